@@ -0,0 +1,276 @@
+// (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+// Table-driven tuner plugin. It maps the tuning table built by
+// maint/tunetable.py from recorded latencies (NCCL_TUNER_TABLE_FILE) and
+// answers getCollInfo() with a binary search in it, without allocating.
+//
+// Usage:
+//   NCCL_TUNER_PLUGIN=libnccl-tuner-table.so NCCL_TUNER_TABLE_FILE=h100.tune
+//
+// The table holds, for each rank count, collective and message size bucket,
+// the best candidates (algorithm, protocol, nChannels), best first; the first
+// one this communicator supports is used. Communicators whose rank count is
+// not in the table use the closest one. Without a usable table, or for
+// collectives that are not in it, NCCL's default tuning applies.
+//
+// getCollInfo() of the v1 API does not say which communicator it is called
+// for: with communicators of different sizes in a process, the rank count of
+// the last one initialized applies to all of them. Nor does it get the
+// datatype and reduction op: NVLS and NVLS_TREE candidates are answered
+// whenever the communicator supports NVLS, and getAlgoInfo() falls back to
+// NCCL's default tuning for the datatypes and ops NVLS does not support
+// (NCCL_NVLS_SUPPORTS()).
+//
+// The plugin has no addOnlineResult(), so that CollTrace does not average
+// every latency across ranks for it.
+
+#include <errno.h>
+#include <fcntl.h>
+#include <pthread.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#include "nccl_tuner.h"
+
+#define TABLE_MAGIC "NCCLTUNE"
+#define TABLE_VERSION 1
+
+// Layout of maint/tunetable.py, little endian
+struct tableHeader {
+  char magic[8];
+  uint32_t version;
+  uint32_t headerSize;
+  uint32_t entrySize;
+  uint32_t nEntries;
+  uint32_t checksum; // crc32 of the entries
+  uint32_t flags;
+};
+
+struct tableEntry {
+  uint32_t nRanks;
+  uint32_t coll;
+  uint64_t minBytes;
+  int8_t algorithm;
+  int8_t protocol;
+  int16_t nChannels; // 0: NCCL's choice
+  float latencyUs;
+};
+
+_Static_assert(sizeof(struct tableHeader) == 32, "tableHeader must match maint/tunetable.py");
+_Static_assert(sizeof(struct tableEntry) == 24, "tableEntry must match maint/tunetable.py");
+
+static pthread_mutex_t tableLock = PTHREAD_MUTEX_INITIALIZER;
+static int tableRefCount = 0;
+static void* tableMap = NULL;
+static size_t tableMapSize = 0;
+static const struct tableEntry* tableEntries = NULL;
+// Entries of the selected rank count, as first << 32 | last, and the number
+// of nodes; read without the lock by getCollInfo()
+static uint64_t tableRange = 0;
+static int tableNNodes = 1;
+static ncclDebugLogger_t tableLogger = NULL;
+
+#define TABLE_LOG(level, ...)                                           \
+  do {                                                                  \
+    if (tableLogger != NULL)                                            \
+      tableLogger(level, NCCL_TUNING, __FILE__, __LINE__, __VA_ARGS__); \
+  } while (0)
+
+static uint32_t tableCrc32(const unsigned char* data, size_t size) {
+  uint32_t crc = 0xffffffff;
+  for (size_t i = 0; i < size; i++) {
+    crc ^= data[i];
+    for (int k = 0; k < 8; k++) {
+      crc = (crc >> 1) ^ (0xedb88320 & -(crc & 1));
+    }
+  }
+  return ~crc;
+}
+
+// Maps and checks the table; on failure, leaves no table mapped
+static void tableOpen(const char* path) {
+  int fd = open(path, O_RDONLY | O_CLOEXEC);
+  if (fd < 0) {
+    TABLE_LOG(NCCL_LOG_WARN, "Tuner table: cannot open %s: %s, using default tuning", path, strerror(errno));
+    return;
+  }
+  struct stat st;
+  void* map = MAP_FAILED;
+  if (fstat(fd, &st) == 0 && st.st_size >= (off_t)sizeof(struct tableHeader)) {
+    map = mmap(NULL, st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+  }
+  close(fd);
+  if (map == MAP_FAILED) {
+    TABLE_LOG(NCCL_LOG_WARN, "Tuner table: cannot map %s, using default tuning", path);
+    return;
+  }
+
+  const struct tableHeader* header = (const struct tableHeader*)map;
+  const char* error = NULL;
+  if (memcmp(header->magic, TABLE_MAGIC, sizeof(header->magic)) != 0) {
+    error = "not a tuning table";
+  } else if (header->version != TABLE_VERSION) {
+    error = "unsupported table version";
+  } else if (header->headerSize != sizeof(struct tableHeader) || header->entrySize != sizeof(struct tableEntry)) {
+    error = "unexpected header or entry size";
+  } else if ((uint64_t)st.st_size != header->headerSize + (uint64_t)header->nEntries * header->entrySize) {
+    error = "truncated table";
+  } else if (tableCrc32((const unsigned char*)map + header->headerSize,
+                        (size_t)header->nEntries * header->entrySize) != header->checksum) {
+    error = "checksum mismatch";
+  }
+  if (error != NULL) {
+    TABLE_LOG(NCCL_LOG_WARN, "Tuner table: %s: %s, using default tuning", path, error);
+    munmap(map, st.st_size);
+    return;
+  }
+  tableMap = map;
+  tableMapSize = st.st_size;
+  tableEntries = (const struct tableEntry*)((const char*)map + header->headerSize);
+  TABLE_LOG(NCCL_LOG_INFO, "Tuner table: mapped %u entries from %s", header->nEntries, path);
+}
+
+// First entry of a rank count at least nRanks
+static uint32_t tableLowerBound(uint32_t nEntries, uint32_t nRanks) {
+  uint32_t lo = 0, hi = nEntries;
+  while (lo < hi) {
+    uint32_t mid = lo + (hi - lo) / 2;
+    if (tableEntries[mid].nRanks < nRanks) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+}
+
+// Selects the entries of the rank count closest to nRanks, in ratio
+static void tableSelectRanks(uint32_t nRanks) {
+  uint32_t nEntries = ((const struct tableHeader*)tableMap)->nEntries;
+  if (nEntries == 0) {
+    __atomic_store_n(&tableRange, 0, __ATOMIC_RELEASE);
+    return;
+  }
+  uint32_t above = tableLowerBound(nEntries, nRanks);
+  uint32_t chosen;
+  if (above == nEntries) {
+    chosen = tableEntries[nEntries - 1].nRanks;
+  } else if (above == 0) {
+    chosen = tableEntries[0].nRanks;
+  } else {
+    uint64_t lower = tableEntries[above - 1].nRanks, upper = tableEntries[above].nRanks;
+    chosen = (uint64_t)nRanks * nRanks <= lower * upper ? lower : upper;
+  }
+  uint64_t first = tableLowerBound(nEntries, chosen);
+  uint64_t last = tableLowerBound(nEntries, chosen + 1);
+  __atomic_store_n(&tableRange, first << 32 | last, __ATOMIC_RELEASE);
+  TABLE_LOG(NCCL_LOG_INFO, "Tuner table: using the %u entries of %u ranks for %zu ranks",
+      (unsigned)(last - first), chosen, (size_t)nRanks);
+}
+
+static ncclResult_t tableInit(size_t nRanks, size_t nNodes, ncclDebugLogger_t logFunction) {
+  pthread_mutex_lock(&tableLock);
+  tableRefCount++;
+  if (logFunction != NULL) tableLogger = logFunction;
+  // nRanks is 0 for the one-off init of ncclInitEnv(), before any communicator
+  if (nRanks > 0) {
+    if (tableMap == NULL) {
+      const char* path = getenv("NCCL_TUNER_TABLE_FILE");
+      if (path == NULL || path[0] == '\0') {
+        TABLE_LOG(NCCL_LOG_WARN, "Tuner table: NCCL_TUNER_TABLE_FILE is not set, using default tuning");
+      } else {
+        tableOpen(path);
+      }
+    }
+    if (tableMap != NULL) {
+      tableSelectRanks(nRanks > UINT32_MAX ? UINT32_MAX : (uint32_t)nRanks);
+      __atomic_store_n(&tableNNodes, (int)nNodes, __ATOMIC_RELAXED);
+    }
+  }
+  pthread_mutex_unlock(&tableLock);
+  return ncclSuccess;
+}
+
+static int tableSupported(int algorithm, int collNetSupport, int nvlsSupport, int nNodes) {
+  if ((algorithm == NCCL_ALGO_COLLNET_DIRECT || algorithm == NCCL_ALGO_COLLNET_CHAIN) && collNetSupport != 1) {
+    return 0;
+  }
+  if ((algorithm == NCCL_ALGO_NVLS || algorithm == NCCL_ALGO_NVLS_TREE) && !nvlsSupport) {
+    return 0;
+  }
+  if (algorithm == NCCL_ALGO_NVLS && collNetSupport != 1 && nNodes > 1) {
+    return 0;
+  }
+  return 1;
+}
+
+static ncclResult_t tableGetCollInfo(
+    ncclFunc_t collType,
+    size_t nBytes,
+    int collNetSupport,
+    int nvlsSupport,
+    int numPipeOps,
+    int* algorithm,
+    int* protocol,
+    int* nChannels) {
+  (void)numPipeOps;
+  uint64_t range = __atomic_load_n(&tableRange, __ATOMIC_ACQUIRE);
+  uint32_t first = range >> 32, last = (uint32_t)range;
+  uint32_t coll = (uint32_t)collType;
+
+  // Past the last entry at or below (collType, nBytes)
+  uint32_t lo = first, hi = last;
+  while (lo < hi) {
+    uint32_t mid = lo + (hi - lo) / 2;
+    const struct tableEntry* e = tableEntries + mid;
+    if (e->coll < coll || (e->coll == coll && e->minBytes <= nBytes)) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  if (lo == first || tableEntries[lo - 1].coll != coll) {
+    // Not in the table: NCCL's default tuning
+    return ncclSuccess;
+  }
+
+  // Candidates of the bucket, best first
+  uint64_t minBytes = tableEntries[lo - 1].minBytes;
+  uint32_t start = lo - 1;
+  while (start > first && tableEntries[start - 1].coll == coll && tableEntries[start - 1].minBytes == minBytes) {
+    start--;
+  }
+  int nNodes = __atomic_load_n(&tableNNodes, __ATOMIC_RELAXED);
+  for (uint32_t i = start; i < lo; i++) {
+    const struct tableEntry* e = tableEntries + i;
+    if (!tableSupported(e->algorithm, collNetSupport, nvlsSupport, nNodes)) continue;
+    *algorithm = e->algorithm;
+    *protocol = e->protocol;
+    if (e->nChannels > 0) *nChannels = e->nChannels;
+    break;
+  }
+  return ncclSuccess;
+}
+
+static ncclResult_t tableDestroy(void) {
+  pthread_mutex_lock(&tableLock);
+  if (--tableRefCount == 0 && tableMap != NULL) {
+    __atomic_store_n(&tableRange, 0, __ATOMIC_RELEASE);
+    munmap(tableMap, tableMapSize);
+    tableMap = NULL;
+    tableMapSize = 0;
+    tableEntries = NULL;
+  }
+  pthread_mutex_unlock(&tableLock);
+  return ncclSuccess;
+}
+
+const ncclTuner_v1_t ncclTunerPlugin_v1 = {
+    .name = "table",
+    .init = tableInit,
+    .getCollInfo = tableGetCollInfo,
+    .addOnlineResult = NULL,
+    .destroy = tableDestroy};
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Time each stage of ./maint/extractcvars.py on a synthetic source tree.
+
+The tree holds --files source files, --cvars of which carry a cvar block
+covering every cvar type. Each stage is run --repeat times and the JSON
+report (stdout or --output) keeps the minimum and median wall time of each,
+so that changes to the generator can be compared in review:
+
+    ./maint/bench_extractcvars.py --output before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import extractcvars
+
+maintDir = os.path.dirname(os.path.abspath(__file__))
+ccTemplate = os.path.join(maintDir, "..", "src", "misc", "nccl_cvars.cc.in")
+
+# One synthetic cvar per type, cycled through; %(name)s is filled in
+cvarTemplates = [
+    """ - name        : %(name)s
+   type        : int64_t
+   default     : 4
+   description : |-
+     Synthetic numeric cvar.
+""",
+    """ - name        : %(name)s
+   type        : bool
+   default     : true
+   description : |-
+     Synthetic bool cvar.
+""",
+    """ - name        : %(name)s
+   type        : string
+   default     : "val"
+   description : |-
+     Synthetic string cvar.
+""",
+    """ - name        : %(name)s
+   type        : stringlist
+   default     : a,b,c
+   description : |-
+     Synthetic stringlist cvar.
+""",
+    """ - name        : %(name)s
+   type        : prefixed_stringlist
+   prefixes    : ^, =
+   default     : ^a,b
+   description : |-
+     Synthetic prefixed_stringlist cvar.
+""",
+    """ - name        : %(name)s
+   type        : enum
+   choices     : a, b, c
+   default     : a
+   description : |-
+     Synthetic enum cvar.
+""",
+    """ - name        : %(name)s
+   type        : enumlist
+   choices     : a, b, c
+   default     : a,c
+   description : |-
+     Synthetic enumlist cvar.
+""",
+]
+
+# Filler making files about as long as typical NCCL sources
+fillerLine = "static int unused%d = %d; // filler to scan past\n"
+fillerLines = 200
+
+
+def makeTree(top, numFiles, numCvars, filesPerDir=100):
+    for i in range(numFiles):
+        dirname = os.path.join(top, "src", "dir%d" % (i // filesPerDir))
+        if i % filesPerDir == 0:
+            os.makedirs(dirname)
+        with open(os.path.join(dirname, "file%d.cc" % i), "w") as f:
+            f.write("// Synthetic source file %d\n" % i)
+            if i < numCvars:
+                f.write("/*\n=== BEGIN_NCCL_CVAR_INFO_BLOCK ===\n\n")
+                f.write(cvarTemplates[i % len(cvarTemplates)] %
+                        {"name": "NCCL_BENCH_CVAR_%d" % i})
+                f.write("\n=== END_NCCL_CVAR_INFO_BLOCK ===\n*/\n")
+            for j in range(fillerLines):
+                f.write(fillerLine % (j, j))
+
+
+def timeStage(times, name, fn):
+    start = time.perf_counter()
+    ret = fn()
+    times.setdefault(name, []).append(time.perf_counter() - start)
+    return ret
+
+
+def runOnce(tree, outdir, jobs, numShards, times):
+    # Start from missing outputs, as writeIfChanged() skips identical ones
+    if os.path.exists(outdir):
+        shutil.rmtree(outdir)
+    os.makedirs(outdir)
+
+    filenames = timeStage(times, "findSourceFiles",
+                          lambda: extractcvars.findSourceFiles(tree))
+    timeStage(times, "scanFiles",
+              lambda: sum(1 for _ in extractcvars.scanFiles(filenames, {}, jobs)))
+    cvars, files = timeStage(times, "loadCvarsFromFiles",
+                             lambda: extractcvars.loadCvarsFromFiles(filenames, {}, jobs))
+    timeStage(times, "loadCvarsFromFiles (cached)",
+              lambda: extractcvars.loadCvarsFromFiles(filenames, files, jobs))
+    cacheFile = os.path.join(outdir, "cache")
+    timeStage(times, "saveCache", lambda: extractcvars.saveCache(cacheFile, files))
+    timeStage(times, "loadCache", lambda: extractcvars.loadCache(cacheFile))
+
+    allcvars = timeStage(times, "makeCvars", lambda: extractcvars.makeCvars(cvars))
+    out = lambda name: os.path.join(outdir, name)
+    timeStage(times, "populateCCFile", lambda: extractcvars.populateCCFile(
+        allcvars, ccTemplate, out("nccl_cvars.cc")))
+    timeStage(times, "populateHFile", lambda: extractcvars.populateHFile(
+        allcvars, out("nccl_cvars.h")))
+    timeStage(times, "populateReadme", lambda: extractcvars.populateReadme(
+        allcvars, out("README.cvars")))
+    timeStage(times, "populateCatalog", lambda: extractcvars.populateCatalog(
+        allcvars, out("nccl_cvars")))
+    timeStage(times, "populateUT", lambda: extractcvars.populateUT(
+        allcvars, out("CvarUTShard%d.cc"), numShards))
+    timeStage(times, "populateBenchEnvs", lambda: extractcvars.populateBenchEnvs(
+        allcvars, out("CvarBenchEnvs.h")))
+    return len(filenames), len(cvars)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark ./maint/extractcvars.py on a synthetic tree")
+    parser.add_argument("--files", type=int, default=10000,
+                        help="number of source files")
+    parser.add_argument("--cvars", type=int, default=5000,
+                        help="number of source files with a cvar block")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed runs of each stage")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of processes used to scan the tree")
+    parser.add_argument("--ut-shards", type=int, default=4,
+                        help="number of generated unit test shards")
+    parser.add_argument("--output", type=str, default=None,
+                        help="file to write the JSON report to (default: stdout)")
+    args = parser.parse_args()
+    if args.cvars > args.files:
+        parser.error("--cvars must not exceed --files")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    times = {}
+    with tempfile.TemporaryDirectory(prefix="bench_extractcvars.") as tmp:
+        tree = os.path.join(tmp, "tree")
+        makeTree(tree, args.files, args.cvars)
+        for _ in range(args.repeat):
+            numFiles, numCvars = runOnce(
+                tree, os.path.join(tmp, "out"), args.jobs, args.ut_shards, times)
+
+    report = {
+        "benchmark": "extractcvars",
+        "python": platform.python_version(),
+        "files": numFiles,
+        "cvars": numCvars,
+        "jobs": args.jobs,
+        "repeat": args.repeat,
+        "stages": {
+            name: {"minSec": min(t), "medianSec": statistics.median(t)}
+            for name, t in times.items()
+        },
+    }
+    content = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(content)
+    else:
+        sys.stdout.write(content)
+
+
+if __name__ == "__main__":
+    main()
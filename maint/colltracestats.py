@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Summarize CollTrace results: latency percentiles, bandwidth and stragglers.
+
+With NCCL_COLLTRACE_DIR set, every rank writes the latency (in ms) of each
+collective it ran to <dir>/<rank>_online.json:
+
+    [{"coll": "AllReduce", "msg_size": "1048576", "latency": 0.123}, ...]
+
+This tool loads those files (in parallel for large jobs) into one column of
+latencies per rank and (collective, message size), then reports for each
+(collective, message size):
+  - latency percentiles over all ranks and iterations,
+  - algorithm and bus bandwidth of the median latency, using the bus
+    bandwidth factors of nccl-tests (assuming all ranks are in one
+    communicator, unless --nranks says otherwise),
+and the ranks whose median latencies are consistently outliers among their
+peers. A "slow" rank spends longer in collectives than its peers; a "fast"
+one usually arrives late, so that its peers were left waiting for it:
+
+    ./maint/colltracestats.py /shared/job42/colltrace
+"""
+
+import argparse
+import array
+import json
+import multiprocessing
+import os
+import re
+import sys
+
+# Below this many files a process pool costs more than it saves
+parallelLoadMinFiles = 256
+
+percentiles = (50, 90, 99)
+
+# Modified z-score above which a rank is an outlier (Iglewicz and Hoaglin)
+defaultStragglerThreshold = 3.5
+
+rankFileRegex = re.compile(r"^(\d+)_online\.json$")
+
+
+def busBwFactors(coll, nranks):
+    """(total bytes per msg_size byte, bus bandwidth factor) of coll, as in
+    nccl-tests. CollTrace's msg_size is count * type size, which is the
+    per-rank buffer of AllGather and ReduceScatter."""
+    if nranks < 1:
+        return 1, 1.0
+    if coll == "AllReduce":
+        return 1, 2.0 * (nranks - 1) / nranks
+    if coll in ("AllGather", "ReduceScatter"):
+        return nranks, (nranks - 1) / nranks
+    if coll in ("AllToAll", "AllToAllv"):
+        return 1, (nranks - 1) / nranks
+    # Broadcast, Reduce, Send, Recv
+    return 1, 1.0
+
+
+def percentile(values, q):
+    """q-th percentile of sorted values, interpolated linearly"""
+    pos = (len(values) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def median(values):
+    return percentile(sorted(values), 50)
+
+
+def findFiles(paths):
+    """[(rank, filename)] of the CollTrace results in paths (dirs or files)"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as it:
+                names = [(e.name, e.path) for e in it]
+        else:
+            names = [(os.path.basename(path), path)]
+        for name, filename in names:
+            m = rankFileRegex.match(name)
+            if m:
+                files.append((int(m.group(1)), filename))
+            elif not os.path.isdir(path):
+                raise ValueError("%s: not a <rank>_online.json file" % filename)
+    return sorted(files)
+
+
+def loadRank(work):
+    """(rank, {(coll, msgSize): array of latencies}) of one results file"""
+    rank, filename = work
+    with open(filename, "rb") as f:
+        try:
+            entries = json.load(f)
+        except ValueError as e:
+            raise ValueError("%s: %s" % (filename, e))
+    columns = {}
+    for entry in entries:
+        # A rank without results writes a single empty entry
+        if not entry:
+            continue
+        latency = entry["latency"]
+        # CollTrace reports -1 for collectives it failed to time
+        if latency < 0:
+            continue
+        key = (entry["coll"], int(entry["msg_size"]))
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = array.array("d")
+        column.append(latency)
+    return rank, columns
+
+
+def loadResults(paths, jobs=1):
+    """Latencies of all ranks in paths, as {(coll, msgSize): {rank: array}}"""
+    files = findFiles(paths)
+    if jobs > 1 and len(files) >= parallelLoadMinFiles:
+        chunksize = max(1, len(files) // (jobs * 8))
+        with multiprocessing.Pool(jobs) as pool:
+            loaded = pool.imap_unordered(loadRank, files, chunksize)
+            return mergeRanks(loaded), len(files)
+    return mergeRanks(map(loadRank, files)), len(files)
+
+
+def mergeRanks(loaded):
+    results = {}
+    for rank, columns in loaded:
+        for key, column in columns.items():
+            results.setdefault(key, {})[rank] = column
+    return results
+
+
+def summarize(results, nranks):
+    """Per (coll, msgSize) statistics, ordered by collective and size"""
+    summary = []
+    for (coll, size), ranks in sorted(results.items()):
+        latencies = array.array("d")
+        for column in ranks.values():
+            latencies.extend(column)
+        latencies = sorted(latencies)
+        stats = {
+            "coll": coll,
+            "msgSize": size,
+            "ranks": len(ranks),
+            "samples": len(latencies),
+            "meanMs": sum(latencies) / len(latencies),
+            "maxMs": latencies[-1],
+        }
+        for q in percentiles:
+            stats["p%dMs" % q] = percentile(latencies, q)
+
+        bytesFactor, busFactor = busBwFactors(coll, nranks)
+        p50 = stats["p50Ms"]
+        # bytes / ms / 1e6 = GB/s
+        algBw = size * bytesFactor / p50 / 1e6 if p50 > 0 else 0.0
+        stats["algBwGBs"] = algBw
+        stats["busBwGBs"] = algBw * busFactor
+        summary.append(stats)
+    return summary
+
+
+def findStragglers(results, threshold=defaultStragglerThreshold, minRanks=4):
+    """Ranks whose median latency is an outlier among their peers.
+
+    Each rank gets a modified z-score (0.6745 * (x - median) / MAD) of its
+    median latency in every (coll, msgSize) run by at least minRanks ranks.
+    A rank is flagged when the median of its scores exceeds threshold, so a
+    single noisy collective does not make a straggler.
+    """
+    scores = {}
+    worst = {}
+    for key, ranks in results.items():
+        if len(ranks) < minRanks:
+            continue
+        rankMedians = {rank: median(column) for rank, column in ranks.items()}
+        center = median(rankMedians.values())
+        mad = median([abs(m - center) for m in rankMedians.values()])
+        if mad == 0:
+            # Most ranks agree exactly; scale by the center instead
+            mad = abs(center) * 1e-3 or 1e-9
+        for rank, m in rankMedians.items():
+            z = 0.6745 * (m - center) / mad
+            scores.setdefault(rank, []).append(z)
+            if abs(z) > abs(worst.get(rank, (0, None, None, None))[0]):
+                worst[rank] = (z, key, m, center)
+
+    stragglers = []
+    for rank, zs in scores.items():
+        score = median(zs)
+        if abs(score) <= threshold:
+            continue
+        z, (coll, size), m, center = worst[rank]
+        stragglers.append({
+            "rank": rank,
+            "score": score,
+            "kind": "slow" if score > 0 else "fast",
+            "worstColl": coll,
+            "worstMsgSize": size,
+            "worstMs": m,
+            "peersMs": center,
+        })
+    stragglers.sort(key=lambda s: -abs(s["score"]))
+    return stragglers
+
+
+def analyze(paths, jobs=1, nranks=None, threshold=defaultStragglerThreshold):
+    results, numFiles = loadResults(paths, jobs)
+    nranks = nranks or numFiles
+    return {
+        "files": numFiles,
+        "nranks": nranks,
+        "collectives": summarize(results, nranks),
+        "stragglers": findStragglers(results, threshold),
+    }
+
+
+def printReport(report, maxStragglers=20):
+    print("%d ranks" % report["files"])
+    rows = [["COLL", "MSG_SIZE", "RANKS", "SAMPLES"]
+            + ["P%d(ms)" % q for q in percentiles]
+            + ["MAX(ms)", "ALGBW(GB/s)", "BUSBW(GB/s)"]]
+    for s in report["collectives"]:
+        rows.append([s["coll"], "%d" % s["msgSize"], "%d" % s["ranks"], "%d" % s["samples"]]
+                    + ["%.4f" % s["p%dMs" % q] for q in percentiles]
+                    + ["%.4f" % s["maxMs"], "%.2f" % s["algBwGBs"], "%.2f" % s["busBwGBs"]])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(col.rjust(w) for col, w in zip(row, widths)))
+
+    stragglers = report["stragglers"]
+    if not stragglers:
+        print("\nno stragglers")
+        return
+    print("\n%d stragglers" % len(stragglers))
+    for s in stragglers[:maxStragglers]:
+        print("    rank %d: %s (score %.1f), %s %d: %.4f ms (peers: %.4f ms)" % (
+            s["rank"], s["kind"], s["score"], s["worstColl"], s["worstMsgSize"],
+            s["worstMs"], s["peersMs"]))
+    if len(stragglers) > maxStragglers:
+        print("    ...")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarize the CollTrace results of a job")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="NCCL_COLLTRACE_DIR directories, or <rank>_online.json files",
+    )
+    parser.add_argument(
+        "--nranks",
+        type=int,
+        default=None,
+        help="communicator size used for bus bandwidth (default: number of result files)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=defaultStragglerThreshold,
+        help="modified z-score above which a rank is a straggler",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes used to load the results",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the report as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        report = analyze(args.paths, args.jobs, args.nranks, args.threshold)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        sys.exit("colltracestats.py: error: %s" % e)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        printReport(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
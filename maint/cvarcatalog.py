@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Query and validate NCCL cvars without a GPU or the NCCL library.
+
+./maint/extractcvars.py writes a catalog of all cvars next to this module,
+both as JSON (nccl_cvars.json) and in an indexed binary form
+(nccl_cvars.bin) that can be loaded without decoding every entry:
+
+    import cvarcatalog
+    catalog = cvarcatalog.load()
+    catalog.get("NCCL_IB_HCA")["type"]
+    catalog.validate({"NCCL_ALGO": "ring", "NCCL_IB_HCA": "mlx5_0,mlx5_0"})
+
+validate() returns (env, value, message) tuples for the settings that
+ncclCvarInit() would warn about, plus malformed or out-of-range numerals
+(which ncclCvarInit() silently truncates). Validation results are memoized
+per (env, value), so checking thousands of similar job environments costs
+about one dict lookup per setting.
+"""
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+
+catalogVersion = 1
+
+# Binary catalog: header, then one index entry per env sorted by env name,
+# then the names and the compact JSON of each entry. Entries of accepted envs
+# that are not backed by a cvar have an empty record.
+binaryMagic = b"NCVC"
+binaryHeader = struct.Struct("<4sII")          # magic, version, count
+binaryIndexEntry = struct.Struct("<IHII")      # nameOff, nameLen, recOff, recLen
+
+defaultDir = os.path.dirname(os.path.abspath(__file__))
+
+boolValues = {"y", "n", "yes", "no", "t", "f", "true", "false", "1", "0"}
+integerRegex = re.compile(r"^[+-]?[0-9]+$")
+
+# Memoized validation results; cleared when it grows past this many entries
+maxMemoEntries = 1 << 16
+
+
+def numericLimits(type_):
+    """(min, max) of an integer cvar type, assuming LP64"""
+    m = re.match(r"^(u?)int(\d+)_t$", type_)
+    if m:
+        unsigned, bits = m.group(1) == "u", int(m.group(2))
+    else:
+        unsigned, bits = type_ == "size_t", 32 if type_ == "int" else 64
+    if unsigned:
+        return 0, 2 ** bits - 1
+    return -2 ** (bits - 1), 2 ** (bits - 1) - 1
+
+
+def splitTokens(val):
+    return [t.strip() for t in val.split(",") if t.strip()]
+
+
+def encodeCatalog(cvars, acceptedEnvs=()):
+    """JSON and binary catalogs of cvars (catalog entries as dicts)"""
+    text = json.dumps({"version": catalogVersion, "cvars": cvars,
+                       "acceptedEnvs": list(acceptedEnvs)},
+                      indent=1, sort_keys=True) + "\n"
+
+    entries = [(c["envstr"], json.dumps(c, separators=(",", ":"), sort_keys=True))
+               for c in cvars]
+    entries += [(e, "") for e in acceptedEnvs]
+    entries.sort()
+
+    offset = binaryHeader.size + binaryIndexEntry.size * len(entries)
+    index, blob = [], []
+    for env, record in entries:
+        name, record = env.encode(), record.encode()
+        index.append(binaryIndexEntry.pack(
+            offset, len(name), offset + len(name), len(record)))
+        blob += [name, record]
+        offset += len(name) + len(record)
+    data = b"".join([binaryHeader.pack(binaryMagic, catalogVersion, len(entries))]
+                    + index + blob)
+    return text, data
+
+
+def intValidator(type_):
+    lo, hi = numericLimits(type_)
+
+    def check(val):
+        s = val.strip()
+        if not any(c.isdigit() for c in s):
+            # str2num() accepts MAX/MIN only when there are no digits
+            if s.upper() in ("MAX", "MIN"):
+                return None
+            return "Unrecognized numeral"
+        if not integerRegex.match(s):
+            return "Unrecognized numeral"
+        if not lo <= int(s) <= hi:
+            return "Out of range for %s" % type_
+        return None
+    return check
+
+
+def floatValidator(val):
+    s = val.strip()
+    if not any(c.isdigit() for c in s):
+        return None if s.upper() in ("MAX", "MIN") else "Unrecognized numeral"
+    try:
+        float(s)
+    except ValueError:
+        return "Unrecognized numeral"
+    return None
+
+
+def tokensValidator(choices=None):
+    def check(val):
+        tokens = splitTokens(val)
+        if len(set(tokens)) != len(tokens):
+            return "Duplicate token"
+        if choices is not None and not choices.issuperset(tokens):
+            return "Unknown value"
+        return None
+    return check
+
+
+def makeValidator(cvar):
+    """Function checking a value of cvar; returns a message or None"""
+    type_ = cvar["type"]
+    if type_ == "bool":
+        return lambda val: None if val.lower() in boolValues else "Unknown value"
+    if type_ == "string":
+        return lambda val: None
+    if type_ == "stringlist":
+        return tokensValidator()
+    if type_ == "prefixed_stringlist":
+        prefixes = cvar["prefixes"]
+        checkTokens = tokensValidator()
+
+        def check(val):
+            for prefix in prefixes:
+                if val.startswith(prefix):
+                    return checkTokens(val[len(prefix):])
+            return checkTokens(val)
+        return check
+    if type_ == "enum":
+        choices = frozenset(cvar["choices"])
+        # str2enum() is handed the raw value, surrounding blanks included
+        return lambda val: None if val in choices else "Unknown value"
+    if type_ == "enumlist":
+        return tokensValidator(frozenset(cvar["choices"]))
+    if type_ in ("float", "double"):
+        return floatValidator
+    return intValidator(type_)
+
+
+class Catalog:
+    """Cvar catalog; entries and validators are decoded on first use"""
+
+    def __init__(self, names, loadRecord):
+        self._names = names             # env name -> record key, or None
+        self._loadRecord = loadRecord
+        self._cvars = {}
+        self._validators = {}
+        self._memo = {}
+
+    def __contains__(self, env):
+        return env in self._names
+
+    def __len__(self):
+        return len(self._names)
+
+    def envs(self):
+        return sorted(self._names)
+
+    def get(self, env):
+        """Catalog entry of env, or None for unknown and non-cvar envs"""
+        cvar = self._cvars.get(env)
+        if cvar is None and env in self._names:
+            key = self._names[env]
+            cvar = self._loadRecord(key) if key is not None else None
+            self._cvars[env] = cvar
+        return cvar
+
+    def checkValue(self, env, val):
+        """Message describing the problem with env=val, or None. Numbers and
+        booleans (e.g. from JSON) are checked as their str()."""
+        if not isinstance(val, str):
+            if not isinstance(val, (bool, int, float)):
+                return "Not a string value"
+            val = str(val)
+        check = self._validators.get(env)
+        if check is None:
+            if env not in self._names:
+                return "Unknown env" if env.startswith("NCCL_") else None
+            cvar = self.get(env)
+            check = makeValidator(cvar) if cvar else (lambda val: None)
+            self._validators[env] = check
+        return check(val)
+
+    def validate(self, environ):
+        """(env, value, message) of every problem in an environment dict"""
+        issues = []
+        memo = self._memo
+        for env, val in environ.items():
+            if not isinstance(val, str):
+                # Coerce before the memo lookup, as True == 1
+                if not isinstance(val, (bool, int, float)):
+                    issues.append((env, val, "Not a string value"))
+                    continue
+                val = str(val)
+            key = (env, val)
+            msg = memo.get(key, key)
+            if msg is key:
+                if len(memo) >= maxMemoEntries:
+                    memo.clear()
+                msg = memo[key] = self.checkValue(env, val)
+            if msg is not None:
+                issues.append((env, val, msg))
+        return issues
+
+    def validateMany(self, environs):
+        """{position: issues} of the environment dicts with problems"""
+        result = {}
+        for i, environ in enumerate(environs):
+            issues = self.validate(environ)
+            if issues:
+                result[i] = issues
+        return result
+
+
+def loadBinary(filename):
+    with open(filename, "rb") as f:
+        data = f.read()
+    magic, version, count = binaryHeader.unpack_from(data)
+    if magic != binaryMagic or version != catalogVersion:
+        raise ValueError("%s: not a version %d cvar catalog" % (filename, catalogVersion))
+
+    names = {}
+    for nameOff, nameLen, recOff, recLen in binaryIndexEntry.iter_unpack(
+            data[binaryHeader.size:binaryHeader.size + binaryIndexEntry.size * count]):
+        names[data[nameOff:nameOff + nameLen].decode()] = \
+            (recOff, recLen) if recLen else None
+
+    def loadRecord(key):
+        recOff, recLen = key
+        return json.loads(data[recOff:recOff + recLen])
+    return Catalog(names, loadRecord)
+
+
+def loadJson(filename):
+    with open(filename, "r") as f:
+        content = json.load(f)
+    if content.get("version") != catalogVersion:
+        raise ValueError("%s: not a version %d cvar catalog" % (filename, catalogVersion))
+
+    cvars = {c["envstr"]: c for c in content["cvars"]}
+    names = {env: env for env in cvars}
+    names.update((env, None) for env in content["acceptedEnvs"])
+    return Catalog(names, cvars.__getitem__)
+
+
+_catalogs = {}
+
+def load(filename=None):
+    """Catalog in filename (.bin or .json); defaults to the one next to this
+    module, preferring the binary form. Catalogs are loaded once per file."""
+    if filename is None:
+        filename = os.path.join(defaultDir, "nccl_cvars.bin")
+        if not os.path.exists(filename):
+            filename = os.path.join(defaultDir, "nccl_cvars.json")
+    catalog = _catalogs.get(filename)
+    if catalog is None:
+        catalog = loadBinary(filename) if filename.endswith(".bin") else loadJson(filename)
+        _catalogs[filename] = catalog
+    return catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check NCCL_* settings against the cvar catalog")
+    parser.add_argument(
+        "--catalog",
+        type=str,
+        default=None,
+        help="catalog file (.bin or .json); defaults to the one in %s" % defaultDir,
+    )
+    parser.add_argument(
+        "--jsonl",
+        type=str,
+        default=None,
+        help="file with one JSON environment dict per line to check",
+    )
+    parser.add_argument(
+        "settings",
+        nargs="*",
+        metavar="ENV=VALUE",
+        help="settings to check",
+    )
+    args = parser.parse_args()
+
+    catalog = load(args.catalog)
+    environs = [dict(s.split("=", 1) for s in args.settings)] if args.settings else []
+    if args.jsonl:
+        with open(args.jsonl, "r") as f:
+            environs += [json.loads(line) for line in f if line.strip()]
+
+    failed = catalog.validateMany(environs)
+    for i, issues in sorted(failed.items()):
+        for env, val, msg in issues:
+            print("%d: %s=%s: %s" % (i, env, val, msg))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Report ranks of a job that run with different NCCL cvar settings.
+
+With NCCL_CVAR_SNAPSHOT_DIR set, every rank writes the cvars that differ
+from their default to <dir>/<rank>_cvars.json, as one JSON record:
+
+    {"rank":0,"nranks":2,"host":"h0","pid":1,"commHash":0,
+     "cvars":{"NCCL_BUFFSIZE":{"value":"8388608","default":"-2"}}}
+
+This tool streams those records (from snapshot directories, or files with
+one record per line) and groups the ranks by their effective configuration.
+Records are not kept once their rank is assigned to a group, so only the
+distinct configurations stay in memory:
+
+    ./maint/cvarskew.py /shared/job42/cvars
+"""
+
+import argparse
+import json
+import os
+import sys
+
+
+def iterRecords(paths):
+    """Yield the snapshot records found in paths (directories or files)"""
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as it:
+                files = sorted(e.path for e in it if e.name.endswith("_cvars.json"))
+        else:
+            files = [path]
+        for filename in files:
+            with open(filename, "r") as f:
+                for lineno, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError as e:
+                        raise ValueError("%s:%d: %s" % (filename, lineno, e))
+
+
+def configKey(cvars):
+    return tuple(sorted((env, v["value"], v["default"]) for env, v in cvars.items()))
+
+
+def groupRanks(records):
+    """Group the ranks of records by configuration.
+
+    Returns ({config: [ranks]}, {rank: host}, nranks), where a config is the
+    sorted tuple of (env, value, default) of a rank's non-default cvars.
+    """
+    groups = {}
+    hosts = {}
+    nranks = 0
+    for record in records:
+        rank = record["rank"]
+        groups.setdefault(configKey(record["cvars"]), []).append(rank)
+        hosts[rank] = record.get("host", "")
+        nranks = max(nranks, record.get("nranks", 0))
+    return groups, hosts, nranks
+
+
+def rankRanges(ranks):
+    """Compact text of a list of ranks, e.g. "0-3,8,10-11" """
+    ranges = []
+    ranks = sorted(ranks)
+    start = prev = ranks[0]
+    for r in ranks[1:] + [None]:
+        if r is not None and r == prev + 1:
+            prev = r
+            continue
+        ranges.append("%d" % start if start == prev else "%d-%d" % (start, prev))
+        if r is not None:
+            start = prev = r
+    return ",".join(ranges)
+
+
+def configDiff(config, reference):
+    """{env: (referenceValue, value)} of the cvars on which config differs"""
+    ref = {env: (value, default) for env, value, default in reference}
+    cur = {env: (value, default) for env, value, default in config}
+    diff = {}
+    for env in sorted(set(ref) | set(cur)):
+        if ref.get(env) != cur.get(env):
+            # An env missing from a snapshot runs with its default
+            refValue = ref[env][0] if env in ref else "(default)"
+            curValue = cur[env][0] if env in cur else "(default)"
+            diff[env] = (refValue, curValue)
+    return diff
+
+
+def analyze(records):
+    groups, hosts, nranks = groupRanks(records)
+    ordered = sorted(groups.items(), key=lambda g: (-len(g[1]), min(g[1])))
+    report = {"ranks": sum(len(r) for r in groups.values()),
+              "configs": len(groups), "groups": []}
+    if nranks:
+        seen = set(hosts)
+        report["missingRanks"] = [r for r in range(nranks) if r not in seen]
+    if not ordered:
+        return report
+
+    reference = ordered[0][0]
+    for i, (config, ranks) in enumerate(ordered):
+        group = {
+            "ranks": rankRanges(ranks),
+            "numRanks": len(ranks),
+            "hosts": sorted({hosts[r] for r in ranks}),
+        }
+        if i == 0:
+            group["cvars"] = {env: value for env, value, _ in config}
+        else:
+            group["diff"] = {env: {"majority": a, "value": b}
+                             for env, (a, b) in configDiff(config, reference).items()}
+        report["groups"].append(group)
+    return report
+
+
+def printReport(report, maxHosts=4):
+    print("%d ranks, %d distinct cvar configurations" % (report["ranks"], report["configs"]))
+    if report.get("missingRanks"):
+        print("missing snapshots of ranks %s" % rankRanges(report["missingRanks"]))
+    for i, group in enumerate(report["groups"]):
+        hosts = group["hosts"]
+        hostText = ", ".join(hosts[:maxHosts]) + (", ..." if len(hosts) > maxHosts else "")
+        if i == 0:
+            print("\nmajority: %d ranks (%s)" % (group["numRanks"], group["ranks"]))
+            for env, value in sorted(group["cvars"].items()):
+                print("    %s=%s" % (env, value))
+            continue
+        print("\ngroup %d: %d ranks (%s) on %s" % (i, group["numRanks"], group["ranks"], hostText))
+        for env, d in group["diff"].items():
+            print("    %s: %s (majority: %s)" % (env, d["value"], d["majority"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report ranks whose NCCL cvar settings differ from the rest of the job")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="NCCL_CVAR_SNAPSHOT_DIR directories, or files of snapshot records",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the report as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        report = analyze(iterRecords(args.paths))
+    except (OSError, ValueError, KeyError) as e:
+        sys.exit("cvarskew.py: error: %s" % e)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        printReport(report)
+    return 1 if report["configs"] > 1 or report.get("missingRanks") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
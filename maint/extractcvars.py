@@ -2,13 +2,34 @@
 # (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
 
 from ruamel.yaml import YAML
+from ruamel.yaml.error import MarkedYAMLError
+import argparse
+import hashlib
+import json
+import multiprocessing
 import os
-from os import walk
+import re
+import sys
 from io import StringIO
 
+from cvarcatalog import encodeCatalog, numericLimits
+
 acceptedEnvs = [
     ]
 
+# Bump whenever the format of the cached per-file cvar entries changes
+cacheVersion = 2
+
+cvarBlockBegin = b"BEGIN_NCCL_CVAR_INFO_BLOCK"
+cvarBlockEnd = b"END_NCCL_CVAR_INFO_BLOCK"
+
+# Directories that never contain NCCL_CVAR_INFO blocks; hidden directories
+# (.git, .hg, ...) are skipped as well
+pruneDirs = {"build", "ext-net", "__pycache__"}
+
+# Below this many files a process pool costs more than it saves
+parallelScanMinFiles = 2048
+
 def static_vars(**kwargs):
     def decorate(func):
         for k in kwargs:
@@ -17,23 +38,317 @@ def static_vars(**kwargs):
     return decorate
 
 
-def loadCvarsFromFiles(filenames):
-    stream = "cvars:\n"
-    for file in filenames:
-        f = open(file, 'r')
-        lines = f.readlines()
-        f.close()
+def findSourceFiles(top):
+    filenames = []
+    for (root, dirs, files) in os.walk(top, topdown=True):
+        dirs[:] = sorted(d for d in dirs
+                         if d not in pruneDirs and not d.startswith("."))
+        for x in sorted(files):
+            if x.endswith(".cc") or x.endswith(".h"):
+                filenames.append(os.path.join(root, x))
+    return filenames
+
+
+def extractCvarBlocks(content):
+    """Yield (lineno, text) for each cvar info block in content (bytes).
+
+    A block is every line after a BEGIN_NCCL_CVAR_INFO_BLOCK marker line up
+    to, but excluding, the next END_NCCL_CVAR_INFO_BLOCK marker line (or EOF).
+    lineno is the 1-based line number of the first line of the block.
+    """
+    pos = content.find(cvarBlockBegin)
+    while pos != -1:
+        start = content.find(b"\n", pos)
+        if start == -1:
+            return
+        start += 1
+        end = content.find(cvarBlockEnd, start)
+        if end == -1:
+            stop = len(content)
+        else:
+            stop = max(content.rfind(b"\n", start, end) + 1, start)
+        lineno = content.count(b"\n", 0, start) + 1
+        yield lineno, content[start:stop].decode("utf-8")
+        if end == -1:
+            return
+        pos = content.find(cvarBlockBegin, end)
+
+
+def scanFile(job):
+    """Hash a source file and extract its cvar blocks.
+
+    job is (filename, cachedHash). Blocks are only extracted when the
+    content hash differs from cachedHash; otherwise None is returned in
+    their place so the caller reuses its cached entry.
+    """
+    filename, cachedHash = job
+    with open(filename, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha1(content).hexdigest()
+    if digest == cachedHash:
+        return filename, digest, None
+    return filename, digest, list(extractCvarBlocks(content))
+
+
+def scanFiles(filenames, cache, jobs):
+    """Stream (filename, digest, blocks) for each file, in input order."""
+    work = [(f, cache.get(f, {}).get("hash")) for f in filenames]
+    if jobs > 1 and len(work) >= parallelScanMinFiles:
+        chunksize = max(1, len(work) // (jobs * 8))
+        with multiprocessing.Pool(jobs) as pool:
+            yield from pool.imap(scanFile, work, chunksize)
+    else:
+        yield from map(scanFile, work)
+
+
+def loadCache(filename):
+    try:
+        with open(filename, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != cacheVersion:
+        return {}
+    return cache.get("files", {})
 
-        ready = False
-        for line in lines:
-            if line.find('END_NCCL_CVAR_INFO_BLOCK') != -1:
-                ready = False
-            if ready == True:
-                stream += line
-            if line.find('BEGIN_NCCL_CVAR_INFO_BLOCK') != -1:
-                ready = True
 
-    return YAML().load(stream)
+def saveCache(filename, files):
+    content = json.dumps({"version": cacheVersion, "files": files},
+                         sort_keys=True, separators=(",", ":"))
+    writeIfChanged(filename, content + "\n")
+
+
+class CvarError(Exception):
+    """Invalid cvar definition; the message is prefixed with file:line."""
+
+    def __init__(self, file, line, msg):
+        super().__init__("%s:%d: %s" % (file, line, msg))
+        self.file = file
+        self.line = line
+
+
+identRegex = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+envRegex = re.compile(r"^[A-Z_][A-Z0-9_]*$")
+itemRegex = re.compile(r"^( *)- ", re.MULTILINE)
+
+numericTypes = {
+    "int", "long", "size_t", "ssize_t", "double", "float",
+    "int8_t", "int16_t", "int32_t", "int64_t",
+    "uint8_t", "uint16_t", "uint32_t", "uint64_t",
+}
+cvarTypes = {
+    "bool", "string", "stringlist", "prefixed_stringlist", "enum", "enumlist",
+} | numericTypes
+
+
+def isBool(val):
+    # The builtin bool is shadowed by the cvar type class below
+    return val is True or val is False
+
+
+def splitChoices(val):
+    return val.replace(" ", "").split(",")
+
+
+def checkIdent(cvar, key):
+    val = cvar[key]
+    if not isinstance(val, str) or not identRegex.match(val):
+        return "%s '%s' is not a valid C identifier" % (key, val)
+
+
+def checkEnvstr(cvar, key):
+    val = cvar[key]
+    if not isinstance(val, str) or not envRegex.match(val):
+        return "envstr '%s' is not a valid environment variable name" % val
+
+
+def checkType(cvar, key):
+    if cvar[key] not in cvarTypes:
+        return "unknown type '%s'" % cvar[key]
+
+
+def checkDescription(cvar, key):
+    if not isinstance(cvar[key], str):
+        return "description must be a string"
+
+
+def checkChoices(cvar, key):
+    val = cvar[key]
+    if not isinstance(val, str) or not val.strip():
+        return "choices must be a non-empty comma-separated string"
+    choices = splitChoices(val)
+    for c in choices:
+        if not identRegex.match(c):
+            return "choice '%s' is not a valid C identifier" % c
+    if len(set(choices)) != len(choices):
+        return "duplicate entry in choices '%s'" % val
+    if cvar.get("type") == "enumlist" and len(choices) > 64:
+        return "enumlist supports at most 64 choices for its bitmask"
+
+
+def checkPrefixes(cvar, key):
+    if not isinstance(cvar[key], str) or not cvar[key].strip():
+        return "prefixes must be a non-empty comma-separated string"
+
+
+def checkDefault(cvar, key):
+    val = cvar[key]
+    type_ = cvar["type"]
+    if type_ == "bool":
+        if not isBool(val):
+            return "default '%s' is not a bool" % val
+    elif type_ in numericTypes:
+        if isinstance(val, str):
+            if val.upper() not in ("MAX", "MIN"):
+                return "default '%s' is neither a number nor MAX/MIN" % val
+        elif isBool(val) or not isinstance(val, (int, float)):
+            return "default '%s' is not a number" % val
+    elif type_ in ("enum", "enumlist"):
+        if not isinstance(val, str):
+            return "default '%s' is not a string" % val
+        choices = splitChoices(cvar["choices"])
+        defaults = [val.strip()] if type_ == "enum" else splitChoices(val)
+        for d in defaults:
+            if d not in choices:
+                return "default '%s' is not one of the choices '%s'" % (
+                    d, cvar["choices"])
+    elif val is not None and not isinstance(val, str):
+        return "default '%s' is not a string" % val
+
+
+# Schema of a cvar entry: key -> (required, checker). Checkers run in this
+# order and return an error message, or None if the value is valid. A key
+# listed in "requires" of the type table below becomes mandatory.
+cvarSchema = {
+    "name": (True, checkIdent),
+    "type": (True, checkType),
+    "envstr": (False, checkEnvstr),
+    "choices": (False, checkChoices),
+    "prefixes": (False, checkPrefixes),
+    "default": (True, checkDefault),
+    "description": (True, checkDescription),
+}
+typeRequires = {
+    "enum": ("choices",),
+    "enumlist": ("choices",),
+    "prefixed_stringlist": ("prefixes",),
+}
+
+
+def validateCvar(cvar, file, line):
+    if not isinstance(cvar, dict):
+        raise CvarError(file, line, "cvar entry must be a mapping")
+    name = cvar.get("name", "<unnamed>")
+    for key in cvar:
+        if key not in cvarSchema:
+            raise CvarError(file, line, "%s: unknown key '%s'" % (name, key))
+    required = typeRequires.get(cvar.get("type"), ())
+    for key, (mandatory, check) in cvarSchema.items():
+        if key not in cvar:
+            if mandatory or key in required:
+                raise CvarError(file, line, "%s: missing key '%s'" % (name, key))
+            continue
+        err = check(cvar, key)
+        if err:
+            raise CvarError(file, line, "%s: %s" % (name, err))
+
+
+def parseCvarBlock(loader, file, lineno, text):
+    """Parse and validate one cvar info block.
+
+    Returns a list of (line, cvar) where line is the file line of the
+    "- name" item the cvar was defined in.
+    """
+    try:
+        data = loader.load(text)
+    except MarkedYAMLError as e:
+        mark = e.problem_mark or e.context_mark
+        line = lineno + mark.line if mark else lineno
+        raise CvarError(file, line, "invalid YAML: %s" % (e.problem or e.context))
+    if data is None:
+        return []
+    if not isinstance(data, list):
+        raise CvarError(file, lineno, "cvar info block must be a YAML list")
+
+    # List items start at the shallowest "- " indentation of the block
+    items = [(m.start(), len(m.group(1))) for m in itemRegex.finditer(text)]
+    if items:
+        depth = min(d for _, d in items)
+        items = [text.count("\n", 0, pos) + lineno
+                 for pos, d in items if d == depth]
+    if len(items) != len(data):
+        items = [lineno] * len(data)
+
+    parsed = []
+    for line, cvar in zip(items, data):
+        validateCvar(cvar, file, line)
+        parsed.append((line, cvar))
+    return parsed
+
+
+def checkDuplicates(cvars):
+    """Report cvars sharing a name or environment variable, in O(n)."""
+    seen = {}
+    for cvar in cvars:
+        envstr = cvar.get("envstr", cvar["name"])
+        for key, val in (("name", cvar["name"]), ("envstr", envstr)):
+            prev = seen.setdefault((key, val), cvar)
+            if prev is not cvar:
+                raise CvarError(cvar["file"], cvar["line"],
+                    "duplicate cvar %s %s, first defined at %s:%d" %
+                    (key, val, prev["file"], prev["line"]))
+
+
+def loadCvarsFromFiles(filenames, cache, jobs=1):
+    """Load cvars from files, reusing cached entries for unchanged files.
+
+    Each file is keyed by the SHA-1 of its contents, so only files whose
+    bytes changed since the last run are scanned and parsed again. Every
+    block is parsed on its own with the safe loader and validated against
+    cvarSchema; loaded cvars carry the "file" and "line" they come from.
+    Returns the loaded cvars and the updated cache entries.
+    """
+    loader = YAML(typ="safe", pure=False)
+    cvars = []
+    files = {}
+    for file, digest, blocks in scanFiles(filenames, cache, jobs):
+        if blocks is None:
+            entry = cache[file]
+        else:
+            parsed = []
+            for lineno, text in blocks:
+                for line, cvar in parseCvarBlock(loader, file, lineno, text):
+                    cvar["line"] = line
+                    parsed.append(cvar)
+            entry = {"hash": digest, "cvars": parsed}
+
+        files[file] = entry
+        for cvar in entry["cvars"]:
+            cvar = dict(cvar)
+            cvar["file"] = file
+            cvars.append(cvar)
+
+    checkDuplicates(cvars)
+    return cvars, files
+
+
+def writeIfChanged(filename, content):
+    """Write content to filename only if it differs from what is on disk.
+
+    Leaving untouched outputs alone keeps their mtime, so a regeneration
+    that does not change any cvar does not trigger a rebuild of everything
+    that includes nccl_cvars.h.
+    """
+    binary = "b" if isinstance(content, bytes) else ""
+    try:
+        with open(filename, "r" + binary) as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(filename, "w" + binary) as f:
+        f.write(content)
+    return True
 
 
 @static_vars(counter = 0)
@@ -50,6 +365,95 @@ def indent(file, str_):
     indent.counter += str.count('{') - str.count('}')
 
 
+def cString(val):
+    return '"%s"' % val.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def cStringList(vals):
+    return "{%s}" % ", ".join(cString(v) for v in vals)
+
+
+def splitTokens(val):
+    """Comma-separated tokens of val, as tokenizer() in nccl_cvars.cc.in"""
+    return [t.strip() for t in (val or "").split(",") if t.strip()]
+
+
+def fnv1a(data, seed):
+    """FNV-1a over bytes with the basis perturbed by seed; see cvarEnvHash()"""
+    h = 0x811c9dc5 ^ seed
+    for b in data:
+        h = ((h ^ b) * 0x01000193) & 0xffffffff
+    return h
+
+
+def perfectHash(keys):
+    """Build a hash-and-displace perfect hash table over keys (bytes).
+
+    Returns (seeds, slots), both of a power-of-two size with mask
+    len(slots) - 1. Key i is stored at slots[p] == i, where
+    p = fnv1a(key, seeds[fnv1a(key, 0) & mask]) & mask.
+    """
+    size = 1
+    while size < 2 * len(keys):
+        size *= 2
+    mask = size - 1
+
+    buckets = [[] for _ in range(size)]
+    for i, key in enumerate(keys):
+        buckets[fnv1a(key, 0) & mask].append(i)
+
+    seeds = [0] * size
+    slots = [-1] * size
+    # Place the largest buckets first while the table is still sparse
+    for b in sorted(range(size), key=lambda b: (-len(buckets[b]), b)):
+        if not buckets[b]:
+            break
+        seed = 1
+        while True:
+            pos = [fnv1a(keys[i], seed) & mask for i in buckets[b]]
+            if len(set(pos)) == len(pos) and all(slots[p] < 0 for p in pos):
+                break
+            seed += 1
+        seeds[b] = seed
+        for i, p in zip(buckets[b], pos):
+            slots[p] = i
+    return seeds, slots
+
+
+def writeEnumChoices(file, name, choices):
+    """Emit the choice table of an enum cvar, sorted by name for str2enum()"""
+    indent(file, "static const CvarEnumChoice<enum %s> %s_choices[] = {" % (name, name))
+    for c in sorted(choices):
+        indent(file, "{\"%s\", %s::%s}," % (c, name, c))
+    indent(file, "};")
+
+
+def numericTestKind(type_):
+    """Generated test table kind and value type of a numeric cvar type"""
+    if type_ in ("float", "double"):
+        return "float", "double"
+    if type_.startswith("uint") or type_ == "size_t":
+        return "uint", "uint64_t"
+    return "int", "int64_t"
+
+
+def utCase(label, env, value, expected, get):
+    value = cString(value) if value is not None else "nullptr"
+    return "{%s, %s, %s, %s, %s}," % (cString(label), cString(env), value, expected, get)
+
+
+def utWarnCase(label, env, value, keyword, name):
+    return "{%s, %s, %s, %s, CVAR_TOUCH(%s)}," % (
+        cString(label), cString(env), cString(value), cString(keyword), name)
+
+
+def writeArray(file, decl, vals, perLine=8):
+    indent(file, "%s = {" % decl)
+    for i in range(0, len(vals), perLine):
+        indent(file, "%s," % ", ".join(str(v) for v in vals[i:i + perLine]))
+    indent(file, "};")
+
+
 class basetype:
     def __init__(self, cvar):
         self.name = cvar['name']
@@ -68,19 +472,44 @@ class basetype:
             self.prefixes = cvar['prefixes']
         else:
             self.prefixes = ""
+        self.file = cvar.get('file')
+        self.line = cvar.get('line')
 
     @staticmethod
     def utilfns(file):
         pass
 
+    def ctype(self):
+        return self.type
+
     def externDecl(self, file):
-        indent(file, "extern %s %s;" % (self.type, self.name))
-        indent(file, "extern %s %s_DEFAULT;" % (self.type, self.name))
+        indent(file, "extern %s %s;" % (self.ctype(), self.name))
+        indent(file, "extern const %s %s_DEFAULT;" % (self.ctype(), self.name))
+        indent(file, "const %s& %s_get();" % (self.ctype(), self.name))
         file.write("\n")
 
     def storageDecl(self, file):
-        indent(file, "%s %s;" % (self.type, self.name))
-        indent(file, "%s %s_DEFAULT;" % (self.type, self.name))
+        indent(file, "%s %s;" % (self.ctype(), self.name))
+        indent(file, "const %s %s_DEFAULT = %s;" %
+            (self.ctype(), self.name, self.defaultValue()))
+
+    def fields(self):
+        """(ctype, name) of the variables holding the value of the cvar"""
+        return [(self.ctype(), self.name)]
+
+    def resetDefault(self, file):
+        for _, name in self.fields():
+            indent(file, "%s = %s_DEFAULT;" % (name, name))
+
+    def accessor(self, file, idx):
+        for ctype, name in self.fields():
+            if name == self.name + "_MASK":
+                indent(file, "uint64_t %s_get() {" % name)
+            else:
+                indent(file, "const %s& %s_get() {" % (ctype, name))
+            indent(file, "cvarEnsureLoaded(%d);" % idx)
+            indent(file, "return %s;" % name)
+            indent(file, "}")
 
     def desc(self, file):
         file.write("\n")
@@ -96,57 +525,69 @@ class basetype:
         file.write("Type: %s\n" % self.type)
         file.write("Default: %s\n" % self.default)
 
-    def unknownValUnitTest(self, file):
-        indent(file, "TEST_F(CvarTest, %s_warn_unknown_val) {" % (self.name))
-        indent(file, "setenv(\"%s\", \"dummy\", 1);" % (self.envstr))
-        indent(file, "testWarn(\"%s\", \"Unknown value\");" % (self.envstr))
-        indent(file, "}")
-        file.write("\n")
+    def toString(self, expr):
+        return "cvarToString(%s)" % expr
 
-    def dupValUnitTest(self, file):
-        indent(file, "TEST_F(CvarTest, %s_warn_dup_val) {" % (self.name))
-        indent(file, "setenv(\"%s\", \"dummy,dummy\", 1);" % (self.envstr))
-        indent(file, "testWarn(\"%s\", \"Duplicate token\");" % (self.envstr))
+    def snapshot(self, file):
+        indent(file, "if (%s_get() != %s_DEFAULT) {" % (self.name, self.name))
+        indent(file, "cvarSnapshotAdd(snapshot, \"%s\", %s, %s);" % (self.envstr,
+            self.toString(self.name + "_get()"), self.toString(self.name + "_DEFAULT")))
         indent(file, "}")
-        file.write("\n")
+
+    def catalogEntry(self):
+        entry = {
+            "name": self.name,
+            "envstr": self.envstr,
+            "type": self.type,
+            "default": self.default,
+            "file": self.file,
+            "line": self.line,
+        }
+        if self.choices:
+            entry["choices"] = splitChoices(self.choices)
+        if self.prefixes:
+            entry["prefixes"] = [v.strip() for v in self.prefixes.split(",")]
+        return entry
+
+    def unknownValUnitTest(self, cases):
+        cases["warn"].append(utWarnCase("%s_warn_unknown_val" % self.name,
+            self.envstr, "dummy", "Unknown value", self.name))
+
+    def dupValUnitTest(self, cases):
+        cases["warn"].append(utWarnCase("%s_warn_dup_val" % self.name,
+            self.envstr, "dummy,dummy", "Duplicate token", self.name))
 
 class bool(basetype):
     @staticmethod
     def utilfns(file):
         pass
 
-    def unitTest(self, file):
+    def unitTestCases(self, cases):
+        get = "CVAR_GET(bool, %s)" % self.name
         for i, val in enumerate(["y", "yes", "true", "1"]):
-            indent(file, "TEST_F(CvarTest, %s_value_y%s) {" % (self.name, i))
-            indent(file, "setenv(\"%s\", \"%s\", 1);" % (self.envstr, val))
-            indent(file, "ncclCvarInit();")
-            indent(file, "EXPECT_TRUE(%s);" % (self.name))
-            indent(file, "}")
-            file.write("\n")
+            cases["bool"].append(utCase("%s_value_y%s" % (self.name, i),
+                self.envstr, val, "true", get))
 
         for i, val in enumerate(["n", "no", "false", "0"]):
-            indent(file, "TEST_F(CvarTest, %s_value_n%s) {" % (self.name, i))
-            indent(file, "setenv(\"%s\", \"%s\", 1);" % (self.envstr, val))
-            indent(file, "ncclCvarInit();")
-            indent(file, "EXPECT_FALSE(%s);" % (self.name))
-            indent(file, "}")
-            file.write("\n")
+            cases["bool"].append(utCase("%s_value_n%s" % (self.name, i),
+                self.envstr, val, "false", get))
 
         if self.default:
-            indent(file, "TEST_F(CvarTest, %s_default_value) {" % (self.name))
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            func = "EXPECT_TRUE" if self.default == True else "EXPECT_FALSE"
-            indent(file, "%s(%s);" % (func, self.name))
-            indent(file, "}")
-            file.write("\n")
+            cases["bool"].append(utCase("%s_default_value" % self.name,
+                self.envstr, None, self.defaultValue(), get))
+
+        self.unknownValUnitTest(cases)
+
+    def defaultValue(self):
+        return "true" if self.default else "false"
 
-        self.unknownValUnitTest(file)
+    def benchValue(self):
+        return "1"
 
     def readenv(self, file):
-        indent(file, "%s = env2bool(\"%s\", \"%s\");" %
-            (self.name, self.envstr, self.default))
-        indent(file, "%s_DEFAULT = env2bool(\"NCCL_ENV_DO_NOT_SET\", \"%s\");" %
-            (self.name, self.default))
+        indent(file, "static void %s_parse(const char* val) {" % self.name)
+        indent(file, "%s = str2bool(\"%s\", val);" % (self.name, self.envstr))
+        indent(file, "}")
         file.write("\n")
 
 
@@ -155,35 +596,37 @@ class numeric(basetype):
     def utilfns(file):
         pass
 
-    def unitTest(self, file):
-        for i, val in enumerate(["0", "9999", \
-            "std::numeric_limits<%s>::max()" % self.type, \
-            "std::numeric_limits<%s>::min()" % self.type]):
-            indent(file, "TEST_F(CvarTest, %s_value_%s) {" % (self.name, i))
-            indent(file, "testNumValue<%s>(\"%s\", %s);" % (self.type, self.envstr, val))
-            indent(file, "EXPECT_EQ(%s, %s);" % (self.name, val))
-            indent(file, "}")
-            file.write("\n")
+    def unitTestCases(self, cases):
+        kind, ctype = numericTestKind(self.type)
+        get = "CVAR_GET(%s, %s)" % (ctype, self.name)
+        vals = [("0", "0"), ("9999", "9999")]
+        if kind != "float":
+            lo, hi = numericLimits(self.type)
+            vals += [(str(hi), "std::numeric_limits<%s>::max()" % self.type),
+                     (str(lo), "std::numeric_limits<%s>::min()" % self.type)]
+        for i, (val, expected) in enumerate(vals):
+            cases[kind].append(utCase("%s_value_%s" % (self.name, i),
+                self.envstr, val, expected, get))
 
         if self.default:
-            indent(file, "TEST_F(CvarTest, %s_default_value) {" % (self.name))
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            if self.default == "MAX":
-                indent(file, "EXPECT_EQ(%s, std::numeric_limits<%s>::max());" %
-                    (self.name, self.type))
-            elif self.default == "MIN":
-                indent(file, "EXPECT_EQ(%s, std::numeric_limits<%s>::min());" %
-                    (self.name, self.type))
-            else:
-                indent(file, "EXPECT_EQ(%s, %s);" % (self.name, self.default))
-            indent(file, "}")
-            file.write("\n")
+            cases[kind].append(utCase("%s_default_value" % self.name,
+                self.envstr, None, self.defaultValue(), get))
+
+    def defaultValue(self):
+        if isinstance(self.default, str):
+            # MAX or MIN, as accepted by str2num()
+            return "std::numeric_limits<%s>::%s()" % (self.type, self.default.lower())
+        if isinstance(self.default, int) and self.default > 0x7fffffffffffffff:
+            return "%dULL" % self.default
+        return repr(self.default)
+
+    def benchValue(self):
+        return "1.5" if self.type in ("float", "double") else "1"
 
     def readenv(self, file):
-        indent(file, "%s = env2num<%s>(\"%s\", \"%s\");" %
-            (self.name, self.type, self.envstr, self.default))
-        indent(file, "%s_DEFAULT = env2num<%s>(\"NCCL_ENV_DO_NOT_SET\", \"%s\");" %
-            (self.name, self.type, self.default))
+        indent(file, "static void %s_parse(const char* val) {" % self.name)
+        indent(file, "%s = str2num<%s>(val);" % (self.name, self.type))
+        indent(file, "}")
         file.write("\n")
 
 
@@ -192,37 +635,29 @@ class string(basetype):
     def utilfns(file):
         pass
 
-    def externDecl(self, file):
-        indent(file, "extern std::string %s;" % self.name)
-        indent(file, "extern std::string %s_DEFAULT;" % self.name)
-        file.write("\n")
+    def ctype(self):
+        return "std::string"
 
-    def storageDecl(self, file):
-        indent(file, "std::string %s;" % self.name)
-        indent(file, "std::string %s_DEFAULT;" % self.name)
+    def defaultValue(self):
+        return cString((self.default or "").strip())
 
-    def unitTest(self, file):
+    def benchValue(self):
+        return "bench"
+
+    def unitTestCases(self, cases):
+        get = "CVAR_GET(std::string, %s)" % self.name
         for i, val in enumerate(["val1", "  val2_with_space   "]):
-            indent(file, "TEST_F(CvarTest, %s_value_%s) {" % (self.name, i))
-            indent(file, "setenv(\"%s\", \"%s\", 1);" % (self.envstr, val))
-            indent(file, "ncclCvarInit();")
-            indent(file, "EXPECT_EQ(%s, \"%s\");" % (self.name, val.strip()))
-            indent(file, "}")
-            file.write("\n")
+            cases["string"].append(utCase("%s_value_%s" % (self.name, i),
+                self.envstr, val, cString(val.strip()), get))
 
         if self.default:
-            indent(file, "TEST_F(CvarTest, %s_default_value) {" % (self.name))
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            indent(file, "EXPECT_EQ(%s, \"%s\");" % (self.name, self.default))
-            indent(file, "}")
-            file.write("\n")
+            cases["string"].append(utCase("%s_default_value" % self.name,
+                self.envstr, None, self.defaultValue(), get))
 
     def readenv(self, file):
-        default = self.default if self.default else ""
-        indent(file, "%s = env2str(\"%s\", \"%s\");" %
-            (self.name, self.envstr, default))
-        indent(file, "%s_DEFAULT = env2str(\"NCCL_ENV_DO_NOT_SET\", \"%s\");" %
-            (self.name, default))
+        indent(file, "static void %s_parse(const char* val) {" % self.name)
+        indent(file, "%s = str2str(val);" % self.name)
+        indent(file, "}")
         file.write("\n")
 
 
@@ -231,49 +666,30 @@ class stringlist(basetype):
     def utilfns(file):
         pass
 
-    def externDecl(self, file):
-        indent(file, "extern std::vector<std::string> %s;" % self.name)
-        indent(file, "extern std::vector<std::string> %s_DEFAULT;" % self.name)
-        file.write("\n")
+    def ctype(self):
+        return "std::vector<std::string>"
 
-    def storageDecl(self, file):
-        indent(file, "std::vector<std::string> %s;" % self.name)
-        indent(file, "std::vector<std::string> %s_DEFAULT;" % self.name)
+    def defaultValue(self):
+        return cStringList(splitTokens(self.default))
+
+    def benchValue(self):
+        return "val1,val2"
 
-    def unitTest(self, file):
+    def unitTestCases(self, cases):
+        get = "CVAR_GET(std::vector<std::string>, %s)" % self.name
         for i, val in enumerate(["val1,val2,val3", "val1:1,val2:2,val3:3", "val", "val1, val_w_space  "]):
-            indent(file, "TEST_F(CvarTest, %s_valuelist_%s) {" % (self.name, i))
-            indent(file, "setenv(\"%s\", \"%s\", 1);" % (self.envstr, val))
-            trimmedVals = [v.strip() for v in val.split(",")]
-            indent(file, "std::vector<std::string> vals{\"%s\"};" % ("\",\"".join(trimmedVals)))
-            indent(file, "ncclCvarInit();")
-            indent(file, "checkListValues<std::string>(vals, %s);" % (self.name))
-            indent(file, "}")
-            file.write("\n")
+            cases["stringlist"].append(utCase("%s_valuelist_%s" % (self.name, i),
+                self.envstr, val, cStringList(splitTokens(val)), get))
 
-        indent(file, "TEST_F(CvarTest, %s_default_value) {" % (self.name))
-        if self.default:
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            indent(file, "{")
-            indent(file, "std::vector<std::string> vals{\"%s\"};" % (self.default.replace("," , "\",\"")))
-            indent(file, "checkListValues<std::string>(vals, %s);" % (self.name))
-            indent(file, "}")
-        else:
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            indent(file, "EXPECT_EQ(%s.size(), 0);" % (self.name))
-        indent(file, "}")
-        file.write("\n")
+        cases["stringlist"].append(utCase("%s_default_value" % self.name,
+            self.envstr, None, self.defaultValue(), get))
 
-        self.dupValUnitTest(file)
+        self.dupValUnitTest(cases)
 
     def readenv(self, file):
-        default = self.default if self.default else ""
-        indent(file, "%s.clear();" % self.name)
-        indent(file, "%s = env2strlist(\"%s\", \"%s\");" %
-            (self.name, self.envstr, default))
-        indent(file, "%s_DEFAULT.clear();" % self.name)
-        indent(file, "%s_DEFAULT = env2strlist(\"NCCL_ENV_DO_NOT_SET\", \"%s\");" %
-            (self.name, default))
+        indent(file, "static void %s_parse(const char* val) {" % self.name)
+        indent(file, "%s = str2strlist(val);" % self.name)
+        indent(file, "}")
         file.write("\n")
 
 
@@ -282,58 +698,71 @@ class prefixedStringlist(stringlist):
     def utilfns(file):
         pass
 
+    def splitDefault(self):
+        """(prefix, tokens) of the default, as str2prefixedStrlist()"""
+        default = self.default or ""
+        for prefix in [v.strip() for v in self.prefixes.split(",")]:
+            if default.startswith(prefix):
+                return prefix, splitTokens(default[len(prefix):])
+        return "", splitTokens(default)
+
+    def defaultValue(self):
+        return cStringList(self.splitDefault()[1])
+
+    def benchValue(self):
+        return self.prefixes.split(",")[0].strip() + "val1,val2"
+
     def externDecl(self, file):
         indent(file, "extern std::string %s_PREFIX;" % self.name)
-        indent(file, "extern std::string %s_PREFIX_DEFAULT;" % self.name)
+        indent(file, "extern const std::string %s_PREFIX_DEFAULT;" % self.name)
+        indent(file, "const std::string& %s_PREFIX_get();" % self.name)
         super().externDecl(file)
 
     def storageDecl(self, file):
         indent(file, "std::string %s_PREFIX;" % self.name)
-        indent(file, "std::string %s_PREFIX_DEFAULT;" % self.name)
+        indent(file, "const std::string %s_PREFIX_DEFAULT = %s;" %
+            (self.name, cString(self.splitDefault()[0])))
         super().storageDecl(file)
 
-    def unitTest(self, file):
-        indent(file, "TEST_F(CvarTest, %s_default_value) {" % (self.name))
-        if self.default:
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            indent(file, "{")
-            trimmedPrefixes = [v.strip() for v in self.prefixes.split(",")]
-            default = self.default
-            for v in trimmedPrefixes:
-                default = default.lstrip(v)
-            indent(file, "std::vector<std::string> vals{\"%s\"};" % (default.replace("," , "\",\"")))
-            indent(file, "checkListValues<std::string>(vals, %s);" % (self.name))
-            indent(file, "}")
-        else:
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            indent(file, "EXPECT_EQ(%s.size(), 0);" % (self.name))
-        indent(file, "}")
-        file.write("\n")
+    def fields(self):
+        return [("std::string", self.name + "_PREFIX")] + super().fields()
 
-        self.dupValUnitTest(file)
+    def unitTestCases(self, cases):
+        get = "CVAR_GET(std::vector<std::string>, %s)" % self.name
+        getPrefix = "CVAR_GET(std::string, %s_PREFIX)" % self.name
+        prefix, default = self.splitDefault()
+        label = "%s_default_value" % self.name
+        cases["stringlist"].append(utCase(label, self.envstr, None,
+            cStringList(default), get))
+        cases["string"].append(utCase(label, self.envstr, None,
+            cString(prefix), getPrefix))
+
+        self.dupValUnitTest(cases)
 
         val = "val1,val2,val3"
         for i, prefix in enumerate(["^", "=", ""]):
-            indent(file, "TEST_F(CvarTest, %s_prefix_%s) {" % (self.name, i))
-            indent(file, "setenv(\"%s\", \"%s%s\", 1);" % (self.envstr, prefix, val))
-            indent(file, "std::vector<std::string> vals{\"%s\"};" % (val.replace("," , "\",\"")))
-            indent(file, "ncclCvarInit();")
-            indent(file, "EXPECT_EQ(%s_PREFIX, \"%s\");" % (self.name, prefix))
-            indent(file, "checkListValues<std::string>(vals, %s);" % (self.name))
-            indent(file, "}")
-            file.write("\n")
+            label = "%s_prefix_%s" % (self.name, i)
+            cases["stringlist"].append(utCase(label, self.envstr, prefix + val,
+                cStringList(splitTokens(val)), get))
+            cases["string"].append(utCase(label, self.envstr, prefix + val,
+                cString(prefix), getPrefix))
+
+    def snapshot(self, file):
+        indent(file, "if (%s_get() != %s_DEFAULT || %s_PREFIX_get() != %s_PREFIX_DEFAULT) {" %
+            (self.name, self.name, self.name, self.name))
+        indent(file, "cvarSnapshotAdd(snapshot, \"%s\", %s_PREFIX_get() + cvarToString(%s_get()), "
+            "%s_PREFIX_DEFAULT + cvarToString(%s_DEFAULT));" %
+            (self.envstr, self.name, self.name, self.name, self.name))
+        indent(file, "}")
 
     def readenv(self, file):
         trimmedPrefixes = [v.strip() for v in self.prefixes.split(",")]
-        indent(file, "std::vector<std::string> %s_allPrefixes{\"%s\"};" % (self.name, ("\", \"").join(trimmedPrefixes)))
-        default = self.default if self.default else ""
-        indent(file, "%s.clear();" % self.name)
-        indent(file, "std::tie(%s_PREFIX, %s) = env2prefixedStrlist(\"%s\", \"%s\", %s_allPrefixes);" %
-                (self.name, self.name, self.envstr, default, self.name))
-        indent(file, "%s_DEFAULT.clear();" % self.name)
-        indent(file, "std::tie(%s_PREFIX_DEFAULT, %s_DEFAULT) = " \
-                "env2prefixedStrlist(\"NCCL_ENV_DO_NOT_SET\", \"%s\", %s_allPrefixes);" %
-                (self.name, self.name, default, self.name))
+        indent(file, "static const char* const %s_allPrefixes[] = %s;" %
+                (self.name, cStringList(trimmedPrefixes)))
+        indent(file, "static void %s_parse(const char* val) {" % self.name)
+        indent(file, "std::tie(%s_PREFIX, %s) = str2prefixedStrlist(val, %s_allPrefixes);" %
+                (self.name, self.name, self.name))
+        indent(file, "}")
         file.write("\n")
 
 class enum(basetype):
@@ -348,49 +777,42 @@ class enum(basetype):
             indent(file, "%s," % c)
         indent(file, "};")
         indent(file, "extern enum %s %s;" % (self.name, self.name))
-        indent(file, "extern enum %s %s_DEFAULT;" % (self.name, self.name))
+        indent(file, "extern const enum %s %s_DEFAULT;" % (self.name, self.name))
+        indent(file, "const enum %s& %s_get();" % (self.name, self.name))
         file.write("\n")
 
-    def storageDecl(self, file):
-        indent(file, "enum %s %s;" % (self.name, self.name))
-        indent(file, "enum %s %s_DEFAULT;" % (self.name, self.name))
+    def ctype(self):
+        return "enum %s" % self.name
+
+    def defaultValue(self):
+        return "%s::%s" % (self.name, self.default.strip())
+
+    def benchValue(self):
+        return splitChoices(self.choices)[-1]
 
-    def unitTest(self, file):
+    def unitTestCases(self, cases):
+        get = "CVAR_GET(int64_t, %s)" % self.name
         choiceList = self.choices.replace(" ", "").split(",")
         for i, val in enumerate(choiceList):
-            indent(file, "TEST_F(CvarTest, %s_single_choice_%s) {" % (self.name, i))
-            indent(file, "setenv(\"%s\", \"%s\", 1);" % (self.envstr, val))
-            indent(file, "ncclCvarInit();")
-            indent(file, "EXPECT_EQ(%s, %s::%s);" % (self.name, self.name, val))
-            indent(file, "}")
-            file.write("\n")
+            cases["int"].append(utCase("%s_single_choice_%s" % (self.name, i),
+                self.envstr, val, "int64_t(%s::%s)" % (self.name, val), get))
 
         if self.default:
-            indent(file, "TEST_F(CvarTest, %s_default_choice) {" % (self.name))
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            indent(file, "EXPECT_EQ(%s, %s::%s);" % (self.name, self.name, self.default))
-            indent(file, "}")
-        file.write("\n")
+            cases["int"].append(utCase("%s_default_choice" % self.name,
+                self.envstr, None, "int64_t(%s)" % self.defaultValue(), get))
+
+        self.unknownValUnitTest(cases)
 
-        self.unknownValUnitTest(file)
+    def toString(self, expr):
+        return "cvarToString(%s, %s_choices)" % (expr, self.name)
 
     def readenv(self, file):
-        indent(file, "if (getenv(\"%s\") == nullptr) {" % self.envstr)
-        indent(file, "%s = %s::%s;" % (self.name, self.name, self.default))
-        indent(file, "} else {")
-        indent(file, "std::string str(getenv(\"%s\"));" % self.envstr)
-        choices = self.choices.replace(" ", "").split(",")
-        for idx, c in enumerate(choices):
-            if (idx == 0):
-               indent(file, "if (str == std::string(\"%s\")) {" % c)
-            else:
-               indent(file, "} else if (str == std::string(\"%s\")) {" % c)
-            indent(file, "%s = %s::%s;" % (self.name, self.name, c))
-        indent(file, "} else {")
-        indent(file, "  CVAR_WARN_UNKNOWN_VALUE(\"%s\", str.c_str());" % self.name)
+        writeEnumChoices(file, self.name, self.choices.replace(" ", "").split(","))
+        indent(file, "static void %s_parse(const char* val) {" % self.name)
+        indent(file, "if (!str2enum(val, %s_choices, %s)) {" % (self.name, self.name))
+        indent(file, "CVAR_WARN_UNKNOWN_VALUE(\"%s\", val);" % self.name)
         indent(file, "}")
         indent(file, "}")
-        indent(file, "%s_DEFAULT = %s::%s;" % (self.name, self.name, self.default))
         file.write("\n")
 
 
@@ -406,71 +828,77 @@ class enumlist(basetype):
             indent(file, "%s," % c)
         indent(file, "};")
         indent(file, "extern std::vector<enum %s> %s;" % (self.name, self.name))
-        indent(file, "extern std::vector<enum %s> %s_DEFAULT;" % (self.name, self.name))
+        indent(file, "extern const std::vector<enum %s> %s_DEFAULT;" % (self.name, self.name))
+        indent(file, "const std::vector<enum %s>& %s_get();" % (self.name, self.name))
+        indent(file, "extern uint64_t %s_MASK;" % self.name)
+        indent(file, "extern const uint64_t %s_MASK_DEFAULT;" % self.name)
+        indent(file, "uint64_t %s_MASK_get();" % self.name)
         file.write("\n")
 
     def storageDecl(self, file):
-        indent(file, "std::vector<enum %s> %s;" % (self.name, self.name))
-        indent(file, "std::vector<enum %s> %s_DEFAULT;" % (self.name, self.name))
+        super().storageDecl(file)
+        indent(file, "uint64_t %s_MASK;" % self.name)
+        indent(file, "const uint64_t %s_MASK_DEFAULT = %s;" %
+            (self.name, self.defaultMask()))
+
+    def fields(self):
+        return super().fields() + [("uint64_t", self.name + "_MASK")]
 
-    def unitTest(self, file):
+    def ctype(self):
+        return "std::vector<enum %s>" % self.name
+
+    def defaultValue(self):
+        return "{%s}" % ", ".join(
+            "%s::%s" % (self.name, d) for d in splitTokens(self.default))
+
+    def benchValue(self):
+        return ",".join(splitChoices(self.choices))
+
+    def defaultMask(self):
+        choices = self.choices.replace(" ", "").split(",")
+        mask = 0
+        for d in splitTokens(self.default):
+            mask |= 1 << choices.index(d)
+        return "0x%xULL" % mask
+
+    def unitTestCases(self, cases):
+        get = "CVAR_GET_ENUMLIST(%s)" % self.name
+        getMask = "CVAR_GET_MASK(%s)" % self.name
         choiceList = self.choices.replace(" ", "").split(",")
-        allChoicesEnum = ["%s::%s" % (self.name, c) for c in choiceList]
 
-        for i, val in enumerate(choiceList):
-            indent(file, "TEST_F(CvarTest, %s_single_choice_%s) {" % (self.name, i))
-            indent(file, "setenv(\"%s\", \"%s\", 1);" % (self.envstr, val))
-            indent(file, "ncclCvarInit();")
-            indent(file, "std::vector<enum %s> vals{%s::%s};" % (self.name, self.name, val))
-            indent(file, "checkListValues<enum %s>(vals, %s);" % (self.name, self.name))
-            indent(file, "}")
-            file.write("\n")
+        def addCases(label, value, choices):
+            cases["enumlist"].append(utCase(label, self.envstr, value,
+                "{%s}" % ", ".join("int64_t(%s::%s)" % (self.name, c) for c in choices),
+                get))
+            mask = " | ".join("ncclCvarBit(%s::%s)" % (self.name, c) for c in choices)
+            cases["uint"].append(utCase(label, self.envstr, value, mask or "0", getMask))
 
-        indent(file, "TEST_F(CvarTest, %s_all_choices) {" % (self.name))
-        indent(file, "setenv(\"%s\", \"%s\", 1);" % (self.envstr, self.choices))
-        indent(file, "ncclCvarInit();")
-        indent(file, "std::vector<enum %s> vals{%s};" % (self.name, ",".join(allChoicesEnum)))
-        indent(file, "checkListValues<enum %s>(vals, %s);" % (self.name, self.name))
-        indent(file, "}")
-        file.write("\n")
+        for i, val in enumerate(choiceList):
+            addCases("%s_single_choice_%s" % (self.name, i), val, [val])
+        addCases("%s_all_choices" % self.name, self.choices, choiceList)
+        addCases("%s_default_choices" % self.name, None, splitTokens(self.default))
 
-        defaultChoicesEnum = ["%s::%s" % (self.name, c) for c in self.default.replace(" ", "").split(",")]
-        indent(file, "TEST_F(CvarTest, %s_default_choices) {" % (self.name))
-        if defaultChoicesEnum:
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            indent(file, "std::vector<enum %s> vals{%s};" % (self.name, ",".join(defaultChoicesEnum)))
-            indent(file, "checkListValues<enum %s>(vals, %s);" % (self.name, self.name))
-        else:
-            indent(file, "testDefaultValue(\"%s\");" % (self.envstr))
-            indent(file, "EXPECT_EQ(%s.size(), 0);" % (self.name))
-        indent(file, "}")
-        file.write("\n")
+        self.unknownValUnitTest(cases)
+        self.dupValUnitTest(cases)
 
-        self.unknownValUnitTest(file)
-        self.dupValUnitTest(file)
+    def toString(self, expr):
+        return "cvarToString(%s, %s_choices)" % (expr, self.name)
 
     def readenv(self, file):
-        indent(file, "{")
+        writeEnumChoices(file, self.name, self.choices.replace(" ", "").split(","))
+        indent(file, "static void %s_parse(const char* val) {" % self.name)
         indent(file, "%s.clear();" % self.name)
-        indent(file, "auto tokens = env2strlist(\"%s\", \"%s\");" %
-                (self.envstr, self.default))
-        choices = self.choices.replace(" ", "").split(",")
-        indent(file, "for (auto token : tokens) {")
-        for idx, c in enumerate(choices):
-            if (idx == 0):
-               indent(file, "if (token == std::string(\"%s\")) {" % c)
-            else:
-               indent(file, "} else if (token == std::string(\"%s\")) {" % c)
-            indent(file, "%s.emplace_back(%s::%s);" % (self.name, self.name, c))
+        indent(file, "%s_MASK = 0;" % self.name)
+        indent(file, "for (const auto& token : str2strlist(val)) {")
+        indent(file, "enum %s choice;" % self.name)
+        indent(file, "if (str2enum(token.c_str(), %s_choices, choice)) {" % self.name)
+        indent(file, "%s.emplace_back(choice);" % self.name)
+        indent(file, "%s_MASK |= ncclCvarBit(choice);" % self.name)
         indent(file, "} else {")
-        indent(file, "  CVAR_WARN_UNKNOWN_VALUE(\"%s\", token.c_str());" % self.name)
+        indent(file, "CVAR_WARN_UNKNOWN_VALUE(\"%s\", token.c_str());" % self.name)
         indent(file, "}")
         indent(file, "}")
         indent(file, "}")
-        indent(file, "%s_DEFAULT.clear();" % self.name)
-        default = self.default.replace(" ", "").split(",")
-        for d in default:
-            indent(file, "%s_DEFAULT.emplace_back(%s::%s);" % (self.name, self.name, d))
         file.write("\n")
 
 def printAutogenStart(file):
@@ -485,7 +913,88 @@ def printAutogenHeader(file):
 def printAutogenFooter(file):
     file.write("// Automatically generated by ./maint/extractcvars.py --- END\n")
 
-def populateCCFile(allcvars, templateFilename, outputFilename):
+def blankLiterals(line, state):
+    """Return line with its comments and string and character literals
+    replaced by spaces, and the state to scan the next line with: None, or
+    the "/*" comment or the quote that is still open at the end of line."""
+    out = []
+    i = 0
+    while i < len(line):
+        if state == "/*":
+            end = line.find("*/", i)
+            stop = len(line) if end == -1 else end + 2
+            out.append(" " * (stop - i))
+            i = stop
+            if end != -1:
+                state = None
+        elif state:
+            j = i
+            while j < len(line) and line[j] != state:
+                j += 2 if line[j] == "\\" else 1
+            stop = min(j + 1, len(line))
+            out.append(" " * (stop - i))
+            i = stop
+            # Only a backslash-newline continues a literal on the next line
+            if j < len(line) or not line.rstrip("\n").endswith("\\"):
+                state = None
+        elif line.startswith("//", i):
+            break
+        elif line.startswith("/*", i):
+            state = "/*"
+            out.append("  ")
+            i += 2
+        elif line[i] in "\"'":
+            state = line[i]
+            out.append(" ")
+            i += 1
+        else:
+            out.append(line[i])
+            i += 1
+    return "".join(out), state
+
+
+def findDirectReaders(filenames, allcvars):
+    """Return "file:line: name" of every direct access to a cvar global,
+    which a --lazy build would leave at its default. Comments, string
+    literals and names that a header #defines as a macro are ignored."""
+    generated = ("nccl_cvars.cc", "nccl_cvars.h")
+    sources = {}
+    for filename in sorted(filenames):
+        base = os.path.basename(filename)
+        # The cvar unit tests check the globals along with the accessors
+        if base in generated or base.startswith("CvarUT"):
+            continue
+        with open(filename, "r", errors="replace") as f:
+            sources[filename] = f.read()
+
+    macros = set()
+    for content in sources.values():
+        macros.update(re.findall(r"^\s*#\s*define\s+(\w+)", content, re.MULTILINE))
+    names = set()
+    for cvar in allcvars:
+        names.update(name for _, name in cvar.fields())
+    names -= macros
+    regex = re.compile(r'(?<!\w)(%s)\b(?!_get\b|::)' %
+        "|".join(sorted(names, key=len, reverse=True)))
+
+    readers = []
+    for filename, content in sources.items():
+        inBlock = False
+        state = None
+        for lineno, line in enumerate(content.splitlines(), 1):
+            if "BEGIN_NCCL_CVAR_INFO_BLOCK" in line:
+                inBlock = True
+            elif "END_NCCL_CVAR_INFO_BLOCK" in line:
+                inBlock = False
+            code, state = blankLiterals(line, state)
+            if inBlock:
+                continue
+            for m in regex.finditer(code):
+                readers.append("%s:%d: %s" % (filename, lineno, m.group(1)))
+    return readers
+
+
+def populateCCFile(allcvars, templateFilename, outputFilename, lazy=False):
     file = StringIO()
 
     printAutogenStart(file)
@@ -495,22 +1004,52 @@ def populateCCFile(allcvars, templateFilename, outputFilename):
         cvar.storageDecl(file)
     file.write("\n")
 
-    # Generate initialization for environment variable set
-    indent(file, "void initEnvSet(std::unordered_set<std::string>& env) {")
-    for cvar in allcvars:
-        indent(file, "env.insert(\"%s\");" % cvar.envstr)
-    for e in acceptedEnvs:
-        indent(file, "env.insert(\"%s\");" % e)
-    indent(file, "}")
+    envs = [(cvar.envstr, "%s_parse" % cvar.name, "%s_reset" % cvar.name)
+            for cvar in allcvars]
+    envs += [(e, "nullptr", "nullptr") for e in acceptedEnvs]
+    indent(file, "static constexpr int numCvarEnvs = %d;" % len(envs))
     file.write("\n")
 
-    # Generate environment reading of all cvars
-    indent(file, "void readCvarEnv() {")
+    # Generate per-cvar parsers of the environment variable value and reset
+    # to the default
     for cvar in allcvars:
         cvar.readenv(file)
+        indent(file, "static void %s_reset() {" % cvar.name)
+        cvar.resetDefault(file)
+        indent(file, "}")
+        file.write("\n")
+
+    # Generate table of all accepted NCCL_ environment variables
+    indent(file, "static const CvarEnvEntry cvarEnvTable[numCvarEnvs] = {")
+    for env, parse, reset in envs:
+        indent(file, "{\"%s\", %d, %s, %s}," % (env, len(env), parse, reset))
+    indent(file, "};")
+    file.write("\n")
+
+    # Generate accessors, which parse their cvar on first use
+    indent(file, "static constexpr bool cvarLazyInit = %s;" % ("true" if lazy else "false"))
+    file.write("\n")
+    for idx, cvar in enumerate(allcvars):
+        cvar.accessor(file, idx)
+    file.write("\n")
+
+    # Generate the snapshot of all cvars differing from their default
+    indent(file, "std::string ncclCvarSnapshot() {")
+    indent(file, "std::string snapshot;")
+    for cvar in allcvars:
+        cvar.snapshot(file)
+    # Written as is: indent() would count the braces of the string literals
+    file.write("  return snapshot.empty() ? \"{}\" : snapshot + \"}\";\n")
     indent(file, "}")
     file.write("\n")
 
+    # Generate perfect hash of the environment variable names
+    seeds, slots = perfectHash([env.encode() for env, _, _ in envs])
+    indent(file, "static constexpr uint32_t cvarEnvHashMask = %d;" % (len(slots) - 1))
+    writeArray(file, "static const uint32_t cvarEnvHashSeeds[%d]" % len(seeds), seeds)
+    writeArray(file, "static const int16_t cvarEnvHashSlots[%d]" % len(slots), slots)
+    file.write("\n")
+
     printAutogenFooter(file)
     content = file.getvalue()
 
@@ -518,14 +1057,13 @@ def populateCCFile(allcvars, templateFilename, outputFilename):
     with open(templateFilename, "r") as tpl:
         fileContents = tpl.read()
         fileContents = fileContents.replace("### AUTOGEN_CONTENT ###", content)
-        with open(outputFilename, "w") as out:
-            out.write(fileContents)
+        writeIfChanged(outputFilename, fileContents)
 
     file.close()
 
 
 def populateHFile(allcvars, outputFilename):
-    file = open(outputFilename, "w")
+    file = StringIO()
     printAutogenHeader(file)
     file.write("\n")
 
@@ -533,10 +1071,18 @@ def populateHFile(allcvars, outputFilename):
     file.write("#define NCCL_CVARS_H_INCLUDED\n")
     file.write("\n")
 
+    file.write("#include <cstdint>\n")
     file.write("#include <string>\n")
     file.write("#include <vector>\n")
     file.write("\n")
 
+    # Bit of an enumlist choice in its <name>_MASK
+    file.write("template <typename T>\n")
+    file.write("constexpr uint64_t ncclCvarBit(T choice) {\n")
+    file.write("  return 1ULL << static_cast<int>(choice);\n")
+    file.write("}\n")
+    file.write("\n")
+
     # Generate extern declaration
     for cvar in allcvars:
         cvar.externDecl(file)
@@ -545,15 +1091,33 @@ def populateHFile(allcvars, outputFilename):
     file.write("void ncclCvarInit();\n")
     file.write("\n")
 
+    file.write("// Re-read only the named environment variables (e.g. \"NCCL_PROXY_PROFILE\")\n")
+    file.write("// and update their cvars; unset variables revert to their default.\n")
+    file.write("// Like ncclCvarInit(), this writes the cvar globals, so it must not run\n")
+    file.write("// concurrently with code reading the reloaded cvars; call it between\n")
+    file.write("// communicator creations.\n")
+    file.write("void ncclCvarReload(const std::vector<std::string>& names);\n")
+    file.write("\n")
+
+    file.write("// JSON object of every cvar differing from its default, keyed by env name:\n")
+    file.write("// {\"NCCL_BUFFSIZE\":{\"value\":\"8388608\",\"default\":\"-2\"},...}\n")
+    file.write("std::string ncclCvarSnapshot();\n")
+    file.write("\n")
+
+    file.write("// str as a quoted JSON string, escaped like the values in ncclCvarSnapshot()\n")
+    file.write("std::string ncclCvarJsonString(const std::string& str);\n")
+    file.write("\n")
+
     file.write("#endif  /* NCCL_CVARS_H_INCLUDED */")
     file.write("\n")
 
     printAutogenFooter(file)
+    writeIfChanged(outputFilename, file.getvalue())
     file.close()
 
 
 def populateReadme(allcvars, filename):
-    file = open(filename, "w")
+    file = StringIO()
     file.write("(c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.\n")
     file.write("\n")
     file.write("Automatically generated\n")
@@ -561,39 +1125,86 @@ def populateReadme(allcvars, filename):
     file.write("DO NOT EDIT!!!\n")
     for cvar in allcvars:
         cvar.desc(file)
+    writeIfChanged(filename, file.getvalue())
     file.close()
 
-def populateUT(allcvars, templateFilename, outputFilename):
+def populateCatalog(allcvars, basename):
+    """Write the cvar catalog read by maint/cvarcatalog.py as basename.json
+    and basename.bin"""
+    text, data = encodeCatalog([cvar.catalogEntry() for cvar in allcvars],
+                               acceptedEnvs)
+    writeIfChanged(basename + ".json", text)
+    writeIfChanged(basename + ".bin", data)
+
+# Kinds of generated test cases: kind, parameterized test suite, case type
+utKinds = [
+    ("bool", "CvarBoolTest", "CvarCase<bool>"),
+    ("int", "CvarIntTest", "CvarCase<int64_t>"),
+    ("uint", "CvarUintTest", "CvarCase<uint64_t>"),
+    ("float", "CvarFloatTest", "CvarCase<double>"),
+    ("string", "CvarStringTest", "CvarCase<std::string>"),
+    ("stringlist", "CvarStringListTest", "CvarCase<std::vector<std::string>>"),
+    ("enumlist", "CvarEnumListTest", "CvarCase<std::vector<int64_t>>"),
+    ("warn", "CvarWarnTest", "CvarWarnCase"),
+]
+
+def populateBenchEnvs(allcvars, outputFilename):
+    """Generate a valid setting of every cvar for src/benchmarks/CvarInitBench.cc"""
     file = StringIO()
-
-    # Generate unit test declarations
-    file.write("// Automatically generated by ./maint/extractcvars.py\n")
-    file.write("// DO NOT EDIT!!!\n")
+    printAutogenHeader(file)
+    file.write("\n")
+    file.write("#ifndef CVAR_BENCH_ENVS_H_INCLUDED\n")
+    file.write("#define CVAR_BENCH_ENVS_H_INCLUDED\n")
+    file.write("\n")
+    indent(file, "static const char* const cvarBenchEnvs[][2] = {")
     for cvar in allcvars:
-        cvar.unitTest(file)
-    utDecl = file.getvalue()
+        indent(file, "{%s, %s}," % (cString(cvar.envstr), cString(cvar.benchValue())))
+    indent(file, "};")
+    file.write("\n")
+    file.write("#endif  /* CVAR_BENCH_ENVS_H_INCLUDED */\n")
+    printAutogenFooter(file)
+    writeIfChanged(outputFilename, file.getvalue())
+    file.close()
 
-    # Load template and insert generated contents
-    with open(templateFilename, "r") as tpl:
-        fileContents = tpl.read()
-        fileContents = fileContents.replace("## NCCL_CVAR_TESTS_DECL ##", utDecl)
+def populateUT(allcvars, outputPattern, numShards):
+    """Generate the test case tables of all cvars, split into numShards files.
 
-        with open(outputFilename, "w") as out:
-            out.write(fileContents)
-    file.close()
+    Cvars are assigned to shards by a hash of their name, so adding a cvar
+    only changes the shard it lands in. The parameterized tests consuming
+    the tables are defined in src/tests/CvarUT.cc.
+    """
+    shards = [{kind: [] for kind, _, _ in utKinds} for _ in range(numShards)]
+    for cvar in allcvars:
+        cvar.unitTestCases(shards[fnv1a(cvar.name.encode(), 0) % numShards])
 
-def main():
-    filenames = []
-    for (root, dirs, files) in os.walk('.', topdown=True):
-        for x in files:
-            if x.endswith(".cc") or x.endswith(".h"):
-                filenames.append(os.path.join(root, x))
+    for shard, cases in enumerate(shards):
+        file = StringIO()
+        printAutogenHeader(file)
+        file.write("\n")
+        file.write("#include \"CvarUT.h\"\n")
+        file.write("\n")
+        for kind, suite, caseType in utKinds:
+            if not cases[kind]:
+                continue
+            indent(file, "static const %s %sCases[] = {" % (caseType, kind))
+            for case in cases[kind]:
+                indent(file, case)
+            indent(file, "};")
+            indent(file, "INSTANTIATE_CVAR_CASES(Shard%d, %s, %sCases);" % (shard, suite, kind))
+            file.write("\n")
+        printAutogenFooter(file)
+        writeIfChanged(outputPattern % shard, file.getvalue())
+        file.close()
 
-    data = loadCvarsFromFiles(filenames)
-    if (data['cvars'] == None):
-        return
+    # Remove shards left over from a run with more shards
+    shard = numShards
+    while os.path.exists(outputPattern % shard):
+        os.remove(outputPattern % shard)
+        shard += 1
 
-    loadedCvars = sorted(data['cvars'], key=lambda x: x['name'])
+def makeCvars(cvars):
+    """Cvar objects of loaded cvars, sorted by name"""
+    loadedCvars = sorted(cvars, key=lambda x: x['name'])
 
     allcvars = []
     for cvar in loadedCvars:
@@ -611,11 +1222,72 @@ def main():
             allcvars.append(prefixedStringlist(cvar))
         else:
             allcvars.append(numeric(cvar))
+    return allcvars
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate NCCL cvar sources from NCCL_CVAR_INFO blocks")
+    parser.add_argument(
+        "--cache-file",
+        type=str,
+        default=".extractcvars.cache",
+        help="file caching the parsed cvar blocks of each source file",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore the cache and re-parse every source file",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="generate an ncclCvarInit() that leaves parsing of each cvar to "
+             "the first call of its <name>_get() accessor; fails if any source "
+             "file still reads a cvar global directly",
+    )
+    parser.add_argument(
+        "--ut-shards",
+        type=int,
+        default=4,
+        help="number of src/tests/CvarUTShard<N>.cc files to split the "
+             "generated cvar unit tests into",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes used to scan large source trees",
+    )
+    args = parser.parse_args()
+
+    filenames = findSourceFiles('.')
+
+    cache = {} if args.no_cache else loadCache(args.cache_file)
+    try:
+        cvars, files = loadCvarsFromFiles(filenames, cache, args.jobs)
+    except CvarError as e:
+        sys.exit("extractcvars.py: error: %s" % e)
+    saveCache(args.cache_file, files)
+    if not cvars:
+        return
+
+    allcvars = makeCvars(cvars)
+
+    if args.lazy:
+        readers = findDirectReaders(filenames, allcvars)
+        if readers:
+            sys.exit("extractcvars.py: error: --lazy requires reading cvars "
+                     "through their <name>_get() accessors, but these read "
+                     "the globals directly:\n  %s" % "\n  ".join(readers))
 
-    populateCCFile(allcvars, "src/misc/nccl_cvars.cc.in", "src/misc/nccl_cvars.cc")
+    populateCCFile(allcvars, "src/misc/nccl_cvars.cc.in", "src/misc/nccl_cvars.cc", args.lazy)
     populateHFile(allcvars, "src/include/nccl_cvars.h")
     populateReadme(allcvars, "README.cvars")
-    populateUT(allcvars, "src/tests/CvarUT.cc.in", "src/tests/CvarUT.cc")
+    populateCatalog(allcvars, "maint/nccl_cvars")
+    populateUT(allcvars, "src/tests/CvarUTShard%d.cc", args.ut_shards)
+    populateBenchEnvs(allcvars, "src/benchmarks/CvarBenchEnvs.h")
 
 
 if __name__ == "__main__":
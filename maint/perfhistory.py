@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Record NCCL test performance over time and gate on regressions.
+
+Each run of a test is stored in a local SQLite database together with the
+hash of the test binary, its effective envs, host count, ppn, and the
+per-collective latencies of its CollTrace results (see colltracestats.py):
+
+    ./maint/perfhistory.py --db perf.db record --test nccl_allreduce \\
+        --binary ./nccl_allreduce --nnode 2 --ppn 8 --envs "NCCL_ALGO=Ring" \\
+        /tmp/colltrace
+
+Runs with the same test, host count, ppn and envs share a configuration.
+compare checks a run (default: the latest) against a rolling baseline of
+the previous runs of its configuration, collective by collective. The
+sample unit is the run: the ranks of a collective finish together, so
+their latencies are not independent samples. Each (collective, message
+size) checks how far the median latency of the run lies above the median
+latencies of the baseline runs, with a one-sided t test of a new
+observation on their logarithms (or, without assuming a distribution, the
+rank of the run among them), and the p-values are Holm-Bonferroni
+corrected over all of them. A slowdown is reported when it is both
+significant and larger than --min-slowdown, and then compare exits with 1:
+
+    ./maint/perfhistory.py --db perf.db compare
+
+Failed runs and runs without results are kept out of baselines. compare
+also exits with 1, reporting "no data", when the run itself failed or has
+no (collective, message size) in common with its baseline.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import sqlite3
+import sys
+import time
+
+import colltracestats
+
+schemaVersion = 1
+
+schema = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    test TEXT NOT NULL,
+    binaryHash TEXT NOT NULL,
+    configKey TEXT NOT NULL,
+    envs TEXT NOT NULL,
+    nnode INTEGER NOT NULL,
+    ppn INTEGER NOT NULL,
+    passed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runsByConfig ON runs (configKey, id);
+CREATE TABLE IF NOT EXISTS results (
+    runId INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    coll TEXT NOT NULL,
+    msgSize INTEGER NOT NULL,
+    ranks INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    p50Ms REAL NOT NULL,
+    p90Ms REAL NOT NULL,
+    p99Ms REAL NOT NULL,
+    meanMs REAL NOT NULL,
+    busBwGBs REAL NOT NULL,
+    rankMedians TEXT NOT NULL,
+    PRIMARY KEY (runId, coll, msgSize)
+);
+"""
+
+# Per-rank median latencies kept per (coll, msgSize) of a run; larger jobs
+# keep evenly spaced quantiles of them
+maxRankMedians = 1024
+
+# Envs that differ between otherwise identical runs
+ignoredEnvs = {"NCCL_COLLTRACE_DIR", "NCCL_CVAR_SNAPSHOT_DIR"}
+
+# Baseline runs with results of a (coll, msgSize) needed to compare it
+minBaselineRuns = 3
+
+
+def configKey(test, nnode, ppn, envs):
+    envs = {k: v for k, v in envs.items() if k not in ignoredEnvs}
+    key = json.dumps([test, nnode, ppn, envs], sort_keys=True)
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def fileHash(filename):
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def quantileSample(values, n):
+    """At most n evenly spaced quantiles of values"""
+    values = sorted(values)
+    if len(values) <= n:
+        return values
+    step = (len(values) - 1) / (n - 1)
+    return [values[round(i * step)] for i in range(n)]
+
+
+class PerfHistory:
+    def __init__(self, filename):
+        self.db = sqlite3.connect(filename)
+        self.db.execute("PRAGMA foreign_keys = ON")
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, schemaVersion):
+            raise ValueError("%s: unsupported schema version %d" % (filename, version))
+        with self.db:
+            self.db.executescript(schema)
+            self.db.execute("PRAGMA user_version = %d" % schemaVersion)
+
+    def close(self):
+        self.db.close()
+
+    def recordRun(self, test, binaryHash, envs, nnode, ppn, results, passed=True,
+                  nranks=None):
+        """Store a run and its CollTrace results, as returned by
+        colltracestats.loadResults(); returns the id of the run"""
+        rankMedians = {
+            key: [colltracestats.median(column) for column in ranks.values()]
+            for key, ranks in results.items()
+        }
+        summary = colltracestats.summarize(results, nranks or nnode * ppn)
+        with self.db:
+            cur = self.db.execute(
+                "INSERT INTO runs (time, test, binaryHash, configKey, envs, nnode, ppn, passed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), test, binaryHash, configKey(test, nnode, ppn, envs),
+                 json.dumps(envs, sort_keys=True), nnode, ppn, int(passed)))
+            runId = cur.lastrowid
+            self.db.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(runId, s["coll"], s["msgSize"], s["ranks"], s["samples"],
+                  s["p50Ms"], s["p90Ms"], s["p99Ms"], s["meanMs"], s["busBwGBs"],
+                  json.dumps(quantileSample(rankMedians[(s["coll"], s["msgSize"])],
+                                            maxRankMedians)))
+                 for s in summary])
+        return runId
+
+    def run(self, runId=None):
+        """Row of a run as a dict (default: the latest one), or None"""
+        self.db.row_factory = sqlite3.Row
+        try:
+            if runId is None:
+                row = self.db.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+            else:
+                row = self.db.execute("SELECT * FROM runs WHERE id = ?", (runId,)).fetchone()
+        finally:
+            self.db.row_factory = None
+        return dict(row) if row else None
+
+    def runs(self, test=None, limit=20):
+        self.db.row_factory = sqlite3.Row
+        try:
+            query = "SELECT * FROM runs"
+            params = ()
+            if test is not None:
+                query += " WHERE test = ?"
+                params = (test,)
+            rows = self.db.execute(query + " ORDER BY id DESC LIMIT ?", params + (limit,))
+            return [dict(row) for row in rows]
+        finally:
+            self.db.row_factory = None
+
+    def baselineRuns(self, run, numRuns):
+        """Ids of the last numRuns passing runs with results of the
+        configuration of run before it"""
+        rows = self.db.execute(
+            "SELECT id FROM runs WHERE configKey = ? AND id < ? AND passed "
+            "AND EXISTS (SELECT 1 FROM results WHERE runId = runs.id) "
+            "ORDER BY id DESC LIMIT ?", (run["configKey"], run["id"], numRuns))
+        return [r[0] for r in rows]
+
+    def runMedians(self, runIds):
+        """{(coll, msgSize): [median latency of each run]} of runIds"""
+        samples = {}
+        if not runIds:
+            return samples
+        rows = self.db.execute(
+            "SELECT coll, msgSize, p50Ms FROM results WHERE runId IN (%s) ORDER BY runId"
+            % ",".join("?" * len(runIds)), runIds)
+        for coll, size, p50 in rows:
+            samples.setdefault((coll, size), []).append(p50)
+        return samples
+
+
+def betaIncomplete(a, b, x):
+    """Regularized incomplete beta function I_x(a, b), by its continued
+    fraction (modified Lentz's method)"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - betaIncomplete(b, a, 1 - x)
+    tiny = 1e-300
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log(1 - x)) / a
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    f = d
+    for m in range(1, 200):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            f *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return front * f
+
+
+def tGreater(x, y):
+    """One-sided p-value that the run median x is larger than the baseline
+    run medians y would give: a t test of one new observation on the
+    logarithms of the medians, as run-to-run noise is proportional"""
+    logY = [math.log(v) for v in y]
+    n = len(logY)
+    mean = sum(logY) / n
+    sd = math.sqrt(sum((v - mean) ** 2 for v in logY) / (n - 1))
+    diff = math.log(x) - mean
+    if sd == 0:
+        return 0.0 if diff > 0 else 1.0
+    t = diff / (sd * math.sqrt(1 + 1.0 / n))
+    df = n - 1
+    # P(T > t) of Student's t distribution with df degrees of freedom
+    tail = 0.5 * betaIncomplete(df / 2.0, 0.5, df / (df + t * t))
+    return tail if t > 0 else 1.0 - tail
+
+
+def rankGreater(x, y):
+    """One-sided p-value of the run median x from its rank among the
+    baseline run medians y; it is at least 1 / (len(y) + 1)"""
+    return (1 + sum(1 for v in y if v >= x)) / (len(y) + 1.0)
+
+
+def holm(pvalues):
+    """Holm-Bonferroni adjusted p-values, in input order"""
+    order = sorted(range(len(pvalues)), key=lambda i: pvalues[i])
+    adjusted = [1.0] * len(pvalues)
+    prev = 0.0
+    for k, i in enumerate(order):
+        prev = max(prev, min(1.0, (len(pvalues) - k) * pvalues[i]))
+        adjusted[i] = prev
+    return adjusted
+
+
+def compareRun(history, runId=None, baselineRuns=10, alpha=0.01,
+               minSlowdown=0.05, method="t"):
+    run = history.run(runId)
+    if run is None:
+        raise ValueError("no run %s in the history" % ("" if runId is None else runId))
+    baselineIds = history.baselineRuns(run, baselineRuns)
+    report = {"run": run["id"], "test": run["test"], "binaryHash": run["binaryHash"],
+              "baselineRuns": baselineIds, "collectives": [], "regressions": 0,
+              "noData": None}
+    if not run["passed"]:
+        report["noData"] = "the run failed"
+        return report
+    if not baselineIds:
+        return report
+
+    current = history.runMedians([run["id"]])
+    baseline = history.runMedians(baselineIds)
+    keys = sorted(set(current) & set(baseline))
+    if not keys:
+        report["noData"] = ("no results in common with the baseline" if current
+                            else "the run has no results")
+        return report
+    test = tGreater if method == "t" else rankGreater
+    rows = []
+    for key in keys:
+        x, y = current[key][0], baseline[key]
+        if len(y) < minBaselineRuns or x <= 0 or min(y) <= 0:
+            continue
+        my = colltracestats.median(y)
+        rows.append({"coll": key[0], "msgSize": key[1], "medianMs": x,
+                     "baselineMs": my, "slowdown": x / my - 1, "p": test(x, y)})
+    for row, p in zip(rows, holm([r["p"] for r in rows])):
+        row["pAdjusted"] = p
+        row["regression"] = p < alpha and row["slowdown"] > minSlowdown
+    report["collectives"] = rows
+    report["regressions"] = sum(r["regression"] for r in rows)
+    return report
+
+
+def printComparison(report):
+    if report["noData"]:
+        print("run %d (%s): no data: %s" % (report["run"], report["test"], report["noData"]))
+        return
+    if not report["baselineRuns"]:
+        print("run %d (%s): no baseline runs of its configuration" % (report["run"], report["test"]))
+        return
+    print("run %d (%s, binary %s) against runs %s" % (
+        report["run"], report["test"], report["binaryHash"][:12],
+        ",".join("%d" % r for r in report["baselineRuns"])))
+    rows = [["COLL", "MSG_SIZE", "MEDIAN(ms)", "BASELINE(ms)", "SLOWDOWN", "P(adj)", ""]]
+    for r in report["collectives"]:
+        rows.append([r["coll"], "%d" % r["msgSize"], "%.4f" % r["medianMs"],
+                     "%.4f" % r["baselineMs"], "%+.1f%%" % (100 * r["slowdown"]),
+                     "%.2g" % r["pAdjusted"], "REGRESSION" if r["regression"] else ""])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(col.rjust(w) for col, w in zip(row, widths)).rstrip())
+    print("\n%d regressions" % report["regressions"])
+
+
+def parseEnvs(envStr):
+    """{key: value} of "KEY=VAL;KEY2=VAL2", split like parse_envs() of the
+    test launcher's --envs so that both give runs the same configuration"""
+    envs = {}
+    for e in envStr.split(";"):
+        if e and "=" in e:
+            fields = e.split("=")
+            envs[fields[0]] = fields[1]
+    return envs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record NCCL test performance and check for regressions")
+    parser.add_argument("--db", type=str, required=True, help="SQLite history database")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="record a run from its CollTrace results")
+    record.add_argument("--test", type=str, required=True, help="test name")
+    hashArgs = record.add_mutually_exclusive_group(required=True)
+    hashArgs.add_argument("--binary", type=str, help="test binary, to hash")
+    hashArgs.add_argument("--binary-hash", type=str, help="hash of the test binary")
+    record.add_argument("--nnode", type=int, required=True, help="number of hosts")
+    record.add_argument("--ppn", type=int, required=True, help="number of processes per host")
+    record.add_argument("--envs", type=str, default="", help="envs of the run, as 'KEY=VAL;KEY2=VAL2'")
+    record.add_argument("--failed", action="store_true", help="the run failed; keep it out of baselines")
+    record.add_argument("paths", nargs="+", help="NCCL_COLLTRACE_DIR directories, or <rank>_online.json files")
+
+    compare = sub.add_parser("compare", help="compare a run with its baseline")
+    compare.add_argument("--run", type=int, default=None, help="run id (default: the latest run)")
+    compare.add_argument("--baseline-runs", type=int, default=10,
+                         help="number of previous runs of the configuration in the baseline")
+    compare.add_argument("--alpha", type=float, default=0.01,
+                         help="significance level, after Holm-Bonferroni correction")
+    compare.add_argument("--min-slowdown", type=float, default=0.05,
+                         help="smallest relative slowdown of the median latency to report")
+    compare.add_argument("--method", choices=["t", "rank"], default="t",
+                         help="statistical test over the median latencies of runs; rank needs at least "
+                              "1 / alpha baseline runs to report anything")
+    compare.add_argument("--json", action="store_true", help="print the report as JSON")
+
+    runs = sub.add_parser("list", help="list the latest runs")
+    runs.add_argument("--test", type=str, default=None, help="only runs of this test")
+    runs.add_argument("--limit", type=int, default=20, help="number of runs")
+    args = parser.parse_args()
+
+    try:
+        history = PerfHistory(args.db)
+        if args.command == "record":
+            results, numFiles = colltracestats.loadResults(args.paths)
+            binaryHash = args.binary_hash or fileHash(args.binary)
+            runId = history.recordRun(args.test, binaryHash, parseEnvs(args.envs),
+                                      args.nnode, args.ppn, results, not args.failed,
+                                      numFiles)
+            print("recorded run %d" % runId)
+            return 0
+        if args.command == "list":
+            for run in history.runs(args.test, args.limit):
+                print("%d  %s  %s  %s  %dx%d  %s%s" % (
+                    run["id"], time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run["time"])),
+                    run["test"], run["binaryHash"][:12], run["nnode"], run["ppn"],
+                    run["envs"], "" if run["passed"] else "  FAILED"))
+            return 0
+        report = compareRun(history, args.run, args.baseline_runs, args.alpha,
+                            args.min_slowdown, args.method)
+    except (OSError, ValueError, KeyError, TypeError, sqlite3.Error) as e:
+        sys.exit("perfhistory.py: error: %s" % e)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        printComparison(report)
+    return 1 if report["regressions"] or report["noData"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
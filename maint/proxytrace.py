@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Analyze and merge proxy profiler traces of several ranks.
+
+With NCCL_PROXY_PROFILE set (and the proxy profiler built in), each rank
+dumps the steps of its network proxy as a Chrome trace (ncclProfilingDump()
+in src/misc/profiler.cc): one event per line, a "b"/"e" pair per Send/Recv
+step ("Send-<peer>-<step>", pid = channel) with nested pairs for the states
+of the step, pairs for the proxy thread (pid -1), and a closing {} entry.
+Timestamps are in us since the first event of the rank.
+
+This tool streams those files, so they are never loaded whole, and:
+  - splits every step into the time spent waiting for a buffer, for the
+    GPU, for the network, and for flushes;
+  - reports that breakdown per channel and per (rank, peer) connection,
+    to tell whether the network or the GPU is the bottleneck;
+  - with --output, aligns the clocks of the ranks and writes one merged
+    Perfetto trace, coalescing consecutive steps of each connection that
+    are less than --resolution-us apart.
+
+Files are assigned the rank of the last number in their name
+(e.g. proxy.12.json), or RANK=FILE may be given:
+
+    ./maint/proxytrace.py --output merged.json /shared/job42/proxy.*.json
+
+Clocks are aligned as NTP does: for every pair of ranks that exchanged
+data, the smallest delays from send post to receive completion in both
+directions give their offset, and offsets are chained from the lowest rank.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+readChunk = 1 << 20
+
+stepNameRegex = re.compile(r"^(Send|Recv)-(-?\d+)-(\d+)$")
+rankFileRegex = re.compile(r"(\d+)(?!.*\d)")
+
+categories = ("buffer", "gpu", "network", "flush", "other")
+
+# Send states are named after their timestamp slot, from BufferWait (since
+# the step began) to the unnamed one of a posted send (until it completes).
+sendCategories = {"BufferWait": "buffer", "GPUWait": "gpu", "SendWait": "network",
+                  "": "network"}
+# Recv states use slots 4 to 6, past the names of profilingStateRecvStr, so
+# they are told apart by position: BufferWait, the receive, the flush if
+# any, and the wait for the GPU to consume the data.
+recvCategories = {2: ("buffer", "gpu"), 3: ("buffer", "network", "gpu"),
+                  4: ("buffer", "network", "flush", "gpu")}
+
+# Steps whose number is a multiple of this are kept to align clocks
+defaultAlignSample = 16
+
+
+def iterEvents(filename):
+    """Stream the events of a Chrome trace array, skipping {} entries"""
+    decoder = json.JSONDecoder()
+    with open(filename, "r") as f:
+        buf, pos, eof = "", 0, False
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,[":
+                pos += 1
+            if pos == len(buf):
+                if eof:
+                    return
+                buf, pos = f.read(readChunk), 0
+                eof = not buf
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                event, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                chunk = f.read(readChunk)
+                if not chunk:
+                    raise ValueError("%s: truncated or malformed trace near offset %d"
+                                     % (filename, f.tell() - len(buf) + pos))
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            pos = end
+            if event:
+                yield event
+
+
+class Step:
+    __slots__ = ("kind", "peer", "step", "channel", "opCount", "begin", "end", "states")
+
+    def categoryTimes(self):
+        """{category: us} of the states of the step"""
+        times = dict.fromkeys(categories, 0.0)
+        if self.kind == "Send":
+            for name, start, end in self.states:
+                times[sendCategories.get(name, "other")] += end - start
+        else:
+            cats = recvCategories.get(len(self.states))
+            for i, (_, start, end) in enumerate(self.states):
+                times[cats[i] if cats else "other"] += end - start
+        return times
+
+    def sendPosted(self):
+        """time the data of a send step was handed to the network"""
+        for name, start, _ in self.states:
+            if name == "":
+                return start
+        return None
+
+    def recvDone(self):
+        """time the data of a recv step was received"""
+        if len(self.states) >= 3:
+            return self.states[1][2]
+        return None
+
+
+def iterSteps(events):
+    """Yield the Steps and the (name, begin, end) proxy thread intervals of
+    a stream of proxy profiler events"""
+    steps = {}
+    states = {}
+    proxy = {}
+    for e in events:
+        id_, name, ts = e.get("id"), e.get("name", ""), e.get("ts", 0.0)
+        if e.get("ph") == "b":
+            m = stepNameRegex.match(name)
+            if m:
+                s = Step()
+                s.kind, s.peer, s.step = m.group(1), int(m.group(2)), int(m.group(3))
+                s.channel = e.get("pid", 0)
+                s.opCount = e.get("args", {}).get("opCount", 0)
+                s.begin, s.end, s.states = ts, ts, []
+                steps[id_] = s
+            elif id_ in steps:
+                states[id_] = (name, ts)
+            else:
+                proxy[id_] = (name, ts)
+        elif e.get("ph") == "e":
+            if id_ in states and states[id_][0] == name and not stepNameRegex.match(name):
+                stateName, start = states.pop(id_)
+                steps[id_].states.append((stateName, start, ts))
+            elif id_ in steps:
+                s = steps.pop(id_)
+                s.end = ts
+                yield s
+            elif id_ in proxy:
+                proxyName, start = proxy.pop(id_)
+                yield (proxyName, start, ts)
+
+
+def rankFiles(specs):
+    """[(rank, filename)] of RANK=FILE or FILE arguments"""
+    files = []
+    for spec in specs:
+        rank, sep, filename = spec.partition("=")
+        if sep and rank.isdigit():
+            files.append((int(rank), filename))
+            continue
+        m = rankFileRegex.search(os.path.basename(spec))
+        if m is None:
+            raise ValueError("%s: no rank in the file name, use RANK=%s" % (spec, spec))
+        files.append((int(m.group(1)), spec))
+    ranks = [r for r, _ in files]
+    if len(set(ranks)) != len(ranks):
+        raise ValueError("several files of the same rank; use RANK=FILE")
+    return sorted(files)
+
+
+class Breakdown:
+    """Category times of steps, per channel and per (rank, peer, kind)"""
+
+    def __init__(self):
+        self.channels = {}
+        self.connections = {}
+        self.totals = dict.fromkeys(categories, 0.0)
+        self.proxy = {}
+
+    def add(self, rank, step):
+        times = step.categoryTimes()
+        for key, table in (((step.channel,), self.channels),
+                           ((rank, step.peer, step.kind), self.connections)):
+            entry = table.get(key)
+            if entry is None:
+                entry = table[key] = dict.fromkeys(categories, 0.0)
+                entry["steps"] = 0
+                entry["time"] = 0.0
+            entry["steps"] += 1
+            entry["time"] += step.end - step.begin
+            for cat, t in times.items():
+                entry[cat] += t
+        for cat, t in times.items():
+            self.totals[cat] += t
+
+    def addProxy(self, name, start, end):
+        self.proxy[name] = self.proxy.get(name, 0.0) + end - start
+
+
+def collect(files, alignSample):
+    """First pass: breakdown, and the delays between sampled send posts and
+    receive completions, as {(src, dst): min(recvDone - sendPosted)}"""
+    breakdown = Breakdown()
+    sends, recvs = {}, {}
+    for rank, filename in files:
+        for item in iterSteps(iterEvents(filename)):
+            if not isinstance(item, Step):
+                breakdown.addProxy(*item)
+                continue
+            breakdown.add(rank, item)
+            if alignSample and item.step % alignSample == 0:
+                if item.kind == "Send":
+                    t = item.sendPosted()
+                    if t is not None:
+                        sends[(rank, item.peer, item.channel, item.opCount, item.step)] = t
+                else:
+                    t = item.recvDone()
+                    if t is not None:
+                        recvs[(item.peer, rank, item.channel, item.opCount, item.step)] = t
+    delays = {}
+    for key, posted in sends.items():
+        done = recvs.get(key)
+        if done is not None:
+            pair = key[:2]
+            delays[pair] = min(delays.get(pair, float("inf")), done - posted)
+    return breakdown, delays
+
+
+def clockOffsets(ranks, delays):
+    """{rank: offset to subtract from its timestamps}; ranks that exchanged
+    no data both ways with an aligned rank keep their own clock"""
+    neighbors = {}
+    for src, dst in delays:
+        if (dst, src) in delays:
+            neighbors.setdefault(src, []).append(dst)
+    offsets = {}
+    for root in ranks:
+        if root in offsets:
+            continue
+        offsets[root] = 0.0
+        queue = [root]
+        while queue:
+            a = queue.pop(0)
+            for b in sorted(neighbors.get(a, [])):
+                if b in offsets:
+                    continue
+                # clock of b minus clock of a
+                offsets[b] = offsets[a] + (delays[(a, b)] - delays[(b, a)]) / 2
+                queue.append(b)
+    return offsets
+
+
+def writeMerged(out, files, offsets, resolution):
+    """Second pass: one trace of all ranks, each (rank, channel, peer,
+    kind) lane coalescing the steps less than resolution us apart"""
+    out.write("[\n")
+
+    def emit(event):
+        out.write(json.dumps(event, separators=(",", ":")) + ",\n")
+
+    numEvents = 0
+    for rank, filename in files:
+        offset = offsets.get(rank, 0.0)
+        emit({"name": "process_name", "ph": "M", "pid": rank, "args": {"name": "rank %d" % rank}})
+        lanes = {}
+        tids = {}
+
+        def tidOf(key, label):
+            tid = tids.get(key)
+            if tid is None:
+                tid = tids[key] = len(tids) + 1
+                emit({"name": "thread_name", "ph": "M", "pid": rank, "tid": tid,
+                      "args": {"name": label}})
+            return tid
+
+        def flush(key):
+            nonlocal numEvents
+            name, tid, start, end, n, times = lanes.pop(key)
+            args = {"steps": n}
+            args.update((cat, round(t, 3)) for cat, t in times.items() if t)
+            emit({"name": name, "cat": "NET", "ph": "X", "pid": rank, "tid": tid,
+                  "ts": start - offset, "dur": end - start, "args": args})
+            numEvents += 1
+
+        for item in iterSteps(iterEvents(filename)):
+            if isinstance(item, Step):
+                key = (item.channel, item.peer, item.kind)
+                label = "ch%d %s %d" % (item.channel, item.kind.lower(), item.peer)
+                name = "%s %d" % (item.kind, item.peer)
+                times = item.categoryTimes()
+                start, end = item.begin, item.end
+            else:
+                name, start, end = item
+                key = label = "proxy %s" % name
+                times = {}
+            lane = lanes.get(key)
+            if lane is not None and start > lane[3] + resolution:
+                flush(key)
+                lane = None
+            if lane is None:
+                lanes[key] = [name, tidOf(key, label), start, end, 1, times]
+                continue
+            lane[2] = min(lane[2], start)
+            lane[3] = max(lane[3], end)
+            lane[4] += 1
+            for cat, t in times.items():
+                lane[5][cat] = lane[5].get(cat, 0.0) + t
+        for key in list(lanes):
+            flush(key)
+    out.write("{} ]\n")
+    return numEvents
+
+
+def report(breakdown, offsets, topConnections=10):
+    def row(label, entry):
+        busy = sum(entry[c] for c in categories) or 1.0
+        return [label, "%d" % entry["steps"], "%.1f" % (entry["time"] / 1e3)] + \
+            ["%.0f%%" % (100 * entry[c] / busy) for c in categories]
+
+    def table(rows):
+        widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+        for r in rows:
+            print("  ".join(c.rjust(w) for c, w in zip(r, widths)))
+
+    header = ["", "STEPS", "TIME(ms)"] + [c.upper() for c in categories]
+    print("per channel:")
+    header[0] = "CHANNEL"
+    table([list(header)] + [row("%d" % ch, e) for (ch,), e in sorted(breakdown.channels.items())])
+
+    print("\nslowest connections:")
+    header[0] = "RANK->PEER"
+    conns = sorted(breakdown.connections.items(),
+                   key=lambda kv: -kv[1]["time"] / max(kv[1]["steps"], 1))
+    table([list(header)] + [
+        row("%d%s%d %s" % (r, "->" if k == "Send" else "<-", p, k.lower()), e)
+        for (r, p, k), e in conns[:topConnections]])
+
+    totals = breakdown.totals
+    busy = sum(totals.values()) or 1.0
+    gpu, net = totals["gpu"] / busy, totals["network"] / busy
+    print("\nstep time: %s" % ", ".join("%s %.0f%%" % (c, 100 * totals[c] / busy) for c in categories))
+    if net > gpu:
+        print("bottleneck: network (%.0f%% of step time vs %.0f%% waiting for the GPU)"
+              % (100 * net, 100 * gpu))
+    else:
+        print("bottleneck: GPU (%.0f%% of step time vs %.0f%% in the network)"
+              % (100 * gpu, 100 * net))
+    if breakdown.proxy:
+        print("proxy thread: %s" % ", ".join(
+            "%s %.1f ms" % (n, t / 1e3) for n, t in sorted(breakdown.proxy.items())))
+    shifted = {r: o for r, o in offsets.items() if o}
+    if shifted:
+        worst = max(shifted.items(), key=lambda kv: abs(kv[1]))
+        print("clock offsets of %d ranks, up to %.1f us (rank %d)" % (len(shifted), worst[1], worst[0]))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Analyze and merge NCCL proxy profiler traces")
+    parser.add_argument(
+        "files",
+        nargs="+",
+        metavar="[RANK=]FILE",
+        help="NCCL_PROXY_PROFILE dumps, with the rank as the last number of their name or given",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="write the merged trace of all ranks to this file",
+    )
+    parser.add_argument(
+        "--resolution-us",
+        type=float,
+        default=50.0,
+        help="steps of a connection less than this apart are merged into one slice",
+    )
+    parser.add_argument(
+        "--align-sample",
+        type=int,
+        default=defaultAlignSample,
+        help="align clocks with every N-th step (0: do not align)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="number of slowest connections to report",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the breakdown as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        files = rankFiles(args.files)
+        breakdown, delays = collect(files, args.align_sample)
+        offsets = clockOffsets([r for r, _ in files], delays) if args.align_sample else {}
+        if args.output:
+            with open(args.output, "w") as out:
+                n = writeMerged(out, files, offsets, args.resolution_us)
+            print("wrote %d slices to %s" % (n, args.output), file=sys.stderr)
+    except (OSError, ValueError) as e:
+        sys.exit("proxytrace.py: error: %s" % e)
+
+    if args.json:
+        print(json.dumps({
+            "totals": breakdown.totals,
+            "proxy": breakdown.proxy,
+            "channels": {str(ch): e for (ch,), e in sorted(breakdown.channels.items())},
+            "connections": [dict(e, rank=r, peer=p, kind=k)
+                            for (r, p, k), e in sorted(breakdown.connections.items())],
+            "clockOffsets": {str(r): o for r, o in sorted(offsets.items())},
+        }, indent=2))
+    else:
+        report(breakdown, offsets, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import array
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import colltracestats  # noqa: E402
+
+numRanks = 8
+numIters = 5
+slowRank = 5
+# Rank without results
+idleRank = 7
+
+
+def latencyMs(rank, coll, i):
+    base = 0.1 if coll == "AllReduce" else 0.05
+    if rank == slowRank:
+        base *= 4
+    return base + 0.001 * (rank % 4) + 0.0001 * i
+
+
+def writeResults(directory):
+    """<rank>_online.json of 8 ranks running AllReduce and AllGather, rank 5
+    4 times slower than its peers and rank 7 without results"""
+    for rank in range(numRanks):
+        entries = []
+        if rank == idleRank:
+            entries.append({})
+        else:
+            for i in range(numIters):
+                entries.append({"coll": "AllReduce", "msg_size": "1048576", "latency": latencyMs(rank, "AllReduce", i)})
+                entries.append({"coll": "AllGather", "msg_size": "65536", "latency": latencyMs(rank, "AllGather", i)})
+            # A collective CollTrace failed to time
+            entries.append({"coll": "AllReduce", "msg_size": "1048576", "latency": -1})
+        with open(os.path.join(directory, "%d_online.json" % rank), "w") as f:
+            json.dump(entries, f)
+
+
+class CollTraceStatsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = os.path.join(self.tmp.name, "colltrace")
+        os.mkdir(self.dir)
+        writeResults(self.dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def colltracestats(self, *argv):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["colltracestats.py"] + list(argv)), \
+                contextlib.redirect_stdout(out):
+            self.assertEqual(colltracestats.main(), 0)
+        return out.getvalue()
+
+    def testPercentile(self):
+        self.assertEqual(colltracestats.percentile([1.0, 2.0, 3.0, 4.0], 50), 2.5)
+        self.assertEqual(colltracestats.percentile([1.0, 2.0, 3.0, 4.0], 100), 4.0)
+        self.assertEqual(colltracestats.percentile([7.0], 99), 7.0)
+        self.assertEqual(colltracestats.median([3.0, 1.0, 2.0]), 2.0)
+
+    def testFindFiles(self):
+        with open(os.path.join(self.dir, "notes.txt"), "w") as f:
+            f.write("not a result\n")
+        files = colltracestats.findFiles([self.dir])
+        self.assertEqual([rank for rank, _ in files], list(range(numRanks)))
+        self.assertEqual(colltracestats.findFiles([os.path.join(self.dir, "3_online.json")]),
+                         [(3, os.path.join(self.dir, "3_online.json"))])
+        with self.assertRaisesRegex(ValueError, "notes.txt: not a <rank>_online.json file"):
+            colltracestats.findFiles([os.path.join(self.dir, "notes.txt")])
+
+    def testLoadRank(self):
+        rank, columns = colltracestats.loadRank((2, os.path.join(self.dir, "2_online.json")))
+        self.assertEqual(rank, 2)
+        self.assertEqual(sorted(columns), [("AllGather", 65536), ("AllReduce", 1048576)])
+        self.assertEqual(list(columns[("AllReduce", 1048576)]),
+                         [latencyMs(2, "AllReduce", i) for i in range(numIters)])
+        self.assertEqual(colltracestats.loadRank((idleRank, os.path.join(self.dir, "7_online.json")))[1], {})
+
+        with open(os.path.join(self.dir, "0_online.json"), "w") as f:
+            f.write('[{"coll": "AllReduce", ')
+        with self.assertRaisesRegex(ValueError, "0_online.json: "):
+            colltracestats.loadRank((0, os.path.join(self.dir, "0_online.json")))
+
+    def testSummarize(self):
+        results = {("AllReduce", 1000000): {0: array.array("d", [1.0, 1.0]), 1: array.array("d", [1.0])},
+                   ("AllGather", 1000000): {0: array.array("d", [2.0, 4.0])}}
+        summary = colltracestats.summarize(results, 4)
+        self.assertEqual([(s["coll"], s["ranks"], s["samples"]) for s in summary],
+                         [("AllGather", 1, 2), ("AllReduce", 2, 3)])
+        # AllGather moves nranks buffers: 4 MB in 3 ms
+        self.assertEqual((summary[0]["p50Ms"], summary[0]["meanMs"], summary[0]["maxMs"]), (3.0, 3.0, 4.0))
+        self.assertAlmostEqual(summary[0]["algBwGBs"], 4.0 / 3)
+        self.assertAlmostEqual(summary[0]["busBwGBs"], 1.0)
+        self.assertAlmostEqual(summary[1]["algBwGBs"], 1.0)
+        self.assertAlmostEqual(summary[1]["busBwGBs"], 1.5)
+
+    def testReport(self):
+        report = json.loads(self.colltracestats("--json", self.dir))
+        self.assertEqual((report["files"], report["nranks"]), (numRanks, numRanks))
+        self.assertEqual([(s["coll"], s["msgSize"], s["ranks"], s["samples"]) for s in report["collectives"]],
+                         [("AllGather", 65536, 7, 7 * numIters), ("AllReduce", 1048576, 7, 7 * numIters)])
+        self.assertEqual([(s["rank"], s["kind"], s["worstColl"]) for s in report["stragglers"]],
+                         [(slowRank, "slow", "AllReduce")])
+        self.assertAlmostEqual(report["stragglers"][0]["worstMs"], latencyMs(slowRank, "AllReduce", 2))
+
+        # Bus bandwidth of a larger communicator
+        report16 = json.loads(self.colltracestats("--json", "--nranks", "16", self.dir))
+        allReduce = report["collectives"][1]
+        self.assertAlmostEqual(report16["collectives"][1]["busBwGBs"] / allReduce["busBwGBs"],
+                               (2.0 * 15 / 16) / (2.0 * 7 / 8))
+
+        out = self.colltracestats(self.dir)
+        lines = out.splitlines()
+        self.assertEqual(lines[0], "8 ranks")
+        self.assertEqual(lines[1].split(), ["COLL", "MSG_SIZE", "RANKS", "SAMPLES", "P50(ms)", "P90(ms)", "P99(ms)",
+                                            "MAX(ms)", "ALGBW(GB/s)", "BUSBW(GB/s)"])
+        self.assertEqual(lines[3].split()[:4], ["AllReduce", "1048576", "7", "35"])
+        self.assertEqual(lines[5], "1 stragglers")
+        self.assertRegex(lines[6], r"^    rank 5: slow \(score \d+\.\d\), AllReduce 1048576: 0\.4012 ms "
+                                   r"\(peers: 0\.1022 ms\)$")
+
+    def testNoStragglers(self):
+        report = json.loads(self.colltracestats("--json", "--threshold", "1000", self.dir))
+        self.assertEqual(report["stragglers"], [])
+        self.assertTrue(self.colltracestats("--threshold", "1000", self.dir).endswith("\nno stragglers\n"))
+
+    def testParallelLoad(self):
+        report = self.colltracestats("--json", "-j", "1", self.dir)
+        with mock.patch.object(colltracestats, "parallelLoadMinFiles", 1):
+            self.assertEqual(self.colltracestats("--json", "-j", "2", self.dir), report)
+
+
+if __name__ == "__main__":
+    unittest.main()
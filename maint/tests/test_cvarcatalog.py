@@ -0,0 +1,105 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import cvarcatalog  # noqa: E402
+
+
+cvars = [
+    {"name": "NCCL_IB_DISABLE", "envstr": "NCCL_IB_DISABLE", "type": "int64_t"},
+    {"name": "NCCL_CHECK_POINTERS", "envstr": "NCCL_CHECK_POINTERS", "type": "bool"},
+    {"name": "NCCL_NTHREADS", "envstr": "NCCL_NTHREADS", "type": "int"},
+    {"name": "NCCL_ALLREDUCE_ALGO", "envstr": "NCCL_ALLREDUCE_ALGO", "type": "enum",
+     "choices": ["orig", "dda"]},
+    {"name": "NCCL_IB_HCA", "envstr": "NCCL_IB_HCA", "type": "prefixed_stringlist",
+     "prefixes": ["^", "="]},
+]
+
+
+class CatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        text, data = cvarcatalog.encodeCatalog(cvars, ["NCCL_ACCEPTED"])
+        self.jsonFile = os.path.join(self.tmp.name, "c.json")
+        self.binFile = os.path.join(self.tmp.name, "c.bin")
+        with open(self.jsonFile, "w") as f:
+            f.write(text)
+        with open(self.binFile, "wb") as f:
+            f.write(data)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def catalogs(self):
+        return [cvarcatalog.loadJson(self.jsonFile), cvarcatalog.loadBinary(self.binFile)]
+
+    def testLoad(self):
+        for catalog in self.catalogs():
+            self.assertEqual(len(catalog), len(cvars) + 1)
+            self.assertIn("NCCL_ACCEPTED", catalog)
+            self.assertIsNone(catalog.get("NCCL_ACCEPTED"))
+            self.assertEqual(catalog.get("NCCL_NTHREADS")["type"], "int")
+            self.assertIsNone(catalog.get("NCCL_MISSING"))
+
+    def testValidate(self):
+        environ = {
+            "NCCL_IB_DISABLE": "1",
+            "NCCL_CHECK_POINTERS": "maybe",
+            "NCCL_NTHREADS": "4294967296",
+            "NCCL_ALLREDUCE_ALGO": "ring",
+            "NCCL_IB_HCA": "^mlx5_0,mlx5_0",
+            "NCCL_ACCEPTED": "anything",
+            "NCCL_UNKNOWN": "1",
+            "PATH": "/bin",
+        }
+        expected = [
+            ("NCCL_CHECK_POINTERS", "maybe", "Unknown value"),
+            ("NCCL_NTHREADS", "4294967296", "Out of range for int"),
+            ("NCCL_ALLREDUCE_ALGO", "ring", "Unknown value"),
+            ("NCCL_IB_HCA", "^mlx5_0,mlx5_0", "Duplicate token"),
+            ("NCCL_UNKNOWN", "1", "Unknown env"),
+        ]
+        for catalog in self.catalogs():
+            self.assertEqual(sorted(catalog.validate(environ)), sorted(expected))
+            # Memoized results must not change
+            self.assertEqual(sorted(catalog.validate(environ)), sorted(expected))
+
+    def testNonStringValues(self):
+        catalog = cvarcatalog.loadJson(self.jsonFile)
+        self.assertEqual(catalog.validate({"NCCL_IB_DISABLE": 1}), [])
+        self.assertEqual(catalog.validate({"NCCL_CHECK_POINTERS": True}), [])
+        self.assertEqual(catalog.validate({"NCCL_NTHREADS": 2.5}),
+                         [("NCCL_NTHREADS", "2.5", "Unrecognized numeral")])
+        self.assertEqual(catalog.validate({"NCCL_IB_HCA": ["mlx5_0"]}),
+                         [("NCCL_IB_HCA", ["mlx5_0"], "Not a string value")])
+        self.assertEqual(catalog.validate({"NCCL_IB_DISABLE": None}),
+                         [("NCCL_IB_DISABLE", None, "Not a string value")])
+        self.assertIsNone(catalog.checkValue("NCCL_IB_DISABLE", 0))
+
+    def testMain(self):
+        jsonl = os.path.join(self.tmp.name, "envs.jsonl")
+        with open(jsonl, "w") as f:
+            f.write(json.dumps({"NCCL_IB_DISABLE": 1}) + "\n\n")
+            f.write(json.dumps({"NCCL_ALLREDUCE_ALGO": "ring"}) + "\n")
+        argv = ["cvarcatalog.py", "--catalog", self.binFile, "--jsonl", jsonl,
+                "NCCL_NTHREADS=x"]
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(out):
+            rc = cvarcatalog.main()
+        self.assertEqual(rc, 1)
+        self.assertEqual(out.getvalue().splitlines(), [
+            "0: NCCL_NTHREADS=x: Unrecognized numeral",
+            "2: NCCL_ALLREDUCE_ALGO=ring: Unknown value",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import cvarskew  # noqa: E402
+
+buffSize = {"value": "8388608", "default": "4194304"}
+algo = {"value": "ring", "default": ""}
+
+
+def record(rank, cvars, nranks=8):
+    """Snapshot record of a rank, as writeCvarSnapshot() writes it"""
+    return {"rank": rank, "nranks": nranks, "host": "h%d" % (rank // 4), "pid": 100 + rank, "commHash": 42,
+            "cvars": cvars}
+
+
+def writeSnapshots(directory, nranks=8):
+    """Ranks 0-5 with the majority settings, rank 6 with another buffer
+    size and rank 7 without NCCL_ALGO"""
+    for rank in range(8):
+        cvars = {"NCCL_BUFFSIZE": dict(buffSize), "NCCL_ALGO": dict(algo)}
+        if rank == 6:
+            cvars["NCCL_BUFFSIZE"]["value"] = "1048576"
+        elif rank == 7:
+            del cvars["NCCL_ALGO"]
+        with open(os.path.join(directory, "%d_cvars.json" % rank), "w") as f:
+            f.write(json.dumps(record(rank, cvars, nranks), separators=(",", ":")) + "\n")
+
+
+class CvarSkewTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = os.path.join(self.tmp.name, "cvars")
+        os.mkdir(self.dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def cvarskew(self, *argv, rc=0):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["cvarskew.py"] + list(argv)), \
+                contextlib.redirect_stdout(out):
+            self.assertEqual(cvarskew.main(), rc)
+        return out.getvalue()
+
+    def testIterRecords(self):
+        writeSnapshots(self.dir)
+        with open(os.path.join(self.dir, "notes.txt"), "w") as f:
+            f.write("not a snapshot\n")
+        lines = os.path.join(self.tmp.name, "more.jsonl")
+        with open(lines, "w") as f:
+            f.write(json.dumps(record(8, {})) + "\n\n" + json.dumps(record(9, {})) + "\n")
+        self.assertEqual([r["rank"] for r in cvarskew.iterRecords([self.dir, lines])], list(range(10)))
+
+        with open(lines, "a") as f:
+            f.write('{"rank": 10,\n')
+        with self.assertRaisesRegex(ValueError, "more.jsonl:4: "):
+            list(cvarskew.iterRecords([lines]))
+
+    def testRankRanges(self):
+        self.assertEqual(cvarskew.rankRanges([11, 0, 1, 2, 3, 8, 10]), "0-3,8,10-11")
+        self.assertEqual(cvarskew.rankRanges([5]), "5")
+
+    def testConfigDiff(self):
+        reference = cvarskew.configKey({"NCCL_BUFFSIZE": buffSize, "NCCL_ALGO": algo})
+        config = cvarskew.configKey({"NCCL_BUFFSIZE": {"value": "1", "default": "4194304"},
+                                     "NCCL_PROTO": {"value": "LL", "default": ""}})
+        self.assertEqual(cvarskew.configDiff(config, reference), {
+            "NCCL_ALGO": ("ring", "(default)"),
+            "NCCL_BUFFSIZE": ("8388608", "1"),
+            "NCCL_PROTO": ("(default)", "LL"),
+        })
+        self.assertEqual(cvarskew.configDiff(reference, reference), {})
+
+    def testReport(self):
+        writeSnapshots(self.dir, nranks=10)
+        report = json.loads(self.cvarskew("--json", self.dir, rc=1))
+        self.assertEqual((report["ranks"], report["configs"], report["missingRanks"]), (8, 3, [8, 9]))
+        self.assertEqual(report["groups"][0], {"ranks": "0-5", "numRanks": 6, "hosts": ["h0", "h1"],
+                                               "cvars": {"NCCL_ALGO": "ring", "NCCL_BUFFSIZE": "8388608"}})
+        self.assertEqual([(g["ranks"], g["diff"]) for g in report["groups"][1:]], [
+            ("6", {"NCCL_BUFFSIZE": {"majority": "8388608", "value": "1048576"}}),
+            ("7", {"NCCL_ALGO": {"majority": "ring", "value": "(default)"}}),
+        ])
+
+        out = self.cvarskew(self.dir, rc=1)
+        self.assertEqual(out, "8 ranks, 3 distinct cvar configurations\n"
+                              "missing snapshots of ranks 8-9\n"
+                              "\nmajority: 6 ranks (0-5)\n"
+                              "    NCCL_ALGO=ring\n"
+                              "    NCCL_BUFFSIZE=8388608\n"
+                              "\ngroup 1: 1 ranks (6) on h1\n"
+                              "    NCCL_BUFFSIZE: 1048576 (majority: 8388608)\n"
+                              "\ngroup 2: 1 ranks (7) on h1\n"
+                              "    NCCL_ALGO: (default) (majority: ring)\n")
+
+    def testUniform(self):
+        for rank in range(4):
+            with open(os.path.join(self.dir, "%d_cvars.json" % rank), "w") as f:
+                f.write(json.dumps(record(rank, {"NCCL_BUFFSIZE": buffSize}, 4)) + "\n")
+        self.assertEqual(self.cvarskew(self.dir),
+                         "4 ranks, 1 distinct cvar configurations\n\nmajority: 4 ranks (0-3)\n"
+                         "    NCCL_BUFFSIZE=8388608\n")
+        report = json.loads(self.cvarskew("--json", self.dir))
+        self.assertEqual(report["missingRanks"], [])
+        self.assertNotIn("diff", report["groups"][0])
+
+    def testErrors(self):
+        with open(os.path.join(self.dir, "0_cvars.json"), "w") as f:
+            f.write('{"nranks": 1, "cvars": {}}\n')
+        with mock.patch.object(sys, "argv", ["cvarskew.py", self.dir]), \
+                self.assertRaisesRegex(SystemExit, "cvarskew.py: error: 'rank'"):
+            cvarskew.main()
+        with mock.patch.object(sys, "argv", ["cvarskew.py", os.path.join(self.tmp.name, "missing.json")]), \
+                self.assertRaisesRegex(SystemExit, "cvarskew.py: error: .*No such file"):
+            cvarskew.main()
+
+
+if __name__ == "__main__":
+    unittest.main()
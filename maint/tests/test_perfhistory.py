@@ -0,0 +1,152 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import perfhistory  # noqa: E402
+
+
+def writeTrace(directory, nranks, latency, colls=("AllReduce",), seed=0):
+    """CollTrace results of nranks ranks, each with 10 iterations around
+    latency ms of every collective in colls"""
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    for rank in range(nranks):
+        entries = [{"coll": coll, "msg_size": "1048576",
+                    "latency": latency * (1 + 0.01 * rng.random())}
+                   for coll in colls for _ in range(10)]
+        with open(os.path.join(directory, "%d_online.json" % rank), "w") as f:
+            json.dump(entries or [{}], f)
+
+
+class PerfHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.tmp.name, "perf.db")
+        self.runs = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def perfhistory(self, *argv):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["perfhistory.py", "--db", self.db] + list(argv)), \
+                contextlib.redirect_stdout(out):
+            rc = perfhistory.main()
+        return rc, out.getvalue()
+
+    def record(self, latency, colls=("AllReduce",), failed=False, envs="NCCL_ALGO=Ring"):
+        trace = os.path.join(self.tmp.name, "trace%d" % self.runs)
+        writeTrace(trace, 8, latency, colls, seed=self.runs)
+        self.runs += 1
+        argv = ["record", "--test", "allreduce", "--binary-hash", "abc", "--nnode", "1",
+                "--ppn", "8", "--envs", envs, trace]
+        rc, out = self.perfhistory(*(argv + (["--failed"] if failed else [])))
+        self.assertEqual(rc, 0)
+        return int(out.split()[-1])
+
+    def testNoRegression(self):
+        for _ in range(3):
+            self.record(1.0)
+        rc, out = self.perfhistory("compare")
+        self.assertEqual(rc, 0, out)
+        self.assertIn("0 regressions", out)
+
+    def testRegression(self):
+        for _ in range(3):
+            self.record(1.0)
+        self.record(2.0)
+        rc, out = self.perfhistory("compare", "--json")
+        self.assertEqual(rc, 1)
+        report = json.loads(out)
+        self.assertEqual(report["regressions"], 1)
+        self.assertEqual(len(report["baselineRuns"]), 3)
+        self.assertAlmostEqual(report["collectives"][0]["slowdown"], 1.0, delta=0.05)
+
+    def testNoBaseline(self):
+        self.record(1.0)
+        rc, out = self.perfhistory("compare")
+        self.assertEqual(rc, 0)
+        self.assertIn("no baseline runs", out)
+
+    def testFailedRun(self):
+        self.record(1.0)
+        self.record(1.0, failed=True)
+        rc, out = self.perfhistory("compare")
+        self.assertEqual(rc, 1)
+        self.assertIn("no data: the run failed", out)
+
+    def testFailedAndEmptyRunsNotInBaseline(self):
+        good = self.record(1.0)
+        self.record(5.0, failed=True)
+        self.record(1.0, colls=())
+        self.record(1.0)
+        rc, out = self.perfhistory("compare", "--json")
+        self.assertEqual(rc, 0)
+        self.assertEqual(json.loads(out)["baselineRuns"], [good])
+
+    def testEmptyRun(self):
+        self.record(1.0)
+        self.record(1.0, colls=())
+        rc, out = self.perfhistory("compare")
+        self.assertEqual(rc, 1)
+        self.assertIn("no data: the run has no results", out)
+
+    def testNoOverlap(self):
+        self.record(1.0, colls=("AllGather",))
+        self.record(1.0, colls=("AllReduce",))
+        rc, out = self.perfhistory("compare", "--json")
+        self.assertEqual(rc, 1)
+        self.assertEqual(json.loads(out)["noData"], "no results in common with the baseline")
+
+    def testParseEnvs(self):
+        self.assertEqual(perfhistory.parseEnvs("A=1;;B=x=y;C;"), {"A": "1", "B": "x"})
+        # Envs are part of the configuration
+        self.record(1.0, envs="NCCL_ALGO=Ring")
+        self.record(1.0, envs="NCCL_ALGO=Tree")
+        rc, out = self.perfhistory("compare")
+        self.assertEqual(rc, 0)
+        self.assertIn("no baseline runs", out)
+
+    def testRunToRunNoise(self):
+        # The ranks of each run agree within 1%, runs differ by up to 8%
+        for latency in (1.0, 1.08, 0.95, 1.03, 0.97, 1.06):
+            self.record(latency)
+        self.record(1.07)
+        rc, out = self.perfhistory("compare", "--json")
+        self.assertEqual(rc, 0, out)
+        row = json.loads(out)["collectives"][0]
+        self.assertGreater(row["slowdown"], 0.05)
+        self.assertGreater(row["pAdjusted"], 0.1)
+
+    def testRankMethod(self):
+        for _ in range(3):
+            self.record(1.0)
+        self.record(2.0)
+        # 3 baseline runs cannot reach alpha with ranks
+        rc, out = self.perfhistory("compare", "--json", "--method", "rank")
+        self.assertEqual(rc, 0, out)
+        self.assertEqual(json.loads(out)["collectives"][0]["p"], 0.25)
+
+    def testTests(self):
+        self.assertAlmostEqual(perfhistory.betaIncomplete(3, 4, 0.3), 0.25569)
+        # log medians 0 and 2 (mean 1, sd sqrt(2)) give t = 1 for exp(1 + sqrt(3)), and Student's t with 1
+        # degree of freedom is the Cauchy distribution, whose P(T > 1) is 1/4
+        self.assertAlmostEqual(perfhistory.tGreater(math.exp(1 + math.sqrt(3)), [1.0, math.exp(2)]), 0.25)
+        self.assertLess(perfhistory.tGreater(2.0, [1.0, 1.01, 0.99, 1.0]), 0.001)
+        self.assertGreater(perfhistory.tGreater(1.0, [1.0, 1.01, 0.99, 1.0]), 0.4)
+        self.assertEqual(perfhistory.tGreater(1.1, [1.0, 1.0, 1.0]), 0.0)
+        self.assertEqual(perfhistory.rankGreater(1.5, [1.0, 2.0, 1.2]), 0.5)
+        self.assertEqual(perfhistory.holm([0.01, 0.04, 0.03]), [0.03, 0.06, 0.06])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import proxytrace  # noqa: E402
+
+numSteps = 32
+stepPeriodUs = 20.0
+networkDelayUs = 5.0
+# Clock of rank 1 minus clock of rank 0
+rank1OffsetUs = 1000.0
+
+
+class TraceWriter:
+    """Proxy profiler dump of one rank, as ncclProfilingDump() writes it"""
+
+    def __init__(self):
+        self.lines = []
+        self.nextId = 0
+
+    def pair(self, name, id_, pid, start, end, args=None):
+        begin = {"name": name, "cat": "NET", "ph": "b", "id": id_, "pid": pid, "tid": 1, "ts": start}
+        if args is not None:
+            begin["args"] = args
+        self.lines.append(begin)
+        return {"name": name, "cat": "NET", "ph": "e", "id": id_, "pid": pid, "tid": 1, "ts": end}
+
+    def step(self, kind, peer, step, channel, states):
+        """states: [(name, start, end)], consecutive"""
+        id_ = self.nextId
+        self.nextId += 1
+        end = self.pair("%s-%d-%d" % (kind, peer, step), id_, channel, states[0][1], states[-1][2],
+                        {"opCount": 7, "proxyOpIndex": 3})
+        for name, start, stop in states:
+            self.lines.append(self.pair(name, id_, channel, start, stop))
+        self.lines.append(end)
+
+    def proxy(self, name, start, end):
+        id_ = self.nextId
+        self.nextId += 1
+        self.lines.append(self.pair(name, id_, -1, start, end))
+
+    def write(self, filename):
+        with open(filename, "w") as f:
+            f.write("[\n")
+            for line in self.lines:
+                f.write(json.dumps(line) + ",\n")
+            f.write("{} ]\n")
+
+
+def sendStates(t):
+    return [("BufferWait", t, t + 1), ("GPUWait", t + 1, t + 3), ("SendWait", t + 3, t + 4),
+            ("", t + 4, t + 10)]
+
+
+def recvStates(posted):
+    """Receive of data posted at posted, in the clock of the receiver"""
+    done = posted + networkDelayUs
+    return [("BufferWait", posted - 4, posted - 2), ("RecvWait", posted - 2, done),
+            ("GPUWait", done, done + 2)]
+
+
+def writeTraces(directory):
+    """Rank 0 and 1 exchanging numSteps steps both ways on channel 0"""
+    ranks = [TraceWriter(), TraceWriter()]
+    for step in range(numSteps):
+        t = step * stepPeriodUs
+        # 0 -> 1
+        ranks[0].step("Send", 1, step, 0, sendStates(t))
+        ranks[1].step("Recv", 0, step, 0, recvStates(t + 4 + rank1OffsetUs))
+        # 1 -> 0, at the same time
+        ranks[1].step("Send", 0, step, 0, sendStates(t + rank1OffsetUs))
+        ranks[0].step("Recv", 1, step, 0, recvStates(t + 4))
+    ranks[0].proxy("Idle", 0, 100)
+    files = []
+    for rank, writer in enumerate(ranks):
+        filename = os.path.join(directory, "proxy.%d.json" % rank)
+        writer.write(filename)
+        files.append(filename)
+    return files
+
+
+class ProxyTraceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.files = writeTraces(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def proxytrace(self, *argv):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["proxytrace.py"] + list(argv)), \
+                contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            rc = proxytrace.main()
+        self.assertEqual(rc, 0)
+        return out.getvalue()
+
+    def testIterEventsAcrossChunks(self):
+        events = list(proxytrace.iterEvents(self.files[0]))
+        with mock.patch.object(proxytrace, "readChunk", 7):
+            self.assertEqual(list(proxytrace.iterEvents(self.files[0])), events)
+        # b/e pairs of each step and its states: 10 events a send, 8 a
+        # receive, and 2 for the proxy thread
+        self.assertEqual(len(events), numSteps * 18 + 2)
+
+    def testTruncated(self):
+        with open(self.files[0]) as f:
+            content = f.read()
+        with open(self.files[0], "w") as f:
+            f.write(content[:len(content) // 2])
+        with self.assertRaisesRegex(ValueError, "truncated or malformed"):
+            list(proxytrace.iterEvents(self.files[0]))
+
+    def testRankFiles(self):
+        self.assertEqual(proxytrace.rankFiles(["a/p.1.json", "3=x.json", "b/r12_p.json"]),
+                         [(1, "a/p.1.json"), (3, "x.json"), (12, "b/r12_p.json")])
+        with self.assertRaisesRegex(ValueError, "no rank"):
+            proxytrace.rankFiles(["proxy.json"])
+        with self.assertRaisesRegex(ValueError, "same rank"):
+            proxytrace.rankFiles(["p.1.json", "1=q.json"])
+
+    def testBreakdown(self):
+        report = json.loads(self.proxytrace("--json", *self.files))
+        n = 2 * numSteps
+        # Sends: buffer 1, gpu 2, network 1 + 6; receives: buffer 2,
+        # network 2 + delay, gpu 2
+        self.assertEqual(report["totals"], {
+            "buffer": n * 3.0, "gpu": n * 4.0, "network": n * (7.0 + 2 + networkDelayUs),
+            "flush": 0.0, "other": 0.0})
+        self.assertEqual(report["proxy"], {"Idle": 100})
+        self.assertEqual(list(report["channels"]), ["0"])
+        self.assertEqual(report["channels"]["0"]["steps"], 2 * n)
+        self.assertEqual([(c["rank"], c["peer"], c["kind"], c["steps"]) for c in report["connections"]],
+                         [(0, 1, "Recv", numSteps), (0, 1, "Send", numSteps),
+                          (1, 0, "Recv", numSteps), (1, 0, "Send", numSteps)])
+        self.assertEqual(report["clockOffsets"], {"0": 0.0, "1": rank1OffsetUs})
+
+    def testReport(self):
+        out = self.proxytrace(*self.files)
+        self.assertIn("bottleneck: network", out)
+        self.assertIn("proxy thread: Idle 0.1 ms", out)
+        self.assertIn("clock offsets of 1 ranks, up to 1000.0 us (rank 1)", out)
+
+    def testMerged(self):
+        merged = os.path.join(self.tmp.name, "merged.json")
+        self.proxytrace("--output", merged, "--resolution-us", "50", *self.files)
+        with open(merged) as f:
+            events = [e for e in json.load(f) if e]
+        slices = [e for e in events if e["ph"] == "X"]
+        # Steps 20 us apart coalesce into one slice per lane
+        lanes = {(e["pid"], e["tid"]): e for e in slices}
+        self.assertEqual(len(slices), len(lanes))
+        self.assertEqual(sorted(e["args"]["steps"] for e in slices), [1] + [numSteps] * 4)
+        # Sends of both ranks start at 0 in the clock of rank 0
+        sends = [e for e in slices if e["name"].startswith("Send")]
+        self.assertEqual([e["ts"] for e in sends], [0.0, 0.0])
+        names = [e["args"]["name"] for e in events if e["name"] == "process_name"]
+        self.assertEqual(names, ["rank 0", "rank 1"])
+
+        self.proxytrace("--output", merged, "--resolution-us", "5", "--align-sample", "0", *self.files)
+        with open(merged) as f:
+            slices = [e for e in json.load(f) if e and e["ph"] == "X"]
+        self.assertEqual(len(slices), 4 * numSteps + 1)
+        self.assertEqual(min(e["ts"] for e in slices if e["pid"] == 1 and e["name"].startswith("Recv")),
+                         rank1OffsetUs)
+
+
+if __name__ == "__main__":
+    unittest.main()
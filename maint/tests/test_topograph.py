@@ -0,0 +1,205 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import topograph  # noqa: E402
+
+
+def topologyXml(sm=80, guid=0x400, ranked=4):
+    """NCCL_TOPO_DUMP_FILE of a node with 2 CPUs, each with a PCI switch
+    holding 2 GPUs on NVSwitch and a NIC; the first ranked GPUs have a rank"""
+    lines = ['<system version="1">']
+    for cpu in range(2):
+        bus = 0x10 * (cpu + 1)
+        lines.append('  <cpu numaid="%d" affinity="ffff" arch="x86_64" vendor="GenuineIntel" familyid="6" '
+                     'modelid="85">' % cpu)
+        lines.append('    <pci busid="0000:%02x:00.0" class="0x060400" vendor="0x1000" device="0xc010" '
+                     'subsystem_vendor="0x1000" subsystem_device="0xa064" link_speed="16.0 GT/s PCIe" '
+                     'link_width="16">' % bus)
+        for k in range(2):
+            dev = 2 * cpu + k
+            rank = ' rank="%d"' % dev if dev < ranked else ""
+            lines.append('      <pci busid="0000:%02x:00.0" class="0x030200" vendor="0x10de" device="0x20b0" '
+                         'link_speed="16.0 GT/s PCIe" link_width="16">' % (bus + 1 + k))
+            lines.append('        <gpu dev="%d" sm="%d"%s gdr="1">' % (dev, sm, rank))
+            lines.append('          <nvlink target="0000:c0:00.0" count="12" tclass="0x068000"/>')
+            lines.append('        </gpu>')
+            lines.append('      </pci>')
+        lines.append('      <pci busid="0000:%02x:00.0" class="0x020700" vendor="0x15b3" device="0x101b" '
+                     'link_speed="16.0 GT/s PCIe" link_width="16">' % (bus + 3))
+        lines.append('        <nic>')
+        lines.append('          <net name="mlx5_%d" dev="%d" speed="200000" port="1" latency="0.000000" '
+                     'guid="0x%x" maxconn="131072" gdr="1"/>' % (cpu, cpu, guid + cpu))
+        lines.append('        </nic>')
+        lines.append('      </pci>')
+        lines.append('    </pci>')
+        lines.append('  </cpu>')
+    lines.append('</system>')
+    return "\n".join(lines) + "\n"
+
+
+class TopoGraphTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.topology = self.write("host0.xml", topologyXml())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        filename = os.path.join(self.tmp.name, name)
+        with open(filename, "w") as f:
+            f.write(content)
+        return filename
+
+    def topograph(self, *argv, rc=0):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["topograph.py"] + list(argv)), \
+                contextlib.redirect_stdout(out):
+            self.assertEqual(topograph.main(), rc)
+        return out.getvalue()
+
+    def testSystemFromXml(self):
+        system = topograph.systemFromXml(ET.fromstring(topologyXml()))
+        self.assertEqual([len(system.nodes[t]) for t in (topograph.GPU, topograph.NET, topograph.CPU,
+                                                         topograph.NVS)], [4, 2, 2, 1])
+        self.assertEqual([gpu.rank for gpu in system.nodes[topograph.GPU]], [0, 1, 2, 3])
+        self.assertEqual([net.bw for net in system.nodes[topograph.NET]], [25.0, 25.0])
+        # 12 NVLinks of 20 GB/s to the NVSwitch
+        nvls = [link for link in system.nodes[topograph.GPU][0].links if link.type == topograph.LINK_NVL]
+        self.assertEqual([link.bw for link in nvls], [240.0])
+
+        # GPUs without a rank are not in the job unless --all-gpus
+        root = ET.fromstring(topologyXml(ranked=2))
+        self.assertEqual(len(topograph.systemFromXml(root).nodes[topograph.GPU]), 2)
+        self.assertEqual([gpu.rank for gpu in topograph.systemFromXml(root, True).nodes[topograph.GPU]],
+                         [0, 1, 2, 3])
+        with self.assertRaisesRegex(ValueError, "no GPU with a rank"):
+            topograph.systemFromXml(ET.fromstring(topologyXml(ranked=0)))
+        with self.assertRaisesRegex(ValueError, "version 2, 1 needed"):
+            topograph.systemFromXml(ET.fromstring(topologyXml().replace('version="1"', 'version="2"')))
+
+    def testPaths(self):
+        lines = self.topograph("paths", self.topology).splitlines()
+        self.assertEqual(lines[0], "maxBw 24 totalBw 240")
+        self.assertEqual(lines[1], "GPU/0 (rank 0): GPU/0 LOC 5000, GPU/1 NVL 240, GPU/2 NVL 240, "
+                                   "GPU/3 NVL 240, NET/0 PIX 24, NET/1 PXN 24")
+        self.assertEqual(lines[5], "NET/0: GPU/0 PIX 24, GPU/1 PIX 24, GPU/2 SYS 10, GPU/3 SYS 10, "
+                                   "NET/0 LOC 5000, NET/1 SYS 10")
+        self.assertEqual(len(lines), 7)
+
+    def testSearch(self):
+        graphFile = os.path.join(self.tmp.name, "host0.graph.xml")
+        out = self.topograph("search", "--output", graphFile, self.topology)
+        self.assertIn("ring (id 0) ring: 2 channels x 24/24 GB/s, NVL/PIX", out)
+        self.assertIn("tree (id 1) balanced tree: 2 channels x 48/24 GB/s, NVL/PIX", out)
+        graphs = topograph.parseGraphs(topograph.loadXml(graphFile))
+        self.assertEqual([g["nchannels"] for g in graphs], [2, 2, 0, 0])
+        for channel in graphs[0]["channels"]:
+            # Each channel enters and leaves through the NIC of its first GPU
+            self.assertEqual([tag for tag, _ in channel], ["net"] + ["gpu"] * 4 + ["net"])
+            self.assertEqual(channel[0], channel[-1])
+            self.assertEqual(sorted(dev for tag, dev in channel if tag == "gpu"), [0, 1, 2, 3])
+        self.assertEqual(self.topograph("validate", self.topology, graphFile),
+                         "%s is valid on %s\n" % (graphFile, self.topology))
+
+        # Without the network, rings stay on NVLink
+        out = self.topograph("search", "--nnodes", "1", self.topology)
+        self.assertIn("ring (id 0) ring: 12 channels x 20/20 GB/s, NVL/PIX", out)
+        self.assertIn("   0 : GPU/0 GPU/1 GPU/2 GPU/3\n", out)
+
+    def testValidateProblems(self):
+        graphFile = os.path.join(self.tmp.name, "host0.graph.xml")
+        self.topograph("search", "--output", graphFile, self.topology)
+        root = topograph.loadXml(graphFile)
+        ring = root.find("graph")
+        channels = ring.findall("channel")
+        # Drop a GPU, name a NIC the node does not have, and a missing channel
+        channels[0].remove(channels[0].findall("gpu")[1])
+        channels[1].find("net").set("dev", "7")
+        ring.set("nchannels", "3")
+        bad = self.write("bad.graph.xml", topograph.dumpXml(root))
+        out = self.topograph("validate", self.topology, bad, rc=1)
+        self.assertEqual(out.splitlines(), [
+            "graph 0: 2 channels, nchannels is 3",
+            "graph 0 channel 0: 3 GPUs, 4 in the topology",
+            "graph 0 channel 1: no NET/7 in the topology",
+        ])
+
+        # More bandwidth than the NICs have
+        root = topograph.loadXml(graphFile)
+        root.find("graph").set("speedinter", "40")
+        problems = topograph.validateGraphs(topograph.loadXml(self.topology),
+                                            topograph.parseGraphs(root))
+        self.assertEqual(len(problems), 2)
+        self.assertRegex(problems[0], r"^graph 0 channel 0: NET/\d has 25 GB/s left, 40 needed$")
+
+        with self.assertRaisesRegex(ValueError, "unknown typeintra XYZ"):
+            topograph.parseGraphs(ET.fromstring(
+                '<graphs version="1"><graph id="0" pattern="4" crossnic="0" nchannels="0" speedintra="1" '
+                'speedinter="1" typeintra="XYZ" typeinter="PIX" samechannels="0"/></graphs>'))
+
+    def testSkuKey(self):
+        key = topograph.skuKey(ET.fromstring(topologyXml()))
+        # NIC GUIDs and ranks differ between hosts of a SKU
+        self.assertEqual(topograph.skuKey(ET.fromstring(topologyXml(guid=0x900))), key)
+        self.assertEqual(topograph.skuKey(ET.fromstring(topologyXml(ranked=2))), key)
+        self.assertNotEqual(topograph.skuKey(ET.fromstring(topologyXml(sm=90))), key)
+
+    def testLabelFiles(self):
+        self.assertEqual(topograph.labelFiles(["d/host1.topo.xml", "n2=x.graph", self.topology]),
+                         [("host1", "d/host1.topo.xml"), ("n2", "x.graph"), ("host0", self.topology)])
+
+    def testEmit(self):
+        self.write("host1.xml", topologyXml(guid=0x800))
+        self.write("host2.xml", topologyXml(sm=90))
+        outputDir = os.path.join(self.tmp.name, "graphs")
+        hosts = [os.path.join(self.tmp.name, "host%d.xml" % i) for i in range(3)]
+        out = self.topograph("emit", "--output-dir", outputDir, hosts[0], "h1=" + hosts[1], hosts[2])
+        with open(os.path.join(outputDir, "skus.json")) as f:
+            manifest = json.load(f)
+        self.assertEqual(sorted(sku["hosts"] for sku in manifest.values()), [["host0", "h1"], ["host2"]])
+        for sku, entry in manifest.items():
+            self.assertEqual(entry["graphFile"], os.path.join(outputDir, "%s.xml" % sku))
+            self.assertEqual(entry["problems"], {})
+            self.assertEqual((entry["gpus"], entry["nets"]), (4, 2))
+            self.assertIn("%s: %d hosts, 4 GPUs, 2 NICs -> %s\n" % (sku, len(entry["hosts"]), entry["graphFile"]),
+                          out)
+        self.assertNotIn("INVALID", out)
+
+    def testDiff(self):
+        graphFile = os.path.join(self.tmp.name, "node0.xml")
+        self.topograph("search", "--output", graphFile, self.topology)
+        root = topograph.loadXml(graphFile)
+        for i in (1, 2):
+            self.write("node%d.xml" % i, topograph.dumpXml(root))
+        root.find("graph").set("nchannels", "1")
+        root.find("graph").remove(root.find("graph").findall("channel")[1])
+        odd = self.write("node3.xml", topograph.dumpXml(root))
+        files = [os.path.join(self.tmp.name, "node%d.xml" % i) for i in range(3)] + [odd]
+
+        out = self.topograph("diff", *files, rc=1)
+        self.assertTrue(out.startswith("4 nodes, 2 distinct graph sets\n\nmajority: 3 nodes (node0, node1, node2)"),
+                        out)
+        self.assertIn("group 1: 1 nodes (node3)\n    ring: nchannels 1 (majority: 2)\n    ring channel 1: - ", out)
+
+        groups = json.loads(self.topograph("diff", "--json", *files, rc=1))
+        self.assertEqual([g["nodes"] for g in groups], [["node0", "node1", "node2"], ["node3"]])
+        self.assertEqual(groups[0]["diff"], [])
+
+        # A topology is compared by the graphs the search chooses on it
+        out = self.topograph("diff", graphFile, "host0=" + self.topology)
+        self.assertTrue(out.startswith("2 nodes, 1 distinct graph sets\n"), out)
+
+
+if __name__ == "__main__":
+    unittest.main()
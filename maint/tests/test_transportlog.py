@@ -0,0 +1,194 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import transportlog  # noqa: E402
+
+numHosts = 2
+gpusPerHost = 4
+numRanks = numHosts * gpusPerHost
+numChannels = 2
+
+
+def writeLogs(directory):
+    """NCCL_DEBUG=INFO logs of 2 hosts of 4 GPUs, one process a rank, with
+    a ring over all ranks (commHash 777) and, from another thread, one over
+    the ranks of host 0 (commHash 888). Rank 1 gets SHM to rank 2, and the
+    NET connections of host 1 have no GPU Direct RDMA."""
+    files = []
+    for rank in range(numRanks):
+        host, dev = divmod(rank, gpusPerHost)
+        pid = 100 + rank
+        lines = []
+
+        def info(msg, tid=pid):
+            lines.append("2024-05-01T10:00:00.%06d host%d:%d:%d [%d] NCCL INFO %s"
+                         % (len(lines), host, pid, tid, dev, msg))
+
+        def init(commHash, nranks, tid, channels):
+            info("comm 0x%x rank %d nranks %d cudaDev %d nvmlDev %d busId %x000 commId 0x1 commHash %d - Init START"
+                 % (commHash, rank, nranks, dev, dev, dev + 16, commHash), tid)
+            prev, next_ = (rank - 1) % nranks, (rank + 1) % nranks
+            info("Using network IB", tid)
+            for c in range(numChannels):
+                info("Ring %02d : %d -> %d -> %d" % (c, prev, rank, next_), tid)
+            info("Trees" + "".join(" [%d] %d/-1/-1->%d->%d" % (c, next_, rank, prev) for c in range(numChannels)),
+                 tid)
+            for c in range(numChannels):
+                channels(c, next_, prev)
+            info("%d coll channels, 0 nvls channels, %d p2p channels, 2 p2p channels per peer"
+                 % (numChannels, 2 * numChannels), tid)
+            info("comm 0x%x rank %d nranks %d localrank %d localranks %d cudaDev %d nvmlDev %d busId %x000 "
+                 "commId 0x1 commHash %d - Init COMPLETE in 12.00 ms"
+                 % (commHash, rank, nranks, dev, min(nranks, gpusPerHost), dev, dev, dev + 16, commHash), tid)
+
+        def worldChannels(c, next_, prev):
+            gdr = "" if host == 1 else "/GDRDMA"
+            if next_ // gpusPerHost != host:
+                info("Channel %02d/0 : %d[%d] -> %d[%d] [send] via NET/IB/%d%s"
+                     % (c, rank, dev, next_, next_ % gpusPerHost, dev // 2, gdr))
+            elif rank == 1:
+                info("Channel %02d : %d[%d] -> %d[%d] via SHM/direct/direct" % (c, rank, dev, next_, next_))
+            else:
+                info("Channel %02d/0 : %d[%d] -> %d[%d] via P2P/IPC/read" % (c, rank, dev, next_, next_ % gpusPerHost))
+            if prev // gpusPerHost != host:
+                info("Channel %02d/0 : %d[%d] -> %d[%d] [receive] via NET/IB/%d%s"
+                     % (c, prev, prev % gpusPerHost, rank, dev, dev // 2, gdr))
+
+        def hostChannels(c, next_, prev):
+            info("Channel %02d/0 : %d[%d] -> %d[%d] via P2P/direct pointer/read" % (c, rank, dev, next_, next_),
+                 pid + 1)
+
+        if rank == 1:
+            info("P2P is disabled between connected GPUs 1 and 2. You can repress this message with "
+                 "NCCL_IGNORE_DISABLED_P2P=1.")
+        if host == 1:
+            info("GPU Direct RDMA Disabled for GPU %x000 / HCA %d (distance 5 > 4)" % (dev + 16, dev // 2))
+        init(777, numRanks, pid, worldChannels)
+        if host == 0:
+            init(888, gpusPerHost, pid + 1, hostChannels)
+        for i in range(20):
+            info("AllReduce: opCount %x sendbuff 0x7f recvbuff 0x7f count 1024 datatype 7 op 0 root 0 comm 0x309 "
+                 "[nranks=%d] stream 0x1" % (i, numRanks))
+        filename = os.path.join(directory, "nccl.host%d.%d" % (host, pid))
+        with open(filename, "w") as f:
+            # The last line of a log cut short has no newline
+            f.write("\n".join(lines) + ("" if rank == 0 else "\n"))
+        files.append(filename)
+    return files
+
+
+class TransportLogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.logs = os.path.join(self.tmp.name, "logs")
+        os.mkdir(self.logs)
+        self.files = writeLogs(self.logs)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def transportlog(self, *argv):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["transportlog.py"] + list(argv)), \
+                contextlib.redirect_stdout(out):
+            self.assertEqual(transportlog.main(), 0)
+        return out.getvalue()
+
+    def testParseVia(self):
+        self.assertEqual(transportlog.parseVia("NET/IB/3/GDRDMA"), ("NET", "NET/IB", 3, -1, 1, 0, 0))
+        self.assertEqual(transportlog.parseVia("NET/IB/1(5)/GDRDMA/Shared"), ("NET", "NET/IB", 1, 5, 1, 1, 0))
+        self.assertEqual(transportlog.parseVia("NET/Socket/0"), ("NET", "NET/Socket", 0, -1, 0, 0, 0))
+        self.assertEqual(transportlog.parseVia("P2P/IPC/read"), ("P2P", "P2P/IPC", -1, -1, -1, 0, 1))
+        self.assertEqual(transportlog.parseVia("P2P/direct pointer/read"), ("P2P", "P2P/direct", -1, -1, -1, 0, 1))
+        self.assertEqual(transportlog.parseVia("P2P/indirect/2[2]"), ("P2P", "P2P/indirect", -1, -1, -1, 0, 0))
+        self.assertEqual(transportlog.parseVia("SHM/direct/direct"), ("SHM", "SHM/direct/direct", -1, -1, -1, 0, 0))
+
+    def testIterInfoLines(self):
+        nLines = [0]
+        with open(self.files[0]) as f:
+            lines = list(transportlog.iterInfoLines(f, nLines))
+        with open(self.files[0]) as f:
+            content = f.read()
+        self.assertEqual(nLines[0], content.count("\n") + 1)
+        # The AllReduce lines are skipped, the last one without a newline read
+        self.assertEqual(lines, [l for l in content.split("\n") if "AllReduce" not in l])
+        with mock.patch.object(transportlog, "readChunk", 13), open(self.files[0]) as f:
+            self.assertEqual(list(transportlog.iterInfoLines(f, [0])), lines)
+
+    def testScan(self):
+        tables, reasons, nFiles, nLines = transportlog.scanLogs([self.logs])
+        self.assertEqual(nFiles, numRanks)
+        comms = tables.tables["comms"]
+        self.assertEqual(sorted(zip(comms["comm"], comms["rank"])),
+                         [("777", r) for r in range(numRanks)] + [("888", r) for r in range(gpusPerHost)])
+        row = list(zip(*comms.values()))[comms["rank"].index(5)]
+        self.assertEqual(row, ("777", 5, numRanks, gpusPerHost, "host1", 105, 1, 1, "11000", "IB", numChannels, 0,
+                               2 * numChannels, os.path.join(self.logs, "nccl.host1.105")))
+
+        conns = list(tables.rows("connections"))
+        # Connections of the thread of each communicator
+        self.assertEqual(sorted({(c[0], c[6]) for c in conns}),
+                         [("777", "NET"), ("777", "P2P"), ("777", "SHM"), ("888", "P2P")])
+        self.assertEqual(len([c for c in conns if c[0] == "888"]), gpusPerHost * numChannels)
+        self.assertIn(("777", 4, 1, 0, 3, "recv", "NET", "NET/IB", 0, -1, 0, 0, 0), conns)
+        self.assertIn(("777", 3, 1, 0, 4, "send", "NET", "NET/IB", 1, -1, 1, 0, 0), conns)
+
+        rings = list(tables.rows("rings"))
+        self.assertEqual(len(rings), (numRanks + gpusPerHost) * numChannels)
+        self.assertIn(("888", 3, 1, 2, 0), rings)
+        self.assertIn(("777", 3, 1, 2, 4), rings)
+        self.assertIn(("777", 0, 1, 1, -1, -1, 7), list(tables.rows("trees")))
+        self.assertEqual(reasons[("777", 5)], {"noGdr": "GPU Direct RDMA Disabled for GPU 11000 / HCA 0 (distance "
+                                                         "5 > 4)"})
+
+    def testFallbacks(self):
+        report = json.loads(self.transportlog("--json", self.logs))
+        self.assertEqual((report["files"], report["comms"], report["ranks"]), (numRanks, 2, numRanks + gpusPerHost))
+        self.assertEqual(list(report["paths"].items()),
+                         [("P2P/IPC", 10), ("NET/IB", 8), ("P2P/direct", 8), ("SHM/direct/direct", 2)])
+        self.assertEqual([(f["comm"], f["kind"], f["ranks"], f["connections"], f["applicableRanks"], f["partial"])
+                          for f in report["fallbacks"]],
+                         [("777", "noGdr", [4, 7], 4, 4, True), ("777", "shm", [1], 2, 6, True)])
+        self.assertEqual(report["fallbacks"][0]["hosts"], ["host1"])
+        self.assertTrue(report["fallbacks"][1]["reason"].startswith("P2P is disabled between connected GPUs 1 and 2."))
+
+    def testReport(self):
+        out = self.transportlog(*self.files)
+        self.assertTrue(out.startswith("8 files, %d lines: 2 communicators, 12 ranks, 28 connections\n"
+                                       % sum(1 for f in self.files for _ in open(f))), out)
+        self.assertIn("  comm 777 (8 ranks): NET or CollNet without GPU Direct RDMA on 2 of 4 ranks (only some), "
+                      "4 connections\n    ranks 4,7 on host1\n    rank 4: GPU Direct RDMA Disabled for GPU 10000", out)
+        self.assertIn("  comm 777 (8 ranks): SHM instead of P2P on 1 of 6 ranks (only some), 2 connections\n"
+                      "    rank 1 on host0\n", out)
+
+    def testParallelScan(self):
+        report = self.transportlog("--json", "-j", "1", self.logs)
+        with mock.patch.object(transportlog, "parallelScanMinFiles", 1):
+            self.assertEqual(self.transportlog("--json", "-j", "2", self.logs), report)
+
+    def testCsv(self):
+        directory = os.path.join(self.tmp.name, "tables")
+        self.transportlog("--csv", directory, self.logs)
+        for name, columns in transportlog.tableColumns.items():
+            with open(os.path.join(directory, name + ".csv")) as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(tuple(rows[0]), columns)
+        self.assertEqual(len(rows), 1 + (numRanks + gpusPerHost) * numChannels)
+
+    def testRangesStr(self):
+        self.assertEqual(transportlog.rangesStr([1, 3, 4, 5, 9]), "1,3-5,9")
+        self.assertEqual(transportlog.rangesStr([0, 2, 4, 6], limit=2), "0,2,...")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import contextlib
+import csv
+import faulthandler
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tunerbench  # noqa: E402
+import tunetable  # noqa: E402
+from test_tunetable import pluginPath, writeSweep  # noqa: E402
+
+# ncclTuner_v1_t of src/include/nccl_tuner.h, without its CUDA includes
+pluginPrologue = """
+#include <stddef.h>
+#include <stdint.h>
+typedef void (*logger_t)(int level, unsigned long flags, const char* file, int line, const char* fmt, ...);
+typedef struct {
+  const char* name;
+  int (*init)(size_t nRanks, size_t nNodes, logger_t logFunction);
+  int (*getCollInfo)(int collType, size_t nBytes, int collNetSupport, int nvlsSupport, int numPipeOps,
+                     int* algorithm, int* protocol, int* nChannels);
+  int (*addOnlineResult)(int collType, size_t nBytes, int64_t iteration, float latency, int algorithm,
+                         int protocol, int nChannels, int nThreads);
+  int (*destroy)(void);
+} tuner_t;
+static int destroy(void) { return 0; }
+"""
+
+plugins = {
+    # Ring/Simple above 64 KiB, with online results
+    "good": """
+static int init(size_t nRanks, size_t nNodes, logger_t log) { return 0; }
+static int getCollInfo(int coll, size_t nBytes, int collNet, int nvls, int pipeOps, int* a, int* p, int* c) {
+  if (nBytes > 65536) { *a = 1; *p = 2; *c = 4; }
+  return 0;
+}
+static int addOnlineResult(int coll, size_t nBytes, int64_t it, float lat, int a, int p, int c, int t) { return 0; }
+const tuner_t ncclTunerPlugin_v1 = {"good", init, getCollInfo, addOnlineResult, destroy};
+""",
+    # CollNet without support, LL with NVLS, too many channels and an error code
+    "bad": """
+static int init(size_t nRanks, size_t nNodes, logger_t log) {
+  if (log) log(2, 0, "bad.c", 1, "hello %d", 3);
+  return 0;
+}
+static int getCollInfo(int coll, size_t nBytes, int collNet, int nvls, int pipeOps, int* a, int* p, int* c) {
+  if (nBytes == 0) return 3;
+  if (nBytes > 1000000) { *a = 2; *p = 2; }
+  else if (nBytes > 1000) { *a = 4; *p = 0; }
+  *c = 40;
+  return 0;
+}
+const tuner_t ncclTunerPlugin_v1 = {"bad", init, getCollInfo, NULL, destroy};
+""",
+    # Crashes once it got online results
+    "crash": """
+static int results;
+static int init(size_t nRanks, size_t nNodes, logger_t log) { return 0; }
+static int getCollInfo(int coll, size_t nBytes, int collNet, int nvls, int pipeOps, int* a, int* p, int* c) {
+  if (results > 100) *(volatile int*)0 = 1;
+  *a = 1; *p = 2;
+  return 0;
+}
+static int addOnlineResult(int coll, size_t nBytes, int64_t it, float lat, int a, int p, int c, int t) {
+  results++;
+  return 0;
+}
+const tuner_t ncclTunerPlugin_v1 = {"crash", init, getCollInfo, addOnlineResult, destroy};
+""",
+    "nosymbol": "const int notATuner = 0;\n",
+}
+
+
+class TunerBenchTest(unittest.TestCase):
+    def testQueries(self):
+        queries = tunerbench.Queries(5000, 3, 1 << 20, 4, None, 1)
+        self.assertEqual(len(queries), 5000)
+        again = tunerbench.Queries(5000, 3, 1 << 20, 4, None, 1)
+        self.assertEqual([queries.get(i) for i in range(5000)], [again.get(i) for i in range(5000)])
+        self.assertEqual(set(queries.coll), set(range(tunerbench.numFunctions)))
+        self.assertEqual(set(queries.collNet), {0, 1})
+        self.assertEqual(set(queries.nvls), {1})
+        self.assertEqual(set(queries.pipeOps), {1, 2, 3, 4})
+        self.assertIn(0, queries.nBytes)
+        self.assertLessEqual(max(queries.nBytes), (1 << 20) + 1)
+
+    def testCheckAnswer(self):
+        allGather = tunetable.collIds["AllGather"]
+        ring, nvls, collNetDirect = tunerbench.algoRing, tunetable.nvlsAlgos[0], tunetable.collNetAlgos[0]
+        query = lambda coll=tunerbench.allReduce, collNet=0, nvls=0: (coll, 1024, collNet, nvls, 1)
+
+        self.assertEqual(tunerbench.checkAnswer(query(), 0, -1, -1, 0, 1), ([], []))
+        self.assertEqual(tunerbench.checkAnswer(query(), 0, ring, 0, 32, 1), ([], []))
+        self.assertEqual(tunerbench.checkAnswer(query(), 1, ring, -1, 33, 1)[0], [
+            "returned 1 instead of ncclSuccess",
+            "set the algorithm without the protocol, or the reverse",
+            "nChannels 33 out of range",
+        ])
+        self.assertEqual(tunerbench.checkAnswer(query(), 0, 6, 3, 0, 1)[0],
+                         ["algorithm 6 out of range", "protocol 3 out of range"])
+        self.assertEqual(tunerbench.checkAnswer(query(), 0, collNetDirect, 2, 0, 1)[0],
+                         ["CollNetDirect without CollNet support"])
+        self.assertEqual(tunerbench.checkAnswer(query(nvls=1), 0, nvls, 0, 0, 2)[0], [
+            "NVLS across nodes without CollNet support", "NVLS with protocol LL"])
+        self.assertEqual(tunerbench.checkAnswer(query(collNet=1, nvls=1), 0, nvls, 2, 0, 2), ([], []))
+        # Patterns of the other collectives
+        self.assertEqual(tunerbench.checkAnswer(query(allGather), 0, 0, 2, 0, 1),
+                         ([], ["Tree for AllGather, which has no pattern for it"]))
+        self.assertEqual(tunerbench.checkAnswer(query(allGather, nvls=1), 0, nvls, 2, 0, 1), ([], []))
+
+    def testFindings(self):
+        findings = tunerbench.Findings()
+        findings.add("errors", ["a", "b"], (0, 1, 0, 0, 1))
+        findings.add("errors", ["a"], (1, 1, 0, 0, 1))
+        other = tunerbench.Findings()
+        other.add("warnings", ["c"], None)
+        other.add("errors", ["a"], (2, 1, 0, 0, 1))
+        findings.merge(json.loads(json.dumps(other.result())))
+        self.assertEqual(findings.result()["counts"], {"errors": {"a": 3, "b": 1}, "warnings": {"c": 1}})
+        self.assertEqual(findings.result()["examples"]["a"], (0, 1, 0, 0, 1))
+
+    def testPercentiles(self):
+        self.assertEqual(tunerbench.percentiles([]), {})
+        stats = tunerbench.percentiles(range(1000, 0, -1))
+        self.assertEqual(stats, {"p50": 0.501, "p99": 0.991, "p99.9": 1.0, "max": 1.0})
+
+
+@unittest.skipUnless(shutil.which("cc"), "no C compiler to build the test plugins")
+class TunerBenchPluginTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.plugins = {}
+        for name, source in plugins.items():
+            filename = os.path.join(cls.tmp.name, "%s.c" % name)
+            with open(filename, "w") as f:
+                f.write(source if name == "nosymbol" else pluginPrologue + source)
+            cls.plugins[name] = os.path.join(cls.tmp.name, "lib%s.so" % name)
+            subprocess.run(["cc", "-O2", "-fPIC", "-shared", "-o", cls.plugins[name], filename], check=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def tunerbench(self, *argv):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["tunerbench.py", "--queries", "2000", "--threads", "2"] + list(argv)), \
+                contextlib.redirect_stdout(out):
+            rc = tunerbench.main()
+        return rc, out.getvalue()
+
+    def testLoadTuner(self):
+        _, tuner = tunerbench.loadTuner(self.plugins["good"])
+        self.assertEqual(tuner.name, b"good")
+        self.assertTrue(tuner.addOnlineResult)
+        with self.assertRaisesRegex(ValueError, "failed to find ncclTunerPlugin_v1"):
+            tunerbench.loadTuner(self.plugins["nosymbol"])
+        with self.assertRaisesRegex(ValueError, "plugin load '.*missing.so' failed"):
+            tunerbench.loadTuner(os.path.join(self.tmp.name, "missing.so"))
+
+    def testGoodPlugin(self):
+        rc, out = self.tunerbench(self.plugins["good"], "--json", "--max-bytes", str(1 << 20))
+        self.assertEqual(rc, 0)
+        result = json.loads(out)
+        self.assertEqual((result["name"], result["addOnlineResult"]), ("good", True))
+        phases = result["phases"]
+        self.assertEqual(sorted(phases), ["calls", "online", "threads"])
+        calls = phases["calls"]
+        self.assertEqual(calls["calls"], 2000)
+        self.assertEqual(calls["answered"], calls["withChannels"])
+        self.assertEqual(list(calls["answers"]), [tunetable.candidateStr(tunerbench.algoRing, 2, 4)])
+        self.assertEqual(sorted(calls["latencyUs"]), ["max", "p50", "p99", "p99.9"])
+        self.assertEqual(phases["threads"]["calls"], 2000)
+        for phase in phases.values():
+            self.assertEqual(phase["findings"]["counts"], {"errors": {}, "warnings": {}})
+
+        rc, out = self.tunerbench(self.plugins["good"])
+        self.assertEqual(rc, 0)
+        self.assertIn("plugin good, addOnlineResult set\ngetCollInfo: 2000 calls, p50 ", out)
+        self.assertIn("errors: none\nwarnings: none\n", out)
+
+    def testBadPlugin(self):
+        rc, out = self.tunerbench(self.plugins["bad"], "--collnet", "0", "--nvls", "0")
+        self.assertEqual(rc, 1)
+        self.assertIn("plugin bad, addOnlineResult NULL (CollTrace skips online tuning)", out)
+        self.assertNotIn("with online results", out)
+        for error in ("returned 3 instead of ncclSuccess", "nChannels 40 out of range",
+                      "CollNetDirect without CollNet support", "NVLS without NVLS support",
+                      "NVLS with protocol LL"):
+            self.assertRegex(out, r"\n  \[calls\] %s: \d+ calls \(e\.g\. " % error)
+            self.assertRegex(out, r"\n  \[threads\] %s: \d+ calls" % error)
+        self.assertIn("plugin logs:\n  WARN hello %d (3)\n", out)
+
+    def testCrash(self):
+        # The children inherit the fault handler of pytest, which would dump their stacks
+        if faulthandler.is_enabled():
+            faulthandler.disable()
+            self.addCleanup(faulthandler.enable)
+        rc, out = self.tunerbench(self.plugins["crash"], "--json")
+        self.assertEqual(rc, 1)
+        phases = json.loads(out)["phases"]
+        self.assertEqual(phases["calls"]["findings"]["counts"]["errors"], {})
+        self.assertEqual(phases["online"]["findings"]["counts"]["errors"], {"crashed (signal 11)": 1})
+        self.assertEqual(phases["threads"]["findings"]["counts"]["errors"], {"crashed (signal 11)": 1})
+
+    @unittest.skipUnless(os.path.exists(pluginPath),
+                         "ext-tuner/table is not built (set NCCL_TUNER_TABLE_PLUGIN)")
+    def testTablePlugin(self):
+        sweep, table = os.path.join(self.tmp.name, "sweep.csv"), os.path.join(self.tmp.name, "t.tune")
+        writeSweep(sweep)
+        # NCCL only runs CollNet and NVLS with Simple
+        with open(sweep) as f:
+            rows = [row for row in csv.reader(f)
+                    if row[3] not in ("CollNetDirect", "NVLS") or row[4] == "Simple"]
+        with open(sweep, "w", newline="") as f:
+            csv.writer(f).writerows(rows)
+        argv = ["tunetable.py", "build", "--output", table, "--min-samples", "3", sweep]
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(io.StringIO()):
+            tunetable.main()
+        with mock.patch.dict(os.environ, {"NCCL_TUNER_TABLE_FILE": table}):
+            rc, out = self.tunerbench(pluginPath, "--json", "--nranks", "16", "--nnodes", "2")
+        self.assertEqual(rc, 0, out)
+        calls = json.loads(out)["phases"]["calls"]
+        self.assertGreater(calls["answered"], 0)
+        self.assertEqual(calls["findings"]["counts"]["errors"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+import contextlib
+import csv
+import ctypes
+import io
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+maintDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, maintDir)
+import tunetable  # noqa: E402
+
+# Built ext-tuner/table plugin, for the lookup parity test
+pluginPath = os.environ.get(
+    "NCCL_TUNER_TABLE_PLUGIN",
+    os.path.join(maintDir, "..", "ext-tuner", "table", "libnccl-tuner-table.so"))
+
+ring, tree, collNetDirect, nvls = 1, 0, 2, 4
+ll, ll128, simple = 0, 1, 2
+
+
+def latencyMs(nranks, coll, nBytes, algorithm, protocol):
+    """Synthetic latencies: LL wins small sizes, Simple large ones, NVLS
+    beats Ring, CollNet beats everything for AllReduce at 16 ranks"""
+    base = {ll: 0.005, ll128: 0.008, simple: 0.02}[protocol]
+    perByte = {ll: 4e-9, ll128: 1e-9, simple: 0.6e-9}[protocol]
+    scale = {ring: 1.0, tree: 1.1 if nBytes > 1 << 20 else 0.9, nvls: 0.7, collNetDirect: 1.0}[algorithm]
+    if algorithm == collNetDirect and nranks == 16 and coll == tunetable.collIds["AllReduce"]:
+        scale = 0.5
+    return (base + perByte * nBytes) * scale * nranks / 8
+
+
+def writeSweep(filename):
+    rows = []
+    for nranks in (8, 16):
+        for coll in ("AllReduce", "AllGather"):
+            for shift in range(8, 27, 2):
+                nBytes = 1 << shift
+                for algorithm in (ring, tree, nvls, collNetDirect):
+                    if coll == "AllGather" and algorithm in (tree, collNetDirect):
+                        continue
+                    for protocol in (ll, ll128, simple):
+                        latency = latencyMs(nranks, tunetable.collIds[coll], nBytes, algorithm, protocol)
+                        for i in range(3):
+                            rows.append((nranks, coll, nBytes, tunetable.algoNames[algorithm],
+                                         tunetable.protoNames[protocol], 0, latency * (1 + 0.001 * i)))
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(tunetable.csvColumns)
+        writer.writerows(rows)
+
+
+def queryPlugin(tuner, coll, nBytes, collNet, nvlsSupport):
+    """(algorithm, protocol, nChannels) a plugin answers, as tunetable.lookup()"""
+    algorithm, protocol, nChannels = ctypes.c_int(-1), ctypes.c_int(-1), ctypes.c_int(0)
+    rc = tuner.getCollInfo(coll, nBytes, int(collNet), int(nvlsSupport), 1, ctypes.byref(algorithm),
+                           ctypes.byref(protocol), ctypes.byref(nChannels))
+    if rc != 0:
+        raise ValueError("getCollInfo() returned %d" % rc)
+    if algorithm.value == -1:
+        return None
+    return algorithm.value, protocol.value, nChannels.value
+
+
+class TuneTableTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv = os.path.join(self.tmp.name, "sweep.csv")
+        self.table = os.path.join(self.tmp.name, "t.tune")
+        writeSweep(self.csv)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def tunetable(self, *argv):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["tunetable.py"] + list(argv)), \
+                contextlib.redirect_stdout(out):
+            tunetable.main()
+        return out.getvalue()
+
+    def build(self):
+        out = self.tunetable("build", "--output", self.table, "--min-samples", "3", self.csv)
+        self.assertIn("buckets", out)
+        return tunetable.readTable(self.table)
+
+    def testBuild(self):
+        entries = self.build()
+        self.assertEqual(entries, sorted(entries, key=lambda e: e[:3]))
+        self.assertEqual({e[0] for e in entries}, {8, 16})
+        # Every (nranks, coll) starts at 0, with at most 3 candidates a bucket
+        for key in {e[:2] for e in entries}:
+            self.assertEqual(min(e[2] for e in entries if e[:2] == key), 0)
+        buckets = {}
+        for e in entries:
+            buckets.setdefault(e[:3], []).append(e)
+        self.assertLessEqual(max(len(b) for b in buckets.values()), 3)
+
+    def testLookup(self):
+        entries = self.build()
+        allReduce, allGather = tunetable.collIds["AllReduce"], tunetable.collIds["AllGather"]
+        self.assertEqual(tunetable.lookup(entries, 8, allReduce, 256, nvls=True)[:2], (nvls, ll))
+        self.assertEqual(tunetable.lookup(entries, 8, allReduce, 1 << 26, nvls=True)[:2], (nvls, simple))
+        # Next candidates when NVLS is not supported
+        self.assertEqual(tunetable.lookup(entries, 8, allReduce, 1 << 26)[:2], (ring, simple))
+        self.assertEqual(tunetable.lookup(entries, 16, allReduce, 1 << 26, collNet=True)[0], collNetDirect)
+        # NVLS across nodes needs CollNet
+        self.assertNotEqual(tunetable.lookup(entries, 8, allGather, 1 << 26, nvls=True, nnodes=2)[0], nvls)
+        # Closest rank count, in ratio
+        self.assertEqual(tunetable.lookup(entries, 11, allReduce, 1 << 26, collNet=True),
+                         tunetable.lookup(entries, 8, allReduce, 1 << 26, collNet=True))
+        self.assertEqual(tunetable.lookup(entries, 12, allReduce, 1 << 26, collNet=True),
+                         tunetable.lookup(entries, 16, allReduce, 1 << 26, collNet=True))
+        self.assertIsNone(tunetable.lookup(entries, 8, tunetable.collIds["Broadcast"], 1024))
+
+    def testLookupCommand(self):
+        self.build()
+        out = self.tunetable("lookup", self.table, "AllReduce", "1048576", "--nranks", "8", "--nvls")
+        self.assertTrue(out.startswith("NVLS/"), out)
+
+    def testCorruptTable(self):
+        self.build()
+        with open(self.table, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            f.write(b"\xff")
+        with self.assertRaisesRegex(ValueError, "checksum mismatch"):
+            tunetable.readTable(self.table)
+        with open(self.table, "wb") as f:
+            f.write(b"NCCLTUNX" + bytes(24))
+        with self.assertRaisesRegex(ValueError, "not a tuning table"):
+            tunetable.readTable(self.table)
+
+    @unittest.skipUnless(os.path.exists(pluginPath),
+                         "ext-tuner/table is not built (set NCCL_TUNER_TABLE_PLUGIN)")
+    def testPluginParity(self):
+        import tunerbench
+
+        entries = self.build()
+        lib, tuner = tunerbench.loadTuner(pluginPath)
+        logger = tunerbench.LoggerType(lambda *args: None)
+        rng = random.Random(0)
+        colls = list(tunetable.collIds.values())
+        with mock.patch.dict(os.environ, {"NCCL_TUNER_TABLE_FILE": self.table}):
+            for nranks, nnodes in ((8, 1), (11, 1), (12, 2), (16, 2), (64, 4)):
+                self.assertEqual(tuner.init(nranks, nnodes, logger), 0)
+                try:
+                    for _ in range(2000):
+                        coll = rng.choice(colls)
+                        nBytes = rng.choice((0, 1, rng.randrange(1 << 28), 1 << rng.randrange(28)))
+                        collNet, nvlsSupport = rng.random() < 0.5, rng.random() < 0.5
+                        answer = queryPlugin(tuner, coll, nBytes, collNet, nvlsSupport)
+                        expected = tunetable.lookup(entries, nranks, coll, nBytes, collNet, nvlsSupport, nnodes)
+                        self.assertEqual(answer, expected, (nranks, nnodes, coll, nBytes, collNet, nvlsSupport))
+                finally:
+                    self.assertEqual(tuner.destroy(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,1767 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Offline topology and graph search from dumped XML.
+
+Every communicator init detects the topology of its node and searches its
+ring, tree, CollNet and NVLS graphs (src/graph/search.cc). Both can be
+dumped (NCCL_TOPO_DUMP_FILE, NCCL_GRAPH_DUMP_FILE) and loaded back
+(NCCL_TOPO_FILE, NCCL_GRAPH_FILE), which skips the search. This tool ports
+the topology model, the path computation and the graph search of
+src/graph, so that they can run offline on dumped topologies:
+
+    # GPU/NIC paths and bandwidths of a node
+    ./maint/topograph.py paths host0.topo.xml
+
+    # graphs NCCL would search on that node
+    ./maint/topograph.py search host0.topo.xml
+
+    # one validated NCCL_GRAPH_FILE per machine SKU of a fleet
+    ./maint/topograph.py emit --output-dir graphs/ /shared/topo/*.xml
+
+    # check a graph file against a topology
+    ./maint/topograph.py validate host0.topo.xml graphs/3f2a9c0d41e7.xml
+
+    # compare the graphs chosen on the nodes of a job
+    ./maint/topograph.py diff /shared/job42/graph.*.xml
+
+Machines are of the same SKU when their topologies only differ in per-host
+attributes (ranks, NIC GUIDs, ...); see skuAttrs. Graph files name GPUs by
+device index and NICs by net device, so a graph searched on one machine of
+a SKU applies to all of them; emit validates it against every one.
+The search is ported step by step, timeouts included, so a node with 8 GPUs
+takes about a minute; emit and diff search once per SKU.
+
+The search reads the same envs as the library (NCCL_CROSS_NIC,
+NCCL_P2P_LEVEL, NCCL_NET_GDR_LEVEL, NCCL_PXN_DISABLE, ...). What depends on
+the communicator is assumed: all GPUs of the XML belong to the job, P2P is
+allowed wherever the topology permits it (no NVML), and there is more than
+one node unless --nnodes 1 is given.
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import math
+import os
+import struct
+import sys
+import xml.etree.ElementTree as ET
+
+# src/graph/topo.h
+LOC_BW = 5000.0
+SM60_NVLINK_BW = 18.0
+SM70_NVLINK_BW = 20.0
+SM80_NVLINK_BW = 20.0
+SM90_NVLINK_BW = 20.0
+SM86_NVLINK_BW = 12.0
+QPI_BW = 6.0
+SKL_QPI_BW = 10.0
+ZPI_BW = 6.0
+YONGFENG_ZPI_BW = 9.0
+P9_BW = 32.0
+ARM_BW = 6.0
+
+GPU, PCI, NVS, CPU, NIC, NET = range(6)
+nodeTypeStr = ("GPU", "PCI", "NVS", "CPU", "NIC", "NET")
+
+LINK_LOC, LINK_NVL, LINK_PCI, LINK_SYS, LINK_NET = 0, 1, 3, 7, 8
+linkTypeStr = ("LOC", "NVL", "", "PCI", "", "", "", "SYS", "NET")
+
+PATH_LOC, PATH_NVL, PATH_NVB, PATH_PIX, PATH_PXB, PATH_PXN, PATH_PHB, PATH_SYS, PATH_NET, PATH_DIS = range(10)
+pathTypeStr = ("LOC", "NVL", "NVB", "PIX", "PXB", "PXN", "PHB", "SYS", "NET", "DIS")
+
+# src/include/graph.h
+CPU_ARCH_X86, CPU_ARCH_POWER, CPU_ARCH_ARM = 1, 2, 3
+CPU_VENDOR_INTEL, CPU_VENDOR_AMD, CPU_VENDOR_ZHAOXIN = 1, 2, 3
+CPU_TYPE_BDW, CPU_TYPE_SKL, CPU_TYPE_YONGFENG = 1, 2, 1
+PATTERN_BALANCED_TREE, PATTERN_SPLIT_TREE, PATTERN_TREE, PATTERN_RING, PATTERN_NVLS = 1, 2, 3, 4, 5
+treePatterns = (PATTERN_BALANCED_TREE, PATTERN_TREE, PATTERN_SPLIT_TREE)
+patternStr = {PATTERN_BALANCED_TREE: "balanced tree", PATTERN_SPLIT_TREE: "split tree",
+              PATTERN_TREE: "tree", PATTERN_RING: "ring", PATTERN_NVLS: "nvls"}
+graphNames = ("ring", "tree", "collnet", "nvls")
+
+MAXCHANNELS = 32
+TOPO_XML_VERSION = 1
+GRAPH_XML_VERSION = 1
+
+# Dictionaries of src/graph/topo.cc, matched on prefixes as kvConvertToInt()
+kvDictPciClass = (("0x060400", PCI), ("0x068000", NVS), ("0x068001", CPU), ("0x03", GPU),
+                  ("0x02", NIC), (None, PCI))
+kvDictPciGen = (("2.5 GT/s", 15), ("5 GT/s", 30), ("8 GT/s", 60), ("16 GT/s", 120), ("32 GT/s", 240),
+                ("2.5 GT/s PCIe", 15), ("5.0 GT/s PCIe", 30), ("8.0 GT/s PCIe", 60),
+                ("16.0 GT/s PCIe", 120), ("32.0 GT/s PCIe", 240), ("64.0 GT/s PCIe", 480),
+                (None, 60))
+kvDictCpuArch = (("x86_64", CPU_ARCH_X86), ("arm64", CPU_ARCH_ARM), ("ppc64", CPU_ARCH_POWER), (None, 0))
+kvDictCpuVendor = (("GenuineIntel", CPU_VENDOR_INTEL), ("AuthenticAMD", CPU_VENDOR_AMD),
+                   ("CentaurHauls", CPU_VENDOR_ZHAOXIN), ("  Shanghai  ", CPU_VENDOR_ZHAOXIN), (None, 0))
+kvDictLinkType = {s: t for t, s in enumerate(pathTypeStr[:PATH_NET])}
+
+# Search timeouts and speeds of src/graph/search.cc
+SEARCH_GLOBAL_TIMEOUT = 5 << 16
+SEARCH_TIMEOUT = 1 << 14
+SEARCH_TIMEOUT_TREE = 1 << 14
+SEARCH_TIMEOUT_SAMECHANNELS = 1 << 8
+FORCED_ORDER_PCI = 1
+FORCED_ORDER_REPLAY = 2
+
+# Attributes that tell machine SKUs apart; others (rank, guid, keep, ...)
+# differ between hosts of a SKU
+skuAttrs = {
+    "system": ("version",),
+    "cpu": ("numaid", "arch", "vendor", "familyid", "modelid"),
+    "pci": ("busid", "class", "vendor", "device", "subsystem_vendor", "subsystem_device",
+            "link_speed", "link_width"),
+    "gpu": ("dev", "sm", "gdr"),
+    "nvlink": ("target", "count", "tclass"),
+    "nic": (),
+    "net": ("dev", "speed", "port", "latency", "gdr", "maxconn", "coll"),
+}
+
+
+floatStruct = struct.Struct("f")
+
+
+def f32(x):
+    """x rounded to a C float, as the library computes bandwidths"""
+    return floatStruct.unpack(floatStruct.pack(x))[0]
+
+
+@functools.lru_cache(maxsize=None)
+def subRound(a, b):
+    """SUB_ROUND of search.cc (the search only sees a few (a, b) pairs)"""
+    x = (a - b) * 1000
+    return f32((math.floor(x + 0.5) if x >= 0 else -math.floor(0.5 - x)) / 1000)
+
+
+def cvar(name, default):
+    """Integer env as the library reads it, or default"""
+    value = os.environ.get(name, "")
+    return int(value) if value.strip() else default
+
+
+def kvConvert(value, table):
+    for key, result in table:
+        if key is None or value.startswith(key):
+            return result
+
+
+def busIdToInt64(busId):
+    digits = ""
+    for c in busId:
+        if c in ".:":
+            continue
+        if c not in "0123456789abcdefABCDEF":
+            break
+        digits += c
+    return int(digits[:16] or "0", 16)
+
+
+def attr(elem, name, default=None):
+    value = elem.get(name)
+    if value is None:
+        if default is None:
+            raise ValueError("<%s> has no %s attribute" % (elem.tag, name))
+        return default
+    return value
+
+
+def attrInt(elem, name, default=None):
+    return int(attr(elem, name, None if default is None else str(default)), 0)
+
+
+class Link:
+    __slots__ = ("type", "bw", "remNode")
+
+    def __init__(self, type_, bw, remNode):
+        self.type, self.bw, self.remNode = type_, bw, remNode
+
+
+class Path:
+    __slots__ = ("links", "count", "bw", "type")
+
+    def __init__(self):
+        self.links, self.count, self.bw, self.type = [], 0, 0.0, PATH_LOC
+
+    def setLinks(self, links):
+        self.links, self.count = links, len(links)
+
+
+class Node:
+    def __init__(self, type_, id_):
+        self.type = type_
+        self.id = id_
+        self.links = []
+        self.paths = {}
+        self.used = 0
+        if type_ == GPU:
+            # Link to itself, used in some corner cases
+            self.links.append(Link(LINK_LOC, LOC_BW, self))
+            self.dev = self.rank = self.cudaCompCap = -1
+            self.gdrSupport = 0
+        elif type_ == CPU:
+            self.arch = self.vendor = self.model = -1
+        elif type_ == NET:
+            self.asic, self.port, self.bw, self.latency = 0, -1, 0.0, 0.0
+            self.gdrSupport = self.collSupport = 0
+            self.maxChannels = MAXCHANNELS
+        elif type_ == PCI:
+            self.device = 0
+
+    def __repr__(self):
+        return "%s/%X" % (nodeTypeStr[self.type], self.id)
+
+
+def nvlinkBw(cudaCompCap):
+    if cudaCompCap >= 90:
+        return SM90_NVLINK_BW
+    if cudaCompCap == 86:
+        return SM86_NVLINK_BW
+    if cudaCompCap >= 80:
+        return SM80_NVLINK_BW
+    if cudaCompCap >= 70:
+        return SM70_NVLINK_BW
+    if cudaCompCap >= 60:
+        return SM60_NVLINK_BW
+    return SM80_NVLINK_BW
+
+
+def connectNodes(node, remNode, type_, bw):
+    """Add bw to the link of node to remNode, keeping links by descending bw"""
+    for i, link in enumerate(node.links):
+        if link.remNode is remNode and link.type == type_:
+            link.bw = f32(link.bw + bw)
+            break
+    else:
+        i = len(node.links)
+        node.links.append(Link(type_, f32(bw), remNode))
+    while i > 0 and node.links[i - 1].bw < node.links[i].bw:
+        node.links[i - 1], node.links[i] = node.links[i], node.links[i - 1]
+        i -= 1
+
+
+class TopoSystem:
+    """Nodes of a node's topology, indexed by type and id, as ncclTopoSystem"""
+
+    def __init__(self):
+        self.nodes = [[] for _ in nodeTypeStr]
+        self.maxBw = 0.0
+        self.totalBw = 0.0
+
+    def createNode(self, type_, id_):
+        node = Node(type_, id_)
+        self.nodes[type_].append(node)
+        return node
+
+    def getNode(self, type_, id_):
+        for node in self.nodes[type_]:
+            if node.id == id_:
+                return node
+        return None
+
+    def index(self, node):
+        for i, n in enumerate(self.nodes[node.type]):
+            if n is node:
+                return i
+        raise ValueError("%r is not in the system" % node)
+
+    def idToIndex(self, type_, id_):
+        for i, node in enumerate(self.nodes[type_]):
+            if node.id == id_:
+                return i
+        raise ValueError("no %s with id %x" % (nodeTypeStr[type_], id_))
+
+    def rankToIndex(self, rank):
+        for i, gpu in enumerate(self.nodes[GPU]):
+            if gpu.rank == rank:
+                return i
+        raise ValueError("no GPU of rank %d" % rank)
+
+    def removeNode(self, node):
+        for nodes in self.nodes:
+            for n in nodes:
+                n.links = [link for link in n.links if link.remNode is not node]
+        self.nodes[node.type].remove(node)
+
+    def compCap(self):
+        caps = [gpu.cudaCompCap for gpu in self.nodes[GPU]]
+        if not caps:
+            raise ValueError("no GPU in the topology")
+        return min(caps), max(caps)
+
+    def cpuType(self):
+        cpu = self.nodes[CPU][0]
+        return cpu.arch, cpu.vendor, cpu.model
+
+
+def findLocalCpu(node, seen=None):
+    if node.type == CPU:
+        return node
+    seen = seen or set()
+    seen.add(id(node))
+    for link in node.links:
+        if link.type == LINK_PCI and id(link.remNode) not in seen:
+            cpu = findLocalCpu(link.remNode, seen)
+            if cpu is not None:
+                return cpu
+    return None
+
+
+def interCpuBw(cpu):
+    if cpu.arch == CPU_ARCH_POWER:
+        return P9_BW
+    if cpu.arch == CPU_ARCH_ARM:
+        return ARM_BW
+    if cpu.arch == CPU_ARCH_X86 and cpu.vendor == CPU_VENDOR_INTEL:
+        return SKL_QPI_BW if cpu.model == CPU_TYPE_SKL else QPI_BW
+    if cpu.arch == CPU_ARCH_X86 and cpu.vendor == CPU_VENDOR_ZHAOXIN:
+        return YONGFENG_ZPI_BW if cpu.model == CPU_TYPE_YONGFENG else ZPI_BW
+    return LOC_BW
+
+
+def addNet(system, xmlNet, nic):
+    dev = attrInt(xmlNet, "dev")
+    net = system.createNode(NET, dev)
+    guid = xmlNet.get("guid")
+    net.asic = int(guid, 16) if guid else dev
+    mbps = attrInt(xmlNet, "speed", 0)
+    if mbps <= 0:
+        # Some NICs define speed = -1
+        mbps = 10000
+    net.bw = f32(mbps / 8000.0)
+    net.latency = f32(float(xmlNet.get("latency", "0")))
+    net.port = attrInt(xmlNet, "port", 0)
+    net.gdrSupport = attrInt(xmlNet, "gdr", 0)
+    net.maxChannels = attrInt(xmlNet, "maxconn", MAXCHANNELS)
+    net.collSupport = attrInt(xmlNet, "coll", 0)
+    connectNodes(nic, net, LINK_NET, net.bw)
+    connectNodes(net, nic, LINK_NET, net.bw)
+
+
+def addNic(system, xmlNic, nic):
+    for xmlNet in xmlNic:
+        if xmlNet.tag == "net" and xmlNet.get("dev") is not None:
+            addNet(system, xmlNet, nic)
+
+
+def addPci(system, xmlPci, parent, allGpus):
+    type_ = kvConvert(attr(xmlPci, "class"), kvDictPciClass)
+    busId = busIdToInt64(attr(xmlPci, "busid"))
+
+    node = None
+    xmlGpu = xmlPci.find("gpu")
+    if xmlGpu is not None:
+        type_ = GPU
+        if xmlGpu.get("rank") is None and not allGpus:
+            return
+        node = system.createNode(GPU, busId)
+        node.cudaCompCap = attrInt(xmlGpu, "sm")
+        node.dev = attrInt(xmlGpu, "dev")
+        node.rank = node.dev if allGpus else attrInt(xmlGpu, "rank")
+        node.gdrSupport = attrInt(xmlGpu, "gdr", 0 if allGpus else None)
+    xmlNic = xmlPci.find("nic")
+    if xmlNic is not None:
+        # Ignore sub device ID and merge multi-port NICs into one PCI device
+        busId &= 0xfffffffffffffff0
+        nic = system.getNode(NIC, busId)
+        if nic is None:
+            # Connect it to parent later on
+            nic = node = system.createNode(NIC, busId)
+        addNic(system, xmlNic, nic)
+    elif type_ == PCI:
+        node = system.createNode(PCI, busId)
+        for key, shift in (("vendor", 48), ("device", 32), ("subsystem_vendor", 16), ("subsystem_device", 0)):
+            if xmlPci.get(key):
+                node.device += int(xmlPci.get(key), 0) << shift
+        for sub in xmlPci:
+            if sub.tag == "pci":
+                addPci(system, sub, node, allGpus)
+
+    if node is not None:
+        width = attrInt(xmlPci, "link_width", 0) or 16
+        speed = kvConvert(attr(xmlPci, "link_speed", ""), kvDictPciGen)
+        bw = f32(width * speed / 80.0)
+        connectNodes(node, parent, LINK_PCI, bw)
+        connectNodes(parent, node, LINK_PCI, bw)
+
+
+def addCpu(system, xmlCpu, allGpus):
+    cpu = system.createNode(CPU, attrInt(xmlCpu, "numaid"))
+    cpu.arch = kvConvert(attr(xmlCpu, "arch"), kvDictCpuArch)
+    if cpu.arch == CPU_ARCH_X86:
+        cpu.vendor = kvConvert(attr(xmlCpu, "vendor"), kvDictCpuVendor)
+        if cpu.vendor == CPU_VENDOR_INTEL:
+            familyId, modelId = attrInt(xmlCpu, "familyid"), attrInt(xmlCpu, "modelid")
+            cpu.model = CPU_TYPE_SKL if familyId == 6 and modelId >= 0x55 else CPU_TYPE_BDW
+        elif cpu.vendor == CPU_VENDOR_ZHAOXIN:
+            familyId, modelId = attrInt(xmlCpu, "familyid"), attrInt(xmlCpu, "modelid")
+            if familyId == 7 and modelId == 0x5B:
+                cpu.model = CPU_TYPE_YONGFENG
+    for sub in xmlCpu:
+        if sub.tag == "pci":
+            addPci(system, sub, cpu, allGpus)
+        if sub.tag == "nic":
+            nic = system.getNode(NIC, 0)
+            if nic is None:
+                nic = system.createNode(NIC, 0)
+                connectNodes(cpu, nic, LINK_PCI, LOC_BW)
+                connectNodes(nic, cpu, LINK_PCI, LOC_BW)
+            addNic(system, sub, nic)
+
+
+def addNvLinks(system, elem, parentBusId, allGpus):
+    if elem.tag == "gpu" and elem.get("rank") is None and not allGpus:
+        # Not in the job: trimmed from the XML with its NVLinks (ncclTopoTrimXml())
+        return
+    if elem.tag == "nvlink":
+        gpu = system.getNode(GPU, busIdToInt64(parentBusId or ""))
+        if gpu is None:
+            raise ValueError("NVLink of GPU %s, which is not in the topology" % parentBusId)
+        count = attrInt(elem, "count")
+        targetType = kvConvert(attr(elem, "tclass"), kvDictPciClass)
+        if targetType == GPU:
+            remote = system.getNode(GPU, busIdToInt64(attr(elem, "target")))
+        elif targetType == CPU:
+            remote = findLocalCpu(gpu)
+        else:
+            remote = system.nodes[NVS][0] if system.nodes[NVS] else system.createNode(NVS, 0)
+        if remote is not None:
+            bw = count * nvlinkBw(gpu.cudaCompCap)
+            connectNodes(gpu, remote, LINK_NVL, bw)
+            if remote.type != GPU:
+                connectNodes(remote, gpu, LINK_NVL, bw)
+        return
+    busId = elem.get("busid")
+    for sub in elem:
+        addNvLinks(system, sub, busId or parentBusId, allGpus)
+
+
+def flattenBcmSwitches(system):
+    """BCM Gen4 switches present themselves as two levels of switches; fuse them"""
+    flattened = True
+    while flattened:
+        flattened = False
+        for pciSwitch in system.nodes[PCI]:
+            device = pciSwitch.device
+            if device & 0xfffffffffffff000 != 0x1000c0101000a000:
+                continue
+            subs = [link.remNode for link in pciSwitch.links
+                    if link.remNode.type == PCI and link.remNode.device == device]
+            pciSwitch.links = [link for link in pciSwitch.links if link.remNode not in subs]
+            for sub in subs:
+                for link in sub.links:
+                    remNode = link.remNode
+                    if remNode is pciSwitch:
+                        continue
+                    pciSwitch.links.append(Link(link.type, link.bw, remNode))
+                    for remLink in remNode.links:
+                        if remLink.remNode is sub:
+                            remLink.remNode = pciSwitch
+                            break
+                system.removeNode(sub)
+            # Do not merge this switch again
+            pciSwitch.device = 0x1000c01010000000
+            flattened = True
+            break
+
+
+def sortLinks(node, upNode):
+    """Order links as NVLinks, PCI down, PCI up, SYS, as ncclTopoSortSystem()"""
+    if upNode is not None:
+        for i, link in enumerate(node.links):
+            if link.remNode is upNode:
+                node.links.append(node.links.pop(i))
+                break
+    for link in list(node.links):
+        if link.type == LINK_PCI and link.remNode is not upNode:
+            sortLinks(link.remNode, node)
+
+
+def systemFromXml(root, allGpus=False):
+    """TopoSystem of an NCCL_TOPO_DUMP_FILE, as ncclTopoGetSystemFromXml()"""
+    top = root if root.tag == "system" else root.find(".//system")
+    if top is None:
+        raise ValueError("no <system> in the topology XML")
+    version = attrInt(top, "version", 0)
+    if version != TOPO_XML_VERSION:
+        raise ValueError("XML topology has version %d, %d needed" % (version, TOPO_XML_VERSION))
+    system = TopoSystem()
+    for sub in top:
+        if sub.tag == "cpu":
+            addCpu(system, sub, allGpus)
+    addNvLinks(system, top, None, allGpus)
+    flattenBcmSwitches(system)
+    cpus = system.nodes[CPU]
+    for cpu in cpus:
+        for peer in cpus:
+            if peer is not cpu:
+                connectNodes(cpu, peer, LINK_SYS, interCpuBw(cpu))
+    for cpu in cpus:
+        sortLinks(cpu, None)
+    if not system.nodes[GPU]:
+        raise ValueError("no GPU with a rank in the topology (see --all-gpus)")
+    return system
+
+
+# Paths (src/graph/paths.cc)
+
+def setPaths(system, baseNode, nvbDisable):
+    """Breadth-first search of the best paths from all nodes to baseNode"""
+    baseType = baseNode.type
+    base = system.index(baseNode)
+    count = len(system.nodes[baseType])
+
+    def pathOf(node):
+        paths = node.paths.get(baseType)
+        if paths is None:
+            paths = node.paths[baseType] = [Path() for _ in range(count)]
+        return paths[base]
+
+    basePath = pathOf(baseNode)
+    basePath.setLinks([])
+    basePath.bw, basePath.type = LOC_BW, PATH_LOC
+
+    nodeList = [baseNode]
+    while nodeList:
+        nextNodeList = []
+        for node in nodeList:
+            path = pathOf(node)
+            for link in node.links:
+                remNode = link.remNode
+                remPath = pathOf(remNode)
+                bw = min(path.bw, link.bw)
+
+                # Allow routing through a GPU only as 1 hop
+                if node is not baseNode and node.type == GPU and \
+                        (nvbDisable or link.type != LINK_NVL or remNode.type != GPU or path.count > 1):
+                    continue
+
+                if (remPath.bw == 0 or remPath.count > path.count) and remPath.bw < bw:
+                    revLink = next((l for l in remNode.links if l.remNode is node), None)
+                    if revLink is None:
+                        raise ValueError("no reverse link from %r to %r" % (remNode, node))
+                    remPath.setLinks([revLink] + path.links)
+                    remPath.bw = bw
+
+                    # Path types follow link types, except for LINK_NET
+                    type_ = LINK_LOC if link.type == LINK_NET else link.type
+                    if node.type == PCI and remNode.type == PCI:
+                        type_ = PATH_PXB
+                    if link.type == LINK_PCI and (node.type == CPU or remNode.type == CPU):
+                        type_ = PATH_PHB
+                    if node.type == GPU and path.type == PATH_NVL and type_ == PATH_NVL and remPath.count > 1:
+                        type_ = PATH_NVB
+                    remPath.type = max(path.type, type_)
+                    if all(n is not remNode for n in nextNodeList):
+                        nextNodeList.append(remNode)
+        nodeList = nextNodeList
+
+
+levelsOldToNew = (PATH_LOC, PATH_PIX, PATH_PXB, PATH_PHB, PATH_SYS, PATH_SYS)
+
+
+def userLevel(disableEnv, levelEnv):
+    """Path type of NCCL_P2P_LEVEL-like envs, or None, as ncclGetLevel()"""
+    disable = os.environ.get(disableEnv, "") if disableEnv else ""
+    if disable.strip() and int(disable) == 1:
+        return PATH_LOC
+    level = os.environ.get(levelEnv, "")
+    if not level:
+        return None
+    if level in pathTypeStr[:PATH_NET]:
+        return pathTypeStr.index(level)
+    if level[0].isdigit():
+        return levelsOldToNew[min(int(level), len(levelsOldToNew) - 1)]
+    return None
+
+
+class Options:
+    """Envs of the library that change paths and the search"""
+
+    def __init__(self):
+        self.nvbDisable = cvar("NCCL_NVB_DISABLE", 0)
+        self.pxnDisable = cvar("NCCL_PXN_DISABLE", 0)
+        self.p2pLevel = userLevel("NCCL_P2P_DISABLE", "NCCL_P2P_LEVEL")
+        self.gdrLevel = userLevel(None, "NCCL_NET_GDR_LEVEL")
+        self.gdrRead = cvar("NCCL_NET_GDR_READ", -2)
+        self.crossNic = cvar("NCCL_CROSS_NIC", 2)
+        self.nvlsEnable = cvar("NCCL_NVLS_ENABLE", 2)
+
+
+def checkP2p(system, g1, g2, options):
+    """Whether GPU g1 can use P2P to GPU g2; NVML is assumed to allow it"""
+    path = system.nodes[GPU][g1].paths[GPU][g2]
+    p2pLevel = PATH_SYS
+    if options.p2pLevel is not None:
+        p2pLevel = options.p2pLevel
+    else:
+        # Don't use P2P through ARM, Intel and Zhaoxin CPUs
+        arch, vendor, _ = system.cpuType()
+        if arch == CPU_ARCH_ARM:
+            p2pLevel = PATH_PXB
+        if arch == CPU_ARCH_X86 and vendor in (CPU_VENDOR_INTEL, CPU_VENDOR_ZHAOXIN):
+            p2pLevel = PATH_PXB
+    return path.type <= p2pLevel
+
+
+def intermediateRank(system, rank, netDev):
+    gpu = system.nodes[GPU][system.rankToIndex(rank)]
+    path = gpu.paths[NET][system.idToIndex(NET, netDev)]
+    if path.type != PATH_PXN:
+        return rank
+    node = None
+    for link in path.links:
+        node = link.remNode
+        if node.type != NVS:
+            break
+    if node is None or node.type != GPU:
+        raise ValueError("no intermediate GPU between GPU rank %d and NIC %d" % (rank, netDev))
+    return node.rank
+
+
+def checkGdr(system, g, n, read, options):
+    gpu, net = system.nodes[GPU][g], system.nodes[NET][n]
+    if not net.gdrSupport or not gpu.gdrSupport:
+        return False
+    if read:
+        # For reads (sends) only enable under certain conditions
+        if options.gdrRead == 0:
+            return False
+        if options.gdrRead < 0:
+            nvlink = len(system.nodes[GPU]) == 1 or any(
+                i != g and gpu.paths[GPU][i].type == PATH_NVL for i in range(len(system.nodes[GPU])))
+            if not nvlink:
+                return False
+    netGdrLevel = PATH_PXB if options.gdrLevel is None else options.gdrLevel
+    distance = gpu.paths[NET][n].type
+    if distance == PATH_PXN:
+        # Use the distance of the intermediate GPU instead
+        proxy = system.nodes[GPU][system.rankToIndex(intermediateRank(system, gpu.rank, net.id))]
+        distance = proxy.paths[NET][n].type
+    return distance <= netGdrLevel
+
+
+def localNetMask(system, g):
+    """(mask of the net ids closest to GPU g, their path type)"""
+    minType, maxBw, nets = PATH_DIS, 0.0, []
+    for net in system.nodes[NET]:
+        path = net.paths[GPU][g]
+        if path.bw > maxBw or (path.bw == maxBw and path.type < minType):
+            maxBw, minType, nets = path.bw, path.type, []
+        if path.bw == maxBw and path.type == minType:
+            nets.append(net.id)
+    mask = 0
+    for netId in nets:
+        if netId >= 64:
+            raise ValueError("net device %d out of range" % netId)
+        mask |= 1 << netId
+    return mask, minType
+
+
+def localGpu(system, netId):
+    """Index of the GPU that NIC netId is local to, or -1, as ncclTopoGetLocalGpu()"""
+    gpus, minType, mask = [], PATH_DIS, 0
+    for g in range(len(system.nodes[GPU])):
+        gMask, type_ = localNetMask(system, g)
+        if not (1 << netId) & gMask:
+            continue
+        if type_ < minType:
+            mask, gpus, minType = gMask, [], type_
+        if type_ == minType:
+            if mask and gMask != mask:
+                raise ValueError("GPUs %d and %d have different local nets for net %d" % (g, gpus[-1], netId))
+            gpus.append(g)
+    if not mask:
+        return -1
+    # Round robin on GPUs
+    gIndex = 0
+    for n in range(64):
+        if (1 << n) & mask:
+            if n == netId:
+                return gpus[gIndex]
+            gIndex = (gIndex + 1) % len(gpus)
+    return -1
+
+
+def localCpu(system, g):
+    paths = system.nodes[GPU][g].paths[CPU]
+    best, minHops = -1, 0
+    for c, path in enumerate(paths):
+        if minHops == 0 or path.count < minHops:
+            best, minHops = c, path.count
+    if best == -1:
+        raise ValueError("no CPU close to GPU %d" % g)
+    return best
+
+
+def addInterStep(system, tx, ix, t1, i1, t2, i2):
+    """Route the path from node t1/i1 to t2/i2 through tx/ix"""
+    cpuNode, srcNode = system.nodes[tx][ix], system.nodes[t1][i1]
+    first, second = srcNode.paths[tx][ix], cpuNode.paths[t2][i2]
+    path = srcNode.paths[t2][i2]
+    path.setLinks(first.links + second.links)
+    path.type = PATH_PXN if tx == GPU else max(first.type, second.type)
+    path.bw = min(first.bw, second.bw)
+
+
+def computePaths(system, options):
+    """Paths between GPUs, NICs, CPUs and NVSwitches, as ncclTopoComputePaths()"""
+    for nodes in system.nodes:
+        for node in nodes:
+            node.paths = {}
+    for type_ in (CPU, GPU, NET, NVS):
+        for node in system.nodes[type_]:
+            setPaths(system, node, options.nvbDisable)
+
+    ngpus = len(system.nodes[GPU])
+    for g in range(ngpus):
+        for p in range(ngpus):
+            if not checkP2p(system, p, g, options):
+                # Divert all traffic through the CPU
+                addInterStep(system, CPU, localCpu(system, g), GPU, p, GPU, g)
+
+    for n, net in enumerate(system.nodes[NET]):
+        for g, gpu in enumerate(system.nodes[GPU]):
+            # Access the NIC through another NVLink-connected GPU (PXN)
+            if options.pxnDisable != 1:
+                peer = localGpu(system, net.id)
+                if peer not in (g, -1):
+                    peerNode = system.nodes[GPU][peer]
+                    if peerNode.paths[NET][n].type <= PATH_PXB and \
+                            peerNode.paths[GPU][g].type <= PATH_NVL and \
+                            (peerNode.paths[NET][n].bw > gpu.paths[NET][n].bw or
+                             gpu.paths[NET][n].type > PATH_PXB):
+                        addInterStep(system, GPU, peer, GPU, g, NET, n)
+            if not checkGdr(system, g, n, False, options):
+                # No GPU Direct RDMA, go through the CPU local to the GPU
+                cpu = localCpu(system, g)
+                addInterStep(system, CPU, cpu, NET, n, GPU, g)
+                addInterStep(system, CPU, cpu, GPU, g, NET, n)
+
+
+def searchInit(system):
+    """Per-channel max bw and total bw of the GPUs, as ncclTopoSearchInit()"""
+    system.maxBw = system.totalBw = 0.0
+    inter = len(system.nodes[NET])
+    if inter == 0 and len(system.nodes[GPU]) == 1:
+        system.maxBw = LOC_BW
+        return
+    for gpu in system.nodes[GPU]:
+        paths = gpu.paths[NET if inter else GPU]
+        system.maxBw = max([system.maxBw] + [p.bw for p in paths if p.count])
+        nvlinkBw = sum(l.bw for l in gpu.links if l.type == LINK_NVL)
+        pciBw = ([0.0] + [l.bw for l in gpu.links if l.type == LINK_PCI])[-1]
+        system.totalBw = max(system.totalBw, f32(max(pciBw, nvlinkBw)))
+
+
+def prepareSystem(root, options, nnodes=2, allGpus=False):
+    """System with paths, as after topology detection in initTransportsRank()"""
+    system = systemFromXml(root, allGpus)
+    computePaths(system, options)
+    if nnodes == 1:
+        # All ranks on one node: the network is not used
+        for net in list(system.nodes[NET]):
+            system.removeNode(net)
+        computePaths(system, options)
+    searchInit(system)
+    return system
+
+
+# Graph search (src/graph/search.cc)
+
+class Graph:
+    def __init__(self, id_=0, pattern=PATTERN_RING, collNet=0, minChannels=1, maxChannels=MAXCHANNELS // 2):
+        self.id = id_
+        self.pattern = pattern
+        self.crossNic = 0
+        self.collNet = collNet
+        self.minChannels = minChannels
+        self.maxChannels = maxChannels
+        self.nChannels = 0
+        self.bwIntra = self.bwInter = self.latencyInter = 0.0
+        self.typeIntra = self.typeInter = PATH_LOC
+        self.sameChannels = 0
+        self.nHops = 0
+        self.intra = [0] * (MAXCHANNELS * 256)
+        self.inter = [0] * (MAXCHANNELS * 2)
+
+    def assign(self, other):
+        self.__dict__.update(other.__dict__)
+        self.intra = list(other.intra)
+        self.inter = list(other.inter)
+
+    def copy(self):
+        graph = Graph()
+        graph.assign(self)
+        return graph
+
+
+speedArrayIntra = [f32(s) for s in (40.0, 30.0, 20.0, 18.0, 15.0, 12.0, 10.0, 9.0, 7.0, 6.0, 5.0, 4.0, 3.0)]
+speedArrayInter = [f32(s) for s in (48.0, 30.0, 28.0, 24.0, 20.0, 18.0, 15.0, 12.0, 10.0, 9.0, 7.0, 6.0,
+                                    5.0, 4.0, 3.0, 2.4, 1.2, 0.24, 0.12)]
+sm90SpeedArrayIntra = [f32(s) for s in (60.0, 40.0, 30.0, 24.0, 20.0, 15.0, 12.0, 6.0, 3.0)]
+sm90SpeedArrayInter = [f32(s) for s in (48.0, 45.0, 42.0, 40.0, 30.0, 24.0, 20.0, 17.5, 15.0, 12.0, 6.0,
+                                        3.0, 2.4, 1.2, 0.24, 0.12)]
+
+
+def findRevLink(node1, node2):
+    for link in node2.links:
+        if link.remNode is node1:
+            return link
+    raise ValueError("no reverse link from %r to %r" % (node2, node1))
+
+
+def followPath(path, start, maxSteps, bw):
+    """Take bw from the first maxSteps links of path; steps taken"""
+    pciBw = bw
+    if path.type == PATH_PHB and start.type == GPU:
+        for link in path.links:
+            node = link.remNode
+            # Account for P2P inefficiency through Intel CPU RC
+            if node.type == CPU and node.arch == CPU_ARCH_X86 and node.vendor == CPU_VENDOR_INTEL:
+                pciBw = f32(bw * 6 / 5)
+
+    node = start
+    for step in range(maxSteps):
+        link = path.links[step]
+        revLink = None
+        fwBw = pciBw if link.type == LINK_PCI else bw
+        revBw = 0.0
+        if link.remNode.type == GPU and link.remNode.cudaCompCap < 80 and start.type != GPU:
+            revLink = findRevLink(node, link.remNode)
+            revBw += f32(fwBw / 8)
+        if link.remNode.type == CPU and link.type == LINK_NVL:
+            revLink = revLink or findRevLink(node, link.remNode)
+            revBw += fwBw
+        if link.bw < fwBw or (revBw and revLink.bw < revBw):
+            return step
+        link.bw = subRound(link.bw, fwBw)
+        if revBw:
+            revLink.bw = subRound(revLink.bw, revBw)
+        node = link.remNode
+    return maxSteps
+
+
+def gpuPciBw(gpu):
+    for gpuLink in gpu.links:
+        if gpuLink.type != LINK_PCI:
+            continue
+        for pciLink in gpuLink.remNode.links:
+            if pciLink.remNode is gpu:
+                return int(min(gpuLink.bw, pciLink.bw))
+    return -1
+
+
+def selectNets(system, typeInter, gpu):
+    """Nets to try, closest to the GPU(s) first, as ncclTopoSelectNets()"""
+    nets = []
+    for t in range(typeInter + 1):
+        for g, gpuNode in enumerate(system.nodes[GPU]):
+            if gpu != -1 and gpu != g:
+                continue
+            localNets = [n for n, path in enumerate(gpuNode.paths[NET]) if path.type == t]
+            if not localNets:
+                continue
+            # Shuffle by device so that GPUs sharing NICs do not start on the same one
+            shift = gpuNode.dev % len(localNets)
+            localNets = localNets[shift:] + localNets[:shift]
+            nets.extend(n for n in localNets if n not in nets)
+    return nets
+
+
+def searchParams(system, pattern):
+    """(backToNet, backToFirstRank) steps of a pattern"""
+    ngpus = len(system.nodes[GPU])
+    if system.nodes[NET]:
+        if pattern == PATTERN_RING:
+            return ngpus - 1, -1
+        if pattern == PATTERN_SPLIT_TREE:
+            return 1, -1
+        return 0, -1
+    return -1, ngpus - 1 if pattern == PATTERN_RING else -1
+
+
+class Search:
+    """Recursive graph search of ncclTopoCompute(), on one system"""
+
+    def __init__(self, system):
+        self.system = system
+        self.time = 0
+        self.ngpus = len(system.nodes[GPU])
+        self.gpuIndex = {id(gpu): g for g, gpu in enumerate(system.nodes[GPU])}
+        # Path types do not change during the search, nor the nets they select
+        self.nets = {}
+
+    def selectNets(self, typeInter, gpu):
+        key = (typeInter, gpu)
+        if key not in self.nets:
+            self.nets[key] = selectNets(self.system, typeInter, gpu)
+        return self.nets[key]
+
+    def followPath(self, graph, type1, index1, type2, index2, mult):
+        """Destination node if graph can go from type1/index1 to type2/index2
+        (mult 1), or undo it (mult -1), else None"""
+        nodes = self.system.nodes
+        node2 = nodes[type2][index2]
+        if type1 == -1:
+            return node2
+        node1 = nodes[type1][index1]
+        path = node1.paths[type2][index2]
+        revPath = node2.paths[type1][index1]
+        if path.count == 0:
+            return node2
+
+        intra = type1 in (GPU, NVS) and type2 in (GPU, NVS)
+        bw = graph.bwIntra if intra else graph.bwInter
+        type_ = graph.typeIntra if intra else graph.typeInter
+        if mult == 1 and path.type > type_:
+            return None
+        if mult == 1 and graph.pattern in treePatterns and revPath.type > type_:
+            return None
+
+        # mult is 1, 2 or their opposites: exact in float
+        bw = bw * mult
+        step = followPath(path, node1, path.count, bw)
+        if step < path.count:
+            followPath(path, node1, step, -bw)
+            return None
+        graph.nHops += mult * path.count
+        return node2
+
+    def replayGetGpu(self, graph, step):
+        if graph.nChannels == 0:
+            raise ValueError("no channel to replay")
+        nextRank = graph.intra[(graph.nChannels - 1) * self.ngpus + step + 1]
+        return self.system.rankToIndex(nextRank)
+
+    def nextGpuSort(self, graph, gpu, sortNet):
+        system = self.system
+        flag = 1 << graph.nChannels
+        paths = gpu.paths[GPU]
+        netPaths = None
+        if sortNet:
+            netId = graph.inter[graph.nChannels * 2]
+            netPaths = system.nodes[NET][system.idToIndex(NET, netId)].paths[GPU]
+        start = self.gpuIndex[id(gpu)]
+        scores = []
+        for i in range(1, self.ngpus):
+            g = (start + i) % self.ngpus
+            if paths[g].count == 0 or system.nodes[GPU][g].used & flag:
+                continue
+            inter = (0, 0, 0)
+            if netPaths:
+                inter = (int(netPaths[g].bw), gpuPciBw(system.nodes[GPU][g]), netPaths[g].count)
+            # interBw, interPciBw, interNhops, intraBw, intraNhops, startIndex
+            scores.append((-inter[0], -inter[1], inter[2], -int(paths[g].bw), paths[g].count, i, g))
+        scores.sort()
+        # Go reverse for sortNet = -1 when all have the same intra-node score
+        if sortNet == -1 and len({(s[3], s[4]) for s in scores}) <= 1:
+            scores.reverse()
+        return [s[-1] for s in scores]
+
+    def tryGpu(self, graph, save, step, backToNet, backToFirstRank, forcedOrder, type_, index, g):
+        flag = 1 << graph.nChannels
+        gpu = self.followPath(graph, type_, index, GPU, g, 1)
+        if gpu is not None:
+            gpu.used ^= flag
+            self.recGpu(graph, save, gpu, step, backToNet, backToFirstRank, forcedOrder)
+            gpu.used ^= flag
+            self.followPath(graph, type_, index, GPU, g, -1)
+
+    def tryNvls(self, graph, save, g):
+        ngpus = self.ngpus
+        d0 = 0
+        gpu = None
+        # Enough bandwidth for NVS->GPU traffic
+        while True:
+            gpu = self.followPath(graph, NVS, 0, GPU, d0, 2 if d0 == g else 1)
+            d0 += 1
+            if gpu is None or d0 >= ngpus:
+                break
+        if gpu is None:
+            d0 -= 1
+        else:
+            d1 = 0
+            # Enough bandwidth for GPU->NVS traffic
+            while True:
+                nvs = self.followPath(graph, GPU, d1, NVS, 0, 2 if d1 == g else 1)
+                d1 += 1
+                if nvs is None or d1 >= ngpus:
+                    break
+            if nvs is None:
+                d1 -= 1
+            else:
+                self.recGpu(graph, save, None, ngpus, -1, -1, 0)
+            while d1:
+                d1 -= 1
+                self.followPath(graph, GPU, d1, NVS, 0, -2 if d1 == g else -1)
+        while d0:
+            d0 -= 1
+            self.followPath(graph, NVS, 0, GPU, d0, -2 if d0 == g else -1)
+
+    def recGpu(self, graph, save, gpu, step, backToNet, backToFirstRank, forcedOrder):
+        if self.time <= 0:
+            return
+        self.time -= 1
+
+        system, ngpus = self.system, self.ngpus
+        if step == ngpus:
+            # Determine whether we found a better solution or not
+            graph.nChannels += 1
+            if compareGraphs(system, graph, save):
+                save.assign(graph)
+                if graph.nChannels == graph.maxChannels:
+                    self.time = -1
+            if graph.nChannels < graph.maxChannels:
+                self.searchRec(graph, save)
+            graph.nChannels -= 1
+            return
+
+        graph.intra[graph.nChannels * ngpus + step] = gpu.rank
+        g = self.gpuIndex[id(gpu)]
+        if step == backToNet:
+            # First get back to NIC
+            if system.nodes[NET]:
+                startNet = system.nodes[NET][system.idToIndex(NET, graph.inter[graph.nChannels * 2])]
+                for n in self.selectNets(graph.typeInter, g):
+                    net = system.nodes[NET][n]
+                    # Trees are symmetric
+                    if graph.pattern == PATTERN_TREE and net.id != startNet.id:
+                        continue
+                    if graph.crossNic != 1 and (net.asic != startNet.asic or net.port != startNet.port):
+                        continue
+
+                    nextBackToNet = -1
+                    bwInterSave = graph.bwInter
+                    if graph.pattern == PATTERN_BALANCED_TREE:
+                        # Count half of the bandwidth on each of the first two GPUs
+                        if step == 0:
+                            nextBackToNet = 1
+                        elif net.id != graph.inter[graph.nChannels * 2 + 1]:
+                            continue
+                        graph.bwInter = f32(graph.bwInter / 2)
+
+                    reached = self.followPath(graph, GPU, g, NET, n, 1)
+                    graph.bwInter = bwInterSave
+                    if reached is not None:
+                        graph.inter[graph.nChannels * 2 + 1] = net.id
+                        self.recGpu(graph, save, gpu, step, nextBackToNet, backToFirstRank, forcedOrder)
+                        if graph.pattern == PATTERN_BALANCED_TREE:
+                            graph.bwInter = f32(graph.bwInter / 2)
+                        self.followPath(graph, GPU, g, NET, n, -1)
+                        graph.bwInter = bwInterSave
+        elif graph.pattern == PATTERN_NVLS:
+            self.tryNvls(graph, save, g)
+        elif step < ngpus - 1:
+            # Go to next GPU
+            if forcedOrder == FORCED_ORDER_PCI:
+                nexts = [step + 1]
+            elif forcedOrder == FORCED_ORDER_REPLAY:
+                nexts = [self.replayGetGpu(graph, step)]
+            else:
+                sortNet = 0 if backToNet == -1 else 1 if backToNet == step + 1 else -1
+                nexts = self.nextGpuSort(graph, gpu, sortNet)
+            for nextGpu in nexts:
+                self.tryGpu(graph, save, step + 1, backToNet, backToFirstRank, forcedOrder, GPU, g, nextGpu)
+        elif step == backToFirstRank:
+            # Find first GPU and loop back to it
+            p = system.rankToIndex(graph.intra[graph.nChannels * ngpus])
+            firstGpu = self.followPath(graph, GPU, g, GPU, p, 1)
+            if firstGpu is not None:
+                self.recGpu(graph, save, firstGpu, step + 1, backToNet, -1, forcedOrder)
+                self.followPath(graph, GPU, g, GPU, p, -1)
+        else:
+            # Next path
+            self.recGpu(graph, save, gpu, ngpus, -1, -1, forcedOrder)
+
+    def recNet(self, graph, save, backToNet, backToFirstRank):
+        system = self.system
+        bw = int(graph.bwInter)
+        nets = self.selectNets(graph.typeInter, -1)
+        for n in nets:
+            net = system.nodes[NET][n]
+            if graph.collNet and not net.collSupport:
+                continue
+            if net.bw < bw:
+                continue
+            graph.inter[graph.nChannels * 2] = net.id
+            graph.latencyInter = net.latency
+            sharing = [m for m in system.nodes[NET] if m.asic == net.asic and m.port == net.port]
+            for m in sharing:
+                m.bw = f32(m.bw - bw)
+
+            if graph.pattern == PATTERN_NVLS:
+                # NVLS needs to balance on all NICs
+                if graph.nChannels < len(nets):
+                    self.tryGpu(graph, save, 0, backToNet, backToFirstRank, 0, -1, -1, nets[graph.nChannels])
+            else:
+                if graph.nChannels > 0:
+                    # Try to replay the last channel
+                    g = self.replayGetGpu(graph, -1)
+                    self.tryGpu(graph, save, 0, backToNet, backToFirstRank, FORCED_ORDER_REPLAY, NET, n, g)
+                if graph.nChannels == 0 or graph.sameChannels == 0:
+                    if graph.nChannels == 0:
+                        # Try the PCI order first to set a reference, without
+                        # counting it in the timeout
+                        time, self.time = self.time, 1 << 10
+                        self.tryGpu(graph, save, 0, backToNet, backToFirstRank, FORCED_ORDER_PCI, NET, n, 0)
+                        self.time = -1 if self.time == -1 else time
+
+                    # Then try the most local GPUs
+                    paths = net.paths[GPU]
+                    maxBw, minHops = 0.0, 0xfffffff
+                    for path in paths:
+                        if path.bw > maxBw:
+                            maxBw, minHops = path.bw, path.count
+                        elif path.bw == maxBw and path.count < minHops:
+                            minHops = path.count
+                    if maxBw >= bw:
+                        # Avoid using GPUs in both directions between channels first
+                        for tryGpuBidir in (0, 1):
+                            for g, path in enumerate(paths):
+                                if path.bw == maxBw and path.count == minHops:
+                                    gpuUsed = 0 if gpuPciBw(system.nodes[GPU][g]) > 0 else 1
+                                    if tryGpuBidir == gpuUsed:
+                                        self.tryGpu(graph, save, 0, backToNet, backToFirstRank, 0, NET, n, g)
+
+            for m in sharing:
+                m.bw = f32(m.bw + bw)
+
+    def searchRec(self, graph, save):
+        backToNet, backToFirstRank = searchParams(self.system, graph.pattern)
+        if self.system.nodes[NET]:
+            self.recNet(graph, save, backToNet, backToFirstRank)
+            return
+        # Intra-node only
+        if graph.pattern == PATTERN_NVLS:
+            self.tryGpu(graph, save, 0, backToNet, backToFirstRank, 0, -1, -1, graph.nChannels)
+            return
+        if graph.nChannels == 0:
+            # Try PCI order first
+            self.tryGpu(graph, save, 0, backToNet, backToFirstRank, FORCED_ORDER_PCI, -1, -1, 0)
+        else:
+            # Also try to replay previous channel
+            g = self.replayGetGpu(graph, -1)
+            self.tryGpu(graph, save, 0, backToNet, backToFirstRank, FORCED_ORDER_REPLAY, -1, -1, g)
+        if graph.sameChannels == 0 or graph.nChannels == 0:
+            # Finally, try all other possibilities
+            for g in range(self.ngpus):
+                self.tryGpu(graph, save, 0, backToNet, backToFirstRank, 0, -1, -1, g)
+
+
+def compareGraphs(system, graph, refGraph):
+    """Whether graph is better than refGraph"""
+    # 1. Try to get the same nChannels between Rings and Trees
+    if graph.nChannels < graph.minChannels:
+        return False
+    if graph.pattern == PATTERN_NVLS:
+        # NVLS channels correspond to GPUs pulling from NVLS, the more the better
+        return refGraph.nChannels < graph.nChannels <= len(system.nodes[GPU])
+    # 2. Try to get better bandwidth, with a 15% bonus to paths not crossing NICs
+    target = 1.0 - (refGraph.crossNic - graph.crossNic) * .15
+    bw, refBw = f32(graph.nChannels * graph.bwIntra), f32(refGraph.nChannels * refGraph.bwIntra) * target
+    if bw > refBw:
+        return True
+    if bw < refBw:
+        return False
+    # 3. Less hops
+    return graph.pattern == refGraph.pattern and graph.crossNic == refGraph.crossNic and \
+        graph.nHops < refGraph.nHops
+
+
+def computeGraph(system, graph, options):
+    """Search graph on system, as ncclTopoCompute()"""
+    search = Search(system)
+    ngpus = search.ngpus
+    hasNet = bool(system.nodes[NET])
+    graph.crossNic = options.crossNic
+    crossNic = 1 if len(system.nodes[NET]) > 1 and graph.crossNic and \
+        graph.pattern in (PATTERN_RING, PATTERN_BALANCED_TREE, PATTERN_SPLIT_TREE) else 0
+    graph.bwIntra = graph.bwInter = 0.0
+    graph.latencyInter = 0.0
+    if graph.crossNic == 2:
+        graph.crossNic = 0
+    graph.typeIntra = PATH_LOC if ngpus == 1 else PATH_NVL
+    graph.typeInter = PATH_PIX
+    graph.nChannels = 0
+    trySameChannels = 0 if graph.pattern == PATTERN_NVLS else 1
+    graph.sameChannels = trySameChannels
+
+    ccMin, _ = system.compCap()
+    if graph.pattern == PATTERN_NVLS and (not system.nodes[NVS] or ccMin < 90):
+        return graph
+    if ngpus == 1 and graph.pattern != PATTERN_RING:
+        graph.pattern = PATTERN_TREE
+    if not hasNet and graph.pattern == PATTERN_NVLS:
+        # Force intra-node NVLS algorithm to pull evenly from all GPUs
+        graph.minChannels = graph.maxChannels = ngpus
+
+    tmpGraph = graph.copy()
+
+    # First try crossnic, then decrease bw and finally increase bwIntra
+    if not hasNet:
+        speedArray = sm90SpeedArrayIntra if ccMin >= 90 else speedArrayIntra
+    else:
+        speedArray = sm90SpeedArrayInter if ccMin >= 90 else speedArrayInter
+    nspeeds = len(speedArray)
+    passNum = 1
+    speedIndex = 0
+    maxBw = system.maxBw
+    totalBw = system.totalBw
+    if ngpus == 1 or graph.pattern != PATTERN_RING:
+        totalBw *= ngpus * 1.0 / (ngpus - 1) if ngpus > 1 else float("inf")
+    while (speedArray[speedIndex] > maxBw or speedArray[speedIndex] * graph.minChannels > totalBw) and \
+            speedIndex < nspeeds - 1:
+        speedIndex += 1
+    tmpGraph.bwIntra = tmpGraph.bwInter = speedArray[speedIndex]
+    globalTimeout = SEARCH_GLOBAL_TIMEOUT
+
+    while True:
+        # search:
+        if tmpGraph.sameChannels:
+            time = SEARCH_TIMEOUT_SAMECHANNELS
+        else:
+            time = SEARCH_TIMEOUT_TREE if tmpGraph.pattern == PATTERN_TREE else SEARCH_TIMEOUT
+        tmpGraph.nChannels = 0
+        globalTimeout -= time
+        search.time = time
+        search.searchRec(tmpGraph, graph)
+        time = search.time
+
+        # Optimal solution, stop here
+        done = time == -1 or graph.nChannels * graph.bwInter >= system.totalBw
+        if not done and passNum == 1:
+            # First pass, we don't have a solution yet; try other options
+            if tmpGraph.sameChannels == 1:
+                tmpGraph.sameChannels = 0
+                continue
+            tmpGraph.sameChannels = trySameChannels
+
+            globalTimeout += time
+            if not (globalTimeout < 0 and graph.nChannels):
+                # Try a simpler tree
+                if ccMin >= 90 and tmpGraph.pattern == PATTERN_BALANCED_TREE:
+                    tmpGraph.pattern = PATTERN_TREE
+                    continue
+                tmpGraph.pattern = graph.pattern
+
+                maxTypeIntra = tmpGraph.typeInter if hasNet else PATH_SYS
+                if tmpGraph.typeIntra < maxTypeIntra and \
+                        (graph.nChannels == 0 or tmpGraph.typeIntra < graph.typeIntra):
+                    tmpGraph.typeIntra += 1
+                    continue
+                tmpGraph.typeIntra = PATH_LOC if ngpus == 1 else PATH_NVL
+
+                if hasNet and tmpGraph.typeInter < PATH_SYS and \
+                        (graph.nChannels == 0 or tmpGraph.typeInter < graph.typeInter or
+                         tmpGraph.typeInter < PATH_PXN):
+                    tmpGraph.typeInter += 1
+                    continue
+                tmpGraph.typeInter = PATH_PIX
+
+                if crossNic and tmpGraph.crossNic == 0:
+                    # Try again with crossNic if permitted
+                    tmpGraph.crossNic = crossNic
+                    continue
+                tmpGraph.crossNic = 0
+
+                # Decrease bw until we find a solution
+                if speedIndex < nspeeds - 1 and \
+                        (graph.nChannels == 0 or speedArray[speedIndex + 1] / graph.bwInter > .49):
+                    speedIndex += 1
+                    tmpGraph.bwInter = tmpGraph.bwIntra = speedArray[speedIndex]
+                    continue
+                speedIndex = 0
+                while speedArray[speedIndex] > maxBw and speedIndex < nspeeds - 1:
+                    speedIndex += 1
+                tmpGraph.bwIntra = tmpGraph.bwInter = speedArray[speedIndex]
+
+        # done: we have a solution, start from it and move to pass 2
+        if passNum == 1:
+            time = -1
+            tmpGraph = graph.copy()
+            speedIndex = 0
+            while speedArray[speedIndex] > graph.bwInter and speedIndex < nspeeds - 1:
+                speedIndex += 1
+            tmpGraph.bwIntra = tmpGraph.bwInter = speedArray[speedIndex]
+            tmpGraph.minChannels = graph.nChannels
+            passNum = 2
+
+        # 3. See if we can increase bwIntra for trees (2 nodes or collnet)
+        if time != 0 and graph.pattern != PATTERN_RING and tmpGraph.bwIntra == graph.bwIntra and \
+                tmpGraph.bwIntra < tmpGraph.bwInter * 2 and speedIndex > 0:
+            speedIndex -= 1
+            tmpGraph.bwIntra = speedArray[speedIndex]
+            continue
+        break
+
+    if graph.nChannels == 0 and graph.collNet == 0 and graph.pattern != PATTERN_NVLS:
+        # Could not find a path, fall back to simple order
+        for i, gpu in enumerate(system.nodes[GPU]):
+            graph.intra[i] = gpu.rank
+        graph.inter[0] = graph.inter[1] = 0
+        graph.bwIntra = graph.bwInter = f32(0.1)
+        graph.typeIntra = graph.typeInter = PATH_SYS
+        graph.nChannels = 1
+
+    if graph.nChannels == 0 or graph.pattern == PATTERN_NVLS or graph.bwIntra < 25.0:
+        return graph
+    if ccMin > 80 and graph.bwIntra < 50.0 and graph.nChannels > 4:
+        return graph
+
+    # Duplicate channels
+    dupChannels = min(graph.nChannels * 2, graph.maxChannels)
+    n = graph.nChannels
+    graph.intra[n * ngpus:dupChannels * ngpus] = graph.intra[:(dupChannels - n) * ngpus]
+    graph.inter[n * 2:dupChannels * 2] = graph.inter[:(dupChannels - n) * 2]
+    div = (dupChannels + n - 1) // n
+    graph.bwIntra = f32(graph.bwIntra / div)
+    graph.bwInter = f32(graph.bwInter / div)
+    graph.nChannels = dupChannels
+    return graph
+
+
+def computeGraphs(system, options, collNet=False, nvls=None):
+    """Ring, tree, CollNet and NVLS graphs, as initTransportsRank()"""
+    ring = computeGraph(system, Graph(0, PATTERN_RING, 0, 1, MAXCHANNELS // 2), options)
+    tree = computeGraph(system, Graph(1, PATTERN_BALANCED_TREE, 0, ring.nChannels, ring.nChannels), options)
+    collNetGraph = Graph(2, PATTERN_TREE, 1, ring.nChannels, ring.nChannels)
+    if collNet:
+        computeGraph(system, collNetGraph, options)
+    nvlsGraph = Graph(3, PATTERN_NVLS, 0, 1, MAXCHANNELS)
+    if nvls is None:
+        # ncclNvlsInit() also needs multicast support, which is unknown offline
+        nvls = options.nvlsEnable != 0 and len(system.nodes[GPU]) > 2
+    if nvls:
+        computeGraph(system, nvlsGraph, options)
+    return [ring, tree, collNetGraph, nvlsGraph]
+
+
+# Graph XML (NCCL_GRAPH_FILE)
+
+def graphsToXml(system, graphs):
+    """<graphs> of graphs, as ncclTopoGetXmlFromGraphs()"""
+    ngpus = len(system.nodes[GPU])
+    devOfRank = {gpu.rank: gpu.dev for gpu in system.nodes[GPU]}
+    root = ET.Element("graphs", version="%d" % GRAPH_XML_VERSION)
+    for graph in graphs:
+        xmlGraph = ET.SubElement(root, "graph")
+        for key, value in (("id", graph.id), ("pattern", graph.pattern), ("crossnic", graph.crossNic),
+                           ("nchannels", graph.nChannels)):
+            xmlGraph.set(key, "%d" % value)
+        for key, value in (("speedintra", graph.bwIntra), ("speedinter", graph.bwInter),
+                           ("latencyinter", graph.latencyInter)):
+            xmlGraph.set(key, "%g" % value)
+        xmlGraph.set("typeintra", pathTypeStr[graph.typeIntra])
+        xmlGraph.set("typeinter", pathTypeStr[graph.typeInter])
+        xmlGraph.set("samechannels", "%d" % graph.sameChannels)
+        for c in range(graph.nChannels):
+            channel = ET.SubElement(xmlGraph, "channel")
+            if system.nodes[NET]:
+                ET.SubElement(channel, "net", dev="%d" % graph.inter[2 * c])
+            for rank in graph.intra[c * ngpus:(c + 1) * ngpus]:
+                if rank not in devOfRank:
+                    raise ValueError("graph %d channel %d: rank %d not found" % (graph.id, c, rank))
+                ET.SubElement(channel, "gpu", dev="%d" % devOfRank[rank])
+            if system.nodes[NET]:
+                ET.SubElement(channel, "net", dev="%d" % graph.inter[2 * c + 1])
+    return root
+
+
+def dumpXml(elem, indent=0):
+    """Text of elem in the layout of ncclTopoDumpXmlToFile()"""
+    lines = []
+    attrs = "".join(' %s="%s"' % (k, v) for k, v in elem.attrib.items())
+    children = list(elem)
+    if not children:
+        lines.append("%s<%s%s/>" % (" " * indent, elem.tag, attrs))
+    else:
+        lines.append("%s<%s%s>" % (" " * indent, elem.tag, attrs))
+        for child in children:
+            lines.append(dumpXml(child, indent + 2))
+        lines.append("%s</%s>" % (" " * indent, elem.tag))
+    return "\n".join(lines)
+
+
+def parseGraphs(root):
+    """[{graph attributes, "channels": [[(tag, dev)]]}] of a <graphs> element"""
+    if root.tag != "graphs":
+        raise ValueError("no <graphs> in the graph XML")
+    version = attrInt(root, "version", 0)
+    if version != GRAPH_XML_VERSION:
+        raise ValueError("XML graph has version %d, %d needed" % (version, GRAPH_XML_VERSION))
+    graphs = []
+    for xmlGraph in root:
+        if xmlGraph.tag != "graph":
+            continue
+        graph = {key: attrInt(xmlGraph, key) for key in ("id", "pattern", "crossnic", "nchannels",
+                                                         "samechannels")}
+        for key in ("speedintra", "speedinter"):
+            graph[key] = float(attr(xmlGraph, key))
+        graph["latencyinter"] = float(xmlGraph.get("latencyinter", "0"))
+        for key in ("typeintra", "typeinter"):
+            graph[key] = attr(xmlGraph, key)
+            if graph[key] not in kvDictLinkType:
+                raise ValueError("graph %d: unknown %s %s" % (graph["id"], key, graph[key]))
+        graph["channels"] = [[(sub.tag, attrInt(sub, "dev")) for sub in channel]
+                             for channel in xmlGraph if channel.tag == "channel"]
+        graphs.append(graph)
+    return graphs
+
+
+def validateGraphs(root, graphs, allGpus=False):
+    """Problems of parsed graphs when loaded on the topology root: devices
+    that do not exist, channels that do not visit every GPU once, and
+    channels whose bandwidth the topology cannot carry"""
+    options = Options()
+    problems = []
+    # Graphs searched for a single node do not use the network
+    nnodes = 2 if any(tag == "net" for g in graphs for c in g["channels"] for tag, _ in c) else 1
+    for graph in graphs:
+        name = "graph %d" % graph["id"]
+        if len(graph["channels"]) != graph["nchannels"]:
+            problems.append("%s: %d channels, nchannels is %d" % (name, len(graph["channels"]), graph["nchannels"]))
+        if not graph["channels"]:
+            continue
+        # Every graph takes bandwidth from a fresh system, as in the library
+        system = prepareSystem(root, options, nnodes, allGpus)
+        devs = {gpu.dev: g for g, gpu in enumerate(system.nodes[GPU])}
+        netIds = {net.id: n for n, net in enumerate(system.nodes[NET])}
+        channels = []
+        for c, channel in enumerate(graph["channels"]):
+            gpus = [dev for tag, dev in channel if tag == "gpu"]
+            nets = [dev for tag, dev in channel if tag == "net"]
+            unknown = ["GPU/%d" % d for d in gpus if d not in devs] + \
+                ["NET/%d" % d for d in nets if d not in netIds]
+            if unknown:
+                problems.append("%s channel %d: no %s in the topology" % (name, c, ", ".join(unknown)))
+            elif len(gpus) != len(devs):
+                problems.append("%s channel %d: %d GPUs, %d in the topology" % (name, c, len(gpus), len(devs)))
+            elif graph["pattern"] != PATTERN_NVLS and sorted(gpus) != sorted(devs):
+                # NVLS channels only name the GPU they start from
+                problems.append("%s channel %d: visits GPUs %s, not each of %s once" % (name, c, gpus, sorted(devs)))
+            elif len(nets) != (2 if netIds else 0):
+                problems.append("%s channel %d: %d nets" % (name, c, len(nets)))
+            else:
+                channels.append((c, [devs[d] for d in gpus], [netIds[d] for d in nets]))
+        if len(channels) == len(graph["channels"]) and graph["pattern"] != PATTERN_NVLS:
+            problems.extend("%s %s" % (name, p) for p in replayChannels(system, graph, channels))
+    return problems
+
+
+def replayChannels(system, graph, channels):
+    """Take the bandwidth of channels from system in the order of the
+    search; problems of the channels that do not fit"""
+    g = Graph(graph["id"], graph["pattern"])
+    g.crossNic = graph["crossnic"]
+    g.bwIntra, g.bwInter = f32(graph["speedintra"]), f32(graph["speedinter"])
+    g.typeIntra, g.typeInter = kvDictLinkType[graph["typeintra"]], kvDictLinkType[graph["typeinter"]]
+    search = Search(system)
+    ngpus = search.ngpus
+    problems = []
+    for c, gpus, nets in channels:
+        backToNet, backToFirstRank = searchParams(system, g.pattern)
+        hops = []
+        if nets:
+            bw = int(g.bwInter)
+            net = system.nodes[NET][nets[0]]
+            if net.bw < bw:
+                problems.append("channel %d: NET/%d has %g GB/s left, %d needed" % (c, net.id, net.bw, bw))
+                continue
+            for m in system.nodes[NET]:
+                if m.asic == net.asic and m.port == net.port:
+                    m.bw = f32(m.bw - bw)
+            hops.append((NET, nets[0], GPU, gpus[0], g.bwInter))
+        for step, gpu in enumerate(gpus):
+            if step == backToNet:
+                bwInter = g.bwInter
+                if g.pattern == PATTERN_BALANCED_TREE:
+                    bwInter = f32(bwInter / 2)
+                    if step == 0:
+                        backToNet = 1
+                hops.append((GPU, gpu, NET, nets[1], bwInter))
+            if step < ngpus - 1:
+                hops.append((GPU, gpu, GPU, gpus[step + 1], g.bwIntra))
+            elif step == backToFirstRank:
+                hops.append((GPU, gpu, GPU, gpus[0], g.bwIntra))
+        for type1, index1, type2, index2, bw in hops:
+            saved = g.bwInter
+            g.bwInter = bw
+            reached = search.followPath(g, type1, index1, type2, index2, 1)
+            g.bwInter = saved
+            if reached is None:
+                src, dst = system.nodes[type1][index1], system.nodes[type2][index2]
+                path = src.paths[type2][index2]
+                problems.append("channel %d: %s -> %s (%s) cannot carry %g GB/s" % (
+                    c, describe(src), describe(dst), pathTypeStr[path.type], bw))
+                break
+    return problems
+
+
+def describe(node):
+    if node.type == GPU:
+        return "GPU/%d" % node.dev
+    if node.type == NET:
+        return "NET/%d" % node.id
+    return repr(node)
+
+
+# SKUs and reports
+
+def skuKey(root):
+    """Hash of the structure of a topology, without its per-host attributes"""
+    def canon(elem):
+        keys = skuAttrs.get(elem.tag, ())
+        attrs = ",".join("%s=%s" % (k, elem.get(k)) for k in keys if elem.get(k) is not None)
+        return "<%s %s>%s</>" % (elem.tag, attrs, "".join(canon(sub) for sub in elem))
+    return hashlib.sha1(canon(root).encode()).hexdigest()[:12]
+
+
+def loadXml(filename):
+    try:
+        return ET.parse(filename).getroot()
+    except ET.ParseError as e:
+        raise ValueError("%s: %s" % (filename, e))
+
+
+def labelFiles(specs):
+    """[(label, filename)] of LABEL=FILE or FILE arguments (labeled by name)"""
+    files = []
+    for spec in specs:
+        label, sep, filename = spec.partition("=")
+        if not sep or os.path.exists(spec):
+            filename = spec
+            label = os.path.basename(spec)
+            for ext in (".xml", ".topo", ".graph"):
+                if label.endswith(ext):
+                    label = label[:-len(ext)]
+        files.append((label, filename))
+    return files
+
+
+def graphSummary(graph):
+    return "%s: %d channels x %g/%g GB/s, %s/%s%s" % (
+        patternStr.get(graph["pattern"], graph["pattern"]), graph["nchannels"], graph["speedintra"],
+        graph["speedinter"], graph["typeintra"], graph["typeinter"],
+        ", crossnic" if graph["crossnic"] == 1 else "")
+
+
+def channelText(channel):
+    return " ".join("%s/%d" % (tag.upper(), dev) for tag, dev in channel)
+
+
+def printPaths(system):
+    print("maxBw %g totalBw %g" % (system.maxBw, system.totalBw))
+    for src in (GPU, NET):
+        for node in system.nodes[src]:
+            cols = []
+            for dst in (GPU, NET):
+                for index, path in enumerate(node.paths.get(dst, [])):
+                    target = system.nodes[dst][index]
+                    cols.append("%s %s %g" % (describe(target), pathTypeStr[path.type], path.bw))
+            print("%s%s: %s" % (describe(node), " (rank %d)" % node.rank if src == GPU else "",
+                                ", ".join(cols)))
+
+
+def printGraphs(graphs):
+    for graph in graphs:
+        print("%s (id %d) %s" % (graphNames[graph["id"]] if graph["id"] < len(graphNames) else "graph",
+                                 graph["id"], graphSummary(graph)))
+        for c, channel in enumerate(graph["channels"]):
+            print("  %2d : %s" % (c, channelText(channel)))
+
+
+def searchedGraphs(root, options, args):
+    system = prepareSystem(root, options, args.nnodes, args.all_gpus)
+    graphs = computeGraphs(system, options, args.collnet, True if args.nvls else None)
+    return system, graphsToXml(system, graphs)
+
+
+def emit(args, options):
+    """Search once per SKU, write <sku>.xml, and validate it on every host"""
+    skus = {}
+    for label, filename in labelFiles(args.topologies):
+        root = loadXml(filename)
+        skus.setdefault(skuKey(root), []).append((label, filename, root))
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    manifest = {}
+    failed = False
+    for sku, hosts in sorted(skus.items()):
+        label, filename, root = hosts[0]
+        system, graphsXml = searchedGraphs(root, options, args)
+        graphFile = os.path.join(args.output_dir, "%s.xml" % sku)
+        with open(graphFile, "w") as f:
+            f.write(dumpXml(graphsXml) + "\n")
+        graphs = parseGraphs(loadXml(graphFile))
+        problems = {}
+        for hostLabel, _, hostRoot in hosts:
+            hostProblems = validateGraphs(hostRoot, graphs, args.all_gpus)
+            if hostProblems:
+                problems[hostLabel] = hostProblems
+        failed = failed or bool(problems)
+        manifest[sku] = {
+            "graphFile": graphFile,
+            "searchedOn": label,
+            "gpus": len(system.nodes[GPU]),
+            "nets": len(system.nodes[NET]),
+            "hosts": [h[0] for h in hosts],
+            "graphs": [graphSummary(g) for g in graphs if g["nchannels"]],
+            "problems": problems,
+        }
+        print("%s: %d hosts, %d GPUs, %d NICs -> %s%s" % (
+            sku, len(hosts), len(system.nodes[GPU]), len(system.nodes[NET]), graphFile,
+            "" if not problems else " (INVALID on %d hosts)" % len(problems)))
+        for g in graphs:
+            if g["nchannels"]:
+                print("    %s" % graphSummary(g))
+        for host, hostProblems in sorted(problems.items()):
+            for p in hostProblems:
+                print("    %s: %s" % (host, p))
+    with open(os.path.join(args.output_dir, "skus.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return 1 if failed else 0
+
+
+def graphKey(graphs):
+    return tuple((g["id"], g["pattern"], g["crossnic"], g["nchannels"], g["speedintra"], g["speedinter"],
+                  g["typeintra"], g["typeinter"], g["samechannels"],
+                  tuple(tuple(c) for c in g["channels"])) for g in sorted(graphs, key=lambda g: g["id"]))
+
+
+def graphDiff(graphs, reference):
+    """Lines describing how graphs differ from reference"""
+    lines = []
+    ref = {g["id"]: g for g in reference}
+    cur = {g["id"]: g for g in graphs}
+    for id_ in sorted(set(ref) | set(cur)):
+        a, b = ref.get(id_), cur.get(id_)
+        name = graphNames[id_] if id_ < len(graphNames) else "graph %d" % id_
+        if a is None or b is None:
+            lines.append("%s: %s" % (name, "missing" if b is None else "not in the majority"))
+            continue
+        for key in ("pattern", "crossnic", "nchannels", "speedintra", "speedinter", "typeintra",
+                    "typeinter", "samechannels"):
+            if a[key] != b[key]:
+                lines.append("%s: %s %s (majority: %s)" % (name, key, b[key], a[key]))
+        for c in range(max(len(a["channels"]), len(b["channels"]))):
+            ca = a["channels"][c] if c < len(a["channels"]) else []
+            cb = b["channels"][c] if c < len(b["channels"]) else []
+            if ca != cb:
+                lines.append("%s channel %d: %s (majority: %s)" % (
+                    name, c, channelText(cb) or "-", channelText(ca) or "-"))
+    return lines
+
+
+def diff(args, options):
+    """Group nodes by the graphs they chose; report how the others differ"""
+    groups = {}
+    searched = {}
+    for label, filename in labelFiles(args.files):
+        root = loadXml(filename)
+        if root.tag == "system" or root.find(".//system") is not None:
+            # A topology: compare the graphs the search chooses on it, once per SKU
+            sku = skuKey(root)
+            if sku not in searched:
+                searched[sku] = searchedGraphs(root, options, args)[1]
+            root = searched[sku]
+        graphs = parseGraphs(root)
+        entry = groups.setdefault(graphKey(graphs), (graphs, []))
+        entry[1].append(label)
+    ordered = sorted(groups.values(), key=lambda g: (-len(g[1]), sorted(g[1])))
+    if args.json:
+        print(json.dumps([{"nodes": labels,
+                           "graphs": [graphSummary(g) for g in graphs if g["nchannels"]],
+                           "diff": graphDiff(graphs, ordered[0][0]) if i else []}
+                          for i, (graphs, labels) in enumerate(ordered)], indent=2))
+    else:
+        print("%d nodes, %d distinct graph sets" % (sum(len(l) for _, l in ordered), len(ordered)))
+        for i, (graphs, labels) in enumerate(ordered):
+            names = ", ".join(sorted(labels)[:8]) + (", ..." if len(labels) > 8 else "")
+            if i == 0:
+                print("\nmajority: %d nodes (%s)" % (len(labels), names))
+                for g in graphs:
+                    if g["nchannels"]:
+                        print("    %s" % graphSummary(g))
+                continue
+            print("\ngroup %d: %d nodes (%s)" % (i, len(labels), names))
+            for line in graphDiff(graphs, ordered[0][0]):
+                print("    %s" % line)
+    return 1 if len(ordered) > 1 else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline NCCL topology, path and graph search from dumped XML")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def searchArgs(p):
+        p.add_argument("--nnodes", type=int, default=2,
+                       help="number of nodes of the job; 1 drops the network as the library does")
+        p.add_argument("--all-gpus", action="store_true",
+                       help="also use the GPUs of the XML without a rank (ranked by device)")
+        p.add_argument("--collnet", action="store_true", help="also search the CollNet graph")
+        p.add_argument("--nvls", action="store_true",
+                       help="search the NVLS graph even when NCCL_NVLS_ENABLE=0")
+
+    paths = sub.add_parser("paths", help="print the GPU and NIC paths of a topology")
+    paths.add_argument("topology", help="NCCL_TOPO_DUMP_FILE")
+    searchArgs(paths)
+
+    search = sub.add_parser("search", help="search the graphs of a topology")
+    search.add_argument("topology", help="NCCL_TOPO_DUMP_FILE")
+    search.add_argument("--output", type=str, default=None, help="write them as an NCCL_GRAPH_FILE")
+    searchArgs(search)
+
+    emitParser = sub.add_parser("emit", help="write a validated NCCL_GRAPH_FILE per machine SKU")
+    emitParser.add_argument("topologies", nargs="+", metavar="[HOST=]TOPOLOGY",
+                            help="NCCL_TOPO_DUMP_FILE of each host, named after the host or given")
+    emitParser.add_argument("--output-dir", type=str, required=True,
+                            help="directory of the <sku>.xml graph files and skus.json")
+    searchArgs(emitParser)
+
+    validate = sub.add_parser("validate", help="check a graph file against a topology")
+    validate.add_argument("topology", help="NCCL_TOPO_DUMP_FILE")
+    validate.add_argument("graph", help="NCCL_GRAPH_FILE")
+    validate.add_argument("--all-gpus", action="store_true",
+                          help="also use the GPUs of the XML without a rank (ranked by device)")
+
+    diffParser = sub.add_parser("diff", help="compare the graphs chosen on the nodes of a job")
+    diffParser.add_argument("files", nargs="+", metavar="[NODE=]FILE",
+                            help="NCCL_GRAPH_DUMP_FILE (or NCCL_TOPO_DUMP_FILE, searched) of each node")
+    diffParser.add_argument("--json", action="store_true", help="print the groups as JSON")
+    searchArgs(diffParser)
+    args = parser.parse_args()
+
+    # The search recurses once per GPU of every channel
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20000))
+    options = Options()
+    try:
+        if args.command == "paths":
+            root = loadXml(args.topology)
+            printPaths(prepareSystem(root, options, args.nnodes, args.all_gpus))
+        elif args.command == "search":
+            _, graphsXml = searchedGraphs(loadXml(args.topology), options, args)
+            printGraphs(parseGraphs(graphsXml))
+            if args.output:
+                with open(args.output, "w") as f:
+                    f.write(dumpXml(graphsXml) + "\n")
+        elif args.command == "emit":
+            return emit(args, options)
+        elif args.command == "validate":
+            problems = validateGraphs(loadXml(args.topology), parseGraphs(loadXml(args.graph)), args.all_gpus)
+            for p in problems:
+                print(p)
+            if not problems:
+                print("%s is valid on %s" % (args.graph, args.topology))
+            return 1 if problems else 0
+        elif args.command == "diff":
+            return diff(args, options)
+    except (OSError, ValueError) as e:
+        sys.exit("topograph.py: error: %s" % e)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Extract transport, ring and tree selections from NCCL debug logs, and
+flag the ranks that fell back to slower paths.
+
+With NCCL_DEBUG=INFO (and NCCL_DEBUG_FILE=<dir>/nccl.%h.%p), the INFO lines
+of the transports are the only record of which transport each channel got:
+
+    Channel 00/0 : 3[3] -> 11[3] [send] via NET/IB/3/GDRDMA
+    Channel 01/0 : 2[2] -> 3[3] via P2P/IPC/read
+    Channel 02 : 4[4] -> 5[5] via SHM/direct/direct
+
+This tool streams the logs (in parallel over files for large jobs) into
+columnar tables of communicators, connections, rings and trees, which
+--csv writes out, and reports for each communicator:
+  - SHM instead of P2P between GPUs of one host,
+  - P2P through an intermediate GPU,
+  - NET between GPUs of one host,
+  - the Socket network instead of IB (or another plugin),
+  - NET or CollNet connections without GPU Direct RDMA,
+with the ranks affected among those that could be. Fallbacks hitting only
+some ranks of a communicator are reported first: those are the ones that
+slow a whole job down without anyone having asked for them. The INFO lines
+saying why (GDR distance, P2P disabled, no IB device) are quoted when found.
+
+    ./maint/transportlog.py /shared/job42/nccl-logs
+    ./maint/transportlog.py --csv tables/ nccl.host1.* nccl.host2.*
+
+Lines carry the host, pid and thread of the rank, not its communicator: a
+connection is assigned to the communicator the thread last initialized, or
+the one of its process with the rank it names.
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import re
+import sys
+
+readChunk = 1 << 20
+
+# Below this many files a process pool costs more than it saves
+parallelScanMinFiles = 16
+
+# Ranks listed per finding in the text report
+maxListedRanks = 16
+
+# Lines of interest, found without going through every line in Python
+infoLineRegex = re.compile(
+    r" NCCL INFO (?:Channel |CollNet |Ring |Trees|comm |Using network |\d+ coll channels|GPU Direct RDMA|NET/|P2P is "
+    r"disabled)")
+headerRegex = re.compile(r"^\S+ (\S+):(\d+):(\d+) \[(-?\d+)\]")
+initRegex = re.compile(
+    r"^comm \S+ rank (\d+) nranks (\d+) cudaDev (-?\d+) nvmlDev (-?\d+) busId ([0-9a-f]+) "
+    r"commId \S+ commHash (\d+) - Init START$")
+completeRegex = re.compile(r"^comm \S+ rank (\d+) nranks (\d+) localrank \d+ localranks (\d+) .* - Init COMPLETE")
+# P2P and SHM lines are printed by the sender, NET ones by both sides
+channelRegex = re.compile(
+    r"^Channel (\d+)(?:/(\d+))? : (\d+)\[-?\d+\] -> (\d+)\[-?\d+\] (?:\[(send|receive)\] )?via (\S+(?: pointer)?\S*)$")
+collNetRegex = re.compile(r"^CollNet (\d+)/(\d+) : (\d+) \[(send|receive)\] via COLLNET/([^/]+)/(\d+)(/GDRDMA)?$")
+netViaRegex = re.compile(r"^NET/([^/]+)/(\d+)(?:\((\d+)\))?(/GDRDMA)?(/Shared)?$")
+ringRegex = re.compile(r"^Ring (\d+) : (-?\d+) -> (\d+) -> (-?\d+)$")
+treeRegex = re.compile(r" \[(\d+)\] (-?\d+)/(-?\d+)/(-?\d+)->(\d+)->(-?\d+)")
+networkRegex = re.compile(r"^Using network (\S+)$")
+channelsRegex = re.compile(r"^(\d+) coll channels, (\d+) nvls channels, (\d+) p2p channels")
+# Reasons of fallbacks, kept per process
+reasonRegexes = (
+    ("noGdr", re.compile(r"^GPU Direct RDMA Disabled for GPU .*")),
+    ("noGdr", re.compile(r"^NET/\S+ : GPU Direct RDMA Disabled for HCA .*")),
+    ("shm", re.compile(r"^P2P is disabled between connected GPUs .*")),
+    ("socket", re.compile(r"^NET/IB : No device found\.$")),
+    ("socket", re.compile(r"^NET/Plugin ?: (?:Plugin load \(.*|Failed to find ncclNetPlugin.*)$")),
+)
+
+tableColumns = {
+    "comms": ("comm", "rank", "nranks", "localRanks", "host", "pid", "cudaDev", "nvmlDev", "busId", "network",
+              "nChannels", "nvlsChannels", "p2pChannels", "file"),
+    "connections": ("comm", "rank", "channel", "connIndex", "peer", "direction", "transport", "path", "netDev",
+                    "proxyRank", "gdr", "shared", "read"),
+    "rings": ("comm", "rank", "channel", "prev", "next"),
+    "trees": ("comm", "rank", "channel", "down0", "down1", "down2", "up"),
+}
+
+fallbacks = {
+    "shm": "SHM instead of P2P",
+    "p2pIndirect": "P2P through an intermediate GPU",
+    "intraNet": "NET between GPUs of one host",
+    "socket": "Socket network",
+    "noGdr": "NET or CollNet without GPU Direct RDMA",
+}
+
+
+class Tables:
+    """Columns of each table, as lists"""
+
+    def __init__(self):
+        self.tables = {name: {c: [] for c in columns} for name, columns in tableColumns.items()}
+
+    def add(self, name, *row):
+        for column, value in zip(self.tables[name].values(), row):
+            column.append(value)
+
+    def extend(self, other):
+        for name, table in other.tables.items():
+            for column, values in table.items():
+                self.tables[name][column].extend(values)
+
+    def rows(self, name):
+        return zip(*self.tables[name].values())
+
+
+class Process:
+    """Communicators a process initialized, and the one of each thread"""
+
+    def __init__(self):
+        self.comms = []  # (commHash, rank), in order of initialization
+        self.commsRow = {}  # (commHash, rank) -> row in the comms table
+        self.threadComm = {}
+        self.reasons = {}
+
+    def commOf(self, tid, rank=None):
+        """(commHash, rank) of a line of thread tid naming rank"""
+        comm = self.threadComm.get(tid)
+        if rank is None or (comm is not None and comm[1] == rank):
+            return comm
+        for candidate in reversed(self.comms):
+            if candidate[1] == rank:
+                return candidate
+        return None
+
+
+def parseVia(via):
+    """(transport, path, netDev, proxyRank, gdr, shared, read) of a "via" string"""
+    read = int("/read" in via)
+    if via.startswith("NET/"):
+        m = netViaRegex.match(via)
+        if m is None:
+            return "NET", via, -1, -1, -1, 0, 0
+        return ("NET", "NET/" + m.group(1), int(m.group(2)), int(m.group(3)) if m.group(3) else -1,
+                int(m.group(4) is not None), int(m.group(5) is not None), 0)
+    if via.startswith("P2P/indirect/"):
+        return "P2P", "P2P/indirect", -1, -1, -1, 0, read
+    if via.startswith("P2P/"):
+        kind = via.split("/")[1]
+        return "P2P", "P2P/" + ("direct" if kind.startswith("direct") else kind), -1, -1, -1, 0, read
+    if via.startswith("SHM/"):
+        return "SHM", via, -1, -1, -1, 0, 0
+    return via.split("/")[0], via, -1, -1, -1, 0, 0
+
+
+def iterInfoLines(f, nLines):
+    """INFO lines of f that scanFile() parses, found a chunk at a time;
+    adds the number of lines read to nLines[0]"""
+    tail = ""
+    while True:
+        chunk = f.read(readChunk)
+        if not chunk:
+            break
+        end = chunk.rfind("\n")
+        if end < 0:
+            tail += chunk
+            continue
+        buf, tail = tail + chunk[:end + 1], chunk[end + 1:]
+        nLines[0] += buf.count("\n")
+        for m in infoLineRegex.finditer(buf):
+            start = buf.rfind("\n", 0, m.start()) + 1
+            yield buf[start:buf.index("\n", m.end())]
+    if tail:
+        nLines[0] += 1
+        for m in infoLineRegex.finditer(tail):
+            yield tail[tail.rfind("\n", 0, m.start()) + 1:]
+
+
+def scanFile(filename):
+    """(Tables, {(commHash, rank): {kind: reason}}, lines) of one debug log"""
+    tables = Tables()
+    processes = {}
+    comms = tables.tables["comms"]
+    reasons = {}
+    nLines = [0]
+    with open(filename, "r", errors="replace") as f:
+        for line in iterInfoLines(f, nLines):
+            head, _, msg = line.partition(" NCCL INFO ")
+            m = headerRegex.match(head)
+            if m is None:
+                continue
+            host, pid, tid = m.group(1), int(m.group(2)), int(m.group(3))
+            proc = processes.get((host, pid))
+            if proc is None:
+                proc = processes[(host, pid)] = Process()
+
+            if msg.startswith("Channel "):
+                m = channelRegex.match(msg)
+                if m is None:
+                    # Ring orders printed by rank 0
+                    continue
+                direction = "recv" if m.group(5) == "receive" else "send"
+                src, dst = int(m.group(3)), int(m.group(4))
+                rank, peer = (dst, src) if direction == "recv" else (src, dst)
+                comm = proc.commOf(tid, rank)
+                if comm is None:
+                    continue
+                tables.add("connections", comm[0], rank, int(m.group(1)), int(m.group(2) or 0), peer, direction,
+                           *parseVia(m.group(6)))
+            elif msg.startswith("CollNet "):
+                m = collNetRegex.match(msg)
+                if m is None:
+                    continue
+                rank = int(m.group(3))
+                comm = proc.commOf(tid, rank)
+                if comm is None:
+                    continue
+                tables.add("connections", comm[0], rank, int(m.group(1)), int(m.group(2)), -1,
+                           "recv" if m.group(4) == "receive" else "send", "COLLNET", "COLLNET/" + m.group(5),
+                           int(m.group(6)), -1, int(m.group(7) is not None), 0, 0)
+            elif msg.startswith("Ring "):
+                m = ringRegex.match(msg)
+                comm = proc.commOf(tid, int(m.group(3))) if m else None
+                if comm is not None:
+                    tables.add("rings", comm[0], comm[1], int(m.group(1)), int(m.group(2)), int(m.group(4)))
+            elif msg.startswith("Trees"):
+                for m in treeRegex.finditer(msg):
+                    comm = proc.commOf(tid, int(m.group(5)))
+                    if comm is not None:
+                        tables.add("trees", comm[0], comm[1], int(m.group(1)), int(m.group(2)), int(m.group(3)),
+                                   int(m.group(4)), int(m.group(6)))
+            elif msg.startswith("comm "):
+                m = initRegex.match(msg)
+                if m is not None:
+                    rank, commHash = int(m.group(1)), m.group(6)
+                    key = (commHash, rank)
+                    proc.comms.append(key)
+                    proc.threadComm[tid] = key
+                    proc.commsRow[key] = len(comms["comm"])
+                    tables.add("comms", commHash, rank, int(m.group(2)), -1, host, pid, int(m.group(3)),
+                               int(m.group(4)), m.group(5), "", -1, -1, -1, filename)
+                    reasons[key] = proc.reasons
+                    continue
+                m = completeRegex.match(msg)
+                comm = proc.commOf(tid, int(m.group(1))) if m else None
+                if comm is not None:
+                    comms["localRanks"][proc.commsRow[comm]] = int(m.group(3))
+            elif msg.startswith("Using network "):
+                m = networkRegex.match(msg)
+                comm = proc.commOf(tid)
+                if m and comm is not None:
+                    comms["network"][proc.commsRow[comm]] = m.group(1)
+            elif " coll channels, " in msg:
+                m = channelsRegex.match(msg)
+                comm = proc.commOf(tid)
+                if m and comm is not None:
+                    row = proc.commsRow[comm]
+                    comms["nChannels"][row] = int(m.group(1))
+                    comms["nvlsChannels"][row] = int(m.group(2))
+                    comms["p2pChannels"][row] = int(m.group(3))
+            else:
+                for kind, regex in reasonRegexes:
+                    if regex.match(msg):
+                        proc.reasons.setdefault(kind, msg)
+                        break
+    return tables, reasons, nLines[0]
+
+
+def findFiles(paths):
+    """Debug logs in paths (dirs or files)"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as it:
+                files.extend(e.path for e in it if e.is_file())
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def scanLogs(paths, jobs=1):
+    """(Tables, reasons, files, lines) of all the logs in paths"""
+    files = findFiles(paths)
+    tables, reasons, nLines = Tables(), {}, 0
+
+    def merge(scanned):
+        nonlocal nLines
+        for t, r, n in scanned:
+            tables.extend(t)
+            reasons.update(r)
+            nLines += n
+
+    if jobs > 1 and len(files) >= parallelScanMinFiles:
+        chunksize = max(1, len(files) // (jobs * 8))
+        with multiprocessing.Pool(jobs) as pool:
+            merge(pool.imap_unordered(scanFile, files, chunksize))
+    else:
+        merge(map(scanFile, files))
+    return tables, reasons, len(files), nLines
+
+
+def connectionFallbacks(transport, path, gdr, intraHost, network):
+    """(kinds of fallback, kinds that could apply) of one connection"""
+    if transport == "SHM":
+        return ("shm",), ("shm", "p2pIndirect")
+    if transport == "P2P":
+        return ("p2pIndirect",) if path == "P2P/indirect" else (), ("shm", "p2pIndirect")
+    if transport in ("NET", "COLLNET"):
+        found = []
+        if intraHost:
+            found.append("intraNet")
+        if network == "Socket":
+            found.append("socket")
+        if gdr == 0:
+            found.append("noGdr")
+        applicable = ("intraNet", "noGdr", "socket") if intraHost else ("noGdr", "socket")
+        return tuple(found), applicable
+    return (), ()
+
+
+def findFallbacks(tables, reasons):
+    """Fallbacks per communicator, those hitting only some ranks first"""
+    comms = tables.tables["comms"]
+    hosts = {}
+    networks = {}
+    nranks = {}
+    for comm, rank, n, host, network in zip(comms["comm"], comms["rank"], comms["nranks"], comms["host"],
+                                            comms["network"]):
+        hosts[(comm, rank)] = host
+        nranks[comm] = n
+        if network:
+            networks[(comm, rank)] = network
+
+    affected = {}
+    applicable = {}
+    conns = tables.tables["connections"]
+    for comm, rank, peer, transport, path, gdr in zip(conns["comm"], conns["rank"], conns["peer"],
+                                                       conns["transport"], conns["path"], conns["gdr"]):
+        key = (comm, rank)
+        host = hosts.get(key)
+        intraHost = peer >= 0 and host is not None and hosts.get((comm, peer)) == host
+        network = path[4:] if transport == "NET" else networks.get(key)
+        found, could = connectionFallbacks(transport, path, gdr, intraHost, network)
+        for kind in could:
+            applicable.setdefault((comm, kind), set()).add(rank)
+        for kind in found:
+            counts = affected.setdefault((comm, kind), {})
+            counts[rank] = counts.get(rank, 0) + 1
+
+    findings = []
+    for (comm, kind), ranks in affected.items():
+        could = applicable[(comm, kind)]
+        example = min(ranks)
+        findings.append({
+            "comm": comm,
+            "nranks": nranks.get(comm, 0),
+            "kind": kind,
+            "description": fallbacks[kind],
+            "ranks": sorted(ranks),
+            "connections": sum(ranks.values()),
+            "applicableRanks": len(could),
+            "partial": len(ranks) < len(could),
+            "hosts": sorted({hosts[(comm, r)] for r in ranks if (comm, r) in hosts}),
+            "reason": reasons.get((comm, example), {}).get(kind, ""),
+        })
+    findings.sort(key=lambda f: (not f["partial"], -f["connections"], f["comm"], f["kind"]))
+    return findings
+
+
+def rangesStr(values, limit=maxListedRanks):
+    """1,3-5,9 of sorted values, truncated after limit ranges"""
+    ranges = []
+    for v in values:
+        if ranges and v == ranges[-1][1] + 1:
+            ranges[-1][1] = v
+        else:
+            ranges.append([v, v])
+    parts = ["%d" % a if a == b else "%d-%d" % (a, b) for a, b in ranges]
+    return ",".join(parts[:limit]) + (",..." if len(parts) > limit else "")
+
+
+def summarizePaths(tables):
+    """{path: connections}, most used first (by name on ties, as files
+    scanned in parallel come in any order)"""
+    counts = {}
+    for path in tables.tables["connections"]["path"]:
+        counts[path] = counts.get(path, 0) + 1
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+def writeCsv(tables, directory):
+    os.makedirs(directory, exist_ok=True)
+    for name, columns in tableColumns.items():
+        with open(os.path.join(directory, name + ".csv"), "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(tables.rows(name))
+
+
+def printReport(report):
+    print("%d files, %d lines: %d communicators, %d ranks, %d connections" % (
+        report["files"], report["lines"], report["comms"], report["ranks"], report["connections"]))
+    for path, count in report["paths"].items():
+        print("  %-24s %8d" % (path, count))
+    if not report["fallbacks"]:
+        print("no fallbacks found")
+        return
+    print("fallbacks:")
+    for f in report["fallbacks"]:
+        print("  comm %s (%d ranks): %s on %d of %d ranks%s, %d connections" % (
+            f["comm"], f["nranks"], f["description"], len(f["ranks"]), f["applicableRanks"],
+            " (only some)" if f["partial"] else "", f["connections"]))
+        print("    rank%s %s on %s" % ("s" if len(f["ranks"]) > 1 else "", rangesStr(f["ranks"]),
+                                        ",".join(f["hosts"][:8]) + (",..." if len(f["hosts"]) > 8 else "")))
+        if f["reason"]:
+            print("    rank %d: %s" % (f["ranks"][0], f["reason"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract transport selections from NCCL debug logs and flag fallbacks")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="NCCL_DEBUG_FILE logs, or directories of them",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes used to scan the logs",
+    )
+    parser.add_argument("--csv", metavar="DIR", help="write the comms, connections, rings and trees tables")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the report as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        tables, reasons, nFiles, nLines = scanLogs(args.paths, args.jobs)
+        if args.csv:
+            writeCsv(tables, args.csv)
+    except (OSError, ValueError) as e:
+        sys.exit("transportlog.py: error: %s" % e)
+    comms = tables.tables["comms"]
+    report = {
+        "files": nFiles,
+        "lines": nLines,
+        "comms": len(set(comms["comm"])),
+        "ranks": len(comms["comm"]),
+        "connections": len(tables.tables["connections"]["comm"]),
+        "paths": summarizePaths(tables),
+        "fallbacks": findFallbacks(tables, reasons),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        printReport(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Benchmark a tuner plugin and check it against the tuner interface, on CPU.
+
+Loads a library exporting ncclTunerPlugin_v1 as ncclLoadTunerPlugin() does
+(dlopen of NCCL_TUNER_PLUGIN, then dlsym), initializes it as a communicator
+of --nranks/--nnodes would, and drives it with synthetic queries over
+collectives, message sizes, CollNet/NVLS support and numPipeOps:
+
+    ./maint/tunerbench.py ext-tuner/table/libnccl-tuner-table.so --queries 1000000
+    NCCL_TUNER_TABLE_FILE=h100.tune ./maint/tunerbench.py libnccl-tuner-table.so --nranks 16
+
+Each phase runs in its own process, with fresh plugin state, so that a crash
+is reported against the phase that caused it:
+  - calls: every query from one thread, timing each getCollInfo() call; the
+    first queries are asked again to check that the answers are the same,
+  - online: getCollInfo() with an addOnlineResult() after every collective,
+    as CollTrace does (skipped when the plugin has none),
+  - threads: --threads threads, each initializing its own "communicator",
+    asking queries (and adding online results) concurrently.
+
+getCollInfo() runs on the enqueue path of every collective. Call latencies
+include the cost of the ctypes call; the same prototype bound to a trivial
+libc function is timed as a baseline, to tell them apart.
+
+Errors break collectives in this tree: a return code other than ncclSuccess
+(getAlgoInfo() fails the collective, it does not fall back), an algorithm
+without a protocol or the reverse, out of range outputs, CollNet or NVLS
+when the communicator does not support them, and protocols other than Simple
+with CollNet or NVLS. Warnings are algorithms getPatternInfo() has no
+pattern for (besides AllReduce, only Ring, and NVLS for AllGather and
+ReduceScatter) and answers that change between identical queries without
+online results.
+"""
+
+import argparse
+import array
+import collections
+import ctypes
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+
+import tunetable
+
+tunerSymbol = "ncclTunerPlugin_v1"
+
+# src/include/nccl_common.h, devcomm.h
+numFunctions = 5
+numAlgorithms = 6
+numProtocols = 3
+maxChannels = 32
+algoUndef = -1
+protoUndef = -1
+algoRing = 1
+protoSimple = 2
+collNetAlgos = tunetable.collNetAlgos
+nvlsAlgos = tunetable.nvlsAlgos
+allReduce = tunetable.collIds["AllReduce"]
+# Algorithms getPatternInfo() has a pattern for, besides AllReduce
+patternAlgos = {
+    tunetable.collIds["AllGather"]: (algoUndef, algoRing, nvlsAlgos[0]),
+    tunetable.collIds["ReduceScatter"]: (algoUndef, algoRing, nvlsAlgos[0]),
+    None: (algoUndef, algoRing),
+}
+logLevels = {2: "WARN", 3: "INFO", 4: "ABORT", 5: "TRACE"}
+
+# Queries asked again for the determinism check and by the threads
+referenceQueries = 100000
+
+# Logger callbacks are variadic: only the format is kept
+LoggerType = ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.c_ulong, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p)
+InitType = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_size_t, ctypes.c_size_t, LoggerType)
+GetCollInfoType = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.c_int, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int))
+AddOnlineResultType = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.c_int, ctypes.c_size_t, ctypes.c_int64, ctypes.c_float, ctypes.c_int, ctypes.c_int,
+    ctypes.c_int, ctypes.c_int)
+DestroyType = ctypes.CFUNCTYPE(ctypes.c_int)
+
+
+class TunerV1(ctypes.Structure):
+    """ncclTuner_v1_t of src/include/nccl_tuner.h"""
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("init", InitType),
+        ("getCollInfo", GetCollInfoType),
+        ("addOnlineResult", AddOnlineResultType),
+        ("destroy", DestroyType),
+    ]
+
+
+def loadTuner(path):
+    """ncclTuner_v1_t of a plugin, looked up as ncclLoadTunerPlugin() does"""
+    try:
+        lib = ctypes.CDLL(path, mode=os.RTLD_LAZY | os.RTLD_LOCAL)
+    except OSError as e:
+        raise ValueError("plugin load '%s' failed: %s" % (path, e))
+    try:
+        tuner = TunerV1.in_dll(lib, tunerSymbol)
+    except ValueError:
+        raise ValueError("failed to find %s in plugin (%s)" % (tunerSymbol, path))
+    for field in ("init", "getCollInfo", "destroy"):
+        if not getattr(tuner, field):
+            raise ValueError("%s.%s is NULL" % (tunerSymbol, field))
+    return lib, tuner
+
+
+class Queries:
+    """Columns of synthetic getCollInfo() inputs"""
+
+    def __init__(self, count, seed, maxBytes, maxPipeOps, collNet, nvls):
+        rng = random.Random(seed)
+        self.coll, self.nBytes, self.collNet, self.nvls, self.pipeOps = (array.array("q") for _ in range(5))
+        logMax = math.log2(maxBytes)
+        for _ in range(count):
+            self.coll.append(rng.randrange(numFunctions))
+            r = rng.random()
+            if r < 0.01:
+                nBytes = 0
+            elif r < 0.1:
+                # Bucket edges
+                nBytes = max(0, (1 << rng.randrange(int(logMax) + 1)) + rng.choice((-1, 0, 1)))
+            else:
+                nBytes = int(2 ** rng.uniform(0, logMax))
+            self.nBytes.append(nBytes)
+            self.collNet.append(collNet if collNet is not None else rng.randrange(2))
+            self.nvls.append(nvls if nvls is not None else rng.randrange(2))
+            self.pipeOps.append(rng.randint(1, maxPipeOps))
+
+    def __len__(self):
+        return len(self.coll)
+
+    def get(self, i):
+        return self.coll[i], self.nBytes[i], self.collNet[i], self.nvls[i], self.pipeOps[i]
+
+
+def checkAnswer(query, rc, algorithm, protocol, nChannels, nnodes):
+    """(errors, warnings) of one getCollInfo() answer"""
+    coll, _, collNet, nvls, _ = query
+    errors, warnings = [], []
+    if rc != 0:
+        errors.append("returned %d instead of ncclSuccess" % rc)
+    if (algorithm == algoUndef) != (protocol == protoUndef):
+        errors.append("set the algorithm without the protocol, or the reverse")
+    if not -1 <= algorithm < numAlgorithms:
+        errors.append("algorithm %d out of range" % algorithm)
+    if not -1 <= protocol < numProtocols:
+        errors.append("protocol %d out of range" % protocol)
+    if not 0 <= nChannels <= maxChannels:
+        errors.append("nChannels %d out of range" % nChannels)
+    if algorithm in collNetAlgos and collNet != 1:
+        errors.append("%s without CollNet support" % tunetable.algoNames[algorithm])
+    if algorithm in nvlsAlgos and not nvls:
+        errors.append("%s without NVLS support" % tunetable.algoNames[algorithm])
+    if algorithm == nvlsAlgos[0] and nnodes > 1 and collNet != 1:
+        errors.append("NVLS across nodes without CollNet support")
+    if (algorithm in collNetAlgos or algorithm in nvlsAlgos) and protocol not in (protoSimple, protoUndef):
+        errors.append("%s with protocol %s" % (tunetable.algoNames[algorithm],
+                                               tunetable.idToName(protocol, tunetable.protoNames)))
+    known = patternAlgos.get(coll, patternAlgos[None])
+    if coll != allReduce and algorithm not in known and 0 <= algorithm < numAlgorithms:
+        warnings.append("%s for %s, which has no pattern for it" % (
+            tunetable.algoNames[algorithm], tunetable.idToName(coll, tunetable.collIds)))
+    return errors, warnings
+
+
+class Findings:
+    """Problems found, counted by message, with the first query showing each"""
+
+    def __init__(self):
+        self.counts = {"errors": collections.Counter(), "warnings": collections.Counter()}
+        self.examples = {}
+
+    def add(self, kind, messages, query):
+        for message in messages:
+            self.counts[kind][message] += 1
+            self.examples.setdefault(message, query)
+
+    def merge(self, other):
+        for kind, counts in other["counts"].items():
+            self.counts[kind].update(counts)
+        for message, query in other["examples"].items():
+            self.examples.setdefault(message, query)
+
+    def result(self):
+        return {"counts": {k: dict(v) for k, v in self.counts.items()}, "examples": self.examples}
+
+
+def percentiles(latencies):
+    values = sorted(latencies)
+    if not values:
+        return {}
+    pick = lambda q: values[min(len(values) - 1, int(len(values) * q / 100.0))] / 1000.0
+    return {"p50": pick(50), "p99": pick(99), "p99.9": pick(99.9), "max": values[-1] / 1000.0}
+
+
+class Harness:
+    """One phase, run in a child process on the loaded plugin"""
+
+    def __init__(self, tuner, queries, args):
+        self.tuner = tuner
+        self.queries = queries
+        self.args = args
+        self.logs = collections.Counter()
+        self.logger = LoggerType(self.log)
+        self.lock = threading.Lock()
+        self.getCollInfo = tuner.getCollInfo
+        self.addOnlineResult = tuner.addOnlineResult if tuner.addOnlineResult else None
+
+    def log(self, level, flags, filename, line, fmt):
+        with self.lock:
+            self.logs[(logLevels.get(level, str(level)), (fmt or b"").decode(errors="replace"))] += 1
+
+    def init(self):
+        rc = self.tuner.init(self.args.nranks, self.args.nnodes, self.logger)
+        if rc != 0:
+            raise ValueError("init(%d, %d) returned %d" % (self.args.nranks, self.args.nnodes, rc))
+
+    def destroy(self):
+        rc = self.tuner.destroy()
+        if rc != 0:
+            raise ValueError("destroy() returned %d" % rc)
+
+    def run(self, start, count, findings, timed=None, online=0, outputs=None, reference=None):
+        """Ask count queries from start; adds an online result every online
+        calls; returns the number of answers that differ from reference"""
+        algorithm, protocol, nChannels = ctypes.c_int(), ctypes.c_int(), ctypes.c_int()
+        pa, pp, pn = ctypes.pointer(algorithm), ctypes.pointer(protocol), ctypes.pointer(nChannels)
+        getCollInfo, addOnlineResult = self.getCollInfo, self.addOnlineResult
+        clock = time.perf_counter_ns
+        nnodes, n = self.args.nnodes, len(self.queries)
+        rng = random.Random(start)
+        onlineTimes = array.array("q")
+        differ = 0
+        for k in range(count):
+            i = (start + k) % n
+            query = self.queries.get(i)
+            coll, nBytes, collNet, nvls, pipeOps = query
+            # As getAlgoInfo() calls it
+            algorithm.value, protocol.value, nChannels.value = algoUndef, protoUndef, 0
+            t0 = clock()
+            rc = getCollInfo(coll, nBytes, collNet, nvls, pipeOps, pa, pp, pn)
+            t1 = clock()
+            if timed is not None:
+                timed.append(t1 - t0)
+            answer = (algorithm.value, protocol.value, nChannels.value)
+            errors, warnings = checkAnswer(query, rc, *answer, nnodes)
+            if errors or warnings:
+                findings.add("errors", errors, query)
+                findings.add("warnings", warnings, query)
+            if outputs is not None:
+                outputs.append(answer)
+            if reference is not None and i < len(reference) and reference[i] != answer:
+                differ += 1
+            if online and addOnlineResult is not None and k % online == 0:
+                # A latency growing with the size, as CollTrace would report
+                latency = (5.0 + nBytes / 2e4) * rng.uniform(0.9, 1.1) / 1000.0
+                t0 = clock()
+                rc = addOnlineResult(coll, nBytes, k, latency, answer[0], answer[1], answer[2] or 1, 512)
+                onlineTimes.append(clock() - t0)
+                if rc != 0:
+                    findings.add("errors", ["addOnlineResult() returned %d" % rc], query)
+        return differ, onlineTimes
+
+
+def phaseCalls(harness, args):
+    findings = Findings()
+    timed = array.array("q")
+    outputs = []
+    harness.init()
+    harness.run(0, len(harness.queries), findings, timed=timed, outputs=outputs)
+    # Ask again: without online results, the answers should not change
+    reference = outputs[:referenceQueries]
+    differ, _ = harness.run(0, len(reference), Findings(), reference=reference)
+    harness.destroy()
+
+    # The same prototype on a trivial function: the cost of ctypes itself
+    libc = ctypes.CDLL(None)
+    baseline = GetCollInfoType(ctypes.cast(libc.labs, ctypes.c_void_p).value)
+    harness.getCollInfo = baseline
+    baselineTimed = array.array("q")
+    harness.run(0, min(len(harness.queries), referenceQueries), Findings(), timed=baselineTimed)
+
+    answered = sum(1 for a in outputs if a[0] != algoUndef)
+    withChannels = sum(1 for a in outputs if a[2] > 0)
+    if differ:
+        findings.add("warnings", ["%d answers changed when asked again" % differ], harness.queries.get(0))
+    return {
+        "calls": len(outputs),
+        "latencyUs": percentiles(timed),
+        "baselineUs": percentiles(baselineTimed),
+        "answered": answered,
+        "withChannels": withChannels,
+        "answers": dict(collections.Counter(
+            tunetable.candidateStr(*a) for a in outputs if a[0] != algoUndef).most_common(8)),
+        "findings": findings.result(),
+        "reference": reference,
+    }
+
+
+def phaseOnline(harness, args):
+    findings = Findings()
+    timed = array.array("q")
+    harness.init()
+    _, onlineTimes = harness.run(0, len(harness.queries), findings, timed=timed, online=1)
+    harness.destroy()
+    return {
+        "calls": len(harness.queries),
+        "latencyUs": percentiles(timed),
+        "onlineLatencyUs": percentiles(onlineTimes),
+        "findings": findings.result(),
+    }
+
+
+def phaseThreads(harness, args, reference):
+    """Threads asking (and adding results) concurrently; ctypes releases the
+    GIL during each call, so plugin code overlaps"""
+    perThread = max(1, len(harness.queries) // args.threads)
+    barrier = threading.Barrier(args.threads)
+    results = [None] * args.threads
+    online = 1 if harness.addOnlineResult is not None else 0
+
+    def worker(t):
+        findings = Findings()
+        try:
+            harness.init()
+            barrier.wait()
+            # Without online results, every thread should get the reference answers
+            ref = reference if not online else None
+            differ, _ = harness.run(t * perThread, perThread, findings, online=online, reference=ref)
+            barrier.wait()
+            harness.destroy()
+            results[t] = (differ, findings.result(), None)
+        except Exception as e:
+            barrier.abort()
+            results[t] = (0, findings.result(), str(e))
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    findings = Findings()
+    differ = 0
+    for d, f, error in results:
+        differ += d
+        findings.merge(f)
+        if error:
+            findings.add("errors", [error], None)
+    if differ:
+        findings.add("warnings", ["%d answers differed from the single-thread ones" % differ], None)
+    return {
+        "threads": args.threads,
+        "calls": perThread * args.threads,
+        "callsPerSec": perThread * args.threads / elapsed if elapsed > 0 else 0.0,
+        "findings": findings.result(),
+    }
+
+
+def runPhase(name, tuner, queries, args, *extra):
+    """Result of a phase run in a child process, or of its crash"""
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+
+    def child():
+        harness = Harness(tuner, queries, args)
+        try:
+            result = {"calls": phaseCalls, "online": phaseOnline, "threads": phaseThreads}[name](
+                harness, args, *extra)
+        except ValueError as e:
+            findings = Findings()
+            findings.add("errors", [str(e)], None)
+            result = {"findings": findings.result()}
+        result["logs"] = [[level, fmt, count] for (level, fmt), count in harness.logs.most_common()]
+        sender.send(result)
+        sender.close()
+
+    process = context.Process(target=child)
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = None
+    process.join()
+    if result is None:
+        findings = Findings()
+        how = "signal %d" % -process.exitcode if process.exitcode < 0 else "exit code %d" % process.exitcode
+        findings.add("errors", ["crashed (%s)" % how], None)
+        result = {"findings": findings.result(), "logs": []}
+    return result
+
+
+def queryStr(query):
+    if query is None:
+        return ""
+    coll, nBytes, collNet, nvls, pipeOps = query
+    return " (e.g. %s %d bytes collNet=%d nvls=%d numPipeOps=%d)" % (
+        tunetable.idToName(coll, tunetable.collIds), nBytes, collNet, nvls, pipeOps)
+
+
+def latencyStr(stats):
+    if not stats:
+        return "-"
+    return "p50 %.3f us, p99 %.3f us, p99.9 %.3f us, max %.1f us" % (
+        stats["p50"], stats["p99"], stats["p99.9"], stats["max"])
+
+
+def report(name, online, phases):
+    calls = phases["calls"]
+    print("plugin %s, addOnlineResult %s" % (name, "set" if online else "NULL (CollTrace skips online tuning)"))
+    if "latencyUs" in calls:
+        print("getCollInfo: %d calls, %s" % (calls["calls"], latencyStr(calls["latencyUs"])))
+        print("  ctypes baseline: %s" % latencyStr(calls["baselineUs"]))
+        print("  estimated plugin cost: p50 %.3f us, p99 %.3f us" % (
+            max(0.0, calls["latencyUs"]["p50"] - calls["baselineUs"]["p50"]),
+            max(0.0, calls["latencyUs"]["p99"] - calls["baselineUs"]["p99"])))
+        print("  answered %.1f%% of the queries, %.1f%% with nChannels" % (
+            100.0 * calls["answered"] / max(1, calls["calls"]), 100.0 * calls["withChannels"] / max(1, calls["calls"])))
+        for answer, count in calls["answers"].items():
+            print("    %-24s %6.2f%%" % (answer, 100.0 * count / max(1, calls["calls"])))
+    if "online" in phases and "latencyUs" in phases["online"]:
+        online = phases["online"]
+        print("with online results: getCollInfo %s" % latencyStr(online["latencyUs"]))
+        print("  addOnlineResult: %s" % latencyStr(online["onlineLatencyUs"]))
+    if "callsPerSec" in phases["threads"]:
+        threads = phases["threads"]
+        print("threads: %d threads, %d calls, %.0f calls/s" % (threads["threads"], threads["calls"],
+                                                               threads["callsPerSec"]))
+
+    nErrors = 0
+    for kind in ("errors", "warnings"):
+        lines = []
+        for phase, result in phases.items():
+            findings = result["findings"]
+            for message, count in sorted(findings["counts"].get(kind, {}).items(), key=lambda m: -m[1]):
+                query = findings["examples"].get(message)
+                if query is None:
+                    lines.append("  [%s] %s" % (phase, message))
+                else:
+                    lines.append("  [%s] %s: %d calls%s" % (phase, message, count, queryStr(query)))
+        if kind == "errors":
+            nErrors = len(lines)
+        print("%s: %s" % (kind, "none" if not lines else ""))
+        for line in lines:
+            print(line)
+    logs = collections.Counter()
+    for result in phases.values():
+        for level, fmt, count in result.get("logs", []):
+            logs[(level, fmt)] += count
+    if logs:
+        print("plugin logs:")
+        for (level, fmt), count in logs.most_common(10):
+            print("  %s %s (%d)" % (level, fmt, count))
+    return nErrors
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark a tuner plugin and check it against the tuner interface")
+    parser.add_argument(
+        "plugin",
+        nargs="?",
+        default=os.environ.get("NCCL_TUNER_PLUGIN", ""),
+        help="tuner library, as NCCL_TUNER_PLUGIN (default: $NCCL_TUNER_PLUGIN)",
+    )
+    parser.add_argument("--queries", type=int, default=1000000, help="getCollInfo() calls per phase")
+    parser.add_argument("--nranks", type=int, default=8, help="ranks of the communicator given to init()")
+    parser.add_argument("--nnodes", type=int, default=1, help="nodes of the communicator given to init()")
+    parser.add_argument("--threads", type=int, default=4, help="threads of the concurrency phase")
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=16 << 30,
+        help="largest message size of the queries",
+    )
+    parser.add_argument("--max-pipe-ops", type=int, default=8, help="largest numPipeOps of the queries")
+    parser.add_argument(
+        "--collnet",
+        type=int,
+        choices=(0, 1),
+        default=None,
+        help="collNetSupport of every query (default: random)",
+    )
+    parser.add_argument(
+        "--nvls",
+        type=int,
+        choices=(0, 1),
+        default=None,
+        help="nvlsSupport of every query (default: random)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the queries")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    try:
+        if not args.plugin:
+            raise ValueError("no plugin given and NCCL_TUNER_PLUGIN is not set")
+        if args.queries < 1 or args.threads < 1 or args.max_bytes < 1 or args.max_pipe_ops < 1:
+            raise ValueError("--queries, --threads, --max-bytes and --max-pipe-ops must be positive")
+        _, tuner = loadTuner(args.plugin)
+    except ValueError as e:
+        sys.exit("tunerbench.py: error: %s" % e)
+    name = (tuner.name or b"").decode(errors="replace")
+    online = bool(tuner.addOnlineResult)
+
+    queries = Queries(args.queries, args.seed, args.max_bytes, args.max_pipe_ops, args.collnet, args.nvls)
+    phases = {"calls": runPhase("calls", tuner, queries, args)}
+    reference = phases["calls"].pop("reference", None)
+    if online:
+        phases["online"] = runPhase("online", tuner, queries, args)
+    phases["threads"] = runPhase("threads", tuner, queries, args, reference)
+
+    if args.json:
+        print(json.dumps({"plugin": args.plugin, "name": name, "addOnlineResult": online, "phases": phases},
+                         indent=2))
+        nErrors = sum(len(p["findings"]["counts"].get("errors", {})) for p in phases.values())
+    else:
+        nErrors = report(name, online, phases)
+    return 1 if nErrors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+"""Build the binary tuning table of the table tuner plugin from latencies.
+
+With NCCL_COLLTRACE_DIR set, every rank writes the latency of each
+collective it ran, with the algorithm, protocol and number of channels NCCL
+chose for it, to <dir>/<rank>_online.json. Latencies of sweeps run with
+different NCCL_ALGO/NCCL_PROTO/NCCL_MAX_NCHANNELS can also be given as CSV
+files with the columns nranks,coll,nbytes,algorithm,protocol,nchannels,latency
+(latency in ms; names or numbers for coll, algorithm and protocol).
+
+For every rank count, collective and power of two message size bucket, the
+candidates (algorithm, protocol, nChannels) are ranked by their median
+latency relative to the best one at each measured message size. The best
+few are written, best first, to a table that ext-tuner/table mmaps
+(NCCL_TUNER_TABLE_FILE) to answer getCollInfo():
+
+    ./maint/tunetable.py build --output h100.tune /shared/sweeps/*/colltrace
+    ./maint/tunetable.py dump h100.tune
+    ./maint/tunetable.py lookup h100.tune --nranks 16 AllReduce 1048576
+
+Table layout (little endian): a 32-byte header
+    char magic[8] = "NCCLTUNE"; uint32 version, headerSize, entrySize,
+    nEntries, crc32 of the entries, flags
+followed by 24-byte entries sorted by (nRanks, coll, minBytes)
+    uint32 nRanks, coll; uint64 minBytes; int8 algorithm, protocol;
+    int16 nChannels (0: NCCL's choice); float latencyUs
+An entry applies from minBytes up to the minBytes of the next bucket of its
+rank count and collective; buckets choosing the same candidates as the one
+below are merged into it, and the smallest bucket starts at 0.
+"""
+
+import argparse
+import csv
+import json
+import struct
+import sys
+import zlib
+
+import colltracestats
+
+tableMagic = b"NCCLTUNE"
+tableVersion = 1
+headerStruct = struct.Struct("<8sIIIIII")
+entryStruct = struct.Struct("<IIQbbhf")
+
+# ncclFunc_t, and the algorithm and protocol names of NCCL_ALGO/NCCL_PROTO
+collIds = {"Broadcast": 0, "Reduce": 1, "AllGather": 2, "ReduceScatter": 3, "AllReduce": 4,
+           "SendRecv": 5, "Send": 6, "Recv": 7}
+algoNames = ("Tree", "Ring", "CollNetDirect", "CollNetChain", "NVLS", "NVLSTree")
+protoNames = ("LL", "LL128", "Simple")
+collNetAlgos = (2, 3)
+nvlsAlgos = (4, 5)
+
+csvColumns = ("nranks", "coll", "nbytes", "algorithm", "protocol", "nchannels", "latency")
+
+
+def nameToId(value, names, what):
+    """Id of a name (case insensitive) or number"""
+    if isinstance(value, int):
+        return value
+    value = value.strip()
+    if value.lstrip("-").isdigit():
+        return int(value)
+    pairs = names.items() if isinstance(names, dict) else ((n, i) for i, n in enumerate(names))
+    for name, i in pairs:
+        if name.lower() == value.lower():
+            return i
+    raise ValueError("unknown %s %s" % (what, value))
+
+
+def idToName(value, names):
+    if isinstance(names, dict):
+        names = {v: k for k, v in names.items()}
+        return names.get(value, str(value))
+    return names[value] if 0 <= value < len(names) else str(value)
+
+
+def bucketOf(nBytes):
+    """Lower bound of the power of two bucket of nBytes"""
+    return 1 << (nBytes.bit_length() - 1) if nBytes > 0 else 0
+
+
+def loadCollTrace(path, nranks, samples):
+    """Add the latencies of a CollTrace directory to samples; entries of
+    CollTrace versions without the algorithm are skipped, and counted"""
+    files = colltracestats.findFiles([path])
+    if not files:
+        raise ValueError("%s: no <rank>_online.json file" % path)
+    nranks = nranks or len(files)
+    skipped = 0
+    for _, filename in files:
+        with open(filename, "rb") as f:
+            try:
+                entries = json.load(f)
+            except ValueError as e:
+                raise ValueError("%s: %s" % (filename, e))
+        for entry in entries:
+            # A rank without results writes a single empty entry
+            if not entry:
+                continue
+            if "algorithm" not in entry:
+                skipped += 1
+                continue
+            # CollTrace reports -1 for collectives it failed to time
+            if entry["latency"] < 0 or entry["algorithm"] < 0 or entry["protocol"] < 0:
+                continue
+            key = (nranks, nameToId(entry["coll"], collIds, "collective"), int(entry["msg_size"]))
+            candidate = (entry["algorithm"], entry["protocol"], entry.get("nchannels", 0))
+            samples.setdefault(key, {}).setdefault(candidate, []).append(entry["latency"])
+    return skipped
+
+
+def loadCsv(filename, samples):
+    with open(filename, newline="") as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in csvColumns if c not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError("%s: no %s column" % (filename, ", ".join(missing)))
+        for line, row in enumerate(reader, 2):
+            try:
+                key = (int(row["nranks"]), nameToId(row["coll"], collIds, "collective"), int(row["nbytes"]))
+                candidate = (nameToId(row["algorithm"], algoNames, "algorithm"),
+                             nameToId(row["protocol"], protoNames, "protocol"), int(row["nchannels"] or 0))
+                latency = float(row["latency"])
+            except (TypeError, ValueError) as e:
+                raise ValueError("%s:%d: %s" % (filename, line, e))
+            if latency >= 0:
+                samples.setdefault(key, {}).setdefault(candidate, []).append(latency)
+
+
+def buildEntries(samples, minSamples, maxCandidates):
+    """Sorted table entries of samples, as (nRanks, coll, minBytes, algorithm,
+    protocol, nChannels, latencyUs) tuples"""
+    # Relative latencies of the candidates measured at every message size
+    buckets = {}
+    for (nranks, coll, nBytes), candidates in samples.items():
+        medians = {c: colltracestats.median(l) for c, l in candidates.items() if len(l) >= minSamples}
+        if not medians:
+            continue
+        best = min(medians.values())
+        bucket = buckets.setdefault((nranks, coll, bucketOf(nBytes)), {})
+        for candidate, latency in medians.items():
+            scores = bucket.setdefault(candidate, [])
+            scores.append((latency / best if best > 0 else 1.0, latency))
+
+    entries = []
+    previous = {}
+    for (nranks, coll, minBytes) in sorted(buckets):
+        scored = buckets[(nranks, coll, minBytes)]
+        # The sizes of a bucket are not all measured with every candidate:
+        # prefer the candidates measured at most of them
+        sizes = max(len(s) for s in scored.values())
+        ranked = sorted((sum(r for r, _ in s) / len(s), -len(s), c, colltracestats.median([l for _, l in s]))
+                        for c, s in scored.items() if 2 * len(s) >= sizes)
+        chosen = [(c, latency) for _, _, c, latency in ranked[:maxCandidates]]
+        # Merge buckets choosing the same as the one below
+        if previous.get((nranks, coll)) == [c for c, _ in chosen]:
+            continue
+        first = (nranks, coll) not in previous
+        previous[(nranks, coll)] = [c for c, _ in chosen]
+        for (algorithm, protocol, nChannels), latency in chosen:
+            entries.append((nranks, coll, 0 if first else minBytes, algorithm, protocol, nChannels,
+                            latency * 1000.0))
+    return entries
+
+
+def packTable(entries):
+    body = b"".join(entryStruct.pack(*e) for e in entries)
+    header = headerStruct.pack(tableMagic, tableVersion, headerStruct.size, entryStruct.size, len(entries),
+                               zlib.crc32(body), 0)
+    return header + body
+
+
+def readTable(filename):
+    """Entries of a table file, after the checks the plugin does"""
+    with open(filename, "rb") as f:
+        data = f.read()
+    if len(data) < headerStruct.size:
+        raise ValueError("%s: truncated header" % filename)
+    magic, version, headerSize, entrySize, nEntries, crc, _ = headerStruct.unpack_from(data)
+    if magic != tableMagic:
+        raise ValueError("%s: not a tuning table" % filename)
+    if version != tableVersion:
+        raise ValueError("%s: table version %d, %d needed" % (filename, version, tableVersion))
+    if headerSize != headerStruct.size or entrySize != entryStruct.size:
+        raise ValueError("%s: unexpected header or entry size" % filename)
+    body = data[headerSize:]
+    if len(body) != nEntries * entrySize:
+        raise ValueError("%s: %d bytes of entries, %d expected" % (filename, len(body), nEntries * entrySize))
+    if zlib.crc32(body) != crc:
+        raise ValueError("%s: checksum mismatch" % filename)
+    entries = [entryStruct.unpack_from(body, i * entrySize) for i in range(nEntries)]
+    if entries != sorted(entries, key=lambda e: e[:3]):
+        raise ValueError("%s: entries are not sorted" % filename)
+    return entries
+
+
+def rankRange(entries, nranks):
+    """(first, last) entries of the rank count closest to nranks, in ratio"""
+    counts = sorted({e[0] for e in entries})
+    if not counts:
+        return 0, 0
+    above = [c for c in counts if c >= nranks]
+    below = [c for c in counts if c < nranks]
+    if not above or (below and nranks * nranks <= below[-1] * above[0]):
+        chosen = below[-1]
+    else:
+        chosen = above[0]
+    first = next(i for i, e in enumerate(entries) if e[0] == chosen)
+    last = first
+    while last < len(entries) and entries[last][0] == chosen:
+        last += 1
+    return first, last
+
+
+def lookup(entries, nranks, coll, nBytes, collNet=False, nvls=False, nnodes=1):
+    """(algorithm, protocol, nChannels) the plugin answers, or None"""
+    first, last = rankRange(entries, nranks)
+    end = first
+    while end < last and (entries[end][1], entries[end][2]) <= (coll, nBytes):
+        end += 1
+    if end == first or entries[end - 1][1] != coll:
+        return None
+    start = end - 1
+    while start > first and entries[start - 1][1:3] == entries[end - 1][1:3]:
+        start -= 1
+    for entry in entries[start:end]:
+        algorithm = entry[3]
+        if algorithm in collNetAlgos and not collNet:
+            continue
+        if algorithm in nvlsAlgos and not nvls:
+            continue
+        if algorithm == 4 and nnodes > 1 and not collNet:
+            continue
+        return entry[3], entry[4], entry[5]
+    return None
+
+
+def candidateStr(algorithm, protocol, nChannels):
+    return "%s/%s/%s" % (idToName(algorithm, algoNames), idToName(protocol, protoNames),
+                         nChannels if nChannels else "auto")
+
+
+def sizeStr(nBytes):
+    for unit, shift in (("G", 30), ("M", 20), ("K", 10)):
+        if nBytes >= 1 << shift and nBytes % (1 << shift) == 0:
+            return "%d%s" % (nBytes >> shift, unit)
+    return "%d" % nBytes
+
+
+def build(args):
+    samples = {}
+    skipped = 0
+    for path in args.inputs:
+        if path.endswith(".csv"):
+            loadCsv(path, samples)
+        else:
+            skipped += loadCollTrace(path, args.nranks, samples)
+    entries = buildEntries(samples, args.min_samples, args.candidates)
+    if not entries:
+        raise ValueError("no (collective, message size) with %d samples of a candidate" % args.min_samples)
+    data = packTable(entries)
+    with open(args.output, "wb") as f:
+        f.write(data)
+    buckets = len({e[:3] for e in entries})
+    print("%s: %d buckets, %d entries, %d bytes, from %d message sizes" % (
+        args.output, buckets, len(entries), len(data), len(samples)))
+    if skipped:
+        print("skipped %d CollTrace entries without algorithm (older NCCL)" % skipped)
+
+
+def dump(args):
+    entries = readTable(args.table)
+    if args.json:
+        print(json.dumps([{"nranks": e[0], "coll": idToName(e[1], collIds), "minBytes": e[2],
+                           "algorithm": idToName(e[3], algoNames), "protocol": idToName(e[4], protoNames),
+                           "nChannels": e[5], "latencyUs": e[6]} for e in entries], indent=2))
+        return
+    lastBucket = None
+    for e in entries:
+        bucket = e[:3]
+        prefix = "%6d %-14s >= %-6s" % (e[0], idToName(e[1], collIds), sizeStr(e[2]))
+        print("%s %-24s %10.2f us" % (prefix if bucket != lastBucket else " " * len(prefix),
+                                      candidateStr(*e[3:6]), e[6]))
+        lastBucket = bucket
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build and inspect the binary tuning table of the table tuner plugin")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    buildParser = sub.add_parser("build", help="build a table from CollTrace results or CSV sweeps")
+    buildParser.add_argument(
+        "inputs",
+        nargs="+",
+        help="NCCL_COLLTRACE_DIR directories (one communicator each) or .csv files",
+    )
+    buildParser.add_argument("--output", type=str, required=True, help="table file to write")
+    buildParser.add_argument(
+        "--nranks",
+        type=int,
+        default=0,
+        help="rank count of the CollTrace results (default: number of rank files)",
+    )
+    buildParser.add_argument(
+        "--min-samples",
+        type=int,
+        default=5,
+        help="latencies needed for a candidate at a message size",
+    )
+    buildParser.add_argument(
+        "--candidates",
+        type=int,
+        default=3,
+        help="candidates kept per bucket, for when the best is not supported",
+    )
+
+    dumpParser = sub.add_parser("dump", help="check and print a table")
+    dumpParser.add_argument("table")
+    dumpParser.add_argument("--json", action="store_true", help="print the entries as JSON")
+
+    lookupParser = sub.add_parser("lookup", help="answer a getCollInfo() as the plugin does")
+    lookupParser.add_argument("table")
+    lookupParser.add_argument("coll", help="collective, e.g. AllReduce")
+    lookupParser.add_argument("nbytes", type=int, help="message size in bytes")
+    lookupParser.add_argument("--nranks", type=int, required=True, help="ranks of the communicator")
+    lookupParser.add_argument("--nnodes", type=int, default=1, help="nodes of the communicator")
+    lookupParser.add_argument("--collnet", action="store_true", help="CollNet is supported")
+    lookupParser.add_argument("--nvls", action="store_true", help="NVLS is supported")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "build":
+            if args.min_samples < 1 or args.candidates < 1:
+                raise ValueError("--min-samples and --candidates must be positive")
+            build(args)
+        elif args.command == "dump":
+            dump(args)
+        elif args.command == "lookup":
+            entries = readTable(args.table)
+            coll = nameToId(args.coll, collIds, "collective")
+            result = lookup(entries, args.nranks, coll, args.nbytes, args.collnet, args.nvls, args.nnodes)
+            print(candidateStr(*result) if result else "no entry, NCCL's default tuning")
+    except (OSError, ValueError) as e:
+        sys.exit("tunetable.py: error: %s" % e)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,7 @@ AlgoDirector::AlgoDirector(ncclComm_t comm) : comm_(comm) {
   // register rank
   DdaThreadedData::get()->registerRank(comm->commHash, comm->rank);
 
-  if (NCCL_ALLREDUCE_ALGO == NCCL_ALLREDUCE_ALGO::dda) {
+  if (NCCL_ALLREDUCE_ALGO_get() == NCCL_ALLREDUCE_ALGO::dda) {
     // initialize allreduce if dda is enabled
 
     // enable peer access (support for NVS full-mesh topology only)
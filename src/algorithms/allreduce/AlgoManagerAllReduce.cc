@@ -151,12 +151,12 @@ std::unique_ptr<AlgoAllReduce> AlgoManagerAllReduce::getAlgoAllReduce(
         recvbuff,
         totalSize,
         numDdaThreads,
-        NCCL_DDA_ALLREDUCE_TREE_THRESHOLD)) {
+        NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_get())) {
       // fallback to default
       return nullptr;
     }
 
-    if (totalSize < NCCL_DDA_ALLREDUCE_TREE_THRESHOLD) {
+    if (totalSize < NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_get()) {
       return getAlgoAllReduceDdaNvsFlatThreaded(
           sendbuff, recvbuff, count, datatype, op, comm, stream);
     } else {
@@ -171,17 +171,17 @@ std::unique_ptr<AlgoAllReduce> AlgoManagerAllReduce::getAlgoAllReduce(
           sendbuff,
           recvbuff,
           totalSize,
-          NCCL_DDA_ALLREDUCE_TREE_THRESHOLD,
-          NCCL_DDA_TMPBUFF_SIZE)) {
+          NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_get(),
+          NCCL_DDA_TMPBUFF_SIZE_get())) {
       // fallback to default
       return nullptr;
     }
 
-    assert(totalSize <= NCCL_DDA_TMPBUFF_SIZE);
-    if (totalSize < NCCL_DDA_ALLREDUCE_TREE_THRESHOLD) {
+    assert(totalSize <= NCCL_DDA_TMPBUFF_SIZE_get());
+    if (totalSize < NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_get()) {
       return getAlgoAllReduceDdaNvsFlatIpc(
           sendbuff, recvbuff, count, datatype, op, comm, stream);
-    } else if (totalSize < NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD) {
+    } else if (totalSize < NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_get()) {
       return getAlgoAllReduceDdaNvsTreeIpc(
           sendbuff, recvbuff, count, datatype, op, comm, stream);
     } else {
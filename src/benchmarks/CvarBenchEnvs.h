@@ -0,0 +1,167 @@
+// (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+// Automatically generated by ./maint/extractcvars.py --- START
+// DO NOT EDIT!!!
+
+#ifndef CVAR_BENCH_ENVS_H_INCLUDED
+#define CVAR_BENCH_ENVS_H_INCLUDED
+
+static const char* const cvarBenchEnvs[][2] = {
+  {"CUDA_LAUNCH_BLOCKING", "bench"},
+  {"NCCL_AGG_CHANNEL_SIZE", "1"},
+  {"NCCL_ALGO", "bench"},
+  {"NCCL_ALLGATHER_ALGO", "ctrd"},
+  {"NCCL_ALLGATHER_DIRECT_CUTOFF", "1"},
+  {"NCCL_ALLOC_P2P_NET_LL_BUFFERS", "1"},
+  {"NCCL_ALLREDUCE_ALGO", "dda"},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", "1"},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", "1"},
+  {"NCCL_ALLTOALLV_ALGO", "ctran"},
+  {"NCCL_ALLTOALL_ALGO", "ctran"},
+  {"NCCL_BUFFSIZE", "1"},
+  {"NCCL_CGA_CLUSTER_SIZE", "1"},
+  {"NCCL_CHECK_POINTERS", "1"},
+  {"NCCL_CHUNK_SIZE", "1"},
+  {"NCCL_COLLNET_ENABLE", "bench"},
+  {"NCCL_COLLNET_NODE_THRESHOLD", "1"},
+  {"NCCL_COLLTRACE_DIR", "bench"},
+  {"NCCL_COMM_BLOCKING", "1"},
+  {"NCCL_COMM_ID", "bench"},
+  {"NCCL_COMM_SPLIT_SHARE_RESOURCES", "1"},
+  {"NCCL_CONNECT_ROUND_SIZE", "1"},
+  {"NCCL_CREATE_THREAD_CONTEXT", "1"},
+  {"NCCL_CROSS_NIC", "1"},
+  {"NCCL_CTRAN_AG_RD_RTR", "1"},
+  {"NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", "1"},
+  {"NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", "1"},
+  {"NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", "1"},
+  {"NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", "1"},
+  {"NCCL_CTRAN_ALLTOALL_THRESHOLD", "1"},
+  {"NCCL_CTRAN_BACKENDS", "ib"},
+  {"NCCL_CTRAN_IB_CTRL_TC", "1"},
+  {"NCCL_CTRAN_IB_MAX_QPS", "1"},
+  {"NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", "1"},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "1"},
+  {"NCCL_CTRAN_KINETO_PROFILE_DIR", "bench"},
+  {"NCCL_CTRAN_NUM_KERNEL_P2PELEMS", "1"},
+  {"NCCL_CTRAN_PROFILING", "kineto"},
+  {"NCCL_CTRAN_PROFILING_REPORT_COUNT", "1"},
+  {"NCCL_CTRAN_REGISTER", "eager"},
+  {"NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", "1"},
+  {"NCCL_CTRAN_RING_MAX_OUTSTANDING", "1"},
+  {"NCCL_CTRAN_RING_STEP", "1"},
+  {"NCCL_CTRAN_SHARED_DEVBUF_SIZE", "1"},
+  {"NCCL_CTRAN_TOPO_FILE", "bench"},
+  {"NCCL_CTRAN_TOPO_FILE_KEYS", "val1,val2"},
+  {"NCCL_CUDA_PATH", "bench"},
+  {"NCCL_CUMEM_ENABLE", "1"},
+  {"NCCL_CVAR_SNAPSHOT_DIR", "bench"},
+  {"NCCL_DATA_EXPORT_DIR", "bench"},
+  {"NCCL_DDA_ALLREDUCE_MAX_BLOCKS", "1"},
+  {"NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", "1"},
+  {"NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", "1"},
+  {"NCCL_DDA_TMPBUFF_SIZE", "1"},
+  {"NCCL_DEBUG", "bench"},
+  {"NCCL_DEBUG_FILE", "bench"},
+  {"NCCL_DEBUG_SUBSYS", "bench"},
+  {"NCCL_DMABUF_ENABLE", "1"},
+  {"NCCL_GDRCOPY_ENABLE", "1"},
+  {"NCCL_GDRCOPY_FIFO_ENABLE", "1"},
+  {"NCCL_GDRCOPY_FLUSH_ENABLE", "1"},
+  {"NCCL_GDRCOPY_SYNC_ENABLE", "1"},
+  {"NCCL_GDR_FLUSH_DISABLE", "1"},
+  {"NCCL_GRAPH_DUMP_FILE", "bench"},
+  {"NCCL_GRAPH_DUMP_FILE_RANK", "1"},
+  {"NCCL_GRAPH_FILE", "bench"},
+  {"NCCL_GRAPH_MIXING_SUPPORT", "1"},
+  {"NCCL_GRAPH_REGISTER", "1"},
+  {"NCCL_HOSTID", "bench"},
+  {"NCCL_IB_ADAPTIVE_ROUTING", "1"},
+  {"NCCL_IB_ADDR_FAMILY", "bench"},
+  {"NCCL_IB_ADDR_RANGE", "bench"},
+  {"NCCL_IB_AR_THRESHOLD", "1"},
+  {"NCCL_IB_DISABLE", "1"},
+  {"NCCL_IB_GID_INDEX", "1"},
+  {"NCCL_IB_HCA", "^val1,val2"},
+  {"NCCL_IB_MERGE_VFS", "1"},
+  {"NCCL_IB_PCI_RELAXED_ORDERING", "1"},
+  {"NCCL_IB_PKEY", "1"},
+  {"NCCL_IB_QPS_PER_CONNECTION", "1"},
+  {"NCCL_IB_RETRY_CNT", "1"},
+  {"NCCL_IB_ROCE_VERSION_NUM", "1"},
+  {"NCCL_IB_SL", "1"},
+  {"NCCL_IB_SPLIT_DATA_ON_QPS", "1"},
+  {"NCCL_IB_TC", "1"},
+  {"NCCL_IB_TIMEOUT", "1"},
+  {"NCCL_IB_USE_INLINE", "1"},
+  {"NCCL_IGNORE_CPU_AFFINITY", "1"},
+  {"NCCL_IGNORE_DISABLED_P2P", "1"},
+  {"NCCL_L1_SHARED_MEMORY_CARVEOUT", "1"},
+  {"NCCL_LAUNCH_MODE", "bench"},
+  {"NCCL_LL128_BUFFSIZE", "1"},
+  {"NCCL_LL128_NTHREADS", "1"},
+  {"NCCL_LL_BUFFSIZE", "1"},
+  {"NCCL_LOCAL_REGISTER", "1"},
+  {"NCCL_LOGGER_MODE", "async"},
+  {"NCCL_MAX_CTAS", "1"},
+  {"NCCL_MAX_NCHANNELS", "1"},
+  {"NCCL_MAX_NRINGS", "1"},
+  {"NCCL_MAX_P2P_NCHANNELS", "1"},
+  {"NCCL_MEM_SYNC_DOMAIN", "remote"},
+  {"NCCL_MIN_CTAS", "1"},
+  {"NCCL_MIN_NCHANNELS", "1"},
+  {"NCCL_MIN_NRINGS", "1"},
+  {"NCCL_MIN_P2P_NCHANNELS", "1"},
+  {"NCCL_NCHANNELS_PER_NET_PEER", "1"},
+  {"NCCL_NET", "bench"},
+  {"NCCL_NET_DISABLE_INTRA", "1"},
+  {"NCCL_NET_FORCE_FLUSH", "1"},
+  {"NCCL_NET_GDR_LEVEL", "bench"},
+  {"NCCL_NET_GDR_READ", "1"},
+  {"NCCL_NET_OVERHEAD", "1"},
+  {"NCCL_NET_PLUGIN", "bench"},
+  {"NCCL_NET_SHARED_BUFFERS", "1"},
+  {"NCCL_NET_SHARED_COMMS", "1"},
+  {"NCCL_NSOCKS_PERTHREAD", "1"},
+  {"NCCL_NTHREADS", "1"},
+  {"NCCL_NVB_DISABLE", "1"},
+  {"NCCL_NVB_PRECONNECT", "1"},
+  {"NCCL_NVLS_ENABLE", "1"},
+  {"NCCL_NVLS_NCHANNELS", "1"},
+  {"NCCL_P2P_DIRECT_DISABLE", "1"},
+  {"NCCL_P2P_DISABLE", "bench"},
+  {"NCCL_P2P_LEVEL", "bench"},
+  {"NCCL_P2P_LL_THRESHOLD", "1"},
+  {"NCCL_P2P_NET_CHUNKSIZE", "1"},
+  {"NCCL_P2P_NVL_CHUNKSIZE", "1"},
+  {"NCCL_P2P_PCI_CHUNKSIZE", "1"},
+  {"NCCL_P2P_PXN_LEVEL", "1"},
+  {"NCCL_P2P_READ_ENABLE", "1"},
+  {"NCCL_P2P_USE_CUDA_MEMCPY", "1"},
+  {"NCCL_PROGRESS_APPENDOP_FREQ", "1"},
+  {"NCCL_PROTO", "bench"},
+  {"NCCL_PROXY_APPEND_BATCH_SIZE", "1"},
+  {"NCCL_PROXY_DUMP_SIGNAL", "1"},
+  {"NCCL_PROXY_PROFILE", "bench"},
+  {"NCCL_PROXY_PROFILE_DIR", "bench"},
+  {"NCCL_PXN_DISABLE", "1"},
+  {"NCCL_SENDRECV_ALGO", "ctran"},
+  {"NCCL_SET_STACK_SIZE", "1"},
+  {"NCCL_SET_THREAD_NAME", "1"},
+  {"NCCL_SHM_DISABLE", "1"},
+  {"NCCL_SHM_LOCALITY", "1"},
+  {"NCCL_SHM_MEMCPY_MODE", "1"},
+  {"NCCL_SHM_USE_CUDA_MEMCPY", "1"},
+  {"NCCL_SOCKET_FAMILY", "bench"},
+  {"NCCL_SOCKET_IFNAME", "bench"},
+  {"NCCL_SOCKET_NTHREADS", "1"},
+  {"NCCL_THREAD_THRESHOLDS", "bench"},
+  {"NCCL_TOPO_DUMP_FILE", "bench"},
+  {"NCCL_TOPO_DUMP_FILE_RANK", "1"},
+  {"NCCL_TOPO_FILE", "bench"},
+  {"NCCL_TUNER_PLUGIN", "bench"},
+  {"NCCL_WORK_FIFO_DEPTH", "1"},
+};
+
+#endif  /* CVAR_BENCH_ENVS_H_INCLUDED */
+// Automatically generated by ./maint/extractcvars.py --- END
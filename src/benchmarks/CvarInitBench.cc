@@ -0,0 +1,212 @@
+// (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+#include <CLI11/CLI11.hpp>
+#include <stdlib.h>
+#include <algorithm>
+#include <chrono>
+#include <cstdio>
+#include <string>
+#include <utility>
+#include <vector>
+#include <unordered_set>
+#include "CvarBenchEnvs.h"
+#include "bench_common.h"
+#include "nccl_cvars.h"
+
+// CPU-only microbenchmark of the generated ncclCvarInit() and
+// ncclCvarReload() under environments with an increasing number of NCCL_*
+// variables. Settings beyond the realistic ones below come from
+// cvarBenchEnvs, a valid setting of every cvar generated by
+// ./maint/extractcvars.py, so that every variable is parsed.
+
+static const std::vector<std::pair<std::string, std::string>> realisticEnvs = {
+    {"NCCL_IB_HCA", "=mlx5_0:1,mlx5_3:1,mlx5_4:1,mlx5_5:1"},
+    {"NCCL_SOCKET_IFNAME", "eth0"},
+    {"NCCL_ALGO", "Ring,Tree"},
+    {"NCCL_PROTO", "LL,LL128,Simple"},
+    {"NCCL_IB_TIMEOUT", "22"},
+    {"NCCL_IB_RETRY_CNT", "10"},
+    {"NCCL_IB_GID_INDEX", "3"},
+    {"NCCL_IB_TC", "106"},
+    {"NCCL_IB_SPLIT_DATA_ON_QPS", "0"},
+    {"NCCL_IB_QPS_PER_CONNECTION", "4"},
+    {"NCCL_NET_GDR_LEVEL", "PHB"},
+    {"NCCL_P2P_LEVEL", "NVL"},
+    {"NCCL_BUFFSIZE", "8388608"},
+    {"NCCL_MIN_NCHANNELS", "4"},
+    {"NCCL_MAX_NCHANNELS", "32"},
+    {"NCCL_NVLS_ENABLE", "0"},
+    {"NCCL_CUMEM_ENABLE", "1"},
+    {"NCCL_CROSS_NIC", "0"},
+    {"NCCL_COLLTRACE_DIR", "/tmp/colltrace"},
+    {"NCCL_ALLGATHER_ALGO", "ctdirect"},
+    {"NCCL_ALLREDUCE_ALGO", "dda"},
+    {"NCCL_CTRAN_BACKENDS", "ib"},
+    {"NCCL_CTRAN_REGISTER", "eager"},
+    {"NCCL_DDA_TMPBUFF_SIZE", "67108864"},
+    {"NCCL_CTRAN_AG_RD_RTR", "false"},
+    {"NCCL_LOGGER_MODE", "async"},
+    {"NCCL_MAX_P2P_NCHANNELS", "MAX"},
+    {"NCCL_TOPO_FILE", "/etc/nccl/topo.xml"},
+};
+
+struct CvarBenchResult {
+  int numNcclEnvs{0};
+  double minUs{0};
+  double medianUs{0};
+  double meanUs{0};
+  double p99Us{0};
+};
+
+// The first n of the realistic settings followed by the other cvars; fewer
+// than n if there are not as many cvars
+static std::vector<std::pair<std::string, std::string>> makeNcclEnvs(int n) {
+  std::vector<std::pair<std::string, std::string>> envs;
+  std::unordered_set<std::string> used;
+  for (const auto& env : realisticEnvs) {
+    if (envs.size() == n) {
+      return envs;
+    }
+    envs.push_back(env);
+    used.insert(env.first);
+  }
+  for (const auto& env : cvarBenchEnvs) {
+    if (envs.size() == n) {
+      break;
+    }
+    if (used.insert(env[0]).second) {
+      envs.emplace_back(env[0], env[1]);
+    }
+  }
+  return envs;
+}
+
+template <typename F>
+static CvarBenchResult timeIt(int numNcclEnvs, int numIter, int numWarmup, F fn) {
+  for (int i = 0; i < numWarmup; i++) {
+    fn();
+  }
+  std::vector<double> us(numIter);
+  for (int i = 0; i < numIter; i++) {
+    auto start = std::chrono::steady_clock::now();
+    fn();
+    auto stop = std::chrono::steady_clock::now();
+    us[i] = std::chrono::duration<double, std::micro>(stop - start).count();
+  }
+  std::sort(us.begin(), us.end());
+
+  CvarBenchResult res;
+  res.numNcclEnvs = numNcclEnvs;
+  res.minUs = us.front();
+  res.medianUs = us[us.size() / 2];
+  res.p99Us = us[std::min(us.size() - 1, us.size() * 99 / 100)];
+  for (auto v : us) {
+    res.meanUs += v / us.size();
+  }
+  return res;
+}
+
+static void writeResults(
+    FILE* out,
+    const char* name,
+    const std::vector<CvarBenchResult>& results,
+    bool last) {
+  fprintf(out, "    \"%s\": [\n", name);
+  for (size_t i = 0; i < results.size(); i++) {
+    const auto& r = results[i];
+    fprintf(
+        out,
+        "      {\"numNcclEnvs\": %d, \"minUs\": %.3f, \"medianUs\": %.3f, "
+        "\"meanUs\": %.3f, \"p99Us\": %.3f}%s\n",
+        r.numNcclEnvs,
+        r.minUs,
+        r.medianUs,
+        r.meanUs,
+        r.p99Us,
+        i + 1 < results.size() ? "," : "");
+  }
+  fprintf(out, "    ]%s\n", last ? "" : ",");
+}
+
+std::vector<int> numNcclEnvsList = {0, 8, 32, 64, 128};
+int numOtherEnvs = 64;
+int numIter = 1000, numWarmup = 10;
+std::string outputFile;
+
+int main(int argc, char** argv) {
+  CLI::App app{"ncclCvarInit() CPU microbenchmark"};
+  app.add_option(
+         "--num-nccl-envs",
+         numNcclEnvsList,
+         "Numbers of NCCL_* variables to benchmark with")
+      ->default_val(numNcclEnvsList);
+  app.add_option(
+         "--num-other-envs",
+         numOtherEnvs,
+         "Number of non-NCCL variables added to every environment")
+      ->default_val(numOtherEnvs);
+  app.add_option("--num-iteration", numIter, "Number of iterations")
+      ->default_val(numIter);
+  app.add_option("--num-warmup", numWarmup, "Number of warmup")
+      ->default_val(numWarmup);
+  app.add_option(
+      "--output", outputFile, "File to write the JSON report to (default: stdout)");
+
+  CLI11_PARSE(app, argc, argv);
+
+  benchAbortSignalSetup();
+
+  if (numIter <= 0) {
+    BENCH_ERR("Invalid number of iterations %d\n", numIter);
+    return EXIT_FAILURE;
+  }
+
+  // Keep CVAR_WARN quiet unless a run sets NCCL_DEBUG itself
+  unsetenv("NCCL_DEBUG");
+  for (int i = 0; i < numOtherEnvs; i++) {
+    setenv(("BENCH_OTHER_ENV_" + std::to_string(i)).c_str(), "value", 1);
+  }
+
+  std::vector<CvarBenchResult> initResults, reloadResults;
+  for (int n : numNcclEnvsList) {
+    auto envs = makeNcclEnvs(n);
+    if (envs.size() < n) {
+      BENCH_ERR("Only %zu NCCL_* cvars to set, %d requested\n", envs.size(), n);
+      return EXIT_FAILURE;
+    }
+    std::vector<std::string> names;
+    for (const auto& e : envs) {
+      setenv(e.first.c_str(), e.second.c_str(), 1);
+      names.push_back(e.first);
+    }
+
+    initResults.push_back(timeIt(n, numIter, numWarmup, [] { ncclCvarInit(); }));
+    reloadResults.push_back(
+        timeIt(n, numIter, numWarmup, [&names] { ncclCvarReload(names); }));
+
+    for (const auto& e : envs) {
+      unsetenv(e.first.c_str());
+    }
+  }
+
+  FILE* out = stdout;
+  if (!outputFile.empty()) {
+    out = fopen(outputFile.c_str(), "w");
+    if (out == nullptr) {
+      BENCH_ERR("Cannot open %s\n", outputFile.c_str());
+      return EXIT_FAILURE;
+    }
+  }
+  fprintf(out, "{\n");
+  fprintf(out, "  \"benchmark\": \"ncclCvarInit\",\n");
+  fprintf(out, "  \"numOtherEnvs\": %d,\n", numOtherEnvs);
+  fprintf(out, "  \"numIteration\": %d,\n", numIter);
+  fprintf(out, "  \"results\": {\n");
+  writeResults(out, "ncclCvarInit", initResults, false);
+  writeResults(out, "ncclCvarReload", reloadResults, true);
+  fprintf(out, "  }\n");
+  fprintf(out, "}\n");
+  if (out != stdout) {
+    fclose(out);
+  }
+  return EXIT_SUCCESS;
+}
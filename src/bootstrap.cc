@@ -29,9 +29,9 @@ ncclResult_t bootstrapNetInit() {
   if (bootstrapNetInitDone == 0) {
     pthread_mutex_lock(&bootstrapNetLock);
     if (bootstrapNetInitDone == 0) {
-      if (!NCCL_COMM_ID.empty()) {
+      if (!NCCL_COMM_ID_get().empty()) {
         union ncclSocketAddress remoteAddr;
-        if (ncclSocketGetAddrFromString(&remoteAddr, NCCL_COMM_ID.c_str()) != ncclSuccess) {
+        if (ncclSocketGetAddrFromString(&remoteAddr, NCCL_COMM_ID_get().c_str()) != ncclSuccess) {
           WARN("Invalid NCCL_COMM_ID, please use format: <ipv4>:<port> or [<ipv6>]:<port> or <hostname>:<port>");
           return ncclInvalidArgument;
         }
@@ -189,9 +189,9 @@ ncclResult_t bootstrapGetUniqueId(struct ncclBootstrapHandle* handle) {
   memset(handle, 0, sizeof(ncclBootstrapHandle));
   NCCLCHECK(getRandomData(&handle->magic, sizeof(handle->magic)));
 
-  if (!NCCL_COMM_ID.empty()) {
-    INFO(NCCL_ENV, "NCCL_COMM_ID set by environment to %s", NCCL_COMM_ID.c_str());
-    if (ncclSocketGetAddrFromString(&handle->addr, NCCL_COMM_ID.c_str()) != ncclSuccess) {
+  if (!NCCL_COMM_ID_get().empty()) {
+    INFO(NCCL_ENV, "NCCL_COMM_ID set by environment to %s", NCCL_COMM_ID_get().c_str());
+    if (ncclSocketGetAddrFromString(&handle->addr, NCCL_COMM_ID_get().c_str()) != ncclSuccess) {
       WARN("Invalid NCCL_COMM_ID, please use format: <ipv4>:<port> or [<ipv6>]:<port> or <hostname>:<port>");
       return ncclInvalidArgument;
     }
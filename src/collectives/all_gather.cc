@@ -27,15 +27,15 @@ ncclResult_t ncclAllGather(const void* sendbuff, void* recvbuff, size_t sendcoun
     ncclDataType_t datatype, ncclComm_t comm, cudaStream_t stream) {
   int nRanks = comm->nRanks;
   size_t rankOffset = sendcount * ncclTypeSize(datatype);
-  bool directSend = (comm->localRanks == 1) && (rankOffset <= NCCL_ALLGATHER_DIRECT_CUTOFF);
+  bool directSend = (comm->localRanks == 1) && (rankOffset <= NCCL_ALLGATHER_DIRECT_CUTOFF_get());
 
   // CTRAN allgather: only support inter-node now
   if (ctranInitialized(comm) && comm->localRanks == 1 && nRanks > 1 && rankOffset > getpagesize()) {
-    if (NCCL_ALLGATHER_ALGO == NCCL_ALLGATHER_ALGO::ctdirect) {
+    if (NCCL_ALLGATHER_ALGO_get() == NCCL_ALLGATHER_ALGO::ctdirect) {
       return ctranAllGatherDirect(sendbuff, recvbuff, sendcount, datatype, comm, stream);
-    } else if (NCCL_ALLGATHER_ALGO == NCCL_ALLGATHER_ALGO::ctring) {
+    } else if (NCCL_ALLGATHER_ALGO_get() == NCCL_ALLGATHER_ALGO::ctring) {
       return ctranAllGatherRing(sendbuff, recvbuff, sendcount, datatype, comm, stream);
-    } else if (NCCL_ALLGATHER_ALGO == NCCL_ALLGATHER_ALGO::ctrd) {
+    } else if (NCCL_ALLGATHER_ALGO_get() == NCCL_ALLGATHER_ALGO::ctrd) {
       return ctranAllGatherRd(sendbuff, recvbuff, sendcount, datatype, comm, stream);
     }
   }
@@ -70,10 +70,10 @@ static inline ncclResult_t unpackSendBlocks(
   // Allow user to customize if specified
   unsigned int num_blocks_x = unpackMinGridSize,
                num_threads_x = unpackBlockSize;
-  if (NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS > 0)
-    num_blocks_x = NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS;
-  if (NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE > 0)
-    num_threads_x = NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE;
+  if (NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_get() > 0)
+    num_blocks_x = NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_get();
+  if (NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_get() > 0)
+    num_threads_x = NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_get();
 
   INFO(
       NCCL_COLL,
@@ -35,7 +35,7 @@ ncclResult_t ncclAllToAll(
   }
 
   if (ctranAllToAllSupport(count, datatype, comm) &&
-      NCCL_ALLTOALL_ALGO == NCCL_ALLTOALL_ALGO::ctran) {
+      NCCL_ALLTOALL_ALGO_get() == NCCL_ALLTOALL_ALGO::ctran) {
     return ctranAllToAll(sendbuff, recvbuff, count, datatype, comm, stream);
   }
 
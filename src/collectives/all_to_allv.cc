@@ -36,7 +36,7 @@ ncclResult_t ncclAllToAllv(
   }
 
   if (ctranInitialized(comm) &&
-      NCCL_ALLTOALLV_ALGO == NCCL_ALLTOALLV_ALGO::ctran) {
+      NCCL_ALLTOALLV_ALGO_get() == NCCL_ALLTOALLV_ALGO::ctran) {
     return ctranAllToAllv(
         sendbuff,
         sendcounts,
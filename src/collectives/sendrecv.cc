@@ -24,7 +24,7 @@ NCCL_API(ncclResult_t, ncclSend, const void* sendbuff, size_t count, ncclDataTyp
     ncclComm_t comm, cudaStream_t stream);
 ncclResult_t ncclSend(const void* sendbuff, size_t count, ncclDataType_t datatype, int peer,
     ncclComm_t comm, cudaStream_t stream) {
-  if (NCCL_SENDRECV_ALGO == NCCL_SENDRECV_ALGO::ctran &&
+  if (NCCL_SENDRECV_ALGO_get() == NCCL_SENDRECV_ALGO::ctran &&
       ctranSendRecvSupport(peer, comm)) {
     // ctran send/recvs are enqueued within ctran wherease other non-ctran ones
     // are enqueued in the original queue. When reaching group end, these two
@@ -56,7 +56,7 @@ NCCL_API(ncclResult_t, ncclRecv, void* recvbuff, size_t count, ncclDataType_t da
     ncclComm_t comm, cudaStream_t stream);
 ncclResult_t ncclRecv(void* recvbuff, size_t count, ncclDataType_t datatype, int peer,
     ncclComm_t comm, cudaStream_t stream) {
-  if (NCCL_SENDRECV_ALGO == NCCL_SENDRECV_ALGO::ctran &&
+  if (NCCL_SENDRECV_ALGO_get() == NCCL_SENDRECV_ALGO::ctran &&
       ctranSendRecvSupport(peer, comm)) {
     // ctran send/recvs are enqueued within ctran wherease other non-ctran ones
     // are enqueued in the original queue. When reaching group end, these two
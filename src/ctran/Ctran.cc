@@ -29,7 +29,7 @@ ncclResult_t Ctran::commRegister(void* buff, size_t size, void** handle) {
   if (!this->mapper) {
     WARN("Ctran mapper is not initialized, skip commRegister\n");
     return ncclInternalError;
-  } else if (NCCL_CTRAN_REGISTER != NCCL_CTRAN_REGISTER::none) {
+  } else if (NCCL_CTRAN_REGISTER_get() != NCCL_CTRAN_REGISTER::none) {
     return this->mapper->regMem(buff, size, handle);
   }
 
@@ -42,7 +42,7 @@ ncclResult_t Ctran::commDeregister(void* handle) {
   if (!this->mapper) {
     WARN("Ctran mapper is not initialized, skip commDeregister\n");
     return ncclInternalError;
-  } else if (NCCL_CTRAN_REGISTER != NCCL_CTRAN_REGISTER::none) {
+  } else if (NCCL_CTRAN_REGISTER_get() != NCCL_CTRAN_REGISTER::none) {
     return this->mapper->deregMem(handle);
   }
 
@@ -89,7 +89,7 @@ class Ctran {
 };
 
 inline bool ctranIsUsed() {
-  return (NCCL_SENDRECV_ALGO == NCCL_SENDRECV_ALGO::ctran);
+  return (NCCL_SENDRECV_ALGO_get() == NCCL_SENDRECV_ALGO::ctran);
 }
 
 ncclResult_t ctranInit(ncclComm* comm);
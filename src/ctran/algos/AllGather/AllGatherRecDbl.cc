@@ -68,7 +68,7 @@ static ncclResult_t impl(std::vector<std::unique_ptr<struct OpElem>> opGroup) {
         res,
         exit);
 
-    if (!NCCL_CTRAN_AG_RD_RTR) {
+    if (!NCCL_CTRAN_AG_RD_RTR_get()) {
       NCCLCHECKGOTO(
           comm->ctran->mapper->isendCtrl(recvbuff, recvHdl, peers[i], &isendReq[i]),
           res,
@@ -79,7 +79,7 @@ static ncclResult_t impl(std::vector<std::unique_ptr<struct OpElem>> opGroup) {
   for (size_t i = 0; i < nSteps; i++) {
     auto peer = peers[i];
 
-    if (NCCL_CTRAN_AG_RD_RTR) {
+    if (NCCL_CTRAN_AG_RD_RTR_get()) {
       NCCLCHECKGOTO(
           comm->ctran->mapper->isendCtrl(recvbuff, recvHdl, peer, &isendReq[i]),
           res,
@@ -57,9 +57,9 @@ static ncclResult_t impl(std::vector<std::unique_ptr<struct OpElem>> opGroup) {
   int left = (rank + nRanks - 1) % nRanks;
   int right = (rank + 1) % nRanks;
 
-  size_t stepSize = std::min(NCCL_CTRAN_RING_STEP, sendSize);
+  size_t stepSize = std::min(NCCL_CTRAN_RING_STEP_get(), sendSize);
   size_t stepsPerBlock = std::max(1LU, (sendSize + stepSize - 1) / stepSize); // ceilDiv
-  size_t maxOutstandingPuts = NCCL_CTRAN_RING_MAX_OUTSTANDING;
+  size_t maxOutstandingPuts = NCCL_CTRAN_RING_MAX_OUTSTANDING_get();
   std::deque<PutQElem> putQ;
   std::deque<CtranMapperRequest*> iputReqs;
   uint64_t blockNum{0};
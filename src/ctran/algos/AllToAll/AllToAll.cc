@@ -117,13 +117,13 @@ static inline ncclResult_t setupKernelConfig(
   }
 
   // Allow user to customize thread block size if specified
-  config.numThreads = NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE > 0
-      ? NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE
+  config.numThreads = NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_get() > 0
+      ? NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_get()
       : bestThreadBlockSize;
 
   // Use specified grid size if specified and in limit; otherwise use default
-  if (NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS < 1 ||
-      NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS > CTRAN_ALGO_MAX_THREAD_BLOCKS) {
+  if (NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_get() < 1 ||
+      NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_get() > CTRAN_ALGO_MAX_THREAD_BLOCKS) {
     // Calculate default grid size based on block size
     unsigned int gridSize = (count + config.numThreads - 1) / config.numThreads;
     if (gridSize > CTRAN_ALGO_MAX_THREAD_BLOCKS) {
@@ -131,7 +131,7 @@ static inline ncclResult_t setupKernelConfig(
     }
     config.numBlocks = gridSize;
   } else {
-    config.numBlocks = NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS;
+    config.numBlocks = NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_get();
   }
 
   // gridSize must be even number, because we split blocks into two sets of
@@ -214,7 +214,7 @@ bool ctranAllToAllSupport(
     ncclDataType_t datatype,
     ncclComm_t comm) {
   if (ctranInitialized(comm) &&
-      ncclTypeSize(datatype) * count >= NCCL_CTRAN_ALLTOALL_THRESHOLD) {
+      ncclTypeSize(datatype) * count >= NCCL_CTRAN_ALLTOALL_THRESHOLD_get()) {
     return true;
   } else {
     return false;
@@ -60,8 +60,8 @@ static inline ncclResult_t setupKernelConfig(
     KernelConfig& config) {
   // Unlike alltoall, we cannot automatically detect grid size because each rank
   // may see different counts; use static gridSize for now.
-  config.numThreads = NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE;
-  config.numBlocks = NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS;
+  config.numThreads = NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_get();
+  config.numBlocks = NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_get();
 
   // Adjust gridSize to fit alltoallv kernel algorithm:
   // 1. gridSize must be even number, because we split blocks into two sets of
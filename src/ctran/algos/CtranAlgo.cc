@@ -73,7 +73,7 @@ ncclResult_t CtranAlgo::initDevState() {
   // Copy basic comm info to device state for collective kernel to use
   tmpDevState.localRank = this->comm_->localRank;
   tmpDevState.localRanks = this->comm_->localRanks;
-  tmpDevState.bufSize = NCCL_CTRAN_SHARED_DEVBUF_SIZE;
+  tmpDevState.bufSize = NCCL_CTRAN_SHARED_DEVBUF_SIZE_get();
   for (int localRank = 0; localRank < this->comm_->localRanks; localRank++) {
     tmpDevState.localRankToRank[localRank] =
         this->comm_->localRankToRank[localRank];
@@ -104,7 +104,7 @@ ncclResult_t CtranAlgo::initDevState() {
         allPeerToBufStatesMap[owner][i] =
             reinterpret_cast<CtranAlgoDeviceBufState*>(statePtr_d);
         allPeerToBufsMap[owner][i] =
-            (char*)bufBase_d + pos * NCCL_CTRAN_SHARED_DEVBUF_SIZE;
+            (char*)bufBase_d + pos * NCCL_CTRAN_SHARED_DEVBUF_SIZE_get();
       }
     }
   }
@@ -130,7 +130,7 @@ CtranAlgo::SharedResource::SharedResource(ncclComm* comm) {
   // |bufState_0|bufState_1|...|bufState_N-2|buf_0|buf_1|...|buf_N-2|
   std::vector<cudaIpcMemHandle_t> handles(this->comm_->localRanks);
   size_t shmSize =
-      (sizeof(CtranAlgoDeviceBufState) + NCCL_CTRAN_SHARED_DEVBUF_SIZE) *
+      (sizeof(CtranAlgoDeviceBufState) + NCCL_CTRAN_SHARED_DEVBUF_SIZE_get()) *
       (this->comm_->localRanks - 1);
 
   CUDACHECKTHROW(cudaMalloc(&this->devShmPtr_, shmSize));
@@ -73,9 +73,9 @@ CtranIbSingleton &CtranIbSingleton::getInstance(void) {
 CtranIbSingleton::CtranIbSingleton(void) {
   std::vector<RoceHca> hcas;
   // Avoid copy triggered by resize
-  hcas.reserve(NCCL_IB_HCA.size());
+  hcas.reserve(NCCL_IB_HCA_get().size());
 
-  for (const auto& hca: NCCL_IB_HCA) {
+  for (const auto& hca: NCCL_IB_HCA_get()) {
     // Copy value to each vector element so it can be freed automatically
     hcas.push_back(RoceHca(hca));
   }
@@ -89,7 +89,7 @@ CtranIbSingleton::CtranIbSingleton(void) {
 
   // Exact match: find each matching device from system returned list following
   // the specified sequence
-  if (!NCCL_IB_HCA_PREFIX.compare("=")) {
+  if (!NCCL_IB_HCA_PREFIX_get().compare("=")) {
     for (const auto& d: hcas) {
       for (int i = 0; i < nDevs; i++) {
         std::string nameStr = devs[i]->name;
@@ -109,7 +109,7 @@ CtranIbSingleton::CtranIbSingleton(void) {
       std::string nameStr = devs[i]->name;
 
       // Exclude: include only if it does not match with anyone in the excluding list
-      if (!NCCL_IB_HCA_PREFIX.compare("^")) {
+      if (!NCCL_IB_HCA_PREFIX_get().compare("^")) {
         bool exclude = false;
         for (const auto& d: hcas) {
           if (!nameStr.compare(d.name.c_str())) {
@@ -166,7 +166,7 @@ CtranIbSingleton::~CtranIbSingleton() {
     }
   }
 
-  if (NCCL_CTRAN_IB_TRAFFIC_PROFILNG) {
+  if (NCCL_CTRAN_IB_TRAFFIC_PROFILNG_get()) {
     std::lock_guard<std::mutex> guard(this->trafficRecordMutex_);
     for (auto& it : this->trafficPerDevice_) {
       INFO(
@@ -220,7 +220,7 @@ std::unordered_map<uint32_t, size_t> CtranIbSingleton::getQpTrafficSnapshot(
 void CtranIbSingleton::recordDeviceTraffic(
     struct ibv_context* ctx,
     size_t nbytes) {
-  if (!NCCL_CTRAN_IB_TRAFFIC_PROFILNG)
+  if (!NCCL_CTRAN_IB_TRAFFIC_PROFILNG_get())
     return;
 
   std::lock_guard<std::mutex> guard(this->trafficRecordMutex_);
@@ -233,7 +233,7 @@ void CtranIbSingleton::recordDeviceTraffic(
 }
 
 void CtranIbSingleton::recordQpTraffic(struct ibv_qp* qp, size_t nbytes) {
-  if (!NCCL_CTRAN_IB_TRAFFIC_PROFILNG)
+  if (!NCCL_CTRAN_IB_TRAFFIC_PROFILNG_get())
     return;
   std::lock_guard<std::mutex> guard(this->trafficRecordMutex_);
   if (this->trafficPerQP_.count(qp->qp_num) == 0) {
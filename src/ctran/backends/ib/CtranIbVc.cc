@@ -70,7 +70,7 @@ CtranIb::Impl::VirtualConn::VirtualConn(
     int port,
     int peerRank)
     : peerRank(peerRank), context_(context), pd_(pd), cq_(cq), port_(port) {
-  if (NCCL_CTRAN_IB_MAX_QPS > CTRAN_HARDCODED_MAX_QPS) {
+  if (NCCL_CTRAN_IB_MAX_QPS_get() > CTRAN_HARDCODED_MAX_QPS) {
     WARN("CTRAN-IB: CTRAN_MAX_QPS set to more than the hardcoded max value (%d)", CTRAN_HARDCODED_MAX_QPS);
   }
 
@@ -94,12 +94,12 @@ CtranIb::Impl::VirtualConn::VirtualConn(
     this->sendCtrl_.freeMsgs_.push_back(&this->sendCtrl_.cmsg_[i]);
   }
 
-  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS; i++) {
+  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS_get(); i++) {
     std::deque<CtranIbRequest *> q;
     this->put_.postedWrs_.push_back(q);
   }
 
-  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS; i++) {
+  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS_get(); i++) {
     std::deque<uint64_t> q;
     this->notifications_.push_back(q);
   }
@@ -166,7 +166,7 @@ ncclResult_t CtranIb::Impl::VirtualConn::getLocalBusCard(void *localBusCard) {
   initAttr.cap.max_recv_sge = 1;
   initAttr.cap.max_inline_data = 0;
   NCCLCHECKGOTO(wrap_ibv_create_qp(&this->controlQp_, this->pd_, &initAttr), res, exit);
-  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS; i++) {
+  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS_get(); i++) {
     struct ibv_qp *qp;
     NCCLCHECKGOTO(wrap_ibv_create_qp(&qp, this->pd_, &initAttr), res, exit);
     this->dataQps_.push_back(qp);
@@ -176,7 +176,7 @@ ncclResult_t CtranIb::Impl::VirtualConn::getLocalBusCard(void *localBusCard) {
   struct ibv_qp_attr qpAttr;
   memset(&qpAttr, 0, sizeof(struct ibv_qp_attr));
   qpAttr.qp_state = IBV_QPS_INIT;
-  qpAttr.pkey_index = NCCL_IB_PKEY;
+  qpAttr.pkey_index = NCCL_IB_PKEY_get();
   qpAttr.port_num = this->port_;
   qpAttr.qp_access_flags = IBV_ACCESS_REMOTE_WRITE | IBV_ACCESS_LOCAL_WRITE | IBV_ACCESS_REMOTE_READ;
   NCCLCHECKGOTO(
@@ -184,7 +184,7 @@ ncclResult_t CtranIb::Impl::VirtualConn::getLocalBusCard(void *localBusCard) {
                        IBV_QP_STATE | IBV_QP_PKEY_INDEX | IBV_QP_PORT | IBV_QP_ACCESS_FLAGS),
     res, exit);
 
-  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS; i++) {
+  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS_get(); i++) {
     NCCLCHECKGOTO(
         wrap_ibv_modify_qp(this->dataQps_[i], &qpAttr,
           IBV_QP_STATE | IBV_QP_PKEY_INDEX | IBV_QP_PORT | IBV_QP_ACCESS_FLAGS),
@@ -194,14 +194,14 @@ ncclResult_t CtranIb::Impl::VirtualConn::getLocalBusCard(void *localBusCard) {
   /* create local business card */
   busCard->port = this->port_;
   busCard->controlQpn = this->controlQp_->qp_num;
-  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS; i++) {
+  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS_get(); i++) {
     busCard->dataQpn[i] = this->dataQps_[i]->qp_num;
   }
   busCard->mtu = portAttr.active_mtu;
 
   if (this->linkLayer_ == IBV_LINK_LAYER_ETHERNET) {
     union ibv_gid gid;
-    NCCLCHECKGOTO(wrap_ibv_query_gid(this->context_, this->port_, NCCL_IB_GID_INDEX, &gid), res, exit);
+    NCCLCHECKGOTO(wrap_ibv_query_gid(this->context_, this->port_, NCCL_IB_GID_INDEX_get(), &gid), res, exit);
     busCard->u.eth.spn = gid.global.subnet_prefix;
     busCard->u.eth.iid = gid.global.interface_id;
   } else {
@@ -218,7 +218,7 @@ ncclResult_t CtranIb::Impl::VirtualConn::setupVc(void *remoteBusCard, uint32_t *
   struct BusCard *remoteBusCardStruct = reinterpret_cast<struct BusCard *>(remoteBusCard);
 
   *controlQp = this->controlQp_->qp_num;
-  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS; i++) {
+  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS_get(); i++) {
     dataQps.push_back(this->dataQps_[i]->qp_num);
     this->qpNumToIdx_[this->dataQps_[i]->qp_num] = i;
   }
@@ -236,14 +236,14 @@ ncclResult_t CtranIb::Impl::VirtualConn::setupVc(void *remoteBusCard, uint32_t *
     qpAttr.ah_attr.grh.dgid.global.subnet_prefix = remoteBusCardStruct->u.eth.spn;
     qpAttr.ah_attr.grh.dgid.global.interface_id = remoteBusCardStruct->u.eth.iid;
     qpAttr.ah_attr.grh.flow_label = 0;
-    qpAttr.ah_attr.grh.sgid_index = NCCL_IB_GID_INDEX;
+    qpAttr.ah_attr.grh.sgid_index = NCCL_IB_GID_INDEX_get();
     qpAttr.ah_attr.grh.hop_limit = 255;
-    qpAttr.ah_attr.grh.traffic_class = NCCL_CTRAN_IB_CTRL_TC;
+    qpAttr.ah_attr.grh.traffic_class = NCCL_CTRAN_IB_CTRL_TC_get();
   } else {
     qpAttr.ah_attr.is_global = 0;
     qpAttr.ah_attr.dlid = remoteBusCardStruct->u.ib.lid;
   }
-  qpAttr.ah_attr.sl = NCCL_IB_SL;
+  qpAttr.ah_attr.sl = NCCL_IB_SL_get();
   qpAttr.ah_attr.src_path_bits = 0;
   qpAttr.ah_attr.port_num = remoteBusCardStruct->port;
 
@@ -255,10 +255,10 @@ ncclResult_t CtranIb::Impl::VirtualConn::setupVc(void *remoteBusCard, uint32_t *
 
   if (this->linkLayer_ == IBV_LINK_LAYER_ETHERNET) {
     // Only use NCCL_CTRAN_IB_CTRL_TC for the control QP; switch back to NCCL_IB_TC for data QPs
-    qpAttr.ah_attr.grh.traffic_class = NCCL_IB_TC;
+    qpAttr.ah_attr.grh.traffic_class = NCCL_IB_TC_get();
   }
 
-  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS; i++) {
+  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS_get(); i++) {
     qpAttr.dest_qp_num = remoteBusCardStruct->dataQpn[i];
     NCCLCHECKGOTO(
         wrap_ibv_modify_qp(this->dataQps_[i], &qpAttr,
@@ -269,8 +269,8 @@ ncclResult_t CtranIb::Impl::VirtualConn::setupVc(void *remoteBusCard, uint32_t *
   /* set QP to RTS state */
   memset(&qpAttr, 0, sizeof(struct ibv_qp_attr));
   qpAttr.qp_state = IBV_QPS_RTS;
-  qpAttr.timeout = NCCL_IB_TIMEOUT;
-  qpAttr.retry_cnt = NCCL_IB_RETRY_CNT;
+  qpAttr.timeout = NCCL_IB_TIMEOUT_get();
+  qpAttr.retry_cnt = NCCL_IB_RETRY_CNT_get();
   qpAttr.rnr_retry = 7;
   qpAttr.sq_psn = 0;
   qpAttr.max_rd_atomic = 1;
@@ -279,7 +279,7 @@ ncclResult_t CtranIb::Impl::VirtualConn::setupVc(void *remoteBusCard, uint32_t *
                        IBV_QP_STATE | IBV_QP_TIMEOUT | IBV_QP_RETRY_CNT | IBV_QP_RNR_RETRY |
                        IBV_QP_SQ_PSN | IBV_QP_MAX_QP_RD_ATOMIC), res, exit);
 
-  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS; i++) {
+  for (int i = 0; i < NCCL_CTRAN_IB_MAX_QPS_get(); i++) {
     NCCLCHECKGOTO(
         wrap_ibv_modify_qp(this->dataQps_[i], &qpAttr,
           IBV_QP_STATE | IBV_QP_TIMEOUT | IBV_QP_RETRY_CNT | IBV_QP_RNR_RETRY |
@@ -291,7 +291,7 @@ ncclResult_t CtranIb::Impl::VirtualConn::setupVc(void *remoteBusCard, uint32_t *
     NCCLCHECKGOTO(this->postRecvCtrlMsg(&this->recvCtrl_.cmsg_[i]), res, exit);
     this->recvCtrl_.postedMsgs_.push_back(&this->recvCtrl_.cmsg_[i]);
 
-    for (int j = 0; j < NCCL_CTRAN_IB_MAX_QPS; j++) {
+    for (int j = 0; j < NCCL_CTRAN_IB_MAX_QPS_get(); j++) {
       NCCLCHECKGOTO(this->postRecvNotifyMsg(j), res, exit);
     }
   }
@@ -350,10 +350,10 @@ ncclResult_t CtranIb::Impl::VirtualConn::postPutMsg(const void *sbuf, void *dbuf
     uint32_t lkey, uint32_t rkey, bool localNotify, bool notify) {
   ncclResult_t res = ncclSuccess;
 
-  int numQps = (len_ / NCCL_CTRAN_IB_QP_SCALING_THRESHOLD) +
-    !!(len_ % NCCL_CTRAN_IB_QP_SCALING_THRESHOLD);
-  if (numQps > NCCL_CTRAN_IB_MAX_QPS) {
-    numQps = NCCL_CTRAN_IB_MAX_QPS;
+  int numQps = (len_ / NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get()) +
+    !!(len_ % NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get());
+  if (numQps > NCCL_CTRAN_IB_MAX_QPS_get()) {
+    numQps = NCCL_CTRAN_IB_MAX_QPS_get();
   }
 
   uint64_t offset = 0;
@@ -581,10 +581,10 @@ ncclResult_t CtranIb::Impl::VirtualConn::iput(const void *sbuf, void *dbuf, std:
 
   bool localNotify;
   if (req != nullptr) {
-    int numQps = (len / NCCL_CTRAN_IB_QP_SCALING_THRESHOLD) +
-      !!(len % NCCL_CTRAN_IB_QP_SCALING_THRESHOLD);
-    if (numQps > NCCL_CTRAN_IB_MAX_QPS) {
-      numQps = NCCL_CTRAN_IB_MAX_QPS;
+    int numQps = (len / NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get()) +
+      !!(len % NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get());
+    if (numQps > NCCL_CTRAN_IB_MAX_QPS_get()) {
+      numQps = NCCL_CTRAN_IB_MAX_QPS_get();
     }
 
     localNotify = true;
@@ -609,10 +609,10 @@ bool CtranIb::Impl::VirtualConn::checkNotify() {
     uint64_t msgSz = this->notifications_[0].front();
 
     // Calculate number of QPs used in the data transfer
-    int numQps = (msgSz / NCCL_CTRAN_IB_QP_SCALING_THRESHOLD) +
-      !!(msgSz % NCCL_CTRAN_IB_QP_SCALING_THRESHOLD);
-    if (numQps > NCCL_CTRAN_IB_MAX_QPS) {
-      numQps = NCCL_CTRAN_IB_MAX_QPS;
+    int numQps = (msgSz / NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get()) +
+      !!(msgSz % NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get());
+    if (numQps > NCCL_CTRAN_IB_MAX_QPS_get()) {
+      numQps = NCCL_CTRAN_IB_MAX_QPS_get();
     }
 
     // Return true only when received notification from all QPs
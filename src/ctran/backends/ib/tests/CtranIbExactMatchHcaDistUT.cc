@@ -74,7 +74,7 @@ TEST_F(CtranIbHcaTest, IbHcaExactMatchDev) {
     int myDevId = this->globalRank == 0 ? devId : this->localRank;
     ncclComm_t comm = createNcclComm(this->globalRank, this->numRanks, myDevId);
 
-    EXPECT_EQ(NCCL_IB_HCA_PREFIX, "=");
+    EXPECT_EQ(NCCL_IB_HCA_PREFIX_get(), "=");
 
     try {
       auto ctranIb = std::unique_ptr<class CtranIb>(new class CtranIb(comm));
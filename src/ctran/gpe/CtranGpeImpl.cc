@@ -29,7 +29,7 @@ CtranGpe::Impl::Impl() {
   *(this->kernelFlag) = UNSET;
 
   this->kernelP2pElemPool = std::unique_ptr<KernelP2pElemPool>(
-      new KernelP2pElemPool(NCCL_CTRAN_NUM_KERNEL_P2PELEMS));
+      new KernelP2pElemPool(NCCL_CTRAN_NUM_KERNEL_P2PELEMS_get()));
   return;
 }
 
@@ -138,9 +138,9 @@ static void recordRegistDuration(
   // Allow periodical snapshot report during long job running
   bool shouldReport = false;
   if (key == GlobalRegistDurationType::REG_MEM &&
-      NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT > 0 &&
+      NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() > 0 &&
       (allCommRegistDurationsMap[key].size() %
-           NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT ==
+           NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() ==
        0)) {
     shouldReport = true;
   }
@@ -161,7 +161,7 @@ CtranMapper::CtranMapper(ncclComm* comm) {
       std::unique_ptr<class CtranAvlTree>(new class CtranAvlTree());
 
   /* check user preference for backends */
-  for (auto b : NCCL_CTRAN_BACKENDS) {
+  for (auto b : NCCL_CTRAN_BACKENDS_get()) {
     if (b == NCCL_CTRAN_BACKENDS::ib) {
       this->pimpl_->backends.push_back(CtranMapperBackend::IB);
     }
@@ -208,7 +208,7 @@ CtranMapper::CtranMapper(ncclComm* comm) {
   this->rank = comm->rank;
   this->commHash = comm->commHash;
 
-  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT >= 0) {
+  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() >= 0) {
     allCommMutex.lock();
     allCommHashCtranMapperMap[this->commHash] = this;
     allCommMutex.unlock();
@@ -234,10 +234,10 @@ void CtranMapper::reportRegSnapshot(void) {
 void CtranMapper::reportProfiling(bool flush) {
   /* flush timestamps */
   if (!this->timestamps.empty() &&
-      ((this->timestamps.size() > NCCL_CTRAN_PROFILING_REPORT_COUNT ||
+      ((this->timestamps.size() > NCCL_CTRAN_PROFILING_REPORT_COUNT_get() ||
         flush))) {
-    if (NCCL_CTRAN_PROFILING == NCCL_CTRAN_PROFILING::stdout ||
-        NCCL_CTRAN_PROFILING == NCCL_CTRAN_PROFILING::info) {
+    if (NCCL_CTRAN_PROFILING_get() == NCCL_CTRAN_PROFILING::stdout ||
+        NCCL_CTRAN_PROFILING_get() == NCCL_CTRAN_PROFILING::info) {
       std::stringstream ss;
       ss << "[CTRAN-MAPPER] Communication Profiling:" << std::endl;
       for (auto& ts : this->timestamps) {
@@ -268,23 +268,23 @@ void CtranMapper::reportProfiling(bool flush) {
                     .count()
              << std::endl;
         }
-        if (NCCL_CTRAN_PROFILING == NCCL_CTRAN_PROFILING::info) {
+        if (NCCL_CTRAN_PROFILING_get() == NCCL_CTRAN_PROFILING::info) {
           INFO(NCCL_INIT, "%s", ss.str().c_str());
           ss.str("");
           ss.clear();
         }
       }
-      if (NCCL_CTRAN_PROFILING == NCCL_CTRAN_PROFILING::stdout) {
+      if (NCCL_CTRAN_PROFILING_get() == NCCL_CTRAN_PROFILING::stdout) {
         std::cout << ss.str() << std::flush;
       }
-    } else if (NCCL_CTRAN_PROFILING == NCCL_CTRAN_PROFILING::kineto) {
+    } else if (NCCL_CTRAN_PROFILING_get() == NCCL_CTRAN_PROFILING::kineto) {
       auto pid = getpid();
       static uint64_t reportCnt = 0;
       std::stringstream stream;
       char hostname[1024];
       getHostName(hostname, 1024, '.');
       std::string filename(
-          NCCL_CTRAN_KINETO_PROFILE_DIR + std::string("/nccl_ctran_log.") +
+          NCCL_CTRAN_KINETO_PROFILE_DIR_get() + std::string("/nccl_ctran_log.") +
           std::to_string(pid) + std::string(".rank") +
           std::to_string(this->rank) + "." + std::string(hostname) +
           std::string(".comm") + std::to_string(this->commHash) +
@@ -389,7 +389,7 @@ CtranMapper::~CtranMapper() {
     NCCLCHECKIGNORE(this->deregMem(hdl));
   }
 
-  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT >= 0) {
+  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() >= 0) {
     // Report summary of this communicator before destroying it
     this->reportRegSnapshot();
 
@@ -429,7 +429,7 @@ ncclResult_t CtranMapper::impl::regMem(
   }
 
   mapperRegElem->state = CtranMapperRegElemState::REGISTERED;
-  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT >= 0) {
+  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() >= 0) {
     this->numRegistrations++;
     this->totalNumRegistrations++;
     recordRegistDuration(GlobalRegistDurationType::REG_MEM, dur.durationMs());
@@ -461,7 +461,7 @@ ncclResult_t CtranMapper::impl::deregMem(
       mapperRegElem->buf,
       mapperRegElem->len,
       mapperRegElem->state);
-  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT >= 0) {
+  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() >= 0) {
     this->numRegistrations--;
     recordRegistDuration(GlobalRegistDurationType::DEREG_MEM, dur.durationMs());
   }
@@ -509,9 +509,9 @@ ncclResult_t CtranMapper::regMem(
       buf, len, reinterpret_cast<void*>(mapperRegElem));
 
   /* regiser the buffer only if on Eager mode or forced by caller */
-  if (NCCL_CTRAN_REGISTER == NCCL_CTRAN_REGISTER::eager || forceRegist) {
+  if (NCCL_CTRAN_REGISTER_get() == NCCL_CTRAN_REGISTER::eager || forceRegist) {
     NCCLCHECKGOTO(this->pimpl_->regMem(mapperRegElem), res, fail);
-  } else if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT >= 0) {
+  } else if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() >= 0) {
     // In lazy registration
     this->pimpl_->numCachedRegistrations++;
     this->pimpl_->totalNumCachedRegistrations++;
@@ -540,7 +540,7 @@ ncclResult_t CtranMapper::deregMem(void* hdl) {
 
   if (mapperRegElem->state == CtranMapperRegElemState::REGISTERED) {
     NCCLCHECKGOTO(this->pimpl_->deregMem(mapperRegElem), res, exit);
-  } else if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT >= 0) {
+  } else if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() >= 0) {
     // Just remove cache if the buffer is never registered
     this->pimpl_->numCachedRegistrations--;
   }
@@ -583,7 +583,7 @@ ncclResult_t CtranMapper::searchRegHandle(
     lookupHit = false;
   }
 
-  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT >= 0) {
+  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() >= 0) {
     if (lookupHit) {
       recordRegistDuration(
           GlobalRegistDurationType::LOOKUP_HIT, dur.durationMs());
@@ -110,7 +110,7 @@ TEST_F(CtranTest, AlgoDeviceState) {
 
   EXPECT_EQ(devState.localRanks, comm->localRanks);
   EXPECT_EQ(devState.localRank, comm->localRank);
-  EXPECT_EQ(devState.bufSize, NCCL_CTRAN_SHARED_DEVBUF_SIZE);
+  EXPECT_EQ(devState.bufSize, NCCL_CTRAN_SHARED_DEVBUF_SIZE_get());
 
   for (int i = 0; i < comm->localRanks; i++) {
     EXPECT_EQ(devState.localRankToRank[i], comm->localRankToRank[i]);
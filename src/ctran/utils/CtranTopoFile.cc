@@ -52,7 +52,7 @@ std::vector<int64_t> getTopoValsFromFile() {
   std::vector<int64_t> vals;
   std::ifstream infile;
   std::string line;
-  std::vector<std::string> keys = NCCL_CTRAN_TOPO_FILE_KEYS;
+  std::vector<std::string> keys = NCCL_CTRAN_TOPO_FILE_KEYS_get();
   std::vector<std::string> keysWithEq;
   std::unordered_map<std::string, int64_t> keyVals;
 
@@ -62,7 +62,7 @@ std::vector<int64_t> getTopoValsFromFile() {
     keysWithEq.push_back(key + "=");
   }
 
-  infile.open(NCCL_CTRAN_TOPO_FILE);
+  infile.open(NCCL_CTRAN_TOPO_FILE_get());
   if (!infile.is_open()) {
     return {};
   }
@@ -74,9 +74,9 @@ static __thread int tid = -1;
 void ncclDebugInit() {
   pthread_mutex_lock(&ncclDebugLock);
   if (ncclDebugLevel != -1) { pthread_mutex_unlock(&ncclDebugLock); return; }
-  const char* nccl_debug = NCCL_DEBUG.c_str();
+  const char* nccl_debug = NCCL_DEBUG_get().c_str();
   int tempNcclDebugLevel = -1;
-  if (NCCL_DEBUG.empty()) {
+  if (NCCL_DEBUG_get().empty()) {
     tempNcclDebugLevel = NCCL_LOG_NONE;
   } else if (strcasecmp(nccl_debug, "VERSION") == 0) {
     tempNcclDebugLevel = NCCL_LOG_VERSION;
@@ -94,8 +94,8 @@ void ncclDebugInit() {
    * This can be a comma separated list such as INIT,COLL
    * or ^INIT,COLL etc
    */
-  const char* ncclDebugSubsysEnv = NCCL_DEBUG_SUBSYS.c_str();
-  if (!NCCL_DEBUG_SUBSYS.empty()) {
+  const char* ncclDebugSubsysEnv = NCCL_DEBUG_SUBSYS_get().c_str();
+  if (!NCCL_DEBUG_SUBSYS_get().empty()) {
     int invert = 0;
     if (ncclDebugSubsysEnv[0] == '^') { invert = 1; ncclDebugSubsysEnv++; }
     ncclDebugMask = invert ? ~0ULL : 0ULL;
@@ -146,8 +146,8 @@ void ncclDebugInit() {
    * then create the debug file. But don't bother unless the
    * NCCL_DEBUG level is > VERSION
    */
-  const char* ncclDebugFileEnv = NCCL_DEBUG_FILE.c_str();
-  if (tempNcclDebugLevel > NCCL_LOG_VERSION && !NCCL_DEBUG_FILE.empty()) {
+  const char* ncclDebugFileEnv = NCCL_DEBUG_FILE_get().c_str();
+  if (tempNcclDebugLevel > NCCL_LOG_VERSION && !NCCL_DEBUG_FILE_get().empty()) {
     int c = 0;
     char debugFn[PATH_MAX+1] = "";
     char *dfn = debugFn;
@@ -238,7 +238,7 @@ void ncclDebugLog(ncclDebugLogLevel level, unsigned long flags, const char *file
     va_end(vargs);
     buffer[len++] = '\n';
 
-    if (NCCL_LOGGER_MODE == NCCL_LOGGER_MODE::sync) {
+    if (NCCL_LOGGER_MODE_get() == NCCL_LOGGER_MODE::sync) {
       fwrite(buffer, 1, len, ncclDebugFile);
     } else {
       NcclLogger::getInstance(ncclDebugFile).log(std::string(buffer, len));
@@ -257,7 +257,7 @@ void ncclSetThreadName(pthread_t thread, const char *fmt, ...) {
   // pthread_setname_np is nonstandard GNU extension
   // needs the following feature test macro
 #ifdef _GNU_SOURCE
-  if (NCCL_SET_THREAD_NAME != 1) return;
+  if (NCCL_SET_THREAD_NAME_get() != 1) return;
   char threadName[NCCL_THREAD_NAMELEN];
   va_list vargs;
   va_start(vargs, fmt);
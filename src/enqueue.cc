@@ -154,7 +154,7 @@ ncclResult_t ncclInitKernelsForDevice(int cudaArch, size_t* maxStackSize) {
   ncclResult_t result = ncclSuccess;
 
   if (maxStackSize) *maxStackSize = 0;
-  int carveout = NCCL_L1_SHARED_MEMORY_CARVEOUT;
+  int carveout = NCCL_L1_SHARED_MEMORY_CARVEOUT_get();
 
   // Keep track if we already visited a function pointer.
   void* lru[2] = {nullptr, nullptr};
@@ -419,7 +419,7 @@ static ncclResult_t addP2pToPlan(
   // 1 is connIndex
   struct ncclConnInfo* conn = isSendNotRecv ?
     &comm->channels[channelId].peers[peer]->send[1].conn : &comm->channels[channelId].peers[peer]->recv[1].conn;
-  info.protocol = ((conn->buffs[NCCL_PROTO_LL] != nullptr) && bytes <= NCCL_P2P_LL_THRESHOLD) ? NCCL_PROTO_LL : NCCL_PROTO_SIMPLE;
+  info.protocol = ((conn->buffs[NCCL_PROTO_LL] != nullptr) && bytes <= NCCL_P2P_LL_THRESHOLD_get()) ? NCCL_PROTO_LL : NCCL_PROTO_SIMPLE;
 
   struct ncclProxyOp proxyOp = {};
   NCCLCHECK(ncclProxyComputeP2p(&info, &proxyOp));
@@ -633,7 +633,7 @@ static ncclResult_t scheduleCollTasksToPlan(
       bool regBufUsed = false;
       void* regBufSend[NCCL_MAX_LOCAL_RANKS];
       void* regBufRecv[NCCL_MAX_LOCAL_RANKS];
-      if (plan->persistent && NCCL_GRAPH_REGISTER &&
+      if (plan->persistent && NCCL_GRAPH_REGISTER_get() &&
           info.algorithm == NCCL_ALGO_COLLNET_DIRECT &&   // limited to CollNetDirect for now
           comm->intraHighestTransportType == TRANSPORT_P2P && // only when all ranks can p2p each other
           comm->intraRanks < comm->localRanks) { // only with inter-process & intra-node peers
@@ -1143,7 +1143,7 @@ ncclResult_t ncclLaunchKernel(struct ncclComm* comm, struct ncclKernelPlan* plan
     if (compCap >= 90 && driverVersion >= 12000) {
       // Set the NCCL Mem Sync domain on CUDA 12.0 and later (sm90)
       launchAttrs[attrs].id = cudaLaunchAttributeMemSyncDomain;
-      if (NCCL_MEM_SYNC_DOMAIN == NCCL_MEM_SYNC_DOMAIN::local) {
+      if (NCCL_MEM_SYNC_DOMAIN_get() == NCCL_MEM_SYNC_DOMAIN::local) {
         launchAttrs[attrs++].val.memSyncDomain = cudaLaunchMemSyncDomainDefault;
       } else {
         launchAttrs[attrs++].val.memSyncDomain = cudaLaunchMemSyncDomainRemote;
@@ -1332,6 +1332,16 @@ static ncclResult_t getAlgoInfo(struct ncclInfo* info, int collNetTypeSupport, i
           info->coll, info->nBytes,
           collNetTypeSupport, info->comm->nvlsSupport, numPipeOps,
           &info->algorithm, &info->protocol, &nChannels));
+    // getCollInfo() does not get the datatype and reduction op, so the tuner
+    // cannot tell whether NVLS supports them; fall back to NCCL's choice
+    if ((info->algorithm == NCCL_ALGO_NVLS || info->algorithm == NCCL_ALGO_NVLS_TREE) &&
+        !NCCL_NVLS_SUPPORTS(info->datatype, info->opFull.op)) {
+      TRACE(NCCL_TUNING, "Tuner algo %d does not support datatype %d op %d, using default tuning",
+          info->algorithm, info->datatype, info->opFull.op);
+      info->algorithm = NCCL_ALGO_UNDEF;
+      info->protocol = NCCL_PROTO_UNDEF;
+      nChannels = 0;
+    }
   }
   NCCLCHECK(ncclTopoGetAlgoInfo(info, collNetTypeSupport, numPipeOps));
   if (nChannels) info->nChannels = nChannels; // Set by plugin; override default.
@@ -350,8 +350,8 @@ static ncclResult_t connectNvls(struct ncclComm* comm, int* nvlsHeads, struct nc
 
 int ncclMinNchannels() {
   int minNchannels = 0;
-  if (NCCL_MIN_NRINGS != -2) minNchannels = NCCL_MIN_NRINGS;
-  if (NCCL_MIN_NCHANNELS != -2) minNchannels = NCCL_MIN_NCHANNELS;
+  if (NCCL_MIN_NRINGS_get() != -2) minNchannels = NCCL_MIN_NRINGS_get();
+  if (NCCL_MIN_NCHANNELS_get() != -2) minNchannels = NCCL_MIN_NCHANNELS_get();
   if (minNchannels > MAXCHANNELS) {
     WARN("User asked for a minimum of %d channels, limiting to %d", minNchannels, MAXCHANNELS);
     minNchannels = MAXCHANNELS;
@@ -361,8 +361,8 @@ int ncclMinNchannels() {
 }
 int ncclMaxNchannels() {
   int maxNchannels = MAXCHANNELS;
-  if (NCCL_MAX_NRINGS != -2) maxNchannels = NCCL_MAX_NRINGS;
-  if (NCCL_MAX_NCHANNELS != -2) maxNchannels = NCCL_MAX_NCHANNELS;
+  if (NCCL_MAX_NRINGS_get() != -2) maxNchannels = NCCL_MAX_NRINGS_get();
+  if (NCCL_MAX_NCHANNELS_get() != -2) maxNchannels = NCCL_MAX_NCHANNELS_get();
   if (maxNchannels > MAXCHANNELS) maxNchannels = MAXCHANNELS;
   if (maxNchannels < 1) {
     WARN("User asked for a maximum of %d channels, setting it to 1", maxNchannels);
@@ -167,7 +167,7 @@ static ncclResult_t ncclTopoSetPaths(struct ncclTopoNode* baseNode, struct ncclT
 
         // allow routing through a GPU only as 1 hop
         if (node != baseNode && node->type == GPU &&
-            (NCCL_NVB_DISABLE || link->type != LINK_NVL || remNode->type != GPU || path->count > 1)) continue;
+            (NCCL_NVB_DISABLE_get() || link->type != LINK_NVL || remNode->type != GPU || path->count > 1)) continue;
 
         if ((remPath->bw == 0 || remPath->count > path->count) && remPath->bw < bw) {
           // Find reverse link
@@ -374,7 +374,7 @@ ncclResult_t ncclTopoCheckP2p(struct ncclTopoSystem* system, int64_t id1, int64_
 
   // User override
   if (ncclTopoUserP2pLevel == -1)
-    NCCLCHECK(ncclGetLevel(&ncclTopoUserP2pLevel, NCCL_P2P_DISABLE, NCCL_P2P_LEVEL));
+    NCCLCHECK(ncclGetLevel(&ncclTopoUserP2pLevel, NCCL_P2P_DISABLE_get(), NCCL_P2P_LEVEL_get()));
   if (ncclTopoUserP2pLevel != -2) {
     p2pLevel = ncclTopoUserP2pLevel;
     goto compare;
@@ -398,7 +398,7 @@ compare:
   if (*p2p == 1) {
     // NCCL_IGNORE_DISABLED_P2P=2 is used by unit tests that don't want to
     // validate against NVML at all since they are pretending to be on other hw.
-    if (g1 != g2 && NCCL_IGNORE_DISABLED_P2P != 2) {
+    if (g1 != g2 && NCCL_IGNORE_DISABLED_P2P_get() != 2) {
       int indexes[3] = {-1,-1,-1};
       int verticeN = 0;
       NCCLCHECK(ncclNvmlEnsureInitialized());
@@ -414,7 +414,7 @@ compare:
         status = ncclNvmlDevicePairs[indexes[i-1]][indexes[i-0]].p2pStatusWrite;
         good &= status == NVML_P2P_STATUS_OK;
         if (!good) {
-          if (NCCL_IGNORE_DISABLED_P2P) {
+          if (NCCL_IGNORE_DISABLED_P2P_get()) {
             *p2p = 0;
           } else if (path->type <= PATH_NVB) {
             WARN("P2P is disabled between NVLINK connected GPUs %d and %d. This should not be the case given their connectivity, and is probably due to a hardware issue. If you still want to proceed, you can set NCCL_IGNORE_DISABLED_P2P=1.", indexes[i-1], indexes[i-0]);
@@ -453,7 +453,7 @@ ncclResult_t ncclTopoCheckGdr(struct ncclTopoSystem* system, int64_t busId, int
   if (gpu->gpu.gdrSupport == 0) return ncclSuccess;
 
   if (read) { // For reads (sends) only enable under certain conditions
-    int gdrReadParam = NCCL_NET_GDR_READ;
+    int gdrReadParam = NCCL_NET_GDR_READ_get();
     if (gdrReadParam == 0) return ncclSuccess;
     if (gdrReadParam < 0) {
       int nvlink = 0;
@@ -473,7 +473,7 @@ ncclResult_t ncclTopoCheckGdr(struct ncclTopoSystem* system, int64_t busId, int
 
   // Check if we are close enough that it makes sense to enable GDR
   int netGdrLevel = PATH_PXB;
-  NCCLCHECK(ncclGetLevel(&ncclTopoUserGdrLevel, "", NCCL_NET_GDR_LEVEL));
+  NCCLCHECK(ncclGetLevel(&ncclTopoUserGdrLevel, "", NCCL_NET_GDR_LEVEL_get()));
   if (ncclTopoUserGdrLevel != -2) netGdrLevel = ncclTopoUserGdrLevel;
   int distance = gpu->paths[NET][n].type;
   if (distance == PATH_PXN) {
@@ -500,13 +500,13 @@ ncclResult_t ncclTopoNeedFlush(struct ncclTopoSystem* system, int64_t busId, int
   NCCLCHECK(ncclTopoIdToIndex(system, GPU, busId, &g));
   struct ncclTopoNode* gpu = system->nodes[GPU].nodes+g;
   // Flush is required on Ampere and earlier
-  *flush = gpu->gpu.cudaCompCap < 90 ? 1 : NCCL_NET_FORCE_FLUSH;
+  *flush = gpu->gpu.cudaCompCap < 90 ? 1 : NCCL_NET_FORCE_FLUSH_get();
   return ncclSuccess;
 }
 
 // Check whether going through the network would be faster than going through P2P/SHM.
 ncclResult_t ncclTopoCheckNet(struct ncclTopoSystem* system, int64_t id1, int64_t id2, int* net) {
-  if (NCCL_NET_DISABLE_INTRA == 1) {
+  if (NCCL_NET_DISABLE_INTRA_get() == 1) {
     *net = 0;
     return ncclSuccess;
   }
@@ -570,7 +570,7 @@ int ncclPxnDisable(struct ncclComm* comm) {
       INFO(NCCL_INIT, "PXN Disabled as plugin is v4");
       pxnDisable = 1;
     } else {
-      pxnDisable = NCCL_PXN_DISABLE;
+      pxnDisable = NCCL_PXN_DISABLE_get();
     }
   }
   return pxnDisable;
@@ -771,7 +771,7 @@ static ncclResult_t ncclTopoGetNchannels(struct ncclTopoSystem* system, int g /*
     }
   } else {
     // Remote rank, use network
-    *nChannels = NCCL_NCHANNELS_PER_NET_PEER;
+    *nChannels = NCCL_NCHANNELS_PER_NET_PEER_get();
   }
   return ncclSuccess;
 }
@@ -784,13 +784,13 @@ static int nextPow2(int v) {
 
 ncclResult_t ncclTopoComputeP2pChannels(struct ncclComm* comm) {
   /* here we already honor comm->max/minCTAs for p2pnChannels. */
-  int maxChannels = std::min((int) NCCL_MAX_P2P_NCHANNELS, MAXCHANNELS);
+  int maxChannels = std::min((int) NCCL_MAX_P2P_NCHANNELS_get(), MAXCHANNELS);
   if (comm->sharedRes->owner != comm) {
     comm->p2pnChannels = std::min(comm->nChannels, maxChannels);
-    comm->p2pnChannels = std::min(std::max(comm->p2pnChannels, (int)NCCL_MIN_P2P_NCHANNELS), comm->sharedRes->tpP2pNChannels);
+    comm->p2pnChannels = std::min(std::max(comm->p2pnChannels, (int)NCCL_MIN_P2P_NCHANNELS_get()), comm->sharedRes->tpP2pNChannels);
   } else {
     comm->p2pnChannels = std::min(comm->nChannels, maxChannels);
-    comm->p2pnChannels = std::max(comm->p2pnChannels, (int)NCCL_MIN_P2P_NCHANNELS);
+    comm->p2pnChannels = std::max(comm->p2pnChannels, (int)NCCL_MIN_P2P_NCHANNELS_get());
   }
 
   int minChannels = comm->p2pnChannels;
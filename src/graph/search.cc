@@ -735,7 +735,7 @@ ncclResult_t ncclTopoGetGraphFromXmlSub(struct ncclXmlNode *xmlGraph, struct ncc
 
   int crossNic;
   NCCLCHECK(xmlGetAttrInt(xmlGraph, "crossnic", &crossNic));
-  if (NCCL_CROSS_NIC == 0 && crossNic == 1) return ncclSuccess;
+  if (NCCL_CROSS_NIC_get() == 0 && crossNic == 1) return ncclSuccess;
   graph->crossNic = crossNic;
 
   NCCLCHECK(xmlGetAttrInt(xmlGraph, "pattern", &graph->pattern));
@@ -836,7 +836,7 @@ float sm90SpeedArrayInter[] = { 48.0, 45.0, 42.0, 40.0, 30.0, 24.0, 20.0, 17.5,
 
 ncclResult_t ncclTopoCompute(ncclTopoSystem* system, struct ncclTopoGraph* graph) {
   int ngpus = system->nodes[GPU].count;
-  graph->crossNic = NCCL_CROSS_NIC;
+  graph->crossNic = NCCL_CROSS_NIC_get();
   int crossNic = (system->nodes[NET].count > 1) && graph->crossNic &&
 	 (graph->pattern == NCCL_TOPO_PATTERN_RING ||
 	  graph->pattern == NCCL_TOPO_PATTERN_BALANCED_TREE ||
@@ -850,11 +850,11 @@ ncclResult_t ncclTopoCompute(ncclTopoSystem* system, struct ncclTopoGraph* graph
   int trySameChannels = graph->pattern == NCCL_TOPO_PATTERN_NVLS ? 0 : 1;
   graph->sameChannels = trySameChannels;
 
-  if (!NCCL_GRAPH_FILE.empty()) {
-    INFO(NCCL_ENV, "NCCL_GRAPH_FILE set by environment to %s", NCCL_GRAPH_FILE.c_str());
+  if (!NCCL_GRAPH_FILE_get().empty()) {
+    INFO(NCCL_ENV, "NCCL_GRAPH_FILE set by environment to %s", NCCL_GRAPH_FILE_get().c_str());
     struct ncclXml* xml;
     NCCLCHECK(ncclCalloc(&xml, 1));
-    NCCLCHECK(ncclTopoGetXmlGraphFromFile(NCCL_GRAPH_FILE.c_str(), xml));
+    NCCLCHECK(ncclTopoGetXmlGraphFromFile(NCCL_GRAPH_FILE_get().c_str(), xml));
     int nChannels;
     NCCLCHECK(ncclTopoGetGraphFromXml(xml->nodes, system, graph, &nChannels));
     INFO(NCCL_GRAPH, "Search %d : %d channels loaded from XML graph", graph->id, nChannels);
@@ -1042,12 +1042,12 @@ ncclResult_t ncclTopoPrintGraph(struct ncclTopoSystem* system, struct ncclTopoGr
 }
 
 ncclResult_t ncclTopoDumpGraphs(struct ncclTopoSystem* system, int ngraphs, struct ncclTopoGraph** graphs) {
-  if (!NCCL_GRAPH_DUMP_FILE.empty()) {
-    INFO(NCCL_ENV, "NCCL_GRAPH_DUMP_FILE set by environment to %s", NCCL_GRAPH_DUMP_FILE.c_str());
+  if (!NCCL_GRAPH_DUMP_FILE_get().empty()) {
+    INFO(NCCL_ENV, "NCCL_GRAPH_DUMP_FILE set by environment to %s", NCCL_GRAPH_DUMP_FILE_get().c_str());
     struct ncclXml* xml;
     NCCLCHECK(ncclCalloc(&xml, 1));
     NCCLCHECK(ncclTopoGetXmlFromGraphs(ngraphs, graphs, system, xml));
-    NCCLCHECK(ncclTopoDumpXmlToFile(NCCL_GRAPH_DUMP_FILE.c_str(), xml));
+    NCCLCHECK(ncclTopoDumpXmlToFile(NCCL_GRAPH_DUMP_FILE_get().c_str(), xml));
     free(xml);
   }
   return ncclSuccess;
@@ -1086,9 +1086,9 @@ ncclResult_t ncclTopoGetNetDev(struct ncclComm* comm, int rank, struct ncclTopoG
     NCCLCHECK(ncclTopoGetLocalNet(comm->topo, rank, channelId, dev));
     *proxyRank = rank;
 
-    int pxnLevel = ncclPxnDisable(comm) == 1 ? 0 : NCCL_P2P_PXN_LEVEL;
+    int pxnLevel = ncclPxnDisable(comm) == 1 ? 0 : NCCL_P2P_PXN_LEVEL_get();
     // See whether we can use the remote rank preferred device.
-    if (NCCL_CROSS_NIC == 0 || (pxnLevel != 0)) {
+    if (NCCL_CROSS_NIC_get() == 0 || (pxnLevel != 0)) {
       // Find local NIC number close to local nvmlDev
       int nvmlDev = comm->peerInfo[peerRank].nvmlDev;
       int localRank;
@@ -1098,7 +1098,7 @@ ncclResult_t ncclTopoGetNetDev(struct ncclComm* comm, int rank, struct ncclTopoG
 
       int n;
       // Check that device exists on our node
-      if (NCCL_CROSS_NIC == 0) {
+      if (NCCL_CROSS_NIC_get() == 0) {
         if (ncclTopoIdToIndex(comm->topo, NET, netDev, &n) != ncclSuccess) {
           WARN("Rank %d requires NIC %d but that NIC is not available for rank %d", peerRank, netDev, rank);
           return ncclInvalidUsage;
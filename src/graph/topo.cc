@@ -632,9 +632,9 @@ static ncclResult_t xmlInitAttrFloat(struct ncclXmlNode* node, const char* attrN
 ncclResult_t ncclTopoGetSystem(struct ncclComm* comm, struct ncclTopoSystem** system) {
   struct ncclXml* xml;
   NCCLCHECK(ncclCalloc(&xml, 1));
-  if (NCCL_TOPO_FILE != NCCL_TOPO_FILE_DEFAULT) {
-    INFO(NCCL_ENV, "NCCL_TOPO_FILE set by environment to %s", NCCL_TOPO_FILE.c_str());
-    NCCLCHECK(ncclTopoGetXmlFromFile(NCCL_TOPO_FILE.c_str(), xml, 1));
+  if (NCCL_TOPO_FILE_get() != NCCL_TOPO_FILE_DEFAULT) {
+    INFO(NCCL_ENV, "NCCL_TOPO_FILE set by environment to %s", NCCL_TOPO_FILE_get().c_str());
+    NCCLCHECK(ncclTopoGetXmlFromFile(NCCL_TOPO_FILE_get().c_str(), xml, 1));
   } else {
     // Try default XML topology location
     NCCLCHECK(ncclTopoGetXmlFromFile(NCCL_TOPO_FILE_DEFAULT.c_str(), xml, 0));
@@ -704,9 +704,9 @@ ncclResult_t ncclTopoGetSystem(struct ncclComm* comm, struct ncclTopoSystem** sy
   // Remove XML branches which don't have a node with keep="1" (typically when importing a topology)
   NCCLCHECK(ncclTopoTrimXml(xml));
 
-  if (!NCCL_TOPO_DUMP_FILE.empty() && comm->rank == NCCL_TOPO_DUMP_FILE_RANK) {
-    INFO(NCCL_ENV, "NCCL_TOPO_DUMP_FILE set by environment to %s", NCCL_TOPO_DUMP_FILE.c_str());
-    NCCLCHECK(ncclTopoDumpXmlToFile(NCCL_TOPO_DUMP_FILE.c_str(), xml));
+  if (!NCCL_TOPO_DUMP_FILE_get().empty() && comm->rank == NCCL_TOPO_DUMP_FILE_RANK_get()) {
+    INFO(NCCL_ENV, "NCCL_TOPO_DUMP_FILE set by environment to %s", NCCL_TOPO_DUMP_FILE_get().c_str());
+    NCCLCHECK(ncclTopoDumpXmlToFile(NCCL_TOPO_DUMP_FILE_get().c_str(), xml));
   }
 
   NCCLCHECK(ncclTopoGetSystemFromXml(xml, system));
@@ -893,7 +893,7 @@ ncclResult_t ncclTopoGetCpuAffinity(struct ncclTopoSystem* system, int rank, cpu
 #endif
 
   cpu_set_t finalMask;
-  if (NCCL_IGNORE_CPU_AFFINITY)
+  if (NCCL_IGNORE_CPU_AFFINITY_get())
     // Ignore the CPU affinity set and use the GPU one instead
     finalMask = cpuMask;
   else
@@ -155,7 +155,7 @@ static const double perChMaxTreeBws[3][3] = {
 };
 
 static float getNetOverhead(struct ncclComm* comm) {
-  if (NCCL_NET_OVERHEAD != -2) return NCCL_NET_OVERHEAD * .001;
+  if (NCCL_NET_OVERHEAD_get() != -2) return NCCL_NET_OVERHEAD_get() * .001;
   int cpuArch, cpuVendor, cpuModel;
   NCCLCHECK(ncclTopoCpuType(comm->topo, &cpuArch, &cpuVendor, &cpuModel));
   if (cpuArch == NCCL_TOPO_CPU_ARCH_X86 && cpuVendor == NCCL_TOPO_CPU_VENDOR_INTEL) return 1.0;
@@ -166,17 +166,17 @@ static float getNetOverhead(struct ncclComm* comm) {
 ncclResult_t ncclTopoTuneModel(struct ncclComm* comm, int minCompCap, int maxCompCap, struct ncclTopoGraph** graphs) {
   int simpleDefaultThreads = (graphs[NCCL_ALGO_RING]->bwIntra*graphs[NCCL_ALGO_RING]->nChannels <= PCI_BW) ? 256 : NCCL_SIMPLE_MAX_NTHREADS;
   comm->maxThreads[NCCL_ALGO_RING][NCCL_PROTO_SIMPLE] =
-    getNthreads("NCCL_NTHREADS", NCCL_NTHREADS, 2*WARP_SIZE, NCCL_SIMPLE_MAX_NTHREADS, simpleDefaultThreads);
+    getNthreads("NCCL_NTHREADS", NCCL_NTHREADS_get(), 2*WARP_SIZE, NCCL_SIMPLE_MAX_NTHREADS, simpleDefaultThreads);
   comm->maxThreads[NCCL_ALGO_TREE][NCCL_PROTO_SIMPLE] =
-    getNthreads("NCCL_NTHREADS", NCCL_NTHREADS, 2*WARP_SIZE, NCCL_SIMPLE_MAX_NTHREADS, NCCL_SIMPLE_MAX_NTHREADS);
+    getNthreads("NCCL_NTHREADS", NCCL_NTHREADS_get(), 2*WARP_SIZE, NCCL_SIMPLE_MAX_NTHREADS, NCCL_SIMPLE_MAX_NTHREADS);
   comm->maxThreads[NCCL_ALGO_COLLNET_DIRECT][NCCL_PROTO_SIMPLE] =
     comm->maxThreads[NCCL_ALGO_COLLNET_CHAIN][NCCL_PROTO_SIMPLE] =
     comm->maxThreads[NCCL_ALGO_NVLS][NCCL_PROTO_SIMPLE] =
     comm->maxThreads[NCCL_ALGO_NVLS_TREE][NCCL_PROTO_SIMPLE] = NCCL_MAX_NTHREADS;
   comm->maxThreads[NCCL_ALGO_RING][NCCL_PROTO_LL] = comm->maxThreads[NCCL_ALGO_TREE][NCCL_PROTO_LL] =
-    getNthreads("NCCL_NTHREADS", NCCL_NTHREADS, 2*WARP_SIZE, NCCL_LL_MAX_NTHREADS, NCCL_LL_MAX_NTHREADS);
+    getNthreads("NCCL_NTHREADS", NCCL_NTHREADS_get(), 2*WARP_SIZE, NCCL_LL_MAX_NTHREADS, NCCL_LL_MAX_NTHREADS);
   comm->maxThreads[NCCL_ALGO_RING][NCCL_PROTO_LL128] = comm->maxThreads[NCCL_ALGO_TREE][NCCL_PROTO_LL128] =
-    getNthreads("NCCL_LL128_NTHREADS", NCCL_LL128_NTHREADS, NCCL_LL128_MAX_NTHREADS/4, NCCL_LL128_MAX_NTHREADS, NCCL_LL128_MAX_NTHREADS);
+    getNthreads("NCCL_LL128_NTHREADS", NCCL_LL128_NTHREADS_get(), NCCL_LL128_MAX_NTHREADS/4, NCCL_LL128_MAX_NTHREADS, NCCL_LL128_MAX_NTHREADS);
 
   int nNodes = comm->nNodes;
   int nRanks = comm->nRanks;
@@ -292,13 +292,13 @@ ncclResult_t ncclTopoTuneModel(struct ncclComm* comm, int minCompCap, int maxCom
   int protoEnable[NCCL_NUM_PROTOCOLS] = { 1, 2, 1 };
   int algoEnable[NCCL_NUM_ALGORITHMS] = { 1, 1, 1, 1, 1, 1 };
 
-  if (!NCCL_PROTO.empty()) {
-    INFO(NCCL_ENV, "NCCL_PROTO set by environment to %s", NCCL_PROTO.c_str());
-    NCCLCHECK(parseList(NCCL_PROTO.c_str(), ncclProtoStr, NCCL_NUM_PROTOCOLS, protoEnable));
+  if (!NCCL_PROTO_get().empty()) {
+    INFO(NCCL_ENV, "NCCL_PROTO set by environment to %s", NCCL_PROTO_get().c_str());
+    NCCLCHECK(parseList(NCCL_PROTO_get().c_str(), ncclProtoStr, NCCL_NUM_PROTOCOLS, protoEnable));
   }
-  if (!NCCL_ALGO.empty()) {
-    INFO(NCCL_ENV, "NCCL_ALGO set by environment to %s", NCCL_ALGO.c_str());
-    NCCLCHECK(parseList(NCCL_ALGO.c_str(), ncclAlgoStr, NCCL_NUM_ALGORITHMS, algoEnable));
+  if (!NCCL_ALGO_get().empty()) {
+    INFO(NCCL_ENV, "NCCL_ALGO set by environment to %s", NCCL_ALGO_get().c_str());
+    NCCLCHECK(parseList(NCCL_ALGO_get().c_str(), ncclAlgoStr, NCCL_NUM_ALGORITHMS, algoEnable));
   }
 
   if (comm->nNodes == 1) algoEnable[NCCL_ALGO_NVLS_TREE] = 0;
@@ -390,10 +390,10 @@ ncclResult_t ncclTopoTuneModel(struct ncclComm* comm, int minCompCap, int maxCom
   comm->threadThresholds[NCCL_ALGO_COLLNET_CHAIN][NCCL_PROTO_SIMPLE] = 512;
 
   // Override defaults with user env
-  if (!NCCL_THREAD_THRESHOLDS.empty()) {
-    INFO(NCCL_ENV, "NCCL_THREAD_THRESHOLDS set by environment to %s", NCCL_THREAD_THRESHOLDS.c_str());
+  if (!NCCL_THREAD_THRESHOLDS_get().empty()) {
+    INFO(NCCL_ENV, "NCCL_THREAD_THRESHOLDS set by environment to %s", NCCL_THREAD_THRESHOLDS_get().c_str());
     ssize_t t[2][NCCL_NUM_PROTOCOLS] = {{ -2, -2, -2 }, { -2, -2, -2 }};
-    sscanf(NCCL_THREAD_THRESHOLDS.c_str(), "%ld %ld %ld %ld %ld %ld", t[0], t[0]+1, t[0]+2, t[1], t[1]+1, t[1]+2);
+    sscanf(NCCL_THREAD_THRESHOLDS_get().c_str(), "%ld %ld %ld %ld %ld %ld", t[0], t[0]+1, t[0]+2, t[1], t[1]+1, t[1]+2);
     for (int a=0; a<2; a++) {
       for (int p=0; p<NCCL_NUM_PROTOCOLS; p++) {
         if (t[a][p] >= 0) comm->threadThresholds[a][p] = t[a][p];
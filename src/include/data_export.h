@@ -4,6 +4,19 @@
 #include "comm.h"
 #include "nccl.h"
 
+/*
+=== BEGIN_NCCL_CVAR_INFO_BLOCK ===
+
+ - name        : NCCL_DATA_EXPORT_DIR
+   type        : string
+   default     : "/tmp"
+   description : |-
+     Directory for NCCL data exporter to dump.
+     Can be either local or FB internal remote URL.
+
+=== END_NCCL_CVAR_INFO_BLOCK ===
+*/
+
 #ifdef ENABLE_FB_DATA_EXPORT
 ncclResult_t ncclDataExport(
     const void* sendbuff,
@@ -19,6 +19,7 @@
 #include "tuner.h"
 #include "colltrace.h"
 #include "AlgoInit.h"
+#include "FbInternal.h"
 #include <fcntl.h>
 #include <string.h>
 #include <errno.h>
@@ -28,6 +29,9 @@
 #include <sys/stat.h>
 #include <unistd.h>
 #include <cstdlib>
+#include <fstream>
+#include <mutex>
+#include <sstream>
 
 /*
 === BEGIN_NCCL_CVAR_INFO_BLOCK ===
@@ -258,6 +262,15 @@
      network module. For more information:
      https://docs.nvidia.com/deeplearning/nccl/user-guide/docs/env.html#nccl-net
 
+ - name        : NCCL_CVAR_SNAPSHOT_DIR
+   type        : string
+   default     : ""
+   description : |-
+     Directory to which each rank writes the cvars it runs with that differ
+     from their default, as <rank>_cvars.json, once its first communicator
+     is initialized. Can be either local or FB internal remote URL.
+     maint/cvarskew.py reports the ranks whose settings differ.
+
 === END_NCCL_CVAR_INFO_BLOCK ===
 */
 
@@ -294,7 +307,7 @@ static uint64_t hashUniqueId(ncclUniqueId const &id) {
 gdr_t ncclGdrCopy = NULL;
 
 ncclResult_t initGdrCopy() {
-  if (NCCL_GDRCOPY_ENABLE == 1) {
+  if (NCCL_GDRCOPY_ENABLE_get() == 1) {
     ncclGdrCopy = ncclGdrInit();
   }
   return ncclSuccess;
@@ -483,7 +496,7 @@ enum ncclLaunchMode ncclParamLaunchMode;
 
 // Detect DMA-BUF support
 static ncclResult_t dmaBufSupported(struct ncclComm* comm) {
-  if (NCCL_DMABUF_ENABLE == 0 || comm->ncclNet->regMrDmaBuf == NULL || ncclCudaLibraryInit() != ncclSuccess) return ncclInternalError;
+  if (NCCL_DMABUF_ENABLE_get() == 0 || comm->ncclNet->regMrDmaBuf == NULL || ncclCudaLibraryInit() != ncclSuccess) return ncclInternalError;
 #if CUDA_VERSION >= 11070
   int flag = 0;
   CUdevice dev;
@@ -559,7 +572,7 @@ static ncclResult_t commAlloc(struct ncclComm* comm, struct ncclComm* parent, in
   comm->compCap = ncclCudaCompCap();
   TRACE(NCCL_INIT,"comm %p rank %d nranks %d cudaDev %d busId %lx compCap %d", comm, rank, ndev, comm->cudaDev, comm->busId, comm->compCap);
 
-  comm->checkPointers = NCCL_CHECK_POINTERS == 1 ? true : false;
+  comm->checkPointers = NCCL_CHECK_POINTERS_get() == 1 ? true : false;
   comm->dmaBufSupport = (dmaBufSupported(comm) == ncclSuccess) ? true : false;
 
   comm->collNetSupport = 0;
@@ -625,14 +638,14 @@ static ncclResult_t devCommSetup(ncclComm_t comm) {
   }
   tmpCommAndChans.comm.channels = &devCommAndChans->channels[0];
 
-  comm->workFifoDepth = NCCL_WORK_FIFO_DEPTH;
+  comm->workFifoDepth = NCCL_WORK_FIFO_DEPTH_get();
   if (0 != (comm->workFifoDepth & (comm->workFifoDepth-1))) {
     WARN("NCCL_WORK_FIFO_DEPTH=%d is being ignored because it is not a power of 2.", comm->workFifoDepth);
     comm->workFifoDepth = 64<<10;
   }
   tmpCommAndChans.comm.workFifoDepth = comm->workFifoDepth;
 
-  if (ncclGdrCopy != NULL && NCCL_GDRCOPY_FIFO_ENABLE == 1) {
+  if (ncclGdrCopy != NULL && NCCL_GDRCOPY_FIFO_ENABLE_get() == 1) {
     // The workFifoHeap lives in GDR mapped CUDA memory.
     NCCLCHECKGOTO(ncclGdrCudaCalloc(&comm->workFifoHeap, &comm->devWorkFifoHeap, comm->workFifoDepth, &comm->workFifoHeapGdrHandle), ret, fail);
     ncclCommPushCudaGdrFree(comm, comm->workFifoHeapGdrHandle);
@@ -736,7 +749,7 @@ static ncclResult_t computeBuffSizes(struct ncclComm* comm) {
   int cpuArch, cpuVendor, cpuModel;
   NCCLCHECK(ncclTopoCpuType(comm->topo, &cpuArch, &cpuVendor, &cpuModel));
 
-  int64_t envs[NCCL_NUM_PROTOCOLS] = { NCCL_LL_BUFFSIZE, NCCL_LL128_BUFFSIZE, NCCL_BUFFSIZE };
+  int64_t envs[NCCL_NUM_PROTOCOLS] = { NCCL_LL_BUFFSIZE_get(), NCCL_LL128_BUFFSIZE_get(), NCCL_BUFFSIZE_get() };
   int defaults[NCCL_NUM_PROTOCOLS] = { DEFAULT_LL_BUFFSIZE, DEFAULT_LL128_BUFFSIZE, DEFAULT_BUFFSIZE };
 
   if (cpuArch == NCCL_TOPO_CPU_ARCH_ARM) defaults[NCCL_PROTO_SIMPLE] = DEFAULT_BUFFSIZE_ARM;
@@ -745,9 +758,9 @@ static ncclResult_t computeBuffSizes(struct ncclComm* comm) {
     comm->buffSizes[p] = envs[p] != -2 ? envs[p] : defaults[p];
   }
 
-  if (comm->nNodes > 1) comm->p2pChunkSize = NCCL_P2P_NET_CHUNKSIZE;
-  else if (ncclTopoPathAllNVLink(comm->topo)) comm->p2pChunkSize = NCCL_P2P_NVL_CHUNKSIZE;
-  else comm->p2pChunkSize = NCCL_P2P_PCI_CHUNKSIZE;
+  if (comm->nNodes > 1) comm->p2pChunkSize = NCCL_P2P_NET_CHUNKSIZE_get();
+  else if (ncclTopoPathAllNVLink(comm->topo)) comm->p2pChunkSize = NCCL_P2P_NVL_CHUNKSIZE_get();
+  else comm->p2pChunkSize = NCCL_P2P_PCI_CHUNKSIZE_get();
   if (comm->sharedRes->owner != comm) {
     /* make sure split comm p2pChunkSize won't exceed shared p2pChunkSize. */
     comm->p2pChunkSize = std::min(comm->p2pChunkSize, comm->sharedRes->tpP2pChunkSize);
@@ -1077,9 +1090,9 @@ static ncclResult_t initTransportsRank(struct ncclComm* comm, struct ncclComm* p
 
   // Determine local CollNet support
   if (collNetSupport(comm)) {
-    if (!NCCL_COLLNET_ENABLE.empty()) {
-      INFO(NCCL_ALL, "NCCL_COLLNET_ENABLE set by environment to %s.", NCCL_COLLNET_ENABLE.c_str());
-      if (NCCL_COLLNET_ENABLE == "1") {
+    if (!NCCL_COLLNET_ENABLE_get().empty()) {
+      INFO(NCCL_ALL, "NCCL_COLLNET_ENABLE set by environment to %s.", NCCL_COLLNET_ENABLE_get().c_str());
+      if (NCCL_COLLNET_ENABLE_get() == "1") {
         comm->collNetSupport = 1;
       }
     }
@@ -1129,9 +1142,9 @@ static ncclResult_t initTransportsRank(struct ncclComm* comm, struct ncclComm* p
   }
 
   // Initialize num P2P LL buffers for this communicator
-  comm->allocP2pNetLLBuffers = NCCL_ALLOC_P2P_NET_LL_BUFFERS == 1;
+  comm->allocP2pNetLLBuffers = NCCL_ALLOC_P2P_NET_LL_BUFFERS_get() == 1;
 
-  if (comm->rank == NCCL_GRAPH_DUMP_FILE_RANK) {
+  if (comm->rank == NCCL_GRAPH_DUMP_FILE_RANK_get()) {
     struct ncclTopoGraph* dumpGraphs[4] = { &ringGraph, &treeGraph, &collNetGraph, &nvlsGraph };
     NCCLCHECKGOTO(ncclTopoDumpGraphs(comm->topo, 4, dumpGraphs), ret, fail);
   }
@@ -1230,7 +1243,7 @@ static ncclResult_t initTransportsRank(struct ncclComm* comm, struct ncclComm* p
 
   // Determine CollNet support after all-gather now that we know nNodes and each node localRanks
   if (comm->collNetSupport == 1) {
-    int collNetNodeThreshold = NCCL_COLLNET_NODE_THRESHOLD;
+    int collNetNodeThreshold = NCCL_COLLNET_NODE_THRESHOLD_get();
     if (comm->nNodes < collNetNodeThreshold) {
       INFO(NCCL_INIT, "Communicator has %d nodes which is less than CollNet node threshold %d, disabling CollNet", comm->nNodes, collNetNodeThreshold);
       comm->collNetSupport = 0;
@@ -1373,7 +1386,7 @@ static ncclResult_t initTransportsRank(struct ncclComm* comm, struct ncclComm* p
     assert(i == tasks->p2pOrderSteps);
   } while (0);
 
-  if (NCCL_NVB_PRECONNECT) {
+  if (NCCL_NVB_PRECONNECT_get()) {
     // Connect p2p when using NVB path
     int nvbNpeers;
     NCCLCHECKGOTO(ncclTopoGetNvbGpus(comm->topo, comm->rank, &nvbNpeers, &nvbPeers), ret, fail);
@@ -1415,7 +1428,7 @@ static ncclResult_t initTransportsRank(struct ncclComm* comm, struct ncclComm* p
 
   if (comm->intraRank == 0) { // Load ncclParamLaunchMode
     enum ncclLaunchMode mode, modeOld;
-    if (strcasecmp(NCCL_LAUNCH_MODE.c_str(), "GROUP") == 0) {
+    if (strcasecmp(NCCL_LAUNCH_MODE_get().c_str(), "GROUP") == 0) {
       mode = ncclLaunchModeGroup;
     } else {
       mode = ncclLaunchModeParallel;
@@ -1423,7 +1436,7 @@ static ncclResult_t initTransportsRank(struct ncclComm* comm, struct ncclComm* p
     // In theory we could be racing with other communicators not associated with
     // this one if the user is connecting to multiple ncclUniqueId's concurrently.
     modeOld = __atomic_exchange_n(&ncclParamLaunchMode, mode, __ATOMIC_RELAXED);
-    if (modeOld == ncclLaunchModeInvalid && !NCCL_LAUNCH_MODE.empty()) {
+    if (modeOld == ncclLaunchModeInvalid && !NCCL_LAUNCH_MODE_get().empty()) {
       INFO(NCCL_ENV, "NCCL_LAUNCH_MODE set by environment to %s", mode == ncclLaunchModeParallel ? "PARALLEL" : "GROUP");
     }
   }
@@ -1523,6 +1536,29 @@ fail:
   goto exit;
 }
 
+// Write the non-default cvars of this rank to NCCL_CVAR_SNAPSHOT_DIR
+static void writeCvarSnapshot(struct ncclComm* comm) {
+  char hostname[1024];
+  getHostName(hostname, sizeof(hostname), '.');
+
+  std::stringstream stream;
+  stream << "{\"rank\":" << comm->rank << ",\"nranks\":" << comm->nRanks
+         << ",\"host\":" << ncclCvarJsonString(hostname) << ",\"pid\":" << getpid()
+         << ",\"commHash\":" << comm->commHash
+         << ",\"cvars\":" << ncclCvarSnapshot() << "}\n";
+
+  const std::string fileName =
+      NCCL_CVAR_SNAPSHOT_DIR_get() + "/" + std::to_string(comm->rank) + "_cvars.json";
+  INFO(NCCL_INIT, "Rank %d: Writing cvar snapshot to : %s", comm->rank, fileName.c_str());
+  if (ncclIsFbPath(fileName)) {
+    ncclFbUpload(stream.str(), fileName);
+  } else {
+    std::ofstream f(fileName);
+    f << stream.str();
+    f.close();
+  }
+}
+
 static ncclResult_t ncclCommInitRankFunc(struct ncclAsyncJob* job_) {
   struct ncclCommInitRankAsyncJob* job = (struct ncclCommInitRankAsyncJob*)job_;
   ncclComm_t comm = job->comm;
@@ -1547,7 +1583,7 @@ static ncclResult_t ncclCommInitRankFunc(struct ncclAsyncJob* job_) {
   NCCLCHECK(ncclInitKernelsForDevice(cudaArch, &maxLocalSizeBytes));
   // Set the maximum kernel stack size of all kernels to avoid
   // a CUDA memory reconfig on load (c.f. NVSHMEM issue)
-  if (maxLocalSizeBytes > 0 && NCCL_SET_STACK_SIZE == 1) {
+  if (maxLocalSizeBytes > 0 && NCCL_SET_STACK_SIZE_get() == 1) {
     TRACE(NCCL_INIT, "Setting cudaLimitStackSize to %zi", maxLocalSizeBytes);
     CUDACHECKIGNORE(cudaDeviceSetLimit(cudaLimitStackSize, maxLocalSizeBytes));
   }
@@ -1609,6 +1645,12 @@ static ncclResult_t ncclCommInitRankFunc(struct ncclAsyncJob* job_) {
 
   NCCLCHECKGOTO(ncclCommInitWorld(comm), res, fail);
 
+  // Only the communicators created from a unique id see every rank of a job
+  if (!job->parent && !NCCL_CVAR_SNAPSHOT_DIR_get().empty()) {
+    static std::once_flag snapshotOnce;
+    std::call_once(snapshotOnce, writeCvarSnapshot, comm);
+  }
+
 exit:
   if (job->newcomm) {
     /* assign it to user pointer. */
@@ -1638,11 +1680,11 @@ static ncclResult_t envConfigOverride(ncclComm_t comm) {
   int splitShareEnv;
 
   /* override configuration from env variable. */
-  blockingEnv = NCCL_COMM_BLOCKING;
+  blockingEnv = NCCL_COMM_BLOCKING_get();
   if (blockingEnv == 0 || blockingEnv == 1)
     comm->config.blocking = blockingEnv;
 
-  cgaClusterSizeEnv = NCCL_CGA_CLUSTER_SIZE;
+  cgaClusterSizeEnv = NCCL_CGA_CLUSTER_SIZE_get();
   if (0 <= cgaClusterSizeEnv && cgaClusterSizeEnv <= NCCL_MAX_CGA_CLUSTER_SIZE) {
     comm->config.cgaClusterSize = cgaClusterSizeEnv;
   } else if (cgaClusterSizeEnv > NCCL_MAX_CGA_CLUSTER_SIZE) {
@@ -1650,18 +1692,18 @@ static ncclResult_t envConfigOverride(ncclComm_t comm) {
     comm->config.cgaClusterSize = NCCL_MAX_CGA_CLUSTER_SIZE;
   }
 
-  minCTAsEnv = NCCL_MIN_CTAS;
+  minCTAsEnv = NCCL_MIN_CTAS_get();
   if (minCTAsEnv > 0) {
     comm->config.minCTAs = minCTAsEnv;
   }
 
-  maxCTAsEnv = NCCL_MAX_CTAS;
+  maxCTAsEnv = NCCL_MAX_CTAS_get();
   if (maxCTAsEnv > 0) {
     comm->config.maxCTAs = maxCTAsEnv;
   }
 
-  if (!NCCL_NETWORK.empty())
-    tmpNetName = NCCL_NETWORK.c_str();
+  if (!NCCL_NETWORK_get().empty())
+    tmpNetName = NCCL_NETWORK_get().c_str();
   if (tmpNetName != NULL) {
     int netNameLen = strlen(tmpNetName) + 1;
     comm->config.netName = (char*)malloc(netNameLen);
@@ -1670,7 +1712,7 @@ static ncclResult_t envConfigOverride(ncclComm_t comm) {
     comm->config.netName = NULL;
   }
 
-  splitShareEnv = NCCL_COMM_SPLIT_SHARE_RESOURCES;
+  splitShareEnv = NCCL_COMM_SPLIT_SHARE_RESOURCES_get();
   if (splitShareEnv != -1) {
     comm->config.splitShare = splitShareEnv;
   }
@@ -1822,8 +1864,8 @@ static ncclResult_t ncclCommInitRankDev(ncclComm_t* newcomm, int nranks, ncclUni
   ncclResult_t res = ncclSuccess;
   ncclComm_t comm = NULL;
   struct ncclCommInitRankAsyncJob *job = NULL;
-  if (!NCCL_COMM_ID.empty() && myrank == 0) {
-    INFO(NCCL_ENV, "NCCL_COMM_ID set by environment to %s", NCCL_COMM_ID.c_str());
+  if (!NCCL_COMM_ID_get().empty() && myrank == 0) {
+    INFO(NCCL_ENV, "NCCL_COMM_ID set by environment to %s", NCCL_COMM_ID_get().c_str());
     NCCLCHECKGOTO(bootstrapCreateRoot((struct ncclBootstrapHandle*)&commId, true), res, fail);
   }
 
@@ -2407,7 +2449,7 @@ ncclResult_t ncclCommRegister(const ncclComm_t comm, void* buff, size_t size, vo
   NVTX3_FUNC_RANGE_IN(nccl_domain);
   ncclResult_t ret = ncclSuccess;
 
-  if (NCCL_LOCAL_REGISTER) {
+  if (NCCL_LOCAL_REGISTER_get()) {
     if(ctranInitialized(comm)) {
       return comm->ctran->commRegister(buff, size, handle);
     } else {
@@ -2423,7 +2465,7 @@ NCCL_API(ncclResult_t, ncclCommDeregister, const ncclComm_t comm, void* handle);
 ncclResult_t ncclCommDeregister(const ncclComm_t comm, void* handle) {
   ncclResult_t ret = ncclSuccess;
 
-  if (NCCL_LOCAL_REGISTER) {
+  if (NCCL_LOCAL_REGISTER_get()) {
     if(ctranInitialized(comm)) {
       return comm->ctran->commDeregister(handle);
     } else {
@@ -37,15 +37,18 @@ void CollTrace::outputResults(){
     stream << "    \"coll\": \"" << it->info.opName << "\",\n"
           << "    \"msg_size\": \""
           << (it->info.count * ncclTypeSize(it->info.datatype)) << "\",\n"
+          << "    \"algorithm\": " << it->info.algorithm << ",\n"
+          << "    \"protocol\": " << it->info.protocol << ",\n"
+          << "    \"nchannels\": " << it->info.nChannels << ",\n"
           << "    \"latency\": " << it->latency << "\n";
   }
   stream << "  }\n]";
 
 
   // If NCCL_COLLTRACE_DIR is set, then write profiling data to file
-  if(!NCCL_COLLTRACE_DIR.empty()){
+  if(!NCCL_COLLTRACE_DIR_get().empty()){
     const std::string fileName =
-        NCCL_COLLTRACE_DIR + "/" + std::to_string(rank_) + "_online.json";
+        NCCL_COLLTRACE_DIR_get() + "/" + std::to_string(rank_) + "_online.json";
     INFO(NCCL_ALL, "Rank %d: Writing %lu online profiler data to : %s", rank_, results_.size(), fileName.c_str());
 
     if (ncclIsFbPath(fileName)) {
@@ -80,7 +83,10 @@ void* CollTrace::measureLatency() {
         eventPool_.add(std::move(curEvent->stop));
         COLLTRACE_IO_FB_DURING_RUN(result, rank_);
 
-        if (curEvent->info.comm->tuner != NULL) {
+        // Tuners without online results (e.g. table-driven ones) do not need
+        // the per-collective allgather
+        if (curEvent->info.comm->tuner != NULL &&
+            curEvent->info.comm->tuner->addOnlineResult != NULL) {
           results_.push_back(result);
 
           // Online tuning - average latencies across ranks & send to tuner
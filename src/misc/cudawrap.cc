@@ -66,7 +66,7 @@ error:
 }
 
 int ncclCuMemEnable() {
-  return ((NCCL_CUMEM_ENABLE == -2 && ncclCuMemSupported) || NCCL_CUMEM_ENABLE);
+  return ((NCCL_CUMEM_ENABLE_get() == -2 && ncclCuMemSupported) || NCCL_CUMEM_ENABLE_get());
 }
 
 #define DECLARE_CUDA_PFN(symbol,version) PFN_##symbol##_v##version pfn_##symbol = nullptr
@@ -181,7 +181,7 @@ static ncclResult_t initResult;
 
 static void initOnceFunc() {
   do {
-    std::string val = CUDA_LAUNCH_BLOCKING;
+    std::string val = CUDA_LAUNCH_BLOCKING_get();
     ncclCudaLaunchBlocking = !val.empty() && val[0]!=0 && !(val[0]=='0' && val[1]==0);
   } while (0);
 
@@ -190,15 +190,15 @@ static void initOnceFunc() {
    * Load CUDA driver library
    */
   char path[1024];
-  if (NCCL_CUDA_PATH.empty())
+  if (NCCL_CUDA_PATH_get().empty())
     snprintf(path, 1024, "%s", "libcuda.so");
   else
-    snprintf(path, 1024, "%s/%s", NCCL_CUDA_PATH.c_str(), "libcuda.so");
+    snprintf(path, 1024, "%s/%s", NCCL_CUDA_PATH_get().c_str(), "libcuda.so");
 
   (void) dlerror(); // Clear any previous errors
   cudaLib = dlopen(path, RTLD_LAZY);
   if (cudaLib == NULL) {
-    WARN("Failed to find CUDA library %s (NCCL_CUDA_PATH='%s') : %s", path, NCCL_CUDA_PATH.c_str(), dlerror());
+    WARN("Failed to find CUDA library %s (NCCL_CUDA_PATH='%s') : %s", path, NCCL_CUDA_PATH_get().c_str(), dlerror());
     goto error;
   }
 
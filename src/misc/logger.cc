@@ -56,7 +56,7 @@ NcclLogger::~NcclLogger() {
 }
 
 void NcclLogger::log(const std::string& msg) {
-  if (NCCL_LOGGER_MODE == NCCL_LOGGER_MODE::sync) {
+  if (NCCL_LOGGER_MODE_get() == NCCL_LOGGER_MODE::sync) {
     writeToFile(msg);
   } else {
     {
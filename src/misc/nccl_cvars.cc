@@ -9,7 +9,12 @@
 #include <limits>
 #include <chrono>
 #include <iomanip>
+#include <cstdint>
+#include <tuple>
 #include <unordered_set>
+#include <atomic>
+#include <mutex>
+#include <type_traits>
 #include <strings.h>
 #include <string.h>
 #include <cuda_runtime.h>
@@ -28,8 +33,17 @@ static char hostname[HOST_NAME_MAX];
 static bool enableCvarWarn = true;
 static int cudaDev = -1;
 
-void initEnvSet(std::unordered_set<std::string>& env);
-void readCvarEnv();
+// Entry of the generated NCCL_* environment variable table. parse and reset
+// are nullptr for variables that are accepted but not backed by a cvar.
+struct CvarEnvEntry {
+  const char* name;
+  size_t len;
+  void (*parse)(const char* val);
+  void (*reset)();
+};
+
+// Parses the cvar of table entry idx unless it is loaded already
+static inline void cvarEnsureLoaded(int idx);
 
 #define CVAR_WARN(fmt, ...)                                 \
   if (enableCvarWarn) {                                     \
@@ -75,31 +89,59 @@ static inline void rtrim(std::string &s) {
   }).base(), s.end());
 }
 
-static std::vector<std::string> tokenizer(std::string str) {
-  std::string delim = ",";
+static std::vector<std::string> tokenizer(const std::string& str) {
   std::vector<std::string> tokens;
+  std::unordered_set<std::string> seen;
 
-  while (auto pos = str.find(",")) {
-    std::string newstr = str.substr(0, pos);
+  size_t start = 0;
+  while (start <= str.size()) {
+    size_t pos = str.find(',', start);
+    if (pos == std::string::npos) {
+      pos = str.size();
+    }
+    std::string newstr = str.substr(start, pos - start);
     ltrim(newstr);
     rtrim(newstr);
     // Skip empty string
-    if(!newstr.empty()) {
-      if(std::find(tokens.begin(), tokens.end(), newstr) != tokens.end()) {
+    if (!newstr.empty()) {
+      if (!seen.insert(newstr).second) {
         CVAR_WARN("Duplicate token %s found in the value of %s", newstr.c_str(), str.c_str());
       }
-      tokens.push_back(newstr);
-    }
-    str.erase(0, pos + delim.length());
-    if (pos == std::string::npos) {
-      break;
+      tokens.push_back(std::move(newstr));
     }
+    start = pos + 1;
   }
   return tokens;
 }
 
-static bool env2bool(const char *str_, const char *def) {
-  std::string str(getenv(str_) ? getenv(str_) : def);
+// Choice of an enum or enumlist cvar, in generated tables sorted by name
+template <typename T>
+struct CvarEnumChoice {
+  const char* name;
+  T value;
+};
+
+// Binary search of str in choices; sets value and returns true if found
+template <typename T, size_t N>
+static bool str2enum(const char* str, const CvarEnumChoice<T> (&choices)[N], T& value) {
+  size_t lo = 0, hi = N;
+  while (lo < hi) {
+    size_t mid = lo + (hi - lo) / 2;
+    int cmp = strcmp(str, choices[mid].name);
+    if (cmp == 0) {
+      value = choices[mid].value;
+      return true;
+    } else if (cmp < 0) {
+      hi = mid;
+    } else {
+      lo = mid + 1;
+    }
+  }
+  return false;
+}
+
+static bool str2bool(const char *name, const char *val) {
+  std::string str(val);
   std::transform(str.cbegin(), str.cend(), str.begin(), [](unsigned char c) { return std::tolower(c); });
   if (str == "y") return true;
   else if (str == "n") return false;
@@ -111,13 +153,13 @@ static bool env2bool(const char *str_, const char *def) {
   else if (str == "false") return false;
   else if (str == "1") return true;
   else if (str == "0") return false;
-  else CVAR_WARN_UNKNOWN_VALUE(str_, str.c_str());
+  else CVAR_WARN_UNKNOWN_VALUE(name, str.c_str());
   return true;
 }
 
 template <typename T>
-static T env2num(const char *str, const char *def) {
-  std::string s(getenv(str) ? getenv(str) : def);
+static T str2num(const char *val) {
+  std::string s(val);
 
   if (std::find_if(s.begin(), s.end(), ::isdigit) != s.end()) {
     /* if the string contains a digit, try converting it normally */
@@ -140,1114 +182,3239 @@ static T env2num(const char *str, const char *def) {
   }
 }
 
-static std::string env2str(const char *str, const char *def_) {
-  const char *def = def_ ? def_ : "";
-  std::string str_s = getenv(str) ? std::string(getenv(str)) : std::string(def);
+static std::string str2str(const char *val) {
+  std::string str_s(val);
   ltrim(str_s);
   rtrim(str_s);
   return str_s;
 }
 
-static std::vector<std::string> env2strlist(const char* str, const char* def_) {
-  const char* def = def_ ? def_ : "";
-  std::string str_s(getenv(str) ? getenv(str) : def);
-  return tokenizer(str_s);
+static std::vector<std::string> str2strlist(const char* val) {
+  return tokenizer(std::string(val));
 }
 
-static std::tuple<std::string, std::vector<std::string>> env2prefixedStrlist(
-    const char* str,
-    const char* def_,
-    std::vector<std::string> prefixes) {
-  const char* def = def_ ? def_ : "";
-  std::string str_s(getenv(str) ? getenv(str) : def);
+template <size_t N>
+static std::tuple<std::string, std::vector<std::string>> str2prefixedStrlist(
+    const char* val,
+    const char* const (&prefixes)[N]) {
+  std::string str_s(val);
 
   // search if any prefix is specified
   for (auto prefix : prefixes) {
-    if (!str_s.compare(0, prefix.size(), prefix)) {
+    size_t len = strlen(prefix);
+    if (!str_s.compare(0, len, prefix)) {
       // if prefix is found, convert the remaining string to stringList
-      std::string slist_s = str_s.substr(prefix.size());
-      return std::make_tuple(prefix, tokenizer(slist_s));
+      std::string slist_s = str_s.substr(len);
+      return std::make_tuple(std::string(prefix), tokenizer(slist_s));
     }
   }
   // if no prefix is found, convert entire string to stringList
   return std::make_tuple("", tokenizer(str_s));
 }
 
-extern char **environ;
-void ncclCvarInit() {
-  std::unordered_set<std::string> env;
-  initEnvSet(env);
+// Text form of cvar values, as listed by ncclCvarSnapshot()
+static std::string cvarToString(bool v) {
+  return v ? "true" : "false";
+}
 
-  initCvarLogger();
+template <typename T>
+static typename std::enable_if<std::is_arithmetic<T>::value, std::string>::type
+cvarToString(T v) {
+  std::ostringstream ss;
+  ss << std::setprecision(std::numeric_limits<T>::max_digits10) << v;
+  return ss.str();
+}
 
-  // Check if any NCCL_ env var is not in allow list
-  char **s = environ;
-  for (; *s; s++) {
-    if (!strncmp(*s, "NCCL_", strlen("NCCL_"))) {
-      std::string str(*s);
-      str = str.substr(0, str.find("="));
-      if (env.find(str) == env.end()) {
-        CVAR_WARN("Unknown env %s in the NCCL namespace", str.c_str());
-      }
+static std::string cvarToString(const std::string& v) {
+  return v;
+}
+
+static std::string cvarToString(const std::vector<std::string>& v) {
+  std::string str;
+  for (const auto& token : v) {
+    str += str.empty() ? token : "," + token;
+  }
+  return str;
+}
+
+template <typename T, size_t N>
+static std::string cvarToString(T v, const CvarEnumChoice<T> (&choices)[N]) {
+  for (const auto& choice : choices) {
+    if (choice.value == v) {
+      return choice.name;
+    }
+  }
+  return std::to_string(static_cast<int>(v));
+}
+
+template <typename T, size_t N>
+static std::string cvarToString(
+    const std::vector<T>& v,
+    const CvarEnumChoice<T> (&choices)[N]) {
+  std::string str;
+  for (auto choice : v) {
+    str += (str.empty() ? "" : ",") + cvarToString(choice, choices);
+  }
+  return str;
+}
+
+static void cvarJsonString(std::string& out, const std::string& str) {
+  out += '"';
+  for (unsigned char c : str) {
+    if (c == '"' || c == '\\') {
+      out += '\\';
+      out += c;
+    } else if (c < 0x20) {
+      char buf[8];
+      snprintf(buf, sizeof(buf), "\\u%04x", c);
+      out += buf;
+    } else {
+      out += c;
     }
   }
+  out += '"';
+}
 
-  readCvarEnv();
+std::string ncclCvarJsonString(const std::string& str) {
+  std::string out;
+  cvarJsonString(out, str);
+  return out;
+}
+
+// Append "env":{"value":...,"default":...} to the JSON object in snapshot
+static void cvarSnapshotAdd(
+    std::string& snapshot,
+    const char* env,
+    const std::string& value,
+    const std::string& defaultValue) {
+  snapshot += snapshot.empty() ? "{" : ",";
+  cvarJsonString(snapshot, env);
+  snapshot += ":{\"value\":";
+  cvarJsonString(snapshot, value);
+  snapshot += ",\"default\":";
+  cvarJsonString(snapshot, defaultValue);
+  snapshot += "}";
 }
 
 // Automatically generated by ./maint/extractcvars.py --- START
 // DO NOT EDIT!!!
 std::string CUDA_LAUNCH_BLOCKING;
-std::string CUDA_LAUNCH_BLOCKING_DEFAULT;
+const std::string CUDA_LAUNCH_BLOCKING_DEFAULT = "";
 int64_t NCCL_AGG_CHANNEL_SIZE;
-int64_t NCCL_AGG_CHANNEL_SIZE_DEFAULT;
+const int64_t NCCL_AGG_CHANNEL_SIZE_DEFAULT = -2;
 std::string NCCL_ALGO;
-std::string NCCL_ALGO_DEFAULT;
+const std::string NCCL_ALGO_DEFAULT = "";
 enum NCCL_ALLGATHER_ALGO NCCL_ALLGATHER_ALGO;
-enum NCCL_ALLGATHER_ALGO NCCL_ALLGATHER_ALGO_DEFAULT;
+const enum NCCL_ALLGATHER_ALGO NCCL_ALLGATHER_ALGO_DEFAULT = NCCL_ALLGATHER_ALGO::orig;
 uint64_t NCCL_ALLGATHER_DIRECT_CUTOFF;
-uint64_t NCCL_ALLGATHER_DIRECT_CUTOFF_DEFAULT;
+const uint64_t NCCL_ALLGATHER_DIRECT_CUTOFF_DEFAULT = 524288;
 int64_t NCCL_ALLOC_P2P_NET_LL_BUFFERS;
-int64_t NCCL_ALLOC_P2P_NET_LL_BUFFERS_DEFAULT;
+const int64_t NCCL_ALLOC_P2P_NET_LL_BUFFERS_DEFAULT = 0;
 enum NCCL_ALLREDUCE_ALGO NCCL_ALLREDUCE_ALGO;
-enum NCCL_ALLREDUCE_ALGO NCCL_ALLREDUCE_ALGO_DEFAULT;
+const enum NCCL_ALLREDUCE_ALGO NCCL_ALLREDUCE_ALGO_DEFAULT = NCCL_ALLREDUCE_ALGO::orig;
 int NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS;
-int NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_DEFAULT;
+const int NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_DEFAULT = -1;
 int NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE;
-int NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_DEFAULT;
+const int NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_DEFAULT = -1;
 enum NCCL_ALLTOALLV_ALGO NCCL_ALLTOALLV_ALGO;
-enum NCCL_ALLTOALLV_ALGO NCCL_ALLTOALLV_ALGO_DEFAULT;
+const enum NCCL_ALLTOALLV_ALGO NCCL_ALLTOALLV_ALGO_DEFAULT = NCCL_ALLTOALLV_ALGO::orig;
 enum NCCL_ALLTOALL_ALGO NCCL_ALLTOALL_ALGO;
-enum NCCL_ALLTOALL_ALGO NCCL_ALLTOALL_ALGO_DEFAULT;
+const enum NCCL_ALLTOALL_ALGO NCCL_ALLTOALL_ALGO_DEFAULT = NCCL_ALLTOALL_ALGO::orig;
 int64_t NCCL_BUFFSIZE;
-int64_t NCCL_BUFFSIZE_DEFAULT;
+const int64_t NCCL_BUFFSIZE_DEFAULT = -2;
 int64_t NCCL_CGA_CLUSTER_SIZE;
-int64_t NCCL_CGA_CLUSTER_SIZE_DEFAULT;
+const int64_t NCCL_CGA_CLUSTER_SIZE_DEFAULT = -1;
 int64_t NCCL_CHECK_POINTERS;
-int64_t NCCL_CHECK_POINTERS_DEFAULT;
+const int64_t NCCL_CHECK_POINTERS_DEFAULT = 0;
 int64_t NCCL_CHUNK_SIZE;
-int64_t NCCL_CHUNK_SIZE_DEFAULT;
+const int64_t NCCL_CHUNK_SIZE_DEFAULT = 0;
 std::string NCCL_COLLNET_ENABLE;
-std::string NCCL_COLLNET_ENABLE_DEFAULT;
+const std::string NCCL_COLLNET_ENABLE_DEFAULT = "";
 int64_t NCCL_COLLNET_NODE_THRESHOLD;
-int64_t NCCL_COLLNET_NODE_THRESHOLD_DEFAULT;
+const int64_t NCCL_COLLNET_NODE_THRESHOLD_DEFAULT = 2;
 std::string NCCL_COLLTRACE_DIR;
-std::string NCCL_COLLTRACE_DIR_DEFAULT;
+const std::string NCCL_COLLTRACE_DIR_DEFAULT = "";
 int64_t NCCL_COMM_BLOCKING;
-int64_t NCCL_COMM_BLOCKING_DEFAULT;
+const int64_t NCCL_COMM_BLOCKING_DEFAULT = -1;
 std::string NCCL_COMM_ID;
-std::string NCCL_COMM_ID_DEFAULT;
+const std::string NCCL_COMM_ID_DEFAULT = "";
 int64_t NCCL_COMM_SPLIT_SHARE_RESOURCES;
-int64_t NCCL_COMM_SPLIT_SHARE_RESOURCES_DEFAULT;
+const int64_t NCCL_COMM_SPLIT_SHARE_RESOURCES_DEFAULT = -1;
 int64_t NCCL_CONNECT_ROUND_SIZE;
-int64_t NCCL_CONNECT_ROUND_SIZE_DEFAULT;
+const int64_t NCCL_CONNECT_ROUND_SIZE_DEFAULT = 128;
 int64_t NCCL_CREATE_THREAD_CONTEXT;
-int64_t NCCL_CREATE_THREAD_CONTEXT_DEFAULT;
+const int64_t NCCL_CREATE_THREAD_CONTEXT_DEFAULT = 0;
 int64_t NCCL_CROSS_NIC;
-int64_t NCCL_CROSS_NIC_DEFAULT;
+const int64_t NCCL_CROSS_NIC_DEFAULT = 2;
 bool NCCL_CTRAN_AG_RD_RTR;
-bool NCCL_CTRAN_AG_RD_RTR_DEFAULT;
+const bool NCCL_CTRAN_AG_RD_RTR_DEFAULT = true;
 int NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS;
-int NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_DEFAULT;
+const int NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_DEFAULT = 64;
 int NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE;
-int NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_DEFAULT;
+const int NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_DEFAULT = 640;
 int NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS;
-int NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_DEFAULT;
+const int NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_DEFAULT = -1;
 int NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE;
-int NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_DEFAULT;
+const int NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_DEFAULT = -1;
 uint64_t NCCL_CTRAN_ALLTOALL_THRESHOLD;
-uint64_t NCCL_CTRAN_ALLTOALL_THRESHOLD_DEFAULT;
+const uint64_t NCCL_CTRAN_ALLTOALL_THRESHOLD_DEFAULT = 32768;
 std::vector<enum NCCL_CTRAN_BACKENDS> NCCL_CTRAN_BACKENDS;
-std::vector<enum NCCL_CTRAN_BACKENDS> NCCL_CTRAN_BACKENDS_DEFAULT;
+const std::vector<enum NCCL_CTRAN_BACKENDS> NCCL_CTRAN_BACKENDS_DEFAULT = {NCCL_CTRAN_BACKENDS::ib};
+uint64_t NCCL_CTRAN_BACKENDS_MASK;
+const uint64_t NCCL_CTRAN_BACKENDS_MASK_DEFAULT = 0x1ULL;
 uint64_t NCCL_CTRAN_IB_CTRL_TC;
-uint64_t NCCL_CTRAN_IB_CTRL_TC_DEFAULT;
+const uint64_t NCCL_CTRAN_IB_CTRL_TC_DEFAULT = 192;
 int NCCL_CTRAN_IB_MAX_QPS;
-int NCCL_CTRAN_IB_MAX_QPS_DEFAULT;
+const int NCCL_CTRAN_IB_MAX_QPS_DEFAULT = 1;
 uint64_t NCCL_CTRAN_IB_QP_SCALING_THRESHOLD;
-uint64_t NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_DEFAULT;
+const uint64_t NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_DEFAULT = 1048576;
 bool NCCL_CTRAN_IB_TRAFFIC_PROFILNG;
-bool NCCL_CTRAN_IB_TRAFFIC_PROFILNG_DEFAULT;
+const bool NCCL_CTRAN_IB_TRAFFIC_PROFILNG_DEFAULT = false;
 std::string NCCL_CTRAN_KINETO_PROFILE_DIR;
-std::string NCCL_CTRAN_KINETO_PROFILE_DIR_DEFAULT;
+const std::string NCCL_CTRAN_KINETO_PROFILE_DIR_DEFAULT = "/tmp";
 int NCCL_CTRAN_NUM_KERNEL_P2PELEMS;
-int NCCL_CTRAN_NUM_KERNEL_P2PELEMS_DEFAULT;
+const int NCCL_CTRAN_NUM_KERNEL_P2PELEMS_DEFAULT = 65536;
 enum NCCL_CTRAN_PROFILING NCCL_CTRAN_PROFILING;
-enum NCCL_CTRAN_PROFILING NCCL_CTRAN_PROFILING_DEFAULT;
+const enum NCCL_CTRAN_PROFILING NCCL_CTRAN_PROFILING_DEFAULT = NCCL_CTRAN_PROFILING::none;
 int NCCL_CTRAN_PROFILING_REPORT_COUNT;
-int NCCL_CTRAN_PROFILING_REPORT_COUNT_DEFAULT;
+const int NCCL_CTRAN_PROFILING_REPORT_COUNT_DEFAULT = 100;
 enum NCCL_CTRAN_REGISTER NCCL_CTRAN_REGISTER;
-enum NCCL_CTRAN_REGISTER NCCL_CTRAN_REGISTER_DEFAULT;
+const enum NCCL_CTRAN_REGISTER NCCL_CTRAN_REGISTER_DEFAULT = NCCL_CTRAN_REGISTER::lazy;
 int NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT;
-int NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_DEFAULT;
+const int NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_DEFAULT = -1;
 int NCCL_CTRAN_RING_MAX_OUTSTANDING;
-int NCCL_CTRAN_RING_MAX_OUTSTANDING_DEFAULT;
+const int NCCL_CTRAN_RING_MAX_OUTSTANDING_DEFAULT = 8;
 uint64_t NCCL_CTRAN_RING_STEP;
-uint64_t NCCL_CTRAN_RING_STEP_DEFAULT;
+const uint64_t NCCL_CTRAN_RING_STEP_DEFAULT = 4194304;
 uint64_t NCCL_CTRAN_SHARED_DEVBUF_SIZE;
-uint64_t NCCL_CTRAN_SHARED_DEVBUF_SIZE_DEFAULT;
+const uint64_t NCCL_CTRAN_SHARED_DEVBUF_SIZE_DEFAULT = 8388608;
 std::string NCCL_CTRAN_TOPO_FILE;
-std::string NCCL_CTRAN_TOPO_FILE_DEFAULT;
+const std::string NCCL_CTRAN_TOPO_FILE_DEFAULT = "";
 std::vector<std::string> NCCL_CTRAN_TOPO_FILE_KEYS;
-std::vector<std::string> NCCL_CTRAN_TOPO_FILE_KEYS_DEFAULT;
+const std::vector<std::string> NCCL_CTRAN_TOPO_FILE_KEYS_DEFAULT = {};
 std::string NCCL_CUDA_PATH;
-std::string NCCL_CUDA_PATH_DEFAULT;
+const std::string NCCL_CUDA_PATH_DEFAULT = "";
 int64_t NCCL_CUMEM_ENABLE;
-int64_t NCCL_CUMEM_ENABLE_DEFAULT;
+const int64_t NCCL_CUMEM_ENABLE_DEFAULT = 0;
+std::string NCCL_CVAR_SNAPSHOT_DIR;
+const std::string NCCL_CVAR_SNAPSHOT_DIR_DEFAULT = "";
 std::string NCCL_DATA_EXPORT_DIR;
-std::string NCCL_DATA_EXPORT_DIR_DEFAULT;
+const std::string NCCL_DATA_EXPORT_DIR_DEFAULT = "/tmp";
 int NCCL_DDA_ALLREDUCE_MAX_BLOCKS;
-int NCCL_DDA_ALLREDUCE_MAX_BLOCKS_DEFAULT;
+const int NCCL_DDA_ALLREDUCE_MAX_BLOCKS_DEFAULT = 24;
 uint64_t NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD;
-uint64_t NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_DEFAULT;
+const uint64_t NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_DEFAULT = 1048576;
 uint64_t NCCL_DDA_ALLREDUCE_TREE_THRESHOLD;
-uint64_t NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_DEFAULT;
+const uint64_t NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_DEFAULT = 262144;
 uint64_t NCCL_DDA_TMPBUFF_SIZE;
-uint64_t NCCL_DDA_TMPBUFF_SIZE_DEFAULT;
+const uint64_t NCCL_DDA_TMPBUFF_SIZE_DEFAULT = 33554432;
 std::string NCCL_DEBUG;
-std::string NCCL_DEBUG_DEFAULT;
+const std::string NCCL_DEBUG_DEFAULT = "";
 std::string NCCL_DEBUG_FILE;
-std::string NCCL_DEBUG_FILE_DEFAULT;
+const std::string NCCL_DEBUG_FILE_DEFAULT = "";
 std::string NCCL_DEBUG_SUBSYS;
-std::string NCCL_DEBUG_SUBSYS_DEFAULT;
+const std::string NCCL_DEBUG_SUBSYS_DEFAULT = "";
 int64_t NCCL_DMABUF_ENABLE;
-int64_t NCCL_DMABUF_ENABLE_DEFAULT;
+const int64_t NCCL_DMABUF_ENABLE_DEFAULT = 1;
 int64_t NCCL_GDRCOPY_ENABLE;
-int64_t NCCL_GDRCOPY_ENABLE_DEFAULT;
+const int64_t NCCL_GDRCOPY_ENABLE_DEFAULT = 0;
 int64_t NCCL_GDRCOPY_FIFO_ENABLE;
-int64_t NCCL_GDRCOPY_FIFO_ENABLE_DEFAULT;
+const int64_t NCCL_GDRCOPY_FIFO_ENABLE_DEFAULT = -2;
 int64_t NCCL_GDRCOPY_FLUSH_ENABLE;
-int64_t NCCL_GDRCOPY_FLUSH_ENABLE_DEFAULT;
+const int64_t NCCL_GDRCOPY_FLUSH_ENABLE_DEFAULT = 0;
 int64_t NCCL_GDRCOPY_SYNC_ENABLE;
-int64_t NCCL_GDRCOPY_SYNC_ENABLE_DEFAULT;
+const int64_t NCCL_GDRCOPY_SYNC_ENABLE_DEFAULT = 1;
 int64_t NCCL_GDR_FLUSH_DISABLE;
-int64_t NCCL_GDR_FLUSH_DISABLE_DEFAULT;
+const int64_t NCCL_GDR_FLUSH_DISABLE_DEFAULT = 0;
 std::string NCCL_GRAPH_DUMP_FILE;
-std::string NCCL_GRAPH_DUMP_FILE_DEFAULT;
+const std::string NCCL_GRAPH_DUMP_FILE_DEFAULT = "";
 int64_t NCCL_GRAPH_DUMP_FILE_RANK;
-int64_t NCCL_GRAPH_DUMP_FILE_RANK_DEFAULT;
+const int64_t NCCL_GRAPH_DUMP_FILE_RANK_DEFAULT = 0;
 std::string NCCL_GRAPH_FILE;
-std::string NCCL_GRAPH_FILE_DEFAULT;
+const std::string NCCL_GRAPH_FILE_DEFAULT = "";
 int64_t NCCL_GRAPH_MIXING_SUPPORT;
-int64_t NCCL_GRAPH_MIXING_SUPPORT_DEFAULT;
+const int64_t NCCL_GRAPH_MIXING_SUPPORT_DEFAULT = 1;
 int64_t NCCL_GRAPH_REGISTER;
-int64_t NCCL_GRAPH_REGISTER_DEFAULT;
+const int64_t NCCL_GRAPH_REGISTER_DEFAULT = 0;
 std::string NCCL_HOSTID;
-std::string NCCL_HOSTID_DEFAULT;
+const std::string NCCL_HOSTID_DEFAULT = "";
 int64_t NCCL_IB_ADAPTIVE_ROUTING;
-int64_t NCCL_IB_ADAPTIVE_ROUTING_DEFAULT;
+const int64_t NCCL_IB_ADAPTIVE_ROUTING_DEFAULT = -2;
 std::string NCCL_IB_ADDR_FAMILY;
-std::string NCCL_IB_ADDR_FAMILY_DEFAULT;
+const std::string NCCL_IB_ADDR_FAMILY_DEFAULT = "AF_INET";
 std::string NCCL_IB_ADDR_RANGE;
-std::string NCCL_IB_ADDR_RANGE_DEFAULT;
+const std::string NCCL_IB_ADDR_RANGE_DEFAULT = "::/0";
 int64_t NCCL_IB_AR_THRESHOLD;
-int64_t NCCL_IB_AR_THRESHOLD_DEFAULT;
+const int64_t NCCL_IB_AR_THRESHOLD_DEFAULT = 8192;
 int64_t NCCL_IB_DISABLE;
-int64_t NCCL_IB_DISABLE_DEFAULT;
+const int64_t NCCL_IB_DISABLE_DEFAULT = 0;
 int NCCL_IB_GID_INDEX;
-int NCCL_IB_GID_INDEX_DEFAULT;
+const int NCCL_IB_GID_INDEX_DEFAULT = -1;
 std::string NCCL_IB_HCA_PREFIX;
-std::string NCCL_IB_HCA_PREFIX_DEFAULT;
+const std::string NCCL_IB_HCA_PREFIX_DEFAULT = "";
 std::vector<std::string> NCCL_IB_HCA;
-std::vector<std::string> NCCL_IB_HCA_DEFAULT;
+const std::vector<std::string> NCCL_IB_HCA_DEFAULT = {};
 int64_t NCCL_IB_MERGE_VFS;
-int64_t NCCL_IB_MERGE_VFS_DEFAULT;
+const int64_t NCCL_IB_MERGE_VFS_DEFAULT = 1;
 int64_t NCCL_IB_PCI_RELAXED_ORDERING;
-int64_t NCCL_IB_PCI_RELAXED_ORDERING_DEFAULT;
+const int64_t NCCL_IB_PCI_RELAXED_ORDERING_DEFAULT = 2;
 int64_t NCCL_IB_PKEY;
-int64_t NCCL_IB_PKEY_DEFAULT;
+const int64_t NCCL_IB_PKEY_DEFAULT = 0;
 int64_t NCCL_IB_QPS_PER_CONNECTION;
-int64_t NCCL_IB_QPS_PER_CONNECTION_DEFAULT;
+const int64_t NCCL_IB_QPS_PER_CONNECTION_DEFAULT = 1;
 int64_t NCCL_IB_RETRY_CNT;
-int64_t NCCL_IB_RETRY_CNT_DEFAULT;
+const int64_t NCCL_IB_RETRY_CNT_DEFAULT = 7;
 int NCCL_IB_ROCE_VERSION_NUM;
-int NCCL_IB_ROCE_VERSION_NUM_DEFAULT;
+const int NCCL_IB_ROCE_VERSION_NUM_DEFAULT = 2;
 int64_t NCCL_IB_SL;
-int64_t NCCL_IB_SL_DEFAULT;
+const int64_t NCCL_IB_SL_DEFAULT = 0;
 int64_t NCCL_IB_SPLIT_DATA_ON_QPS;
-int64_t NCCL_IB_SPLIT_DATA_ON_QPS_DEFAULT;
+const int64_t NCCL_IB_SPLIT_DATA_ON_QPS_DEFAULT = 1;
 int64_t NCCL_IB_TC;
-int64_t NCCL_IB_TC_DEFAULT;
+const int64_t NCCL_IB_TC_DEFAULT = 0;
 int64_t NCCL_IB_TIMEOUT;
-int64_t NCCL_IB_TIMEOUT_DEFAULT;
+const int64_t NCCL_IB_TIMEOUT_DEFAULT = 18;
 int64_t NCCL_IB_USE_INLINE;
-int64_t NCCL_IB_USE_INLINE_DEFAULT;
+const int64_t NCCL_IB_USE_INLINE_DEFAULT = 0;
 int64_t NCCL_IGNORE_CPU_AFFINITY;
-int64_t NCCL_IGNORE_CPU_AFFINITY_DEFAULT;
+const int64_t NCCL_IGNORE_CPU_AFFINITY_DEFAULT = 0;
 int64_t NCCL_IGNORE_DISABLED_P2P;
-int64_t NCCL_IGNORE_DISABLED_P2P_DEFAULT;
+const int64_t NCCL_IGNORE_DISABLED_P2P_DEFAULT = 0;
 int64_t NCCL_L1_SHARED_MEMORY_CARVEOUT;
-int64_t NCCL_L1_SHARED_MEMORY_CARVEOUT_DEFAULT;
+const int64_t NCCL_L1_SHARED_MEMORY_CARVEOUT_DEFAULT = 0;
 std::string NCCL_LAUNCH_MODE;
-std::string NCCL_LAUNCH_MODE_DEFAULT;
+const std::string NCCL_LAUNCH_MODE_DEFAULT = "";
 int64_t NCCL_LL128_BUFFSIZE;
-int64_t NCCL_LL128_BUFFSIZE_DEFAULT;
+const int64_t NCCL_LL128_BUFFSIZE_DEFAULT = -2;
 int64_t NCCL_LL128_NTHREADS;
-int64_t NCCL_LL128_NTHREADS_DEFAULT;
+const int64_t NCCL_LL128_NTHREADS_DEFAULT = -2;
 int64_t NCCL_LL_BUFFSIZE;
-int64_t NCCL_LL_BUFFSIZE_DEFAULT;
+const int64_t NCCL_LL_BUFFSIZE_DEFAULT = -2;
 int64_t NCCL_LOCAL_REGISTER;
-int64_t NCCL_LOCAL_REGISTER_DEFAULT;
+const int64_t NCCL_LOCAL_REGISTER_DEFAULT = 1;
 enum NCCL_LOGGER_MODE NCCL_LOGGER_MODE;
-enum NCCL_LOGGER_MODE NCCL_LOGGER_MODE_DEFAULT;
+const enum NCCL_LOGGER_MODE NCCL_LOGGER_MODE_DEFAULT = NCCL_LOGGER_MODE::sync;
 int64_t NCCL_MAX_CTAS;
-int64_t NCCL_MAX_CTAS_DEFAULT;
+const int64_t NCCL_MAX_CTAS_DEFAULT = -1;
 int64_t NCCL_MAX_NCHANNELS;
-int64_t NCCL_MAX_NCHANNELS_DEFAULT;
+const int64_t NCCL_MAX_NCHANNELS_DEFAULT = -2;
 int64_t NCCL_MAX_NRINGS;
-int64_t NCCL_MAX_NRINGS_DEFAULT;
+const int64_t NCCL_MAX_NRINGS_DEFAULT = -2;
 int64_t NCCL_MAX_P2P_NCHANNELS;
-int64_t NCCL_MAX_P2P_NCHANNELS_DEFAULT;
+const int64_t NCCL_MAX_P2P_NCHANNELS_DEFAULT = std::numeric_limits<int64_t>::max();
 enum NCCL_MEM_SYNC_DOMAIN NCCL_MEM_SYNC_DOMAIN;
-enum NCCL_MEM_SYNC_DOMAIN NCCL_MEM_SYNC_DOMAIN_DEFAULT;
+const enum NCCL_MEM_SYNC_DOMAIN NCCL_MEM_SYNC_DOMAIN_DEFAULT = NCCL_MEM_SYNC_DOMAIN::remote;
 int64_t NCCL_MIN_CTAS;
-int64_t NCCL_MIN_CTAS_DEFAULT;
+const int64_t NCCL_MIN_CTAS_DEFAULT = -1;
 int64_t NCCL_MIN_NCHANNELS;
-int64_t NCCL_MIN_NCHANNELS_DEFAULT;
+const int64_t NCCL_MIN_NCHANNELS_DEFAULT = -2;
 int64_t NCCL_MIN_NRINGS;
-int64_t NCCL_MIN_NRINGS_DEFAULT;
+const int64_t NCCL_MIN_NRINGS_DEFAULT = -2;
 int64_t NCCL_MIN_P2P_NCHANNELS;
-int64_t NCCL_MIN_P2P_NCHANNELS_DEFAULT;
+const int64_t NCCL_MIN_P2P_NCHANNELS_DEFAULT = 1;
 int64_t NCCL_NCHANNELS_PER_NET_PEER;
-int64_t NCCL_NCHANNELS_PER_NET_PEER_DEFAULT;
+const int64_t NCCL_NCHANNELS_PER_NET_PEER_DEFAULT = 2;
 std::string NCCL_NETWORK;
-std::string NCCL_NETWORK_DEFAULT;
+const std::string NCCL_NETWORK_DEFAULT = "";
 int64_t NCCL_NET_DISABLE_INTRA;
-int64_t NCCL_NET_DISABLE_INTRA_DEFAULT;
+const int64_t NCCL_NET_DISABLE_INTRA_DEFAULT = 0;
 int64_t NCCL_NET_FORCE_FLUSH;
-int64_t NCCL_NET_FORCE_FLUSH_DEFAULT;
+const int64_t NCCL_NET_FORCE_FLUSH_DEFAULT = 1;
 std::string NCCL_NET_GDR_LEVEL;
-std::string NCCL_NET_GDR_LEVEL_DEFAULT;
+const std::string NCCL_NET_GDR_LEVEL_DEFAULT = "";
 int64_t NCCL_NET_GDR_READ;
-int64_t NCCL_NET_GDR_READ_DEFAULT;
+const int64_t NCCL_NET_GDR_READ_DEFAULT = -2;
 int64_t NCCL_NET_OVERHEAD;
-int64_t NCCL_NET_OVERHEAD_DEFAULT;
+const int64_t NCCL_NET_OVERHEAD_DEFAULT = -2;
 std::string NCCL_NET_PLUGIN;
-std::string NCCL_NET_PLUGIN_DEFAULT;
+const std::string NCCL_NET_PLUGIN_DEFAULT = "libnccl-net.so";
 int64_t NCCL_NET_SHARED_BUFFERS;
-int64_t NCCL_NET_SHARED_BUFFERS_DEFAULT;
+const int64_t NCCL_NET_SHARED_BUFFERS_DEFAULT = -2;
 int64_t NCCL_NET_SHARED_COMMS;
-int64_t NCCL_NET_SHARED_COMMS_DEFAULT;
+const int64_t NCCL_NET_SHARED_COMMS_DEFAULT = 1;
 int64_t NCCL_NSOCKS_PERTHREAD;
-int64_t NCCL_NSOCKS_PERTHREAD_DEFAULT;
+const int64_t NCCL_NSOCKS_PERTHREAD_DEFAULT = -2;
 int64_t NCCL_NTHREADS;
-int64_t NCCL_NTHREADS_DEFAULT;
+const int64_t NCCL_NTHREADS_DEFAULT = -2;
 int64_t NCCL_NVB_DISABLE;
-int64_t NCCL_NVB_DISABLE_DEFAULT;
+const int64_t NCCL_NVB_DISABLE_DEFAULT = 0;
 int64_t NCCL_NVB_PRECONNECT;
-int64_t NCCL_NVB_PRECONNECT_DEFAULT;
+const int64_t NCCL_NVB_PRECONNECT_DEFAULT = 1;
 int64_t NCCL_NVLS_ENABLE;
-int64_t NCCL_NVLS_ENABLE_DEFAULT;
+const int64_t NCCL_NVLS_ENABLE_DEFAULT = 2;
 int64_t NCCL_NVLS_NCHANNELS;
-int64_t NCCL_NVLS_NCHANNELS_DEFAULT;
+const int64_t NCCL_NVLS_NCHANNELS_DEFAULT = 16;
 int64_t NCCL_P2P_DIRECT_DISABLE;
-int64_t NCCL_P2P_DIRECT_DISABLE_DEFAULT;
+const int64_t NCCL_P2P_DIRECT_DISABLE_DEFAULT = 0;
 std::string NCCL_P2P_DISABLE;
-std::string NCCL_P2P_DISABLE_DEFAULT;
+const std::string NCCL_P2P_DISABLE_DEFAULT = "";
 std::string NCCL_P2P_LEVEL;
-std::string NCCL_P2P_LEVEL_DEFAULT;
+const std::string NCCL_P2P_LEVEL_DEFAULT = "";
 int64_t NCCL_P2P_LL_THRESHOLD;
-int64_t NCCL_P2P_LL_THRESHOLD_DEFAULT;
+const int64_t NCCL_P2P_LL_THRESHOLD_DEFAULT = 16384;
 int64_t NCCL_P2P_NET_CHUNKSIZE;
-int64_t NCCL_P2P_NET_CHUNKSIZE_DEFAULT;
+const int64_t NCCL_P2P_NET_CHUNKSIZE_DEFAULT = 131072;
 int64_t NCCL_P2P_NVL_CHUNKSIZE;
-int64_t NCCL_P2P_NVL_CHUNKSIZE_DEFAULT;
+const int64_t NCCL_P2P_NVL_CHUNKSIZE_DEFAULT = 524288;
 int64_t NCCL_P2P_PCI_CHUNKSIZE;
-int64_t NCCL_P2P_PCI_CHUNKSIZE_DEFAULT;
+const int64_t NCCL_P2P_PCI_CHUNKSIZE_DEFAULT = 131072;
 int64_t NCCL_P2P_PXN_LEVEL;
-int64_t NCCL_P2P_PXN_LEVEL_DEFAULT;
+const int64_t NCCL_P2P_PXN_LEVEL_DEFAULT = 2;
 int64_t NCCL_P2P_READ_ENABLE;
-int64_t NCCL_P2P_READ_ENABLE_DEFAULT;
+const int64_t NCCL_P2P_READ_ENABLE_DEFAULT = -2;
 int64_t NCCL_P2P_USE_CUDA_MEMCPY;
-int64_t NCCL_P2P_USE_CUDA_MEMCPY_DEFAULT;
+const int64_t NCCL_P2P_USE_CUDA_MEMCPY_DEFAULT = 0;
 int64_t NCCL_PROGRESS_APPENDOP_FREQ;
-int64_t NCCL_PROGRESS_APPENDOP_FREQ_DEFAULT;
+const int64_t NCCL_PROGRESS_APPENDOP_FREQ_DEFAULT = 8;
 std::string NCCL_PROTO;
-std::string NCCL_PROTO_DEFAULT;
+const std::string NCCL_PROTO_DEFAULT = "";
 int64_t NCCL_PROXY_APPEND_BATCH_SIZE;
-int64_t NCCL_PROXY_APPEND_BATCH_SIZE_DEFAULT;
+const int64_t NCCL_PROXY_APPEND_BATCH_SIZE_DEFAULT = 16;
 int64_t NCCL_PROXY_DUMP_SIGNAL;
-int64_t NCCL_PROXY_DUMP_SIGNAL_DEFAULT;
+const int64_t NCCL_PROXY_DUMP_SIGNAL_DEFAULT = -1;
 std::string NCCL_PROXY_PROFILE;
-std::string NCCL_PROXY_PROFILE_DEFAULT;
+const std::string NCCL_PROXY_PROFILE_DEFAULT = "";
 std::string NCCL_PROXY_PROFILE_DIR;
-std::string NCCL_PROXY_PROFILE_DIR_DEFAULT;
+const std::string NCCL_PROXY_PROFILE_DIR_DEFAULT = "/tmp";
 int64_t NCCL_PXN_DISABLE;
-int64_t NCCL_PXN_DISABLE_DEFAULT;
+const int64_t NCCL_PXN_DISABLE_DEFAULT = 0;
 enum NCCL_SENDRECV_ALGO NCCL_SENDRECV_ALGO;
-enum NCCL_SENDRECV_ALGO NCCL_SENDRECV_ALGO_DEFAULT;
+const enum NCCL_SENDRECV_ALGO NCCL_SENDRECV_ALGO_DEFAULT = NCCL_SENDRECV_ALGO::orig;
 int64_t NCCL_SET_STACK_SIZE;
-int64_t NCCL_SET_STACK_SIZE_DEFAULT;
+const int64_t NCCL_SET_STACK_SIZE_DEFAULT = 0;
 int64_t NCCL_SET_THREAD_NAME;
-int64_t NCCL_SET_THREAD_NAME_DEFAULT;
+const int64_t NCCL_SET_THREAD_NAME_DEFAULT = 0;
 int64_t NCCL_SHM_DISABLE;
-int64_t NCCL_SHM_DISABLE_DEFAULT;
+const int64_t NCCL_SHM_DISABLE_DEFAULT = 0;
 int64_t NCCL_SHM_LOCALITY;
-int64_t NCCL_SHM_LOCALITY_DEFAULT;
+const int64_t NCCL_SHM_LOCALITY_DEFAULT = 2;
 int64_t NCCL_SHM_MEMCPY_MODE;
-int64_t NCCL_SHM_MEMCPY_MODE_DEFAULT;
+const int64_t NCCL_SHM_MEMCPY_MODE_DEFAULT = 1;
 int64_t NCCL_SHM_USE_CUDA_MEMCPY;
-int64_t NCCL_SHM_USE_CUDA_MEMCPY_DEFAULT;
+const int64_t NCCL_SHM_USE_CUDA_MEMCPY_DEFAULT = 0;
 std::string NCCL_SOCKET_FAMILY;
-std::string NCCL_SOCKET_FAMILY_DEFAULT;
+const std::string NCCL_SOCKET_FAMILY_DEFAULT = "";
 std::string NCCL_SOCKET_IFNAME;
-std::string NCCL_SOCKET_IFNAME_DEFAULT;
+const std::string NCCL_SOCKET_IFNAME_DEFAULT = "";
 int64_t NCCL_SOCKET_NTHREADS;
-int64_t NCCL_SOCKET_NTHREADS_DEFAULT;
+const int64_t NCCL_SOCKET_NTHREADS_DEFAULT = -2;
 std::string NCCL_THREAD_THRESHOLDS;
-std::string NCCL_THREAD_THRESHOLDS_DEFAULT;
+const std::string NCCL_THREAD_THRESHOLDS_DEFAULT = "";
 std::string NCCL_TOPO_DUMP_FILE;
-std::string NCCL_TOPO_DUMP_FILE_DEFAULT;
+const std::string NCCL_TOPO_DUMP_FILE_DEFAULT = "";
 int64_t NCCL_TOPO_DUMP_FILE_RANK;
-int64_t NCCL_TOPO_DUMP_FILE_RANK_DEFAULT;
+const int64_t NCCL_TOPO_DUMP_FILE_RANK_DEFAULT = 0;
 std::string NCCL_TOPO_FILE;
-std::string NCCL_TOPO_FILE_DEFAULT;
+const std::string NCCL_TOPO_FILE_DEFAULT = "/var/run/nvidia-topologyd/virtualTopology.xml";
 std::string NCCL_TUNER_PLUGIN;
-std::string NCCL_TUNER_PLUGIN_DEFAULT;
+const std::string NCCL_TUNER_PLUGIN_DEFAULT = "";
 int64_t NCCL_WORK_FIFO_DEPTH;
-int64_t NCCL_WORK_FIFO_DEPTH_DEFAULT;
-
-void initEnvSet(std::unordered_set<std::string>& env) {
-  env.insert("CUDA_LAUNCH_BLOCKING");
-  env.insert("NCCL_AGG_CHANNEL_SIZE");
-  env.insert("NCCL_ALGO");
-  env.insert("NCCL_ALLGATHER_ALGO");
-  env.insert("NCCL_ALLGATHER_DIRECT_CUTOFF");
-  env.insert("NCCL_ALLOC_P2P_NET_LL_BUFFERS");
-  env.insert("NCCL_ALLREDUCE_ALGO");
-  env.insert("NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS");
-  env.insert("NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE");
-  env.insert("NCCL_ALLTOALLV_ALGO");
-  env.insert("NCCL_ALLTOALL_ALGO");
-  env.insert("NCCL_BUFFSIZE");
-  env.insert("NCCL_CGA_CLUSTER_SIZE");
-  env.insert("NCCL_CHECK_POINTERS");
-  env.insert("NCCL_CHUNK_SIZE");
-  env.insert("NCCL_COLLNET_ENABLE");
-  env.insert("NCCL_COLLNET_NODE_THRESHOLD");
-  env.insert("NCCL_COLLTRACE_DIR");
-  env.insert("NCCL_COMM_BLOCKING");
-  env.insert("NCCL_COMM_ID");
-  env.insert("NCCL_COMM_SPLIT_SHARE_RESOURCES");
-  env.insert("NCCL_CONNECT_ROUND_SIZE");
-  env.insert("NCCL_CREATE_THREAD_CONTEXT");
-  env.insert("NCCL_CROSS_NIC");
-  env.insert("NCCL_CTRAN_AG_RD_RTR");
-  env.insert("NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS");
-  env.insert("NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE");
-  env.insert("NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS");
-  env.insert("NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE");
-  env.insert("NCCL_CTRAN_ALLTOALL_THRESHOLD");
-  env.insert("NCCL_CTRAN_BACKENDS");
-  env.insert("NCCL_CTRAN_IB_CTRL_TC");
-  env.insert("NCCL_CTRAN_IB_MAX_QPS");
-  env.insert("NCCL_CTRAN_IB_QP_SCALING_THRESHOLD");
-  env.insert("NCCL_CTRAN_IB_TRAFFIC_PROFILNG");
-  env.insert("NCCL_CTRAN_KINETO_PROFILE_DIR");
-  env.insert("NCCL_CTRAN_NUM_KERNEL_P2PELEMS");
-  env.insert("NCCL_CTRAN_PROFILING");
-  env.insert("NCCL_CTRAN_PROFILING_REPORT_COUNT");
-  env.insert("NCCL_CTRAN_REGISTER");
-  env.insert("NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT");
-  env.insert("NCCL_CTRAN_RING_MAX_OUTSTANDING");
-  env.insert("NCCL_CTRAN_RING_STEP");
-  env.insert("NCCL_CTRAN_SHARED_DEVBUF_SIZE");
-  env.insert("NCCL_CTRAN_TOPO_FILE");
-  env.insert("NCCL_CTRAN_TOPO_FILE_KEYS");
-  env.insert("NCCL_CUDA_PATH");
-  env.insert("NCCL_CUMEM_ENABLE");
-  env.insert("NCCL_DATA_EXPORT_DIR");
-  env.insert("NCCL_DDA_ALLREDUCE_MAX_BLOCKS");
-  env.insert("NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD");
-  env.insert("NCCL_DDA_ALLREDUCE_TREE_THRESHOLD");
-  env.insert("NCCL_DDA_TMPBUFF_SIZE");
-  env.insert("NCCL_DEBUG");
-  env.insert("NCCL_DEBUG_FILE");
-  env.insert("NCCL_DEBUG_SUBSYS");
-  env.insert("NCCL_DMABUF_ENABLE");
-  env.insert("NCCL_GDRCOPY_ENABLE");
-  env.insert("NCCL_GDRCOPY_FIFO_ENABLE");
-  env.insert("NCCL_GDRCOPY_FLUSH_ENABLE");
-  env.insert("NCCL_GDRCOPY_SYNC_ENABLE");
-  env.insert("NCCL_GDR_FLUSH_DISABLE");
-  env.insert("NCCL_GRAPH_DUMP_FILE");
-  env.insert("NCCL_GRAPH_DUMP_FILE_RANK");
-  env.insert("NCCL_GRAPH_FILE");
-  env.insert("NCCL_GRAPH_MIXING_SUPPORT");
-  env.insert("NCCL_GRAPH_REGISTER");
-  env.insert("NCCL_HOSTID");
-  env.insert("NCCL_IB_ADAPTIVE_ROUTING");
-  env.insert("NCCL_IB_ADDR_FAMILY");
-  env.insert("NCCL_IB_ADDR_RANGE");
-  env.insert("NCCL_IB_AR_THRESHOLD");
-  env.insert("NCCL_IB_DISABLE");
-  env.insert("NCCL_IB_GID_INDEX");
-  env.insert("NCCL_IB_HCA");
-  env.insert("NCCL_IB_MERGE_VFS");
-  env.insert("NCCL_IB_PCI_RELAXED_ORDERING");
-  env.insert("NCCL_IB_PKEY");
-  env.insert("NCCL_IB_QPS_PER_CONNECTION");
-  env.insert("NCCL_IB_RETRY_CNT");
-  env.insert("NCCL_IB_ROCE_VERSION_NUM");
-  env.insert("NCCL_IB_SL");
-  env.insert("NCCL_IB_SPLIT_DATA_ON_QPS");
-  env.insert("NCCL_IB_TC");
-  env.insert("NCCL_IB_TIMEOUT");
-  env.insert("NCCL_IB_USE_INLINE");
-  env.insert("NCCL_IGNORE_CPU_AFFINITY");
-  env.insert("NCCL_IGNORE_DISABLED_P2P");
-  env.insert("NCCL_L1_SHARED_MEMORY_CARVEOUT");
-  env.insert("NCCL_LAUNCH_MODE");
-  env.insert("NCCL_LL128_BUFFSIZE");
-  env.insert("NCCL_LL128_NTHREADS");
-  env.insert("NCCL_LL_BUFFSIZE");
-  env.insert("NCCL_LOCAL_REGISTER");
-  env.insert("NCCL_LOGGER_MODE");
-  env.insert("NCCL_MAX_CTAS");
-  env.insert("NCCL_MAX_NCHANNELS");
-  env.insert("NCCL_MAX_NRINGS");
-  env.insert("NCCL_MAX_P2P_NCHANNELS");
-  env.insert("NCCL_MEM_SYNC_DOMAIN");
-  env.insert("NCCL_MIN_CTAS");
-  env.insert("NCCL_MIN_NCHANNELS");
-  env.insert("NCCL_MIN_NRINGS");
-  env.insert("NCCL_MIN_P2P_NCHANNELS");
-  env.insert("NCCL_NCHANNELS_PER_NET_PEER");
-  env.insert("NCCL_NET");
-  env.insert("NCCL_NET_DISABLE_INTRA");
-  env.insert("NCCL_NET_FORCE_FLUSH");
-  env.insert("NCCL_NET_GDR_LEVEL");
-  env.insert("NCCL_NET_GDR_READ");
-  env.insert("NCCL_NET_OVERHEAD");
-  env.insert("NCCL_NET_PLUGIN");
-  env.insert("NCCL_NET_SHARED_BUFFERS");
-  env.insert("NCCL_NET_SHARED_COMMS");
-  env.insert("NCCL_NSOCKS_PERTHREAD");
-  env.insert("NCCL_NTHREADS");
-  env.insert("NCCL_NVB_DISABLE");
-  env.insert("NCCL_NVB_PRECONNECT");
-  env.insert("NCCL_NVLS_ENABLE");
-  env.insert("NCCL_NVLS_NCHANNELS");
-  env.insert("NCCL_P2P_DIRECT_DISABLE");
-  env.insert("NCCL_P2P_DISABLE");
-  env.insert("NCCL_P2P_LEVEL");
-  env.insert("NCCL_P2P_LL_THRESHOLD");
-  env.insert("NCCL_P2P_NET_CHUNKSIZE");
-  env.insert("NCCL_P2P_NVL_CHUNKSIZE");
-  env.insert("NCCL_P2P_PCI_CHUNKSIZE");
-  env.insert("NCCL_P2P_PXN_LEVEL");
-  env.insert("NCCL_P2P_READ_ENABLE");
-  env.insert("NCCL_P2P_USE_CUDA_MEMCPY");
-  env.insert("NCCL_PROGRESS_APPENDOP_FREQ");
-  env.insert("NCCL_PROTO");
-  env.insert("NCCL_PROXY_APPEND_BATCH_SIZE");
-  env.insert("NCCL_PROXY_DUMP_SIGNAL");
-  env.insert("NCCL_PROXY_PROFILE");
-  env.insert("NCCL_PROXY_PROFILE_DIR");
-  env.insert("NCCL_PXN_DISABLE");
-  env.insert("NCCL_SENDRECV_ALGO");
-  env.insert("NCCL_SET_STACK_SIZE");
-  env.insert("NCCL_SET_THREAD_NAME");
-  env.insert("NCCL_SHM_DISABLE");
-  env.insert("NCCL_SHM_LOCALITY");
-  env.insert("NCCL_SHM_MEMCPY_MODE");
-  env.insert("NCCL_SHM_USE_CUDA_MEMCPY");
-  env.insert("NCCL_SOCKET_FAMILY");
-  env.insert("NCCL_SOCKET_IFNAME");
-  env.insert("NCCL_SOCKET_NTHREADS");
-  env.insert("NCCL_THREAD_THRESHOLDS");
-  env.insert("NCCL_TOPO_DUMP_FILE");
-  env.insert("NCCL_TOPO_DUMP_FILE_RANK");
-  env.insert("NCCL_TOPO_FILE");
-  env.insert("NCCL_TUNER_PLUGIN");
-  env.insert("NCCL_WORK_FIFO_DEPTH");
-}
-
-void readCvarEnv() {
-  CUDA_LAUNCH_BLOCKING = env2str("CUDA_LAUNCH_BLOCKING", "");
-  CUDA_LAUNCH_BLOCKING_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
-
-  NCCL_AGG_CHANNEL_SIZE = env2num<int64_t>("NCCL_AGG_CHANNEL_SIZE", "-2");
-  NCCL_AGG_CHANNEL_SIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
-
-  NCCL_ALGO = env2str("NCCL_ALGO", "");
-  NCCL_ALGO_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
-
-  if (getenv("NCCL_ALLGATHER_ALGO") == nullptr) {
-    NCCL_ALLGATHER_ALGO = NCCL_ALLGATHER_ALGO::orig;
-  } else {
-    std::string str(getenv("NCCL_ALLGATHER_ALGO"));
-    if (str == std::string("orig")) {
-      NCCL_ALLGATHER_ALGO = NCCL_ALLGATHER_ALGO::orig;
-    } else if (str == std::string("ctdirect")) {
-      NCCL_ALLGATHER_ALGO = NCCL_ALLGATHER_ALGO::ctdirect;
-    } else if (str == std::string("ctring")) {
-      NCCL_ALLGATHER_ALGO = NCCL_ALLGATHER_ALGO::ctring;
-    } else if (str == std::string("ctrd")) {
-      NCCL_ALLGATHER_ALGO = NCCL_ALLGATHER_ALGO::ctrd;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_ALLGATHER_ALGO", str.c_str());
-    }
+const int64_t NCCL_WORK_FIFO_DEPTH_DEFAULT = 65536;
+
+static constexpr int numCvarEnvs = 154;
+
+static void CUDA_LAUNCH_BLOCKING_parse(const char* val) {
+  CUDA_LAUNCH_BLOCKING = str2str(val);
+}
+
+static void CUDA_LAUNCH_BLOCKING_reset() {
+  CUDA_LAUNCH_BLOCKING = CUDA_LAUNCH_BLOCKING_DEFAULT;
+}
+
+static void NCCL_AGG_CHANNEL_SIZE_parse(const char* val) {
+  NCCL_AGG_CHANNEL_SIZE = str2num<int64_t>(val);
+}
+
+static void NCCL_AGG_CHANNEL_SIZE_reset() {
+  NCCL_AGG_CHANNEL_SIZE = NCCL_AGG_CHANNEL_SIZE_DEFAULT;
+}
+
+static void NCCL_ALGO_parse(const char* val) {
+  NCCL_ALGO = str2str(val);
+}
+
+static void NCCL_ALGO_reset() {
+  NCCL_ALGO = NCCL_ALGO_DEFAULT;
+}
+
+static const CvarEnumChoice<enum NCCL_ALLGATHER_ALGO> NCCL_ALLGATHER_ALGO_choices[] = {
+  {"ctdirect", NCCL_ALLGATHER_ALGO::ctdirect},
+  {"ctrd", NCCL_ALLGATHER_ALGO::ctrd},
+  {"ctring", NCCL_ALLGATHER_ALGO::ctring},
+  {"orig", NCCL_ALLGATHER_ALGO::orig},
+};
+static void NCCL_ALLGATHER_ALGO_parse(const char* val) {
+  if (!str2enum(val, NCCL_ALLGATHER_ALGO_choices, NCCL_ALLGATHER_ALGO)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_ALLGATHER_ALGO", val);
   }
-  NCCL_ALLGATHER_ALGO_DEFAULT = NCCL_ALLGATHER_ALGO::orig;
+}
 
-  NCCL_ALLGATHER_DIRECT_CUTOFF = env2num<uint64_t>("NCCL_ALLGATHER_DIRECT_CUTOFF", "524288");
-  NCCL_ALLGATHER_DIRECT_CUTOFF_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "524288");
+static void NCCL_ALLGATHER_ALGO_reset() {
+  NCCL_ALLGATHER_ALGO = NCCL_ALLGATHER_ALGO_DEFAULT;
+}
 
-  NCCL_ALLOC_P2P_NET_LL_BUFFERS = env2num<int64_t>("NCCL_ALLOC_P2P_NET_LL_BUFFERS", "0");
-  NCCL_ALLOC_P2P_NET_LL_BUFFERS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_ALLGATHER_DIRECT_CUTOFF_parse(const char* val) {
+  NCCL_ALLGATHER_DIRECT_CUTOFF = str2num<uint64_t>(val);
+}
 
-  if (getenv("NCCL_ALLREDUCE_ALGO") == nullptr) {
-    NCCL_ALLREDUCE_ALGO = NCCL_ALLREDUCE_ALGO::orig;
-  } else {
-    std::string str(getenv("NCCL_ALLREDUCE_ALGO"));
-    if (str == std::string("orig")) {
-      NCCL_ALLREDUCE_ALGO = NCCL_ALLREDUCE_ALGO::orig;
-    } else if (str == std::string("dda")) {
-      NCCL_ALLREDUCE_ALGO = NCCL_ALLREDUCE_ALGO::dda;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_ALLREDUCE_ALGO", str.c_str());
-    }
+static void NCCL_ALLGATHER_DIRECT_CUTOFF_reset() {
+  NCCL_ALLGATHER_DIRECT_CUTOFF = NCCL_ALLGATHER_DIRECT_CUTOFF_DEFAULT;
+}
+
+static void NCCL_ALLOC_P2P_NET_LL_BUFFERS_parse(const char* val) {
+  NCCL_ALLOC_P2P_NET_LL_BUFFERS = str2num<int64_t>(val);
+}
+
+static void NCCL_ALLOC_P2P_NET_LL_BUFFERS_reset() {
+  NCCL_ALLOC_P2P_NET_LL_BUFFERS = NCCL_ALLOC_P2P_NET_LL_BUFFERS_DEFAULT;
+}
+
+static const CvarEnumChoice<enum NCCL_ALLREDUCE_ALGO> NCCL_ALLREDUCE_ALGO_choices[] = {
+  {"dda", NCCL_ALLREDUCE_ALGO::dda},
+  {"orig", NCCL_ALLREDUCE_ALGO::orig},
+};
+static void NCCL_ALLREDUCE_ALGO_parse(const char* val) {
+  if (!str2enum(val, NCCL_ALLREDUCE_ALGO_choices, NCCL_ALLREDUCE_ALGO)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_ALLREDUCE_ALGO", val);
   }
-  NCCL_ALLREDUCE_ALGO_DEFAULT = NCCL_ALLREDUCE_ALGO::orig;
+}
 
-  NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS = env2num<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", "-1");
-  NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_ALLREDUCE_ALGO_reset() {
+  NCCL_ALLREDUCE_ALGO = NCCL_ALLREDUCE_ALGO_DEFAULT;
+}
 
-  NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE = env2num<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", "-1");
-  NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_parse(const char* val) {
+  NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS = str2num<int>(val);
+}
 
-  if (getenv("NCCL_ALLTOALLV_ALGO") == nullptr) {
-    NCCL_ALLTOALLV_ALGO = NCCL_ALLTOALLV_ALGO::orig;
-  } else {
-    std::string str(getenv("NCCL_ALLTOALLV_ALGO"));
-    if (str == std::string("orig")) {
-      NCCL_ALLTOALLV_ALGO = NCCL_ALLTOALLV_ALGO::orig;
-    } else if (str == std::string("ctran")) {
-      NCCL_ALLTOALLV_ALGO = NCCL_ALLTOALLV_ALGO::ctran;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_ALLTOALLV_ALGO", str.c_str());
-    }
+static void NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_reset() {
+  NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS = NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_DEFAULT;
+}
+
+static void NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_parse(const char* val) {
+  NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE = str2num<int>(val);
+}
+
+static void NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_reset() {
+  NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE = NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_DEFAULT;
+}
+
+static const CvarEnumChoice<enum NCCL_ALLTOALLV_ALGO> NCCL_ALLTOALLV_ALGO_choices[] = {
+  {"ctran", NCCL_ALLTOALLV_ALGO::ctran},
+  {"orig", NCCL_ALLTOALLV_ALGO::orig},
+};
+static void NCCL_ALLTOALLV_ALGO_parse(const char* val) {
+  if (!str2enum(val, NCCL_ALLTOALLV_ALGO_choices, NCCL_ALLTOALLV_ALGO)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_ALLTOALLV_ALGO", val);
   }
-  NCCL_ALLTOALLV_ALGO_DEFAULT = NCCL_ALLTOALLV_ALGO::orig;
+}
 
-  if (getenv("NCCL_ALLTOALL_ALGO") == nullptr) {
-    NCCL_ALLTOALL_ALGO = NCCL_ALLTOALL_ALGO::orig;
-  } else {
-    std::string str(getenv("NCCL_ALLTOALL_ALGO"));
-    if (str == std::string("orig")) {
-      NCCL_ALLTOALL_ALGO = NCCL_ALLTOALL_ALGO::orig;
-    } else if (str == std::string("ctran")) {
-      NCCL_ALLTOALL_ALGO = NCCL_ALLTOALL_ALGO::ctran;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_ALLTOALL_ALGO", str.c_str());
-    }
+static void NCCL_ALLTOALLV_ALGO_reset() {
+  NCCL_ALLTOALLV_ALGO = NCCL_ALLTOALLV_ALGO_DEFAULT;
+}
+
+static const CvarEnumChoice<enum NCCL_ALLTOALL_ALGO> NCCL_ALLTOALL_ALGO_choices[] = {
+  {"ctran", NCCL_ALLTOALL_ALGO::ctran},
+  {"orig", NCCL_ALLTOALL_ALGO::orig},
+};
+static void NCCL_ALLTOALL_ALGO_parse(const char* val) {
+  if (!str2enum(val, NCCL_ALLTOALL_ALGO_choices, NCCL_ALLTOALL_ALGO)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_ALLTOALL_ALGO", val);
   }
-  NCCL_ALLTOALL_ALGO_DEFAULT = NCCL_ALLTOALL_ALGO::orig;
+}
+
+static void NCCL_ALLTOALL_ALGO_reset() {
+  NCCL_ALLTOALL_ALGO = NCCL_ALLTOALL_ALGO_DEFAULT;
+}
 
-  NCCL_BUFFSIZE = env2num<int64_t>("NCCL_BUFFSIZE", "-2");
-  NCCL_BUFFSIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_BUFFSIZE_parse(const char* val) {
+  NCCL_BUFFSIZE = str2num<int64_t>(val);
+}
 
-  NCCL_CGA_CLUSTER_SIZE = env2num<int64_t>("NCCL_CGA_CLUSTER_SIZE", "-1");
-  NCCL_CGA_CLUSTER_SIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_BUFFSIZE_reset() {
+  NCCL_BUFFSIZE = NCCL_BUFFSIZE_DEFAULT;
+}
 
-  NCCL_CHECK_POINTERS = env2num<int64_t>("NCCL_CHECK_POINTERS", "0");
-  NCCL_CHECK_POINTERS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CGA_CLUSTER_SIZE_parse(const char* val) {
+  NCCL_CGA_CLUSTER_SIZE = str2num<int64_t>(val);
+}
 
-  NCCL_CHUNK_SIZE = env2num<int64_t>("NCCL_CHUNK_SIZE", "0");
-  NCCL_CHUNK_SIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CGA_CLUSTER_SIZE_reset() {
+  NCCL_CGA_CLUSTER_SIZE = NCCL_CGA_CLUSTER_SIZE_DEFAULT;
+}
 
-  NCCL_COLLNET_ENABLE = env2str("NCCL_COLLNET_ENABLE", "");
-  NCCL_COLLNET_ENABLE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CHECK_POINTERS_parse(const char* val) {
+  NCCL_CHECK_POINTERS = str2num<int64_t>(val);
+}
 
-  NCCL_COLLNET_NODE_THRESHOLD = env2num<int64_t>("NCCL_COLLNET_NODE_THRESHOLD", "2");
-  NCCL_COLLNET_NODE_THRESHOLD_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "2");
+static void NCCL_CHECK_POINTERS_reset() {
+  NCCL_CHECK_POINTERS = NCCL_CHECK_POINTERS_DEFAULT;
+}
 
-  NCCL_COLLTRACE_DIR = env2str("NCCL_COLLTRACE_DIR", "");
-  NCCL_COLLTRACE_DIR_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CHUNK_SIZE_parse(const char* val) {
+  NCCL_CHUNK_SIZE = str2num<int64_t>(val);
+}
 
-  NCCL_COMM_BLOCKING = env2num<int64_t>("NCCL_COMM_BLOCKING", "-1");
-  NCCL_COMM_BLOCKING_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_CHUNK_SIZE_reset() {
+  NCCL_CHUNK_SIZE = NCCL_CHUNK_SIZE_DEFAULT;
+}
 
-  NCCL_COMM_ID = env2str("NCCL_COMM_ID", "");
-  NCCL_COMM_ID_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_COLLNET_ENABLE_parse(const char* val) {
+  NCCL_COLLNET_ENABLE = str2str(val);
+}
 
-  NCCL_COMM_SPLIT_SHARE_RESOURCES = env2num<int64_t>("NCCL_COMM_SPLIT_SHARE_RESOURCES", "-1");
-  NCCL_COMM_SPLIT_SHARE_RESOURCES_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_COLLNET_ENABLE_reset() {
+  NCCL_COLLNET_ENABLE = NCCL_COLLNET_ENABLE_DEFAULT;
+}
 
-  NCCL_CONNECT_ROUND_SIZE = env2num<int64_t>("NCCL_CONNECT_ROUND_SIZE", "128");
-  NCCL_CONNECT_ROUND_SIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "128");
+static void NCCL_COLLNET_NODE_THRESHOLD_parse(const char* val) {
+  NCCL_COLLNET_NODE_THRESHOLD = str2num<int64_t>(val);
+}
 
-  NCCL_CREATE_THREAD_CONTEXT = env2num<int64_t>("NCCL_CREATE_THREAD_CONTEXT", "0");
-  NCCL_CREATE_THREAD_CONTEXT_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_COLLNET_NODE_THRESHOLD_reset() {
+  NCCL_COLLNET_NODE_THRESHOLD = NCCL_COLLNET_NODE_THRESHOLD_DEFAULT;
+}
 
-  NCCL_CROSS_NIC = env2num<int64_t>("NCCL_CROSS_NIC", "2");
-  NCCL_CROSS_NIC_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "2");
+static void NCCL_COLLTRACE_DIR_parse(const char* val) {
+  NCCL_COLLTRACE_DIR = str2str(val);
+}
 
-  NCCL_CTRAN_AG_RD_RTR = env2bool("NCCL_CTRAN_AG_RD_RTR", "True");
-  NCCL_CTRAN_AG_RD_RTR_DEFAULT = env2bool("NCCL_ENV_DO_NOT_SET", "True");
+static void NCCL_COLLTRACE_DIR_reset() {
+  NCCL_COLLTRACE_DIR = NCCL_COLLTRACE_DIR_DEFAULT;
+}
 
-  NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS = env2num<int>("NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", "64");
-  NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "64");
+static void NCCL_COMM_BLOCKING_parse(const char* val) {
+  NCCL_COMM_BLOCKING = str2num<int64_t>(val);
+}
 
-  NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE = env2num<int>("NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", "640");
-  NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "640");
+static void NCCL_COMM_BLOCKING_reset() {
+  NCCL_COMM_BLOCKING = NCCL_COMM_BLOCKING_DEFAULT;
+}
 
-  NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS = env2num<int>("NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", "-1");
-  NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_COMM_ID_parse(const char* val) {
+  NCCL_COMM_ID = str2str(val);
+}
 
-  NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE = env2num<int>("NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", "-1");
-  NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_COMM_ID_reset() {
+  NCCL_COMM_ID = NCCL_COMM_ID_DEFAULT;
+}
 
-  NCCL_CTRAN_ALLTOALL_THRESHOLD = env2num<uint64_t>("NCCL_CTRAN_ALLTOALL_THRESHOLD", "32768");
-  NCCL_CTRAN_ALLTOALL_THRESHOLD_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "32768");
+static void NCCL_COMM_SPLIT_SHARE_RESOURCES_parse(const char* val) {
+  NCCL_COMM_SPLIT_SHARE_RESOURCES = str2num<int64_t>(val);
+}
 
-  {
-    NCCL_CTRAN_BACKENDS.clear();
-    auto tokens = env2strlist("NCCL_CTRAN_BACKENDS", "ib");
-    for (auto token : tokens) {
-      if (token == std::string("ib")) {
-        NCCL_CTRAN_BACKENDS.emplace_back(NCCL_CTRAN_BACKENDS::ib);
-      } else {
-        CVAR_WARN_UNKNOWN_VALUE("NCCL_CTRAN_BACKENDS", token.c_str());
-      }
-    }
-  }
-  NCCL_CTRAN_BACKENDS_DEFAULT.clear();
-  NCCL_CTRAN_BACKENDS_DEFAULT.emplace_back(NCCL_CTRAN_BACKENDS::ib);
+static void NCCL_COMM_SPLIT_SHARE_RESOURCES_reset() {
+  NCCL_COMM_SPLIT_SHARE_RESOURCES = NCCL_COMM_SPLIT_SHARE_RESOURCES_DEFAULT;
+}
 
-  NCCL_CTRAN_IB_CTRL_TC = env2num<uint64_t>("NCCL_CTRAN_IB_CTRL_TC", "192");
-  NCCL_CTRAN_IB_CTRL_TC_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "192");
+static void NCCL_CONNECT_ROUND_SIZE_parse(const char* val) {
+  NCCL_CONNECT_ROUND_SIZE = str2num<int64_t>(val);
+}
 
-  NCCL_CTRAN_IB_MAX_QPS = env2num<int>("NCCL_CTRAN_IB_MAX_QPS", "1");
-  NCCL_CTRAN_IB_MAX_QPS_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_CONNECT_ROUND_SIZE_reset() {
+  NCCL_CONNECT_ROUND_SIZE = NCCL_CONNECT_ROUND_SIZE_DEFAULT;
+}
 
-  NCCL_CTRAN_IB_QP_SCALING_THRESHOLD = env2num<uint64_t>("NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", "1048576");
-  NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "1048576");
+static void NCCL_CREATE_THREAD_CONTEXT_parse(const char* val) {
+  NCCL_CREATE_THREAD_CONTEXT = str2num<int64_t>(val);
+}
 
-  NCCL_CTRAN_IB_TRAFFIC_PROFILNG = env2bool("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "False");
-  NCCL_CTRAN_IB_TRAFFIC_PROFILNG_DEFAULT = env2bool("NCCL_ENV_DO_NOT_SET", "False");
+static void NCCL_CREATE_THREAD_CONTEXT_reset() {
+  NCCL_CREATE_THREAD_CONTEXT = NCCL_CREATE_THREAD_CONTEXT_DEFAULT;
+}
 
-  NCCL_CTRAN_KINETO_PROFILE_DIR = env2str("NCCL_CTRAN_KINETO_PROFILE_DIR", "/tmp");
-  NCCL_CTRAN_KINETO_PROFILE_DIR_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "/tmp");
+static void NCCL_CROSS_NIC_parse(const char* val) {
+  NCCL_CROSS_NIC = str2num<int64_t>(val);
+}
 
-  NCCL_CTRAN_NUM_KERNEL_P2PELEMS = env2num<int>("NCCL_CTRAN_NUM_KERNEL_P2PELEMS", "65536");
-  NCCL_CTRAN_NUM_KERNEL_P2PELEMS_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "65536");
+static void NCCL_CROSS_NIC_reset() {
+  NCCL_CROSS_NIC = NCCL_CROSS_NIC_DEFAULT;
+}
 
-  if (getenv("NCCL_CTRAN_PROFILING") == nullptr) {
-    NCCL_CTRAN_PROFILING = NCCL_CTRAN_PROFILING::none;
-  } else {
-    std::string str(getenv("NCCL_CTRAN_PROFILING"));
-    if (str == std::string("none")) {
-      NCCL_CTRAN_PROFILING = NCCL_CTRAN_PROFILING::none;
-    } else if (str == std::string("stdout")) {
-      NCCL_CTRAN_PROFILING = NCCL_CTRAN_PROFILING::stdout;
-    } else if (str == std::string("info")) {
-      NCCL_CTRAN_PROFILING = NCCL_CTRAN_PROFILING::info;
-    } else if (str == std::string("kineto")) {
-      NCCL_CTRAN_PROFILING = NCCL_CTRAN_PROFILING::kineto;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_CTRAN_PROFILING", str.c_str());
-    }
-  }
-  NCCL_CTRAN_PROFILING_DEFAULT = NCCL_CTRAN_PROFILING::none;
+static void NCCL_CTRAN_AG_RD_RTR_parse(const char* val) {
+  NCCL_CTRAN_AG_RD_RTR = str2bool("NCCL_CTRAN_AG_RD_RTR", val);
+}
 
-  NCCL_CTRAN_PROFILING_REPORT_COUNT = env2num<int>("NCCL_CTRAN_PROFILING_REPORT_COUNT", "100");
-  NCCL_CTRAN_PROFILING_REPORT_COUNT_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "100");
+static void NCCL_CTRAN_AG_RD_RTR_reset() {
+  NCCL_CTRAN_AG_RD_RTR = NCCL_CTRAN_AG_RD_RTR_DEFAULT;
+}
 
-  if (getenv("NCCL_CTRAN_REGISTER") == nullptr) {
-    NCCL_CTRAN_REGISTER = NCCL_CTRAN_REGISTER::lazy;
-  } else {
-    std::string str(getenv("NCCL_CTRAN_REGISTER"));
-    if (str == std::string("none")) {
-      NCCL_CTRAN_REGISTER = NCCL_CTRAN_REGISTER::none;
-    } else if (str == std::string("lazy")) {
-      NCCL_CTRAN_REGISTER = NCCL_CTRAN_REGISTER::lazy;
-    } else if (str == std::string("eager")) {
-      NCCL_CTRAN_REGISTER = NCCL_CTRAN_REGISTER::eager;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_CTRAN_REGISTER", str.c_str());
-    }
-  }
-  NCCL_CTRAN_REGISTER_DEFAULT = NCCL_CTRAN_REGISTER::lazy;
+static void NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_parse(const char* val) {
+  NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS = str2num<int>(val);
+}
 
-  NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT = env2num<int>("NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", "-1");
-  NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_reset() {
+  NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS = NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_DEFAULT;
+}
 
-  NCCL_CTRAN_RING_MAX_OUTSTANDING = env2num<int>("NCCL_CTRAN_RING_MAX_OUTSTANDING", "8");
-  NCCL_CTRAN_RING_MAX_OUTSTANDING_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "8");
+static void NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_parse(const char* val) {
+  NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE = str2num<int>(val);
+}
 
-  NCCL_CTRAN_RING_STEP = env2num<uint64_t>("NCCL_CTRAN_RING_STEP", "4194304");
-  NCCL_CTRAN_RING_STEP_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "4194304");
+static void NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_reset() {
+  NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE = NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_DEFAULT;
+}
 
-  NCCL_CTRAN_SHARED_DEVBUF_SIZE = env2num<uint64_t>("NCCL_CTRAN_SHARED_DEVBUF_SIZE", "8388608");
-  NCCL_CTRAN_SHARED_DEVBUF_SIZE_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "8388608");
+static void NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_parse(const char* val) {
+  NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS = str2num<int>(val);
+}
 
-  NCCL_CTRAN_TOPO_FILE = env2str("NCCL_CTRAN_TOPO_FILE", "");
-  NCCL_CTRAN_TOPO_FILE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_reset() {
+  NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS = NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_DEFAULT;
+}
 
-  NCCL_CTRAN_TOPO_FILE_KEYS.clear();
-  NCCL_CTRAN_TOPO_FILE_KEYS = env2strlist("NCCL_CTRAN_TOPO_FILE_KEYS", "");
-  NCCL_CTRAN_TOPO_FILE_KEYS_DEFAULT.clear();
-  NCCL_CTRAN_TOPO_FILE_KEYS_DEFAULT = env2strlist("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_parse(const char* val) {
+  NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE = str2num<int>(val);
+}
 
-  NCCL_CUDA_PATH = env2str("NCCL_CUDA_PATH", "");
-  NCCL_CUDA_PATH_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_reset() {
+  NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE = NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_DEFAULT;
+}
 
-  NCCL_CUMEM_ENABLE = env2num<int64_t>("NCCL_CUMEM_ENABLE", "0");
-  NCCL_CUMEM_ENABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CTRAN_ALLTOALL_THRESHOLD_parse(const char* val) {
+  NCCL_CTRAN_ALLTOALL_THRESHOLD = str2num<uint64_t>(val);
+}
 
-  NCCL_DATA_EXPORT_DIR = env2str("NCCL_DATA_EXPORT_DIR", "/tmp");
-  NCCL_DATA_EXPORT_DIR_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "/tmp");
+static void NCCL_CTRAN_ALLTOALL_THRESHOLD_reset() {
+  NCCL_CTRAN_ALLTOALL_THRESHOLD = NCCL_CTRAN_ALLTOALL_THRESHOLD_DEFAULT;
+}
 
-  NCCL_DDA_ALLREDUCE_MAX_BLOCKS = env2num<int>("NCCL_DDA_ALLREDUCE_MAX_BLOCKS", "24");
-  NCCL_DDA_ALLREDUCE_MAX_BLOCKS_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "24");
+static const CvarEnumChoice<enum NCCL_CTRAN_BACKENDS> NCCL_CTRAN_BACKENDS_choices[] = {
+  {"ib", NCCL_CTRAN_BACKENDS::ib},
+};
+static void NCCL_CTRAN_BACKENDS_parse(const char* val) {
+  NCCL_CTRAN_BACKENDS.clear();
+  NCCL_CTRAN_BACKENDS_MASK = 0;
+  for (const auto& token : str2strlist(val)) {
+    enum NCCL_CTRAN_BACKENDS choice;
+    if (str2enum(token.c_str(), NCCL_CTRAN_BACKENDS_choices, choice)) {
+      NCCL_CTRAN_BACKENDS.emplace_back(choice);
+      NCCL_CTRAN_BACKENDS_MASK |= ncclCvarBit(choice);
+    } else {
+      CVAR_WARN_UNKNOWN_VALUE("NCCL_CTRAN_BACKENDS", token.c_str());
+    }
+  }
+}
 
-  NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD = env2num<uint64_t>("NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", "1048576");
-  NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "1048576");
+static void NCCL_CTRAN_BACKENDS_reset() {
+  NCCL_CTRAN_BACKENDS = NCCL_CTRAN_BACKENDS_DEFAULT;
+  NCCL_CTRAN_BACKENDS_MASK = NCCL_CTRAN_BACKENDS_MASK_DEFAULT;
+}
 
-  NCCL_DDA_ALLREDUCE_TREE_THRESHOLD = env2num<uint64_t>("NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", "262144");
-  NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "262144");
+static void NCCL_CTRAN_IB_CTRL_TC_parse(const char* val) {
+  NCCL_CTRAN_IB_CTRL_TC = str2num<uint64_t>(val);
+}
 
-  NCCL_DDA_TMPBUFF_SIZE = env2num<uint64_t>("NCCL_DDA_TMPBUFF_SIZE", "33554432");
-  NCCL_DDA_TMPBUFF_SIZE_DEFAULT = env2num<uint64_t>("NCCL_ENV_DO_NOT_SET", "33554432");
+static void NCCL_CTRAN_IB_CTRL_TC_reset() {
+  NCCL_CTRAN_IB_CTRL_TC = NCCL_CTRAN_IB_CTRL_TC_DEFAULT;
+}
 
-  NCCL_DEBUG = env2str("NCCL_DEBUG", "");
-  NCCL_DEBUG_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CTRAN_IB_MAX_QPS_parse(const char* val) {
+  NCCL_CTRAN_IB_MAX_QPS = str2num<int>(val);
+}
 
-  NCCL_DEBUG_FILE = env2str("NCCL_DEBUG_FILE", "");
-  NCCL_DEBUG_FILE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CTRAN_IB_MAX_QPS_reset() {
+  NCCL_CTRAN_IB_MAX_QPS = NCCL_CTRAN_IB_MAX_QPS_DEFAULT;
+}
 
-  NCCL_DEBUG_SUBSYS = env2str("NCCL_DEBUG_SUBSYS", "");
-  NCCL_DEBUG_SUBSYS_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_parse(const char* val) {
+  NCCL_CTRAN_IB_QP_SCALING_THRESHOLD = str2num<uint64_t>(val);
+}
 
-  NCCL_DMABUF_ENABLE = env2num<int64_t>("NCCL_DMABUF_ENABLE", "1");
-  NCCL_DMABUF_ENABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_reset() {
+  NCCL_CTRAN_IB_QP_SCALING_THRESHOLD = NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_DEFAULT;
+}
 
-  NCCL_GDRCOPY_ENABLE = env2num<int64_t>("NCCL_GDRCOPY_ENABLE", "0");
-  NCCL_GDRCOPY_ENABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CTRAN_IB_TRAFFIC_PROFILNG_parse(const char* val) {
+  NCCL_CTRAN_IB_TRAFFIC_PROFILNG = str2bool("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", val);
+}
 
-  NCCL_GDRCOPY_FIFO_ENABLE = env2num<int64_t>("NCCL_GDRCOPY_FIFO_ENABLE", "-2");
-  NCCL_GDRCOPY_FIFO_ENABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_CTRAN_IB_TRAFFIC_PROFILNG_reset() {
+  NCCL_CTRAN_IB_TRAFFIC_PROFILNG = NCCL_CTRAN_IB_TRAFFIC_PROFILNG_DEFAULT;
+}
 
-  NCCL_GDRCOPY_FLUSH_ENABLE = env2num<int64_t>("NCCL_GDRCOPY_FLUSH_ENABLE", "0");
-  NCCL_GDRCOPY_FLUSH_ENABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CTRAN_KINETO_PROFILE_DIR_parse(const char* val) {
+  NCCL_CTRAN_KINETO_PROFILE_DIR = str2str(val);
+}
 
-  NCCL_GDRCOPY_SYNC_ENABLE = env2num<int64_t>("NCCL_GDRCOPY_SYNC_ENABLE", "1");
-  NCCL_GDRCOPY_SYNC_ENABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_CTRAN_KINETO_PROFILE_DIR_reset() {
+  NCCL_CTRAN_KINETO_PROFILE_DIR = NCCL_CTRAN_KINETO_PROFILE_DIR_DEFAULT;
+}
 
-  NCCL_GDR_FLUSH_DISABLE = env2num<int64_t>("NCCL_GDR_FLUSH_DISABLE", "0");
-  NCCL_GDR_FLUSH_DISABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CTRAN_NUM_KERNEL_P2PELEMS_parse(const char* val) {
+  NCCL_CTRAN_NUM_KERNEL_P2PELEMS = str2num<int>(val);
+}
 
-  NCCL_GRAPH_DUMP_FILE = env2str("NCCL_GRAPH_DUMP_FILE", "");
-  NCCL_GRAPH_DUMP_FILE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CTRAN_NUM_KERNEL_P2PELEMS_reset() {
+  NCCL_CTRAN_NUM_KERNEL_P2PELEMS = NCCL_CTRAN_NUM_KERNEL_P2PELEMS_DEFAULT;
+}
 
-  NCCL_GRAPH_DUMP_FILE_RANK = env2num<int64_t>("NCCL_GRAPH_DUMP_FILE_RANK", "0");
-  NCCL_GRAPH_DUMP_FILE_RANK_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static const CvarEnumChoice<enum NCCL_CTRAN_PROFILING> NCCL_CTRAN_PROFILING_choices[] = {
+  {"info", NCCL_CTRAN_PROFILING::info},
+  {"kineto", NCCL_CTRAN_PROFILING::kineto},
+  {"none", NCCL_CTRAN_PROFILING::none},
+  {"stdout", NCCL_CTRAN_PROFILING::stdout},
+};
+static void NCCL_CTRAN_PROFILING_parse(const char* val) {
+  if (!str2enum(val, NCCL_CTRAN_PROFILING_choices, NCCL_CTRAN_PROFILING)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_CTRAN_PROFILING", val);
+  }
+}
 
-  NCCL_GRAPH_FILE = env2str("NCCL_GRAPH_FILE", "");
-  NCCL_GRAPH_FILE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_CTRAN_PROFILING_reset() {
+  NCCL_CTRAN_PROFILING = NCCL_CTRAN_PROFILING_DEFAULT;
+}
 
-  NCCL_GRAPH_MIXING_SUPPORT = env2num<int64_t>("NCCL_GRAPH_MIXING_SUPPORT", "1");
-  NCCL_GRAPH_MIXING_SUPPORT_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_CTRAN_PROFILING_REPORT_COUNT_parse(const char* val) {
+  NCCL_CTRAN_PROFILING_REPORT_COUNT = str2num<int>(val);
+}
 
-  NCCL_GRAPH_REGISTER = env2num<int64_t>("NCCL_GRAPH_REGISTER", "0");
-  NCCL_GRAPH_REGISTER_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CTRAN_PROFILING_REPORT_COUNT_reset() {
+  NCCL_CTRAN_PROFILING_REPORT_COUNT = NCCL_CTRAN_PROFILING_REPORT_COUNT_DEFAULT;
+}
 
-  NCCL_HOSTID = env2str("NCCL_HOSTID", "");
-  NCCL_HOSTID_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static const CvarEnumChoice<enum NCCL_CTRAN_REGISTER> NCCL_CTRAN_REGISTER_choices[] = {
+  {"eager", NCCL_CTRAN_REGISTER::eager},
+  {"lazy", NCCL_CTRAN_REGISTER::lazy},
+  {"none", NCCL_CTRAN_REGISTER::none},
+};
+static void NCCL_CTRAN_REGISTER_parse(const char* val) {
+  if (!str2enum(val, NCCL_CTRAN_REGISTER_choices, NCCL_CTRAN_REGISTER)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_CTRAN_REGISTER", val);
+  }
+}
 
-  NCCL_IB_ADAPTIVE_ROUTING = env2num<int64_t>("NCCL_IB_ADAPTIVE_ROUTING", "-2");
-  NCCL_IB_ADAPTIVE_ROUTING_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_CTRAN_REGISTER_reset() {
+  NCCL_CTRAN_REGISTER = NCCL_CTRAN_REGISTER_DEFAULT;
+}
 
-  NCCL_IB_ADDR_FAMILY = env2str("NCCL_IB_ADDR_FAMILY", "AF_INET");
-  NCCL_IB_ADDR_FAMILY_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "AF_INET");
+static void NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_parse(const char* val) {
+  NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT = str2num<int>(val);
+}
 
-  NCCL_IB_ADDR_RANGE = env2str("NCCL_IB_ADDR_RANGE", "::/0");
-  NCCL_IB_ADDR_RANGE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "::/0");
+static void NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_reset() {
+  NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT = NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_DEFAULT;
+}
 
-  NCCL_IB_AR_THRESHOLD = env2num<int64_t>("NCCL_IB_AR_THRESHOLD", "8192");
-  NCCL_IB_AR_THRESHOLD_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "8192");
+static void NCCL_CTRAN_RING_MAX_OUTSTANDING_parse(const char* val) {
+  NCCL_CTRAN_RING_MAX_OUTSTANDING = str2num<int>(val);
+}
 
-  NCCL_IB_DISABLE = env2num<int64_t>("NCCL_IB_DISABLE", "0");
-  NCCL_IB_DISABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CTRAN_RING_MAX_OUTSTANDING_reset() {
+  NCCL_CTRAN_RING_MAX_OUTSTANDING = NCCL_CTRAN_RING_MAX_OUTSTANDING_DEFAULT;
+}
 
-  NCCL_IB_GID_INDEX = env2num<int>("NCCL_IB_GID_INDEX", "-1");
-  NCCL_IB_GID_INDEX_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_CTRAN_RING_STEP_parse(const char* val) {
+  NCCL_CTRAN_RING_STEP = str2num<uint64_t>(val);
+}
 
-  std::vector<std::string> NCCL_IB_HCA_allPrefixes{"^", "="};
-  NCCL_IB_HCA.clear();
-  std::tie(NCCL_IB_HCA_PREFIX, NCCL_IB_HCA) = env2prefixedStrlist("NCCL_IB_HCA", "", NCCL_IB_HCA_allPrefixes);
-  NCCL_IB_HCA_DEFAULT.clear();
-  std::tie(NCCL_IB_HCA_PREFIX_DEFAULT, NCCL_IB_HCA_DEFAULT) = env2prefixedStrlist("NCCL_ENV_DO_NOT_SET", "", NCCL_IB_HCA_allPrefixes);
+static void NCCL_CTRAN_RING_STEP_reset() {
+  NCCL_CTRAN_RING_STEP = NCCL_CTRAN_RING_STEP_DEFAULT;
+}
 
-  NCCL_IB_MERGE_VFS = env2num<int64_t>("NCCL_IB_MERGE_VFS", "1");
-  NCCL_IB_MERGE_VFS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_CTRAN_SHARED_DEVBUF_SIZE_parse(const char* val) {
+  NCCL_CTRAN_SHARED_DEVBUF_SIZE = str2num<uint64_t>(val);
+}
 
-  NCCL_IB_PCI_RELAXED_ORDERING = env2num<int64_t>("NCCL_IB_PCI_RELAXED_ORDERING", "2");
-  NCCL_IB_PCI_RELAXED_ORDERING_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "2");
+static void NCCL_CTRAN_SHARED_DEVBUF_SIZE_reset() {
+  NCCL_CTRAN_SHARED_DEVBUF_SIZE = NCCL_CTRAN_SHARED_DEVBUF_SIZE_DEFAULT;
+}
 
-  NCCL_IB_PKEY = env2num<int64_t>("NCCL_IB_PKEY", "0");
-  NCCL_IB_PKEY_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CTRAN_TOPO_FILE_parse(const char* val) {
+  NCCL_CTRAN_TOPO_FILE = str2str(val);
+}
 
-  NCCL_IB_QPS_PER_CONNECTION = env2num<int64_t>("NCCL_IB_QPS_PER_CONNECTION", "1");
-  NCCL_IB_QPS_PER_CONNECTION_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_CTRAN_TOPO_FILE_reset() {
+  NCCL_CTRAN_TOPO_FILE = NCCL_CTRAN_TOPO_FILE_DEFAULT;
+}
 
-  NCCL_IB_RETRY_CNT = env2num<int64_t>("NCCL_IB_RETRY_CNT", "7");
-  NCCL_IB_RETRY_CNT_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "7");
+static void NCCL_CTRAN_TOPO_FILE_KEYS_parse(const char* val) {
+  NCCL_CTRAN_TOPO_FILE_KEYS = str2strlist(val);
+}
 
-  NCCL_IB_ROCE_VERSION_NUM = env2num<int>("NCCL_IB_ROCE_VERSION_NUM", "2");
-  NCCL_IB_ROCE_VERSION_NUM_DEFAULT = env2num<int>("NCCL_ENV_DO_NOT_SET", "2");
+static void NCCL_CTRAN_TOPO_FILE_KEYS_reset() {
+  NCCL_CTRAN_TOPO_FILE_KEYS = NCCL_CTRAN_TOPO_FILE_KEYS_DEFAULT;
+}
 
-  NCCL_IB_SL = env2num<int64_t>("NCCL_IB_SL", "0");
-  NCCL_IB_SL_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CUDA_PATH_parse(const char* val) {
+  NCCL_CUDA_PATH = str2str(val);
+}
 
-  NCCL_IB_SPLIT_DATA_ON_QPS = env2num<int64_t>("NCCL_IB_SPLIT_DATA_ON_QPS", "1");
-  NCCL_IB_SPLIT_DATA_ON_QPS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_CUDA_PATH_reset() {
+  NCCL_CUDA_PATH = NCCL_CUDA_PATH_DEFAULT;
+}
 
-  NCCL_IB_TC = env2num<int64_t>("NCCL_IB_TC", "0");
-  NCCL_IB_TC_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CUMEM_ENABLE_parse(const char* val) {
+  NCCL_CUMEM_ENABLE = str2num<int64_t>(val);
+}
 
-  NCCL_IB_TIMEOUT = env2num<int64_t>("NCCL_IB_TIMEOUT", "18");
-  NCCL_IB_TIMEOUT_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "18");
+static void NCCL_CUMEM_ENABLE_reset() {
+  NCCL_CUMEM_ENABLE = NCCL_CUMEM_ENABLE_DEFAULT;
+}
 
-  NCCL_IB_USE_INLINE = env2num<int64_t>("NCCL_IB_USE_INLINE", "0");
-  NCCL_IB_USE_INLINE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CVAR_SNAPSHOT_DIR_parse(const char* val) {
+  NCCL_CVAR_SNAPSHOT_DIR = str2str(val);
+}
 
-  NCCL_IGNORE_CPU_AFFINITY = env2num<int64_t>("NCCL_IGNORE_CPU_AFFINITY", "0");
-  NCCL_IGNORE_CPU_AFFINITY_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_CVAR_SNAPSHOT_DIR_reset() {
+  NCCL_CVAR_SNAPSHOT_DIR = NCCL_CVAR_SNAPSHOT_DIR_DEFAULT;
+}
 
-  NCCL_IGNORE_DISABLED_P2P = env2num<int64_t>("NCCL_IGNORE_DISABLED_P2P", "0");
-  NCCL_IGNORE_DISABLED_P2P_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_DATA_EXPORT_DIR_parse(const char* val) {
+  NCCL_DATA_EXPORT_DIR = str2str(val);
+}
 
-  NCCL_L1_SHARED_MEMORY_CARVEOUT = env2num<int64_t>("NCCL_L1_SHARED_MEMORY_CARVEOUT", "0");
-  NCCL_L1_SHARED_MEMORY_CARVEOUT_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_DATA_EXPORT_DIR_reset() {
+  NCCL_DATA_EXPORT_DIR = NCCL_DATA_EXPORT_DIR_DEFAULT;
+}
 
-  NCCL_LAUNCH_MODE = env2str("NCCL_LAUNCH_MODE", "");
-  NCCL_LAUNCH_MODE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_DDA_ALLREDUCE_MAX_BLOCKS_parse(const char* val) {
+  NCCL_DDA_ALLREDUCE_MAX_BLOCKS = str2num<int>(val);
+}
 
-  NCCL_LL128_BUFFSIZE = env2num<int64_t>("NCCL_LL128_BUFFSIZE", "-2");
-  NCCL_LL128_BUFFSIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_DDA_ALLREDUCE_MAX_BLOCKS_reset() {
+  NCCL_DDA_ALLREDUCE_MAX_BLOCKS = NCCL_DDA_ALLREDUCE_MAX_BLOCKS_DEFAULT;
+}
 
-  NCCL_LL128_NTHREADS = env2num<int64_t>("NCCL_LL128_NTHREADS", "-2");
-  NCCL_LL128_NTHREADS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_parse(const char* val) {
+  NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD = str2num<uint64_t>(val);
+}
 
-  NCCL_LL_BUFFSIZE = env2num<int64_t>("NCCL_LL_BUFFSIZE", "-2");
-  NCCL_LL_BUFFSIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_reset() {
+  NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD = NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_DEFAULT;
+}
 
-  NCCL_LOCAL_REGISTER = env2num<int64_t>("NCCL_LOCAL_REGISTER", "1");
-  NCCL_LOCAL_REGISTER_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_parse(const char* val) {
+  NCCL_DDA_ALLREDUCE_TREE_THRESHOLD = str2num<uint64_t>(val);
+}
 
-  if (getenv("NCCL_LOGGER_MODE") == nullptr) {
-    NCCL_LOGGER_MODE = NCCL_LOGGER_MODE::sync;
-  } else {
-    std::string str(getenv("NCCL_LOGGER_MODE"));
-    if (str == std::string("sync")) {
-      NCCL_LOGGER_MODE = NCCL_LOGGER_MODE::sync;
-    } else if (str == std::string("async")) {
-      NCCL_LOGGER_MODE = NCCL_LOGGER_MODE::async;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_LOGGER_MODE", str.c_str());
-    }
-  }
-  NCCL_LOGGER_MODE_DEFAULT = NCCL_LOGGER_MODE::sync;
+static void NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_reset() {
+  NCCL_DDA_ALLREDUCE_TREE_THRESHOLD = NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_DEFAULT;
+}
 
-  NCCL_MAX_CTAS = env2num<int64_t>("NCCL_MAX_CTAS", "-1");
-  NCCL_MAX_CTAS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_DDA_TMPBUFF_SIZE_parse(const char* val) {
+  NCCL_DDA_TMPBUFF_SIZE = str2num<uint64_t>(val);
+}
 
-  NCCL_MAX_NCHANNELS = env2num<int64_t>("NCCL_MAX_NCHANNELS", "-2");
-  NCCL_MAX_NCHANNELS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_DDA_TMPBUFF_SIZE_reset() {
+  NCCL_DDA_TMPBUFF_SIZE = NCCL_DDA_TMPBUFF_SIZE_DEFAULT;
+}
 
-  NCCL_MAX_NRINGS = env2num<int64_t>("NCCL_MAX_NRINGS", "-2");
-  NCCL_MAX_NRINGS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_DEBUG_parse(const char* val) {
+  NCCL_DEBUG = str2str(val);
+}
 
-  NCCL_MAX_P2P_NCHANNELS = env2num<int64_t>("NCCL_MAX_P2P_NCHANNELS", "MAX");
-  NCCL_MAX_P2P_NCHANNELS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "MAX");
+static void NCCL_DEBUG_reset() {
+  NCCL_DEBUG = NCCL_DEBUG_DEFAULT;
+}
 
-  if (getenv("NCCL_MEM_SYNC_DOMAIN") == nullptr) {
-    NCCL_MEM_SYNC_DOMAIN = NCCL_MEM_SYNC_DOMAIN::remote;
-  } else {
-    std::string str(getenv("NCCL_MEM_SYNC_DOMAIN"));
-    if (str == std::string("local")) {
-      NCCL_MEM_SYNC_DOMAIN = NCCL_MEM_SYNC_DOMAIN::local;
-    } else if (str == std::string("remote")) {
-      NCCL_MEM_SYNC_DOMAIN = NCCL_MEM_SYNC_DOMAIN::remote;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_MEM_SYNC_DOMAIN", str.c_str());
-    }
-  }
-  NCCL_MEM_SYNC_DOMAIN_DEFAULT = NCCL_MEM_SYNC_DOMAIN::remote;
+static void NCCL_DEBUG_FILE_parse(const char* val) {
+  NCCL_DEBUG_FILE = str2str(val);
+}
 
-  NCCL_MIN_CTAS = env2num<int64_t>("NCCL_MIN_CTAS", "-1");
-  NCCL_MIN_CTAS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_DEBUG_FILE_reset() {
+  NCCL_DEBUG_FILE = NCCL_DEBUG_FILE_DEFAULT;
+}
 
-  NCCL_MIN_NCHANNELS = env2num<int64_t>("NCCL_MIN_NCHANNELS", "-2");
-  NCCL_MIN_NCHANNELS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_DEBUG_SUBSYS_parse(const char* val) {
+  NCCL_DEBUG_SUBSYS = str2str(val);
+}
 
-  NCCL_MIN_NRINGS = env2num<int64_t>("NCCL_MIN_NRINGS", "-2");
-  NCCL_MIN_NRINGS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_DEBUG_SUBSYS_reset() {
+  NCCL_DEBUG_SUBSYS = NCCL_DEBUG_SUBSYS_DEFAULT;
+}
 
-  NCCL_MIN_P2P_NCHANNELS = env2num<int64_t>("NCCL_MIN_P2P_NCHANNELS", "1");
-  NCCL_MIN_P2P_NCHANNELS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_DMABUF_ENABLE_parse(const char* val) {
+  NCCL_DMABUF_ENABLE = str2num<int64_t>(val);
+}
 
-  NCCL_NCHANNELS_PER_NET_PEER = env2num<int64_t>("NCCL_NCHANNELS_PER_NET_PEER", "2");
-  NCCL_NCHANNELS_PER_NET_PEER_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "2");
+static void NCCL_DMABUF_ENABLE_reset() {
+  NCCL_DMABUF_ENABLE = NCCL_DMABUF_ENABLE_DEFAULT;
+}
 
-  NCCL_NETWORK = env2str("NCCL_NET", "");
-  NCCL_NETWORK_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_GDRCOPY_ENABLE_parse(const char* val) {
+  NCCL_GDRCOPY_ENABLE = str2num<int64_t>(val);
+}
 
-  NCCL_NET_DISABLE_INTRA = env2num<int64_t>("NCCL_NET_DISABLE_INTRA", "0");
-  NCCL_NET_DISABLE_INTRA_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_GDRCOPY_ENABLE_reset() {
+  NCCL_GDRCOPY_ENABLE = NCCL_GDRCOPY_ENABLE_DEFAULT;
+}
 
-  NCCL_NET_FORCE_FLUSH = env2num<int64_t>("NCCL_NET_FORCE_FLUSH", "1");
-  NCCL_NET_FORCE_FLUSH_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_GDRCOPY_FIFO_ENABLE_parse(const char* val) {
+  NCCL_GDRCOPY_FIFO_ENABLE = str2num<int64_t>(val);
+}
 
-  NCCL_NET_GDR_LEVEL = env2str("NCCL_NET_GDR_LEVEL", "");
-  NCCL_NET_GDR_LEVEL_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_GDRCOPY_FIFO_ENABLE_reset() {
+  NCCL_GDRCOPY_FIFO_ENABLE = NCCL_GDRCOPY_FIFO_ENABLE_DEFAULT;
+}
 
-  NCCL_NET_GDR_READ = env2num<int64_t>("NCCL_NET_GDR_READ", "-2");
-  NCCL_NET_GDR_READ_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_GDRCOPY_FLUSH_ENABLE_parse(const char* val) {
+  NCCL_GDRCOPY_FLUSH_ENABLE = str2num<int64_t>(val);
+}
 
-  NCCL_NET_OVERHEAD = env2num<int64_t>("NCCL_NET_OVERHEAD", "-2");
-  NCCL_NET_OVERHEAD_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_GDRCOPY_FLUSH_ENABLE_reset() {
+  NCCL_GDRCOPY_FLUSH_ENABLE = NCCL_GDRCOPY_FLUSH_ENABLE_DEFAULT;
+}
 
-  NCCL_NET_PLUGIN = env2str("NCCL_NET_PLUGIN", "libnccl-net.so");
-  NCCL_NET_PLUGIN_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "libnccl-net.so");
+static void NCCL_GDRCOPY_SYNC_ENABLE_parse(const char* val) {
+  NCCL_GDRCOPY_SYNC_ENABLE = str2num<int64_t>(val);
+}
 
-  NCCL_NET_SHARED_BUFFERS = env2num<int64_t>("NCCL_NET_SHARED_BUFFERS", "-2");
-  NCCL_NET_SHARED_BUFFERS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_GDRCOPY_SYNC_ENABLE_reset() {
+  NCCL_GDRCOPY_SYNC_ENABLE = NCCL_GDRCOPY_SYNC_ENABLE_DEFAULT;
+}
 
-  NCCL_NET_SHARED_COMMS = env2num<int64_t>("NCCL_NET_SHARED_COMMS", "1");
-  NCCL_NET_SHARED_COMMS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_GDR_FLUSH_DISABLE_parse(const char* val) {
+  NCCL_GDR_FLUSH_DISABLE = str2num<int64_t>(val);
+}
 
-  NCCL_NSOCKS_PERTHREAD = env2num<int64_t>("NCCL_NSOCKS_PERTHREAD", "-2");
-  NCCL_NSOCKS_PERTHREAD_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_GDR_FLUSH_DISABLE_reset() {
+  NCCL_GDR_FLUSH_DISABLE = NCCL_GDR_FLUSH_DISABLE_DEFAULT;
+}
 
-  NCCL_NTHREADS = env2num<int64_t>("NCCL_NTHREADS", "-2");
-  NCCL_NTHREADS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_GRAPH_DUMP_FILE_parse(const char* val) {
+  NCCL_GRAPH_DUMP_FILE = str2str(val);
+}
 
-  NCCL_NVB_DISABLE = env2num<int64_t>("NCCL_NVB_DISABLE", "0");
-  NCCL_NVB_DISABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_GRAPH_DUMP_FILE_reset() {
+  NCCL_GRAPH_DUMP_FILE = NCCL_GRAPH_DUMP_FILE_DEFAULT;
+}
 
-  NCCL_NVB_PRECONNECT = env2num<int64_t>("NCCL_NVB_PRECONNECT", "1");
-  NCCL_NVB_PRECONNECT_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_GRAPH_DUMP_FILE_RANK_parse(const char* val) {
+  NCCL_GRAPH_DUMP_FILE_RANK = str2num<int64_t>(val);
+}
 
-  NCCL_NVLS_ENABLE = env2num<int64_t>("NCCL_NVLS_ENABLE", "2");
-  NCCL_NVLS_ENABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "2");
+static void NCCL_GRAPH_DUMP_FILE_RANK_reset() {
+  NCCL_GRAPH_DUMP_FILE_RANK = NCCL_GRAPH_DUMP_FILE_RANK_DEFAULT;
+}
 
-  NCCL_NVLS_NCHANNELS = env2num<int64_t>("NCCL_NVLS_NCHANNELS", "16");
-  NCCL_NVLS_NCHANNELS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "16");
+static void NCCL_GRAPH_FILE_parse(const char* val) {
+  NCCL_GRAPH_FILE = str2str(val);
+}
 
-  NCCL_P2P_DIRECT_DISABLE = env2num<int64_t>("NCCL_P2P_DIRECT_DISABLE", "0");
-  NCCL_P2P_DIRECT_DISABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_GRAPH_FILE_reset() {
+  NCCL_GRAPH_FILE = NCCL_GRAPH_FILE_DEFAULT;
+}
 
-  NCCL_P2P_DISABLE = env2str("NCCL_P2P_DISABLE", "");
-  NCCL_P2P_DISABLE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_GRAPH_MIXING_SUPPORT_parse(const char* val) {
+  NCCL_GRAPH_MIXING_SUPPORT = str2num<int64_t>(val);
+}
 
-  NCCL_P2P_LEVEL = env2str("NCCL_P2P_LEVEL", "");
-  NCCL_P2P_LEVEL_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_GRAPH_MIXING_SUPPORT_reset() {
+  NCCL_GRAPH_MIXING_SUPPORT = NCCL_GRAPH_MIXING_SUPPORT_DEFAULT;
+}
 
-  NCCL_P2P_LL_THRESHOLD = env2num<int64_t>("NCCL_P2P_LL_THRESHOLD", "16384");
-  NCCL_P2P_LL_THRESHOLD_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "16384");
+static void NCCL_GRAPH_REGISTER_parse(const char* val) {
+  NCCL_GRAPH_REGISTER = str2num<int64_t>(val);
+}
 
-  NCCL_P2P_NET_CHUNKSIZE = env2num<int64_t>("NCCL_P2P_NET_CHUNKSIZE", "131072");
-  NCCL_P2P_NET_CHUNKSIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "131072");
+static void NCCL_GRAPH_REGISTER_reset() {
+  NCCL_GRAPH_REGISTER = NCCL_GRAPH_REGISTER_DEFAULT;
+}
 
-  NCCL_P2P_NVL_CHUNKSIZE = env2num<int64_t>("NCCL_P2P_NVL_CHUNKSIZE", "524288");
-  NCCL_P2P_NVL_CHUNKSIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "524288");
+static void NCCL_HOSTID_parse(const char* val) {
+  NCCL_HOSTID = str2str(val);
+}
 
-  NCCL_P2P_PCI_CHUNKSIZE = env2num<int64_t>("NCCL_P2P_PCI_CHUNKSIZE", "131072");
-  NCCL_P2P_PCI_CHUNKSIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "131072");
+static void NCCL_HOSTID_reset() {
+  NCCL_HOSTID = NCCL_HOSTID_DEFAULT;
+}
 
-  NCCL_P2P_PXN_LEVEL = env2num<int64_t>("NCCL_P2P_PXN_LEVEL", "2");
-  NCCL_P2P_PXN_LEVEL_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "2");
+static void NCCL_IB_ADAPTIVE_ROUTING_parse(const char* val) {
+  NCCL_IB_ADAPTIVE_ROUTING = str2num<int64_t>(val);
+}
 
-  NCCL_P2P_READ_ENABLE = env2num<int64_t>("NCCL_P2P_READ_ENABLE", "-2");
-  NCCL_P2P_READ_ENABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_IB_ADAPTIVE_ROUTING_reset() {
+  NCCL_IB_ADAPTIVE_ROUTING = NCCL_IB_ADAPTIVE_ROUTING_DEFAULT;
+}
 
-  NCCL_P2P_USE_CUDA_MEMCPY = env2num<int64_t>("NCCL_P2P_USE_CUDA_MEMCPY", "0");
-  NCCL_P2P_USE_CUDA_MEMCPY_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_IB_ADDR_FAMILY_parse(const char* val) {
+  NCCL_IB_ADDR_FAMILY = str2str(val);
+}
 
-  NCCL_PROGRESS_APPENDOP_FREQ = env2num<int64_t>("NCCL_PROGRESS_APPENDOP_FREQ", "8");
-  NCCL_PROGRESS_APPENDOP_FREQ_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "8");
+static void NCCL_IB_ADDR_FAMILY_reset() {
+  NCCL_IB_ADDR_FAMILY = NCCL_IB_ADDR_FAMILY_DEFAULT;
+}
 
-  NCCL_PROTO = env2str("NCCL_PROTO", "");
-  NCCL_PROTO_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_IB_ADDR_RANGE_parse(const char* val) {
+  NCCL_IB_ADDR_RANGE = str2str(val);
+}
 
-  NCCL_PROXY_APPEND_BATCH_SIZE = env2num<int64_t>("NCCL_PROXY_APPEND_BATCH_SIZE", "16");
-  NCCL_PROXY_APPEND_BATCH_SIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "16");
+static void NCCL_IB_ADDR_RANGE_reset() {
+  NCCL_IB_ADDR_RANGE = NCCL_IB_ADDR_RANGE_DEFAULT;
+}
 
-  NCCL_PROXY_DUMP_SIGNAL = env2num<int64_t>("NCCL_PROXY_DUMP_SIGNAL", "-1");
-  NCCL_PROXY_DUMP_SIGNAL_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-1");
+static void NCCL_IB_AR_THRESHOLD_parse(const char* val) {
+  NCCL_IB_AR_THRESHOLD = str2num<int64_t>(val);
+}
 
-  NCCL_PROXY_PROFILE = env2str("NCCL_PROXY_PROFILE", "");
-  NCCL_PROXY_PROFILE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_IB_AR_THRESHOLD_reset() {
+  NCCL_IB_AR_THRESHOLD = NCCL_IB_AR_THRESHOLD_DEFAULT;
+}
 
-  NCCL_PROXY_PROFILE_DIR = env2str("NCCL_PROXY_PROFILE_DIR", "/tmp");
-  NCCL_PROXY_PROFILE_DIR_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "/tmp");
+static void NCCL_IB_DISABLE_parse(const char* val) {
+  NCCL_IB_DISABLE = str2num<int64_t>(val);
+}
 
-  NCCL_PXN_DISABLE = env2num<int64_t>("NCCL_PXN_DISABLE", "0");
-  NCCL_PXN_DISABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_IB_DISABLE_reset() {
+  NCCL_IB_DISABLE = NCCL_IB_DISABLE_DEFAULT;
+}
 
-  if (getenv("NCCL_SENDRECV_ALGO") == nullptr) {
-    NCCL_SENDRECV_ALGO = NCCL_SENDRECV_ALGO::orig;
-  } else {
-    std::string str(getenv("NCCL_SENDRECV_ALGO"));
-    if (str == std::string("orig")) {
-      NCCL_SENDRECV_ALGO = NCCL_SENDRECV_ALGO::orig;
-    } else if (str == std::string("ctran")) {
-      NCCL_SENDRECV_ALGO = NCCL_SENDRECV_ALGO::ctran;
-    } else {
-      CVAR_WARN_UNKNOWN_VALUE("NCCL_SENDRECV_ALGO", str.c_str());
-    }
-  }
-  NCCL_SENDRECV_ALGO_DEFAULT = NCCL_SENDRECV_ALGO::orig;
+static void NCCL_IB_GID_INDEX_parse(const char* val) {
+  NCCL_IB_GID_INDEX = str2num<int>(val);
+}
 
-  NCCL_SET_STACK_SIZE = env2num<int64_t>("NCCL_SET_STACK_SIZE", "0");
-  NCCL_SET_STACK_SIZE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_IB_GID_INDEX_reset() {
+  NCCL_IB_GID_INDEX = NCCL_IB_GID_INDEX_DEFAULT;
+}
 
-  NCCL_SET_THREAD_NAME = env2num<int64_t>("NCCL_SET_THREAD_NAME", "0");
-  NCCL_SET_THREAD_NAME_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static const char* const NCCL_IB_HCA_allPrefixes[] = {"^", "="};
+static void NCCL_IB_HCA_parse(const char* val) {
+  std::tie(NCCL_IB_HCA_PREFIX, NCCL_IB_HCA) = str2prefixedStrlist(val, NCCL_IB_HCA_allPrefixes);
+}
 
-  NCCL_SHM_DISABLE = env2num<int64_t>("NCCL_SHM_DISABLE", "0");
-  NCCL_SHM_DISABLE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_IB_HCA_reset() {
+  NCCL_IB_HCA_PREFIX = NCCL_IB_HCA_PREFIX_DEFAULT;
+  NCCL_IB_HCA = NCCL_IB_HCA_DEFAULT;
+}
 
-  NCCL_SHM_LOCALITY = env2num<int64_t>("NCCL_SHM_LOCALITY", "2");
-  NCCL_SHM_LOCALITY_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "2");
+static void NCCL_IB_MERGE_VFS_parse(const char* val) {
+  NCCL_IB_MERGE_VFS = str2num<int64_t>(val);
+}
 
-  NCCL_SHM_MEMCPY_MODE = env2num<int64_t>("NCCL_SHM_MEMCPY_MODE", "1");
-  NCCL_SHM_MEMCPY_MODE_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "1");
+static void NCCL_IB_MERGE_VFS_reset() {
+  NCCL_IB_MERGE_VFS = NCCL_IB_MERGE_VFS_DEFAULT;
+}
 
-  NCCL_SHM_USE_CUDA_MEMCPY = env2num<int64_t>("NCCL_SHM_USE_CUDA_MEMCPY", "0");
-  NCCL_SHM_USE_CUDA_MEMCPY_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_IB_PCI_RELAXED_ORDERING_parse(const char* val) {
+  NCCL_IB_PCI_RELAXED_ORDERING = str2num<int64_t>(val);
+}
 
-  NCCL_SOCKET_FAMILY = env2str("NCCL_SOCKET_FAMILY", "");
-  NCCL_SOCKET_FAMILY_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_IB_PCI_RELAXED_ORDERING_reset() {
+  NCCL_IB_PCI_RELAXED_ORDERING = NCCL_IB_PCI_RELAXED_ORDERING_DEFAULT;
+}
 
-  NCCL_SOCKET_IFNAME = env2str("NCCL_SOCKET_IFNAME", "");
-  NCCL_SOCKET_IFNAME_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_IB_PKEY_parse(const char* val) {
+  NCCL_IB_PKEY = str2num<int64_t>(val);
+}
 
-  NCCL_SOCKET_NTHREADS = env2num<int64_t>("NCCL_SOCKET_NTHREADS", "-2");
-  NCCL_SOCKET_NTHREADS_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "-2");
+static void NCCL_IB_PKEY_reset() {
+  NCCL_IB_PKEY = NCCL_IB_PKEY_DEFAULT;
+}
 
-  NCCL_THREAD_THRESHOLDS = env2str("NCCL_THREAD_THRESHOLDS", "");
-  NCCL_THREAD_THRESHOLDS_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_IB_QPS_PER_CONNECTION_parse(const char* val) {
+  NCCL_IB_QPS_PER_CONNECTION = str2num<int64_t>(val);
+}
 
-  NCCL_TOPO_DUMP_FILE = env2str("NCCL_TOPO_DUMP_FILE", "");
-  NCCL_TOPO_DUMP_FILE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_IB_QPS_PER_CONNECTION_reset() {
+  NCCL_IB_QPS_PER_CONNECTION = NCCL_IB_QPS_PER_CONNECTION_DEFAULT;
+}
 
-  NCCL_TOPO_DUMP_FILE_RANK = env2num<int64_t>("NCCL_TOPO_DUMP_FILE_RANK", "0");
-  NCCL_TOPO_DUMP_FILE_RANK_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "0");
+static void NCCL_IB_RETRY_CNT_parse(const char* val) {
+  NCCL_IB_RETRY_CNT = str2num<int64_t>(val);
+}
 
-  NCCL_TOPO_FILE = env2str("NCCL_TOPO_FILE", "/var/run/nvidia-topologyd/virtualTopology.xml");
-  NCCL_TOPO_FILE_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "/var/run/nvidia-topologyd/virtualTopology.xml");
+static void NCCL_IB_RETRY_CNT_reset() {
+  NCCL_IB_RETRY_CNT = NCCL_IB_RETRY_CNT_DEFAULT;
+}
 
-  NCCL_TUNER_PLUGIN = env2str("NCCL_TUNER_PLUGIN", "");
-  NCCL_TUNER_PLUGIN_DEFAULT = env2str("NCCL_ENV_DO_NOT_SET", "");
+static void NCCL_IB_ROCE_VERSION_NUM_parse(const char* val) {
+  NCCL_IB_ROCE_VERSION_NUM = str2num<int>(val);
+}
 
-  NCCL_WORK_FIFO_DEPTH = env2num<int64_t>("NCCL_WORK_FIFO_DEPTH", "65536");
-  NCCL_WORK_FIFO_DEPTH_DEFAULT = env2num<int64_t>("NCCL_ENV_DO_NOT_SET", "65536");
+static void NCCL_IB_ROCE_VERSION_NUM_reset() {
+  NCCL_IB_ROCE_VERSION_NUM = NCCL_IB_ROCE_VERSION_NUM_DEFAULT;
+}
 
+static void NCCL_IB_SL_parse(const char* val) {
+  NCCL_IB_SL = str2num<int64_t>(val);
 }
 
-// Automatically generated by ./maint/extractcvars.py --- END
+static void NCCL_IB_SL_reset() {
+  NCCL_IB_SL = NCCL_IB_SL_DEFAULT;
+}
 
+static void NCCL_IB_SPLIT_DATA_ON_QPS_parse(const char* val) {
+  NCCL_IB_SPLIT_DATA_ON_QPS = str2num<int64_t>(val);
+}
+
+static void NCCL_IB_SPLIT_DATA_ON_QPS_reset() {
+  NCCL_IB_SPLIT_DATA_ON_QPS = NCCL_IB_SPLIT_DATA_ON_QPS_DEFAULT;
+}
+
+static void NCCL_IB_TC_parse(const char* val) {
+  NCCL_IB_TC = str2num<int64_t>(val);
+}
+
+static void NCCL_IB_TC_reset() {
+  NCCL_IB_TC = NCCL_IB_TC_DEFAULT;
+}
+
+static void NCCL_IB_TIMEOUT_parse(const char* val) {
+  NCCL_IB_TIMEOUT = str2num<int64_t>(val);
+}
+
+static void NCCL_IB_TIMEOUT_reset() {
+  NCCL_IB_TIMEOUT = NCCL_IB_TIMEOUT_DEFAULT;
+}
+
+static void NCCL_IB_USE_INLINE_parse(const char* val) {
+  NCCL_IB_USE_INLINE = str2num<int64_t>(val);
+}
+
+static void NCCL_IB_USE_INLINE_reset() {
+  NCCL_IB_USE_INLINE = NCCL_IB_USE_INLINE_DEFAULT;
+}
+
+static void NCCL_IGNORE_CPU_AFFINITY_parse(const char* val) {
+  NCCL_IGNORE_CPU_AFFINITY = str2num<int64_t>(val);
+}
+
+static void NCCL_IGNORE_CPU_AFFINITY_reset() {
+  NCCL_IGNORE_CPU_AFFINITY = NCCL_IGNORE_CPU_AFFINITY_DEFAULT;
+}
+
+static void NCCL_IGNORE_DISABLED_P2P_parse(const char* val) {
+  NCCL_IGNORE_DISABLED_P2P = str2num<int64_t>(val);
+}
+
+static void NCCL_IGNORE_DISABLED_P2P_reset() {
+  NCCL_IGNORE_DISABLED_P2P = NCCL_IGNORE_DISABLED_P2P_DEFAULT;
+}
+
+static void NCCL_L1_SHARED_MEMORY_CARVEOUT_parse(const char* val) {
+  NCCL_L1_SHARED_MEMORY_CARVEOUT = str2num<int64_t>(val);
+}
+
+static void NCCL_L1_SHARED_MEMORY_CARVEOUT_reset() {
+  NCCL_L1_SHARED_MEMORY_CARVEOUT = NCCL_L1_SHARED_MEMORY_CARVEOUT_DEFAULT;
+}
+
+static void NCCL_LAUNCH_MODE_parse(const char* val) {
+  NCCL_LAUNCH_MODE = str2str(val);
+}
+
+static void NCCL_LAUNCH_MODE_reset() {
+  NCCL_LAUNCH_MODE = NCCL_LAUNCH_MODE_DEFAULT;
+}
+
+static void NCCL_LL128_BUFFSIZE_parse(const char* val) {
+  NCCL_LL128_BUFFSIZE = str2num<int64_t>(val);
+}
+
+static void NCCL_LL128_BUFFSIZE_reset() {
+  NCCL_LL128_BUFFSIZE = NCCL_LL128_BUFFSIZE_DEFAULT;
+}
+
+static void NCCL_LL128_NTHREADS_parse(const char* val) {
+  NCCL_LL128_NTHREADS = str2num<int64_t>(val);
+}
+
+static void NCCL_LL128_NTHREADS_reset() {
+  NCCL_LL128_NTHREADS = NCCL_LL128_NTHREADS_DEFAULT;
+}
+
+static void NCCL_LL_BUFFSIZE_parse(const char* val) {
+  NCCL_LL_BUFFSIZE = str2num<int64_t>(val);
+}
+
+static void NCCL_LL_BUFFSIZE_reset() {
+  NCCL_LL_BUFFSIZE = NCCL_LL_BUFFSIZE_DEFAULT;
+}
+
+static void NCCL_LOCAL_REGISTER_parse(const char* val) {
+  NCCL_LOCAL_REGISTER = str2num<int64_t>(val);
+}
+
+static void NCCL_LOCAL_REGISTER_reset() {
+  NCCL_LOCAL_REGISTER = NCCL_LOCAL_REGISTER_DEFAULT;
+}
+
+static const CvarEnumChoice<enum NCCL_LOGGER_MODE> NCCL_LOGGER_MODE_choices[] = {
+  {"async", NCCL_LOGGER_MODE::async},
+  {"sync", NCCL_LOGGER_MODE::sync},
+};
+static void NCCL_LOGGER_MODE_parse(const char* val) {
+  if (!str2enum(val, NCCL_LOGGER_MODE_choices, NCCL_LOGGER_MODE)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_LOGGER_MODE", val);
+  }
+}
+
+static void NCCL_LOGGER_MODE_reset() {
+  NCCL_LOGGER_MODE = NCCL_LOGGER_MODE_DEFAULT;
+}
+
+static void NCCL_MAX_CTAS_parse(const char* val) {
+  NCCL_MAX_CTAS = str2num<int64_t>(val);
+}
+
+static void NCCL_MAX_CTAS_reset() {
+  NCCL_MAX_CTAS = NCCL_MAX_CTAS_DEFAULT;
+}
+
+static void NCCL_MAX_NCHANNELS_parse(const char* val) {
+  NCCL_MAX_NCHANNELS = str2num<int64_t>(val);
+}
+
+static void NCCL_MAX_NCHANNELS_reset() {
+  NCCL_MAX_NCHANNELS = NCCL_MAX_NCHANNELS_DEFAULT;
+}
+
+static void NCCL_MAX_NRINGS_parse(const char* val) {
+  NCCL_MAX_NRINGS = str2num<int64_t>(val);
+}
+
+static void NCCL_MAX_NRINGS_reset() {
+  NCCL_MAX_NRINGS = NCCL_MAX_NRINGS_DEFAULT;
+}
+
+static void NCCL_MAX_P2P_NCHANNELS_parse(const char* val) {
+  NCCL_MAX_P2P_NCHANNELS = str2num<int64_t>(val);
+}
+
+static void NCCL_MAX_P2P_NCHANNELS_reset() {
+  NCCL_MAX_P2P_NCHANNELS = NCCL_MAX_P2P_NCHANNELS_DEFAULT;
+}
+
+static const CvarEnumChoice<enum NCCL_MEM_SYNC_DOMAIN> NCCL_MEM_SYNC_DOMAIN_choices[] = {
+  {"local", NCCL_MEM_SYNC_DOMAIN::local},
+  {"remote", NCCL_MEM_SYNC_DOMAIN::remote},
+};
+static void NCCL_MEM_SYNC_DOMAIN_parse(const char* val) {
+  if (!str2enum(val, NCCL_MEM_SYNC_DOMAIN_choices, NCCL_MEM_SYNC_DOMAIN)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_MEM_SYNC_DOMAIN", val);
+  }
+}
+
+static void NCCL_MEM_SYNC_DOMAIN_reset() {
+  NCCL_MEM_SYNC_DOMAIN = NCCL_MEM_SYNC_DOMAIN_DEFAULT;
+}
+
+static void NCCL_MIN_CTAS_parse(const char* val) {
+  NCCL_MIN_CTAS = str2num<int64_t>(val);
+}
+
+static void NCCL_MIN_CTAS_reset() {
+  NCCL_MIN_CTAS = NCCL_MIN_CTAS_DEFAULT;
+}
+
+static void NCCL_MIN_NCHANNELS_parse(const char* val) {
+  NCCL_MIN_NCHANNELS = str2num<int64_t>(val);
+}
+
+static void NCCL_MIN_NCHANNELS_reset() {
+  NCCL_MIN_NCHANNELS = NCCL_MIN_NCHANNELS_DEFAULT;
+}
+
+static void NCCL_MIN_NRINGS_parse(const char* val) {
+  NCCL_MIN_NRINGS = str2num<int64_t>(val);
+}
+
+static void NCCL_MIN_NRINGS_reset() {
+  NCCL_MIN_NRINGS = NCCL_MIN_NRINGS_DEFAULT;
+}
+
+static void NCCL_MIN_P2P_NCHANNELS_parse(const char* val) {
+  NCCL_MIN_P2P_NCHANNELS = str2num<int64_t>(val);
+}
+
+static void NCCL_MIN_P2P_NCHANNELS_reset() {
+  NCCL_MIN_P2P_NCHANNELS = NCCL_MIN_P2P_NCHANNELS_DEFAULT;
+}
+
+static void NCCL_NCHANNELS_PER_NET_PEER_parse(const char* val) {
+  NCCL_NCHANNELS_PER_NET_PEER = str2num<int64_t>(val);
+}
+
+static void NCCL_NCHANNELS_PER_NET_PEER_reset() {
+  NCCL_NCHANNELS_PER_NET_PEER = NCCL_NCHANNELS_PER_NET_PEER_DEFAULT;
+}
+
+static void NCCL_NETWORK_parse(const char* val) {
+  NCCL_NETWORK = str2str(val);
+}
+
+static void NCCL_NETWORK_reset() {
+  NCCL_NETWORK = NCCL_NETWORK_DEFAULT;
+}
+
+static void NCCL_NET_DISABLE_INTRA_parse(const char* val) {
+  NCCL_NET_DISABLE_INTRA = str2num<int64_t>(val);
+}
+
+static void NCCL_NET_DISABLE_INTRA_reset() {
+  NCCL_NET_DISABLE_INTRA = NCCL_NET_DISABLE_INTRA_DEFAULT;
+}
+
+static void NCCL_NET_FORCE_FLUSH_parse(const char* val) {
+  NCCL_NET_FORCE_FLUSH = str2num<int64_t>(val);
+}
+
+static void NCCL_NET_FORCE_FLUSH_reset() {
+  NCCL_NET_FORCE_FLUSH = NCCL_NET_FORCE_FLUSH_DEFAULT;
+}
+
+static void NCCL_NET_GDR_LEVEL_parse(const char* val) {
+  NCCL_NET_GDR_LEVEL = str2str(val);
+}
+
+static void NCCL_NET_GDR_LEVEL_reset() {
+  NCCL_NET_GDR_LEVEL = NCCL_NET_GDR_LEVEL_DEFAULT;
+}
+
+static void NCCL_NET_GDR_READ_parse(const char* val) {
+  NCCL_NET_GDR_READ = str2num<int64_t>(val);
+}
+
+static void NCCL_NET_GDR_READ_reset() {
+  NCCL_NET_GDR_READ = NCCL_NET_GDR_READ_DEFAULT;
+}
+
+static void NCCL_NET_OVERHEAD_parse(const char* val) {
+  NCCL_NET_OVERHEAD = str2num<int64_t>(val);
+}
+
+static void NCCL_NET_OVERHEAD_reset() {
+  NCCL_NET_OVERHEAD = NCCL_NET_OVERHEAD_DEFAULT;
+}
+
+static void NCCL_NET_PLUGIN_parse(const char* val) {
+  NCCL_NET_PLUGIN = str2str(val);
+}
+
+static void NCCL_NET_PLUGIN_reset() {
+  NCCL_NET_PLUGIN = NCCL_NET_PLUGIN_DEFAULT;
+}
+
+static void NCCL_NET_SHARED_BUFFERS_parse(const char* val) {
+  NCCL_NET_SHARED_BUFFERS = str2num<int64_t>(val);
+}
+
+static void NCCL_NET_SHARED_BUFFERS_reset() {
+  NCCL_NET_SHARED_BUFFERS = NCCL_NET_SHARED_BUFFERS_DEFAULT;
+}
+
+static void NCCL_NET_SHARED_COMMS_parse(const char* val) {
+  NCCL_NET_SHARED_COMMS = str2num<int64_t>(val);
+}
+
+static void NCCL_NET_SHARED_COMMS_reset() {
+  NCCL_NET_SHARED_COMMS = NCCL_NET_SHARED_COMMS_DEFAULT;
+}
+
+static void NCCL_NSOCKS_PERTHREAD_parse(const char* val) {
+  NCCL_NSOCKS_PERTHREAD = str2num<int64_t>(val);
+}
+
+static void NCCL_NSOCKS_PERTHREAD_reset() {
+  NCCL_NSOCKS_PERTHREAD = NCCL_NSOCKS_PERTHREAD_DEFAULT;
+}
+
+static void NCCL_NTHREADS_parse(const char* val) {
+  NCCL_NTHREADS = str2num<int64_t>(val);
+}
+
+static void NCCL_NTHREADS_reset() {
+  NCCL_NTHREADS = NCCL_NTHREADS_DEFAULT;
+}
+
+static void NCCL_NVB_DISABLE_parse(const char* val) {
+  NCCL_NVB_DISABLE = str2num<int64_t>(val);
+}
+
+static void NCCL_NVB_DISABLE_reset() {
+  NCCL_NVB_DISABLE = NCCL_NVB_DISABLE_DEFAULT;
+}
+
+static void NCCL_NVB_PRECONNECT_parse(const char* val) {
+  NCCL_NVB_PRECONNECT = str2num<int64_t>(val);
+}
+
+static void NCCL_NVB_PRECONNECT_reset() {
+  NCCL_NVB_PRECONNECT = NCCL_NVB_PRECONNECT_DEFAULT;
+}
+
+static void NCCL_NVLS_ENABLE_parse(const char* val) {
+  NCCL_NVLS_ENABLE = str2num<int64_t>(val);
+}
+
+static void NCCL_NVLS_ENABLE_reset() {
+  NCCL_NVLS_ENABLE = NCCL_NVLS_ENABLE_DEFAULT;
+}
+
+static void NCCL_NVLS_NCHANNELS_parse(const char* val) {
+  NCCL_NVLS_NCHANNELS = str2num<int64_t>(val);
+}
+
+static void NCCL_NVLS_NCHANNELS_reset() {
+  NCCL_NVLS_NCHANNELS = NCCL_NVLS_NCHANNELS_DEFAULT;
+}
+
+static void NCCL_P2P_DIRECT_DISABLE_parse(const char* val) {
+  NCCL_P2P_DIRECT_DISABLE = str2num<int64_t>(val);
+}
+
+static void NCCL_P2P_DIRECT_DISABLE_reset() {
+  NCCL_P2P_DIRECT_DISABLE = NCCL_P2P_DIRECT_DISABLE_DEFAULT;
+}
+
+static void NCCL_P2P_DISABLE_parse(const char* val) {
+  NCCL_P2P_DISABLE = str2str(val);
+}
+
+static void NCCL_P2P_DISABLE_reset() {
+  NCCL_P2P_DISABLE = NCCL_P2P_DISABLE_DEFAULT;
+}
+
+static void NCCL_P2P_LEVEL_parse(const char* val) {
+  NCCL_P2P_LEVEL = str2str(val);
+}
+
+static void NCCL_P2P_LEVEL_reset() {
+  NCCL_P2P_LEVEL = NCCL_P2P_LEVEL_DEFAULT;
+}
+
+static void NCCL_P2P_LL_THRESHOLD_parse(const char* val) {
+  NCCL_P2P_LL_THRESHOLD = str2num<int64_t>(val);
+}
+
+static void NCCL_P2P_LL_THRESHOLD_reset() {
+  NCCL_P2P_LL_THRESHOLD = NCCL_P2P_LL_THRESHOLD_DEFAULT;
+}
+
+static void NCCL_P2P_NET_CHUNKSIZE_parse(const char* val) {
+  NCCL_P2P_NET_CHUNKSIZE = str2num<int64_t>(val);
+}
+
+static void NCCL_P2P_NET_CHUNKSIZE_reset() {
+  NCCL_P2P_NET_CHUNKSIZE = NCCL_P2P_NET_CHUNKSIZE_DEFAULT;
+}
+
+static void NCCL_P2P_NVL_CHUNKSIZE_parse(const char* val) {
+  NCCL_P2P_NVL_CHUNKSIZE = str2num<int64_t>(val);
+}
+
+static void NCCL_P2P_NVL_CHUNKSIZE_reset() {
+  NCCL_P2P_NVL_CHUNKSIZE = NCCL_P2P_NVL_CHUNKSIZE_DEFAULT;
+}
+
+static void NCCL_P2P_PCI_CHUNKSIZE_parse(const char* val) {
+  NCCL_P2P_PCI_CHUNKSIZE = str2num<int64_t>(val);
+}
+
+static void NCCL_P2P_PCI_CHUNKSIZE_reset() {
+  NCCL_P2P_PCI_CHUNKSIZE = NCCL_P2P_PCI_CHUNKSIZE_DEFAULT;
+}
+
+static void NCCL_P2P_PXN_LEVEL_parse(const char* val) {
+  NCCL_P2P_PXN_LEVEL = str2num<int64_t>(val);
+}
+
+static void NCCL_P2P_PXN_LEVEL_reset() {
+  NCCL_P2P_PXN_LEVEL = NCCL_P2P_PXN_LEVEL_DEFAULT;
+}
+
+static void NCCL_P2P_READ_ENABLE_parse(const char* val) {
+  NCCL_P2P_READ_ENABLE = str2num<int64_t>(val);
+}
+
+static void NCCL_P2P_READ_ENABLE_reset() {
+  NCCL_P2P_READ_ENABLE = NCCL_P2P_READ_ENABLE_DEFAULT;
+}
+
+static void NCCL_P2P_USE_CUDA_MEMCPY_parse(const char* val) {
+  NCCL_P2P_USE_CUDA_MEMCPY = str2num<int64_t>(val);
+}
+
+static void NCCL_P2P_USE_CUDA_MEMCPY_reset() {
+  NCCL_P2P_USE_CUDA_MEMCPY = NCCL_P2P_USE_CUDA_MEMCPY_DEFAULT;
+}
+
+static void NCCL_PROGRESS_APPENDOP_FREQ_parse(const char* val) {
+  NCCL_PROGRESS_APPENDOP_FREQ = str2num<int64_t>(val);
+}
+
+static void NCCL_PROGRESS_APPENDOP_FREQ_reset() {
+  NCCL_PROGRESS_APPENDOP_FREQ = NCCL_PROGRESS_APPENDOP_FREQ_DEFAULT;
+}
+
+static void NCCL_PROTO_parse(const char* val) {
+  NCCL_PROTO = str2str(val);
+}
+
+static void NCCL_PROTO_reset() {
+  NCCL_PROTO = NCCL_PROTO_DEFAULT;
+}
+
+static void NCCL_PROXY_APPEND_BATCH_SIZE_parse(const char* val) {
+  NCCL_PROXY_APPEND_BATCH_SIZE = str2num<int64_t>(val);
+}
+
+static void NCCL_PROXY_APPEND_BATCH_SIZE_reset() {
+  NCCL_PROXY_APPEND_BATCH_SIZE = NCCL_PROXY_APPEND_BATCH_SIZE_DEFAULT;
+}
+
+static void NCCL_PROXY_DUMP_SIGNAL_parse(const char* val) {
+  NCCL_PROXY_DUMP_SIGNAL = str2num<int64_t>(val);
+}
+
+static void NCCL_PROXY_DUMP_SIGNAL_reset() {
+  NCCL_PROXY_DUMP_SIGNAL = NCCL_PROXY_DUMP_SIGNAL_DEFAULT;
+}
+
+static void NCCL_PROXY_PROFILE_parse(const char* val) {
+  NCCL_PROXY_PROFILE = str2str(val);
+}
+
+static void NCCL_PROXY_PROFILE_reset() {
+  NCCL_PROXY_PROFILE = NCCL_PROXY_PROFILE_DEFAULT;
+}
+
+static void NCCL_PROXY_PROFILE_DIR_parse(const char* val) {
+  NCCL_PROXY_PROFILE_DIR = str2str(val);
+}
+
+static void NCCL_PROXY_PROFILE_DIR_reset() {
+  NCCL_PROXY_PROFILE_DIR = NCCL_PROXY_PROFILE_DIR_DEFAULT;
+}
+
+static void NCCL_PXN_DISABLE_parse(const char* val) {
+  NCCL_PXN_DISABLE = str2num<int64_t>(val);
+}
+
+static void NCCL_PXN_DISABLE_reset() {
+  NCCL_PXN_DISABLE = NCCL_PXN_DISABLE_DEFAULT;
+}
+
+static const CvarEnumChoice<enum NCCL_SENDRECV_ALGO> NCCL_SENDRECV_ALGO_choices[] = {
+  {"ctran", NCCL_SENDRECV_ALGO::ctran},
+  {"orig", NCCL_SENDRECV_ALGO::orig},
+};
+static void NCCL_SENDRECV_ALGO_parse(const char* val) {
+  if (!str2enum(val, NCCL_SENDRECV_ALGO_choices, NCCL_SENDRECV_ALGO)) {
+    CVAR_WARN_UNKNOWN_VALUE("NCCL_SENDRECV_ALGO", val);
+  }
+}
+
+static void NCCL_SENDRECV_ALGO_reset() {
+  NCCL_SENDRECV_ALGO = NCCL_SENDRECV_ALGO_DEFAULT;
+}
+
+static void NCCL_SET_STACK_SIZE_parse(const char* val) {
+  NCCL_SET_STACK_SIZE = str2num<int64_t>(val);
+}
+
+static void NCCL_SET_STACK_SIZE_reset() {
+  NCCL_SET_STACK_SIZE = NCCL_SET_STACK_SIZE_DEFAULT;
+}
+
+static void NCCL_SET_THREAD_NAME_parse(const char* val) {
+  NCCL_SET_THREAD_NAME = str2num<int64_t>(val);
+}
+
+static void NCCL_SET_THREAD_NAME_reset() {
+  NCCL_SET_THREAD_NAME = NCCL_SET_THREAD_NAME_DEFAULT;
+}
+
+static void NCCL_SHM_DISABLE_parse(const char* val) {
+  NCCL_SHM_DISABLE = str2num<int64_t>(val);
+}
+
+static void NCCL_SHM_DISABLE_reset() {
+  NCCL_SHM_DISABLE = NCCL_SHM_DISABLE_DEFAULT;
+}
+
+static void NCCL_SHM_LOCALITY_parse(const char* val) {
+  NCCL_SHM_LOCALITY = str2num<int64_t>(val);
+}
+
+static void NCCL_SHM_LOCALITY_reset() {
+  NCCL_SHM_LOCALITY = NCCL_SHM_LOCALITY_DEFAULT;
+}
+
+static void NCCL_SHM_MEMCPY_MODE_parse(const char* val) {
+  NCCL_SHM_MEMCPY_MODE = str2num<int64_t>(val);
+}
+
+static void NCCL_SHM_MEMCPY_MODE_reset() {
+  NCCL_SHM_MEMCPY_MODE = NCCL_SHM_MEMCPY_MODE_DEFAULT;
+}
+
+static void NCCL_SHM_USE_CUDA_MEMCPY_parse(const char* val) {
+  NCCL_SHM_USE_CUDA_MEMCPY = str2num<int64_t>(val);
+}
+
+static void NCCL_SHM_USE_CUDA_MEMCPY_reset() {
+  NCCL_SHM_USE_CUDA_MEMCPY = NCCL_SHM_USE_CUDA_MEMCPY_DEFAULT;
+}
+
+static void NCCL_SOCKET_FAMILY_parse(const char* val) {
+  NCCL_SOCKET_FAMILY = str2str(val);
+}
+
+static void NCCL_SOCKET_FAMILY_reset() {
+  NCCL_SOCKET_FAMILY = NCCL_SOCKET_FAMILY_DEFAULT;
+}
+
+static void NCCL_SOCKET_IFNAME_parse(const char* val) {
+  NCCL_SOCKET_IFNAME = str2str(val);
+}
+
+static void NCCL_SOCKET_IFNAME_reset() {
+  NCCL_SOCKET_IFNAME = NCCL_SOCKET_IFNAME_DEFAULT;
+}
+
+static void NCCL_SOCKET_NTHREADS_parse(const char* val) {
+  NCCL_SOCKET_NTHREADS = str2num<int64_t>(val);
+}
+
+static void NCCL_SOCKET_NTHREADS_reset() {
+  NCCL_SOCKET_NTHREADS = NCCL_SOCKET_NTHREADS_DEFAULT;
+}
+
+static void NCCL_THREAD_THRESHOLDS_parse(const char* val) {
+  NCCL_THREAD_THRESHOLDS = str2str(val);
+}
+
+static void NCCL_THREAD_THRESHOLDS_reset() {
+  NCCL_THREAD_THRESHOLDS = NCCL_THREAD_THRESHOLDS_DEFAULT;
+}
+
+static void NCCL_TOPO_DUMP_FILE_parse(const char* val) {
+  NCCL_TOPO_DUMP_FILE = str2str(val);
+}
+
+static void NCCL_TOPO_DUMP_FILE_reset() {
+  NCCL_TOPO_DUMP_FILE = NCCL_TOPO_DUMP_FILE_DEFAULT;
+}
+
+static void NCCL_TOPO_DUMP_FILE_RANK_parse(const char* val) {
+  NCCL_TOPO_DUMP_FILE_RANK = str2num<int64_t>(val);
+}
+
+static void NCCL_TOPO_DUMP_FILE_RANK_reset() {
+  NCCL_TOPO_DUMP_FILE_RANK = NCCL_TOPO_DUMP_FILE_RANK_DEFAULT;
+}
+
+static void NCCL_TOPO_FILE_parse(const char* val) {
+  NCCL_TOPO_FILE = str2str(val);
+}
+
+static void NCCL_TOPO_FILE_reset() {
+  NCCL_TOPO_FILE = NCCL_TOPO_FILE_DEFAULT;
+}
+
+static void NCCL_TUNER_PLUGIN_parse(const char* val) {
+  NCCL_TUNER_PLUGIN = str2str(val);
+}
+
+static void NCCL_TUNER_PLUGIN_reset() {
+  NCCL_TUNER_PLUGIN = NCCL_TUNER_PLUGIN_DEFAULT;
+}
+
+static void NCCL_WORK_FIFO_DEPTH_parse(const char* val) {
+  NCCL_WORK_FIFO_DEPTH = str2num<int64_t>(val);
+}
+
+static void NCCL_WORK_FIFO_DEPTH_reset() {
+  NCCL_WORK_FIFO_DEPTH = NCCL_WORK_FIFO_DEPTH_DEFAULT;
+}
+
+static const CvarEnvEntry cvarEnvTable[numCvarEnvs] = {
+  {"CUDA_LAUNCH_BLOCKING", 20, CUDA_LAUNCH_BLOCKING_parse, CUDA_LAUNCH_BLOCKING_reset},
+  {"NCCL_AGG_CHANNEL_SIZE", 21, NCCL_AGG_CHANNEL_SIZE_parse, NCCL_AGG_CHANNEL_SIZE_reset},
+  {"NCCL_ALGO", 9, NCCL_ALGO_parse, NCCL_ALGO_reset},
+  {"NCCL_ALLGATHER_ALGO", 19, NCCL_ALLGATHER_ALGO_parse, NCCL_ALLGATHER_ALGO_reset},
+  {"NCCL_ALLGATHER_DIRECT_CUTOFF", 28, NCCL_ALLGATHER_DIRECT_CUTOFF_parse, NCCL_ALLGATHER_DIRECT_CUTOFF_reset},
+  {"NCCL_ALLOC_P2P_NET_LL_BUFFERS", 29, NCCL_ALLOC_P2P_NET_LL_BUFFERS_parse, NCCL_ALLOC_P2P_NET_LL_BUFFERS_reset},
+  {"NCCL_ALLREDUCE_ALGO", 19, NCCL_ALLREDUCE_ALGO_parse, NCCL_ALLREDUCE_ALGO_reset},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", 45, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_parse, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_reset},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", 45, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_parse, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_reset},
+  {"NCCL_ALLTOALLV_ALGO", 19, NCCL_ALLTOALLV_ALGO_parse, NCCL_ALLTOALLV_ALGO_reset},
+  {"NCCL_ALLTOALL_ALGO", 18, NCCL_ALLTOALL_ALGO_parse, NCCL_ALLTOALL_ALGO_reset},
+  {"NCCL_BUFFSIZE", 13, NCCL_BUFFSIZE_parse, NCCL_BUFFSIZE_reset},
+  {"NCCL_CGA_CLUSTER_SIZE", 21, NCCL_CGA_CLUSTER_SIZE_parse, NCCL_CGA_CLUSTER_SIZE_reset},
+  {"NCCL_CHECK_POINTERS", 19, NCCL_CHECK_POINTERS_parse, NCCL_CHECK_POINTERS_reset},
+  {"NCCL_CHUNK_SIZE", 15, NCCL_CHUNK_SIZE_parse, NCCL_CHUNK_SIZE_reset},
+  {"NCCL_COLLNET_ENABLE", 19, NCCL_COLLNET_ENABLE_parse, NCCL_COLLNET_ENABLE_reset},
+  {"NCCL_COLLNET_NODE_THRESHOLD", 27, NCCL_COLLNET_NODE_THRESHOLD_parse, NCCL_COLLNET_NODE_THRESHOLD_reset},
+  {"NCCL_COLLTRACE_DIR", 18, NCCL_COLLTRACE_DIR_parse, NCCL_COLLTRACE_DIR_reset},
+  {"NCCL_COMM_BLOCKING", 18, NCCL_COMM_BLOCKING_parse, NCCL_COMM_BLOCKING_reset},
+  {"NCCL_COMM_ID", 12, NCCL_COMM_ID_parse, NCCL_COMM_ID_reset},
+  {"NCCL_COMM_SPLIT_SHARE_RESOURCES", 31, NCCL_COMM_SPLIT_SHARE_RESOURCES_parse, NCCL_COMM_SPLIT_SHARE_RESOURCES_reset},
+  {"NCCL_CONNECT_ROUND_SIZE", 23, NCCL_CONNECT_ROUND_SIZE_parse, NCCL_CONNECT_ROUND_SIZE_reset},
+  {"NCCL_CREATE_THREAD_CONTEXT", 26, NCCL_CREATE_THREAD_CONTEXT_parse, NCCL_CREATE_THREAD_CONTEXT_reset},
+  {"NCCL_CROSS_NIC", 14, NCCL_CROSS_NIC_parse, NCCL_CROSS_NIC_reset},
+  {"NCCL_CTRAN_AG_RD_RTR", 20, NCCL_CTRAN_AG_RD_RTR_parse, NCCL_CTRAN_AG_RD_RTR_reset},
+  {"NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", 38, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_parse, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_reset},
+  {"NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", 38, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_parse, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_reset},
+  {"NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", 37, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_parse, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_reset},
+  {"NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", 37, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_parse, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_reset},
+  {"NCCL_CTRAN_ALLTOALL_THRESHOLD", 29, NCCL_CTRAN_ALLTOALL_THRESHOLD_parse, NCCL_CTRAN_ALLTOALL_THRESHOLD_reset},
+  {"NCCL_CTRAN_BACKENDS", 19, NCCL_CTRAN_BACKENDS_parse, NCCL_CTRAN_BACKENDS_reset},
+  {"NCCL_CTRAN_IB_CTRL_TC", 21, NCCL_CTRAN_IB_CTRL_TC_parse, NCCL_CTRAN_IB_CTRL_TC_reset},
+  {"NCCL_CTRAN_IB_MAX_QPS", 21, NCCL_CTRAN_IB_MAX_QPS_parse, NCCL_CTRAN_IB_MAX_QPS_reset},
+  {"NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", 34, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_parse, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_reset},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG", 30, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_parse, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_reset},
+  {"NCCL_CTRAN_KINETO_PROFILE_DIR", 29, NCCL_CTRAN_KINETO_PROFILE_DIR_parse, NCCL_CTRAN_KINETO_PROFILE_DIR_reset},
+  {"NCCL_CTRAN_NUM_KERNEL_P2PELEMS", 30, NCCL_CTRAN_NUM_KERNEL_P2PELEMS_parse, NCCL_CTRAN_NUM_KERNEL_P2PELEMS_reset},
+  {"NCCL_CTRAN_PROFILING", 20, NCCL_CTRAN_PROFILING_parse, NCCL_CTRAN_PROFILING_reset},
+  {"NCCL_CTRAN_PROFILING_REPORT_COUNT", 33, NCCL_CTRAN_PROFILING_REPORT_COUNT_parse, NCCL_CTRAN_PROFILING_REPORT_COUNT_reset},
+  {"NCCL_CTRAN_REGISTER", 19, NCCL_CTRAN_REGISTER_parse, NCCL_CTRAN_REGISTER_reset},
+  {"NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", 41, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_parse, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_reset},
+  {"NCCL_CTRAN_RING_MAX_OUTSTANDING", 31, NCCL_CTRAN_RING_MAX_OUTSTANDING_parse, NCCL_CTRAN_RING_MAX_OUTSTANDING_reset},
+  {"NCCL_CTRAN_RING_STEP", 20, NCCL_CTRAN_RING_STEP_parse, NCCL_CTRAN_RING_STEP_reset},
+  {"NCCL_CTRAN_SHARED_DEVBUF_SIZE", 29, NCCL_CTRAN_SHARED_DEVBUF_SIZE_parse, NCCL_CTRAN_SHARED_DEVBUF_SIZE_reset},
+  {"NCCL_CTRAN_TOPO_FILE", 20, NCCL_CTRAN_TOPO_FILE_parse, NCCL_CTRAN_TOPO_FILE_reset},
+  {"NCCL_CTRAN_TOPO_FILE_KEYS", 25, NCCL_CTRAN_TOPO_FILE_KEYS_parse, NCCL_CTRAN_TOPO_FILE_KEYS_reset},
+  {"NCCL_CUDA_PATH", 14, NCCL_CUDA_PATH_parse, NCCL_CUDA_PATH_reset},
+  {"NCCL_CUMEM_ENABLE", 17, NCCL_CUMEM_ENABLE_parse, NCCL_CUMEM_ENABLE_reset},
+  {"NCCL_CVAR_SNAPSHOT_DIR", 22, NCCL_CVAR_SNAPSHOT_DIR_parse, NCCL_CVAR_SNAPSHOT_DIR_reset},
+  {"NCCL_DATA_EXPORT_DIR", 20, NCCL_DATA_EXPORT_DIR_parse, NCCL_DATA_EXPORT_DIR_reset},
+  {"NCCL_DDA_ALLREDUCE_MAX_BLOCKS", 29, NCCL_DDA_ALLREDUCE_MAX_BLOCKS_parse, NCCL_DDA_ALLREDUCE_MAX_BLOCKS_reset},
+  {"NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", 36, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_parse, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_reset},
+  {"NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", 33, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_parse, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_reset},
+  {"NCCL_DDA_TMPBUFF_SIZE", 21, NCCL_DDA_TMPBUFF_SIZE_parse, NCCL_DDA_TMPBUFF_SIZE_reset},
+  {"NCCL_DEBUG", 10, NCCL_DEBUG_parse, NCCL_DEBUG_reset},
+  {"NCCL_DEBUG_FILE", 15, NCCL_DEBUG_FILE_parse, NCCL_DEBUG_FILE_reset},
+  {"NCCL_DEBUG_SUBSYS", 17, NCCL_DEBUG_SUBSYS_parse, NCCL_DEBUG_SUBSYS_reset},
+  {"NCCL_DMABUF_ENABLE", 18, NCCL_DMABUF_ENABLE_parse, NCCL_DMABUF_ENABLE_reset},
+  {"NCCL_GDRCOPY_ENABLE", 19, NCCL_GDRCOPY_ENABLE_parse, NCCL_GDRCOPY_ENABLE_reset},
+  {"NCCL_GDRCOPY_FIFO_ENABLE", 24, NCCL_GDRCOPY_FIFO_ENABLE_parse, NCCL_GDRCOPY_FIFO_ENABLE_reset},
+  {"NCCL_GDRCOPY_FLUSH_ENABLE", 25, NCCL_GDRCOPY_FLUSH_ENABLE_parse, NCCL_GDRCOPY_FLUSH_ENABLE_reset},
+  {"NCCL_GDRCOPY_SYNC_ENABLE", 24, NCCL_GDRCOPY_SYNC_ENABLE_parse, NCCL_GDRCOPY_SYNC_ENABLE_reset},
+  {"NCCL_GDR_FLUSH_DISABLE", 22, NCCL_GDR_FLUSH_DISABLE_parse, NCCL_GDR_FLUSH_DISABLE_reset},
+  {"NCCL_GRAPH_DUMP_FILE", 20, NCCL_GRAPH_DUMP_FILE_parse, NCCL_GRAPH_DUMP_FILE_reset},
+  {"NCCL_GRAPH_DUMP_FILE_RANK", 25, NCCL_GRAPH_DUMP_FILE_RANK_parse, NCCL_GRAPH_DUMP_FILE_RANK_reset},
+  {"NCCL_GRAPH_FILE", 15, NCCL_GRAPH_FILE_parse, NCCL_GRAPH_FILE_reset},
+  {"NCCL_GRAPH_MIXING_SUPPORT", 25, NCCL_GRAPH_MIXING_SUPPORT_parse, NCCL_GRAPH_MIXING_SUPPORT_reset},
+  {"NCCL_GRAPH_REGISTER", 19, NCCL_GRAPH_REGISTER_parse, NCCL_GRAPH_REGISTER_reset},
+  {"NCCL_HOSTID", 11, NCCL_HOSTID_parse, NCCL_HOSTID_reset},
+  {"NCCL_IB_ADAPTIVE_ROUTING", 24, NCCL_IB_ADAPTIVE_ROUTING_parse, NCCL_IB_ADAPTIVE_ROUTING_reset},
+  {"NCCL_IB_ADDR_FAMILY", 19, NCCL_IB_ADDR_FAMILY_parse, NCCL_IB_ADDR_FAMILY_reset},
+  {"NCCL_IB_ADDR_RANGE", 18, NCCL_IB_ADDR_RANGE_parse, NCCL_IB_ADDR_RANGE_reset},
+  {"NCCL_IB_AR_THRESHOLD", 20, NCCL_IB_AR_THRESHOLD_parse, NCCL_IB_AR_THRESHOLD_reset},
+  {"NCCL_IB_DISABLE", 15, NCCL_IB_DISABLE_parse, NCCL_IB_DISABLE_reset},
+  {"NCCL_IB_GID_INDEX", 17, NCCL_IB_GID_INDEX_parse, NCCL_IB_GID_INDEX_reset},
+  {"NCCL_IB_HCA", 11, NCCL_IB_HCA_parse, NCCL_IB_HCA_reset},
+  {"NCCL_IB_MERGE_VFS", 17, NCCL_IB_MERGE_VFS_parse, NCCL_IB_MERGE_VFS_reset},
+  {"NCCL_IB_PCI_RELAXED_ORDERING", 28, NCCL_IB_PCI_RELAXED_ORDERING_parse, NCCL_IB_PCI_RELAXED_ORDERING_reset},
+  {"NCCL_IB_PKEY", 12, NCCL_IB_PKEY_parse, NCCL_IB_PKEY_reset},
+  {"NCCL_IB_QPS_PER_CONNECTION", 26, NCCL_IB_QPS_PER_CONNECTION_parse, NCCL_IB_QPS_PER_CONNECTION_reset},
+  {"NCCL_IB_RETRY_CNT", 17, NCCL_IB_RETRY_CNT_parse, NCCL_IB_RETRY_CNT_reset},
+  {"NCCL_IB_ROCE_VERSION_NUM", 24, NCCL_IB_ROCE_VERSION_NUM_parse, NCCL_IB_ROCE_VERSION_NUM_reset},
+  {"NCCL_IB_SL", 10, NCCL_IB_SL_parse, NCCL_IB_SL_reset},
+  {"NCCL_IB_SPLIT_DATA_ON_QPS", 25, NCCL_IB_SPLIT_DATA_ON_QPS_parse, NCCL_IB_SPLIT_DATA_ON_QPS_reset},
+  {"NCCL_IB_TC", 10, NCCL_IB_TC_parse, NCCL_IB_TC_reset},
+  {"NCCL_IB_TIMEOUT", 15, NCCL_IB_TIMEOUT_parse, NCCL_IB_TIMEOUT_reset},
+  {"NCCL_IB_USE_INLINE", 18, NCCL_IB_USE_INLINE_parse, NCCL_IB_USE_INLINE_reset},
+  {"NCCL_IGNORE_CPU_AFFINITY", 24, NCCL_IGNORE_CPU_AFFINITY_parse, NCCL_IGNORE_CPU_AFFINITY_reset},
+  {"NCCL_IGNORE_DISABLED_P2P", 24, NCCL_IGNORE_DISABLED_P2P_parse, NCCL_IGNORE_DISABLED_P2P_reset},
+  {"NCCL_L1_SHARED_MEMORY_CARVEOUT", 30, NCCL_L1_SHARED_MEMORY_CARVEOUT_parse, NCCL_L1_SHARED_MEMORY_CARVEOUT_reset},
+  {"NCCL_LAUNCH_MODE", 16, NCCL_LAUNCH_MODE_parse, NCCL_LAUNCH_MODE_reset},
+  {"NCCL_LL128_BUFFSIZE", 19, NCCL_LL128_BUFFSIZE_parse, NCCL_LL128_BUFFSIZE_reset},
+  {"NCCL_LL128_NTHREADS", 19, NCCL_LL128_NTHREADS_parse, NCCL_LL128_NTHREADS_reset},
+  {"NCCL_LL_BUFFSIZE", 16, NCCL_LL_BUFFSIZE_parse, NCCL_LL_BUFFSIZE_reset},
+  {"NCCL_LOCAL_REGISTER", 19, NCCL_LOCAL_REGISTER_parse, NCCL_LOCAL_REGISTER_reset},
+  {"NCCL_LOGGER_MODE", 16, NCCL_LOGGER_MODE_parse, NCCL_LOGGER_MODE_reset},
+  {"NCCL_MAX_CTAS", 13, NCCL_MAX_CTAS_parse, NCCL_MAX_CTAS_reset},
+  {"NCCL_MAX_NCHANNELS", 18, NCCL_MAX_NCHANNELS_parse, NCCL_MAX_NCHANNELS_reset},
+  {"NCCL_MAX_NRINGS", 15, NCCL_MAX_NRINGS_parse, NCCL_MAX_NRINGS_reset},
+  {"NCCL_MAX_P2P_NCHANNELS", 22, NCCL_MAX_P2P_NCHANNELS_parse, NCCL_MAX_P2P_NCHANNELS_reset},
+  {"NCCL_MEM_SYNC_DOMAIN", 20, NCCL_MEM_SYNC_DOMAIN_parse, NCCL_MEM_SYNC_DOMAIN_reset},
+  {"NCCL_MIN_CTAS", 13, NCCL_MIN_CTAS_parse, NCCL_MIN_CTAS_reset},
+  {"NCCL_MIN_NCHANNELS", 18, NCCL_MIN_NCHANNELS_parse, NCCL_MIN_NCHANNELS_reset},
+  {"NCCL_MIN_NRINGS", 15, NCCL_MIN_NRINGS_parse, NCCL_MIN_NRINGS_reset},
+  {"NCCL_MIN_P2P_NCHANNELS", 22, NCCL_MIN_P2P_NCHANNELS_parse, NCCL_MIN_P2P_NCHANNELS_reset},
+  {"NCCL_NCHANNELS_PER_NET_PEER", 27, NCCL_NCHANNELS_PER_NET_PEER_parse, NCCL_NCHANNELS_PER_NET_PEER_reset},
+  {"NCCL_NET", 8, NCCL_NETWORK_parse, NCCL_NETWORK_reset},
+  {"NCCL_NET_DISABLE_INTRA", 22, NCCL_NET_DISABLE_INTRA_parse, NCCL_NET_DISABLE_INTRA_reset},
+  {"NCCL_NET_FORCE_FLUSH", 20, NCCL_NET_FORCE_FLUSH_parse, NCCL_NET_FORCE_FLUSH_reset},
+  {"NCCL_NET_GDR_LEVEL", 18, NCCL_NET_GDR_LEVEL_parse, NCCL_NET_GDR_LEVEL_reset},
+  {"NCCL_NET_GDR_READ", 17, NCCL_NET_GDR_READ_parse, NCCL_NET_GDR_READ_reset},
+  {"NCCL_NET_OVERHEAD", 17, NCCL_NET_OVERHEAD_parse, NCCL_NET_OVERHEAD_reset},
+  {"NCCL_NET_PLUGIN", 15, NCCL_NET_PLUGIN_parse, NCCL_NET_PLUGIN_reset},
+  {"NCCL_NET_SHARED_BUFFERS", 23, NCCL_NET_SHARED_BUFFERS_parse, NCCL_NET_SHARED_BUFFERS_reset},
+  {"NCCL_NET_SHARED_COMMS", 21, NCCL_NET_SHARED_COMMS_parse, NCCL_NET_SHARED_COMMS_reset},
+  {"NCCL_NSOCKS_PERTHREAD", 21, NCCL_NSOCKS_PERTHREAD_parse, NCCL_NSOCKS_PERTHREAD_reset},
+  {"NCCL_NTHREADS", 13, NCCL_NTHREADS_parse, NCCL_NTHREADS_reset},
+  {"NCCL_NVB_DISABLE", 16, NCCL_NVB_DISABLE_parse, NCCL_NVB_DISABLE_reset},
+  {"NCCL_NVB_PRECONNECT", 19, NCCL_NVB_PRECONNECT_parse, NCCL_NVB_PRECONNECT_reset},
+  {"NCCL_NVLS_ENABLE", 16, NCCL_NVLS_ENABLE_parse, NCCL_NVLS_ENABLE_reset},
+  {"NCCL_NVLS_NCHANNELS", 19, NCCL_NVLS_NCHANNELS_parse, NCCL_NVLS_NCHANNELS_reset},
+  {"NCCL_P2P_DIRECT_DISABLE", 23, NCCL_P2P_DIRECT_DISABLE_parse, NCCL_P2P_DIRECT_DISABLE_reset},
+  {"NCCL_P2P_DISABLE", 16, NCCL_P2P_DISABLE_parse, NCCL_P2P_DISABLE_reset},
+  {"NCCL_P2P_LEVEL", 14, NCCL_P2P_LEVEL_parse, NCCL_P2P_LEVEL_reset},
+  {"NCCL_P2P_LL_THRESHOLD", 21, NCCL_P2P_LL_THRESHOLD_parse, NCCL_P2P_LL_THRESHOLD_reset},
+  {"NCCL_P2P_NET_CHUNKSIZE", 22, NCCL_P2P_NET_CHUNKSIZE_parse, NCCL_P2P_NET_CHUNKSIZE_reset},
+  {"NCCL_P2P_NVL_CHUNKSIZE", 22, NCCL_P2P_NVL_CHUNKSIZE_parse, NCCL_P2P_NVL_CHUNKSIZE_reset},
+  {"NCCL_P2P_PCI_CHUNKSIZE", 22, NCCL_P2P_PCI_CHUNKSIZE_parse, NCCL_P2P_PCI_CHUNKSIZE_reset},
+  {"NCCL_P2P_PXN_LEVEL", 18, NCCL_P2P_PXN_LEVEL_parse, NCCL_P2P_PXN_LEVEL_reset},
+  {"NCCL_P2P_READ_ENABLE", 20, NCCL_P2P_READ_ENABLE_parse, NCCL_P2P_READ_ENABLE_reset},
+  {"NCCL_P2P_USE_CUDA_MEMCPY", 24, NCCL_P2P_USE_CUDA_MEMCPY_parse, NCCL_P2P_USE_CUDA_MEMCPY_reset},
+  {"NCCL_PROGRESS_APPENDOP_FREQ", 27, NCCL_PROGRESS_APPENDOP_FREQ_parse, NCCL_PROGRESS_APPENDOP_FREQ_reset},
+  {"NCCL_PROTO", 10, NCCL_PROTO_parse, NCCL_PROTO_reset},
+  {"NCCL_PROXY_APPEND_BATCH_SIZE", 28, NCCL_PROXY_APPEND_BATCH_SIZE_parse, NCCL_PROXY_APPEND_BATCH_SIZE_reset},
+  {"NCCL_PROXY_DUMP_SIGNAL", 22, NCCL_PROXY_DUMP_SIGNAL_parse, NCCL_PROXY_DUMP_SIGNAL_reset},
+  {"NCCL_PROXY_PROFILE", 18, NCCL_PROXY_PROFILE_parse, NCCL_PROXY_PROFILE_reset},
+  {"NCCL_PROXY_PROFILE_DIR", 22, NCCL_PROXY_PROFILE_DIR_parse, NCCL_PROXY_PROFILE_DIR_reset},
+  {"NCCL_PXN_DISABLE", 16, NCCL_PXN_DISABLE_parse, NCCL_PXN_DISABLE_reset},
+  {"NCCL_SENDRECV_ALGO", 18, NCCL_SENDRECV_ALGO_parse, NCCL_SENDRECV_ALGO_reset},
+  {"NCCL_SET_STACK_SIZE", 19, NCCL_SET_STACK_SIZE_parse, NCCL_SET_STACK_SIZE_reset},
+  {"NCCL_SET_THREAD_NAME", 20, NCCL_SET_THREAD_NAME_parse, NCCL_SET_THREAD_NAME_reset},
+  {"NCCL_SHM_DISABLE", 16, NCCL_SHM_DISABLE_parse, NCCL_SHM_DISABLE_reset},
+  {"NCCL_SHM_LOCALITY", 17, NCCL_SHM_LOCALITY_parse, NCCL_SHM_LOCALITY_reset},
+  {"NCCL_SHM_MEMCPY_MODE", 20, NCCL_SHM_MEMCPY_MODE_parse, NCCL_SHM_MEMCPY_MODE_reset},
+  {"NCCL_SHM_USE_CUDA_MEMCPY", 24, NCCL_SHM_USE_CUDA_MEMCPY_parse, NCCL_SHM_USE_CUDA_MEMCPY_reset},
+  {"NCCL_SOCKET_FAMILY", 18, NCCL_SOCKET_FAMILY_parse, NCCL_SOCKET_FAMILY_reset},
+  {"NCCL_SOCKET_IFNAME", 18, NCCL_SOCKET_IFNAME_parse, NCCL_SOCKET_IFNAME_reset},
+  {"NCCL_SOCKET_NTHREADS", 20, NCCL_SOCKET_NTHREADS_parse, NCCL_SOCKET_NTHREADS_reset},
+  {"NCCL_THREAD_THRESHOLDS", 22, NCCL_THREAD_THRESHOLDS_parse, NCCL_THREAD_THRESHOLDS_reset},
+  {"NCCL_TOPO_DUMP_FILE", 19, NCCL_TOPO_DUMP_FILE_parse, NCCL_TOPO_DUMP_FILE_reset},
+  {"NCCL_TOPO_DUMP_FILE_RANK", 24, NCCL_TOPO_DUMP_FILE_RANK_parse, NCCL_TOPO_DUMP_FILE_RANK_reset},
+  {"NCCL_TOPO_FILE", 14, NCCL_TOPO_FILE_parse, NCCL_TOPO_FILE_reset},
+  {"NCCL_TUNER_PLUGIN", 17, NCCL_TUNER_PLUGIN_parse, NCCL_TUNER_PLUGIN_reset},
+  {"NCCL_WORK_FIFO_DEPTH", 20, NCCL_WORK_FIFO_DEPTH_parse, NCCL_WORK_FIFO_DEPTH_reset},
+};
+
+static constexpr bool cvarLazyInit = false;
+
+const std::string& CUDA_LAUNCH_BLOCKING_get() {
+  cvarEnsureLoaded(0);
+  return CUDA_LAUNCH_BLOCKING;
+}
+const int64_t& NCCL_AGG_CHANNEL_SIZE_get() {
+  cvarEnsureLoaded(1);
+  return NCCL_AGG_CHANNEL_SIZE;
+}
+const std::string& NCCL_ALGO_get() {
+  cvarEnsureLoaded(2);
+  return NCCL_ALGO;
+}
+const enum NCCL_ALLGATHER_ALGO& NCCL_ALLGATHER_ALGO_get() {
+  cvarEnsureLoaded(3);
+  return NCCL_ALLGATHER_ALGO;
+}
+const uint64_t& NCCL_ALLGATHER_DIRECT_CUTOFF_get() {
+  cvarEnsureLoaded(4);
+  return NCCL_ALLGATHER_DIRECT_CUTOFF;
+}
+const int64_t& NCCL_ALLOC_P2P_NET_LL_BUFFERS_get() {
+  cvarEnsureLoaded(5);
+  return NCCL_ALLOC_P2P_NET_LL_BUFFERS;
+}
+const enum NCCL_ALLREDUCE_ALGO& NCCL_ALLREDUCE_ALGO_get() {
+  cvarEnsureLoaded(6);
+  return NCCL_ALLREDUCE_ALGO;
+}
+const int& NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_get() {
+  cvarEnsureLoaded(7);
+  return NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS;
+}
+const int& NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_get() {
+  cvarEnsureLoaded(8);
+  return NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE;
+}
+const enum NCCL_ALLTOALLV_ALGO& NCCL_ALLTOALLV_ALGO_get() {
+  cvarEnsureLoaded(9);
+  return NCCL_ALLTOALLV_ALGO;
+}
+const enum NCCL_ALLTOALL_ALGO& NCCL_ALLTOALL_ALGO_get() {
+  cvarEnsureLoaded(10);
+  return NCCL_ALLTOALL_ALGO;
+}
+const int64_t& NCCL_BUFFSIZE_get() {
+  cvarEnsureLoaded(11);
+  return NCCL_BUFFSIZE;
+}
+const int64_t& NCCL_CGA_CLUSTER_SIZE_get() {
+  cvarEnsureLoaded(12);
+  return NCCL_CGA_CLUSTER_SIZE;
+}
+const int64_t& NCCL_CHECK_POINTERS_get() {
+  cvarEnsureLoaded(13);
+  return NCCL_CHECK_POINTERS;
+}
+const int64_t& NCCL_CHUNK_SIZE_get() {
+  cvarEnsureLoaded(14);
+  return NCCL_CHUNK_SIZE;
+}
+const std::string& NCCL_COLLNET_ENABLE_get() {
+  cvarEnsureLoaded(15);
+  return NCCL_COLLNET_ENABLE;
+}
+const int64_t& NCCL_COLLNET_NODE_THRESHOLD_get() {
+  cvarEnsureLoaded(16);
+  return NCCL_COLLNET_NODE_THRESHOLD;
+}
+const std::string& NCCL_COLLTRACE_DIR_get() {
+  cvarEnsureLoaded(17);
+  return NCCL_COLLTRACE_DIR;
+}
+const int64_t& NCCL_COMM_BLOCKING_get() {
+  cvarEnsureLoaded(18);
+  return NCCL_COMM_BLOCKING;
+}
+const std::string& NCCL_COMM_ID_get() {
+  cvarEnsureLoaded(19);
+  return NCCL_COMM_ID;
+}
+const int64_t& NCCL_COMM_SPLIT_SHARE_RESOURCES_get() {
+  cvarEnsureLoaded(20);
+  return NCCL_COMM_SPLIT_SHARE_RESOURCES;
+}
+const int64_t& NCCL_CONNECT_ROUND_SIZE_get() {
+  cvarEnsureLoaded(21);
+  return NCCL_CONNECT_ROUND_SIZE;
+}
+const int64_t& NCCL_CREATE_THREAD_CONTEXT_get() {
+  cvarEnsureLoaded(22);
+  return NCCL_CREATE_THREAD_CONTEXT;
+}
+const int64_t& NCCL_CROSS_NIC_get() {
+  cvarEnsureLoaded(23);
+  return NCCL_CROSS_NIC;
+}
+const bool& NCCL_CTRAN_AG_RD_RTR_get() {
+  cvarEnsureLoaded(24);
+  return NCCL_CTRAN_AG_RD_RTR;
+}
+const int& NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_get() {
+  cvarEnsureLoaded(25);
+  return NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS;
+}
+const int& NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_get() {
+  cvarEnsureLoaded(26);
+  return NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE;
+}
+const int& NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_get() {
+  cvarEnsureLoaded(27);
+  return NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS;
+}
+const int& NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_get() {
+  cvarEnsureLoaded(28);
+  return NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE;
+}
+const uint64_t& NCCL_CTRAN_ALLTOALL_THRESHOLD_get() {
+  cvarEnsureLoaded(29);
+  return NCCL_CTRAN_ALLTOALL_THRESHOLD;
+}
+const std::vector<enum NCCL_CTRAN_BACKENDS>& NCCL_CTRAN_BACKENDS_get() {
+  cvarEnsureLoaded(30);
+  return NCCL_CTRAN_BACKENDS;
+}
+uint64_t NCCL_CTRAN_BACKENDS_MASK_get() {
+  cvarEnsureLoaded(30);
+  return NCCL_CTRAN_BACKENDS_MASK;
+}
+const uint64_t& NCCL_CTRAN_IB_CTRL_TC_get() {
+  cvarEnsureLoaded(31);
+  return NCCL_CTRAN_IB_CTRL_TC;
+}
+const int& NCCL_CTRAN_IB_MAX_QPS_get() {
+  cvarEnsureLoaded(32);
+  return NCCL_CTRAN_IB_MAX_QPS;
+}
+const uint64_t& NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get() {
+  cvarEnsureLoaded(33);
+  return NCCL_CTRAN_IB_QP_SCALING_THRESHOLD;
+}
+const bool& NCCL_CTRAN_IB_TRAFFIC_PROFILNG_get() {
+  cvarEnsureLoaded(34);
+  return NCCL_CTRAN_IB_TRAFFIC_PROFILNG;
+}
+const std::string& NCCL_CTRAN_KINETO_PROFILE_DIR_get() {
+  cvarEnsureLoaded(35);
+  return NCCL_CTRAN_KINETO_PROFILE_DIR;
+}
+const int& NCCL_CTRAN_NUM_KERNEL_P2PELEMS_get() {
+  cvarEnsureLoaded(36);
+  return NCCL_CTRAN_NUM_KERNEL_P2PELEMS;
+}
+const enum NCCL_CTRAN_PROFILING& NCCL_CTRAN_PROFILING_get() {
+  cvarEnsureLoaded(37);
+  return NCCL_CTRAN_PROFILING;
+}
+const int& NCCL_CTRAN_PROFILING_REPORT_COUNT_get() {
+  cvarEnsureLoaded(38);
+  return NCCL_CTRAN_PROFILING_REPORT_COUNT;
+}
+const enum NCCL_CTRAN_REGISTER& NCCL_CTRAN_REGISTER_get() {
+  cvarEnsureLoaded(39);
+  return NCCL_CTRAN_REGISTER;
+}
+const int& NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() {
+  cvarEnsureLoaded(40);
+  return NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT;
+}
+const int& NCCL_CTRAN_RING_MAX_OUTSTANDING_get() {
+  cvarEnsureLoaded(41);
+  return NCCL_CTRAN_RING_MAX_OUTSTANDING;
+}
+const uint64_t& NCCL_CTRAN_RING_STEP_get() {
+  cvarEnsureLoaded(42);
+  return NCCL_CTRAN_RING_STEP;
+}
+const uint64_t& NCCL_CTRAN_SHARED_DEVBUF_SIZE_get() {
+  cvarEnsureLoaded(43);
+  return NCCL_CTRAN_SHARED_DEVBUF_SIZE;
+}
+const std::string& NCCL_CTRAN_TOPO_FILE_get() {
+  cvarEnsureLoaded(44);
+  return NCCL_CTRAN_TOPO_FILE;
+}
+const std::vector<std::string>& NCCL_CTRAN_TOPO_FILE_KEYS_get() {
+  cvarEnsureLoaded(45);
+  return NCCL_CTRAN_TOPO_FILE_KEYS;
+}
+const std::string& NCCL_CUDA_PATH_get() {
+  cvarEnsureLoaded(46);
+  return NCCL_CUDA_PATH;
+}
+const int64_t& NCCL_CUMEM_ENABLE_get() {
+  cvarEnsureLoaded(47);
+  return NCCL_CUMEM_ENABLE;
+}
+const std::string& NCCL_CVAR_SNAPSHOT_DIR_get() {
+  cvarEnsureLoaded(48);
+  return NCCL_CVAR_SNAPSHOT_DIR;
+}
+const std::string& NCCL_DATA_EXPORT_DIR_get() {
+  cvarEnsureLoaded(49);
+  return NCCL_DATA_EXPORT_DIR;
+}
+const int& NCCL_DDA_ALLREDUCE_MAX_BLOCKS_get() {
+  cvarEnsureLoaded(50);
+  return NCCL_DDA_ALLREDUCE_MAX_BLOCKS;
+}
+const uint64_t& NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_get() {
+  cvarEnsureLoaded(51);
+  return NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD;
+}
+const uint64_t& NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_get() {
+  cvarEnsureLoaded(52);
+  return NCCL_DDA_ALLREDUCE_TREE_THRESHOLD;
+}
+const uint64_t& NCCL_DDA_TMPBUFF_SIZE_get() {
+  cvarEnsureLoaded(53);
+  return NCCL_DDA_TMPBUFF_SIZE;
+}
+const std::string& NCCL_DEBUG_get() {
+  cvarEnsureLoaded(54);
+  return NCCL_DEBUG;
+}
+const std::string& NCCL_DEBUG_FILE_get() {
+  cvarEnsureLoaded(55);
+  return NCCL_DEBUG_FILE;
+}
+const std::string& NCCL_DEBUG_SUBSYS_get() {
+  cvarEnsureLoaded(56);
+  return NCCL_DEBUG_SUBSYS;
+}
+const int64_t& NCCL_DMABUF_ENABLE_get() {
+  cvarEnsureLoaded(57);
+  return NCCL_DMABUF_ENABLE;
+}
+const int64_t& NCCL_GDRCOPY_ENABLE_get() {
+  cvarEnsureLoaded(58);
+  return NCCL_GDRCOPY_ENABLE;
+}
+const int64_t& NCCL_GDRCOPY_FIFO_ENABLE_get() {
+  cvarEnsureLoaded(59);
+  return NCCL_GDRCOPY_FIFO_ENABLE;
+}
+const int64_t& NCCL_GDRCOPY_FLUSH_ENABLE_get() {
+  cvarEnsureLoaded(60);
+  return NCCL_GDRCOPY_FLUSH_ENABLE;
+}
+const int64_t& NCCL_GDRCOPY_SYNC_ENABLE_get() {
+  cvarEnsureLoaded(61);
+  return NCCL_GDRCOPY_SYNC_ENABLE;
+}
+const int64_t& NCCL_GDR_FLUSH_DISABLE_get() {
+  cvarEnsureLoaded(62);
+  return NCCL_GDR_FLUSH_DISABLE;
+}
+const std::string& NCCL_GRAPH_DUMP_FILE_get() {
+  cvarEnsureLoaded(63);
+  return NCCL_GRAPH_DUMP_FILE;
+}
+const int64_t& NCCL_GRAPH_DUMP_FILE_RANK_get() {
+  cvarEnsureLoaded(64);
+  return NCCL_GRAPH_DUMP_FILE_RANK;
+}
+const std::string& NCCL_GRAPH_FILE_get() {
+  cvarEnsureLoaded(65);
+  return NCCL_GRAPH_FILE;
+}
+const int64_t& NCCL_GRAPH_MIXING_SUPPORT_get() {
+  cvarEnsureLoaded(66);
+  return NCCL_GRAPH_MIXING_SUPPORT;
+}
+const int64_t& NCCL_GRAPH_REGISTER_get() {
+  cvarEnsureLoaded(67);
+  return NCCL_GRAPH_REGISTER;
+}
+const std::string& NCCL_HOSTID_get() {
+  cvarEnsureLoaded(68);
+  return NCCL_HOSTID;
+}
+const int64_t& NCCL_IB_ADAPTIVE_ROUTING_get() {
+  cvarEnsureLoaded(69);
+  return NCCL_IB_ADAPTIVE_ROUTING;
+}
+const std::string& NCCL_IB_ADDR_FAMILY_get() {
+  cvarEnsureLoaded(70);
+  return NCCL_IB_ADDR_FAMILY;
+}
+const std::string& NCCL_IB_ADDR_RANGE_get() {
+  cvarEnsureLoaded(71);
+  return NCCL_IB_ADDR_RANGE;
+}
+const int64_t& NCCL_IB_AR_THRESHOLD_get() {
+  cvarEnsureLoaded(72);
+  return NCCL_IB_AR_THRESHOLD;
+}
+const int64_t& NCCL_IB_DISABLE_get() {
+  cvarEnsureLoaded(73);
+  return NCCL_IB_DISABLE;
+}
+const int& NCCL_IB_GID_INDEX_get() {
+  cvarEnsureLoaded(74);
+  return NCCL_IB_GID_INDEX;
+}
+const std::string& NCCL_IB_HCA_PREFIX_get() {
+  cvarEnsureLoaded(75);
+  return NCCL_IB_HCA_PREFIX;
+}
+const std::vector<std::string>& NCCL_IB_HCA_get() {
+  cvarEnsureLoaded(75);
+  return NCCL_IB_HCA;
+}
+const int64_t& NCCL_IB_MERGE_VFS_get() {
+  cvarEnsureLoaded(76);
+  return NCCL_IB_MERGE_VFS;
+}
+const int64_t& NCCL_IB_PCI_RELAXED_ORDERING_get() {
+  cvarEnsureLoaded(77);
+  return NCCL_IB_PCI_RELAXED_ORDERING;
+}
+const int64_t& NCCL_IB_PKEY_get() {
+  cvarEnsureLoaded(78);
+  return NCCL_IB_PKEY;
+}
+const int64_t& NCCL_IB_QPS_PER_CONNECTION_get() {
+  cvarEnsureLoaded(79);
+  return NCCL_IB_QPS_PER_CONNECTION;
+}
+const int64_t& NCCL_IB_RETRY_CNT_get() {
+  cvarEnsureLoaded(80);
+  return NCCL_IB_RETRY_CNT;
+}
+const int& NCCL_IB_ROCE_VERSION_NUM_get() {
+  cvarEnsureLoaded(81);
+  return NCCL_IB_ROCE_VERSION_NUM;
+}
+const int64_t& NCCL_IB_SL_get() {
+  cvarEnsureLoaded(82);
+  return NCCL_IB_SL;
+}
+const int64_t& NCCL_IB_SPLIT_DATA_ON_QPS_get() {
+  cvarEnsureLoaded(83);
+  return NCCL_IB_SPLIT_DATA_ON_QPS;
+}
+const int64_t& NCCL_IB_TC_get() {
+  cvarEnsureLoaded(84);
+  return NCCL_IB_TC;
+}
+const int64_t& NCCL_IB_TIMEOUT_get() {
+  cvarEnsureLoaded(85);
+  return NCCL_IB_TIMEOUT;
+}
+const int64_t& NCCL_IB_USE_INLINE_get() {
+  cvarEnsureLoaded(86);
+  return NCCL_IB_USE_INLINE;
+}
+const int64_t& NCCL_IGNORE_CPU_AFFINITY_get() {
+  cvarEnsureLoaded(87);
+  return NCCL_IGNORE_CPU_AFFINITY;
+}
+const int64_t& NCCL_IGNORE_DISABLED_P2P_get() {
+  cvarEnsureLoaded(88);
+  return NCCL_IGNORE_DISABLED_P2P;
+}
+const int64_t& NCCL_L1_SHARED_MEMORY_CARVEOUT_get() {
+  cvarEnsureLoaded(89);
+  return NCCL_L1_SHARED_MEMORY_CARVEOUT;
+}
+const std::string& NCCL_LAUNCH_MODE_get() {
+  cvarEnsureLoaded(90);
+  return NCCL_LAUNCH_MODE;
+}
+const int64_t& NCCL_LL128_BUFFSIZE_get() {
+  cvarEnsureLoaded(91);
+  return NCCL_LL128_BUFFSIZE;
+}
+const int64_t& NCCL_LL128_NTHREADS_get() {
+  cvarEnsureLoaded(92);
+  return NCCL_LL128_NTHREADS;
+}
+const int64_t& NCCL_LL_BUFFSIZE_get() {
+  cvarEnsureLoaded(93);
+  return NCCL_LL_BUFFSIZE;
+}
+const int64_t& NCCL_LOCAL_REGISTER_get() {
+  cvarEnsureLoaded(94);
+  return NCCL_LOCAL_REGISTER;
+}
+const enum NCCL_LOGGER_MODE& NCCL_LOGGER_MODE_get() {
+  cvarEnsureLoaded(95);
+  return NCCL_LOGGER_MODE;
+}
+const int64_t& NCCL_MAX_CTAS_get() {
+  cvarEnsureLoaded(96);
+  return NCCL_MAX_CTAS;
+}
+const int64_t& NCCL_MAX_NCHANNELS_get() {
+  cvarEnsureLoaded(97);
+  return NCCL_MAX_NCHANNELS;
+}
+const int64_t& NCCL_MAX_NRINGS_get() {
+  cvarEnsureLoaded(98);
+  return NCCL_MAX_NRINGS;
+}
+const int64_t& NCCL_MAX_P2P_NCHANNELS_get() {
+  cvarEnsureLoaded(99);
+  return NCCL_MAX_P2P_NCHANNELS;
+}
+const enum NCCL_MEM_SYNC_DOMAIN& NCCL_MEM_SYNC_DOMAIN_get() {
+  cvarEnsureLoaded(100);
+  return NCCL_MEM_SYNC_DOMAIN;
+}
+const int64_t& NCCL_MIN_CTAS_get() {
+  cvarEnsureLoaded(101);
+  return NCCL_MIN_CTAS;
+}
+const int64_t& NCCL_MIN_NCHANNELS_get() {
+  cvarEnsureLoaded(102);
+  return NCCL_MIN_NCHANNELS;
+}
+const int64_t& NCCL_MIN_NRINGS_get() {
+  cvarEnsureLoaded(103);
+  return NCCL_MIN_NRINGS;
+}
+const int64_t& NCCL_MIN_P2P_NCHANNELS_get() {
+  cvarEnsureLoaded(104);
+  return NCCL_MIN_P2P_NCHANNELS;
+}
+const int64_t& NCCL_NCHANNELS_PER_NET_PEER_get() {
+  cvarEnsureLoaded(105);
+  return NCCL_NCHANNELS_PER_NET_PEER;
+}
+const std::string& NCCL_NETWORK_get() {
+  cvarEnsureLoaded(106);
+  return NCCL_NETWORK;
+}
+const int64_t& NCCL_NET_DISABLE_INTRA_get() {
+  cvarEnsureLoaded(107);
+  return NCCL_NET_DISABLE_INTRA;
+}
+const int64_t& NCCL_NET_FORCE_FLUSH_get() {
+  cvarEnsureLoaded(108);
+  return NCCL_NET_FORCE_FLUSH;
+}
+const std::string& NCCL_NET_GDR_LEVEL_get() {
+  cvarEnsureLoaded(109);
+  return NCCL_NET_GDR_LEVEL;
+}
+const int64_t& NCCL_NET_GDR_READ_get() {
+  cvarEnsureLoaded(110);
+  return NCCL_NET_GDR_READ;
+}
+const int64_t& NCCL_NET_OVERHEAD_get() {
+  cvarEnsureLoaded(111);
+  return NCCL_NET_OVERHEAD;
+}
+const std::string& NCCL_NET_PLUGIN_get() {
+  cvarEnsureLoaded(112);
+  return NCCL_NET_PLUGIN;
+}
+const int64_t& NCCL_NET_SHARED_BUFFERS_get() {
+  cvarEnsureLoaded(113);
+  return NCCL_NET_SHARED_BUFFERS;
+}
+const int64_t& NCCL_NET_SHARED_COMMS_get() {
+  cvarEnsureLoaded(114);
+  return NCCL_NET_SHARED_COMMS;
+}
+const int64_t& NCCL_NSOCKS_PERTHREAD_get() {
+  cvarEnsureLoaded(115);
+  return NCCL_NSOCKS_PERTHREAD;
+}
+const int64_t& NCCL_NTHREADS_get() {
+  cvarEnsureLoaded(116);
+  return NCCL_NTHREADS;
+}
+const int64_t& NCCL_NVB_DISABLE_get() {
+  cvarEnsureLoaded(117);
+  return NCCL_NVB_DISABLE;
+}
+const int64_t& NCCL_NVB_PRECONNECT_get() {
+  cvarEnsureLoaded(118);
+  return NCCL_NVB_PRECONNECT;
+}
+const int64_t& NCCL_NVLS_ENABLE_get() {
+  cvarEnsureLoaded(119);
+  return NCCL_NVLS_ENABLE;
+}
+const int64_t& NCCL_NVLS_NCHANNELS_get() {
+  cvarEnsureLoaded(120);
+  return NCCL_NVLS_NCHANNELS;
+}
+const int64_t& NCCL_P2P_DIRECT_DISABLE_get() {
+  cvarEnsureLoaded(121);
+  return NCCL_P2P_DIRECT_DISABLE;
+}
+const std::string& NCCL_P2P_DISABLE_get() {
+  cvarEnsureLoaded(122);
+  return NCCL_P2P_DISABLE;
+}
+const std::string& NCCL_P2P_LEVEL_get() {
+  cvarEnsureLoaded(123);
+  return NCCL_P2P_LEVEL;
+}
+const int64_t& NCCL_P2P_LL_THRESHOLD_get() {
+  cvarEnsureLoaded(124);
+  return NCCL_P2P_LL_THRESHOLD;
+}
+const int64_t& NCCL_P2P_NET_CHUNKSIZE_get() {
+  cvarEnsureLoaded(125);
+  return NCCL_P2P_NET_CHUNKSIZE;
+}
+const int64_t& NCCL_P2P_NVL_CHUNKSIZE_get() {
+  cvarEnsureLoaded(126);
+  return NCCL_P2P_NVL_CHUNKSIZE;
+}
+const int64_t& NCCL_P2P_PCI_CHUNKSIZE_get() {
+  cvarEnsureLoaded(127);
+  return NCCL_P2P_PCI_CHUNKSIZE;
+}
+const int64_t& NCCL_P2P_PXN_LEVEL_get() {
+  cvarEnsureLoaded(128);
+  return NCCL_P2P_PXN_LEVEL;
+}
+const int64_t& NCCL_P2P_READ_ENABLE_get() {
+  cvarEnsureLoaded(129);
+  return NCCL_P2P_READ_ENABLE;
+}
+const int64_t& NCCL_P2P_USE_CUDA_MEMCPY_get() {
+  cvarEnsureLoaded(130);
+  return NCCL_P2P_USE_CUDA_MEMCPY;
+}
+const int64_t& NCCL_PROGRESS_APPENDOP_FREQ_get() {
+  cvarEnsureLoaded(131);
+  return NCCL_PROGRESS_APPENDOP_FREQ;
+}
+const std::string& NCCL_PROTO_get() {
+  cvarEnsureLoaded(132);
+  return NCCL_PROTO;
+}
+const int64_t& NCCL_PROXY_APPEND_BATCH_SIZE_get() {
+  cvarEnsureLoaded(133);
+  return NCCL_PROXY_APPEND_BATCH_SIZE;
+}
+const int64_t& NCCL_PROXY_DUMP_SIGNAL_get() {
+  cvarEnsureLoaded(134);
+  return NCCL_PROXY_DUMP_SIGNAL;
+}
+const std::string& NCCL_PROXY_PROFILE_get() {
+  cvarEnsureLoaded(135);
+  return NCCL_PROXY_PROFILE;
+}
+const std::string& NCCL_PROXY_PROFILE_DIR_get() {
+  cvarEnsureLoaded(136);
+  return NCCL_PROXY_PROFILE_DIR;
+}
+const int64_t& NCCL_PXN_DISABLE_get() {
+  cvarEnsureLoaded(137);
+  return NCCL_PXN_DISABLE;
+}
+const enum NCCL_SENDRECV_ALGO& NCCL_SENDRECV_ALGO_get() {
+  cvarEnsureLoaded(138);
+  return NCCL_SENDRECV_ALGO;
+}
+const int64_t& NCCL_SET_STACK_SIZE_get() {
+  cvarEnsureLoaded(139);
+  return NCCL_SET_STACK_SIZE;
+}
+const int64_t& NCCL_SET_THREAD_NAME_get() {
+  cvarEnsureLoaded(140);
+  return NCCL_SET_THREAD_NAME;
+}
+const int64_t& NCCL_SHM_DISABLE_get() {
+  cvarEnsureLoaded(141);
+  return NCCL_SHM_DISABLE;
+}
+const int64_t& NCCL_SHM_LOCALITY_get() {
+  cvarEnsureLoaded(142);
+  return NCCL_SHM_LOCALITY;
+}
+const int64_t& NCCL_SHM_MEMCPY_MODE_get() {
+  cvarEnsureLoaded(143);
+  return NCCL_SHM_MEMCPY_MODE;
+}
+const int64_t& NCCL_SHM_USE_CUDA_MEMCPY_get() {
+  cvarEnsureLoaded(144);
+  return NCCL_SHM_USE_CUDA_MEMCPY;
+}
+const std::string& NCCL_SOCKET_FAMILY_get() {
+  cvarEnsureLoaded(145);
+  return NCCL_SOCKET_FAMILY;
+}
+const std::string& NCCL_SOCKET_IFNAME_get() {
+  cvarEnsureLoaded(146);
+  return NCCL_SOCKET_IFNAME;
+}
+const int64_t& NCCL_SOCKET_NTHREADS_get() {
+  cvarEnsureLoaded(147);
+  return NCCL_SOCKET_NTHREADS;
+}
+const std::string& NCCL_THREAD_THRESHOLDS_get() {
+  cvarEnsureLoaded(148);
+  return NCCL_THREAD_THRESHOLDS;
+}
+const std::string& NCCL_TOPO_DUMP_FILE_get() {
+  cvarEnsureLoaded(149);
+  return NCCL_TOPO_DUMP_FILE;
+}
+const int64_t& NCCL_TOPO_DUMP_FILE_RANK_get() {
+  cvarEnsureLoaded(150);
+  return NCCL_TOPO_DUMP_FILE_RANK;
+}
+const std::string& NCCL_TOPO_FILE_get() {
+  cvarEnsureLoaded(151);
+  return NCCL_TOPO_FILE;
+}
+const std::string& NCCL_TUNER_PLUGIN_get() {
+  cvarEnsureLoaded(152);
+  return NCCL_TUNER_PLUGIN;
+}
+const int64_t& NCCL_WORK_FIFO_DEPTH_get() {
+  cvarEnsureLoaded(153);
+  return NCCL_WORK_FIFO_DEPTH;
+}
+
+std::string ncclCvarSnapshot() {
+  std::string snapshot;
+  if (CUDA_LAUNCH_BLOCKING_get() != CUDA_LAUNCH_BLOCKING_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "CUDA_LAUNCH_BLOCKING", cvarToString(CUDA_LAUNCH_BLOCKING_get()), cvarToString(CUDA_LAUNCH_BLOCKING_DEFAULT));
+  }
+  if (NCCL_AGG_CHANNEL_SIZE_get() != NCCL_AGG_CHANNEL_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_AGG_CHANNEL_SIZE", cvarToString(NCCL_AGG_CHANNEL_SIZE_get()), cvarToString(NCCL_AGG_CHANNEL_SIZE_DEFAULT));
+  }
+  if (NCCL_ALGO_get() != NCCL_ALGO_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALGO", cvarToString(NCCL_ALGO_get()), cvarToString(NCCL_ALGO_DEFAULT));
+  }
+  if (NCCL_ALLGATHER_ALGO_get() != NCCL_ALLGATHER_ALGO_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALLGATHER_ALGO", cvarToString(NCCL_ALLGATHER_ALGO_get(), NCCL_ALLGATHER_ALGO_choices), cvarToString(NCCL_ALLGATHER_ALGO_DEFAULT, NCCL_ALLGATHER_ALGO_choices));
+  }
+  if (NCCL_ALLGATHER_DIRECT_CUTOFF_get() != NCCL_ALLGATHER_DIRECT_CUTOFF_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALLGATHER_DIRECT_CUTOFF", cvarToString(NCCL_ALLGATHER_DIRECT_CUTOFF_get()), cvarToString(NCCL_ALLGATHER_DIRECT_CUTOFF_DEFAULT));
+  }
+  if (NCCL_ALLOC_P2P_NET_LL_BUFFERS_get() != NCCL_ALLOC_P2P_NET_LL_BUFFERS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALLOC_P2P_NET_LL_BUFFERS", cvarToString(NCCL_ALLOC_P2P_NET_LL_BUFFERS_get()), cvarToString(NCCL_ALLOC_P2P_NET_LL_BUFFERS_DEFAULT));
+  }
+  if (NCCL_ALLREDUCE_ALGO_get() != NCCL_ALLREDUCE_ALGO_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALLREDUCE_ALGO", cvarToString(NCCL_ALLREDUCE_ALGO_get(), NCCL_ALLREDUCE_ALGO_choices), cvarToString(NCCL_ALLREDUCE_ALGO_DEFAULT, NCCL_ALLREDUCE_ALGO_choices));
+  }
+  if (NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_get() != NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", cvarToString(NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_get()), cvarToString(NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_DEFAULT));
+  }
+  if (NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_get() != NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", cvarToString(NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_get()), cvarToString(NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_DEFAULT));
+  }
+  if (NCCL_ALLTOALLV_ALGO_get() != NCCL_ALLTOALLV_ALGO_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALLTOALLV_ALGO", cvarToString(NCCL_ALLTOALLV_ALGO_get(), NCCL_ALLTOALLV_ALGO_choices), cvarToString(NCCL_ALLTOALLV_ALGO_DEFAULT, NCCL_ALLTOALLV_ALGO_choices));
+  }
+  if (NCCL_ALLTOALL_ALGO_get() != NCCL_ALLTOALL_ALGO_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_ALLTOALL_ALGO", cvarToString(NCCL_ALLTOALL_ALGO_get(), NCCL_ALLTOALL_ALGO_choices), cvarToString(NCCL_ALLTOALL_ALGO_DEFAULT, NCCL_ALLTOALL_ALGO_choices));
+  }
+  if (NCCL_BUFFSIZE_get() != NCCL_BUFFSIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_BUFFSIZE", cvarToString(NCCL_BUFFSIZE_get()), cvarToString(NCCL_BUFFSIZE_DEFAULT));
+  }
+  if (NCCL_CGA_CLUSTER_SIZE_get() != NCCL_CGA_CLUSTER_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CGA_CLUSTER_SIZE", cvarToString(NCCL_CGA_CLUSTER_SIZE_get()), cvarToString(NCCL_CGA_CLUSTER_SIZE_DEFAULT));
+  }
+  if (NCCL_CHECK_POINTERS_get() != NCCL_CHECK_POINTERS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CHECK_POINTERS", cvarToString(NCCL_CHECK_POINTERS_get()), cvarToString(NCCL_CHECK_POINTERS_DEFAULT));
+  }
+  if (NCCL_CHUNK_SIZE_get() != NCCL_CHUNK_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CHUNK_SIZE", cvarToString(NCCL_CHUNK_SIZE_get()), cvarToString(NCCL_CHUNK_SIZE_DEFAULT));
+  }
+  if (NCCL_COLLNET_ENABLE_get() != NCCL_COLLNET_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_COLLNET_ENABLE", cvarToString(NCCL_COLLNET_ENABLE_get()), cvarToString(NCCL_COLLNET_ENABLE_DEFAULT));
+  }
+  if (NCCL_COLLNET_NODE_THRESHOLD_get() != NCCL_COLLNET_NODE_THRESHOLD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_COLLNET_NODE_THRESHOLD", cvarToString(NCCL_COLLNET_NODE_THRESHOLD_get()), cvarToString(NCCL_COLLNET_NODE_THRESHOLD_DEFAULT));
+  }
+  if (NCCL_COLLTRACE_DIR_get() != NCCL_COLLTRACE_DIR_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_COLLTRACE_DIR", cvarToString(NCCL_COLLTRACE_DIR_get()), cvarToString(NCCL_COLLTRACE_DIR_DEFAULT));
+  }
+  if (NCCL_COMM_BLOCKING_get() != NCCL_COMM_BLOCKING_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_COMM_BLOCKING", cvarToString(NCCL_COMM_BLOCKING_get()), cvarToString(NCCL_COMM_BLOCKING_DEFAULT));
+  }
+  if (NCCL_COMM_ID_get() != NCCL_COMM_ID_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_COMM_ID", cvarToString(NCCL_COMM_ID_get()), cvarToString(NCCL_COMM_ID_DEFAULT));
+  }
+  if (NCCL_COMM_SPLIT_SHARE_RESOURCES_get() != NCCL_COMM_SPLIT_SHARE_RESOURCES_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_COMM_SPLIT_SHARE_RESOURCES", cvarToString(NCCL_COMM_SPLIT_SHARE_RESOURCES_get()), cvarToString(NCCL_COMM_SPLIT_SHARE_RESOURCES_DEFAULT));
+  }
+  if (NCCL_CONNECT_ROUND_SIZE_get() != NCCL_CONNECT_ROUND_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CONNECT_ROUND_SIZE", cvarToString(NCCL_CONNECT_ROUND_SIZE_get()), cvarToString(NCCL_CONNECT_ROUND_SIZE_DEFAULT));
+  }
+  if (NCCL_CREATE_THREAD_CONTEXT_get() != NCCL_CREATE_THREAD_CONTEXT_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CREATE_THREAD_CONTEXT", cvarToString(NCCL_CREATE_THREAD_CONTEXT_get()), cvarToString(NCCL_CREATE_THREAD_CONTEXT_DEFAULT));
+  }
+  if (NCCL_CROSS_NIC_get() != NCCL_CROSS_NIC_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CROSS_NIC", cvarToString(NCCL_CROSS_NIC_get()), cvarToString(NCCL_CROSS_NIC_DEFAULT));
+  }
+  if (NCCL_CTRAN_AG_RD_RTR_get() != NCCL_CTRAN_AG_RD_RTR_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_AG_RD_RTR", cvarToString(NCCL_CTRAN_AG_RD_RTR_get()), cvarToString(NCCL_CTRAN_AG_RD_RTR_DEFAULT));
+  }
+  if (NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_get() != NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", cvarToString(NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_get()), cvarToString(NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_DEFAULT));
+  }
+  if (NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_get() != NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", cvarToString(NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_get()), cvarToString(NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_DEFAULT));
+  }
+  if (NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_get() != NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", cvarToString(NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_get()), cvarToString(NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_DEFAULT));
+  }
+  if (NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_get() != NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", cvarToString(NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_get()), cvarToString(NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_DEFAULT));
+  }
+  if (NCCL_CTRAN_ALLTOALL_THRESHOLD_get() != NCCL_CTRAN_ALLTOALL_THRESHOLD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_ALLTOALL_THRESHOLD", cvarToString(NCCL_CTRAN_ALLTOALL_THRESHOLD_get()), cvarToString(NCCL_CTRAN_ALLTOALL_THRESHOLD_DEFAULT));
+  }
+  if (NCCL_CTRAN_BACKENDS_get() != NCCL_CTRAN_BACKENDS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_BACKENDS", cvarToString(NCCL_CTRAN_BACKENDS_get(), NCCL_CTRAN_BACKENDS_choices), cvarToString(NCCL_CTRAN_BACKENDS_DEFAULT, NCCL_CTRAN_BACKENDS_choices));
+  }
+  if (NCCL_CTRAN_IB_CTRL_TC_get() != NCCL_CTRAN_IB_CTRL_TC_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_IB_CTRL_TC", cvarToString(NCCL_CTRAN_IB_CTRL_TC_get()), cvarToString(NCCL_CTRAN_IB_CTRL_TC_DEFAULT));
+  }
+  if (NCCL_CTRAN_IB_MAX_QPS_get() != NCCL_CTRAN_IB_MAX_QPS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_IB_MAX_QPS", cvarToString(NCCL_CTRAN_IB_MAX_QPS_get()), cvarToString(NCCL_CTRAN_IB_MAX_QPS_DEFAULT));
+  }
+  if (NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get() != NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", cvarToString(NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_get()), cvarToString(NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_DEFAULT));
+  }
+  if (NCCL_CTRAN_IB_TRAFFIC_PROFILNG_get() != NCCL_CTRAN_IB_TRAFFIC_PROFILNG_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", cvarToString(NCCL_CTRAN_IB_TRAFFIC_PROFILNG_get()), cvarToString(NCCL_CTRAN_IB_TRAFFIC_PROFILNG_DEFAULT));
+  }
+  if (NCCL_CTRAN_KINETO_PROFILE_DIR_get() != NCCL_CTRAN_KINETO_PROFILE_DIR_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_KINETO_PROFILE_DIR", cvarToString(NCCL_CTRAN_KINETO_PROFILE_DIR_get()), cvarToString(NCCL_CTRAN_KINETO_PROFILE_DIR_DEFAULT));
+  }
+  if (NCCL_CTRAN_NUM_KERNEL_P2PELEMS_get() != NCCL_CTRAN_NUM_KERNEL_P2PELEMS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_NUM_KERNEL_P2PELEMS", cvarToString(NCCL_CTRAN_NUM_KERNEL_P2PELEMS_get()), cvarToString(NCCL_CTRAN_NUM_KERNEL_P2PELEMS_DEFAULT));
+  }
+  if (NCCL_CTRAN_PROFILING_get() != NCCL_CTRAN_PROFILING_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_PROFILING", cvarToString(NCCL_CTRAN_PROFILING_get(), NCCL_CTRAN_PROFILING_choices), cvarToString(NCCL_CTRAN_PROFILING_DEFAULT, NCCL_CTRAN_PROFILING_choices));
+  }
+  if (NCCL_CTRAN_PROFILING_REPORT_COUNT_get() != NCCL_CTRAN_PROFILING_REPORT_COUNT_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_PROFILING_REPORT_COUNT", cvarToString(NCCL_CTRAN_PROFILING_REPORT_COUNT_get()), cvarToString(NCCL_CTRAN_PROFILING_REPORT_COUNT_DEFAULT));
+  }
+  if (NCCL_CTRAN_REGISTER_get() != NCCL_CTRAN_REGISTER_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_REGISTER", cvarToString(NCCL_CTRAN_REGISTER_get(), NCCL_CTRAN_REGISTER_choices), cvarToString(NCCL_CTRAN_REGISTER_DEFAULT, NCCL_CTRAN_REGISTER_choices));
+  }
+  if (NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get() != NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", cvarToString(NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_get()), cvarToString(NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_DEFAULT));
+  }
+  if (NCCL_CTRAN_RING_MAX_OUTSTANDING_get() != NCCL_CTRAN_RING_MAX_OUTSTANDING_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_RING_MAX_OUTSTANDING", cvarToString(NCCL_CTRAN_RING_MAX_OUTSTANDING_get()), cvarToString(NCCL_CTRAN_RING_MAX_OUTSTANDING_DEFAULT));
+  }
+  if (NCCL_CTRAN_RING_STEP_get() != NCCL_CTRAN_RING_STEP_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_RING_STEP", cvarToString(NCCL_CTRAN_RING_STEP_get()), cvarToString(NCCL_CTRAN_RING_STEP_DEFAULT));
+  }
+  if (NCCL_CTRAN_SHARED_DEVBUF_SIZE_get() != NCCL_CTRAN_SHARED_DEVBUF_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_SHARED_DEVBUF_SIZE", cvarToString(NCCL_CTRAN_SHARED_DEVBUF_SIZE_get()), cvarToString(NCCL_CTRAN_SHARED_DEVBUF_SIZE_DEFAULT));
+  }
+  if (NCCL_CTRAN_TOPO_FILE_get() != NCCL_CTRAN_TOPO_FILE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_TOPO_FILE", cvarToString(NCCL_CTRAN_TOPO_FILE_get()), cvarToString(NCCL_CTRAN_TOPO_FILE_DEFAULT));
+  }
+  if (NCCL_CTRAN_TOPO_FILE_KEYS_get() != NCCL_CTRAN_TOPO_FILE_KEYS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CTRAN_TOPO_FILE_KEYS", cvarToString(NCCL_CTRAN_TOPO_FILE_KEYS_get()), cvarToString(NCCL_CTRAN_TOPO_FILE_KEYS_DEFAULT));
+  }
+  if (NCCL_CUDA_PATH_get() != NCCL_CUDA_PATH_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CUDA_PATH", cvarToString(NCCL_CUDA_PATH_get()), cvarToString(NCCL_CUDA_PATH_DEFAULT));
+  }
+  if (NCCL_CUMEM_ENABLE_get() != NCCL_CUMEM_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CUMEM_ENABLE", cvarToString(NCCL_CUMEM_ENABLE_get()), cvarToString(NCCL_CUMEM_ENABLE_DEFAULT));
+  }
+  if (NCCL_CVAR_SNAPSHOT_DIR_get() != NCCL_CVAR_SNAPSHOT_DIR_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_CVAR_SNAPSHOT_DIR", cvarToString(NCCL_CVAR_SNAPSHOT_DIR_get()), cvarToString(NCCL_CVAR_SNAPSHOT_DIR_DEFAULT));
+  }
+  if (NCCL_DATA_EXPORT_DIR_get() != NCCL_DATA_EXPORT_DIR_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DATA_EXPORT_DIR", cvarToString(NCCL_DATA_EXPORT_DIR_get()), cvarToString(NCCL_DATA_EXPORT_DIR_DEFAULT));
+  }
+  if (NCCL_DDA_ALLREDUCE_MAX_BLOCKS_get() != NCCL_DDA_ALLREDUCE_MAX_BLOCKS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DDA_ALLREDUCE_MAX_BLOCKS", cvarToString(NCCL_DDA_ALLREDUCE_MAX_BLOCKS_get()), cvarToString(NCCL_DDA_ALLREDUCE_MAX_BLOCKS_DEFAULT));
+  }
+  if (NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_get() != NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", cvarToString(NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_get()), cvarToString(NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_DEFAULT));
+  }
+  if (NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_get() != NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", cvarToString(NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_get()), cvarToString(NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_DEFAULT));
+  }
+  if (NCCL_DDA_TMPBUFF_SIZE_get() != NCCL_DDA_TMPBUFF_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DDA_TMPBUFF_SIZE", cvarToString(NCCL_DDA_TMPBUFF_SIZE_get()), cvarToString(NCCL_DDA_TMPBUFF_SIZE_DEFAULT));
+  }
+  if (NCCL_DEBUG_get() != NCCL_DEBUG_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DEBUG", cvarToString(NCCL_DEBUG_get()), cvarToString(NCCL_DEBUG_DEFAULT));
+  }
+  if (NCCL_DEBUG_FILE_get() != NCCL_DEBUG_FILE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DEBUG_FILE", cvarToString(NCCL_DEBUG_FILE_get()), cvarToString(NCCL_DEBUG_FILE_DEFAULT));
+  }
+  if (NCCL_DEBUG_SUBSYS_get() != NCCL_DEBUG_SUBSYS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DEBUG_SUBSYS", cvarToString(NCCL_DEBUG_SUBSYS_get()), cvarToString(NCCL_DEBUG_SUBSYS_DEFAULT));
+  }
+  if (NCCL_DMABUF_ENABLE_get() != NCCL_DMABUF_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_DMABUF_ENABLE", cvarToString(NCCL_DMABUF_ENABLE_get()), cvarToString(NCCL_DMABUF_ENABLE_DEFAULT));
+  }
+  if (NCCL_GDRCOPY_ENABLE_get() != NCCL_GDRCOPY_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GDRCOPY_ENABLE", cvarToString(NCCL_GDRCOPY_ENABLE_get()), cvarToString(NCCL_GDRCOPY_ENABLE_DEFAULT));
+  }
+  if (NCCL_GDRCOPY_FIFO_ENABLE_get() != NCCL_GDRCOPY_FIFO_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GDRCOPY_FIFO_ENABLE", cvarToString(NCCL_GDRCOPY_FIFO_ENABLE_get()), cvarToString(NCCL_GDRCOPY_FIFO_ENABLE_DEFAULT));
+  }
+  if (NCCL_GDRCOPY_FLUSH_ENABLE_get() != NCCL_GDRCOPY_FLUSH_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GDRCOPY_FLUSH_ENABLE", cvarToString(NCCL_GDRCOPY_FLUSH_ENABLE_get()), cvarToString(NCCL_GDRCOPY_FLUSH_ENABLE_DEFAULT));
+  }
+  if (NCCL_GDRCOPY_SYNC_ENABLE_get() != NCCL_GDRCOPY_SYNC_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GDRCOPY_SYNC_ENABLE", cvarToString(NCCL_GDRCOPY_SYNC_ENABLE_get()), cvarToString(NCCL_GDRCOPY_SYNC_ENABLE_DEFAULT));
+  }
+  if (NCCL_GDR_FLUSH_DISABLE_get() != NCCL_GDR_FLUSH_DISABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GDR_FLUSH_DISABLE", cvarToString(NCCL_GDR_FLUSH_DISABLE_get()), cvarToString(NCCL_GDR_FLUSH_DISABLE_DEFAULT));
+  }
+  if (NCCL_GRAPH_DUMP_FILE_get() != NCCL_GRAPH_DUMP_FILE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GRAPH_DUMP_FILE", cvarToString(NCCL_GRAPH_DUMP_FILE_get()), cvarToString(NCCL_GRAPH_DUMP_FILE_DEFAULT));
+  }
+  if (NCCL_GRAPH_DUMP_FILE_RANK_get() != NCCL_GRAPH_DUMP_FILE_RANK_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GRAPH_DUMP_FILE_RANK", cvarToString(NCCL_GRAPH_DUMP_FILE_RANK_get()), cvarToString(NCCL_GRAPH_DUMP_FILE_RANK_DEFAULT));
+  }
+  if (NCCL_GRAPH_FILE_get() != NCCL_GRAPH_FILE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GRAPH_FILE", cvarToString(NCCL_GRAPH_FILE_get()), cvarToString(NCCL_GRAPH_FILE_DEFAULT));
+  }
+  if (NCCL_GRAPH_MIXING_SUPPORT_get() != NCCL_GRAPH_MIXING_SUPPORT_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GRAPH_MIXING_SUPPORT", cvarToString(NCCL_GRAPH_MIXING_SUPPORT_get()), cvarToString(NCCL_GRAPH_MIXING_SUPPORT_DEFAULT));
+  }
+  if (NCCL_GRAPH_REGISTER_get() != NCCL_GRAPH_REGISTER_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_GRAPH_REGISTER", cvarToString(NCCL_GRAPH_REGISTER_get()), cvarToString(NCCL_GRAPH_REGISTER_DEFAULT));
+  }
+  if (NCCL_HOSTID_get() != NCCL_HOSTID_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_HOSTID", cvarToString(NCCL_HOSTID_get()), cvarToString(NCCL_HOSTID_DEFAULT));
+  }
+  if (NCCL_IB_ADAPTIVE_ROUTING_get() != NCCL_IB_ADAPTIVE_ROUTING_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_ADAPTIVE_ROUTING", cvarToString(NCCL_IB_ADAPTIVE_ROUTING_get()), cvarToString(NCCL_IB_ADAPTIVE_ROUTING_DEFAULT));
+  }
+  if (NCCL_IB_ADDR_FAMILY_get() != NCCL_IB_ADDR_FAMILY_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_ADDR_FAMILY", cvarToString(NCCL_IB_ADDR_FAMILY_get()), cvarToString(NCCL_IB_ADDR_FAMILY_DEFAULT));
+  }
+  if (NCCL_IB_ADDR_RANGE_get() != NCCL_IB_ADDR_RANGE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_ADDR_RANGE", cvarToString(NCCL_IB_ADDR_RANGE_get()), cvarToString(NCCL_IB_ADDR_RANGE_DEFAULT));
+  }
+  if (NCCL_IB_AR_THRESHOLD_get() != NCCL_IB_AR_THRESHOLD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_AR_THRESHOLD", cvarToString(NCCL_IB_AR_THRESHOLD_get()), cvarToString(NCCL_IB_AR_THRESHOLD_DEFAULT));
+  }
+  if (NCCL_IB_DISABLE_get() != NCCL_IB_DISABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_DISABLE", cvarToString(NCCL_IB_DISABLE_get()), cvarToString(NCCL_IB_DISABLE_DEFAULT));
+  }
+  if (NCCL_IB_GID_INDEX_get() != NCCL_IB_GID_INDEX_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_GID_INDEX", cvarToString(NCCL_IB_GID_INDEX_get()), cvarToString(NCCL_IB_GID_INDEX_DEFAULT));
+  }
+  if (NCCL_IB_HCA_get() != NCCL_IB_HCA_DEFAULT || NCCL_IB_HCA_PREFIX_get() != NCCL_IB_HCA_PREFIX_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_HCA", NCCL_IB_HCA_PREFIX_get() + cvarToString(NCCL_IB_HCA_get()), NCCL_IB_HCA_PREFIX_DEFAULT + cvarToString(NCCL_IB_HCA_DEFAULT));
+  }
+  if (NCCL_IB_MERGE_VFS_get() != NCCL_IB_MERGE_VFS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_MERGE_VFS", cvarToString(NCCL_IB_MERGE_VFS_get()), cvarToString(NCCL_IB_MERGE_VFS_DEFAULT));
+  }
+  if (NCCL_IB_PCI_RELAXED_ORDERING_get() != NCCL_IB_PCI_RELAXED_ORDERING_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_PCI_RELAXED_ORDERING", cvarToString(NCCL_IB_PCI_RELAXED_ORDERING_get()), cvarToString(NCCL_IB_PCI_RELAXED_ORDERING_DEFAULT));
+  }
+  if (NCCL_IB_PKEY_get() != NCCL_IB_PKEY_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_PKEY", cvarToString(NCCL_IB_PKEY_get()), cvarToString(NCCL_IB_PKEY_DEFAULT));
+  }
+  if (NCCL_IB_QPS_PER_CONNECTION_get() != NCCL_IB_QPS_PER_CONNECTION_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_QPS_PER_CONNECTION", cvarToString(NCCL_IB_QPS_PER_CONNECTION_get()), cvarToString(NCCL_IB_QPS_PER_CONNECTION_DEFAULT));
+  }
+  if (NCCL_IB_RETRY_CNT_get() != NCCL_IB_RETRY_CNT_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_RETRY_CNT", cvarToString(NCCL_IB_RETRY_CNT_get()), cvarToString(NCCL_IB_RETRY_CNT_DEFAULT));
+  }
+  if (NCCL_IB_ROCE_VERSION_NUM_get() != NCCL_IB_ROCE_VERSION_NUM_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_ROCE_VERSION_NUM", cvarToString(NCCL_IB_ROCE_VERSION_NUM_get()), cvarToString(NCCL_IB_ROCE_VERSION_NUM_DEFAULT));
+  }
+  if (NCCL_IB_SL_get() != NCCL_IB_SL_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_SL", cvarToString(NCCL_IB_SL_get()), cvarToString(NCCL_IB_SL_DEFAULT));
+  }
+  if (NCCL_IB_SPLIT_DATA_ON_QPS_get() != NCCL_IB_SPLIT_DATA_ON_QPS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_SPLIT_DATA_ON_QPS", cvarToString(NCCL_IB_SPLIT_DATA_ON_QPS_get()), cvarToString(NCCL_IB_SPLIT_DATA_ON_QPS_DEFAULT));
+  }
+  if (NCCL_IB_TC_get() != NCCL_IB_TC_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_TC", cvarToString(NCCL_IB_TC_get()), cvarToString(NCCL_IB_TC_DEFAULT));
+  }
+  if (NCCL_IB_TIMEOUT_get() != NCCL_IB_TIMEOUT_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_TIMEOUT", cvarToString(NCCL_IB_TIMEOUT_get()), cvarToString(NCCL_IB_TIMEOUT_DEFAULT));
+  }
+  if (NCCL_IB_USE_INLINE_get() != NCCL_IB_USE_INLINE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IB_USE_INLINE", cvarToString(NCCL_IB_USE_INLINE_get()), cvarToString(NCCL_IB_USE_INLINE_DEFAULT));
+  }
+  if (NCCL_IGNORE_CPU_AFFINITY_get() != NCCL_IGNORE_CPU_AFFINITY_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IGNORE_CPU_AFFINITY", cvarToString(NCCL_IGNORE_CPU_AFFINITY_get()), cvarToString(NCCL_IGNORE_CPU_AFFINITY_DEFAULT));
+  }
+  if (NCCL_IGNORE_DISABLED_P2P_get() != NCCL_IGNORE_DISABLED_P2P_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_IGNORE_DISABLED_P2P", cvarToString(NCCL_IGNORE_DISABLED_P2P_get()), cvarToString(NCCL_IGNORE_DISABLED_P2P_DEFAULT));
+  }
+  if (NCCL_L1_SHARED_MEMORY_CARVEOUT_get() != NCCL_L1_SHARED_MEMORY_CARVEOUT_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_L1_SHARED_MEMORY_CARVEOUT", cvarToString(NCCL_L1_SHARED_MEMORY_CARVEOUT_get()), cvarToString(NCCL_L1_SHARED_MEMORY_CARVEOUT_DEFAULT));
+  }
+  if (NCCL_LAUNCH_MODE_get() != NCCL_LAUNCH_MODE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_LAUNCH_MODE", cvarToString(NCCL_LAUNCH_MODE_get()), cvarToString(NCCL_LAUNCH_MODE_DEFAULT));
+  }
+  if (NCCL_LL128_BUFFSIZE_get() != NCCL_LL128_BUFFSIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_LL128_BUFFSIZE", cvarToString(NCCL_LL128_BUFFSIZE_get()), cvarToString(NCCL_LL128_BUFFSIZE_DEFAULT));
+  }
+  if (NCCL_LL128_NTHREADS_get() != NCCL_LL128_NTHREADS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_LL128_NTHREADS", cvarToString(NCCL_LL128_NTHREADS_get()), cvarToString(NCCL_LL128_NTHREADS_DEFAULT));
+  }
+  if (NCCL_LL_BUFFSIZE_get() != NCCL_LL_BUFFSIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_LL_BUFFSIZE", cvarToString(NCCL_LL_BUFFSIZE_get()), cvarToString(NCCL_LL_BUFFSIZE_DEFAULT));
+  }
+  if (NCCL_LOCAL_REGISTER_get() != NCCL_LOCAL_REGISTER_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_LOCAL_REGISTER", cvarToString(NCCL_LOCAL_REGISTER_get()), cvarToString(NCCL_LOCAL_REGISTER_DEFAULT));
+  }
+  if (NCCL_LOGGER_MODE_get() != NCCL_LOGGER_MODE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_LOGGER_MODE", cvarToString(NCCL_LOGGER_MODE_get(), NCCL_LOGGER_MODE_choices), cvarToString(NCCL_LOGGER_MODE_DEFAULT, NCCL_LOGGER_MODE_choices));
+  }
+  if (NCCL_MAX_CTAS_get() != NCCL_MAX_CTAS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MAX_CTAS", cvarToString(NCCL_MAX_CTAS_get()), cvarToString(NCCL_MAX_CTAS_DEFAULT));
+  }
+  if (NCCL_MAX_NCHANNELS_get() != NCCL_MAX_NCHANNELS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MAX_NCHANNELS", cvarToString(NCCL_MAX_NCHANNELS_get()), cvarToString(NCCL_MAX_NCHANNELS_DEFAULT));
+  }
+  if (NCCL_MAX_NRINGS_get() != NCCL_MAX_NRINGS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MAX_NRINGS", cvarToString(NCCL_MAX_NRINGS_get()), cvarToString(NCCL_MAX_NRINGS_DEFAULT));
+  }
+  if (NCCL_MAX_P2P_NCHANNELS_get() != NCCL_MAX_P2P_NCHANNELS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MAX_P2P_NCHANNELS", cvarToString(NCCL_MAX_P2P_NCHANNELS_get()), cvarToString(NCCL_MAX_P2P_NCHANNELS_DEFAULT));
+  }
+  if (NCCL_MEM_SYNC_DOMAIN_get() != NCCL_MEM_SYNC_DOMAIN_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MEM_SYNC_DOMAIN", cvarToString(NCCL_MEM_SYNC_DOMAIN_get(), NCCL_MEM_SYNC_DOMAIN_choices), cvarToString(NCCL_MEM_SYNC_DOMAIN_DEFAULT, NCCL_MEM_SYNC_DOMAIN_choices));
+  }
+  if (NCCL_MIN_CTAS_get() != NCCL_MIN_CTAS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MIN_CTAS", cvarToString(NCCL_MIN_CTAS_get()), cvarToString(NCCL_MIN_CTAS_DEFAULT));
+  }
+  if (NCCL_MIN_NCHANNELS_get() != NCCL_MIN_NCHANNELS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MIN_NCHANNELS", cvarToString(NCCL_MIN_NCHANNELS_get()), cvarToString(NCCL_MIN_NCHANNELS_DEFAULT));
+  }
+  if (NCCL_MIN_NRINGS_get() != NCCL_MIN_NRINGS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MIN_NRINGS", cvarToString(NCCL_MIN_NRINGS_get()), cvarToString(NCCL_MIN_NRINGS_DEFAULT));
+  }
+  if (NCCL_MIN_P2P_NCHANNELS_get() != NCCL_MIN_P2P_NCHANNELS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_MIN_P2P_NCHANNELS", cvarToString(NCCL_MIN_P2P_NCHANNELS_get()), cvarToString(NCCL_MIN_P2P_NCHANNELS_DEFAULT));
+  }
+  if (NCCL_NCHANNELS_PER_NET_PEER_get() != NCCL_NCHANNELS_PER_NET_PEER_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NCHANNELS_PER_NET_PEER", cvarToString(NCCL_NCHANNELS_PER_NET_PEER_get()), cvarToString(NCCL_NCHANNELS_PER_NET_PEER_DEFAULT));
+  }
+  if (NCCL_NETWORK_get() != NCCL_NETWORK_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET", cvarToString(NCCL_NETWORK_get()), cvarToString(NCCL_NETWORK_DEFAULT));
+  }
+  if (NCCL_NET_DISABLE_INTRA_get() != NCCL_NET_DISABLE_INTRA_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET_DISABLE_INTRA", cvarToString(NCCL_NET_DISABLE_INTRA_get()), cvarToString(NCCL_NET_DISABLE_INTRA_DEFAULT));
+  }
+  if (NCCL_NET_FORCE_FLUSH_get() != NCCL_NET_FORCE_FLUSH_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET_FORCE_FLUSH", cvarToString(NCCL_NET_FORCE_FLUSH_get()), cvarToString(NCCL_NET_FORCE_FLUSH_DEFAULT));
+  }
+  if (NCCL_NET_GDR_LEVEL_get() != NCCL_NET_GDR_LEVEL_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET_GDR_LEVEL", cvarToString(NCCL_NET_GDR_LEVEL_get()), cvarToString(NCCL_NET_GDR_LEVEL_DEFAULT));
+  }
+  if (NCCL_NET_GDR_READ_get() != NCCL_NET_GDR_READ_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET_GDR_READ", cvarToString(NCCL_NET_GDR_READ_get()), cvarToString(NCCL_NET_GDR_READ_DEFAULT));
+  }
+  if (NCCL_NET_OVERHEAD_get() != NCCL_NET_OVERHEAD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET_OVERHEAD", cvarToString(NCCL_NET_OVERHEAD_get()), cvarToString(NCCL_NET_OVERHEAD_DEFAULT));
+  }
+  if (NCCL_NET_PLUGIN_get() != NCCL_NET_PLUGIN_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET_PLUGIN", cvarToString(NCCL_NET_PLUGIN_get()), cvarToString(NCCL_NET_PLUGIN_DEFAULT));
+  }
+  if (NCCL_NET_SHARED_BUFFERS_get() != NCCL_NET_SHARED_BUFFERS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET_SHARED_BUFFERS", cvarToString(NCCL_NET_SHARED_BUFFERS_get()), cvarToString(NCCL_NET_SHARED_BUFFERS_DEFAULT));
+  }
+  if (NCCL_NET_SHARED_COMMS_get() != NCCL_NET_SHARED_COMMS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NET_SHARED_COMMS", cvarToString(NCCL_NET_SHARED_COMMS_get()), cvarToString(NCCL_NET_SHARED_COMMS_DEFAULT));
+  }
+  if (NCCL_NSOCKS_PERTHREAD_get() != NCCL_NSOCKS_PERTHREAD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NSOCKS_PERTHREAD", cvarToString(NCCL_NSOCKS_PERTHREAD_get()), cvarToString(NCCL_NSOCKS_PERTHREAD_DEFAULT));
+  }
+  if (NCCL_NTHREADS_get() != NCCL_NTHREADS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NTHREADS", cvarToString(NCCL_NTHREADS_get()), cvarToString(NCCL_NTHREADS_DEFAULT));
+  }
+  if (NCCL_NVB_DISABLE_get() != NCCL_NVB_DISABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NVB_DISABLE", cvarToString(NCCL_NVB_DISABLE_get()), cvarToString(NCCL_NVB_DISABLE_DEFAULT));
+  }
+  if (NCCL_NVB_PRECONNECT_get() != NCCL_NVB_PRECONNECT_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NVB_PRECONNECT", cvarToString(NCCL_NVB_PRECONNECT_get()), cvarToString(NCCL_NVB_PRECONNECT_DEFAULT));
+  }
+  if (NCCL_NVLS_ENABLE_get() != NCCL_NVLS_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NVLS_ENABLE", cvarToString(NCCL_NVLS_ENABLE_get()), cvarToString(NCCL_NVLS_ENABLE_DEFAULT));
+  }
+  if (NCCL_NVLS_NCHANNELS_get() != NCCL_NVLS_NCHANNELS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_NVLS_NCHANNELS", cvarToString(NCCL_NVLS_NCHANNELS_get()), cvarToString(NCCL_NVLS_NCHANNELS_DEFAULT));
+  }
+  if (NCCL_P2P_DIRECT_DISABLE_get() != NCCL_P2P_DIRECT_DISABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_DIRECT_DISABLE", cvarToString(NCCL_P2P_DIRECT_DISABLE_get()), cvarToString(NCCL_P2P_DIRECT_DISABLE_DEFAULT));
+  }
+  if (NCCL_P2P_DISABLE_get() != NCCL_P2P_DISABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_DISABLE", cvarToString(NCCL_P2P_DISABLE_get()), cvarToString(NCCL_P2P_DISABLE_DEFAULT));
+  }
+  if (NCCL_P2P_LEVEL_get() != NCCL_P2P_LEVEL_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_LEVEL", cvarToString(NCCL_P2P_LEVEL_get()), cvarToString(NCCL_P2P_LEVEL_DEFAULT));
+  }
+  if (NCCL_P2P_LL_THRESHOLD_get() != NCCL_P2P_LL_THRESHOLD_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_LL_THRESHOLD", cvarToString(NCCL_P2P_LL_THRESHOLD_get()), cvarToString(NCCL_P2P_LL_THRESHOLD_DEFAULT));
+  }
+  if (NCCL_P2P_NET_CHUNKSIZE_get() != NCCL_P2P_NET_CHUNKSIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_NET_CHUNKSIZE", cvarToString(NCCL_P2P_NET_CHUNKSIZE_get()), cvarToString(NCCL_P2P_NET_CHUNKSIZE_DEFAULT));
+  }
+  if (NCCL_P2P_NVL_CHUNKSIZE_get() != NCCL_P2P_NVL_CHUNKSIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_NVL_CHUNKSIZE", cvarToString(NCCL_P2P_NVL_CHUNKSIZE_get()), cvarToString(NCCL_P2P_NVL_CHUNKSIZE_DEFAULT));
+  }
+  if (NCCL_P2P_PCI_CHUNKSIZE_get() != NCCL_P2P_PCI_CHUNKSIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_PCI_CHUNKSIZE", cvarToString(NCCL_P2P_PCI_CHUNKSIZE_get()), cvarToString(NCCL_P2P_PCI_CHUNKSIZE_DEFAULT));
+  }
+  if (NCCL_P2P_PXN_LEVEL_get() != NCCL_P2P_PXN_LEVEL_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_PXN_LEVEL", cvarToString(NCCL_P2P_PXN_LEVEL_get()), cvarToString(NCCL_P2P_PXN_LEVEL_DEFAULT));
+  }
+  if (NCCL_P2P_READ_ENABLE_get() != NCCL_P2P_READ_ENABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_READ_ENABLE", cvarToString(NCCL_P2P_READ_ENABLE_get()), cvarToString(NCCL_P2P_READ_ENABLE_DEFAULT));
+  }
+  if (NCCL_P2P_USE_CUDA_MEMCPY_get() != NCCL_P2P_USE_CUDA_MEMCPY_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_P2P_USE_CUDA_MEMCPY", cvarToString(NCCL_P2P_USE_CUDA_MEMCPY_get()), cvarToString(NCCL_P2P_USE_CUDA_MEMCPY_DEFAULT));
+  }
+  if (NCCL_PROGRESS_APPENDOP_FREQ_get() != NCCL_PROGRESS_APPENDOP_FREQ_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_PROGRESS_APPENDOP_FREQ", cvarToString(NCCL_PROGRESS_APPENDOP_FREQ_get()), cvarToString(NCCL_PROGRESS_APPENDOP_FREQ_DEFAULT));
+  }
+  if (NCCL_PROTO_get() != NCCL_PROTO_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_PROTO", cvarToString(NCCL_PROTO_get()), cvarToString(NCCL_PROTO_DEFAULT));
+  }
+  if (NCCL_PROXY_APPEND_BATCH_SIZE_get() != NCCL_PROXY_APPEND_BATCH_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_PROXY_APPEND_BATCH_SIZE", cvarToString(NCCL_PROXY_APPEND_BATCH_SIZE_get()), cvarToString(NCCL_PROXY_APPEND_BATCH_SIZE_DEFAULT));
+  }
+  if (NCCL_PROXY_DUMP_SIGNAL_get() != NCCL_PROXY_DUMP_SIGNAL_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_PROXY_DUMP_SIGNAL", cvarToString(NCCL_PROXY_DUMP_SIGNAL_get()), cvarToString(NCCL_PROXY_DUMP_SIGNAL_DEFAULT));
+  }
+  if (NCCL_PROXY_PROFILE_get() != NCCL_PROXY_PROFILE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_PROXY_PROFILE", cvarToString(NCCL_PROXY_PROFILE_get()), cvarToString(NCCL_PROXY_PROFILE_DEFAULT));
+  }
+  if (NCCL_PROXY_PROFILE_DIR_get() != NCCL_PROXY_PROFILE_DIR_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_PROXY_PROFILE_DIR", cvarToString(NCCL_PROXY_PROFILE_DIR_get()), cvarToString(NCCL_PROXY_PROFILE_DIR_DEFAULT));
+  }
+  if (NCCL_PXN_DISABLE_get() != NCCL_PXN_DISABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_PXN_DISABLE", cvarToString(NCCL_PXN_DISABLE_get()), cvarToString(NCCL_PXN_DISABLE_DEFAULT));
+  }
+  if (NCCL_SENDRECV_ALGO_get() != NCCL_SENDRECV_ALGO_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SENDRECV_ALGO", cvarToString(NCCL_SENDRECV_ALGO_get(), NCCL_SENDRECV_ALGO_choices), cvarToString(NCCL_SENDRECV_ALGO_DEFAULT, NCCL_SENDRECV_ALGO_choices));
+  }
+  if (NCCL_SET_STACK_SIZE_get() != NCCL_SET_STACK_SIZE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SET_STACK_SIZE", cvarToString(NCCL_SET_STACK_SIZE_get()), cvarToString(NCCL_SET_STACK_SIZE_DEFAULT));
+  }
+  if (NCCL_SET_THREAD_NAME_get() != NCCL_SET_THREAD_NAME_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SET_THREAD_NAME", cvarToString(NCCL_SET_THREAD_NAME_get()), cvarToString(NCCL_SET_THREAD_NAME_DEFAULT));
+  }
+  if (NCCL_SHM_DISABLE_get() != NCCL_SHM_DISABLE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SHM_DISABLE", cvarToString(NCCL_SHM_DISABLE_get()), cvarToString(NCCL_SHM_DISABLE_DEFAULT));
+  }
+  if (NCCL_SHM_LOCALITY_get() != NCCL_SHM_LOCALITY_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SHM_LOCALITY", cvarToString(NCCL_SHM_LOCALITY_get()), cvarToString(NCCL_SHM_LOCALITY_DEFAULT));
+  }
+  if (NCCL_SHM_MEMCPY_MODE_get() != NCCL_SHM_MEMCPY_MODE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SHM_MEMCPY_MODE", cvarToString(NCCL_SHM_MEMCPY_MODE_get()), cvarToString(NCCL_SHM_MEMCPY_MODE_DEFAULT));
+  }
+  if (NCCL_SHM_USE_CUDA_MEMCPY_get() != NCCL_SHM_USE_CUDA_MEMCPY_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SHM_USE_CUDA_MEMCPY", cvarToString(NCCL_SHM_USE_CUDA_MEMCPY_get()), cvarToString(NCCL_SHM_USE_CUDA_MEMCPY_DEFAULT));
+  }
+  if (NCCL_SOCKET_FAMILY_get() != NCCL_SOCKET_FAMILY_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SOCKET_FAMILY", cvarToString(NCCL_SOCKET_FAMILY_get()), cvarToString(NCCL_SOCKET_FAMILY_DEFAULT));
+  }
+  if (NCCL_SOCKET_IFNAME_get() != NCCL_SOCKET_IFNAME_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SOCKET_IFNAME", cvarToString(NCCL_SOCKET_IFNAME_get()), cvarToString(NCCL_SOCKET_IFNAME_DEFAULT));
+  }
+  if (NCCL_SOCKET_NTHREADS_get() != NCCL_SOCKET_NTHREADS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_SOCKET_NTHREADS", cvarToString(NCCL_SOCKET_NTHREADS_get()), cvarToString(NCCL_SOCKET_NTHREADS_DEFAULT));
+  }
+  if (NCCL_THREAD_THRESHOLDS_get() != NCCL_THREAD_THRESHOLDS_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_THREAD_THRESHOLDS", cvarToString(NCCL_THREAD_THRESHOLDS_get()), cvarToString(NCCL_THREAD_THRESHOLDS_DEFAULT));
+  }
+  if (NCCL_TOPO_DUMP_FILE_get() != NCCL_TOPO_DUMP_FILE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_TOPO_DUMP_FILE", cvarToString(NCCL_TOPO_DUMP_FILE_get()), cvarToString(NCCL_TOPO_DUMP_FILE_DEFAULT));
+  }
+  if (NCCL_TOPO_DUMP_FILE_RANK_get() != NCCL_TOPO_DUMP_FILE_RANK_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_TOPO_DUMP_FILE_RANK", cvarToString(NCCL_TOPO_DUMP_FILE_RANK_get()), cvarToString(NCCL_TOPO_DUMP_FILE_RANK_DEFAULT));
+  }
+  if (NCCL_TOPO_FILE_get() != NCCL_TOPO_FILE_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_TOPO_FILE", cvarToString(NCCL_TOPO_FILE_get()), cvarToString(NCCL_TOPO_FILE_DEFAULT));
+  }
+  if (NCCL_TUNER_PLUGIN_get() != NCCL_TUNER_PLUGIN_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_TUNER_PLUGIN", cvarToString(NCCL_TUNER_PLUGIN_get()), cvarToString(NCCL_TUNER_PLUGIN_DEFAULT));
+  }
+  if (NCCL_WORK_FIFO_DEPTH_get() != NCCL_WORK_FIFO_DEPTH_DEFAULT) {
+    cvarSnapshotAdd(snapshot, "NCCL_WORK_FIFO_DEPTH", cvarToString(NCCL_WORK_FIFO_DEPTH_get()), cvarToString(NCCL_WORK_FIFO_DEPTH_DEFAULT));
+  }
+  return snapshot.empty() ? "{}" : snapshot + "}";
+}
+
+static constexpr uint32_t cvarEnvHashMask = 511;
+static const uint32_t cvarEnvHashSeeds[512] = {
+  0, 1, 0, 0, 0, 0, 0, 1,
+  1, 1, 0, 0, 1, 1, 0, 0,
+  0, 0, 0, 0, 0, 1, 0, 0,
+  1, 1, 1, 0, 0, 0, 1, 0,
+  0, 0, 1, 1, 0, 0, 1, 1,
+  0, 0, 0, 0, 0, 0, 1, 0,
+  1, 1, 1, 0, 0, 2, 0, 1,
+  0, 1, 0, 0, 0, 1, 1, 0,
+  1, 0, 0, 0, 0, 0, 0, 1,
+  0, 0, 1, 0, 0, 0, 1, 1,
+  0, 0, 0, 0, 1, 1, 0, 0,
+  0, 1, 0, 0, 1, 0, 1, 1,
+  0, 1, 0, 2, 0, 1, 0, 0,
+  0, 1, 0, 0, 0, 0, 0, 1,
+  0, 0, 0, 0, 0, 1, 1, 0,
+  2, 2, 0, 0, 1, 0, 0, 0,
+  1, 1, 0, 0, 1, 0, 1, 0,
+  0, 1, 0, 0, 1, 0, 0, 0,
+  0, 1, 0, 0, 1, 1, 0, 1,
+  2, 1, 0, 0, 1, 0, 1, 1,
+  0, 0, 1, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 1, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 1, 0, 1, 1, 1,
+  0, 0, 0, 0, 1, 1, 0, 0,
+  0, 0, 0, 1, 0, 1, 0, 0,
+  0, 0, 0, 0, 0, 1, 0, 1,
+  1, 0, 0, 1, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 2,
+  0, 1, 0, 0, 0, 0, 1, 0,
+  0, 0, 0, 0, 0, 1, 2, 0,
+  1, 0, 0, 0, 0, 1, 0, 0,
+  0, 0, 1, 0, 0, 0, 0, 1,
+  0, 0, 0, 0, 0, 1, 1, 0,
+  1, 0, 0, 1, 1, 0, 1, 0,
+  0, 0, 1, 1, 0, 0, 0, 1,
+  3, 0, 0, 0, 0, 0, 0, 1,
+  0, 0, 0, 0, 1, 0, 0, 0,
+  0, 0, 2, 0, 1, 0, 1, 0,
+  0, 0, 0, 2, 0, 0, 0, 4,
+  0, 0, 1, 0, 1, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 2, 0,
+  1, 1, 0, 0, 0, 0, 0, 2,
+  0, 0, 0, 0, 1, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 1, 0, 0, 0, 0, 0,
+  1, 0, 0, 0, 0, 1, 1, 0,
+  0, 0, 0, 1, 0, 0, 2, 0,
+  0, 0, 0, 0, 0, 0, 0, 1,
+  1, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 1, 0, 0, 0,
+  2, 0, 0, 0, 0, 1, 0, 0,
+  1, 1, 0, 0, 0, 0, 0, 0,
+  1, 0, 0, 0, 0, 1, 0, 0,
+  0, 0, 0, 0, 1, 1, 0, 2,
+  0, 0, 0, 0, 0, 1, 0, 0,
+  0, 0, 0, 0, 0, 0, 2, 0,
+  0, 0, 0, 1, 2, 0, 0, 0,
+  0, 0, 0, 0, 1, 0, 1, 2,
+  0, 0, 0, 0, 0, 2, 0, 1,
+  0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 1, 0, 0,
+  0, 0, 0, 1, 1, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0,
+};
+static const int16_t cvarEnvHashSlots[512] = {
+  -1, -1, -1, -1, 123, -1, 21, -1,
+  -1, -1, 133, -1, 151, -1, 147, -1,
+  -1, -1, 86, -1, -1, 99, -1, -1,
+  -1, 53, -1, 34, -1, -1, -1, -1,
+  -1, -1, 71, -1, -1, -1, -1, -1,
+  -1, -1, -1, -1, -1, -1, -1, -1,
+  12, -1, 59, -1, 47, 100, -1, -1,
+  -1, -1, 62, 16, -1, -1, -1, -1,
+  15, -1, -1, -1, -1, -1, -1, 107,
+  -1, 75, 102, -1, -1, -1, -1, -1,
+  -1, -1, -1, -1, -1, 40, 43, -1,
+  -1, -1, -1, -1, -1, -1, -1, -1,
+  106, -1, -1, -1, -1, -1, 105, -1,
+  -1, 132, -1, 143, -1, 150, -1, -1,
+  -1, 6, 112, -1, -1, -1, -1, -1,
+  -1, 88, 116, 148, -1, -1, -1, -1,
+  -1, 119, -1, -1, -1, -1, 22, -1,
+  -1, -1, -1, -1, -1, -1, -1, -1,
+  -1, 146, 1, -1, 97, -1, 13, -1,
+  -1, -1, -1, 76, 90, -1, -1, -1,
+  -1, -1, -1, -1, -1, -1, 84, 130,
+  79, 103, -1, -1, 89, -1, -1, -1,
+  54, 127, 74, -1, -1, -1, -1, 3,
+  -1, 70, -1, -1, -1, -1, -1, -1,
+  -1, 73, -1, 80, -1, -1, -1, -1,
+  -1, -1, -1, -1, 41, -1, 125, -1,
+  -1, 110, -1, -1, 9, -1, -1, -1,
+  -1, -1, -1, -1, -1, -1, -1, -1,
+  -1, 135, -1, -1, 113, -1, 52, -1,
+  17, -1, -1, -1, 129, 11, -1, 138,
+  -1, 30, -1, -1, -1, 38, -1, 32,
+  -1, -1, -1, -1, -1, 111, -1, 152,
+  33, 28, 114, -1, -1, 126, 2, -1,
+  72, -1, 140, 87, 20, 153, -1, -1,
+  -1, 108, 10, -1, -1, 63, -1, 7,
+  -1, -1, 66, -1, 57, -1, -1, -1,
+  -1, -1, -1, -1, 69, -1, -1, -1,
+  -1, -1, 60, -1, 51, -1, 37, 98,
+  -1, 8, -1, 4, 46, 96, 35, -1,
+  -1, -1, 68, -1, -1, 145, -1, 91,
+  139, 58, -1, 101, -1, 92, -1, -1,
+  -1, -1, 137, 0, -1, 95, -1, -1,
+  -1, -1, -1, -1, 45, -1, -1, -1,
+  -1, 67, -1, -1, 39, -1, 117, -1,
+  -1, -1, -1, -1, -1, 128, 14, 31,
+  26, -1, -1, 131, -1, -1, -1, 44,
+  -1, -1, -1, -1, 81, -1, -1, 19,
+  -1, 109, -1, 83, 24, -1, -1, -1,
+  -1, -1, 141, 118, -1, -1, -1, -1,
+  5, -1, -1, -1, 144, -1, 115, -1,
+  -1, -1, -1, -1, -1, -1, -1, -1,
+  64, -1, 50, 55, -1, 42, -1, 134,
+  -1, -1, 93, 104, -1, -1, -1, -1,
+  -1, -1, -1, -1, -1, 94, -1, -1,
+  -1, -1, 136, -1, -1, -1, -1, 142,
+  48, -1, -1, -1, -1, -1, 25, -1,
+  -1, -1, -1, 36, -1, -1, 65, -1,
+  82, 120, -1, -1, -1, -1, 77, -1,
+  -1, -1, 27, -1, -1, -1, -1, -1,
+  29, -1, -1, -1, -1, -1, -1, -1,
+  -1, -1, 85, -1, -1, -1, -1, -1,
+  49, -1, 149, 78, 121, -1, 56, -1,
+  -1, 61, 23, -1, -1, -1, 124, 18,
+  -1, -1, -1, -1, -1, -1, 122, -1,
+};
+
+// Automatically generated by ./maint/extractcvars.py --- END
+
+// FNV-1a, with the initial basis perturbed by seed
+static inline uint32_t cvarEnvHash(const char* s, size_t len, uint32_t seed) {
+  uint32_t h = 0x811c9dc5u ^ seed;
+  for (size_t i = 0; i < len; i++) {
+    h ^= static_cast<unsigned char>(s[i]);
+    h *= 0x01000193u;
+  }
+  return h;
+}
+
+// Look up an environment variable name (not NUL-terminated) in the
+// generated perfect hash table; returns its index or -1 if unknown.
+static int cvarEnvLookup(const char* name, size_t len) {
+  uint32_t seed = cvarEnvHashSeeds[cvarEnvHash(name, len, 0) & cvarEnvHashMask];
+  int idx = cvarEnvHashSlots[cvarEnvHash(name, len, seed) & cvarEnvHashMask];
+  if (idx < 0 || cvarEnvTable[idx].len != len ||
+      memcmp(cvarEnvTable[idx].name, name, len)) {
+    return -1;
+  }
+  return idx;
+}
+
+// Threading contract:
+// - The globals (e.g. NCCL_PROXY_PROFILE) hold the value of every cvar, and
+//   the <name>_get() accessors return references to them.
+// - ncclCvarInit() and ncclCvarReload() write the globals under
+//   cvarLoadMutex. They must not run concurrently with code reading the
+//   cvars they update, so call them before the threads using NCCL start or
+//   between communicator creations.
+// - Each cvar has a once-initialized cvarLoaded flag. The first call of an
+//   accessor of an unloaded cvar (under lazy init, or before ncclCvarInit())
+//   parses it into its global under cvarLoadMutex and then sets the flag;
+//   later calls only check the flag.
+static std::mutex cvarLoadMutex;
+static std::atomic<bool> cvarLoaded[numCvarEnvs];
+
+static void cvarParseEnv(int idx) {
+  const CvarEnvEntry& e = cvarEnvTable[idx];
+  if (e.reset) {
+    e.reset();
+  }
+  const char* val = getenv(e.name);
+  if (val && e.parse) {
+    e.parse(val);
+  }
+  cvarLoaded[idx].store(true, std::memory_order_release);
+}
+
+static inline void cvarEnsureLoaded(int idx) {
+  if (cvarLoaded[idx].load(std::memory_order_acquire)) {
+    return;
+  }
+  std::lock_guard<std::mutex> lock(cvarLoadMutex);
+  if (!cvarLoaded[idx].load(std::memory_order_relaxed)) {
+    cvarParseEnv(idx);
+  }
+}
+
+extern char **environ;
+void ncclCvarInit() {
+  std::lock_guard<std::mutex> lock(cvarLoadMutex);
+  initCvarLogger();
+
+  // Start from the defaults, then parse every cvar env var that is set in a
+  // single walk over environ. With lazy init, only check the names and leave
+  // parsing to the accessors.
+  for (int i = 0; i < numCvarEnvs; i++) {
+    if (cvarEnvTable[i].reset) {
+      cvarEnvTable[i].reset();
+    }
+  }
+
+  bool seen[numCvarEnvs] = {};
+  for (char **s = environ; *s; s++) {
+    const char* entry = *s;
+    const char* eq = strchr(entry, '=');
+    size_t len = eq ? eq - entry : strlen(entry);
+    int idx = cvarEnvLookup(entry, len);
+    if (idx < 0) {
+      // Check if any NCCL_ env var is not in allow list
+      if (!strncmp(entry, "NCCL_", strlen("NCCL_"))) {
+        CVAR_WARN("Unknown env %.*s in the NCCL namespace", (int)len, entry);
+      }
+      continue;
+    }
+    // Like getenv(), only the first definition of a variable counts
+    if (cvarLazyInit || seen[idx]) {
+      continue;
+    }
+    seen[idx] = true;
+    if (cvarEnvTable[idx].parse) {
+      cvarEnvTable[idx].parse(eq ? eq + 1 : "");
+    }
+  }
+
+  for (int i = 0; i < numCvarEnvs; i++) {
+    cvarLoaded[i].store(!cvarLazyInit, std::memory_order_release);
+  }
+}
+
+void ncclCvarReload(const std::vector<std::string>& names) {
+  std::lock_guard<std::mutex> lock(cvarLoadMutex);
+  for (const auto& name : names) {
+    int idx = cvarEnvLookup(name.c_str(), name.size());
+    if (idx < 0) {
+      CVAR_WARN("Unknown env %s in the NCCL namespace", name.c_str());
+      continue;
+    }
+    cvarParseEnv(idx);
+  }
+}
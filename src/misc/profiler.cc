@@ -20,6 +20,13 @@
    description : |-
      Hidden variable. No description provided.
 
+ - name        : NCCL_PROXY_PROFILE_DIR
+   type        : string
+   default     : "/tmp"
+   description : |-
+     Directory for NCCL proxy profiling to dump.
+     Can be either local or FB internal remote URL.
+
 === END_NCCL_CVAR_INFO_BLOCK ===
 */
 
@@ -73,8 +80,8 @@ void ncclProfilingDump() {
   static int dumpDone = 0;
   if (dumpDone) return;
   dumpDone = 1;
-  if (NCCL_PROXY_PROFILE.empty()) { free(profilingEvents); return; }
-  FILE* f = fopen(NCCL_PROXY_PROFILE.c_str(), "w");
+  if (NCCL_PROXY_PROFILE_get().empty()) { free(profilingEvents); return; }
+  FILE* f = fopen(NCCL_PROXY_PROFILE_get().c_str(), "w");
   fprintf(f, "[\n");
 
   for (int i=0; i<profilingIndex; i++) {
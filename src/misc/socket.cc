@@ -114,14 +114,14 @@ static uint16_t socketToPort(union ncclSocketAddress *addr) {
 /* Allow the user to force the IPv4/IPv6 interface selection */
 static int envSocketFamily(void) {
   int family = -1; // Family selection is not forced, will use first one found
-  if (NCCL_SOCKET_FAMILY.empty())
+  if (NCCL_SOCKET_FAMILY_get().empty())
     return family;
 
-  INFO(NCCL_ENV, "NCCL_SOCKET_FAMILY set by environment to %s", NCCL_SOCKET_FAMILY.c_str());
+  INFO(NCCL_ENV, "NCCL_SOCKET_FAMILY set by environment to %s", NCCL_SOCKET_FAMILY_get().c_str());
 
-  if (NCCL_SOCKET_FAMILY == "AF_INET")
+  if (NCCL_SOCKET_FAMILY_get() == "AF_INET")
     family = AF_INET;  // IPv4
-  else if (NCCL_SOCKET_FAMILY == "AF_INET6")
+  else if (NCCL_SOCKET_FAMILY_get() == "AF_INET6")
     family = AF_INET6; // IPv6
   return family;
 }
@@ -354,22 +354,22 @@ int ncclFindInterfaces(char* ifNames, union ncclSocketAddress *ifAddrs, int ifNa
   // Allow user to force the INET socket family selection
   int sock_family = envSocketFamily();
   // User specified interface
-  if (NCCL_SOCKET_IFNAME.length() > 1) {
-    INFO(NCCL_ENV, "NCCL_SOCKET_IFNAME set by environment to %s", NCCL_SOCKET_IFNAME.c_str());
+  if (NCCL_SOCKET_IFNAME_get().length() > 1) {
+    INFO(NCCL_ENV, "NCCL_SOCKET_IFNAME set by environment to %s", NCCL_SOCKET_IFNAME_get().c_str());
     // Specified by user : find or fail
-    if (shownIfName++ == 0) INFO(NCCL_NET, "NCCL_SOCKET_IFNAME set to %s", NCCL_SOCKET_IFNAME.c_str());
-    nIfs = findInterfaces(NCCL_SOCKET_IFNAME.c_str(), ifNames, ifAddrs, sock_family, ifNameMaxSize, maxIfs);
+    if (shownIfName++ == 0) INFO(NCCL_NET, "NCCL_SOCKET_IFNAME set to %s", NCCL_SOCKET_IFNAME_get().c_str());
+    nIfs = findInterfaces(NCCL_SOCKET_IFNAME_get().c_str(), ifNames, ifAddrs, sock_family, ifNameMaxSize, maxIfs);
   } else {
     // Try to automatically pick the right one
     // Start with IB
     nIfs = findInterfaces("ib", ifNames, ifAddrs, sock_family, ifNameMaxSize, maxIfs);
     // else see if we can get some hint from COMM ID
     if (nIfs == 0) {
-      if (NCCL_COMM_ID.length() > 1) {
-	INFO(NCCL_ENV, "NCCL_COMM_ID set by environment to %s", NCCL_COMM_ID.c_str());
+      if (NCCL_COMM_ID_get().length() > 1) {
+	INFO(NCCL_ENV, "NCCL_COMM_ID set by environment to %s", NCCL_COMM_ID_get().c_str());
 	// Try to find interface that is in the same subnet as the IP in comm id
         union ncclSocketAddress idAddr;
-        ncclSocketGetAddrFromString(&idAddr, NCCL_COMM_ID.c_str());
+        ncclSocketGetAddrFromString(&idAddr, NCCL_COMM_ID_get().c_str());
         nIfs = ncclFindInterfaceMatchSubnet(ifNames, ifAddrs, &idAddr, ifNameMaxSize, maxIfs);
       }
     }
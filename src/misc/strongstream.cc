@@ -160,7 +160,7 @@ ncclResult_t ncclStrongStreamAcquire(
     struct ncclCudaGraph graph, struct ncclStrongStream* ss
   ) {
   #if CUDART_VERSION >= 11030
-    bool mixing = NCCL_GRAPH_MIXING_SUPPORT;
+    bool mixing = NCCL_GRAPH_MIXING_SUPPORT_get();
     if (graph.graph == nullptr) {
       if (mixing && ss->everCaptured) {
         CUDACHECK(cudaStreamWaitEvent(ss->cudaStream, ss->serialEvent, 0));
@@ -222,7 +222,7 @@ ncclResult_t ncclStrongStreamAcquire(
 
 ncclResult_t ncclStrongStreamAcquireUncaptured(struct ncclStrongStream* ss) {
   #if CUDART_VERSION >= 11030
-    bool mixing = NCCL_GRAPH_MIXING_SUPPORT;
+    bool mixing = NCCL_GRAPH_MIXING_SUPPORT_get();
     if (mixing && ss->everCaptured) {
       CUDACHECK(cudaStreamWaitEvent(ss->cudaStream, ss->serialEvent, 0));
     }
@@ -241,7 +241,7 @@ static ncclResult_t checkGraphId(struct ncclStrongStreamGraph* g, unsigned long
 
 ncclResult_t ncclStrongStreamRelease(struct ncclCudaGraph graph, struct ncclStrongStream* ss) {
   #if CUDART_VERSION >= 11030
-    bool mixing = NCCL_GRAPH_MIXING_SUPPORT;
+    bool mixing = NCCL_GRAPH_MIXING_SUPPORT_get();
     if (mixing && ss->serialEventNeedsRecord) {
       if (graph.graph == nullptr) {
         if (ss->everCaptured) {
@@ -103,9 +103,9 @@ uint64_t getHostHash(void) {
   (void) getHostName(hostHash, sizeof(hostHash), '\0');
   int offset = strlen(hostHash);
 
-  if (!NCCL_HOSTID.empty()) {
-    INFO(NCCL_ENV, "NCCL_HOSTID set by environment to %s", NCCL_HOSTID.c_str());
-    strncpy(hostHash, NCCL_HOSTID.c_str(), sizeof(hostHash));
+  if (!NCCL_HOSTID_get().empty()) {
+    INFO(NCCL_ENV, "NCCL_HOSTID set by environment to %s", NCCL_HOSTID_get().c_str());
+    strncpy(hostHash, NCCL_HOSTID_get().c_str(), sizeof(hostHash));
   } else {
     FILE *file = fopen(HOSTID_FILE, "r");
     if (file != NULL) {
@@ -186,8 +186,8 @@ enum ncclNetState ncclCollNetStates[3] = { ncclNetStateInit, ncclNetStateInit, n
 
 ncclResult_t ncclNetPluginInit() {
   char ncclNetPluginName[128];
-  if (NCCL_NET_PLUGIN.length()) {
-    snprintf(ncclNetPluginName, 128, "libnccl-net-%s.so", NCCL_NET_PLUGIN.c_str());
+  if (NCCL_NET_PLUGIN_get().length()) {
+    snprintf(ncclNetPluginName, 128, "libnccl-net-%s.so", NCCL_NET_PLUGIN_get().c_str());
     INFO(NCCL_INIT, "Plugin name set by env to %s", ncclNetPluginName);
   } else {
     sprintf(ncclNetPluginName, "%s", NCCL_NET_PLUGIN_DEFAULT.c_str());
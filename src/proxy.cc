@@ -666,8 +666,8 @@ ncclResult_t ncclProxyComputeP2p(struct ncclInfo* info, struct ncclProxyOp* op)
     WARN("P2p operation is neither send or recv");
     return ncclInternalError;
   }
-  if (NCCL_CHUNK_SIZE != 0) {
-    info->chunkSize = NCCL_CHUNK_SIZE;
+  if (NCCL_CHUNK_SIZE_get() != 0) {
+    info->chunkSize = NCCL_CHUNK_SIZE_get();
   }
   op->chunkSize = info->chunkSize;
 
@@ -782,7 +782,7 @@ process_nextops:
     struct ncclProxyOp* peerOp = pool->ops+opIndex;
     int peer = opIndex / MAX_OPS_PER_PEER;
     if ((lastOpCount && peerOp->opCount != lastOpCount) || ((lastPeer != -1) && peer != lastPeer)) count++;
-    if (count == NCCL_PROXY_APPEND_BATCH_SIZE+1) break;
+    if (count == NCCL_PROXY_APPEND_BATCH_SIZE_get()+1) break;
     lastOpCount = peerOp->opCount;
     lastPeer = peer;
     if (peerOp->connection == NULL) return ncclInternalError;
@@ -837,7 +837,7 @@ static int setProxyThreadContext(struct ncclProxyState* proxyState) {
   static int createThreadContext = -1;
 
   if (createThreadContext == -1) {
-    createThreadContext = NCCL_CREATE_THREAD_CONTEXT;
+    createThreadContext = NCCL_CREATE_THREAD_CONTEXT_get();
     if (createThreadContext) {
       if (CUPFN(cuCtxCreate) == nullptr || CUPFN(cuCtxDestroy) == nullptr || CUPFN(cuCtxSetCurrent) == nullptr) {
         WARN("Unable to create thread context due to old driver, disabling.");
@@ -875,7 +875,7 @@ void* ncclProxyProgress(void *proxyState_) {
 
   struct ncclProxyProgressState* state = &proxyState->progressState;
   state->nextOps = -1;
-  const int sig = NCCL_PROXY_DUMP_SIGNAL;
+  const int sig = NCCL_PROXY_DUMP_SIGNAL_get();
   if (sig != -1) signal(sig, ncclDumpProxyState);
   ncclLastProxyState = state;
   char threadName[NCCL_THREAD_NAMELEN];
@@ -899,7 +899,7 @@ void* ncclProxyProgress(void *proxyState_) {
     }
     if (lastIdle == 0 && idle == 1) ncclProfilingRecord(&profArgs, 0, 0, ncclProxyProfileIdle);
     if (lastIdle == 1 && idle == 0) ncclProfilingRecord(&profArgs, 0, 0, ncclProxyProfileActive);
-    if (idle || (++proxyOpAppendCounter == NCCL_PROGRESS_APPENDOP_FREQ)) {
+    if (idle || (++proxyOpAppendCounter == NCCL_PROGRESS_APPENDOP_FREQ_get())) {
       int added = 0;
       proxyOpAppendCounter = 0;
       TIME_START(3);
@@ -1,12 +1,12 @@
 // (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
 
-#include <gmock/gmock.h>
-#include <gtest/gtest.h>
 #include <nccl.h>
 #include <stdlib.h>
-#include <set>
+#include <functional>
+#include <string>
+#include <thread>
 #include <vector>
-#include "../include/nccl_cvars.h"
+#include "CvarUT.h"
 
 class NCCLEnvironment : public ::testing::Environment {
  public:
@@ -25,30 +25,16 @@ class CvarTest : public ::testing::Test {
 /**
 * Utility functions
 */
-template <typename T>
-void checkListValues(std::vector<T> vals, std::vector<T> cvar) {
-  for (int i = 0; i < vals.size(); i++) {
-    EXPECT_EQ(cvar[i], vals[i]);
-  }
-}
-
-void testDefaultValue(const char* cvarName) {
-  unsetenv(cvarName);
-  ncclCvarInit();
-}
-
-template <typename T>
-void testNumValue(const char* cvarName, T val) {
-  std::ostringstream varOSS;
-  varOSS << val;
-  std::string varStr = varOSS.str();
-  setenv(cvarName, varStr.c_str(), 1);
-  ncclCvarInit();
-}
-
-void testWarn(const char* cvarName, std::string expectedKeyword) {
+// access reads the cvar, so that the check also covers lazily parsed cvars
+void testWarn(
+    const char* cvarName,
+    std::string expectedKeyword,
+    std::function<void()> access = nullptr) {
   testing::internal::CaptureStdout();
   ncclCvarInit();
+  if (access) {
+    access();
+  }
   std::string output = testing::internal::GetCapturedStdout();
   EXPECT_THAT(output, testing::HasSubstr(expectedKeyword));
 
@@ -61,3412 +47,166 @@ TEST_F(CvarTest, UnknownEnv) {
   testWarn("NCCL_DUMMY_ENV", "Unknown env");
 }
 
-/**
-* START of generated tests
-*/
-
-// Automatically generated by ./maint/extractcvars.py
-// DO NOT EDIT!!!
-TEST_F(CvarTest, CUDA_LAUNCH_BLOCKING_value_0) {
-  setenv("CUDA_LAUNCH_BLOCKING", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(CUDA_LAUNCH_BLOCKING, "val1");
-}
-
-TEST_F(CvarTest, CUDA_LAUNCH_BLOCKING_value_1) {
-  setenv("CUDA_LAUNCH_BLOCKING", "  val2_with_space   ", 1);
+TEST_F(CvarTest, ReloadSelected) {
+  setenv("NCCL_PROXY_PROFILE", "profile0", 1);
+  setenv("NCCL_COLLTRACE_DIR", "dir0", 1);
   ncclCvarInit();
-  EXPECT_EQ(CUDA_LAUNCH_BLOCKING, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_AGG_CHANNEL_SIZE_value_0) {
-  testNumValue<int64_t>("NCCL_AGG_CHANNEL_SIZE", 0);
-  EXPECT_EQ(NCCL_AGG_CHANNEL_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_AGG_CHANNEL_SIZE_value_1) {
-  testNumValue<int64_t>("NCCL_AGG_CHANNEL_SIZE", 9999);
-  EXPECT_EQ(NCCL_AGG_CHANNEL_SIZE, 9999);
-}
+  EXPECT_EQ(NCCL_PROXY_PROFILE_get(), "profile0");
+  EXPECT_EQ(NCCL_COLLTRACE_DIR_get(), "dir0");
 
-TEST_F(CvarTest, NCCL_AGG_CHANNEL_SIZE_value_2) {
-  testNumValue<int64_t>("NCCL_AGG_CHANNEL_SIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_AGG_CHANNEL_SIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_AGG_CHANNEL_SIZE_value_3) {
-  testNumValue<int64_t>("NCCL_AGG_CHANNEL_SIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_AGG_CHANNEL_SIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_AGG_CHANNEL_SIZE_default_value) {
-  testDefaultValue("NCCL_AGG_CHANNEL_SIZE");
-  EXPECT_EQ(NCCL_AGG_CHANNEL_SIZE, -2);
-}
-
-TEST_F(CvarTest, NCCL_ALGO_value_0) {
-  setenv("NCCL_ALGO", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALGO, "val1");
-}
+  setenv("NCCL_PROXY_PROFILE", "profile1", 1);
+  setenv("NCCL_COLLTRACE_DIR", "dir1", 1);
+  ncclCvarReload({"NCCL_PROXY_PROFILE"});
+  EXPECT_EQ(NCCL_PROXY_PROFILE_get(), "profile1");
+  EXPECT_EQ(NCCL_COLLTRACE_DIR_get(), "dir0");
 
-TEST_F(CvarTest, NCCL_ALGO_value_1) {
-  setenv("NCCL_ALGO", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALGO, "val2_with_space");
+  unsetenv("NCCL_PROXY_PROFILE");
+  unsetenv("NCCL_COLLTRACE_DIR");
+  ncclCvarReload({"NCCL_PROXY_PROFILE", "NCCL_COLLTRACE_DIR"});
+  EXPECT_EQ(NCCL_PROXY_PROFILE_get(), NCCL_PROXY_PROFILE_DEFAULT);
+  EXPECT_EQ(NCCL_COLLTRACE_DIR_get(), NCCL_COLLTRACE_DIR_DEFAULT);
 }
 
-TEST_F(CvarTest, NCCL_ALLGATHER_ALGO_single_choice_0) {
-  setenv("NCCL_ALLGATHER_ALGO", "orig", 1);
+TEST_F(CvarTest, ReloadUpdatesGlobals) {
+  setenv("NCCL_PROXY_PROFILE", "profile0", 1);
   ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLGATHER_ALGO, NCCL_ALLGATHER_ALGO::orig);
-}
+  EXPECT_EQ(&NCCL_PROXY_PROFILE_get(), &NCCL_PROXY_PROFILE);
 
-TEST_F(CvarTest, NCCL_ALLGATHER_ALGO_single_choice_1) {
-  setenv("NCCL_ALLGATHER_ALGO", "ctdirect", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLGATHER_ALGO, NCCL_ALLGATHER_ALGO::ctdirect);
-}
+  setenv("NCCL_PROXY_PROFILE", "a_much_longer_profile_name_than_before", 1);
+  ncclCvarReload({"NCCL_PROXY_PROFILE"});
+  EXPECT_EQ(NCCL_PROXY_PROFILE, "a_much_longer_profile_name_than_before");
 
-TEST_F(CvarTest, NCCL_ALLGATHER_ALGO_single_choice_2) {
-  setenv("NCCL_ALLGATHER_ALGO", "ctring", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLGATHER_ALGO, NCCL_ALLGATHER_ALGO::ctring);
+  unsetenv("NCCL_PROXY_PROFILE");
+  ncclCvarReload({"NCCL_PROXY_PROFILE"});
+  EXPECT_EQ(NCCL_PROXY_PROFILE, NCCL_PROXY_PROFILE_DEFAULT);
 }
 
-TEST_F(CvarTest, NCCL_ALLGATHER_ALGO_single_choice_3) {
-  setenv("NCCL_ALLGATHER_ALGO", "ctrd", 1);
+TEST_F(CvarTest, ConcurrentFirstGet) {
+  setenv("NCCL_PROXY_PROFILE", "profile0", 1);
   ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLGATHER_ALGO, NCCL_ALLGATHER_ALGO::ctrd);
-}
-
-TEST_F(CvarTest, NCCL_ALLGATHER_ALGO_default_choice) {
-  testDefaultValue("NCCL_ALLGATHER_ALGO");
-  EXPECT_EQ(NCCL_ALLGATHER_ALGO, NCCL_ALLGATHER_ALGO::orig);
-}
-
-TEST_F(CvarTest, NCCL_ALLGATHER_ALGO_warn_unknown_val) {
-  setenv("NCCL_ALLGATHER_ALGO", "dummy", 1);
-  testWarn("NCCL_ALLGATHER_ALGO", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_ALLGATHER_DIRECT_CUTOFF_value_0) {
-  testNumValue<uint64_t>("NCCL_ALLGATHER_DIRECT_CUTOFF", 0);
-  EXPECT_EQ(NCCL_ALLGATHER_DIRECT_CUTOFF, 0);
-}
-
-TEST_F(CvarTest, NCCL_ALLGATHER_DIRECT_CUTOFF_value_1) {
-  testNumValue<uint64_t>("NCCL_ALLGATHER_DIRECT_CUTOFF", 9999);
-  EXPECT_EQ(NCCL_ALLGATHER_DIRECT_CUTOFF, 9999);
-}
-
-TEST_F(CvarTest, NCCL_ALLGATHER_DIRECT_CUTOFF_value_2) {
-  testNumValue<uint64_t>("NCCL_ALLGATHER_DIRECT_CUTOFF", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_ALLGATHER_DIRECT_CUTOFF, std::numeric_limits<uint64_t>::max());
-}
 
-TEST_F(CvarTest, NCCL_ALLGATHER_DIRECT_CUTOFF_value_3) {
-  testNumValue<uint64_t>("NCCL_ALLGATHER_DIRECT_CUTOFF", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_ALLGATHER_DIRECT_CUTOFF, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_ALLGATHER_DIRECT_CUTOFF_default_value) {
-  testDefaultValue("NCCL_ALLGATHER_DIRECT_CUTOFF");
-  EXPECT_EQ(NCCL_ALLGATHER_DIRECT_CUTOFF, 524288);
-}
-
-TEST_F(CvarTest, NCCL_ALLOC_P2P_NET_LL_BUFFERS_value_0) {
-  testNumValue<int64_t>("NCCL_ALLOC_P2P_NET_LL_BUFFERS", 0);
-  EXPECT_EQ(NCCL_ALLOC_P2P_NET_LL_BUFFERS, 0);
-}
-
-TEST_F(CvarTest, NCCL_ALLOC_P2P_NET_LL_BUFFERS_value_1) {
-  testNumValue<int64_t>("NCCL_ALLOC_P2P_NET_LL_BUFFERS", 9999);
-  EXPECT_EQ(NCCL_ALLOC_P2P_NET_LL_BUFFERS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_ALLOC_P2P_NET_LL_BUFFERS_value_2) {
-  testNumValue<int64_t>("NCCL_ALLOC_P2P_NET_LL_BUFFERS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_ALLOC_P2P_NET_LL_BUFFERS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_ALLOC_P2P_NET_LL_BUFFERS_value_3) {
-  testNumValue<int64_t>("NCCL_ALLOC_P2P_NET_LL_BUFFERS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_ALLOC_P2P_NET_LL_BUFFERS, std::numeric_limits<int64_t>::min());
+  // Readers may race on the first access of a cvar under lazy init
+  std::vector<std::thread> readers;
+  for (int i = 0; i < 8; i++) {
+    readers.emplace_back([] {
+      EXPECT_EQ(NCCL_PROXY_PROFILE_get(), "profile0");
+    });
+  }
+  for (auto& reader : readers) {
+    reader.join();
+  }
+  unsetenv("NCCL_PROXY_PROFILE");
 }
 
-TEST_F(CvarTest, NCCL_ALLREDUCE_ALGO_single_choice_0) {
-  setenv("NCCL_ALLREDUCE_ALGO", "orig", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLREDUCE_ALGO, NCCL_ALLREDUCE_ALGO::orig);
+TEST_F(CvarTest, JsonString) {
+  EXPECT_EQ(ncclCvarJsonString("host-1.example"), "\"host-1.example\"");
+  EXPECT_EQ(ncclCvarJsonString("a\"b\\c\n"), "\"a\\\"b\\\\c\\u000a\"");
 }
 
-TEST_F(CvarTest, NCCL_ALLREDUCE_ALGO_single_choice_1) {
+TEST_F(CvarTest, SnapshotNonDefault) {
+  setenv("NCCL_BUFFSIZE", "8388608", 1);
   setenv("NCCL_ALLREDUCE_ALGO", "dda", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLREDUCE_ALGO, NCCL_ALLREDUCE_ALGO::dda);
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_ALGO_default_choice) {
-  testDefaultValue("NCCL_ALLREDUCE_ALGO");
-  EXPECT_EQ(NCCL_ALLREDUCE_ALGO, NCCL_ALLREDUCE_ALGO::orig);
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_ALGO_warn_unknown_val) {
-  setenv("NCCL_ALLREDUCE_ALGO", "dummy", 1);
-  testWarn("NCCL_ALLREDUCE_ALGO", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_value_0) {
-  testNumValue<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", 0);
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS, 0);
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_value_1) {
-  testNumValue<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", 9999);
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_value_2) {
-  testNumValue<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_value_3) {
-  testNumValue<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_default_value) {
-  testDefaultValue("NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS");
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS, -1);
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_value_0) {
-  testNumValue<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", 0);
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_value_1) {
-  testNumValue<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", 9999);
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_value_2) {
-  testNumValue<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_value_3) {
-  testNumValue<int>("NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_default_value) {
-  testDefaultValue("NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE");
-  EXPECT_EQ(NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE, -1);
-}
-
-TEST_F(CvarTest, NCCL_ALLTOALLV_ALGO_single_choice_0) {
-  setenv("NCCL_ALLTOALLV_ALGO", "orig", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLTOALLV_ALGO, NCCL_ALLTOALLV_ALGO::orig);
-}
-
-TEST_F(CvarTest, NCCL_ALLTOALLV_ALGO_single_choice_1) {
-  setenv("NCCL_ALLTOALLV_ALGO", "ctran", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLTOALLV_ALGO, NCCL_ALLTOALLV_ALGO::ctran);
-}
-
-TEST_F(CvarTest, NCCL_ALLTOALLV_ALGO_default_choice) {
-  testDefaultValue("NCCL_ALLTOALLV_ALGO");
-  EXPECT_EQ(NCCL_ALLTOALLV_ALGO, NCCL_ALLTOALLV_ALGO::orig);
-}
-
-TEST_F(CvarTest, NCCL_ALLTOALLV_ALGO_warn_unknown_val) {
-  setenv("NCCL_ALLTOALLV_ALGO", "dummy", 1);
-  testWarn("NCCL_ALLTOALLV_ALGO", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_ALLTOALL_ALGO_single_choice_0) {
-  setenv("NCCL_ALLTOALL_ALGO", "orig", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLTOALL_ALGO, NCCL_ALLTOALL_ALGO::orig);
-}
-
-TEST_F(CvarTest, NCCL_ALLTOALL_ALGO_single_choice_1) {
-  setenv("NCCL_ALLTOALL_ALGO", "ctran", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_ALLTOALL_ALGO, NCCL_ALLTOALL_ALGO::ctran);
-}
-
-TEST_F(CvarTest, NCCL_ALLTOALL_ALGO_default_choice) {
-  testDefaultValue("NCCL_ALLTOALL_ALGO");
-  EXPECT_EQ(NCCL_ALLTOALL_ALGO, NCCL_ALLTOALL_ALGO::orig);
-}
-
-TEST_F(CvarTest, NCCL_ALLTOALL_ALGO_warn_unknown_val) {
-  setenv("NCCL_ALLTOALL_ALGO", "dummy", 1);
-  testWarn("NCCL_ALLTOALL_ALGO", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_BUFFSIZE_value_0) {
-  testNumValue<int64_t>("NCCL_BUFFSIZE", 0);
-  EXPECT_EQ(NCCL_BUFFSIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_BUFFSIZE_value_1) {
-  testNumValue<int64_t>("NCCL_BUFFSIZE", 9999);
-  EXPECT_EQ(NCCL_BUFFSIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_BUFFSIZE_value_2) {
-  testNumValue<int64_t>("NCCL_BUFFSIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_BUFFSIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_BUFFSIZE_value_3) {
-  testNumValue<int64_t>("NCCL_BUFFSIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_BUFFSIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_BUFFSIZE_default_value) {
-  testDefaultValue("NCCL_BUFFSIZE");
-  EXPECT_EQ(NCCL_BUFFSIZE, -2);
-}
-
-TEST_F(CvarTest, NCCL_CGA_CLUSTER_SIZE_value_0) {
-  testNumValue<int64_t>("NCCL_CGA_CLUSTER_SIZE", 0);
-  EXPECT_EQ(NCCL_CGA_CLUSTER_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_CGA_CLUSTER_SIZE_value_1) {
-  testNumValue<int64_t>("NCCL_CGA_CLUSTER_SIZE", 9999);
-  EXPECT_EQ(NCCL_CGA_CLUSTER_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CGA_CLUSTER_SIZE_value_2) {
-  testNumValue<int64_t>("NCCL_CGA_CLUSTER_SIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_CGA_CLUSTER_SIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CGA_CLUSTER_SIZE_value_3) {
-  testNumValue<int64_t>("NCCL_CGA_CLUSTER_SIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_CGA_CLUSTER_SIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CGA_CLUSTER_SIZE_default_value) {
-  testDefaultValue("NCCL_CGA_CLUSTER_SIZE");
-  EXPECT_EQ(NCCL_CGA_CLUSTER_SIZE, -1);
-}
-
-TEST_F(CvarTest, NCCL_CHECK_POINTERS_value_0) {
-  testNumValue<int64_t>("NCCL_CHECK_POINTERS", 0);
-  EXPECT_EQ(NCCL_CHECK_POINTERS, 0);
-}
-
-TEST_F(CvarTest, NCCL_CHECK_POINTERS_value_1) {
-  testNumValue<int64_t>("NCCL_CHECK_POINTERS", 9999);
-  EXPECT_EQ(NCCL_CHECK_POINTERS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CHECK_POINTERS_value_2) {
-  testNumValue<int64_t>("NCCL_CHECK_POINTERS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_CHECK_POINTERS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CHECK_POINTERS_value_3) {
-  testNumValue<int64_t>("NCCL_CHECK_POINTERS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_CHECK_POINTERS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CHUNK_SIZE_value_0) {
-  testNumValue<int64_t>("NCCL_CHUNK_SIZE", 0);
-  EXPECT_EQ(NCCL_CHUNK_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_CHUNK_SIZE_value_1) {
-  testNumValue<int64_t>("NCCL_CHUNK_SIZE", 9999);
-  EXPECT_EQ(NCCL_CHUNK_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CHUNK_SIZE_value_2) {
-  testNumValue<int64_t>("NCCL_CHUNK_SIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_CHUNK_SIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CHUNK_SIZE_value_3) {
-  testNumValue<int64_t>("NCCL_CHUNK_SIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_CHUNK_SIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_COLLNET_ENABLE_value_0) {
-  setenv("NCCL_COLLNET_ENABLE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_COLLNET_ENABLE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_COLLNET_ENABLE_value_1) {
-  setenv("NCCL_COLLNET_ENABLE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_COLLNET_ENABLE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_COLLNET_NODE_THRESHOLD_value_0) {
-  testNumValue<int64_t>("NCCL_COLLNET_NODE_THRESHOLD", 0);
-  EXPECT_EQ(NCCL_COLLNET_NODE_THRESHOLD, 0);
-}
-
-TEST_F(CvarTest, NCCL_COLLNET_NODE_THRESHOLD_value_1) {
-  testNumValue<int64_t>("NCCL_COLLNET_NODE_THRESHOLD", 9999);
-  EXPECT_EQ(NCCL_COLLNET_NODE_THRESHOLD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_COLLNET_NODE_THRESHOLD_value_2) {
-  testNumValue<int64_t>("NCCL_COLLNET_NODE_THRESHOLD", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_COLLNET_NODE_THRESHOLD, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_COLLNET_NODE_THRESHOLD_value_3) {
-  testNumValue<int64_t>("NCCL_COLLNET_NODE_THRESHOLD", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_COLLNET_NODE_THRESHOLD, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_COLLNET_NODE_THRESHOLD_default_value) {
-  testDefaultValue("NCCL_COLLNET_NODE_THRESHOLD");
-  EXPECT_EQ(NCCL_COLLNET_NODE_THRESHOLD, 2);
-}
-
-TEST_F(CvarTest, NCCL_COLLTRACE_DIR_value_0) {
-  setenv("NCCL_COLLTRACE_DIR", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_COLLTRACE_DIR, "val1");
-}
-
-TEST_F(CvarTest, NCCL_COLLTRACE_DIR_value_1) {
-  setenv("NCCL_COLLTRACE_DIR", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_COLLTRACE_DIR, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_COMM_BLOCKING_value_0) {
-  testNumValue<int64_t>("NCCL_COMM_BLOCKING", 0);
-  EXPECT_EQ(NCCL_COMM_BLOCKING, 0);
-}
-
-TEST_F(CvarTest, NCCL_COMM_BLOCKING_value_1) {
-  testNumValue<int64_t>("NCCL_COMM_BLOCKING", 9999);
-  EXPECT_EQ(NCCL_COMM_BLOCKING, 9999);
-}
-
-TEST_F(CvarTest, NCCL_COMM_BLOCKING_value_2) {
-  testNumValue<int64_t>("NCCL_COMM_BLOCKING", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_COMM_BLOCKING, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_COMM_BLOCKING_value_3) {
-  testNumValue<int64_t>("NCCL_COMM_BLOCKING", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_COMM_BLOCKING, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_COMM_BLOCKING_default_value) {
-  testDefaultValue("NCCL_COMM_BLOCKING");
-  EXPECT_EQ(NCCL_COMM_BLOCKING, -1);
-}
-
-TEST_F(CvarTest, NCCL_COMM_ID_value_0) {
-  setenv("NCCL_COMM_ID", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_COMM_ID, "val1");
-}
-
-TEST_F(CvarTest, NCCL_COMM_ID_value_1) {
-  setenv("NCCL_COMM_ID", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_COMM_ID, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_COMM_SPLIT_SHARE_RESOURCES_value_0) {
-  testNumValue<int64_t>("NCCL_COMM_SPLIT_SHARE_RESOURCES", 0);
-  EXPECT_EQ(NCCL_COMM_SPLIT_SHARE_RESOURCES, 0);
-}
-
-TEST_F(CvarTest, NCCL_COMM_SPLIT_SHARE_RESOURCES_value_1) {
-  testNumValue<int64_t>("NCCL_COMM_SPLIT_SHARE_RESOURCES", 9999);
-  EXPECT_EQ(NCCL_COMM_SPLIT_SHARE_RESOURCES, 9999);
-}
-
-TEST_F(CvarTest, NCCL_COMM_SPLIT_SHARE_RESOURCES_value_2) {
-  testNumValue<int64_t>("NCCL_COMM_SPLIT_SHARE_RESOURCES", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_COMM_SPLIT_SHARE_RESOURCES, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_COMM_SPLIT_SHARE_RESOURCES_value_3) {
-  testNumValue<int64_t>("NCCL_COMM_SPLIT_SHARE_RESOURCES", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_COMM_SPLIT_SHARE_RESOURCES, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_COMM_SPLIT_SHARE_RESOURCES_default_value) {
-  testDefaultValue("NCCL_COMM_SPLIT_SHARE_RESOURCES");
-  EXPECT_EQ(NCCL_COMM_SPLIT_SHARE_RESOURCES, -1);
-}
-
-TEST_F(CvarTest, NCCL_CONNECT_ROUND_SIZE_value_0) {
-  testNumValue<int64_t>("NCCL_CONNECT_ROUND_SIZE", 0);
-  EXPECT_EQ(NCCL_CONNECT_ROUND_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_CONNECT_ROUND_SIZE_value_1) {
-  testNumValue<int64_t>("NCCL_CONNECT_ROUND_SIZE", 9999);
-  EXPECT_EQ(NCCL_CONNECT_ROUND_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CONNECT_ROUND_SIZE_value_2) {
-  testNumValue<int64_t>("NCCL_CONNECT_ROUND_SIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_CONNECT_ROUND_SIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CONNECT_ROUND_SIZE_value_3) {
-  testNumValue<int64_t>("NCCL_CONNECT_ROUND_SIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_CONNECT_ROUND_SIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CONNECT_ROUND_SIZE_default_value) {
-  testDefaultValue("NCCL_CONNECT_ROUND_SIZE");
-  EXPECT_EQ(NCCL_CONNECT_ROUND_SIZE, 128);
-}
-
-TEST_F(CvarTest, NCCL_CREATE_THREAD_CONTEXT_value_0) {
-  testNumValue<int64_t>("NCCL_CREATE_THREAD_CONTEXT", 0);
-  EXPECT_EQ(NCCL_CREATE_THREAD_CONTEXT, 0);
-}
-
-TEST_F(CvarTest, NCCL_CREATE_THREAD_CONTEXT_value_1) {
-  testNumValue<int64_t>("NCCL_CREATE_THREAD_CONTEXT", 9999);
-  EXPECT_EQ(NCCL_CREATE_THREAD_CONTEXT, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CREATE_THREAD_CONTEXT_value_2) {
-  testNumValue<int64_t>("NCCL_CREATE_THREAD_CONTEXT", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_CREATE_THREAD_CONTEXT, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CREATE_THREAD_CONTEXT_value_3) {
-  testNumValue<int64_t>("NCCL_CREATE_THREAD_CONTEXT", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_CREATE_THREAD_CONTEXT, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CROSS_NIC_value_0) {
-  testNumValue<int64_t>("NCCL_CROSS_NIC", 0);
-  EXPECT_EQ(NCCL_CROSS_NIC, 0);
-}
-
-TEST_F(CvarTest, NCCL_CROSS_NIC_value_1) {
-  testNumValue<int64_t>("NCCL_CROSS_NIC", 9999);
-  EXPECT_EQ(NCCL_CROSS_NIC, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CROSS_NIC_value_2) {
-  testNumValue<int64_t>("NCCL_CROSS_NIC", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_CROSS_NIC, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CROSS_NIC_value_3) {
-  testNumValue<int64_t>("NCCL_CROSS_NIC", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_CROSS_NIC, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CROSS_NIC_default_value) {
-  testDefaultValue("NCCL_CROSS_NIC");
-  EXPECT_EQ(NCCL_CROSS_NIC, 2);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_value_y0) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "y", 1);
-  ncclCvarInit();
-  EXPECT_TRUE(NCCL_CTRAN_AG_RD_RTR);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_value_y1) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "yes", 1);
-  ncclCvarInit();
-  EXPECT_TRUE(NCCL_CTRAN_AG_RD_RTR);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_value_y2) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "true", 1);
-  ncclCvarInit();
-  EXPECT_TRUE(NCCL_CTRAN_AG_RD_RTR);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_value_y3) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "1", 1);
-  ncclCvarInit();
-  EXPECT_TRUE(NCCL_CTRAN_AG_RD_RTR);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_value_n0) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "n", 1);
-  ncclCvarInit();
-  EXPECT_FALSE(NCCL_CTRAN_AG_RD_RTR);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_value_n1) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "no", 1);
-  ncclCvarInit();
-  EXPECT_FALSE(NCCL_CTRAN_AG_RD_RTR);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_value_n2) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "false", 1);
-  ncclCvarInit();
-  EXPECT_FALSE(NCCL_CTRAN_AG_RD_RTR);
+  setenv("NCCL_IB_HCA", "^mlx5_0,mlx5_1", 1);
+  setenv("NCCL_IB_ADDR_FAMILY", "AF_INET", 1);
+  ncclCvarInit();
+  std::string snapshot = ncclCvarSnapshot();
+  EXPECT_THAT(
+      snapshot,
+      testing::HasSubstr(
+          "\"NCCL_BUFFSIZE\":{\"value\":\"8388608\",\"default\":\"-2\"}"));
+  EXPECT_THAT(
+      snapshot,
+      testing::HasSubstr(
+          "\"NCCL_ALLREDUCE_ALGO\":{\"value\":\"dda\",\"default\":\"orig\"}"));
+  EXPECT_THAT(
+      snapshot,
+      testing::HasSubstr(
+          "\"NCCL_IB_HCA\":{\"value\":\"^mlx5_0,mlx5_1\",\"default\":\"\"}"));
+  // Set to its default
+  EXPECT_THAT(snapshot, testing::Not(testing::HasSubstr("NCCL_IB_ADDR_FAMILY")));
+
+  unsetenv("NCCL_BUFFSIZE");
+  unsetenv("NCCL_ALLREDUCE_ALGO");
+  unsetenv("NCCL_IB_HCA");
+  unsetenv("NCCL_IB_ADDR_FAMILY");
+  ncclCvarInit();
+  EXPECT_THAT(ncclCvarSnapshot(), testing::Not(testing::HasSubstr("NCCL_BUFFSIZE")));
+}
+
+TEST_F(CvarTest, ReloadUnknownEnv) {
+  testing::internal::CaptureStdout();
+  ncclCvarReload({"NCCL_DUMMY_ENV"});
+  std::string output = testing::internal::GetCapturedStdout();
+  EXPECT_THAT(output, testing::HasSubstr("Unknown env"));
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_value_n3) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "0", 1);
+/**
+* Parameterized tests; their cases are generated into CvarUTShard*.cc
+*/
+template <typename T>
+void runCvarCase(const CvarCase<T>& c) {
+  // Restore the env afterwards, as some (e.g., NCCL_DEBUG) are set globally
+  const char* prev = getenv(c.env);
+  std::string prevVal = prev ? prev : "";
+
+  if (c.value) {
+    setenv(c.env, c.value, 1);
+  } else {
+    unsetenv(c.env);
+  }
   ncclCvarInit();
-  EXPECT_FALSE(NCCL_CTRAN_AG_RD_RTR);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_default_value) {
-  testDefaultValue("NCCL_CTRAN_AG_RD_RTR");
-  EXPECT_TRUE(NCCL_CTRAN_AG_RD_RTR);
-}
+  EXPECT_EQ(c.get(), c.expected);
 
-TEST_F(CvarTest, NCCL_CTRAN_AG_RD_RTR_warn_unknown_val) {
-  setenv("NCCL_CTRAN_AG_RD_RTR", "dummy", 1);
-  testWarn("NCCL_CTRAN_AG_RD_RTR", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_value_0) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", 0);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_value_1) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", 9999);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_value_2) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS, std::numeric_limits<int>::max());
+  if (prev) {
+    setenv(c.env, prevVal.c_str(), 1);
+  } else {
+    unsetenv(c.env);
+  }
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_value_3) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS, std::numeric_limits<int>::min());
+TEST_P(CvarBoolTest, Value) {
+  runCvarCase(GetParam());
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_default_value) {
-  testDefaultValue("NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS");
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS, 64);
+TEST_P(CvarIntTest, Value) {
+  runCvarCase(GetParam());
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_value_0) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", 0);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE, 0);
+TEST_P(CvarUintTest, Value) {
+  runCvarCase(GetParam());
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_value_1) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", 9999);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE, 9999);
+TEST_P(CvarFloatTest, Value) {
+  runCvarCase(GetParam());
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_value_2) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE, std::numeric_limits<int>::max());
+TEST_P(CvarStringTest, Value) {
+  runCvarCase(GetParam());
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_value_3) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE, std::numeric_limits<int>::min());
+TEST_P(CvarStringListTest, Value) {
+  runCvarCase(GetParam());
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_default_value) {
-  testDefaultValue("NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE");
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE, 640);
+TEST_P(CvarEnumListTest, Value) {
+  runCvarCase(GetParam());
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_value_0) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", 0);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS, 0);
+TEST_P(CvarWarnTest, Warn) {
+  const CvarWarnCase& c = GetParam();
+  setenv(c.env, c.value, 1);
+  testWarn(c.env, c.keyword, c.access);
 }
 
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_value_1) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", 9999);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_value_2) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_value_3) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_default_value) {
-  testDefaultValue("NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS");
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS, -1);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_value_0) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", 0);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_value_1) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", 9999);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_value_2) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_value_3) {
-  testNumValue<int>("NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_default_value) {
-  testDefaultValue("NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE");
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE, -1);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THRESHOLD_value_0) {
-  testNumValue<uint64_t>("NCCL_CTRAN_ALLTOALL_THRESHOLD", 0);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THRESHOLD, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THRESHOLD_value_1) {
-  testNumValue<uint64_t>("NCCL_CTRAN_ALLTOALL_THRESHOLD", 9999);
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THRESHOLD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THRESHOLD_value_2) {
-  testNumValue<uint64_t>("NCCL_CTRAN_ALLTOALL_THRESHOLD", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THRESHOLD, std::numeric_limits<uint64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THRESHOLD_value_3) {
-  testNumValue<uint64_t>("NCCL_CTRAN_ALLTOALL_THRESHOLD", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THRESHOLD, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_ALLTOALL_THRESHOLD_default_value) {
-  testDefaultValue("NCCL_CTRAN_ALLTOALL_THRESHOLD");
-  EXPECT_EQ(NCCL_CTRAN_ALLTOALL_THRESHOLD, 32768);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_BACKENDS_single_choice_0) {
-  setenv("NCCL_CTRAN_BACKENDS", "ib", 1);
-  ncclCvarInit();
-  std::vector<enum NCCL_CTRAN_BACKENDS> vals{NCCL_CTRAN_BACKENDS::ib};
-  checkListValues<enum NCCL_CTRAN_BACKENDS>(vals, NCCL_CTRAN_BACKENDS);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_BACKENDS_all_choices) {
-  setenv("NCCL_CTRAN_BACKENDS", "ib", 1);
-  ncclCvarInit();
-  std::vector<enum NCCL_CTRAN_BACKENDS> vals{NCCL_CTRAN_BACKENDS::ib};
-  checkListValues<enum NCCL_CTRAN_BACKENDS>(vals, NCCL_CTRAN_BACKENDS);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_BACKENDS_default_choices) {
-  testDefaultValue("NCCL_CTRAN_BACKENDS");
-  std::vector<enum NCCL_CTRAN_BACKENDS> vals{NCCL_CTRAN_BACKENDS::ib};
-  checkListValues<enum NCCL_CTRAN_BACKENDS>(vals, NCCL_CTRAN_BACKENDS);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_BACKENDS_warn_unknown_val) {
-  setenv("NCCL_CTRAN_BACKENDS", "dummy", 1);
-  testWarn("NCCL_CTRAN_BACKENDS", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_BACKENDS_warn_dup_val) {
-  setenv("NCCL_CTRAN_BACKENDS", "dummy,dummy", 1);
-  testWarn("NCCL_CTRAN_BACKENDS", "Duplicate token");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_CTRL_TC_value_0) {
-  testNumValue<uint64_t>("NCCL_CTRAN_IB_CTRL_TC", 0);
-  EXPECT_EQ(NCCL_CTRAN_IB_CTRL_TC, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_CTRL_TC_value_1) {
-  testNumValue<uint64_t>("NCCL_CTRAN_IB_CTRL_TC", 9999);
-  EXPECT_EQ(NCCL_CTRAN_IB_CTRL_TC, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_CTRL_TC_value_2) {
-  testNumValue<uint64_t>("NCCL_CTRAN_IB_CTRL_TC", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_CTRAN_IB_CTRL_TC, std::numeric_limits<uint64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_CTRL_TC_value_3) {
-  testNumValue<uint64_t>("NCCL_CTRAN_IB_CTRL_TC", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_CTRAN_IB_CTRL_TC, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_CTRL_TC_default_value) {
-  testDefaultValue("NCCL_CTRAN_IB_CTRL_TC");
-  EXPECT_EQ(NCCL_CTRAN_IB_CTRL_TC, 192);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_MAX_QPS_value_0) {
-  testNumValue<int>("NCCL_CTRAN_IB_MAX_QPS", 0);
-  EXPECT_EQ(NCCL_CTRAN_IB_MAX_QPS, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_MAX_QPS_value_1) {
-  testNumValue<int>("NCCL_CTRAN_IB_MAX_QPS", 9999);
-  EXPECT_EQ(NCCL_CTRAN_IB_MAX_QPS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_MAX_QPS_value_2) {
-  testNumValue<int>("NCCL_CTRAN_IB_MAX_QPS", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_IB_MAX_QPS, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_MAX_QPS_value_3) {
-  testNumValue<int>("NCCL_CTRAN_IB_MAX_QPS", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_IB_MAX_QPS, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_MAX_QPS_default_value) {
-  testDefaultValue("NCCL_CTRAN_IB_MAX_QPS");
-  EXPECT_EQ(NCCL_CTRAN_IB_MAX_QPS, 1);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_value_0) {
-  testNumValue<uint64_t>("NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", 0);
-  EXPECT_EQ(NCCL_CTRAN_IB_QP_SCALING_THRESHOLD, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_value_1) {
-  testNumValue<uint64_t>("NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", 9999);
-  EXPECT_EQ(NCCL_CTRAN_IB_QP_SCALING_THRESHOLD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_value_2) {
-  testNumValue<uint64_t>("NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_CTRAN_IB_QP_SCALING_THRESHOLD, std::numeric_limits<uint64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_value_3) {
-  testNumValue<uint64_t>("NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_CTRAN_IB_QP_SCALING_THRESHOLD, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_default_value) {
-  testDefaultValue("NCCL_CTRAN_IB_QP_SCALING_THRESHOLD");
-  EXPECT_EQ(NCCL_CTRAN_IB_QP_SCALING_THRESHOLD, 1048576);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_y0) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "y", 1);
-  ncclCvarInit();
-  EXPECT_TRUE(NCCL_CTRAN_IB_TRAFFIC_PROFILNG);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_y1) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "yes", 1);
-  ncclCvarInit();
-  EXPECT_TRUE(NCCL_CTRAN_IB_TRAFFIC_PROFILNG);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_y2) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "true", 1);
-  ncclCvarInit();
-  EXPECT_TRUE(NCCL_CTRAN_IB_TRAFFIC_PROFILNG);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_y3) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "1", 1);
-  ncclCvarInit();
-  EXPECT_TRUE(NCCL_CTRAN_IB_TRAFFIC_PROFILNG);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_n0) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "n", 1);
-  ncclCvarInit();
-  EXPECT_FALSE(NCCL_CTRAN_IB_TRAFFIC_PROFILNG);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_n1) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "no", 1);
-  ncclCvarInit();
-  EXPECT_FALSE(NCCL_CTRAN_IB_TRAFFIC_PROFILNG);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_n2) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "false", 1);
-  ncclCvarInit();
-  EXPECT_FALSE(NCCL_CTRAN_IB_TRAFFIC_PROFILNG);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_n3) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "0", 1);
-  ncclCvarInit();
-  EXPECT_FALSE(NCCL_CTRAN_IB_TRAFFIC_PROFILNG);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_IB_TRAFFIC_PROFILNG_warn_unknown_val) {
-  setenv("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "dummy", 1);
-  testWarn("NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_KINETO_PROFILE_DIR_value_0) {
-  setenv("NCCL_CTRAN_KINETO_PROFILE_DIR", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_KINETO_PROFILE_DIR, "val1");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_KINETO_PROFILE_DIR_value_1) {
-  setenv("NCCL_CTRAN_KINETO_PROFILE_DIR", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_KINETO_PROFILE_DIR, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_KINETO_PROFILE_DIR_default_value) {
-  testDefaultValue("NCCL_CTRAN_KINETO_PROFILE_DIR");
-  EXPECT_EQ(NCCL_CTRAN_KINETO_PROFILE_DIR, "/tmp");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_NUM_KERNEL_P2PELEMS_value_0) {
-  testNumValue<int>("NCCL_CTRAN_NUM_KERNEL_P2PELEMS", 0);
-  EXPECT_EQ(NCCL_CTRAN_NUM_KERNEL_P2PELEMS, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_NUM_KERNEL_P2PELEMS_value_1) {
-  testNumValue<int>("NCCL_CTRAN_NUM_KERNEL_P2PELEMS", 9999);
-  EXPECT_EQ(NCCL_CTRAN_NUM_KERNEL_P2PELEMS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_NUM_KERNEL_P2PELEMS_value_2) {
-  testNumValue<int>("NCCL_CTRAN_NUM_KERNEL_P2PELEMS", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_NUM_KERNEL_P2PELEMS, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_NUM_KERNEL_P2PELEMS_value_3) {
-  testNumValue<int>("NCCL_CTRAN_NUM_KERNEL_P2PELEMS", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_NUM_KERNEL_P2PELEMS, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_NUM_KERNEL_P2PELEMS_default_value) {
-  testDefaultValue("NCCL_CTRAN_NUM_KERNEL_P2PELEMS");
-  EXPECT_EQ(NCCL_CTRAN_NUM_KERNEL_P2PELEMS, 65536);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_single_choice_0) {
-  setenv("NCCL_CTRAN_PROFILING", "none", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_PROFILING, NCCL_CTRAN_PROFILING::none);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_single_choice_1) {
-  setenv("NCCL_CTRAN_PROFILING", "stdout", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_PROFILING, NCCL_CTRAN_PROFILING::stdout);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_single_choice_2) {
-  setenv("NCCL_CTRAN_PROFILING", "info", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_PROFILING, NCCL_CTRAN_PROFILING::info);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_single_choice_3) {
-  setenv("NCCL_CTRAN_PROFILING", "kineto", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_PROFILING, NCCL_CTRAN_PROFILING::kineto);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_default_choice) {
-  testDefaultValue("NCCL_CTRAN_PROFILING");
-  EXPECT_EQ(NCCL_CTRAN_PROFILING, NCCL_CTRAN_PROFILING::none);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_warn_unknown_val) {
-  setenv("NCCL_CTRAN_PROFILING", "dummy", 1);
-  testWarn("NCCL_CTRAN_PROFILING", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_REPORT_COUNT_value_0) {
-  testNumValue<int>("NCCL_CTRAN_PROFILING_REPORT_COUNT", 0);
-  EXPECT_EQ(NCCL_CTRAN_PROFILING_REPORT_COUNT, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_REPORT_COUNT_value_1) {
-  testNumValue<int>("NCCL_CTRAN_PROFILING_REPORT_COUNT", 9999);
-  EXPECT_EQ(NCCL_CTRAN_PROFILING_REPORT_COUNT, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_REPORT_COUNT_value_2) {
-  testNumValue<int>("NCCL_CTRAN_PROFILING_REPORT_COUNT", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_PROFILING_REPORT_COUNT, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_REPORT_COUNT_value_3) {
-  testNumValue<int>("NCCL_CTRAN_PROFILING_REPORT_COUNT", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_PROFILING_REPORT_COUNT, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_PROFILING_REPORT_COUNT_default_value) {
-  testDefaultValue("NCCL_CTRAN_PROFILING_REPORT_COUNT");
-  EXPECT_EQ(NCCL_CTRAN_PROFILING_REPORT_COUNT, 100);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_single_choice_0) {
-  setenv("NCCL_CTRAN_REGISTER", "none", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_REGISTER, NCCL_CTRAN_REGISTER::none);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_single_choice_1) {
-  setenv("NCCL_CTRAN_REGISTER", "lazy", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_REGISTER, NCCL_CTRAN_REGISTER::lazy);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_single_choice_2) {
-  setenv("NCCL_CTRAN_REGISTER", "eager", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_REGISTER, NCCL_CTRAN_REGISTER::eager);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_default_choice) {
-  testDefaultValue("NCCL_CTRAN_REGISTER");
-  EXPECT_EQ(NCCL_CTRAN_REGISTER, NCCL_CTRAN_REGISTER::lazy);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_warn_unknown_val) {
-  setenv("NCCL_CTRAN_REGISTER", "dummy", 1);
-  testWarn("NCCL_CTRAN_REGISTER", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_value_0) {
-  testNumValue<int>("NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", 0);
-  EXPECT_EQ(NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_value_1) {
-  testNumValue<int>("NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", 9999);
-  EXPECT_EQ(NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_value_2) {
-  testNumValue<int>("NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_value_3) {
-  testNumValue<int>("NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_default_value) {
-  testDefaultValue("NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT");
-  EXPECT_EQ(NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT, -1);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_MAX_OUTSTANDING_value_0) {
-  testNumValue<int>("NCCL_CTRAN_RING_MAX_OUTSTANDING", 0);
-  EXPECT_EQ(NCCL_CTRAN_RING_MAX_OUTSTANDING, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_MAX_OUTSTANDING_value_1) {
-  testNumValue<int>("NCCL_CTRAN_RING_MAX_OUTSTANDING", 9999);
-  EXPECT_EQ(NCCL_CTRAN_RING_MAX_OUTSTANDING, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_MAX_OUTSTANDING_value_2) {
-  testNumValue<int>("NCCL_CTRAN_RING_MAX_OUTSTANDING", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_CTRAN_RING_MAX_OUTSTANDING, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_MAX_OUTSTANDING_value_3) {
-  testNumValue<int>("NCCL_CTRAN_RING_MAX_OUTSTANDING", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_CTRAN_RING_MAX_OUTSTANDING, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_MAX_OUTSTANDING_default_value) {
-  testDefaultValue("NCCL_CTRAN_RING_MAX_OUTSTANDING");
-  EXPECT_EQ(NCCL_CTRAN_RING_MAX_OUTSTANDING, 8);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_STEP_value_0) {
-  testNumValue<uint64_t>("NCCL_CTRAN_RING_STEP", 0);
-  EXPECT_EQ(NCCL_CTRAN_RING_STEP, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_STEP_value_1) {
-  testNumValue<uint64_t>("NCCL_CTRAN_RING_STEP", 9999);
-  EXPECT_EQ(NCCL_CTRAN_RING_STEP, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_STEP_value_2) {
-  testNumValue<uint64_t>("NCCL_CTRAN_RING_STEP", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_CTRAN_RING_STEP, std::numeric_limits<uint64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_STEP_value_3) {
-  testNumValue<uint64_t>("NCCL_CTRAN_RING_STEP", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_CTRAN_RING_STEP, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_RING_STEP_default_value) {
-  testDefaultValue("NCCL_CTRAN_RING_STEP");
-  EXPECT_EQ(NCCL_CTRAN_RING_STEP, 4194304);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_SHARED_DEVBUF_SIZE_value_0) {
-  testNumValue<uint64_t>("NCCL_CTRAN_SHARED_DEVBUF_SIZE", 0);
-  EXPECT_EQ(NCCL_CTRAN_SHARED_DEVBUF_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_SHARED_DEVBUF_SIZE_value_1) {
-  testNumValue<uint64_t>("NCCL_CTRAN_SHARED_DEVBUF_SIZE", 9999);
-  EXPECT_EQ(NCCL_CTRAN_SHARED_DEVBUF_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_SHARED_DEVBUF_SIZE_value_2) {
-  testNumValue<uint64_t>("NCCL_CTRAN_SHARED_DEVBUF_SIZE", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_CTRAN_SHARED_DEVBUF_SIZE, std::numeric_limits<uint64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_SHARED_DEVBUF_SIZE_value_3) {
-  testNumValue<uint64_t>("NCCL_CTRAN_SHARED_DEVBUF_SIZE", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_CTRAN_SHARED_DEVBUF_SIZE, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_SHARED_DEVBUF_SIZE_default_value) {
-  testDefaultValue("NCCL_CTRAN_SHARED_DEVBUF_SIZE");
-  EXPECT_EQ(NCCL_CTRAN_SHARED_DEVBUF_SIZE, 8388608);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_TOPO_FILE_value_0) {
-  setenv("NCCL_CTRAN_TOPO_FILE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_TOPO_FILE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_TOPO_FILE_value_1) {
-  setenv("NCCL_CTRAN_TOPO_FILE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CTRAN_TOPO_FILE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_TOPO_FILE_KEYS_valuelist_0) {
-  setenv("NCCL_CTRAN_TOPO_FILE_KEYS", "val1,val2,val3", 1);
-  std::vector<std::string> vals{"val1","val2","val3"};
-  ncclCvarInit();
-  checkListValues<std::string>(vals, NCCL_CTRAN_TOPO_FILE_KEYS);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_TOPO_FILE_KEYS_valuelist_1) {
-  setenv("NCCL_CTRAN_TOPO_FILE_KEYS", "val1:1,val2:2,val3:3", 1);
-  std::vector<std::string> vals{"val1:1","val2:2","val3:3"};
-  ncclCvarInit();
-  checkListValues<std::string>(vals, NCCL_CTRAN_TOPO_FILE_KEYS);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_TOPO_FILE_KEYS_valuelist_2) {
-  setenv("NCCL_CTRAN_TOPO_FILE_KEYS", "val", 1);
-  std::vector<std::string> vals{"val"};
-  ncclCvarInit();
-  checkListValues<std::string>(vals, NCCL_CTRAN_TOPO_FILE_KEYS);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_TOPO_FILE_KEYS_valuelist_3) {
-  setenv("NCCL_CTRAN_TOPO_FILE_KEYS", "val1, val_w_space  ", 1);
-  std::vector<std::string> vals{"val1","val_w_space"};
-  ncclCvarInit();
-  checkListValues<std::string>(vals, NCCL_CTRAN_TOPO_FILE_KEYS);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_TOPO_FILE_KEYS_default_value) {
-  testDefaultValue("NCCL_CTRAN_TOPO_FILE_KEYS");
-  EXPECT_EQ(NCCL_CTRAN_TOPO_FILE_KEYS.size(), 0);
-}
-
-TEST_F(CvarTest, NCCL_CTRAN_TOPO_FILE_KEYS_warn_dup_val) {
-  setenv("NCCL_CTRAN_TOPO_FILE_KEYS", "dummy,dummy", 1);
-  testWarn("NCCL_CTRAN_TOPO_FILE_KEYS", "Duplicate token");
-}
-
-TEST_F(CvarTest, NCCL_CUDA_PATH_value_0) {
-  setenv("NCCL_CUDA_PATH", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CUDA_PATH, "val1");
-}
-
-TEST_F(CvarTest, NCCL_CUDA_PATH_value_1) {
-  setenv("NCCL_CUDA_PATH", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_CUDA_PATH, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_CUMEM_ENABLE_value_0) {
-  testNumValue<int64_t>("NCCL_CUMEM_ENABLE", 0);
-  EXPECT_EQ(NCCL_CUMEM_ENABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_CUMEM_ENABLE_value_1) {
-  testNumValue<int64_t>("NCCL_CUMEM_ENABLE", 9999);
-  EXPECT_EQ(NCCL_CUMEM_ENABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_CUMEM_ENABLE_value_2) {
-  testNumValue<int64_t>("NCCL_CUMEM_ENABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_CUMEM_ENABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_CUMEM_ENABLE_value_3) {
-  testNumValue<int64_t>("NCCL_CUMEM_ENABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_CUMEM_ENABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_DATA_EXPORT_DIR_value_0) {
-  setenv("NCCL_DATA_EXPORT_DIR", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_DATA_EXPORT_DIR, "val1");
-}
-
-TEST_F(CvarTest, NCCL_DATA_EXPORT_DIR_value_1) {
-  setenv("NCCL_DATA_EXPORT_DIR", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_DATA_EXPORT_DIR, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_DATA_EXPORT_DIR_default_value) {
-  testDefaultValue("NCCL_DATA_EXPORT_DIR");
-  EXPECT_EQ(NCCL_DATA_EXPORT_DIR, "/tmp");
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_MAX_BLOCKS_value_0) {
-  testNumValue<int>("NCCL_DDA_ALLREDUCE_MAX_BLOCKS", 0);
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_MAX_BLOCKS, 0);
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_MAX_BLOCKS_value_1) {
-  testNumValue<int>("NCCL_DDA_ALLREDUCE_MAX_BLOCKS", 9999);
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_MAX_BLOCKS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_MAX_BLOCKS_value_2) {
-  testNumValue<int>("NCCL_DDA_ALLREDUCE_MAX_BLOCKS", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_MAX_BLOCKS, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_MAX_BLOCKS_value_3) {
-  testNumValue<int>("NCCL_DDA_ALLREDUCE_MAX_BLOCKS", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_MAX_BLOCKS, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_MAX_BLOCKS_default_value) {
-  testDefaultValue("NCCL_DDA_ALLREDUCE_MAX_BLOCKS");
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_MAX_BLOCKS, 24);
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_value_0) {
-  testNumValue<uint64_t>("NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", 0);
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD, 0);
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_value_1) {
-  testNumValue<uint64_t>("NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", 9999);
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_value_2) {
-  testNumValue<uint64_t>("NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD, std::numeric_limits<uint64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_value_3) {
-  testNumValue<uint64_t>("NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_default_value) {
-  testDefaultValue("NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD");
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD, 1048576);
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_value_0) {
-  testNumValue<uint64_t>("NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", 0);
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_TREE_THRESHOLD, 0);
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_value_1) {
-  testNumValue<uint64_t>("NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", 9999);
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_TREE_THRESHOLD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_value_2) {
-  testNumValue<uint64_t>("NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_TREE_THRESHOLD, std::numeric_limits<uint64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_value_3) {
-  testNumValue<uint64_t>("NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_TREE_THRESHOLD, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_default_value) {
-  testDefaultValue("NCCL_DDA_ALLREDUCE_TREE_THRESHOLD");
-  EXPECT_EQ(NCCL_DDA_ALLREDUCE_TREE_THRESHOLD, 262144);
-}
-
-TEST_F(CvarTest, NCCL_DDA_TMPBUFF_SIZE_value_0) {
-  testNumValue<uint64_t>("NCCL_DDA_TMPBUFF_SIZE", 0);
-  EXPECT_EQ(NCCL_DDA_TMPBUFF_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_DDA_TMPBUFF_SIZE_value_1) {
-  testNumValue<uint64_t>("NCCL_DDA_TMPBUFF_SIZE", 9999);
-  EXPECT_EQ(NCCL_DDA_TMPBUFF_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_DDA_TMPBUFF_SIZE_value_2) {
-  testNumValue<uint64_t>("NCCL_DDA_TMPBUFF_SIZE", std::numeric_limits<uint64_t>::max());
-  EXPECT_EQ(NCCL_DDA_TMPBUFF_SIZE, std::numeric_limits<uint64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_DDA_TMPBUFF_SIZE_value_3) {
-  testNumValue<uint64_t>("NCCL_DDA_TMPBUFF_SIZE", std::numeric_limits<uint64_t>::min());
-  EXPECT_EQ(NCCL_DDA_TMPBUFF_SIZE, std::numeric_limits<uint64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_DDA_TMPBUFF_SIZE_default_value) {
-  testDefaultValue("NCCL_DDA_TMPBUFF_SIZE");
-  EXPECT_EQ(NCCL_DDA_TMPBUFF_SIZE, 33554432);
-}
-
-TEST_F(CvarTest, NCCL_DEBUG_value_0) {
-  setenv("NCCL_DEBUG", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_DEBUG, "val1");
-}
-
-TEST_F(CvarTest, NCCL_DEBUG_value_1) {
-  setenv("NCCL_DEBUG", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_DEBUG, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_DEBUG_FILE_value_0) {
-  setenv("NCCL_DEBUG_FILE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_DEBUG_FILE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_DEBUG_FILE_value_1) {
-  setenv("NCCL_DEBUG_FILE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_DEBUG_FILE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_DEBUG_SUBSYS_value_0) {
-  setenv("NCCL_DEBUG_SUBSYS", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_DEBUG_SUBSYS, "val1");
-}
-
-TEST_F(CvarTest, NCCL_DEBUG_SUBSYS_value_1) {
-  setenv("NCCL_DEBUG_SUBSYS", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_DEBUG_SUBSYS, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_DMABUF_ENABLE_value_0) {
-  testNumValue<int64_t>("NCCL_DMABUF_ENABLE", 0);
-  EXPECT_EQ(NCCL_DMABUF_ENABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_DMABUF_ENABLE_value_1) {
-  testNumValue<int64_t>("NCCL_DMABUF_ENABLE", 9999);
-  EXPECT_EQ(NCCL_DMABUF_ENABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_DMABUF_ENABLE_value_2) {
-  testNumValue<int64_t>("NCCL_DMABUF_ENABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_DMABUF_ENABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_DMABUF_ENABLE_value_3) {
-  testNumValue<int64_t>("NCCL_DMABUF_ENABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_DMABUF_ENABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_DMABUF_ENABLE_default_value) {
-  testDefaultValue("NCCL_DMABUF_ENABLE");
-  EXPECT_EQ(NCCL_DMABUF_ENABLE, 1);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_ENABLE_value_0) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_ENABLE", 0);
-  EXPECT_EQ(NCCL_GDRCOPY_ENABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_ENABLE_value_1) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_ENABLE", 9999);
-  EXPECT_EQ(NCCL_GDRCOPY_ENABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_ENABLE_value_2) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_ENABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_GDRCOPY_ENABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_ENABLE_value_3) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_ENABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_GDRCOPY_ENABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FIFO_ENABLE_value_0) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_FIFO_ENABLE", 0);
-  EXPECT_EQ(NCCL_GDRCOPY_FIFO_ENABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FIFO_ENABLE_value_1) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_FIFO_ENABLE", 9999);
-  EXPECT_EQ(NCCL_GDRCOPY_FIFO_ENABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FIFO_ENABLE_value_2) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_FIFO_ENABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_GDRCOPY_FIFO_ENABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FIFO_ENABLE_value_3) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_FIFO_ENABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_GDRCOPY_FIFO_ENABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FIFO_ENABLE_default_value) {
-  testDefaultValue("NCCL_GDRCOPY_FIFO_ENABLE");
-  EXPECT_EQ(NCCL_GDRCOPY_FIFO_ENABLE, -2);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FLUSH_ENABLE_value_0) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_FLUSH_ENABLE", 0);
-  EXPECT_EQ(NCCL_GDRCOPY_FLUSH_ENABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FLUSH_ENABLE_value_1) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_FLUSH_ENABLE", 9999);
-  EXPECT_EQ(NCCL_GDRCOPY_FLUSH_ENABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FLUSH_ENABLE_value_2) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_FLUSH_ENABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_GDRCOPY_FLUSH_ENABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_FLUSH_ENABLE_value_3) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_FLUSH_ENABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_GDRCOPY_FLUSH_ENABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_SYNC_ENABLE_value_0) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_SYNC_ENABLE", 0);
-  EXPECT_EQ(NCCL_GDRCOPY_SYNC_ENABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_SYNC_ENABLE_value_1) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_SYNC_ENABLE", 9999);
-  EXPECT_EQ(NCCL_GDRCOPY_SYNC_ENABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_SYNC_ENABLE_value_2) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_SYNC_ENABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_GDRCOPY_SYNC_ENABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_SYNC_ENABLE_value_3) {
-  testNumValue<int64_t>("NCCL_GDRCOPY_SYNC_ENABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_GDRCOPY_SYNC_ENABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_GDRCOPY_SYNC_ENABLE_default_value) {
-  testDefaultValue("NCCL_GDRCOPY_SYNC_ENABLE");
-  EXPECT_EQ(NCCL_GDRCOPY_SYNC_ENABLE, 1);
-}
-
-TEST_F(CvarTest, NCCL_GDR_FLUSH_DISABLE_value_0) {
-  testNumValue<int64_t>("NCCL_GDR_FLUSH_DISABLE", 0);
-  EXPECT_EQ(NCCL_GDR_FLUSH_DISABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_GDR_FLUSH_DISABLE_value_1) {
-  testNumValue<int64_t>("NCCL_GDR_FLUSH_DISABLE", 9999);
-  EXPECT_EQ(NCCL_GDR_FLUSH_DISABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_GDR_FLUSH_DISABLE_value_2) {
-  testNumValue<int64_t>("NCCL_GDR_FLUSH_DISABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_GDR_FLUSH_DISABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_GDR_FLUSH_DISABLE_value_3) {
-  testNumValue<int64_t>("NCCL_GDR_FLUSH_DISABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_GDR_FLUSH_DISABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_DUMP_FILE_value_0) {
-  setenv("NCCL_GRAPH_DUMP_FILE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_GRAPH_DUMP_FILE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_DUMP_FILE_value_1) {
-  setenv("NCCL_GRAPH_DUMP_FILE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_GRAPH_DUMP_FILE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_DUMP_FILE_RANK_value_0) {
-  testNumValue<int64_t>("NCCL_GRAPH_DUMP_FILE_RANK", 0);
-  EXPECT_EQ(NCCL_GRAPH_DUMP_FILE_RANK, 0);
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_DUMP_FILE_RANK_value_1) {
-  testNumValue<int64_t>("NCCL_GRAPH_DUMP_FILE_RANK", 9999);
-  EXPECT_EQ(NCCL_GRAPH_DUMP_FILE_RANK, 9999);
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_DUMP_FILE_RANK_value_2) {
-  testNumValue<int64_t>("NCCL_GRAPH_DUMP_FILE_RANK", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_GRAPH_DUMP_FILE_RANK, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_DUMP_FILE_RANK_value_3) {
-  testNumValue<int64_t>("NCCL_GRAPH_DUMP_FILE_RANK", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_GRAPH_DUMP_FILE_RANK, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_FILE_value_0) {
-  setenv("NCCL_GRAPH_FILE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_GRAPH_FILE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_FILE_value_1) {
-  setenv("NCCL_GRAPH_FILE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_GRAPH_FILE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_MIXING_SUPPORT_value_0) {
-  testNumValue<int64_t>("NCCL_GRAPH_MIXING_SUPPORT", 0);
-  EXPECT_EQ(NCCL_GRAPH_MIXING_SUPPORT, 0);
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_MIXING_SUPPORT_value_1) {
-  testNumValue<int64_t>("NCCL_GRAPH_MIXING_SUPPORT", 9999);
-  EXPECT_EQ(NCCL_GRAPH_MIXING_SUPPORT, 9999);
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_MIXING_SUPPORT_value_2) {
-  testNumValue<int64_t>("NCCL_GRAPH_MIXING_SUPPORT", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_GRAPH_MIXING_SUPPORT, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_MIXING_SUPPORT_value_3) {
-  testNumValue<int64_t>("NCCL_GRAPH_MIXING_SUPPORT", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_GRAPH_MIXING_SUPPORT, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_MIXING_SUPPORT_default_value) {
-  testDefaultValue("NCCL_GRAPH_MIXING_SUPPORT");
-  EXPECT_EQ(NCCL_GRAPH_MIXING_SUPPORT, 1);
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_REGISTER_value_0) {
-  testNumValue<int64_t>("NCCL_GRAPH_REGISTER", 0);
-  EXPECT_EQ(NCCL_GRAPH_REGISTER, 0);
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_REGISTER_value_1) {
-  testNumValue<int64_t>("NCCL_GRAPH_REGISTER", 9999);
-  EXPECT_EQ(NCCL_GRAPH_REGISTER, 9999);
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_REGISTER_value_2) {
-  testNumValue<int64_t>("NCCL_GRAPH_REGISTER", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_GRAPH_REGISTER, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_GRAPH_REGISTER_value_3) {
-  testNumValue<int64_t>("NCCL_GRAPH_REGISTER", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_GRAPH_REGISTER, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_HOSTID_value_0) {
-  setenv("NCCL_HOSTID", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_HOSTID, "val1");
-}
-
-TEST_F(CvarTest, NCCL_HOSTID_value_1) {
-  setenv("NCCL_HOSTID", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_HOSTID, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_IB_ADAPTIVE_ROUTING_value_0) {
-  testNumValue<int64_t>("NCCL_IB_ADAPTIVE_ROUTING", 0);
-  EXPECT_EQ(NCCL_IB_ADAPTIVE_ROUTING, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_ADAPTIVE_ROUTING_value_1) {
-  testNumValue<int64_t>("NCCL_IB_ADAPTIVE_ROUTING", 9999);
-  EXPECT_EQ(NCCL_IB_ADAPTIVE_ROUTING, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_ADAPTIVE_ROUTING_value_2) {
-  testNumValue<int64_t>("NCCL_IB_ADAPTIVE_ROUTING", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_ADAPTIVE_ROUTING, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_ADAPTIVE_ROUTING_value_3) {
-  testNumValue<int64_t>("NCCL_IB_ADAPTIVE_ROUTING", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_ADAPTIVE_ROUTING, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_ADAPTIVE_ROUTING_default_value) {
-  testDefaultValue("NCCL_IB_ADAPTIVE_ROUTING");
-  EXPECT_EQ(NCCL_IB_ADAPTIVE_ROUTING, -2);
-}
-
-TEST_F(CvarTest, NCCL_IB_ADDR_FAMILY_value_0) {
-  setenv("NCCL_IB_ADDR_FAMILY", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_IB_ADDR_FAMILY, "val1");
-}
-
-TEST_F(CvarTest, NCCL_IB_ADDR_FAMILY_value_1) {
-  setenv("NCCL_IB_ADDR_FAMILY", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_IB_ADDR_FAMILY, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_IB_ADDR_FAMILY_default_value) {
-  testDefaultValue("NCCL_IB_ADDR_FAMILY");
-  EXPECT_EQ(NCCL_IB_ADDR_FAMILY, "AF_INET");
-}
-
-TEST_F(CvarTest, NCCL_IB_ADDR_RANGE_value_0) {
-  setenv("NCCL_IB_ADDR_RANGE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_IB_ADDR_RANGE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_IB_ADDR_RANGE_value_1) {
-  setenv("NCCL_IB_ADDR_RANGE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_IB_ADDR_RANGE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_IB_ADDR_RANGE_default_value) {
-  testDefaultValue("NCCL_IB_ADDR_RANGE");
-  EXPECT_EQ(NCCL_IB_ADDR_RANGE, "::/0");
-}
-
-TEST_F(CvarTest, NCCL_IB_AR_THRESHOLD_value_0) {
-  testNumValue<int64_t>("NCCL_IB_AR_THRESHOLD", 0);
-  EXPECT_EQ(NCCL_IB_AR_THRESHOLD, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_AR_THRESHOLD_value_1) {
-  testNumValue<int64_t>("NCCL_IB_AR_THRESHOLD", 9999);
-  EXPECT_EQ(NCCL_IB_AR_THRESHOLD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_AR_THRESHOLD_value_2) {
-  testNumValue<int64_t>("NCCL_IB_AR_THRESHOLD", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_AR_THRESHOLD, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_AR_THRESHOLD_value_3) {
-  testNumValue<int64_t>("NCCL_IB_AR_THRESHOLD", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_AR_THRESHOLD, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_AR_THRESHOLD_default_value) {
-  testDefaultValue("NCCL_IB_AR_THRESHOLD");
-  EXPECT_EQ(NCCL_IB_AR_THRESHOLD, 8192);
-}
-
-TEST_F(CvarTest, NCCL_IB_DISABLE_value_0) {
-  testNumValue<int64_t>("NCCL_IB_DISABLE", 0);
-  EXPECT_EQ(NCCL_IB_DISABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_DISABLE_value_1) {
-  testNumValue<int64_t>("NCCL_IB_DISABLE", 9999);
-  EXPECT_EQ(NCCL_IB_DISABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_DISABLE_value_2) {
-  testNumValue<int64_t>("NCCL_IB_DISABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_DISABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_DISABLE_value_3) {
-  testNumValue<int64_t>("NCCL_IB_DISABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_DISABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_GID_INDEX_value_0) {
-  testNumValue<int>("NCCL_IB_GID_INDEX", 0);
-  EXPECT_EQ(NCCL_IB_GID_INDEX, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_GID_INDEX_value_1) {
-  testNumValue<int>("NCCL_IB_GID_INDEX", 9999);
-  EXPECT_EQ(NCCL_IB_GID_INDEX, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_GID_INDEX_value_2) {
-  testNumValue<int>("NCCL_IB_GID_INDEX", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_IB_GID_INDEX, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_GID_INDEX_value_3) {
-  testNumValue<int>("NCCL_IB_GID_INDEX", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_IB_GID_INDEX, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_GID_INDEX_default_value) {
-  testDefaultValue("NCCL_IB_GID_INDEX");
-  EXPECT_EQ(NCCL_IB_GID_INDEX, -1);
-}
-
-TEST_F(CvarTest, NCCL_IB_HCA_default_value) {
-  testDefaultValue("NCCL_IB_HCA");
-  EXPECT_EQ(NCCL_IB_HCA.size(), 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_HCA_warn_dup_val) {
-  setenv("NCCL_IB_HCA", "dummy,dummy", 1);
-  testWarn("NCCL_IB_HCA", "Duplicate token");
-}
-
-TEST_F(CvarTest, NCCL_IB_HCA_prefix_0) {
-  setenv("NCCL_IB_HCA", "^val1,val2,val3", 1);
-  std::vector<std::string> vals{"val1","val2","val3"};
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_IB_HCA_PREFIX, "^");
-  checkListValues<std::string>(vals, NCCL_IB_HCA);
-}
-
-TEST_F(CvarTest, NCCL_IB_HCA_prefix_1) {
-  setenv("NCCL_IB_HCA", "=val1,val2,val3", 1);
-  std::vector<std::string> vals{"val1","val2","val3"};
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_IB_HCA_PREFIX, "=");
-  checkListValues<std::string>(vals, NCCL_IB_HCA);
-}
-
-TEST_F(CvarTest, NCCL_IB_HCA_prefix_2) {
-  setenv("NCCL_IB_HCA", "val1,val2,val3", 1);
-  std::vector<std::string> vals{"val1","val2","val3"};
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_IB_HCA_PREFIX, "");
-  checkListValues<std::string>(vals, NCCL_IB_HCA);
-}
-
-TEST_F(CvarTest, NCCL_IB_MERGE_VFS_value_0) {
-  testNumValue<int64_t>("NCCL_IB_MERGE_VFS", 0);
-  EXPECT_EQ(NCCL_IB_MERGE_VFS, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_MERGE_VFS_value_1) {
-  testNumValue<int64_t>("NCCL_IB_MERGE_VFS", 9999);
-  EXPECT_EQ(NCCL_IB_MERGE_VFS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_MERGE_VFS_value_2) {
-  testNumValue<int64_t>("NCCL_IB_MERGE_VFS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_MERGE_VFS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_MERGE_VFS_value_3) {
-  testNumValue<int64_t>("NCCL_IB_MERGE_VFS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_MERGE_VFS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_MERGE_VFS_default_value) {
-  testDefaultValue("NCCL_IB_MERGE_VFS");
-  EXPECT_EQ(NCCL_IB_MERGE_VFS, 1);
-}
-
-TEST_F(CvarTest, NCCL_IB_PCI_RELAXED_ORDERING_value_0) {
-  testNumValue<int64_t>("NCCL_IB_PCI_RELAXED_ORDERING", 0);
-  EXPECT_EQ(NCCL_IB_PCI_RELAXED_ORDERING, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_PCI_RELAXED_ORDERING_value_1) {
-  testNumValue<int64_t>("NCCL_IB_PCI_RELAXED_ORDERING", 9999);
-  EXPECT_EQ(NCCL_IB_PCI_RELAXED_ORDERING, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_PCI_RELAXED_ORDERING_value_2) {
-  testNumValue<int64_t>("NCCL_IB_PCI_RELAXED_ORDERING", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_PCI_RELAXED_ORDERING, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_PCI_RELAXED_ORDERING_value_3) {
-  testNumValue<int64_t>("NCCL_IB_PCI_RELAXED_ORDERING", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_PCI_RELAXED_ORDERING, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_PCI_RELAXED_ORDERING_default_value) {
-  testDefaultValue("NCCL_IB_PCI_RELAXED_ORDERING");
-  EXPECT_EQ(NCCL_IB_PCI_RELAXED_ORDERING, 2);
-}
-
-TEST_F(CvarTest, NCCL_IB_PKEY_value_0) {
-  testNumValue<int64_t>("NCCL_IB_PKEY", 0);
-  EXPECT_EQ(NCCL_IB_PKEY, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_PKEY_value_1) {
-  testNumValue<int64_t>("NCCL_IB_PKEY", 9999);
-  EXPECT_EQ(NCCL_IB_PKEY, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_PKEY_value_2) {
-  testNumValue<int64_t>("NCCL_IB_PKEY", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_PKEY, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_PKEY_value_3) {
-  testNumValue<int64_t>("NCCL_IB_PKEY", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_PKEY, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_QPS_PER_CONNECTION_value_0) {
-  testNumValue<int64_t>("NCCL_IB_QPS_PER_CONNECTION", 0);
-  EXPECT_EQ(NCCL_IB_QPS_PER_CONNECTION, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_QPS_PER_CONNECTION_value_1) {
-  testNumValue<int64_t>("NCCL_IB_QPS_PER_CONNECTION", 9999);
-  EXPECT_EQ(NCCL_IB_QPS_PER_CONNECTION, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_QPS_PER_CONNECTION_value_2) {
-  testNumValue<int64_t>("NCCL_IB_QPS_PER_CONNECTION", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_QPS_PER_CONNECTION, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_QPS_PER_CONNECTION_value_3) {
-  testNumValue<int64_t>("NCCL_IB_QPS_PER_CONNECTION", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_QPS_PER_CONNECTION, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_QPS_PER_CONNECTION_default_value) {
-  testDefaultValue("NCCL_IB_QPS_PER_CONNECTION");
-  EXPECT_EQ(NCCL_IB_QPS_PER_CONNECTION, 1);
-}
-
-TEST_F(CvarTest, NCCL_IB_RETRY_CNT_value_0) {
-  testNumValue<int64_t>("NCCL_IB_RETRY_CNT", 0);
-  EXPECT_EQ(NCCL_IB_RETRY_CNT, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_RETRY_CNT_value_1) {
-  testNumValue<int64_t>("NCCL_IB_RETRY_CNT", 9999);
-  EXPECT_EQ(NCCL_IB_RETRY_CNT, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_RETRY_CNT_value_2) {
-  testNumValue<int64_t>("NCCL_IB_RETRY_CNT", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_RETRY_CNT, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_RETRY_CNT_value_3) {
-  testNumValue<int64_t>("NCCL_IB_RETRY_CNT", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_RETRY_CNT, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_RETRY_CNT_default_value) {
-  testDefaultValue("NCCL_IB_RETRY_CNT");
-  EXPECT_EQ(NCCL_IB_RETRY_CNT, 7);
-}
-
-TEST_F(CvarTest, NCCL_IB_ROCE_VERSION_NUM_value_0) {
-  testNumValue<int>("NCCL_IB_ROCE_VERSION_NUM", 0);
-  EXPECT_EQ(NCCL_IB_ROCE_VERSION_NUM, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_ROCE_VERSION_NUM_value_1) {
-  testNumValue<int>("NCCL_IB_ROCE_VERSION_NUM", 9999);
-  EXPECT_EQ(NCCL_IB_ROCE_VERSION_NUM, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_ROCE_VERSION_NUM_value_2) {
-  testNumValue<int>("NCCL_IB_ROCE_VERSION_NUM", std::numeric_limits<int>::max());
-  EXPECT_EQ(NCCL_IB_ROCE_VERSION_NUM, std::numeric_limits<int>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_ROCE_VERSION_NUM_value_3) {
-  testNumValue<int>("NCCL_IB_ROCE_VERSION_NUM", std::numeric_limits<int>::min());
-  EXPECT_EQ(NCCL_IB_ROCE_VERSION_NUM, std::numeric_limits<int>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_ROCE_VERSION_NUM_default_value) {
-  testDefaultValue("NCCL_IB_ROCE_VERSION_NUM");
-  EXPECT_EQ(NCCL_IB_ROCE_VERSION_NUM, 2);
-}
-
-TEST_F(CvarTest, NCCL_IB_SL_value_0) {
-  testNumValue<int64_t>("NCCL_IB_SL", 0);
-  EXPECT_EQ(NCCL_IB_SL, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_SL_value_1) {
-  testNumValue<int64_t>("NCCL_IB_SL", 9999);
-  EXPECT_EQ(NCCL_IB_SL, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_SL_value_2) {
-  testNumValue<int64_t>("NCCL_IB_SL", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_SL, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_SL_value_3) {
-  testNumValue<int64_t>("NCCL_IB_SL", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_SL, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_SPLIT_DATA_ON_QPS_value_0) {
-  testNumValue<int64_t>("NCCL_IB_SPLIT_DATA_ON_QPS", 0);
-  EXPECT_EQ(NCCL_IB_SPLIT_DATA_ON_QPS, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_SPLIT_DATA_ON_QPS_value_1) {
-  testNumValue<int64_t>("NCCL_IB_SPLIT_DATA_ON_QPS", 9999);
-  EXPECT_EQ(NCCL_IB_SPLIT_DATA_ON_QPS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_SPLIT_DATA_ON_QPS_value_2) {
-  testNumValue<int64_t>("NCCL_IB_SPLIT_DATA_ON_QPS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_SPLIT_DATA_ON_QPS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_SPLIT_DATA_ON_QPS_value_3) {
-  testNumValue<int64_t>("NCCL_IB_SPLIT_DATA_ON_QPS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_SPLIT_DATA_ON_QPS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_SPLIT_DATA_ON_QPS_default_value) {
-  testDefaultValue("NCCL_IB_SPLIT_DATA_ON_QPS");
-  EXPECT_EQ(NCCL_IB_SPLIT_DATA_ON_QPS, 1);
-}
-
-TEST_F(CvarTest, NCCL_IB_TC_value_0) {
-  testNumValue<int64_t>("NCCL_IB_TC", 0);
-  EXPECT_EQ(NCCL_IB_TC, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_TC_value_1) {
-  testNumValue<int64_t>("NCCL_IB_TC", 9999);
-  EXPECT_EQ(NCCL_IB_TC, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_TC_value_2) {
-  testNumValue<int64_t>("NCCL_IB_TC", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_TC, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_TC_value_3) {
-  testNumValue<int64_t>("NCCL_IB_TC", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_TC, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_TIMEOUT_value_0) {
-  testNumValue<int64_t>("NCCL_IB_TIMEOUT", 0);
-  EXPECT_EQ(NCCL_IB_TIMEOUT, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_TIMEOUT_value_1) {
-  testNumValue<int64_t>("NCCL_IB_TIMEOUT", 9999);
-  EXPECT_EQ(NCCL_IB_TIMEOUT, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_TIMEOUT_value_2) {
-  testNumValue<int64_t>("NCCL_IB_TIMEOUT", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_TIMEOUT, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_TIMEOUT_value_3) {
-  testNumValue<int64_t>("NCCL_IB_TIMEOUT", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_TIMEOUT, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IB_TIMEOUT_default_value) {
-  testDefaultValue("NCCL_IB_TIMEOUT");
-  EXPECT_EQ(NCCL_IB_TIMEOUT, 18);
-}
-
-TEST_F(CvarTest, NCCL_IB_USE_INLINE_value_0) {
-  testNumValue<int64_t>("NCCL_IB_USE_INLINE", 0);
-  EXPECT_EQ(NCCL_IB_USE_INLINE, 0);
-}
-
-TEST_F(CvarTest, NCCL_IB_USE_INLINE_value_1) {
-  testNumValue<int64_t>("NCCL_IB_USE_INLINE", 9999);
-  EXPECT_EQ(NCCL_IB_USE_INLINE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IB_USE_INLINE_value_2) {
-  testNumValue<int64_t>("NCCL_IB_USE_INLINE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IB_USE_INLINE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IB_USE_INLINE_value_3) {
-  testNumValue<int64_t>("NCCL_IB_USE_INLINE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IB_USE_INLINE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IGNORE_CPU_AFFINITY_value_0) {
-  testNumValue<int64_t>("NCCL_IGNORE_CPU_AFFINITY", 0);
-  EXPECT_EQ(NCCL_IGNORE_CPU_AFFINITY, 0);
-}
-
-TEST_F(CvarTest, NCCL_IGNORE_CPU_AFFINITY_value_1) {
-  testNumValue<int64_t>("NCCL_IGNORE_CPU_AFFINITY", 9999);
-  EXPECT_EQ(NCCL_IGNORE_CPU_AFFINITY, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IGNORE_CPU_AFFINITY_value_2) {
-  testNumValue<int64_t>("NCCL_IGNORE_CPU_AFFINITY", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IGNORE_CPU_AFFINITY, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IGNORE_CPU_AFFINITY_value_3) {
-  testNumValue<int64_t>("NCCL_IGNORE_CPU_AFFINITY", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IGNORE_CPU_AFFINITY, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_IGNORE_DISABLED_P2P_value_0) {
-  testNumValue<int64_t>("NCCL_IGNORE_DISABLED_P2P", 0);
-  EXPECT_EQ(NCCL_IGNORE_DISABLED_P2P, 0);
-}
-
-TEST_F(CvarTest, NCCL_IGNORE_DISABLED_P2P_value_1) {
-  testNumValue<int64_t>("NCCL_IGNORE_DISABLED_P2P", 9999);
-  EXPECT_EQ(NCCL_IGNORE_DISABLED_P2P, 9999);
-}
-
-TEST_F(CvarTest, NCCL_IGNORE_DISABLED_P2P_value_2) {
-  testNumValue<int64_t>("NCCL_IGNORE_DISABLED_P2P", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_IGNORE_DISABLED_P2P, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_IGNORE_DISABLED_P2P_value_3) {
-  testNumValue<int64_t>("NCCL_IGNORE_DISABLED_P2P", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_IGNORE_DISABLED_P2P, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_L1_SHARED_MEMORY_CARVEOUT_value_0) {
-  testNumValue<int64_t>("NCCL_L1_SHARED_MEMORY_CARVEOUT", 0);
-  EXPECT_EQ(NCCL_L1_SHARED_MEMORY_CARVEOUT, 0);
-}
-
-TEST_F(CvarTest, NCCL_L1_SHARED_MEMORY_CARVEOUT_value_1) {
-  testNumValue<int64_t>("NCCL_L1_SHARED_MEMORY_CARVEOUT", 9999);
-  EXPECT_EQ(NCCL_L1_SHARED_MEMORY_CARVEOUT, 9999);
-}
-
-TEST_F(CvarTest, NCCL_L1_SHARED_MEMORY_CARVEOUT_value_2) {
-  testNumValue<int64_t>("NCCL_L1_SHARED_MEMORY_CARVEOUT", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_L1_SHARED_MEMORY_CARVEOUT, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_L1_SHARED_MEMORY_CARVEOUT_value_3) {
-  testNumValue<int64_t>("NCCL_L1_SHARED_MEMORY_CARVEOUT", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_L1_SHARED_MEMORY_CARVEOUT, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_LAUNCH_MODE_value_0) {
-  setenv("NCCL_LAUNCH_MODE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_LAUNCH_MODE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_LAUNCH_MODE_value_1) {
-  setenv("NCCL_LAUNCH_MODE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_LAUNCH_MODE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_LL128_BUFFSIZE_value_0) {
-  testNumValue<int64_t>("NCCL_LL128_BUFFSIZE", 0);
-  EXPECT_EQ(NCCL_LL128_BUFFSIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_LL128_BUFFSIZE_value_1) {
-  testNumValue<int64_t>("NCCL_LL128_BUFFSIZE", 9999);
-  EXPECT_EQ(NCCL_LL128_BUFFSIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_LL128_BUFFSIZE_value_2) {
-  testNumValue<int64_t>("NCCL_LL128_BUFFSIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_LL128_BUFFSIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_LL128_BUFFSIZE_value_3) {
-  testNumValue<int64_t>("NCCL_LL128_BUFFSIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_LL128_BUFFSIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_LL128_BUFFSIZE_default_value) {
-  testDefaultValue("NCCL_LL128_BUFFSIZE");
-  EXPECT_EQ(NCCL_LL128_BUFFSIZE, -2);
-}
-
-TEST_F(CvarTest, NCCL_LL128_NTHREADS_value_0) {
-  testNumValue<int64_t>("NCCL_LL128_NTHREADS", 0);
-  EXPECT_EQ(NCCL_LL128_NTHREADS, 0);
-}
-
-TEST_F(CvarTest, NCCL_LL128_NTHREADS_value_1) {
-  testNumValue<int64_t>("NCCL_LL128_NTHREADS", 9999);
-  EXPECT_EQ(NCCL_LL128_NTHREADS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_LL128_NTHREADS_value_2) {
-  testNumValue<int64_t>("NCCL_LL128_NTHREADS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_LL128_NTHREADS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_LL128_NTHREADS_value_3) {
-  testNumValue<int64_t>("NCCL_LL128_NTHREADS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_LL128_NTHREADS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_LL128_NTHREADS_default_value) {
-  testDefaultValue("NCCL_LL128_NTHREADS");
-  EXPECT_EQ(NCCL_LL128_NTHREADS, -2);
-}
-
-TEST_F(CvarTest, NCCL_LL_BUFFSIZE_value_0) {
-  testNumValue<int64_t>("NCCL_LL_BUFFSIZE", 0);
-  EXPECT_EQ(NCCL_LL_BUFFSIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_LL_BUFFSIZE_value_1) {
-  testNumValue<int64_t>("NCCL_LL_BUFFSIZE", 9999);
-  EXPECT_EQ(NCCL_LL_BUFFSIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_LL_BUFFSIZE_value_2) {
-  testNumValue<int64_t>("NCCL_LL_BUFFSIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_LL_BUFFSIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_LL_BUFFSIZE_value_3) {
-  testNumValue<int64_t>("NCCL_LL_BUFFSIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_LL_BUFFSIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_LL_BUFFSIZE_default_value) {
-  testDefaultValue("NCCL_LL_BUFFSIZE");
-  EXPECT_EQ(NCCL_LL_BUFFSIZE, -2);
-}
-
-TEST_F(CvarTest, NCCL_LOCAL_REGISTER_value_0) {
-  testNumValue<int64_t>("NCCL_LOCAL_REGISTER", 0);
-  EXPECT_EQ(NCCL_LOCAL_REGISTER, 0);
-}
-
-TEST_F(CvarTest, NCCL_LOCAL_REGISTER_value_1) {
-  testNumValue<int64_t>("NCCL_LOCAL_REGISTER", 9999);
-  EXPECT_EQ(NCCL_LOCAL_REGISTER, 9999);
-}
-
-TEST_F(CvarTest, NCCL_LOCAL_REGISTER_value_2) {
-  testNumValue<int64_t>("NCCL_LOCAL_REGISTER", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_LOCAL_REGISTER, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_LOCAL_REGISTER_value_3) {
-  testNumValue<int64_t>("NCCL_LOCAL_REGISTER", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_LOCAL_REGISTER, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_LOCAL_REGISTER_default_value) {
-  testDefaultValue("NCCL_LOCAL_REGISTER");
-  EXPECT_EQ(NCCL_LOCAL_REGISTER, 1);
-}
-
-TEST_F(CvarTest, NCCL_LOGGER_MODE_single_choice_0) {
-  setenv("NCCL_LOGGER_MODE", "sync", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_LOGGER_MODE, NCCL_LOGGER_MODE::sync);
-}
-
-TEST_F(CvarTest, NCCL_LOGGER_MODE_single_choice_1) {
-  setenv("NCCL_LOGGER_MODE", "async", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_LOGGER_MODE, NCCL_LOGGER_MODE::async);
-}
-
-TEST_F(CvarTest, NCCL_LOGGER_MODE_default_choice) {
-  testDefaultValue("NCCL_LOGGER_MODE");
-  EXPECT_EQ(NCCL_LOGGER_MODE, NCCL_LOGGER_MODE::sync);
-}
-
-TEST_F(CvarTest, NCCL_LOGGER_MODE_warn_unknown_val) {
-  setenv("NCCL_LOGGER_MODE", "dummy", 1);
-  testWarn("NCCL_LOGGER_MODE", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_MAX_CTAS_value_0) {
-  testNumValue<int64_t>("NCCL_MAX_CTAS", 0);
-  EXPECT_EQ(NCCL_MAX_CTAS, 0);
-}
-
-TEST_F(CvarTest, NCCL_MAX_CTAS_value_1) {
-  testNumValue<int64_t>("NCCL_MAX_CTAS", 9999);
-  EXPECT_EQ(NCCL_MAX_CTAS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_MAX_CTAS_value_2) {
-  testNumValue<int64_t>("NCCL_MAX_CTAS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_MAX_CTAS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MAX_CTAS_value_3) {
-  testNumValue<int64_t>("NCCL_MAX_CTAS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_MAX_CTAS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_MAX_CTAS_default_value) {
-  testDefaultValue("NCCL_MAX_CTAS");
-  EXPECT_EQ(NCCL_MAX_CTAS, -1);
-}
-
-TEST_F(CvarTest, NCCL_MAX_NCHANNELS_value_0) {
-  testNumValue<int64_t>("NCCL_MAX_NCHANNELS", 0);
-  EXPECT_EQ(NCCL_MAX_NCHANNELS, 0);
-}
-
-TEST_F(CvarTest, NCCL_MAX_NCHANNELS_value_1) {
-  testNumValue<int64_t>("NCCL_MAX_NCHANNELS", 9999);
-  EXPECT_EQ(NCCL_MAX_NCHANNELS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_MAX_NCHANNELS_value_2) {
-  testNumValue<int64_t>("NCCL_MAX_NCHANNELS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_MAX_NCHANNELS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MAX_NCHANNELS_value_3) {
-  testNumValue<int64_t>("NCCL_MAX_NCHANNELS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_MAX_NCHANNELS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_MAX_NCHANNELS_default_value) {
-  testDefaultValue("NCCL_MAX_NCHANNELS");
-  EXPECT_EQ(NCCL_MAX_NCHANNELS, -2);
-}
-
-TEST_F(CvarTest, NCCL_MAX_NRINGS_value_0) {
-  testNumValue<int64_t>("NCCL_MAX_NRINGS", 0);
-  EXPECT_EQ(NCCL_MAX_NRINGS, 0);
-}
-
-TEST_F(CvarTest, NCCL_MAX_NRINGS_value_1) {
-  testNumValue<int64_t>("NCCL_MAX_NRINGS", 9999);
-  EXPECT_EQ(NCCL_MAX_NRINGS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_MAX_NRINGS_value_2) {
-  testNumValue<int64_t>("NCCL_MAX_NRINGS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_MAX_NRINGS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MAX_NRINGS_value_3) {
-  testNumValue<int64_t>("NCCL_MAX_NRINGS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_MAX_NRINGS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_MAX_NRINGS_default_value) {
-  testDefaultValue("NCCL_MAX_NRINGS");
-  EXPECT_EQ(NCCL_MAX_NRINGS, -2);
-}
-
-TEST_F(CvarTest, NCCL_MAX_P2P_NCHANNELS_value_0) {
-  testNumValue<int64_t>("NCCL_MAX_P2P_NCHANNELS", 0);
-  EXPECT_EQ(NCCL_MAX_P2P_NCHANNELS, 0);
-}
-
-TEST_F(CvarTest, NCCL_MAX_P2P_NCHANNELS_value_1) {
-  testNumValue<int64_t>("NCCL_MAX_P2P_NCHANNELS", 9999);
-  EXPECT_EQ(NCCL_MAX_P2P_NCHANNELS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_MAX_P2P_NCHANNELS_value_2) {
-  testNumValue<int64_t>("NCCL_MAX_P2P_NCHANNELS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_MAX_P2P_NCHANNELS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MAX_P2P_NCHANNELS_value_3) {
-  testNumValue<int64_t>("NCCL_MAX_P2P_NCHANNELS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_MAX_P2P_NCHANNELS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_MAX_P2P_NCHANNELS_default_value) {
-  testDefaultValue("NCCL_MAX_P2P_NCHANNELS");
-  EXPECT_EQ(NCCL_MAX_P2P_NCHANNELS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MEM_SYNC_DOMAIN_single_choice_0) {
-  setenv("NCCL_MEM_SYNC_DOMAIN", "local", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_MEM_SYNC_DOMAIN, NCCL_MEM_SYNC_DOMAIN::local);
-}
-
-TEST_F(CvarTest, NCCL_MEM_SYNC_DOMAIN_single_choice_1) {
-  setenv("NCCL_MEM_SYNC_DOMAIN", "remote", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_MEM_SYNC_DOMAIN, NCCL_MEM_SYNC_DOMAIN::remote);
-}
-
-TEST_F(CvarTest, NCCL_MEM_SYNC_DOMAIN_default_choice) {
-  testDefaultValue("NCCL_MEM_SYNC_DOMAIN");
-  EXPECT_EQ(NCCL_MEM_SYNC_DOMAIN, NCCL_MEM_SYNC_DOMAIN::remote);
-}
-
-TEST_F(CvarTest, NCCL_MEM_SYNC_DOMAIN_warn_unknown_val) {
-  setenv("NCCL_MEM_SYNC_DOMAIN", "dummy", 1);
-  testWarn("NCCL_MEM_SYNC_DOMAIN", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_MIN_CTAS_value_0) {
-  testNumValue<int64_t>("NCCL_MIN_CTAS", 0);
-  EXPECT_EQ(NCCL_MIN_CTAS, 0);
-}
-
-TEST_F(CvarTest, NCCL_MIN_CTAS_value_1) {
-  testNumValue<int64_t>("NCCL_MIN_CTAS", 9999);
-  EXPECT_EQ(NCCL_MIN_CTAS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_MIN_CTAS_value_2) {
-  testNumValue<int64_t>("NCCL_MIN_CTAS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_MIN_CTAS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MIN_CTAS_value_3) {
-  testNumValue<int64_t>("NCCL_MIN_CTAS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_MIN_CTAS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_MIN_CTAS_default_value) {
-  testDefaultValue("NCCL_MIN_CTAS");
-  EXPECT_EQ(NCCL_MIN_CTAS, -1);
-}
-
-TEST_F(CvarTest, NCCL_MIN_NCHANNELS_value_0) {
-  testNumValue<int64_t>("NCCL_MIN_NCHANNELS", 0);
-  EXPECT_EQ(NCCL_MIN_NCHANNELS, 0);
-}
-
-TEST_F(CvarTest, NCCL_MIN_NCHANNELS_value_1) {
-  testNumValue<int64_t>("NCCL_MIN_NCHANNELS", 9999);
-  EXPECT_EQ(NCCL_MIN_NCHANNELS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_MIN_NCHANNELS_value_2) {
-  testNumValue<int64_t>("NCCL_MIN_NCHANNELS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_MIN_NCHANNELS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MIN_NCHANNELS_value_3) {
-  testNumValue<int64_t>("NCCL_MIN_NCHANNELS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_MIN_NCHANNELS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_MIN_NCHANNELS_default_value) {
-  testDefaultValue("NCCL_MIN_NCHANNELS");
-  EXPECT_EQ(NCCL_MIN_NCHANNELS, -2);
-}
-
-TEST_F(CvarTest, NCCL_MIN_NRINGS_value_0) {
-  testNumValue<int64_t>("NCCL_MIN_NRINGS", 0);
-  EXPECT_EQ(NCCL_MIN_NRINGS, 0);
-}
-
-TEST_F(CvarTest, NCCL_MIN_NRINGS_value_1) {
-  testNumValue<int64_t>("NCCL_MIN_NRINGS", 9999);
-  EXPECT_EQ(NCCL_MIN_NRINGS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_MIN_NRINGS_value_2) {
-  testNumValue<int64_t>("NCCL_MIN_NRINGS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_MIN_NRINGS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MIN_NRINGS_value_3) {
-  testNumValue<int64_t>("NCCL_MIN_NRINGS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_MIN_NRINGS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_MIN_NRINGS_default_value) {
-  testDefaultValue("NCCL_MIN_NRINGS");
-  EXPECT_EQ(NCCL_MIN_NRINGS, -2);
-}
-
-TEST_F(CvarTest, NCCL_MIN_P2P_NCHANNELS_value_0) {
-  testNumValue<int64_t>("NCCL_MIN_P2P_NCHANNELS", 0);
-  EXPECT_EQ(NCCL_MIN_P2P_NCHANNELS, 0);
-}
-
-TEST_F(CvarTest, NCCL_MIN_P2P_NCHANNELS_value_1) {
-  testNumValue<int64_t>("NCCL_MIN_P2P_NCHANNELS", 9999);
-  EXPECT_EQ(NCCL_MIN_P2P_NCHANNELS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_MIN_P2P_NCHANNELS_value_2) {
-  testNumValue<int64_t>("NCCL_MIN_P2P_NCHANNELS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_MIN_P2P_NCHANNELS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_MIN_P2P_NCHANNELS_value_3) {
-  testNumValue<int64_t>("NCCL_MIN_P2P_NCHANNELS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_MIN_P2P_NCHANNELS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_MIN_P2P_NCHANNELS_default_value) {
-  testDefaultValue("NCCL_MIN_P2P_NCHANNELS");
-  EXPECT_EQ(NCCL_MIN_P2P_NCHANNELS, 1);
-}
-
-TEST_F(CvarTest, NCCL_NCHANNELS_PER_NET_PEER_value_0) {
-  testNumValue<int64_t>("NCCL_NCHANNELS_PER_NET_PEER", 0);
-  EXPECT_EQ(NCCL_NCHANNELS_PER_NET_PEER, 0);
-}
-
-TEST_F(CvarTest, NCCL_NCHANNELS_PER_NET_PEER_value_1) {
-  testNumValue<int64_t>("NCCL_NCHANNELS_PER_NET_PEER", 9999);
-  EXPECT_EQ(NCCL_NCHANNELS_PER_NET_PEER, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NCHANNELS_PER_NET_PEER_value_2) {
-  testNumValue<int64_t>("NCCL_NCHANNELS_PER_NET_PEER", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NCHANNELS_PER_NET_PEER, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NCHANNELS_PER_NET_PEER_value_3) {
-  testNumValue<int64_t>("NCCL_NCHANNELS_PER_NET_PEER", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NCHANNELS_PER_NET_PEER, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NCHANNELS_PER_NET_PEER_default_value) {
-  testDefaultValue("NCCL_NCHANNELS_PER_NET_PEER");
-  EXPECT_EQ(NCCL_NCHANNELS_PER_NET_PEER, 2);
-}
-
-TEST_F(CvarTest, NCCL_NETWORK_value_0) {
-  setenv("NCCL_NET", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_NETWORK, "val1");
-}
-
-TEST_F(CvarTest, NCCL_NETWORK_value_1) {
-  setenv("NCCL_NET", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_NETWORK, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_NET_DISABLE_INTRA_value_0) {
-  testNumValue<int64_t>("NCCL_NET_DISABLE_INTRA", 0);
-  EXPECT_EQ(NCCL_NET_DISABLE_INTRA, 0);
-}
-
-TEST_F(CvarTest, NCCL_NET_DISABLE_INTRA_value_1) {
-  testNumValue<int64_t>("NCCL_NET_DISABLE_INTRA", 9999);
-  EXPECT_EQ(NCCL_NET_DISABLE_INTRA, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NET_DISABLE_INTRA_value_2) {
-  testNumValue<int64_t>("NCCL_NET_DISABLE_INTRA", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NET_DISABLE_INTRA, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NET_DISABLE_INTRA_value_3) {
-  testNumValue<int64_t>("NCCL_NET_DISABLE_INTRA", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NET_DISABLE_INTRA, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NET_FORCE_FLUSH_value_0) {
-  testNumValue<int64_t>("NCCL_NET_FORCE_FLUSH", 0);
-  EXPECT_EQ(NCCL_NET_FORCE_FLUSH, 0);
-}
-
-TEST_F(CvarTest, NCCL_NET_FORCE_FLUSH_value_1) {
-  testNumValue<int64_t>("NCCL_NET_FORCE_FLUSH", 9999);
-  EXPECT_EQ(NCCL_NET_FORCE_FLUSH, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NET_FORCE_FLUSH_value_2) {
-  testNumValue<int64_t>("NCCL_NET_FORCE_FLUSH", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NET_FORCE_FLUSH, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NET_FORCE_FLUSH_value_3) {
-  testNumValue<int64_t>("NCCL_NET_FORCE_FLUSH", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NET_FORCE_FLUSH, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NET_FORCE_FLUSH_default_value) {
-  testDefaultValue("NCCL_NET_FORCE_FLUSH");
-  EXPECT_EQ(NCCL_NET_FORCE_FLUSH, 1);
-}
-
-TEST_F(CvarTest, NCCL_NET_GDR_LEVEL_value_0) {
-  setenv("NCCL_NET_GDR_LEVEL", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_NET_GDR_LEVEL, "val1");
-}
-
-TEST_F(CvarTest, NCCL_NET_GDR_LEVEL_value_1) {
-  setenv("NCCL_NET_GDR_LEVEL", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_NET_GDR_LEVEL, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_NET_GDR_READ_value_0) {
-  testNumValue<int64_t>("NCCL_NET_GDR_READ", 0);
-  EXPECT_EQ(NCCL_NET_GDR_READ, 0);
-}
-
-TEST_F(CvarTest, NCCL_NET_GDR_READ_value_1) {
-  testNumValue<int64_t>("NCCL_NET_GDR_READ", 9999);
-  EXPECT_EQ(NCCL_NET_GDR_READ, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NET_GDR_READ_value_2) {
-  testNumValue<int64_t>("NCCL_NET_GDR_READ", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NET_GDR_READ, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NET_GDR_READ_value_3) {
-  testNumValue<int64_t>("NCCL_NET_GDR_READ", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NET_GDR_READ, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NET_GDR_READ_default_value) {
-  testDefaultValue("NCCL_NET_GDR_READ");
-  EXPECT_EQ(NCCL_NET_GDR_READ, -2);
-}
-
-TEST_F(CvarTest, NCCL_NET_OVERHEAD_value_0) {
-  testNumValue<int64_t>("NCCL_NET_OVERHEAD", 0);
-  EXPECT_EQ(NCCL_NET_OVERHEAD, 0);
-}
-
-TEST_F(CvarTest, NCCL_NET_OVERHEAD_value_1) {
-  testNumValue<int64_t>("NCCL_NET_OVERHEAD", 9999);
-  EXPECT_EQ(NCCL_NET_OVERHEAD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NET_OVERHEAD_value_2) {
-  testNumValue<int64_t>("NCCL_NET_OVERHEAD", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NET_OVERHEAD, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NET_OVERHEAD_value_3) {
-  testNumValue<int64_t>("NCCL_NET_OVERHEAD", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NET_OVERHEAD, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NET_OVERHEAD_default_value) {
-  testDefaultValue("NCCL_NET_OVERHEAD");
-  EXPECT_EQ(NCCL_NET_OVERHEAD, -2);
-}
-
-TEST_F(CvarTest, NCCL_NET_PLUGIN_value_0) {
-  setenv("NCCL_NET_PLUGIN", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_NET_PLUGIN, "val1");
-}
-
-TEST_F(CvarTest, NCCL_NET_PLUGIN_value_1) {
-  setenv("NCCL_NET_PLUGIN", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_NET_PLUGIN, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_NET_PLUGIN_default_value) {
-  testDefaultValue("NCCL_NET_PLUGIN");
-  EXPECT_EQ(NCCL_NET_PLUGIN, "libnccl-net.so");
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_BUFFERS_value_0) {
-  testNumValue<int64_t>("NCCL_NET_SHARED_BUFFERS", 0);
-  EXPECT_EQ(NCCL_NET_SHARED_BUFFERS, 0);
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_BUFFERS_value_1) {
-  testNumValue<int64_t>("NCCL_NET_SHARED_BUFFERS", 9999);
-  EXPECT_EQ(NCCL_NET_SHARED_BUFFERS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_BUFFERS_value_2) {
-  testNumValue<int64_t>("NCCL_NET_SHARED_BUFFERS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NET_SHARED_BUFFERS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_BUFFERS_value_3) {
-  testNumValue<int64_t>("NCCL_NET_SHARED_BUFFERS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NET_SHARED_BUFFERS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_BUFFERS_default_value) {
-  testDefaultValue("NCCL_NET_SHARED_BUFFERS");
-  EXPECT_EQ(NCCL_NET_SHARED_BUFFERS, -2);
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_COMMS_value_0) {
-  testNumValue<int64_t>("NCCL_NET_SHARED_COMMS", 0);
-  EXPECT_EQ(NCCL_NET_SHARED_COMMS, 0);
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_COMMS_value_1) {
-  testNumValue<int64_t>("NCCL_NET_SHARED_COMMS", 9999);
-  EXPECT_EQ(NCCL_NET_SHARED_COMMS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_COMMS_value_2) {
-  testNumValue<int64_t>("NCCL_NET_SHARED_COMMS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NET_SHARED_COMMS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_COMMS_value_3) {
-  testNumValue<int64_t>("NCCL_NET_SHARED_COMMS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NET_SHARED_COMMS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NET_SHARED_COMMS_default_value) {
-  testDefaultValue("NCCL_NET_SHARED_COMMS");
-  EXPECT_EQ(NCCL_NET_SHARED_COMMS, 1);
-}
-
-TEST_F(CvarTest, NCCL_NSOCKS_PERTHREAD_value_0) {
-  testNumValue<int64_t>("NCCL_NSOCKS_PERTHREAD", 0);
-  EXPECT_EQ(NCCL_NSOCKS_PERTHREAD, 0);
-}
-
-TEST_F(CvarTest, NCCL_NSOCKS_PERTHREAD_value_1) {
-  testNumValue<int64_t>("NCCL_NSOCKS_PERTHREAD", 9999);
-  EXPECT_EQ(NCCL_NSOCKS_PERTHREAD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NSOCKS_PERTHREAD_value_2) {
-  testNumValue<int64_t>("NCCL_NSOCKS_PERTHREAD", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NSOCKS_PERTHREAD, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NSOCKS_PERTHREAD_value_3) {
-  testNumValue<int64_t>("NCCL_NSOCKS_PERTHREAD", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NSOCKS_PERTHREAD, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NSOCKS_PERTHREAD_default_value) {
-  testDefaultValue("NCCL_NSOCKS_PERTHREAD");
-  EXPECT_EQ(NCCL_NSOCKS_PERTHREAD, -2);
-}
-
-TEST_F(CvarTest, NCCL_NTHREADS_value_0) {
-  testNumValue<int64_t>("NCCL_NTHREADS", 0);
-  EXPECT_EQ(NCCL_NTHREADS, 0);
-}
-
-TEST_F(CvarTest, NCCL_NTHREADS_value_1) {
-  testNumValue<int64_t>("NCCL_NTHREADS", 9999);
-  EXPECT_EQ(NCCL_NTHREADS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NTHREADS_value_2) {
-  testNumValue<int64_t>("NCCL_NTHREADS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NTHREADS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NTHREADS_value_3) {
-  testNumValue<int64_t>("NCCL_NTHREADS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NTHREADS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NTHREADS_default_value) {
-  testDefaultValue("NCCL_NTHREADS");
-  EXPECT_EQ(NCCL_NTHREADS, -2);
-}
-
-TEST_F(CvarTest, NCCL_NVB_DISABLE_value_0) {
-  testNumValue<int64_t>("NCCL_NVB_DISABLE", 0);
-  EXPECT_EQ(NCCL_NVB_DISABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_NVB_DISABLE_value_1) {
-  testNumValue<int64_t>("NCCL_NVB_DISABLE", 9999);
-  EXPECT_EQ(NCCL_NVB_DISABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NVB_DISABLE_value_2) {
-  testNumValue<int64_t>("NCCL_NVB_DISABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NVB_DISABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NVB_DISABLE_value_3) {
-  testNumValue<int64_t>("NCCL_NVB_DISABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NVB_DISABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NVB_PRECONNECT_value_0) {
-  testNumValue<int64_t>("NCCL_NVB_PRECONNECT", 0);
-  EXPECT_EQ(NCCL_NVB_PRECONNECT, 0);
-}
-
-TEST_F(CvarTest, NCCL_NVB_PRECONNECT_value_1) {
-  testNumValue<int64_t>("NCCL_NVB_PRECONNECT", 9999);
-  EXPECT_EQ(NCCL_NVB_PRECONNECT, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NVB_PRECONNECT_value_2) {
-  testNumValue<int64_t>("NCCL_NVB_PRECONNECT", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NVB_PRECONNECT, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NVB_PRECONNECT_value_3) {
-  testNumValue<int64_t>("NCCL_NVB_PRECONNECT", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NVB_PRECONNECT, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NVB_PRECONNECT_default_value) {
-  testDefaultValue("NCCL_NVB_PRECONNECT");
-  EXPECT_EQ(NCCL_NVB_PRECONNECT, 1);
-}
-
-TEST_F(CvarTest, NCCL_NVLS_ENABLE_value_0) {
-  testNumValue<int64_t>("NCCL_NVLS_ENABLE", 0);
-  EXPECT_EQ(NCCL_NVLS_ENABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_NVLS_ENABLE_value_1) {
-  testNumValue<int64_t>("NCCL_NVLS_ENABLE", 9999);
-  EXPECT_EQ(NCCL_NVLS_ENABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NVLS_ENABLE_value_2) {
-  testNumValue<int64_t>("NCCL_NVLS_ENABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NVLS_ENABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NVLS_ENABLE_value_3) {
-  testNumValue<int64_t>("NCCL_NVLS_ENABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NVLS_ENABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NVLS_ENABLE_default_value) {
-  testDefaultValue("NCCL_NVLS_ENABLE");
-  EXPECT_EQ(NCCL_NVLS_ENABLE, 2);
-}
-
-TEST_F(CvarTest, NCCL_NVLS_NCHANNELS_value_0) {
-  testNumValue<int64_t>("NCCL_NVLS_NCHANNELS", 0);
-  EXPECT_EQ(NCCL_NVLS_NCHANNELS, 0);
-}
-
-TEST_F(CvarTest, NCCL_NVLS_NCHANNELS_value_1) {
-  testNumValue<int64_t>("NCCL_NVLS_NCHANNELS", 9999);
-  EXPECT_EQ(NCCL_NVLS_NCHANNELS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_NVLS_NCHANNELS_value_2) {
-  testNumValue<int64_t>("NCCL_NVLS_NCHANNELS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_NVLS_NCHANNELS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_NVLS_NCHANNELS_value_3) {
-  testNumValue<int64_t>("NCCL_NVLS_NCHANNELS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_NVLS_NCHANNELS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_NVLS_NCHANNELS_default_value) {
-  testDefaultValue("NCCL_NVLS_NCHANNELS");
-  EXPECT_EQ(NCCL_NVLS_NCHANNELS, 16);
-}
-
-TEST_F(CvarTest, NCCL_P2P_DIRECT_DISABLE_value_0) {
-  testNumValue<int64_t>("NCCL_P2P_DIRECT_DISABLE", 0);
-  EXPECT_EQ(NCCL_P2P_DIRECT_DISABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_P2P_DIRECT_DISABLE_value_1) {
-  testNumValue<int64_t>("NCCL_P2P_DIRECT_DISABLE", 9999);
-  EXPECT_EQ(NCCL_P2P_DIRECT_DISABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_P2P_DIRECT_DISABLE_value_2) {
-  testNumValue<int64_t>("NCCL_P2P_DIRECT_DISABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_P2P_DIRECT_DISABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_P2P_DIRECT_DISABLE_value_3) {
-  testNumValue<int64_t>("NCCL_P2P_DIRECT_DISABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_P2P_DIRECT_DISABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_P2P_DISABLE_value_0) {
-  setenv("NCCL_P2P_DISABLE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_P2P_DISABLE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_P2P_DISABLE_value_1) {
-  setenv("NCCL_P2P_DISABLE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_P2P_DISABLE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_P2P_LEVEL_value_0) {
-  setenv("NCCL_P2P_LEVEL", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_P2P_LEVEL, "val1");
-}
-
-TEST_F(CvarTest, NCCL_P2P_LEVEL_value_1) {
-  setenv("NCCL_P2P_LEVEL", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_P2P_LEVEL, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_P2P_LL_THRESHOLD_value_0) {
-  testNumValue<int64_t>("NCCL_P2P_LL_THRESHOLD", 0);
-  EXPECT_EQ(NCCL_P2P_LL_THRESHOLD, 0);
-}
-
-TEST_F(CvarTest, NCCL_P2P_LL_THRESHOLD_value_1) {
-  testNumValue<int64_t>("NCCL_P2P_LL_THRESHOLD", 9999);
-  EXPECT_EQ(NCCL_P2P_LL_THRESHOLD, 9999);
-}
-
-TEST_F(CvarTest, NCCL_P2P_LL_THRESHOLD_value_2) {
-  testNumValue<int64_t>("NCCL_P2P_LL_THRESHOLD", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_P2P_LL_THRESHOLD, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_P2P_LL_THRESHOLD_value_3) {
-  testNumValue<int64_t>("NCCL_P2P_LL_THRESHOLD", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_P2P_LL_THRESHOLD, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_P2P_LL_THRESHOLD_default_value) {
-  testDefaultValue("NCCL_P2P_LL_THRESHOLD");
-  EXPECT_EQ(NCCL_P2P_LL_THRESHOLD, 16384);
-}
-
-TEST_F(CvarTest, NCCL_P2P_NET_CHUNKSIZE_value_0) {
-  testNumValue<int64_t>("NCCL_P2P_NET_CHUNKSIZE", 0);
-  EXPECT_EQ(NCCL_P2P_NET_CHUNKSIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_P2P_NET_CHUNKSIZE_value_1) {
-  testNumValue<int64_t>("NCCL_P2P_NET_CHUNKSIZE", 9999);
-  EXPECT_EQ(NCCL_P2P_NET_CHUNKSIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_P2P_NET_CHUNKSIZE_value_2) {
-  testNumValue<int64_t>("NCCL_P2P_NET_CHUNKSIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_P2P_NET_CHUNKSIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_P2P_NET_CHUNKSIZE_value_3) {
-  testNumValue<int64_t>("NCCL_P2P_NET_CHUNKSIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_P2P_NET_CHUNKSIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_P2P_NET_CHUNKSIZE_default_value) {
-  testDefaultValue("NCCL_P2P_NET_CHUNKSIZE");
-  EXPECT_EQ(NCCL_P2P_NET_CHUNKSIZE, 131072);
-}
-
-TEST_F(CvarTest, NCCL_P2P_NVL_CHUNKSIZE_value_0) {
-  testNumValue<int64_t>("NCCL_P2P_NVL_CHUNKSIZE", 0);
-  EXPECT_EQ(NCCL_P2P_NVL_CHUNKSIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_P2P_NVL_CHUNKSIZE_value_1) {
-  testNumValue<int64_t>("NCCL_P2P_NVL_CHUNKSIZE", 9999);
-  EXPECT_EQ(NCCL_P2P_NVL_CHUNKSIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_P2P_NVL_CHUNKSIZE_value_2) {
-  testNumValue<int64_t>("NCCL_P2P_NVL_CHUNKSIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_P2P_NVL_CHUNKSIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_P2P_NVL_CHUNKSIZE_value_3) {
-  testNumValue<int64_t>("NCCL_P2P_NVL_CHUNKSIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_P2P_NVL_CHUNKSIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_P2P_NVL_CHUNKSIZE_default_value) {
-  testDefaultValue("NCCL_P2P_NVL_CHUNKSIZE");
-  EXPECT_EQ(NCCL_P2P_NVL_CHUNKSIZE, 524288);
-}
-
-TEST_F(CvarTest, NCCL_P2P_PCI_CHUNKSIZE_value_0) {
-  testNumValue<int64_t>("NCCL_P2P_PCI_CHUNKSIZE", 0);
-  EXPECT_EQ(NCCL_P2P_PCI_CHUNKSIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_P2P_PCI_CHUNKSIZE_value_1) {
-  testNumValue<int64_t>("NCCL_P2P_PCI_CHUNKSIZE", 9999);
-  EXPECT_EQ(NCCL_P2P_PCI_CHUNKSIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_P2P_PCI_CHUNKSIZE_value_2) {
-  testNumValue<int64_t>("NCCL_P2P_PCI_CHUNKSIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_P2P_PCI_CHUNKSIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_P2P_PCI_CHUNKSIZE_value_3) {
-  testNumValue<int64_t>("NCCL_P2P_PCI_CHUNKSIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_P2P_PCI_CHUNKSIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_P2P_PCI_CHUNKSIZE_default_value) {
-  testDefaultValue("NCCL_P2P_PCI_CHUNKSIZE");
-  EXPECT_EQ(NCCL_P2P_PCI_CHUNKSIZE, 131072);
-}
-
-TEST_F(CvarTest, NCCL_P2P_PXN_LEVEL_value_0) {
-  testNumValue<int64_t>("NCCL_P2P_PXN_LEVEL", 0);
-  EXPECT_EQ(NCCL_P2P_PXN_LEVEL, 0);
-}
-
-TEST_F(CvarTest, NCCL_P2P_PXN_LEVEL_value_1) {
-  testNumValue<int64_t>("NCCL_P2P_PXN_LEVEL", 9999);
-  EXPECT_EQ(NCCL_P2P_PXN_LEVEL, 9999);
-}
-
-TEST_F(CvarTest, NCCL_P2P_PXN_LEVEL_value_2) {
-  testNumValue<int64_t>("NCCL_P2P_PXN_LEVEL", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_P2P_PXN_LEVEL, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_P2P_PXN_LEVEL_value_3) {
-  testNumValue<int64_t>("NCCL_P2P_PXN_LEVEL", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_P2P_PXN_LEVEL, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_P2P_PXN_LEVEL_default_value) {
-  testDefaultValue("NCCL_P2P_PXN_LEVEL");
-  EXPECT_EQ(NCCL_P2P_PXN_LEVEL, 2);
-}
-
-TEST_F(CvarTest, NCCL_P2P_READ_ENABLE_value_0) {
-  testNumValue<int64_t>("NCCL_P2P_READ_ENABLE", 0);
-  EXPECT_EQ(NCCL_P2P_READ_ENABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_P2P_READ_ENABLE_value_1) {
-  testNumValue<int64_t>("NCCL_P2P_READ_ENABLE", 9999);
-  EXPECT_EQ(NCCL_P2P_READ_ENABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_P2P_READ_ENABLE_value_2) {
-  testNumValue<int64_t>("NCCL_P2P_READ_ENABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_P2P_READ_ENABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_P2P_READ_ENABLE_value_3) {
-  testNumValue<int64_t>("NCCL_P2P_READ_ENABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_P2P_READ_ENABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_P2P_READ_ENABLE_default_value) {
-  testDefaultValue("NCCL_P2P_READ_ENABLE");
-  EXPECT_EQ(NCCL_P2P_READ_ENABLE, -2);
-}
-
-TEST_F(CvarTest, NCCL_P2P_USE_CUDA_MEMCPY_value_0) {
-  testNumValue<int64_t>("NCCL_P2P_USE_CUDA_MEMCPY", 0);
-  EXPECT_EQ(NCCL_P2P_USE_CUDA_MEMCPY, 0);
-}
-
-TEST_F(CvarTest, NCCL_P2P_USE_CUDA_MEMCPY_value_1) {
-  testNumValue<int64_t>("NCCL_P2P_USE_CUDA_MEMCPY", 9999);
-  EXPECT_EQ(NCCL_P2P_USE_CUDA_MEMCPY, 9999);
-}
-
-TEST_F(CvarTest, NCCL_P2P_USE_CUDA_MEMCPY_value_2) {
-  testNumValue<int64_t>("NCCL_P2P_USE_CUDA_MEMCPY", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_P2P_USE_CUDA_MEMCPY, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_P2P_USE_CUDA_MEMCPY_value_3) {
-  testNumValue<int64_t>("NCCL_P2P_USE_CUDA_MEMCPY", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_P2P_USE_CUDA_MEMCPY, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_PROGRESS_APPENDOP_FREQ_value_0) {
-  testNumValue<int64_t>("NCCL_PROGRESS_APPENDOP_FREQ", 0);
-  EXPECT_EQ(NCCL_PROGRESS_APPENDOP_FREQ, 0);
-}
-
-TEST_F(CvarTest, NCCL_PROGRESS_APPENDOP_FREQ_value_1) {
-  testNumValue<int64_t>("NCCL_PROGRESS_APPENDOP_FREQ", 9999);
-  EXPECT_EQ(NCCL_PROGRESS_APPENDOP_FREQ, 9999);
-}
-
-TEST_F(CvarTest, NCCL_PROGRESS_APPENDOP_FREQ_value_2) {
-  testNumValue<int64_t>("NCCL_PROGRESS_APPENDOP_FREQ", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_PROGRESS_APPENDOP_FREQ, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_PROGRESS_APPENDOP_FREQ_value_3) {
-  testNumValue<int64_t>("NCCL_PROGRESS_APPENDOP_FREQ", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_PROGRESS_APPENDOP_FREQ, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_PROGRESS_APPENDOP_FREQ_default_value) {
-  testDefaultValue("NCCL_PROGRESS_APPENDOP_FREQ");
-  EXPECT_EQ(NCCL_PROGRESS_APPENDOP_FREQ, 8);
-}
-
-TEST_F(CvarTest, NCCL_PROTO_value_0) {
-  setenv("NCCL_PROTO", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_PROTO, "val1");
-}
-
-TEST_F(CvarTest, NCCL_PROTO_value_1) {
-  setenv("NCCL_PROTO", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_PROTO, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_PROXY_APPEND_BATCH_SIZE_value_0) {
-  testNumValue<int64_t>("NCCL_PROXY_APPEND_BATCH_SIZE", 0);
-  EXPECT_EQ(NCCL_PROXY_APPEND_BATCH_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_PROXY_APPEND_BATCH_SIZE_value_1) {
-  testNumValue<int64_t>("NCCL_PROXY_APPEND_BATCH_SIZE", 9999);
-  EXPECT_EQ(NCCL_PROXY_APPEND_BATCH_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_PROXY_APPEND_BATCH_SIZE_value_2) {
-  testNumValue<int64_t>("NCCL_PROXY_APPEND_BATCH_SIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_PROXY_APPEND_BATCH_SIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_PROXY_APPEND_BATCH_SIZE_value_3) {
-  testNumValue<int64_t>("NCCL_PROXY_APPEND_BATCH_SIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_PROXY_APPEND_BATCH_SIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_PROXY_APPEND_BATCH_SIZE_default_value) {
-  testDefaultValue("NCCL_PROXY_APPEND_BATCH_SIZE");
-  EXPECT_EQ(NCCL_PROXY_APPEND_BATCH_SIZE, 16);
-}
-
-TEST_F(CvarTest, NCCL_PROXY_DUMP_SIGNAL_value_0) {
-  testNumValue<int64_t>("NCCL_PROXY_DUMP_SIGNAL", 0);
-  EXPECT_EQ(NCCL_PROXY_DUMP_SIGNAL, 0);
-}
-
-TEST_F(CvarTest, NCCL_PROXY_DUMP_SIGNAL_value_1) {
-  testNumValue<int64_t>("NCCL_PROXY_DUMP_SIGNAL", 9999);
-  EXPECT_EQ(NCCL_PROXY_DUMP_SIGNAL, 9999);
-}
-
-TEST_F(CvarTest, NCCL_PROXY_DUMP_SIGNAL_value_2) {
-  testNumValue<int64_t>("NCCL_PROXY_DUMP_SIGNAL", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_PROXY_DUMP_SIGNAL, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_PROXY_DUMP_SIGNAL_value_3) {
-  testNumValue<int64_t>("NCCL_PROXY_DUMP_SIGNAL", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_PROXY_DUMP_SIGNAL, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_PROXY_DUMP_SIGNAL_default_value) {
-  testDefaultValue("NCCL_PROXY_DUMP_SIGNAL");
-  EXPECT_EQ(NCCL_PROXY_DUMP_SIGNAL, -1);
-}
-
-TEST_F(CvarTest, NCCL_PROXY_PROFILE_value_0) {
-  setenv("NCCL_PROXY_PROFILE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_PROXY_PROFILE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_PROXY_PROFILE_value_1) {
-  setenv("NCCL_PROXY_PROFILE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_PROXY_PROFILE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_PROXY_PROFILE_DIR_value_0) {
-  setenv("NCCL_PROXY_PROFILE_DIR", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_PROXY_PROFILE_DIR, "val1");
-}
-
-TEST_F(CvarTest, NCCL_PROXY_PROFILE_DIR_value_1) {
-  setenv("NCCL_PROXY_PROFILE_DIR", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_PROXY_PROFILE_DIR, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_PROXY_PROFILE_DIR_default_value) {
-  testDefaultValue("NCCL_PROXY_PROFILE_DIR");
-  EXPECT_EQ(NCCL_PROXY_PROFILE_DIR, "/tmp");
-}
-
-TEST_F(CvarTest, NCCL_PXN_DISABLE_value_0) {
-  testNumValue<int64_t>("NCCL_PXN_DISABLE", 0);
-  EXPECT_EQ(NCCL_PXN_DISABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_PXN_DISABLE_value_1) {
-  testNumValue<int64_t>("NCCL_PXN_DISABLE", 9999);
-  EXPECT_EQ(NCCL_PXN_DISABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_PXN_DISABLE_value_2) {
-  testNumValue<int64_t>("NCCL_PXN_DISABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_PXN_DISABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_PXN_DISABLE_value_3) {
-  testNumValue<int64_t>("NCCL_PXN_DISABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_PXN_DISABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_SENDRECV_ALGO_single_choice_0) {
-  setenv("NCCL_SENDRECV_ALGO", "orig", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_SENDRECV_ALGO, NCCL_SENDRECV_ALGO::orig);
-}
-
-TEST_F(CvarTest, NCCL_SENDRECV_ALGO_single_choice_1) {
-  setenv("NCCL_SENDRECV_ALGO", "ctran", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_SENDRECV_ALGO, NCCL_SENDRECV_ALGO::ctran);
-}
-
-TEST_F(CvarTest, NCCL_SENDRECV_ALGO_default_choice) {
-  testDefaultValue("NCCL_SENDRECV_ALGO");
-  EXPECT_EQ(NCCL_SENDRECV_ALGO, NCCL_SENDRECV_ALGO::orig);
-}
-
-TEST_F(CvarTest, NCCL_SENDRECV_ALGO_warn_unknown_val) {
-  setenv("NCCL_SENDRECV_ALGO", "dummy", 1);
-  testWarn("NCCL_SENDRECV_ALGO", "Unknown value");
-}
-
-TEST_F(CvarTest, NCCL_SET_STACK_SIZE_value_0) {
-  testNumValue<int64_t>("NCCL_SET_STACK_SIZE", 0);
-  EXPECT_EQ(NCCL_SET_STACK_SIZE, 0);
-}
-
-TEST_F(CvarTest, NCCL_SET_STACK_SIZE_value_1) {
-  testNumValue<int64_t>("NCCL_SET_STACK_SIZE", 9999);
-  EXPECT_EQ(NCCL_SET_STACK_SIZE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_SET_STACK_SIZE_value_2) {
-  testNumValue<int64_t>("NCCL_SET_STACK_SIZE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_SET_STACK_SIZE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_SET_STACK_SIZE_value_3) {
-  testNumValue<int64_t>("NCCL_SET_STACK_SIZE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_SET_STACK_SIZE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_SET_THREAD_NAME_value_0) {
-  testNumValue<int64_t>("NCCL_SET_THREAD_NAME", 0);
-  EXPECT_EQ(NCCL_SET_THREAD_NAME, 0);
-}
-
-TEST_F(CvarTest, NCCL_SET_THREAD_NAME_value_1) {
-  testNumValue<int64_t>("NCCL_SET_THREAD_NAME", 9999);
-  EXPECT_EQ(NCCL_SET_THREAD_NAME, 9999);
-}
-
-TEST_F(CvarTest, NCCL_SET_THREAD_NAME_value_2) {
-  testNumValue<int64_t>("NCCL_SET_THREAD_NAME", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_SET_THREAD_NAME, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_SET_THREAD_NAME_value_3) {
-  testNumValue<int64_t>("NCCL_SET_THREAD_NAME", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_SET_THREAD_NAME, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_SHM_DISABLE_value_0) {
-  testNumValue<int64_t>("NCCL_SHM_DISABLE", 0);
-  EXPECT_EQ(NCCL_SHM_DISABLE, 0);
-}
-
-TEST_F(CvarTest, NCCL_SHM_DISABLE_value_1) {
-  testNumValue<int64_t>("NCCL_SHM_DISABLE", 9999);
-  EXPECT_EQ(NCCL_SHM_DISABLE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_SHM_DISABLE_value_2) {
-  testNumValue<int64_t>("NCCL_SHM_DISABLE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_SHM_DISABLE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_SHM_DISABLE_value_3) {
-  testNumValue<int64_t>("NCCL_SHM_DISABLE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_SHM_DISABLE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_SHM_LOCALITY_value_0) {
-  testNumValue<int64_t>("NCCL_SHM_LOCALITY", 0);
-  EXPECT_EQ(NCCL_SHM_LOCALITY, 0);
-}
-
-TEST_F(CvarTest, NCCL_SHM_LOCALITY_value_1) {
-  testNumValue<int64_t>("NCCL_SHM_LOCALITY", 9999);
-  EXPECT_EQ(NCCL_SHM_LOCALITY, 9999);
-}
-
-TEST_F(CvarTest, NCCL_SHM_LOCALITY_value_2) {
-  testNumValue<int64_t>("NCCL_SHM_LOCALITY", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_SHM_LOCALITY, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_SHM_LOCALITY_value_3) {
-  testNumValue<int64_t>("NCCL_SHM_LOCALITY", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_SHM_LOCALITY, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_SHM_LOCALITY_default_value) {
-  testDefaultValue("NCCL_SHM_LOCALITY");
-  EXPECT_EQ(NCCL_SHM_LOCALITY, 2);
-}
-
-TEST_F(CvarTest, NCCL_SHM_MEMCPY_MODE_value_0) {
-  testNumValue<int64_t>("NCCL_SHM_MEMCPY_MODE", 0);
-  EXPECT_EQ(NCCL_SHM_MEMCPY_MODE, 0);
-}
-
-TEST_F(CvarTest, NCCL_SHM_MEMCPY_MODE_value_1) {
-  testNumValue<int64_t>("NCCL_SHM_MEMCPY_MODE", 9999);
-  EXPECT_EQ(NCCL_SHM_MEMCPY_MODE, 9999);
-}
-
-TEST_F(CvarTest, NCCL_SHM_MEMCPY_MODE_value_2) {
-  testNumValue<int64_t>("NCCL_SHM_MEMCPY_MODE", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_SHM_MEMCPY_MODE, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_SHM_MEMCPY_MODE_value_3) {
-  testNumValue<int64_t>("NCCL_SHM_MEMCPY_MODE", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_SHM_MEMCPY_MODE, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_SHM_MEMCPY_MODE_default_value) {
-  testDefaultValue("NCCL_SHM_MEMCPY_MODE");
-  EXPECT_EQ(NCCL_SHM_MEMCPY_MODE, 1);
-}
-
-TEST_F(CvarTest, NCCL_SHM_USE_CUDA_MEMCPY_value_0) {
-  testNumValue<int64_t>("NCCL_SHM_USE_CUDA_MEMCPY", 0);
-  EXPECT_EQ(NCCL_SHM_USE_CUDA_MEMCPY, 0);
-}
-
-TEST_F(CvarTest, NCCL_SHM_USE_CUDA_MEMCPY_value_1) {
-  testNumValue<int64_t>("NCCL_SHM_USE_CUDA_MEMCPY", 9999);
-  EXPECT_EQ(NCCL_SHM_USE_CUDA_MEMCPY, 9999);
-}
-
-TEST_F(CvarTest, NCCL_SHM_USE_CUDA_MEMCPY_value_2) {
-  testNumValue<int64_t>("NCCL_SHM_USE_CUDA_MEMCPY", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_SHM_USE_CUDA_MEMCPY, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_SHM_USE_CUDA_MEMCPY_value_3) {
-  testNumValue<int64_t>("NCCL_SHM_USE_CUDA_MEMCPY", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_SHM_USE_CUDA_MEMCPY, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_FAMILY_value_0) {
-  setenv("NCCL_SOCKET_FAMILY", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_SOCKET_FAMILY, "val1");
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_FAMILY_value_1) {
-  setenv("NCCL_SOCKET_FAMILY", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_SOCKET_FAMILY, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_IFNAME_value_0) {
-  setenv("NCCL_SOCKET_IFNAME", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_SOCKET_IFNAME, "val1");
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_IFNAME_value_1) {
-  setenv("NCCL_SOCKET_IFNAME", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_SOCKET_IFNAME, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_NTHREADS_value_0) {
-  testNumValue<int64_t>("NCCL_SOCKET_NTHREADS", 0);
-  EXPECT_EQ(NCCL_SOCKET_NTHREADS, 0);
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_NTHREADS_value_1) {
-  testNumValue<int64_t>("NCCL_SOCKET_NTHREADS", 9999);
-  EXPECT_EQ(NCCL_SOCKET_NTHREADS, 9999);
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_NTHREADS_value_2) {
-  testNumValue<int64_t>("NCCL_SOCKET_NTHREADS", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_SOCKET_NTHREADS, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_NTHREADS_value_3) {
-  testNumValue<int64_t>("NCCL_SOCKET_NTHREADS", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_SOCKET_NTHREADS, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_SOCKET_NTHREADS_default_value) {
-  testDefaultValue("NCCL_SOCKET_NTHREADS");
-  EXPECT_EQ(NCCL_SOCKET_NTHREADS, -2);
-}
-
-TEST_F(CvarTest, NCCL_THREAD_THRESHOLDS_value_0) {
-  setenv("NCCL_THREAD_THRESHOLDS", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_THREAD_THRESHOLDS, "val1");
-}
-
-TEST_F(CvarTest, NCCL_THREAD_THRESHOLDS_value_1) {
-  setenv("NCCL_THREAD_THRESHOLDS", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_THREAD_THRESHOLDS, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_TOPO_DUMP_FILE_value_0) {
-  setenv("NCCL_TOPO_DUMP_FILE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_TOPO_DUMP_FILE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_TOPO_DUMP_FILE_value_1) {
-  setenv("NCCL_TOPO_DUMP_FILE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_TOPO_DUMP_FILE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_TOPO_DUMP_FILE_RANK_value_0) {
-  testNumValue<int64_t>("NCCL_TOPO_DUMP_FILE_RANK", 0);
-  EXPECT_EQ(NCCL_TOPO_DUMP_FILE_RANK, 0);
-}
-
-TEST_F(CvarTest, NCCL_TOPO_DUMP_FILE_RANK_value_1) {
-  testNumValue<int64_t>("NCCL_TOPO_DUMP_FILE_RANK", 9999);
-  EXPECT_EQ(NCCL_TOPO_DUMP_FILE_RANK, 9999);
-}
-
-TEST_F(CvarTest, NCCL_TOPO_DUMP_FILE_RANK_value_2) {
-  testNumValue<int64_t>("NCCL_TOPO_DUMP_FILE_RANK", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_TOPO_DUMP_FILE_RANK, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_TOPO_DUMP_FILE_RANK_value_3) {
-  testNumValue<int64_t>("NCCL_TOPO_DUMP_FILE_RANK", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_TOPO_DUMP_FILE_RANK, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_TOPO_FILE_value_0) {
-  setenv("NCCL_TOPO_FILE", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_TOPO_FILE, "val1");
-}
-
-TEST_F(CvarTest, NCCL_TOPO_FILE_value_1) {
-  setenv("NCCL_TOPO_FILE", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_TOPO_FILE, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_TOPO_FILE_default_value) {
-  testDefaultValue("NCCL_TOPO_FILE");
-  EXPECT_EQ(NCCL_TOPO_FILE, "/var/run/nvidia-topologyd/virtualTopology.xml");
-}
-
-TEST_F(CvarTest, NCCL_TUNER_PLUGIN_value_0) {
-  setenv("NCCL_TUNER_PLUGIN", "val1", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_TUNER_PLUGIN, "val1");
-}
-
-TEST_F(CvarTest, NCCL_TUNER_PLUGIN_value_1) {
-  setenv("NCCL_TUNER_PLUGIN", "  val2_with_space   ", 1);
-  ncclCvarInit();
-  EXPECT_EQ(NCCL_TUNER_PLUGIN, "val2_with_space");
-}
-
-TEST_F(CvarTest, NCCL_WORK_FIFO_DEPTH_value_0) {
-  testNumValue<int64_t>("NCCL_WORK_FIFO_DEPTH", 0);
-  EXPECT_EQ(NCCL_WORK_FIFO_DEPTH, 0);
-}
-
-TEST_F(CvarTest, NCCL_WORK_FIFO_DEPTH_value_1) {
-  testNumValue<int64_t>("NCCL_WORK_FIFO_DEPTH", 9999);
-  EXPECT_EQ(NCCL_WORK_FIFO_DEPTH, 9999);
-}
-
-TEST_F(CvarTest, NCCL_WORK_FIFO_DEPTH_value_2) {
-  testNumValue<int64_t>("NCCL_WORK_FIFO_DEPTH", std::numeric_limits<int64_t>::max());
-  EXPECT_EQ(NCCL_WORK_FIFO_DEPTH, std::numeric_limits<int64_t>::max());
-}
-
-TEST_F(CvarTest, NCCL_WORK_FIFO_DEPTH_value_3) {
-  testNumValue<int64_t>("NCCL_WORK_FIFO_DEPTH", std::numeric_limits<int64_t>::min());
-  EXPECT_EQ(NCCL_WORK_FIFO_DEPTH, std::numeric_limits<int64_t>::min());
-}
-
-TEST_F(CvarTest, NCCL_WORK_FIFO_DEPTH_default_value) {
-  testDefaultValue("NCCL_WORK_FIFO_DEPTH");
-  EXPECT_EQ(NCCL_WORK_FIFO_DEPTH, 65536);
-}
-
-
-
-/**
-* END of generated tests
-*/
+// Not every cvar type exists in every build
+GTEST_ALLOW_UNINSTANTIATED_PARAMETERIZED_TEST(CvarBoolTest);
+GTEST_ALLOW_UNINSTANTIATED_PARAMETERIZED_TEST(CvarIntTest);
+GTEST_ALLOW_UNINSTANTIATED_PARAMETERIZED_TEST(CvarUintTest);
+GTEST_ALLOW_UNINSTANTIATED_PARAMETERIZED_TEST(CvarFloatTest);
+GTEST_ALLOW_UNINSTANTIATED_PARAMETERIZED_TEST(CvarStringTest);
+GTEST_ALLOW_UNINSTANTIATED_PARAMETERIZED_TEST(CvarStringListTest);
+GTEST_ALLOW_UNINSTANTIATED_PARAMETERIZED_TEST(CvarEnumListTest);
+GTEST_ALLOW_UNINSTANTIATED_PARAMETERIZED_TEST(CvarWarnTest);
 
 int main(int argc, char* argv[]) {
   ::testing::InitGoogleTest(&argc, argv);
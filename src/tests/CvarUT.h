@@ -0,0 +1,99 @@
+// (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+#ifndef CVAR_UT_H_INCLUDED
+#define CVAR_UT_H_INCLUDED
+
+#include <gmock/gmock.h>
+#include <gtest/gtest.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <limits>
+#include <string>
+#include <vector>
+#include "../include/nccl_cvars.h"
+
+/**
+* Test cases of the generated cvar tests (CvarUTShard*.cc by
+* ./maint/extractcvars.py). Every case sets (or, if value is nullptr,
+* unsets) env, calls ncclCvarInit() and compares get() with expected.
+* Cvars are read through value getters converted to a few common types, so
+* that all cvars share a small number of parameterized tests.
+*/
+template <typename T>
+struct CvarCase {
+  const char* label;
+  const char* env;
+  const char* value;
+  T expected;
+  T (*get)();
+};
+
+// Cases expecting a warning containing keyword once the cvar is read
+struct CvarWarnCase {
+  const char* label;
+  const char* env;
+  const char* value;
+  const char* keyword;
+  void (*access)();
+};
+
+// Value of a cvar as T. NCCL code reads both the accessor and the global,
+// so every case also checks that they agree.
+template <typename T, typename U, const U& (*get)(), U* global>
+T cvarValueAs() {
+  T value = static_cast<T>(get());
+  EXPECT_EQ(static_cast<T>(*global), value);
+  return value;
+}
+
+template <uint64_t (*get)(), uint64_t* global>
+uint64_t cvarMaskAs() {
+  uint64_t value = get();
+  EXPECT_EQ(*global, value);
+  return value;
+}
+
+template <typename E, const std::vector<E>& (*get)(), std::vector<E>* global>
+std::vector<int64_t> cvarEnumListAs() {
+  std::vector<int64_t> vals;
+  for (auto v : get()) {
+    vals.push_back(static_cast<int64_t>(v));
+  }
+  EXPECT_EQ(*global, get());
+  return vals;
+}
+
+template <typename U, const U& (*get)()>
+void cvarTouch() {
+  get();
+}
+
+#define CVAR_GET(T, name) \
+  (&cvarValueAs<T, decltype(name), &name##_get, &name>)
+#define CVAR_GET_MASK(name) (&cvarMaskAs<&name##_MASK_get, &name##_MASK>)
+#define CVAR_GET_ENUMLIST(name) \
+  (&cvarEnumListAs<decltype(name)::value_type, &name##_get, &name>)
+#define CVAR_TOUCH(name) (&cvarTouch<decltype(name), &name##_get>)
+
+template <typename T>
+std::string cvarCaseName(const ::testing::TestParamInfo<T>& info) {
+  return info.param.label;
+}
+
+#define INSTANTIATE_CVAR_CASES(shard, suite, cases) \
+  INSTANTIATE_TEST_SUITE_P(                         \
+      shard, suite, ::testing::ValuesIn(cases), cvarCaseName<suite::ParamType>)
+
+class CvarBoolTest : public ::testing::TestWithParam<CvarCase<bool>> {};
+class CvarIntTest : public ::testing::TestWithParam<CvarCase<int64_t>> {};
+class CvarUintTest : public ::testing::TestWithParam<CvarCase<uint64_t>> {};
+class CvarFloatTest : public ::testing::TestWithParam<CvarCase<double>> {};
+class CvarStringTest
+    : public ::testing::TestWithParam<CvarCase<std::string>> {};
+class CvarStringListTest
+    : public ::testing::TestWithParam<CvarCase<std::vector<std::string>>> {};
+class CvarEnumListTest
+    : public ::testing::TestWithParam<CvarCase<std::vector<int64_t>>> {};
+class CvarWarnTest : public ::testing::TestWithParam<CvarWarnCase> {};
+
+#endif /* CVAR_UT_H_INCLUDED */
@@ -0,0 +1,180 @@
+// (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+// Automatically generated by ./maint/extractcvars.py --- START
+// DO NOT EDIT!!!
+
+#include "CvarUT.h"
+
+static const CvarCase<int64_t> intCases[] = {
+  {"NCCL_ALLGATHER_ALGO_single_choice_0", "NCCL_ALLGATHER_ALGO", "orig", int64_t(NCCL_ALLGATHER_ALGO::orig), CVAR_GET(int64_t, NCCL_ALLGATHER_ALGO)},
+  {"NCCL_ALLGATHER_ALGO_single_choice_1", "NCCL_ALLGATHER_ALGO", "ctdirect", int64_t(NCCL_ALLGATHER_ALGO::ctdirect), CVAR_GET(int64_t, NCCL_ALLGATHER_ALGO)},
+  {"NCCL_ALLGATHER_ALGO_single_choice_2", "NCCL_ALLGATHER_ALGO", "ctring", int64_t(NCCL_ALLGATHER_ALGO::ctring), CVAR_GET(int64_t, NCCL_ALLGATHER_ALGO)},
+  {"NCCL_ALLGATHER_ALGO_single_choice_3", "NCCL_ALLGATHER_ALGO", "ctrd", int64_t(NCCL_ALLGATHER_ALGO::ctrd), CVAR_GET(int64_t, NCCL_ALLGATHER_ALGO)},
+  {"NCCL_ALLGATHER_ALGO_default_choice", "NCCL_ALLGATHER_ALGO", nullptr, int64_t(NCCL_ALLGATHER_ALGO::orig), CVAR_GET(int64_t, NCCL_ALLGATHER_ALGO)},
+  {"NCCL_COLLNET_NODE_THRESHOLD_value_0", "NCCL_COLLNET_NODE_THRESHOLD", "0", 0, CVAR_GET(int64_t, NCCL_COLLNET_NODE_THRESHOLD)},
+  {"NCCL_COLLNET_NODE_THRESHOLD_value_1", "NCCL_COLLNET_NODE_THRESHOLD", "9999", 9999, CVAR_GET(int64_t, NCCL_COLLNET_NODE_THRESHOLD)},
+  {"NCCL_COLLNET_NODE_THRESHOLD_value_2", "NCCL_COLLNET_NODE_THRESHOLD", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_COLLNET_NODE_THRESHOLD)},
+  {"NCCL_COLLNET_NODE_THRESHOLD_value_3", "NCCL_COLLNET_NODE_THRESHOLD", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_COLLNET_NODE_THRESHOLD)},
+  {"NCCL_COLLNET_NODE_THRESHOLD_default_value", "NCCL_COLLNET_NODE_THRESHOLD", nullptr, 2, CVAR_GET(int64_t, NCCL_COLLNET_NODE_THRESHOLD)},
+  {"NCCL_COMM_BLOCKING_value_0", "NCCL_COMM_BLOCKING", "0", 0, CVAR_GET(int64_t, NCCL_COMM_BLOCKING)},
+  {"NCCL_COMM_BLOCKING_value_1", "NCCL_COMM_BLOCKING", "9999", 9999, CVAR_GET(int64_t, NCCL_COMM_BLOCKING)},
+  {"NCCL_COMM_BLOCKING_value_2", "NCCL_COMM_BLOCKING", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_COMM_BLOCKING)},
+  {"NCCL_COMM_BLOCKING_value_3", "NCCL_COMM_BLOCKING", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_COMM_BLOCKING)},
+  {"NCCL_COMM_BLOCKING_default_value", "NCCL_COMM_BLOCKING", nullptr, -1, CVAR_GET(int64_t, NCCL_COMM_BLOCKING)},
+  {"NCCL_CTRAN_IB_MAX_QPS_value_0", "NCCL_CTRAN_IB_MAX_QPS", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_IB_MAX_QPS)},
+  {"NCCL_CTRAN_IB_MAX_QPS_value_1", "NCCL_CTRAN_IB_MAX_QPS", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_IB_MAX_QPS)},
+  {"NCCL_CTRAN_IB_MAX_QPS_value_2", "NCCL_CTRAN_IB_MAX_QPS", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_IB_MAX_QPS)},
+  {"NCCL_CTRAN_IB_MAX_QPS_value_3", "NCCL_CTRAN_IB_MAX_QPS", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_IB_MAX_QPS)},
+  {"NCCL_CTRAN_IB_MAX_QPS_default_value", "NCCL_CTRAN_IB_MAX_QPS", nullptr, 1, CVAR_GET(int64_t, NCCL_CTRAN_IB_MAX_QPS)},
+  {"NCCL_GDRCOPY_SYNC_ENABLE_value_0", "NCCL_GDRCOPY_SYNC_ENABLE", "0", 0, CVAR_GET(int64_t, NCCL_GDRCOPY_SYNC_ENABLE)},
+  {"NCCL_GDRCOPY_SYNC_ENABLE_value_1", "NCCL_GDRCOPY_SYNC_ENABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_GDRCOPY_SYNC_ENABLE)},
+  {"NCCL_GDRCOPY_SYNC_ENABLE_value_2", "NCCL_GDRCOPY_SYNC_ENABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_GDRCOPY_SYNC_ENABLE)},
+  {"NCCL_GDRCOPY_SYNC_ENABLE_value_3", "NCCL_GDRCOPY_SYNC_ENABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_GDRCOPY_SYNC_ENABLE)},
+  {"NCCL_GDRCOPY_SYNC_ENABLE_default_value", "NCCL_GDRCOPY_SYNC_ENABLE", nullptr, 1, CVAR_GET(int64_t, NCCL_GDRCOPY_SYNC_ENABLE)},
+  {"NCCL_IB_MERGE_VFS_value_0", "NCCL_IB_MERGE_VFS", "0", 0, CVAR_GET(int64_t, NCCL_IB_MERGE_VFS)},
+  {"NCCL_IB_MERGE_VFS_value_1", "NCCL_IB_MERGE_VFS", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_MERGE_VFS)},
+  {"NCCL_IB_MERGE_VFS_value_2", "NCCL_IB_MERGE_VFS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_MERGE_VFS)},
+  {"NCCL_IB_MERGE_VFS_value_3", "NCCL_IB_MERGE_VFS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_MERGE_VFS)},
+  {"NCCL_IB_MERGE_VFS_default_value", "NCCL_IB_MERGE_VFS", nullptr, 1, CVAR_GET(int64_t, NCCL_IB_MERGE_VFS)},
+  {"NCCL_IB_RETRY_CNT_value_0", "NCCL_IB_RETRY_CNT", "0", 0, CVAR_GET(int64_t, NCCL_IB_RETRY_CNT)},
+  {"NCCL_IB_RETRY_CNT_value_1", "NCCL_IB_RETRY_CNT", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_RETRY_CNT)},
+  {"NCCL_IB_RETRY_CNT_value_2", "NCCL_IB_RETRY_CNT", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_RETRY_CNT)},
+  {"NCCL_IB_RETRY_CNT_value_3", "NCCL_IB_RETRY_CNT", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_RETRY_CNT)},
+  {"NCCL_IB_RETRY_CNT_default_value", "NCCL_IB_RETRY_CNT", nullptr, 7, CVAR_GET(int64_t, NCCL_IB_RETRY_CNT)},
+  {"NCCL_IB_SPLIT_DATA_ON_QPS_value_0", "NCCL_IB_SPLIT_DATA_ON_QPS", "0", 0, CVAR_GET(int64_t, NCCL_IB_SPLIT_DATA_ON_QPS)},
+  {"NCCL_IB_SPLIT_DATA_ON_QPS_value_1", "NCCL_IB_SPLIT_DATA_ON_QPS", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_SPLIT_DATA_ON_QPS)},
+  {"NCCL_IB_SPLIT_DATA_ON_QPS_value_2", "NCCL_IB_SPLIT_DATA_ON_QPS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_SPLIT_DATA_ON_QPS)},
+  {"NCCL_IB_SPLIT_DATA_ON_QPS_value_3", "NCCL_IB_SPLIT_DATA_ON_QPS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_SPLIT_DATA_ON_QPS)},
+  {"NCCL_IB_SPLIT_DATA_ON_QPS_default_value", "NCCL_IB_SPLIT_DATA_ON_QPS", nullptr, 1, CVAR_GET(int64_t, NCCL_IB_SPLIT_DATA_ON_QPS)},
+  {"NCCL_IGNORE_DISABLED_P2P_value_0", "NCCL_IGNORE_DISABLED_P2P", "0", 0, CVAR_GET(int64_t, NCCL_IGNORE_DISABLED_P2P)},
+  {"NCCL_IGNORE_DISABLED_P2P_value_1", "NCCL_IGNORE_DISABLED_P2P", "9999", 9999, CVAR_GET(int64_t, NCCL_IGNORE_DISABLED_P2P)},
+  {"NCCL_IGNORE_DISABLED_P2P_value_2", "NCCL_IGNORE_DISABLED_P2P", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IGNORE_DISABLED_P2P)},
+  {"NCCL_IGNORE_DISABLED_P2P_value_3", "NCCL_IGNORE_DISABLED_P2P", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IGNORE_DISABLED_P2P)},
+  {"NCCL_LL128_BUFFSIZE_value_0", "NCCL_LL128_BUFFSIZE", "0", 0, CVAR_GET(int64_t, NCCL_LL128_BUFFSIZE)},
+  {"NCCL_LL128_BUFFSIZE_value_1", "NCCL_LL128_BUFFSIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_LL128_BUFFSIZE)},
+  {"NCCL_LL128_BUFFSIZE_value_2", "NCCL_LL128_BUFFSIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_LL128_BUFFSIZE)},
+  {"NCCL_LL128_BUFFSIZE_value_3", "NCCL_LL128_BUFFSIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_LL128_BUFFSIZE)},
+  {"NCCL_LL128_BUFFSIZE_default_value", "NCCL_LL128_BUFFSIZE", nullptr, -2, CVAR_GET(int64_t, NCCL_LL128_BUFFSIZE)},
+  {"NCCL_LOGGER_MODE_single_choice_0", "NCCL_LOGGER_MODE", "sync", int64_t(NCCL_LOGGER_MODE::sync), CVAR_GET(int64_t, NCCL_LOGGER_MODE)},
+  {"NCCL_LOGGER_MODE_single_choice_1", "NCCL_LOGGER_MODE", "async", int64_t(NCCL_LOGGER_MODE::async), CVAR_GET(int64_t, NCCL_LOGGER_MODE)},
+  {"NCCL_LOGGER_MODE_default_choice", "NCCL_LOGGER_MODE", nullptr, int64_t(NCCL_LOGGER_MODE::sync), CVAR_GET(int64_t, NCCL_LOGGER_MODE)},
+  {"NCCL_MAX_NRINGS_value_0", "NCCL_MAX_NRINGS", "0", 0, CVAR_GET(int64_t, NCCL_MAX_NRINGS)},
+  {"NCCL_MAX_NRINGS_value_1", "NCCL_MAX_NRINGS", "9999", 9999, CVAR_GET(int64_t, NCCL_MAX_NRINGS)},
+  {"NCCL_MAX_NRINGS_value_2", "NCCL_MAX_NRINGS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MAX_NRINGS)},
+  {"NCCL_MAX_NRINGS_value_3", "NCCL_MAX_NRINGS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_MAX_NRINGS)},
+  {"NCCL_MAX_NRINGS_default_value", "NCCL_MAX_NRINGS", nullptr, -2, CVAR_GET(int64_t, NCCL_MAX_NRINGS)},
+  {"NCCL_MAX_P2P_NCHANNELS_value_0", "NCCL_MAX_P2P_NCHANNELS", "0", 0, CVAR_GET(int64_t, NCCL_MAX_P2P_NCHANNELS)},
+  {"NCCL_MAX_P2P_NCHANNELS_value_1", "NCCL_MAX_P2P_NCHANNELS", "9999", 9999, CVAR_GET(int64_t, NCCL_MAX_P2P_NCHANNELS)},
+  {"NCCL_MAX_P2P_NCHANNELS_value_2", "NCCL_MAX_P2P_NCHANNELS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MAX_P2P_NCHANNELS)},
+  {"NCCL_MAX_P2P_NCHANNELS_value_3", "NCCL_MAX_P2P_NCHANNELS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_MAX_P2P_NCHANNELS)},
+  {"NCCL_MAX_P2P_NCHANNELS_default_value", "NCCL_MAX_P2P_NCHANNELS", nullptr, std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MAX_P2P_NCHANNELS)},
+  {"NCCL_MEM_SYNC_DOMAIN_single_choice_0", "NCCL_MEM_SYNC_DOMAIN", "local", int64_t(NCCL_MEM_SYNC_DOMAIN::local), CVAR_GET(int64_t, NCCL_MEM_SYNC_DOMAIN)},
+  {"NCCL_MEM_SYNC_DOMAIN_single_choice_1", "NCCL_MEM_SYNC_DOMAIN", "remote", int64_t(NCCL_MEM_SYNC_DOMAIN::remote), CVAR_GET(int64_t, NCCL_MEM_SYNC_DOMAIN)},
+  {"NCCL_MEM_SYNC_DOMAIN_default_choice", "NCCL_MEM_SYNC_DOMAIN", nullptr, int64_t(NCCL_MEM_SYNC_DOMAIN::remote), CVAR_GET(int64_t, NCCL_MEM_SYNC_DOMAIN)},
+  {"NCCL_MIN_CTAS_value_0", "NCCL_MIN_CTAS", "0", 0, CVAR_GET(int64_t, NCCL_MIN_CTAS)},
+  {"NCCL_MIN_CTAS_value_1", "NCCL_MIN_CTAS", "9999", 9999, CVAR_GET(int64_t, NCCL_MIN_CTAS)},
+  {"NCCL_MIN_CTAS_value_2", "NCCL_MIN_CTAS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MIN_CTAS)},
+  {"NCCL_MIN_CTAS_value_3", "NCCL_MIN_CTAS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_MIN_CTAS)},
+  {"NCCL_MIN_CTAS_default_value", "NCCL_MIN_CTAS", nullptr, -1, CVAR_GET(int64_t, NCCL_MIN_CTAS)},
+  {"NCCL_NET_FORCE_FLUSH_value_0", "NCCL_NET_FORCE_FLUSH", "0", 0, CVAR_GET(int64_t, NCCL_NET_FORCE_FLUSH)},
+  {"NCCL_NET_FORCE_FLUSH_value_1", "NCCL_NET_FORCE_FLUSH", "9999", 9999, CVAR_GET(int64_t, NCCL_NET_FORCE_FLUSH)},
+  {"NCCL_NET_FORCE_FLUSH_value_2", "NCCL_NET_FORCE_FLUSH", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NET_FORCE_FLUSH)},
+  {"NCCL_NET_FORCE_FLUSH_value_3", "NCCL_NET_FORCE_FLUSH", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NET_FORCE_FLUSH)},
+  {"NCCL_NET_FORCE_FLUSH_default_value", "NCCL_NET_FORCE_FLUSH", nullptr, 1, CVAR_GET(int64_t, NCCL_NET_FORCE_FLUSH)},
+  {"NCCL_NVB_PRECONNECT_value_0", "NCCL_NVB_PRECONNECT", "0", 0, CVAR_GET(int64_t, NCCL_NVB_PRECONNECT)},
+  {"NCCL_NVB_PRECONNECT_value_1", "NCCL_NVB_PRECONNECT", "9999", 9999, CVAR_GET(int64_t, NCCL_NVB_PRECONNECT)},
+  {"NCCL_NVB_PRECONNECT_value_2", "NCCL_NVB_PRECONNECT", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NVB_PRECONNECT)},
+  {"NCCL_NVB_PRECONNECT_value_3", "NCCL_NVB_PRECONNECT", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NVB_PRECONNECT)},
+  {"NCCL_NVB_PRECONNECT_default_value", "NCCL_NVB_PRECONNECT", nullptr, 1, CVAR_GET(int64_t, NCCL_NVB_PRECONNECT)},
+  {"NCCL_P2P_NVL_CHUNKSIZE_value_0", "NCCL_P2P_NVL_CHUNKSIZE", "0", 0, CVAR_GET(int64_t, NCCL_P2P_NVL_CHUNKSIZE)},
+  {"NCCL_P2P_NVL_CHUNKSIZE_value_1", "NCCL_P2P_NVL_CHUNKSIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_P2P_NVL_CHUNKSIZE)},
+  {"NCCL_P2P_NVL_CHUNKSIZE_value_2", "NCCL_P2P_NVL_CHUNKSIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_P2P_NVL_CHUNKSIZE)},
+  {"NCCL_P2P_NVL_CHUNKSIZE_value_3", "NCCL_P2P_NVL_CHUNKSIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_P2P_NVL_CHUNKSIZE)},
+  {"NCCL_P2P_NVL_CHUNKSIZE_default_value", "NCCL_P2P_NVL_CHUNKSIZE", nullptr, 524288, CVAR_GET(int64_t, NCCL_P2P_NVL_CHUNKSIZE)},
+  {"NCCL_P2P_PCI_CHUNKSIZE_value_0", "NCCL_P2P_PCI_CHUNKSIZE", "0", 0, CVAR_GET(int64_t, NCCL_P2P_PCI_CHUNKSIZE)},
+  {"NCCL_P2P_PCI_CHUNKSIZE_value_1", "NCCL_P2P_PCI_CHUNKSIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_P2P_PCI_CHUNKSIZE)},
+  {"NCCL_P2P_PCI_CHUNKSIZE_value_2", "NCCL_P2P_PCI_CHUNKSIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_P2P_PCI_CHUNKSIZE)},
+  {"NCCL_P2P_PCI_CHUNKSIZE_value_3", "NCCL_P2P_PCI_CHUNKSIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_P2P_PCI_CHUNKSIZE)},
+  {"NCCL_P2P_PCI_CHUNKSIZE_default_value", "NCCL_P2P_PCI_CHUNKSIZE", nullptr, 131072, CVAR_GET(int64_t, NCCL_P2P_PCI_CHUNKSIZE)},
+  {"NCCL_P2P_PXN_LEVEL_value_0", "NCCL_P2P_PXN_LEVEL", "0", 0, CVAR_GET(int64_t, NCCL_P2P_PXN_LEVEL)},
+  {"NCCL_P2P_PXN_LEVEL_value_1", "NCCL_P2P_PXN_LEVEL", "9999", 9999, CVAR_GET(int64_t, NCCL_P2P_PXN_LEVEL)},
+  {"NCCL_P2P_PXN_LEVEL_value_2", "NCCL_P2P_PXN_LEVEL", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_P2P_PXN_LEVEL)},
+  {"NCCL_P2P_PXN_LEVEL_value_3", "NCCL_P2P_PXN_LEVEL", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_P2P_PXN_LEVEL)},
+  {"NCCL_P2P_PXN_LEVEL_default_value", "NCCL_P2P_PXN_LEVEL", nullptr, 2, CVAR_GET(int64_t, NCCL_P2P_PXN_LEVEL)},
+  {"NCCL_PROGRESS_APPENDOP_FREQ_value_0", "NCCL_PROGRESS_APPENDOP_FREQ", "0", 0, CVAR_GET(int64_t, NCCL_PROGRESS_APPENDOP_FREQ)},
+  {"NCCL_PROGRESS_APPENDOP_FREQ_value_1", "NCCL_PROGRESS_APPENDOP_FREQ", "9999", 9999, CVAR_GET(int64_t, NCCL_PROGRESS_APPENDOP_FREQ)},
+  {"NCCL_PROGRESS_APPENDOP_FREQ_value_2", "NCCL_PROGRESS_APPENDOP_FREQ", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_PROGRESS_APPENDOP_FREQ)},
+  {"NCCL_PROGRESS_APPENDOP_FREQ_value_3", "NCCL_PROGRESS_APPENDOP_FREQ", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_PROGRESS_APPENDOP_FREQ)},
+  {"NCCL_PROGRESS_APPENDOP_FREQ_default_value", "NCCL_PROGRESS_APPENDOP_FREQ", nullptr, 8, CVAR_GET(int64_t, NCCL_PROGRESS_APPENDOP_FREQ)},
+  {"NCCL_PROXY_APPEND_BATCH_SIZE_value_0", "NCCL_PROXY_APPEND_BATCH_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_PROXY_APPEND_BATCH_SIZE)},
+  {"NCCL_PROXY_APPEND_BATCH_SIZE_value_1", "NCCL_PROXY_APPEND_BATCH_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_PROXY_APPEND_BATCH_SIZE)},
+  {"NCCL_PROXY_APPEND_BATCH_SIZE_value_2", "NCCL_PROXY_APPEND_BATCH_SIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_PROXY_APPEND_BATCH_SIZE)},
+  {"NCCL_PROXY_APPEND_BATCH_SIZE_value_3", "NCCL_PROXY_APPEND_BATCH_SIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_PROXY_APPEND_BATCH_SIZE)},
+  {"NCCL_PROXY_APPEND_BATCH_SIZE_default_value", "NCCL_PROXY_APPEND_BATCH_SIZE", nullptr, 16, CVAR_GET(int64_t, NCCL_PROXY_APPEND_BATCH_SIZE)},
+  {"NCCL_SHM_LOCALITY_value_0", "NCCL_SHM_LOCALITY", "0", 0, CVAR_GET(int64_t, NCCL_SHM_LOCALITY)},
+  {"NCCL_SHM_LOCALITY_value_1", "NCCL_SHM_LOCALITY", "9999", 9999, CVAR_GET(int64_t, NCCL_SHM_LOCALITY)},
+  {"NCCL_SHM_LOCALITY_value_2", "NCCL_SHM_LOCALITY", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_SHM_LOCALITY)},
+  {"NCCL_SHM_LOCALITY_value_3", "NCCL_SHM_LOCALITY", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_SHM_LOCALITY)},
+  {"NCCL_SHM_LOCALITY_default_value", "NCCL_SHM_LOCALITY", nullptr, 2, CVAR_GET(int64_t, NCCL_SHM_LOCALITY)},
+  {"NCCL_WORK_FIFO_DEPTH_value_0", "NCCL_WORK_FIFO_DEPTH", "0", 0, CVAR_GET(int64_t, NCCL_WORK_FIFO_DEPTH)},
+  {"NCCL_WORK_FIFO_DEPTH_value_1", "NCCL_WORK_FIFO_DEPTH", "9999", 9999, CVAR_GET(int64_t, NCCL_WORK_FIFO_DEPTH)},
+  {"NCCL_WORK_FIFO_DEPTH_value_2", "NCCL_WORK_FIFO_DEPTH", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_WORK_FIFO_DEPTH)},
+  {"NCCL_WORK_FIFO_DEPTH_value_3", "NCCL_WORK_FIFO_DEPTH", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_WORK_FIFO_DEPTH)},
+  {"NCCL_WORK_FIFO_DEPTH_default_value", "NCCL_WORK_FIFO_DEPTH", nullptr, 65536, CVAR_GET(int64_t, NCCL_WORK_FIFO_DEPTH)},
+};
+INSTANTIATE_CVAR_CASES(Shard0, CvarIntTest, intCases);
+
+static const CvarCase<uint64_t> uintCases[] = {
+  {"NCCL_CTRAN_IB_CTRL_TC_value_0", "NCCL_CTRAN_IB_CTRL_TC", "0", 0, CVAR_GET(uint64_t, NCCL_CTRAN_IB_CTRL_TC)},
+  {"NCCL_CTRAN_IB_CTRL_TC_value_1", "NCCL_CTRAN_IB_CTRL_TC", "9999", 9999, CVAR_GET(uint64_t, NCCL_CTRAN_IB_CTRL_TC)},
+  {"NCCL_CTRAN_IB_CTRL_TC_value_2", "NCCL_CTRAN_IB_CTRL_TC", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_CTRAN_IB_CTRL_TC)},
+  {"NCCL_CTRAN_IB_CTRL_TC_value_3", "NCCL_CTRAN_IB_CTRL_TC", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_CTRAN_IB_CTRL_TC)},
+  {"NCCL_CTRAN_IB_CTRL_TC_default_value", "NCCL_CTRAN_IB_CTRL_TC", nullptr, 192, CVAR_GET(uint64_t, NCCL_CTRAN_IB_CTRL_TC)},
+  {"NCCL_CTRAN_RING_STEP_value_0", "NCCL_CTRAN_RING_STEP", "0", 0, CVAR_GET(uint64_t, NCCL_CTRAN_RING_STEP)},
+  {"NCCL_CTRAN_RING_STEP_value_1", "NCCL_CTRAN_RING_STEP", "9999", 9999, CVAR_GET(uint64_t, NCCL_CTRAN_RING_STEP)},
+  {"NCCL_CTRAN_RING_STEP_value_2", "NCCL_CTRAN_RING_STEP", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_CTRAN_RING_STEP)},
+  {"NCCL_CTRAN_RING_STEP_value_3", "NCCL_CTRAN_RING_STEP", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_CTRAN_RING_STEP)},
+  {"NCCL_CTRAN_RING_STEP_default_value", "NCCL_CTRAN_RING_STEP", nullptr, 4194304, CVAR_GET(uint64_t, NCCL_CTRAN_RING_STEP)},
+  {"NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_value_0", "NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", "0", 0, CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD)},
+  {"NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_value_1", "NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", "9999", 9999, CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD)},
+  {"NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_value_2", "NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD)},
+  {"NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_value_3", "NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD)},
+  {"NCCL_DDA_ALLREDUCE_TREE_THRESHOLD_default_value", "NCCL_DDA_ALLREDUCE_TREE_THRESHOLD", nullptr, 262144, CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_TREE_THRESHOLD)},
+};
+INSTANTIATE_CVAR_CASES(Shard0, CvarUintTest, uintCases);
+
+static const CvarCase<std::string> stringCases[] = {
+  {"NCCL_DEBUG_FILE_value_0", "NCCL_DEBUG_FILE", "val1", "val1", CVAR_GET(std::string, NCCL_DEBUG_FILE)},
+  {"NCCL_DEBUG_FILE_value_1", "NCCL_DEBUG_FILE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_DEBUG_FILE)},
+  {"NCCL_GRAPH_DUMP_FILE_value_0", "NCCL_GRAPH_DUMP_FILE", "val1", "val1", CVAR_GET(std::string, NCCL_GRAPH_DUMP_FILE)},
+  {"NCCL_GRAPH_DUMP_FILE_value_1", "NCCL_GRAPH_DUMP_FILE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_GRAPH_DUMP_FILE)},
+  {"NCCL_NETWORK_value_0", "NCCL_NET", "val1", "val1", CVAR_GET(std::string, NCCL_NETWORK)},
+  {"NCCL_NETWORK_value_1", "NCCL_NET", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_NETWORK)},
+  {"NCCL_NET_GDR_LEVEL_value_0", "NCCL_NET_GDR_LEVEL", "val1", "val1", CVAR_GET(std::string, NCCL_NET_GDR_LEVEL)},
+  {"NCCL_NET_GDR_LEVEL_value_1", "NCCL_NET_GDR_LEVEL", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_NET_GDR_LEVEL)},
+  {"NCCL_PROTO_value_0", "NCCL_PROTO", "val1", "val1", CVAR_GET(std::string, NCCL_PROTO)},
+  {"NCCL_PROTO_value_1", "NCCL_PROTO", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_PROTO)},
+  {"NCCL_PROXY_PROFILE_value_0", "NCCL_PROXY_PROFILE", "val1", "val1", CVAR_GET(std::string, NCCL_PROXY_PROFILE)},
+  {"NCCL_PROXY_PROFILE_value_1", "NCCL_PROXY_PROFILE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_PROXY_PROFILE)},
+  {"NCCL_PROXY_PROFILE_DIR_value_0", "NCCL_PROXY_PROFILE_DIR", "val1", "val1", CVAR_GET(std::string, NCCL_PROXY_PROFILE_DIR)},
+  {"NCCL_PROXY_PROFILE_DIR_value_1", "NCCL_PROXY_PROFILE_DIR", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_PROXY_PROFILE_DIR)},
+  {"NCCL_PROXY_PROFILE_DIR_default_value", "NCCL_PROXY_PROFILE_DIR", nullptr, "/tmp", CVAR_GET(std::string, NCCL_PROXY_PROFILE_DIR)},
+  {"NCCL_SOCKET_FAMILY_value_0", "NCCL_SOCKET_FAMILY", "val1", "val1", CVAR_GET(std::string, NCCL_SOCKET_FAMILY)},
+  {"NCCL_SOCKET_FAMILY_value_1", "NCCL_SOCKET_FAMILY", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_SOCKET_FAMILY)},
+  {"NCCL_SOCKET_IFNAME_value_0", "NCCL_SOCKET_IFNAME", "val1", "val1", CVAR_GET(std::string, NCCL_SOCKET_IFNAME)},
+  {"NCCL_SOCKET_IFNAME_value_1", "NCCL_SOCKET_IFNAME", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_SOCKET_IFNAME)},
+  {"NCCL_TOPO_DUMP_FILE_value_0", "NCCL_TOPO_DUMP_FILE", "val1", "val1", CVAR_GET(std::string, NCCL_TOPO_DUMP_FILE)},
+  {"NCCL_TOPO_DUMP_FILE_value_1", "NCCL_TOPO_DUMP_FILE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_TOPO_DUMP_FILE)},
+  {"NCCL_TUNER_PLUGIN_value_0", "NCCL_TUNER_PLUGIN", "val1", "val1", CVAR_GET(std::string, NCCL_TUNER_PLUGIN)},
+  {"NCCL_TUNER_PLUGIN_value_1", "NCCL_TUNER_PLUGIN", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_TUNER_PLUGIN)},
+};
+INSTANTIATE_CVAR_CASES(Shard0, CvarStringTest, stringCases);
+
+static const CvarWarnCase warnCases[] = {
+  {"NCCL_ALLGATHER_ALGO_warn_unknown_val", "NCCL_ALLGATHER_ALGO", "dummy", "Unknown value", CVAR_TOUCH(NCCL_ALLGATHER_ALGO)},
+  {"NCCL_LOGGER_MODE_warn_unknown_val", "NCCL_LOGGER_MODE", "dummy", "Unknown value", CVAR_TOUCH(NCCL_LOGGER_MODE)},
+  {"NCCL_MEM_SYNC_DOMAIN_warn_unknown_val", "NCCL_MEM_SYNC_DOMAIN", "dummy", "Unknown value", CVAR_TOUCH(NCCL_MEM_SYNC_DOMAIN)},
+};
+INSTANTIATE_CVAR_CASES(Shard0, CvarWarnTest, warnCases);
+
+// Automatically generated by ./maint/extractcvars.py --- END
@@ -0,0 +1,213 @@
+// (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+// Automatically generated by ./maint/extractcvars.py --- START
+// DO NOT EDIT!!!
+
+#include "CvarUT.h"
+
+static const CvarCase<bool> boolCases[] = {
+  {"NCCL_CTRAN_AG_RD_RTR_value_y0", "NCCL_CTRAN_AG_RD_RTR", "y", true, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+  {"NCCL_CTRAN_AG_RD_RTR_value_y1", "NCCL_CTRAN_AG_RD_RTR", "yes", true, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+  {"NCCL_CTRAN_AG_RD_RTR_value_y2", "NCCL_CTRAN_AG_RD_RTR", "true", true, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+  {"NCCL_CTRAN_AG_RD_RTR_value_y3", "NCCL_CTRAN_AG_RD_RTR", "1", true, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+  {"NCCL_CTRAN_AG_RD_RTR_value_n0", "NCCL_CTRAN_AG_RD_RTR", "n", false, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+  {"NCCL_CTRAN_AG_RD_RTR_value_n1", "NCCL_CTRAN_AG_RD_RTR", "no", false, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+  {"NCCL_CTRAN_AG_RD_RTR_value_n2", "NCCL_CTRAN_AG_RD_RTR", "false", false, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+  {"NCCL_CTRAN_AG_RD_RTR_value_n3", "NCCL_CTRAN_AG_RD_RTR", "0", false, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+  {"NCCL_CTRAN_AG_RD_RTR_default_value", "NCCL_CTRAN_AG_RD_RTR", nullptr, true, CVAR_GET(bool, NCCL_CTRAN_AG_RD_RTR)},
+};
+INSTANTIATE_CVAR_CASES(Shard1, CvarBoolTest, boolCases);
+
+static const CvarCase<int64_t> intCases[] = {
+  {"NCCL_AGG_CHANNEL_SIZE_value_0", "NCCL_AGG_CHANNEL_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_AGG_CHANNEL_SIZE)},
+  {"NCCL_AGG_CHANNEL_SIZE_value_1", "NCCL_AGG_CHANNEL_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_AGG_CHANNEL_SIZE)},
+  {"NCCL_AGG_CHANNEL_SIZE_value_2", "NCCL_AGG_CHANNEL_SIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_AGG_CHANNEL_SIZE)},
+  {"NCCL_AGG_CHANNEL_SIZE_value_3", "NCCL_AGG_CHANNEL_SIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_AGG_CHANNEL_SIZE)},
+  {"NCCL_AGG_CHANNEL_SIZE_default_value", "NCCL_AGG_CHANNEL_SIZE", nullptr, -2, CVAR_GET(int64_t, NCCL_AGG_CHANNEL_SIZE)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_value_0", "NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", "0", 0, CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_value_1", "NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", "9999", 9999, CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_value_2", "NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_value_3", "NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS_default_value", "NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS", nullptr, -1, CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_NUM_THREAD_BLOCKS)},
+  {"NCCL_CHECK_POINTERS_value_0", "NCCL_CHECK_POINTERS", "0", 0, CVAR_GET(int64_t, NCCL_CHECK_POINTERS)},
+  {"NCCL_CHECK_POINTERS_value_1", "NCCL_CHECK_POINTERS", "9999", 9999, CVAR_GET(int64_t, NCCL_CHECK_POINTERS)},
+  {"NCCL_CHECK_POINTERS_value_2", "NCCL_CHECK_POINTERS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_CHECK_POINTERS)},
+  {"NCCL_CHECK_POINTERS_value_3", "NCCL_CHECK_POINTERS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_CHECK_POINTERS)},
+  {"NCCL_CHUNK_SIZE_value_0", "NCCL_CHUNK_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_CHUNK_SIZE)},
+  {"NCCL_CHUNK_SIZE_value_1", "NCCL_CHUNK_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_CHUNK_SIZE)},
+  {"NCCL_CHUNK_SIZE_value_2", "NCCL_CHUNK_SIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_CHUNK_SIZE)},
+  {"NCCL_CHUNK_SIZE_value_3", "NCCL_CHUNK_SIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_CHUNK_SIZE)},
+  {"NCCL_CONNECT_ROUND_SIZE_value_0", "NCCL_CONNECT_ROUND_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_CONNECT_ROUND_SIZE)},
+  {"NCCL_CONNECT_ROUND_SIZE_value_1", "NCCL_CONNECT_ROUND_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_CONNECT_ROUND_SIZE)},
+  {"NCCL_CONNECT_ROUND_SIZE_value_2", "NCCL_CONNECT_ROUND_SIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_CONNECT_ROUND_SIZE)},
+  {"NCCL_CONNECT_ROUND_SIZE_value_3", "NCCL_CONNECT_ROUND_SIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_CONNECT_ROUND_SIZE)},
+  {"NCCL_CONNECT_ROUND_SIZE_default_value", "NCCL_CONNECT_ROUND_SIZE", nullptr, 128, CVAR_GET(int64_t, NCCL_CONNECT_ROUND_SIZE)},
+  {"NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_value_0", "NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_value_1", "NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_value_2", "NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_value_3", "NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE_default_value", "NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE", nullptr, 640, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_value_0", "NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_value_1", "NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_value_2", "NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_value_3", "NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS_default_value", "NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS", nullptr, -1, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_NUM_THREAD_BLOCKS)},
+  {"NCCL_DDA_ALLREDUCE_MAX_BLOCKS_value_0", "NCCL_DDA_ALLREDUCE_MAX_BLOCKS", "0", 0, CVAR_GET(int64_t, NCCL_DDA_ALLREDUCE_MAX_BLOCKS)},
+  {"NCCL_DDA_ALLREDUCE_MAX_BLOCKS_value_1", "NCCL_DDA_ALLREDUCE_MAX_BLOCKS", "9999", 9999, CVAR_GET(int64_t, NCCL_DDA_ALLREDUCE_MAX_BLOCKS)},
+  {"NCCL_DDA_ALLREDUCE_MAX_BLOCKS_value_2", "NCCL_DDA_ALLREDUCE_MAX_BLOCKS", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_DDA_ALLREDUCE_MAX_BLOCKS)},
+  {"NCCL_DDA_ALLREDUCE_MAX_BLOCKS_value_3", "NCCL_DDA_ALLREDUCE_MAX_BLOCKS", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_DDA_ALLREDUCE_MAX_BLOCKS)},
+  {"NCCL_DDA_ALLREDUCE_MAX_BLOCKS_default_value", "NCCL_DDA_ALLREDUCE_MAX_BLOCKS", nullptr, 24, CVAR_GET(int64_t, NCCL_DDA_ALLREDUCE_MAX_BLOCKS)},
+  {"NCCL_DMABUF_ENABLE_value_0", "NCCL_DMABUF_ENABLE", "0", 0, CVAR_GET(int64_t, NCCL_DMABUF_ENABLE)},
+  {"NCCL_DMABUF_ENABLE_value_1", "NCCL_DMABUF_ENABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_DMABUF_ENABLE)},
+  {"NCCL_DMABUF_ENABLE_value_2", "NCCL_DMABUF_ENABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_DMABUF_ENABLE)},
+  {"NCCL_DMABUF_ENABLE_value_3", "NCCL_DMABUF_ENABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_DMABUF_ENABLE)},
+  {"NCCL_DMABUF_ENABLE_default_value", "NCCL_DMABUF_ENABLE", nullptr, 1, CVAR_GET(int64_t, NCCL_DMABUF_ENABLE)},
+  {"NCCL_GDRCOPY_FLUSH_ENABLE_value_0", "NCCL_GDRCOPY_FLUSH_ENABLE", "0", 0, CVAR_GET(int64_t, NCCL_GDRCOPY_FLUSH_ENABLE)},
+  {"NCCL_GDRCOPY_FLUSH_ENABLE_value_1", "NCCL_GDRCOPY_FLUSH_ENABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_GDRCOPY_FLUSH_ENABLE)},
+  {"NCCL_GDRCOPY_FLUSH_ENABLE_value_2", "NCCL_GDRCOPY_FLUSH_ENABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_GDRCOPY_FLUSH_ENABLE)},
+  {"NCCL_GDRCOPY_FLUSH_ENABLE_value_3", "NCCL_GDRCOPY_FLUSH_ENABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_GDRCOPY_FLUSH_ENABLE)},
+  {"NCCL_GRAPH_MIXING_SUPPORT_value_0", "NCCL_GRAPH_MIXING_SUPPORT", "0", 0, CVAR_GET(int64_t, NCCL_GRAPH_MIXING_SUPPORT)},
+  {"NCCL_GRAPH_MIXING_SUPPORT_value_1", "NCCL_GRAPH_MIXING_SUPPORT", "9999", 9999, CVAR_GET(int64_t, NCCL_GRAPH_MIXING_SUPPORT)},
+  {"NCCL_GRAPH_MIXING_SUPPORT_value_2", "NCCL_GRAPH_MIXING_SUPPORT", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_GRAPH_MIXING_SUPPORT)},
+  {"NCCL_GRAPH_MIXING_SUPPORT_value_3", "NCCL_GRAPH_MIXING_SUPPORT", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_GRAPH_MIXING_SUPPORT)},
+  {"NCCL_GRAPH_MIXING_SUPPORT_default_value", "NCCL_GRAPH_MIXING_SUPPORT", nullptr, 1, CVAR_GET(int64_t, NCCL_GRAPH_MIXING_SUPPORT)},
+  {"NCCL_IB_ADAPTIVE_ROUTING_value_0", "NCCL_IB_ADAPTIVE_ROUTING", "0", 0, CVAR_GET(int64_t, NCCL_IB_ADAPTIVE_ROUTING)},
+  {"NCCL_IB_ADAPTIVE_ROUTING_value_1", "NCCL_IB_ADAPTIVE_ROUTING", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_ADAPTIVE_ROUTING)},
+  {"NCCL_IB_ADAPTIVE_ROUTING_value_2", "NCCL_IB_ADAPTIVE_ROUTING", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_ADAPTIVE_ROUTING)},
+  {"NCCL_IB_ADAPTIVE_ROUTING_value_3", "NCCL_IB_ADAPTIVE_ROUTING", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_ADAPTIVE_ROUTING)},
+  {"NCCL_IB_ADAPTIVE_ROUTING_default_value", "NCCL_IB_ADAPTIVE_ROUTING", nullptr, -2, CVAR_GET(int64_t, NCCL_IB_ADAPTIVE_ROUTING)},
+  {"NCCL_IB_AR_THRESHOLD_value_0", "NCCL_IB_AR_THRESHOLD", "0", 0, CVAR_GET(int64_t, NCCL_IB_AR_THRESHOLD)},
+  {"NCCL_IB_AR_THRESHOLD_value_1", "NCCL_IB_AR_THRESHOLD", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_AR_THRESHOLD)},
+  {"NCCL_IB_AR_THRESHOLD_value_2", "NCCL_IB_AR_THRESHOLD", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_AR_THRESHOLD)},
+  {"NCCL_IB_AR_THRESHOLD_value_3", "NCCL_IB_AR_THRESHOLD", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_AR_THRESHOLD)},
+  {"NCCL_IB_AR_THRESHOLD_default_value", "NCCL_IB_AR_THRESHOLD", nullptr, 8192, CVAR_GET(int64_t, NCCL_IB_AR_THRESHOLD)},
+  {"NCCL_IB_GID_INDEX_value_0", "NCCL_IB_GID_INDEX", "0", 0, CVAR_GET(int64_t, NCCL_IB_GID_INDEX)},
+  {"NCCL_IB_GID_INDEX_value_1", "NCCL_IB_GID_INDEX", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_GID_INDEX)},
+  {"NCCL_IB_GID_INDEX_value_2", "NCCL_IB_GID_INDEX", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_IB_GID_INDEX)},
+  {"NCCL_IB_GID_INDEX_value_3", "NCCL_IB_GID_INDEX", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_IB_GID_INDEX)},
+  {"NCCL_IB_GID_INDEX_default_value", "NCCL_IB_GID_INDEX", nullptr, -1, CVAR_GET(int64_t, NCCL_IB_GID_INDEX)},
+  {"NCCL_IB_PKEY_value_0", "NCCL_IB_PKEY", "0", 0, CVAR_GET(int64_t, NCCL_IB_PKEY)},
+  {"NCCL_IB_PKEY_value_1", "NCCL_IB_PKEY", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_PKEY)},
+  {"NCCL_IB_PKEY_value_2", "NCCL_IB_PKEY", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_PKEY)},
+  {"NCCL_IB_PKEY_value_3", "NCCL_IB_PKEY", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_PKEY)},
+  {"NCCL_IB_QPS_PER_CONNECTION_value_0", "NCCL_IB_QPS_PER_CONNECTION", "0", 0, CVAR_GET(int64_t, NCCL_IB_QPS_PER_CONNECTION)},
+  {"NCCL_IB_QPS_PER_CONNECTION_value_1", "NCCL_IB_QPS_PER_CONNECTION", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_QPS_PER_CONNECTION)},
+  {"NCCL_IB_QPS_PER_CONNECTION_value_2", "NCCL_IB_QPS_PER_CONNECTION", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_QPS_PER_CONNECTION)},
+  {"NCCL_IB_QPS_PER_CONNECTION_value_3", "NCCL_IB_QPS_PER_CONNECTION", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_QPS_PER_CONNECTION)},
+  {"NCCL_IB_QPS_PER_CONNECTION_default_value", "NCCL_IB_QPS_PER_CONNECTION", nullptr, 1, CVAR_GET(int64_t, NCCL_IB_QPS_PER_CONNECTION)},
+  {"NCCL_IB_ROCE_VERSION_NUM_value_0", "NCCL_IB_ROCE_VERSION_NUM", "0", 0, CVAR_GET(int64_t, NCCL_IB_ROCE_VERSION_NUM)},
+  {"NCCL_IB_ROCE_VERSION_NUM_value_1", "NCCL_IB_ROCE_VERSION_NUM", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_ROCE_VERSION_NUM)},
+  {"NCCL_IB_ROCE_VERSION_NUM_value_2", "NCCL_IB_ROCE_VERSION_NUM", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_IB_ROCE_VERSION_NUM)},
+  {"NCCL_IB_ROCE_VERSION_NUM_value_3", "NCCL_IB_ROCE_VERSION_NUM", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_IB_ROCE_VERSION_NUM)},
+  {"NCCL_IB_ROCE_VERSION_NUM_default_value", "NCCL_IB_ROCE_VERSION_NUM", nullptr, 2, CVAR_GET(int64_t, NCCL_IB_ROCE_VERSION_NUM)},
+  {"NCCL_IB_SL_value_0", "NCCL_IB_SL", "0", 0, CVAR_GET(int64_t, NCCL_IB_SL)},
+  {"NCCL_IB_SL_value_1", "NCCL_IB_SL", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_SL)},
+  {"NCCL_IB_SL_value_2", "NCCL_IB_SL", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_SL)},
+  {"NCCL_IB_SL_value_3", "NCCL_IB_SL", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_SL)},
+  {"NCCL_IB_TIMEOUT_value_0", "NCCL_IB_TIMEOUT", "0", 0, CVAR_GET(int64_t, NCCL_IB_TIMEOUT)},
+  {"NCCL_IB_TIMEOUT_value_1", "NCCL_IB_TIMEOUT", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_TIMEOUT)},
+  {"NCCL_IB_TIMEOUT_value_2", "NCCL_IB_TIMEOUT", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_TIMEOUT)},
+  {"NCCL_IB_TIMEOUT_value_3", "NCCL_IB_TIMEOUT", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_TIMEOUT)},
+  {"NCCL_IB_TIMEOUT_default_value", "NCCL_IB_TIMEOUT", nullptr, 18, CVAR_GET(int64_t, NCCL_IB_TIMEOUT)},
+  {"NCCL_L1_SHARED_MEMORY_CARVEOUT_value_0", "NCCL_L1_SHARED_MEMORY_CARVEOUT", "0", 0, CVAR_GET(int64_t, NCCL_L1_SHARED_MEMORY_CARVEOUT)},
+  {"NCCL_L1_SHARED_MEMORY_CARVEOUT_value_1", "NCCL_L1_SHARED_MEMORY_CARVEOUT", "9999", 9999, CVAR_GET(int64_t, NCCL_L1_SHARED_MEMORY_CARVEOUT)},
+  {"NCCL_L1_SHARED_MEMORY_CARVEOUT_value_2", "NCCL_L1_SHARED_MEMORY_CARVEOUT", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_L1_SHARED_MEMORY_CARVEOUT)},
+  {"NCCL_L1_SHARED_MEMORY_CARVEOUT_value_3", "NCCL_L1_SHARED_MEMORY_CARVEOUT", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_L1_SHARED_MEMORY_CARVEOUT)},
+  {"NCCL_MAX_NCHANNELS_value_0", "NCCL_MAX_NCHANNELS", "0", 0, CVAR_GET(int64_t, NCCL_MAX_NCHANNELS)},
+  {"NCCL_MAX_NCHANNELS_value_1", "NCCL_MAX_NCHANNELS", "9999", 9999, CVAR_GET(int64_t, NCCL_MAX_NCHANNELS)},
+  {"NCCL_MAX_NCHANNELS_value_2", "NCCL_MAX_NCHANNELS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MAX_NCHANNELS)},
+  {"NCCL_MAX_NCHANNELS_value_3", "NCCL_MAX_NCHANNELS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_MAX_NCHANNELS)},
+  {"NCCL_MAX_NCHANNELS_default_value", "NCCL_MAX_NCHANNELS", nullptr, -2, CVAR_GET(int64_t, NCCL_MAX_NCHANNELS)},
+  {"NCCL_NCHANNELS_PER_NET_PEER_value_0", "NCCL_NCHANNELS_PER_NET_PEER", "0", 0, CVAR_GET(int64_t, NCCL_NCHANNELS_PER_NET_PEER)},
+  {"NCCL_NCHANNELS_PER_NET_PEER_value_1", "NCCL_NCHANNELS_PER_NET_PEER", "9999", 9999, CVAR_GET(int64_t, NCCL_NCHANNELS_PER_NET_PEER)},
+  {"NCCL_NCHANNELS_PER_NET_PEER_value_2", "NCCL_NCHANNELS_PER_NET_PEER", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NCHANNELS_PER_NET_PEER)},
+  {"NCCL_NCHANNELS_PER_NET_PEER_value_3", "NCCL_NCHANNELS_PER_NET_PEER", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NCHANNELS_PER_NET_PEER)},
+  {"NCCL_NCHANNELS_PER_NET_PEER_default_value", "NCCL_NCHANNELS_PER_NET_PEER", nullptr, 2, CVAR_GET(int64_t, NCCL_NCHANNELS_PER_NET_PEER)},
+  {"NCCL_NET_DISABLE_INTRA_value_0", "NCCL_NET_DISABLE_INTRA", "0", 0, CVAR_GET(int64_t, NCCL_NET_DISABLE_INTRA)},
+  {"NCCL_NET_DISABLE_INTRA_value_1", "NCCL_NET_DISABLE_INTRA", "9999", 9999, CVAR_GET(int64_t, NCCL_NET_DISABLE_INTRA)},
+  {"NCCL_NET_DISABLE_INTRA_value_2", "NCCL_NET_DISABLE_INTRA", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NET_DISABLE_INTRA)},
+  {"NCCL_NET_DISABLE_INTRA_value_3", "NCCL_NET_DISABLE_INTRA", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NET_DISABLE_INTRA)},
+  {"NCCL_NET_SHARED_COMMS_value_0", "NCCL_NET_SHARED_COMMS", "0", 0, CVAR_GET(int64_t, NCCL_NET_SHARED_COMMS)},
+  {"NCCL_NET_SHARED_COMMS_value_1", "NCCL_NET_SHARED_COMMS", "9999", 9999, CVAR_GET(int64_t, NCCL_NET_SHARED_COMMS)},
+  {"NCCL_NET_SHARED_COMMS_value_2", "NCCL_NET_SHARED_COMMS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NET_SHARED_COMMS)},
+  {"NCCL_NET_SHARED_COMMS_value_3", "NCCL_NET_SHARED_COMMS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NET_SHARED_COMMS)},
+  {"NCCL_NET_SHARED_COMMS_default_value", "NCCL_NET_SHARED_COMMS", nullptr, 1, CVAR_GET(int64_t, NCCL_NET_SHARED_COMMS)},
+  {"NCCL_NSOCKS_PERTHREAD_value_0", "NCCL_NSOCKS_PERTHREAD", "0", 0, CVAR_GET(int64_t, NCCL_NSOCKS_PERTHREAD)},
+  {"NCCL_NSOCKS_PERTHREAD_value_1", "NCCL_NSOCKS_PERTHREAD", "9999", 9999, CVAR_GET(int64_t, NCCL_NSOCKS_PERTHREAD)},
+  {"NCCL_NSOCKS_PERTHREAD_value_2", "NCCL_NSOCKS_PERTHREAD", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NSOCKS_PERTHREAD)},
+  {"NCCL_NSOCKS_PERTHREAD_value_3", "NCCL_NSOCKS_PERTHREAD", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NSOCKS_PERTHREAD)},
+  {"NCCL_NSOCKS_PERTHREAD_default_value", "NCCL_NSOCKS_PERTHREAD", nullptr, -2, CVAR_GET(int64_t, NCCL_NSOCKS_PERTHREAD)},
+  {"NCCL_NTHREADS_value_0", "NCCL_NTHREADS", "0", 0, CVAR_GET(int64_t, NCCL_NTHREADS)},
+  {"NCCL_NTHREADS_value_1", "NCCL_NTHREADS", "9999", 9999, CVAR_GET(int64_t, NCCL_NTHREADS)},
+  {"NCCL_NTHREADS_value_2", "NCCL_NTHREADS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NTHREADS)},
+  {"NCCL_NTHREADS_value_3", "NCCL_NTHREADS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NTHREADS)},
+  {"NCCL_NTHREADS_default_value", "NCCL_NTHREADS", nullptr, -2, CVAR_GET(int64_t, NCCL_NTHREADS)},
+  {"NCCL_P2P_LL_THRESHOLD_value_0", "NCCL_P2P_LL_THRESHOLD", "0", 0, CVAR_GET(int64_t, NCCL_P2P_LL_THRESHOLD)},
+  {"NCCL_P2P_LL_THRESHOLD_value_1", "NCCL_P2P_LL_THRESHOLD", "9999", 9999, CVAR_GET(int64_t, NCCL_P2P_LL_THRESHOLD)},
+  {"NCCL_P2P_LL_THRESHOLD_value_2", "NCCL_P2P_LL_THRESHOLD", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_P2P_LL_THRESHOLD)},
+  {"NCCL_P2P_LL_THRESHOLD_value_3", "NCCL_P2P_LL_THRESHOLD", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_P2P_LL_THRESHOLD)},
+  {"NCCL_P2P_LL_THRESHOLD_default_value", "NCCL_P2P_LL_THRESHOLD", nullptr, 16384, CVAR_GET(int64_t, NCCL_P2P_LL_THRESHOLD)},
+  {"NCCL_P2P_READ_ENABLE_value_0", "NCCL_P2P_READ_ENABLE", "0", 0, CVAR_GET(int64_t, NCCL_P2P_READ_ENABLE)},
+  {"NCCL_P2P_READ_ENABLE_value_1", "NCCL_P2P_READ_ENABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_P2P_READ_ENABLE)},
+  {"NCCL_P2P_READ_ENABLE_value_2", "NCCL_P2P_READ_ENABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_P2P_READ_ENABLE)},
+  {"NCCL_P2P_READ_ENABLE_value_3", "NCCL_P2P_READ_ENABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_P2P_READ_ENABLE)},
+  {"NCCL_P2P_READ_ENABLE_default_value", "NCCL_P2P_READ_ENABLE", nullptr, -2, CVAR_GET(int64_t, NCCL_P2P_READ_ENABLE)},
+};
+INSTANTIATE_CVAR_CASES(Shard1, CvarIntTest, intCases);
+
+static const CvarCase<uint64_t> uintCases[] = {
+  {"NCCL_CTRAN_SHARED_DEVBUF_SIZE_value_0", "NCCL_CTRAN_SHARED_DEVBUF_SIZE", "0", 0, CVAR_GET(uint64_t, NCCL_CTRAN_SHARED_DEVBUF_SIZE)},
+  {"NCCL_CTRAN_SHARED_DEVBUF_SIZE_value_1", "NCCL_CTRAN_SHARED_DEVBUF_SIZE", "9999", 9999, CVAR_GET(uint64_t, NCCL_CTRAN_SHARED_DEVBUF_SIZE)},
+  {"NCCL_CTRAN_SHARED_DEVBUF_SIZE_value_2", "NCCL_CTRAN_SHARED_DEVBUF_SIZE", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_CTRAN_SHARED_DEVBUF_SIZE)},
+  {"NCCL_CTRAN_SHARED_DEVBUF_SIZE_value_3", "NCCL_CTRAN_SHARED_DEVBUF_SIZE", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_CTRAN_SHARED_DEVBUF_SIZE)},
+  {"NCCL_CTRAN_SHARED_DEVBUF_SIZE_default_value", "NCCL_CTRAN_SHARED_DEVBUF_SIZE", nullptr, 8388608, CVAR_GET(uint64_t, NCCL_CTRAN_SHARED_DEVBUF_SIZE)},
+  {"NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_value_0", "NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", "0", 0, CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD)},
+  {"NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_value_1", "NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", "9999", 9999, CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD)},
+  {"NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_value_2", "NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD)},
+  {"NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_value_3", "NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD)},
+  {"NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD_default_value", "NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD", nullptr, 1048576, CVAR_GET(uint64_t, NCCL_DDA_ALLREDUCE_SCATGAT_THRESHOLD)},
+};
+INSTANTIATE_CVAR_CASES(Shard1, CvarUintTest, uintCases);
+
+static const CvarCase<std::string> stringCases[] = {
+  {"NCCL_ALGO_value_0", "NCCL_ALGO", "val1", "val1", CVAR_GET(std::string, NCCL_ALGO)},
+  {"NCCL_ALGO_value_1", "NCCL_ALGO", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_ALGO)},
+  {"NCCL_COLLTRACE_DIR_value_0", "NCCL_COLLTRACE_DIR", "val1", "val1", CVAR_GET(std::string, NCCL_COLLTRACE_DIR)},
+  {"NCCL_COLLTRACE_DIR_value_1", "NCCL_COLLTRACE_DIR", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_COLLTRACE_DIR)},
+  {"NCCL_CTRAN_KINETO_PROFILE_DIR_value_0", "NCCL_CTRAN_KINETO_PROFILE_DIR", "val1", "val1", CVAR_GET(std::string, NCCL_CTRAN_KINETO_PROFILE_DIR)},
+  {"NCCL_CTRAN_KINETO_PROFILE_DIR_value_1", "NCCL_CTRAN_KINETO_PROFILE_DIR", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_CTRAN_KINETO_PROFILE_DIR)},
+  {"NCCL_CTRAN_KINETO_PROFILE_DIR_default_value", "NCCL_CTRAN_KINETO_PROFILE_DIR", nullptr, "/tmp", CVAR_GET(std::string, NCCL_CTRAN_KINETO_PROFILE_DIR)},
+  {"NCCL_CUDA_PATH_value_0", "NCCL_CUDA_PATH", "val1", "val1", CVAR_GET(std::string, NCCL_CUDA_PATH)},
+  {"NCCL_CUDA_PATH_value_1", "NCCL_CUDA_PATH", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_CUDA_PATH)},
+  {"NCCL_CVAR_SNAPSHOT_DIR_value_0", "NCCL_CVAR_SNAPSHOT_DIR", "val1", "val1", CVAR_GET(std::string, NCCL_CVAR_SNAPSHOT_DIR)},
+  {"NCCL_CVAR_SNAPSHOT_DIR_value_1", "NCCL_CVAR_SNAPSHOT_DIR", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_CVAR_SNAPSHOT_DIR)},
+  {"NCCL_DATA_EXPORT_DIR_value_0", "NCCL_DATA_EXPORT_DIR", "val1", "val1", CVAR_GET(std::string, NCCL_DATA_EXPORT_DIR)},
+  {"NCCL_DATA_EXPORT_DIR_value_1", "NCCL_DATA_EXPORT_DIR", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_DATA_EXPORT_DIR)},
+  {"NCCL_DATA_EXPORT_DIR_default_value", "NCCL_DATA_EXPORT_DIR", nullptr, "/tmp", CVAR_GET(std::string, NCCL_DATA_EXPORT_DIR)},
+  {"NCCL_DEBUG_value_0", "NCCL_DEBUG", "val1", "val1", CVAR_GET(std::string, NCCL_DEBUG)},
+  {"NCCL_DEBUG_value_1", "NCCL_DEBUG", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_DEBUG)},
+  {"NCCL_DEBUG_SUBSYS_value_0", "NCCL_DEBUG_SUBSYS", "val1", "val1", CVAR_GET(std::string, NCCL_DEBUG_SUBSYS)},
+  {"NCCL_DEBUG_SUBSYS_value_1", "NCCL_DEBUG_SUBSYS", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_DEBUG_SUBSYS)},
+  {"NCCL_GRAPH_FILE_value_0", "NCCL_GRAPH_FILE", "val1", "val1", CVAR_GET(std::string, NCCL_GRAPH_FILE)},
+  {"NCCL_GRAPH_FILE_value_1", "NCCL_GRAPH_FILE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_GRAPH_FILE)},
+  {"NCCL_HOSTID_value_0", "NCCL_HOSTID", "val1", "val1", CVAR_GET(std::string, NCCL_HOSTID)},
+  {"NCCL_HOSTID_value_1", "NCCL_HOSTID", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_HOSTID)},
+  {"NCCL_LAUNCH_MODE_value_0", "NCCL_LAUNCH_MODE", "val1", "val1", CVAR_GET(std::string, NCCL_LAUNCH_MODE)},
+  {"NCCL_LAUNCH_MODE_value_1", "NCCL_LAUNCH_MODE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_LAUNCH_MODE)},
+  {"NCCL_NET_PLUGIN_value_0", "NCCL_NET_PLUGIN", "val1", "val1", CVAR_GET(std::string, NCCL_NET_PLUGIN)},
+  {"NCCL_NET_PLUGIN_value_1", "NCCL_NET_PLUGIN", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_NET_PLUGIN)},
+  {"NCCL_NET_PLUGIN_default_value", "NCCL_NET_PLUGIN", nullptr, "libnccl-net.so", CVAR_GET(std::string, NCCL_NET_PLUGIN)},
+  {"NCCL_P2P_LEVEL_value_0", "NCCL_P2P_LEVEL", "val1", "val1", CVAR_GET(std::string, NCCL_P2P_LEVEL)},
+  {"NCCL_P2P_LEVEL_value_1", "NCCL_P2P_LEVEL", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_P2P_LEVEL)},
+  {"NCCL_TOPO_FILE_value_0", "NCCL_TOPO_FILE", "val1", "val1", CVAR_GET(std::string, NCCL_TOPO_FILE)},
+  {"NCCL_TOPO_FILE_value_1", "NCCL_TOPO_FILE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_TOPO_FILE)},
+  {"NCCL_TOPO_FILE_default_value", "NCCL_TOPO_FILE", nullptr, "/var/run/nvidia-topologyd/virtualTopology.xml", CVAR_GET(std::string, NCCL_TOPO_FILE)},
+};
+INSTANTIATE_CVAR_CASES(Shard1, CvarStringTest, stringCases);
+
+static const CvarWarnCase warnCases[] = {
+  {"NCCL_CTRAN_AG_RD_RTR_warn_unknown_val", "NCCL_CTRAN_AG_RD_RTR", "dummy", "Unknown value", CVAR_TOUCH(NCCL_CTRAN_AG_RD_RTR)},
+};
+INSTANTIATE_CVAR_CASES(Shard1, CvarWarnTest, warnCases);
+
+// Automatically generated by ./maint/extractcvars.py --- END
@@ -0,0 +1,189 @@
+// (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+// Automatically generated by ./maint/extractcvars.py --- START
+// DO NOT EDIT!!!
+
+#include "CvarUT.h"
+
+static const CvarCase<bool> boolCases[] = {
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_y0", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "y", true, CVAR_GET(bool, NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_y1", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "yes", true, CVAR_GET(bool, NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_y2", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "true", true, CVAR_GET(bool, NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_y3", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "1", true, CVAR_GET(bool, NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_n0", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "n", false, CVAR_GET(bool, NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_n1", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "no", false, CVAR_GET(bool, NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_n2", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "false", false, CVAR_GET(bool, NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_value_n3", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "0", false, CVAR_GET(bool, NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+};
+INSTANTIATE_CVAR_CASES(Shard2, CvarBoolTest, boolCases);
+
+static const CvarCase<int64_t> intCases[] = {
+  {"NCCL_BUFFSIZE_value_0", "NCCL_BUFFSIZE", "0", 0, CVAR_GET(int64_t, NCCL_BUFFSIZE)},
+  {"NCCL_BUFFSIZE_value_1", "NCCL_BUFFSIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_BUFFSIZE)},
+  {"NCCL_BUFFSIZE_value_2", "NCCL_BUFFSIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_BUFFSIZE)},
+  {"NCCL_BUFFSIZE_value_3", "NCCL_BUFFSIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_BUFFSIZE)},
+  {"NCCL_BUFFSIZE_default_value", "NCCL_BUFFSIZE", nullptr, -2, CVAR_GET(int64_t, NCCL_BUFFSIZE)},
+  {"NCCL_CGA_CLUSTER_SIZE_value_0", "NCCL_CGA_CLUSTER_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_CGA_CLUSTER_SIZE)},
+  {"NCCL_CGA_CLUSTER_SIZE_value_1", "NCCL_CGA_CLUSTER_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_CGA_CLUSTER_SIZE)},
+  {"NCCL_CGA_CLUSTER_SIZE_value_2", "NCCL_CGA_CLUSTER_SIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_CGA_CLUSTER_SIZE)},
+  {"NCCL_CGA_CLUSTER_SIZE_value_3", "NCCL_CGA_CLUSTER_SIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_CGA_CLUSTER_SIZE)},
+  {"NCCL_CGA_CLUSTER_SIZE_default_value", "NCCL_CGA_CLUSTER_SIZE", nullptr, -1, CVAR_GET(int64_t, NCCL_CGA_CLUSTER_SIZE)},
+  {"NCCL_CTRAN_NUM_KERNEL_P2PELEMS_value_0", "NCCL_CTRAN_NUM_KERNEL_P2PELEMS", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_NUM_KERNEL_P2PELEMS)},
+  {"NCCL_CTRAN_NUM_KERNEL_P2PELEMS_value_1", "NCCL_CTRAN_NUM_KERNEL_P2PELEMS", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_NUM_KERNEL_P2PELEMS)},
+  {"NCCL_CTRAN_NUM_KERNEL_P2PELEMS_value_2", "NCCL_CTRAN_NUM_KERNEL_P2PELEMS", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_NUM_KERNEL_P2PELEMS)},
+  {"NCCL_CTRAN_NUM_KERNEL_P2PELEMS_value_3", "NCCL_CTRAN_NUM_KERNEL_P2PELEMS", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_NUM_KERNEL_P2PELEMS)},
+  {"NCCL_CTRAN_NUM_KERNEL_P2PELEMS_default_value", "NCCL_CTRAN_NUM_KERNEL_P2PELEMS", nullptr, 65536, CVAR_GET(int64_t, NCCL_CTRAN_NUM_KERNEL_P2PELEMS)},
+  {"NCCL_CTRAN_PROFILING_REPORT_COUNT_value_0", "NCCL_CTRAN_PROFILING_REPORT_COUNT", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_PROFILING_REPORT_COUNT)},
+  {"NCCL_CTRAN_PROFILING_REPORT_COUNT_value_1", "NCCL_CTRAN_PROFILING_REPORT_COUNT", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_PROFILING_REPORT_COUNT)},
+  {"NCCL_CTRAN_PROFILING_REPORT_COUNT_value_2", "NCCL_CTRAN_PROFILING_REPORT_COUNT", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_PROFILING_REPORT_COUNT)},
+  {"NCCL_CTRAN_PROFILING_REPORT_COUNT_value_3", "NCCL_CTRAN_PROFILING_REPORT_COUNT", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_PROFILING_REPORT_COUNT)},
+  {"NCCL_CTRAN_PROFILING_REPORT_COUNT_default_value", "NCCL_CTRAN_PROFILING_REPORT_COUNT", nullptr, 100, CVAR_GET(int64_t, NCCL_CTRAN_PROFILING_REPORT_COUNT)},
+  {"NCCL_CTRAN_REGISTER_single_choice_0", "NCCL_CTRAN_REGISTER", "none", int64_t(NCCL_CTRAN_REGISTER::none), CVAR_GET(int64_t, NCCL_CTRAN_REGISTER)},
+  {"NCCL_CTRAN_REGISTER_single_choice_1", "NCCL_CTRAN_REGISTER", "lazy", int64_t(NCCL_CTRAN_REGISTER::lazy), CVAR_GET(int64_t, NCCL_CTRAN_REGISTER)},
+  {"NCCL_CTRAN_REGISTER_single_choice_2", "NCCL_CTRAN_REGISTER", "eager", int64_t(NCCL_CTRAN_REGISTER::eager), CVAR_GET(int64_t, NCCL_CTRAN_REGISTER)},
+  {"NCCL_CTRAN_REGISTER_default_choice", "NCCL_CTRAN_REGISTER", nullptr, int64_t(NCCL_CTRAN_REGISTER::lazy), CVAR_GET(int64_t, NCCL_CTRAN_REGISTER)},
+  {"NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_value_0", "NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT)},
+  {"NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_value_1", "NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT)},
+  {"NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_value_2", "NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT)},
+  {"NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_value_3", "NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT)},
+  {"NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT_default_value", "NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT", nullptr, -1, CVAR_GET(int64_t, NCCL_CTRAN_REGISTER_REPORT_SNAPSHOT_COUNT)},
+  {"NCCL_GDRCOPY_ENABLE_value_0", "NCCL_GDRCOPY_ENABLE", "0", 0, CVAR_GET(int64_t, NCCL_GDRCOPY_ENABLE)},
+  {"NCCL_GDRCOPY_ENABLE_value_1", "NCCL_GDRCOPY_ENABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_GDRCOPY_ENABLE)},
+  {"NCCL_GDRCOPY_ENABLE_value_2", "NCCL_GDRCOPY_ENABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_GDRCOPY_ENABLE)},
+  {"NCCL_GDRCOPY_ENABLE_value_3", "NCCL_GDRCOPY_ENABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_GDRCOPY_ENABLE)},
+  {"NCCL_GRAPH_REGISTER_value_0", "NCCL_GRAPH_REGISTER", "0", 0, CVAR_GET(int64_t, NCCL_GRAPH_REGISTER)},
+  {"NCCL_GRAPH_REGISTER_value_1", "NCCL_GRAPH_REGISTER", "9999", 9999, CVAR_GET(int64_t, NCCL_GRAPH_REGISTER)},
+  {"NCCL_GRAPH_REGISTER_value_2", "NCCL_GRAPH_REGISTER", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_GRAPH_REGISTER)},
+  {"NCCL_GRAPH_REGISTER_value_3", "NCCL_GRAPH_REGISTER", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_GRAPH_REGISTER)},
+  {"NCCL_IB_DISABLE_value_0", "NCCL_IB_DISABLE", "0", 0, CVAR_GET(int64_t, NCCL_IB_DISABLE)},
+  {"NCCL_IB_DISABLE_value_1", "NCCL_IB_DISABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_DISABLE)},
+  {"NCCL_IB_DISABLE_value_2", "NCCL_IB_DISABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_DISABLE)},
+  {"NCCL_IB_DISABLE_value_3", "NCCL_IB_DISABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_DISABLE)},
+  {"NCCL_IGNORE_CPU_AFFINITY_value_0", "NCCL_IGNORE_CPU_AFFINITY", "0", 0, CVAR_GET(int64_t, NCCL_IGNORE_CPU_AFFINITY)},
+  {"NCCL_IGNORE_CPU_AFFINITY_value_1", "NCCL_IGNORE_CPU_AFFINITY", "9999", 9999, CVAR_GET(int64_t, NCCL_IGNORE_CPU_AFFINITY)},
+  {"NCCL_IGNORE_CPU_AFFINITY_value_2", "NCCL_IGNORE_CPU_AFFINITY", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IGNORE_CPU_AFFINITY)},
+  {"NCCL_IGNORE_CPU_AFFINITY_value_3", "NCCL_IGNORE_CPU_AFFINITY", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IGNORE_CPU_AFFINITY)},
+  {"NCCL_MAX_CTAS_value_0", "NCCL_MAX_CTAS", "0", 0, CVAR_GET(int64_t, NCCL_MAX_CTAS)},
+  {"NCCL_MAX_CTAS_value_1", "NCCL_MAX_CTAS", "9999", 9999, CVAR_GET(int64_t, NCCL_MAX_CTAS)},
+  {"NCCL_MAX_CTAS_value_2", "NCCL_MAX_CTAS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MAX_CTAS)},
+  {"NCCL_MAX_CTAS_value_3", "NCCL_MAX_CTAS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_MAX_CTAS)},
+  {"NCCL_MAX_CTAS_default_value", "NCCL_MAX_CTAS", nullptr, -1, CVAR_GET(int64_t, NCCL_MAX_CTAS)},
+  {"NCCL_MIN_NRINGS_value_0", "NCCL_MIN_NRINGS", "0", 0, CVAR_GET(int64_t, NCCL_MIN_NRINGS)},
+  {"NCCL_MIN_NRINGS_value_1", "NCCL_MIN_NRINGS", "9999", 9999, CVAR_GET(int64_t, NCCL_MIN_NRINGS)},
+  {"NCCL_MIN_NRINGS_value_2", "NCCL_MIN_NRINGS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MIN_NRINGS)},
+  {"NCCL_MIN_NRINGS_value_3", "NCCL_MIN_NRINGS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_MIN_NRINGS)},
+  {"NCCL_MIN_NRINGS_default_value", "NCCL_MIN_NRINGS", nullptr, -2, CVAR_GET(int64_t, NCCL_MIN_NRINGS)},
+  {"NCCL_MIN_P2P_NCHANNELS_value_0", "NCCL_MIN_P2P_NCHANNELS", "0", 0, CVAR_GET(int64_t, NCCL_MIN_P2P_NCHANNELS)},
+  {"NCCL_MIN_P2P_NCHANNELS_value_1", "NCCL_MIN_P2P_NCHANNELS", "9999", 9999, CVAR_GET(int64_t, NCCL_MIN_P2P_NCHANNELS)},
+  {"NCCL_MIN_P2P_NCHANNELS_value_2", "NCCL_MIN_P2P_NCHANNELS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MIN_P2P_NCHANNELS)},
+  {"NCCL_MIN_P2P_NCHANNELS_value_3", "NCCL_MIN_P2P_NCHANNELS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_MIN_P2P_NCHANNELS)},
+  {"NCCL_MIN_P2P_NCHANNELS_default_value", "NCCL_MIN_P2P_NCHANNELS", nullptr, 1, CVAR_GET(int64_t, NCCL_MIN_P2P_NCHANNELS)},
+  {"NCCL_NET_GDR_READ_value_0", "NCCL_NET_GDR_READ", "0", 0, CVAR_GET(int64_t, NCCL_NET_GDR_READ)},
+  {"NCCL_NET_GDR_READ_value_1", "NCCL_NET_GDR_READ", "9999", 9999, CVAR_GET(int64_t, NCCL_NET_GDR_READ)},
+  {"NCCL_NET_GDR_READ_value_2", "NCCL_NET_GDR_READ", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NET_GDR_READ)},
+  {"NCCL_NET_GDR_READ_value_3", "NCCL_NET_GDR_READ", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NET_GDR_READ)},
+  {"NCCL_NET_GDR_READ_default_value", "NCCL_NET_GDR_READ", nullptr, -2, CVAR_GET(int64_t, NCCL_NET_GDR_READ)},
+  {"NCCL_NET_OVERHEAD_value_0", "NCCL_NET_OVERHEAD", "0", 0, CVAR_GET(int64_t, NCCL_NET_OVERHEAD)},
+  {"NCCL_NET_OVERHEAD_value_1", "NCCL_NET_OVERHEAD", "9999", 9999, CVAR_GET(int64_t, NCCL_NET_OVERHEAD)},
+  {"NCCL_NET_OVERHEAD_value_2", "NCCL_NET_OVERHEAD", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NET_OVERHEAD)},
+  {"NCCL_NET_OVERHEAD_value_3", "NCCL_NET_OVERHEAD", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NET_OVERHEAD)},
+  {"NCCL_NET_OVERHEAD_default_value", "NCCL_NET_OVERHEAD", nullptr, -2, CVAR_GET(int64_t, NCCL_NET_OVERHEAD)},
+  {"NCCL_NVLS_NCHANNELS_value_0", "NCCL_NVLS_NCHANNELS", "0", 0, CVAR_GET(int64_t, NCCL_NVLS_NCHANNELS)},
+  {"NCCL_NVLS_NCHANNELS_value_1", "NCCL_NVLS_NCHANNELS", "9999", 9999, CVAR_GET(int64_t, NCCL_NVLS_NCHANNELS)},
+  {"NCCL_NVLS_NCHANNELS_value_2", "NCCL_NVLS_NCHANNELS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NVLS_NCHANNELS)},
+  {"NCCL_NVLS_NCHANNELS_value_3", "NCCL_NVLS_NCHANNELS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NVLS_NCHANNELS)},
+  {"NCCL_NVLS_NCHANNELS_default_value", "NCCL_NVLS_NCHANNELS", nullptr, 16, CVAR_GET(int64_t, NCCL_NVLS_NCHANNELS)},
+  {"NCCL_P2P_USE_CUDA_MEMCPY_value_0", "NCCL_P2P_USE_CUDA_MEMCPY", "0", 0, CVAR_GET(int64_t, NCCL_P2P_USE_CUDA_MEMCPY)},
+  {"NCCL_P2P_USE_CUDA_MEMCPY_value_1", "NCCL_P2P_USE_CUDA_MEMCPY", "9999", 9999, CVAR_GET(int64_t, NCCL_P2P_USE_CUDA_MEMCPY)},
+  {"NCCL_P2P_USE_CUDA_MEMCPY_value_2", "NCCL_P2P_USE_CUDA_MEMCPY", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_P2P_USE_CUDA_MEMCPY)},
+  {"NCCL_P2P_USE_CUDA_MEMCPY_value_3", "NCCL_P2P_USE_CUDA_MEMCPY", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_P2P_USE_CUDA_MEMCPY)},
+  {"NCCL_PROXY_DUMP_SIGNAL_value_0", "NCCL_PROXY_DUMP_SIGNAL", "0", 0, CVAR_GET(int64_t, NCCL_PROXY_DUMP_SIGNAL)},
+  {"NCCL_PROXY_DUMP_SIGNAL_value_1", "NCCL_PROXY_DUMP_SIGNAL", "9999", 9999, CVAR_GET(int64_t, NCCL_PROXY_DUMP_SIGNAL)},
+  {"NCCL_PROXY_DUMP_SIGNAL_value_2", "NCCL_PROXY_DUMP_SIGNAL", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_PROXY_DUMP_SIGNAL)},
+  {"NCCL_PROXY_DUMP_SIGNAL_value_3", "NCCL_PROXY_DUMP_SIGNAL", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_PROXY_DUMP_SIGNAL)},
+  {"NCCL_PROXY_DUMP_SIGNAL_default_value", "NCCL_PROXY_DUMP_SIGNAL", nullptr, -1, CVAR_GET(int64_t, NCCL_PROXY_DUMP_SIGNAL)},
+  {"NCCL_SENDRECV_ALGO_single_choice_0", "NCCL_SENDRECV_ALGO", "orig", int64_t(NCCL_SENDRECV_ALGO::orig), CVAR_GET(int64_t, NCCL_SENDRECV_ALGO)},
+  {"NCCL_SENDRECV_ALGO_single_choice_1", "NCCL_SENDRECV_ALGO", "ctran", int64_t(NCCL_SENDRECV_ALGO::ctran), CVAR_GET(int64_t, NCCL_SENDRECV_ALGO)},
+  {"NCCL_SENDRECV_ALGO_default_choice", "NCCL_SENDRECV_ALGO", nullptr, int64_t(NCCL_SENDRECV_ALGO::orig), CVAR_GET(int64_t, NCCL_SENDRECV_ALGO)},
+  {"NCCL_SHM_MEMCPY_MODE_value_0", "NCCL_SHM_MEMCPY_MODE", "0", 0, CVAR_GET(int64_t, NCCL_SHM_MEMCPY_MODE)},
+  {"NCCL_SHM_MEMCPY_MODE_value_1", "NCCL_SHM_MEMCPY_MODE", "9999", 9999, CVAR_GET(int64_t, NCCL_SHM_MEMCPY_MODE)},
+  {"NCCL_SHM_MEMCPY_MODE_value_2", "NCCL_SHM_MEMCPY_MODE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_SHM_MEMCPY_MODE)},
+  {"NCCL_SHM_MEMCPY_MODE_value_3", "NCCL_SHM_MEMCPY_MODE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_SHM_MEMCPY_MODE)},
+  {"NCCL_SHM_MEMCPY_MODE_default_value", "NCCL_SHM_MEMCPY_MODE", nullptr, 1, CVAR_GET(int64_t, NCCL_SHM_MEMCPY_MODE)},
+  {"NCCL_SHM_USE_CUDA_MEMCPY_value_0", "NCCL_SHM_USE_CUDA_MEMCPY", "0", 0, CVAR_GET(int64_t, NCCL_SHM_USE_CUDA_MEMCPY)},
+  {"NCCL_SHM_USE_CUDA_MEMCPY_value_1", "NCCL_SHM_USE_CUDA_MEMCPY", "9999", 9999, CVAR_GET(int64_t, NCCL_SHM_USE_CUDA_MEMCPY)},
+  {"NCCL_SHM_USE_CUDA_MEMCPY_value_2", "NCCL_SHM_USE_CUDA_MEMCPY", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_SHM_USE_CUDA_MEMCPY)},
+  {"NCCL_SHM_USE_CUDA_MEMCPY_value_3", "NCCL_SHM_USE_CUDA_MEMCPY", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_SHM_USE_CUDA_MEMCPY)},
+};
+INSTANTIATE_CVAR_CASES(Shard2, CvarIntTest, intCases);
+
+static const CvarCase<uint64_t> uintCases[] = {
+  {"NCCL_ALLGATHER_DIRECT_CUTOFF_value_0", "NCCL_ALLGATHER_DIRECT_CUTOFF", "0", 0, CVAR_GET(uint64_t, NCCL_ALLGATHER_DIRECT_CUTOFF)},
+  {"NCCL_ALLGATHER_DIRECT_CUTOFF_value_1", "NCCL_ALLGATHER_DIRECT_CUTOFF", "9999", 9999, CVAR_GET(uint64_t, NCCL_ALLGATHER_DIRECT_CUTOFF)},
+  {"NCCL_ALLGATHER_DIRECT_CUTOFF_value_2", "NCCL_ALLGATHER_DIRECT_CUTOFF", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_ALLGATHER_DIRECT_CUTOFF)},
+  {"NCCL_ALLGATHER_DIRECT_CUTOFF_value_3", "NCCL_ALLGATHER_DIRECT_CUTOFF", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_ALLGATHER_DIRECT_CUTOFF)},
+  {"NCCL_ALLGATHER_DIRECT_CUTOFF_default_value", "NCCL_ALLGATHER_DIRECT_CUTOFF", nullptr, 524288, CVAR_GET(uint64_t, NCCL_ALLGATHER_DIRECT_CUTOFF)},
+  {"NCCL_CTRAN_ALLTOALL_THRESHOLD_value_0", "NCCL_CTRAN_ALLTOALL_THRESHOLD", "0", 0, CVAR_GET(uint64_t, NCCL_CTRAN_ALLTOALL_THRESHOLD)},
+  {"NCCL_CTRAN_ALLTOALL_THRESHOLD_value_1", "NCCL_CTRAN_ALLTOALL_THRESHOLD", "9999", 9999, CVAR_GET(uint64_t, NCCL_CTRAN_ALLTOALL_THRESHOLD)},
+  {"NCCL_CTRAN_ALLTOALL_THRESHOLD_value_2", "NCCL_CTRAN_ALLTOALL_THRESHOLD", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_CTRAN_ALLTOALL_THRESHOLD)},
+  {"NCCL_CTRAN_ALLTOALL_THRESHOLD_value_3", "NCCL_CTRAN_ALLTOALL_THRESHOLD", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_CTRAN_ALLTOALL_THRESHOLD)},
+  {"NCCL_CTRAN_ALLTOALL_THRESHOLD_default_value", "NCCL_CTRAN_ALLTOALL_THRESHOLD", nullptr, 32768, CVAR_GET(uint64_t, NCCL_CTRAN_ALLTOALL_THRESHOLD)},
+  {"NCCL_CTRAN_BACKENDS_single_choice_0", "NCCL_CTRAN_BACKENDS", "ib", ncclCvarBit(NCCL_CTRAN_BACKENDS::ib), CVAR_GET_MASK(NCCL_CTRAN_BACKENDS)},
+  {"NCCL_CTRAN_BACKENDS_all_choices", "NCCL_CTRAN_BACKENDS", "ib", ncclCvarBit(NCCL_CTRAN_BACKENDS::ib), CVAR_GET_MASK(NCCL_CTRAN_BACKENDS)},
+  {"NCCL_CTRAN_BACKENDS_default_choices", "NCCL_CTRAN_BACKENDS", nullptr, ncclCvarBit(NCCL_CTRAN_BACKENDS::ib), CVAR_GET_MASK(NCCL_CTRAN_BACKENDS)},
+  {"NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_value_0", "NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", "0", 0, CVAR_GET(uint64_t, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD)},
+  {"NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_value_1", "NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", "9999", 9999, CVAR_GET(uint64_t, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD)},
+  {"NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_value_2", "NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD)},
+  {"NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_value_3", "NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD)},
+  {"NCCL_CTRAN_IB_QP_SCALING_THRESHOLD_default_value", "NCCL_CTRAN_IB_QP_SCALING_THRESHOLD", nullptr, 1048576, CVAR_GET(uint64_t, NCCL_CTRAN_IB_QP_SCALING_THRESHOLD)},
+  {"NCCL_DDA_TMPBUFF_SIZE_value_0", "NCCL_DDA_TMPBUFF_SIZE", "0", 0, CVAR_GET(uint64_t, NCCL_DDA_TMPBUFF_SIZE)},
+  {"NCCL_DDA_TMPBUFF_SIZE_value_1", "NCCL_DDA_TMPBUFF_SIZE", "9999", 9999, CVAR_GET(uint64_t, NCCL_DDA_TMPBUFF_SIZE)},
+  {"NCCL_DDA_TMPBUFF_SIZE_value_2", "NCCL_DDA_TMPBUFF_SIZE", "18446744073709551615", std::numeric_limits<uint64_t>::max(), CVAR_GET(uint64_t, NCCL_DDA_TMPBUFF_SIZE)},
+  {"NCCL_DDA_TMPBUFF_SIZE_value_3", "NCCL_DDA_TMPBUFF_SIZE", "0", std::numeric_limits<uint64_t>::min(), CVAR_GET(uint64_t, NCCL_DDA_TMPBUFF_SIZE)},
+  {"NCCL_DDA_TMPBUFF_SIZE_default_value", "NCCL_DDA_TMPBUFF_SIZE", nullptr, 33554432, CVAR_GET(uint64_t, NCCL_DDA_TMPBUFF_SIZE)},
+};
+INSTANTIATE_CVAR_CASES(Shard2, CvarUintTest, uintCases);
+
+static const CvarCase<std::string> stringCases[] = {
+  {"CUDA_LAUNCH_BLOCKING_value_0", "CUDA_LAUNCH_BLOCKING", "val1", "val1", CVAR_GET(std::string, CUDA_LAUNCH_BLOCKING)},
+  {"CUDA_LAUNCH_BLOCKING_value_1", "CUDA_LAUNCH_BLOCKING", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, CUDA_LAUNCH_BLOCKING)},
+  {"NCCL_COMM_ID_value_0", "NCCL_COMM_ID", "val1", "val1", CVAR_GET(std::string, NCCL_COMM_ID)},
+  {"NCCL_COMM_ID_value_1", "NCCL_COMM_ID", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_COMM_ID)},
+  {"NCCL_CTRAN_TOPO_FILE_value_0", "NCCL_CTRAN_TOPO_FILE", "val1", "val1", CVAR_GET(std::string, NCCL_CTRAN_TOPO_FILE)},
+  {"NCCL_CTRAN_TOPO_FILE_value_1", "NCCL_CTRAN_TOPO_FILE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_CTRAN_TOPO_FILE)},
+  {"NCCL_IB_ADDR_FAMILY_value_0", "NCCL_IB_ADDR_FAMILY", "val1", "val1", CVAR_GET(std::string, NCCL_IB_ADDR_FAMILY)},
+  {"NCCL_IB_ADDR_FAMILY_value_1", "NCCL_IB_ADDR_FAMILY", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_IB_ADDR_FAMILY)},
+  {"NCCL_IB_ADDR_FAMILY_default_value", "NCCL_IB_ADDR_FAMILY", nullptr, "AF_INET", CVAR_GET(std::string, NCCL_IB_ADDR_FAMILY)},
+  {"NCCL_IB_HCA_default_value", "NCCL_IB_HCA", nullptr, "", CVAR_GET(std::string, NCCL_IB_HCA_PREFIX)},
+  {"NCCL_IB_HCA_prefix_0", "NCCL_IB_HCA", "^val1,val2,val3", "^", CVAR_GET(std::string, NCCL_IB_HCA_PREFIX)},
+  {"NCCL_IB_HCA_prefix_1", "NCCL_IB_HCA", "=val1,val2,val3", "=", CVAR_GET(std::string, NCCL_IB_HCA_PREFIX)},
+  {"NCCL_IB_HCA_prefix_2", "NCCL_IB_HCA", "val1,val2,val3", "", CVAR_GET(std::string, NCCL_IB_HCA_PREFIX)},
+};
+INSTANTIATE_CVAR_CASES(Shard2, CvarStringTest, stringCases);
+
+static const CvarCase<std::vector<std::string>> stringlistCases[] = {
+  {"NCCL_IB_HCA_default_value", "NCCL_IB_HCA", nullptr, {}, CVAR_GET(std::vector<std::string>, NCCL_IB_HCA)},
+  {"NCCL_IB_HCA_prefix_0", "NCCL_IB_HCA", "^val1,val2,val3", {"val1", "val2", "val3"}, CVAR_GET(std::vector<std::string>, NCCL_IB_HCA)},
+  {"NCCL_IB_HCA_prefix_1", "NCCL_IB_HCA", "=val1,val2,val3", {"val1", "val2", "val3"}, CVAR_GET(std::vector<std::string>, NCCL_IB_HCA)},
+  {"NCCL_IB_HCA_prefix_2", "NCCL_IB_HCA", "val1,val2,val3", {"val1", "val2", "val3"}, CVAR_GET(std::vector<std::string>, NCCL_IB_HCA)},
+};
+INSTANTIATE_CVAR_CASES(Shard2, CvarStringListTest, stringlistCases);
+
+static const CvarCase<std::vector<int64_t>> enumlistCases[] = {
+  {"NCCL_CTRAN_BACKENDS_single_choice_0", "NCCL_CTRAN_BACKENDS", "ib", {int64_t(NCCL_CTRAN_BACKENDS::ib)}, CVAR_GET_ENUMLIST(NCCL_CTRAN_BACKENDS)},
+  {"NCCL_CTRAN_BACKENDS_all_choices", "NCCL_CTRAN_BACKENDS", "ib", {int64_t(NCCL_CTRAN_BACKENDS::ib)}, CVAR_GET_ENUMLIST(NCCL_CTRAN_BACKENDS)},
+  {"NCCL_CTRAN_BACKENDS_default_choices", "NCCL_CTRAN_BACKENDS", nullptr, {int64_t(NCCL_CTRAN_BACKENDS::ib)}, CVAR_GET_ENUMLIST(NCCL_CTRAN_BACKENDS)},
+};
+INSTANTIATE_CVAR_CASES(Shard2, CvarEnumListTest, enumlistCases);
+
+static const CvarWarnCase warnCases[] = {
+  {"NCCL_CTRAN_BACKENDS_warn_unknown_val", "NCCL_CTRAN_BACKENDS", "dummy", "Unknown value", CVAR_TOUCH(NCCL_CTRAN_BACKENDS)},
+  {"NCCL_CTRAN_BACKENDS_warn_dup_val", "NCCL_CTRAN_BACKENDS", "dummy,dummy", "Duplicate token", CVAR_TOUCH(NCCL_CTRAN_BACKENDS)},
+  {"NCCL_CTRAN_IB_TRAFFIC_PROFILNG_warn_unknown_val", "NCCL_CTRAN_IB_TRAFFIC_PROFILNG", "dummy", "Unknown value", CVAR_TOUCH(NCCL_CTRAN_IB_TRAFFIC_PROFILNG)},
+  {"NCCL_CTRAN_REGISTER_warn_unknown_val", "NCCL_CTRAN_REGISTER", "dummy", "Unknown value", CVAR_TOUCH(NCCL_CTRAN_REGISTER)},
+  {"NCCL_IB_HCA_warn_dup_val", "NCCL_IB_HCA", "dummy,dummy", "Duplicate token", CVAR_TOUCH(NCCL_IB_HCA)},
+  {"NCCL_SENDRECV_ALGO_warn_unknown_val", "NCCL_SENDRECV_ALGO", "dummy", "Unknown value", CVAR_TOUCH(NCCL_SENDRECV_ALGO)},
+};
+INSTANTIATE_CVAR_CASES(Shard2, CvarWarnTest, warnCases);
+
+// Automatically generated by ./maint/extractcvars.py --- END
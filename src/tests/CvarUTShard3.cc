@@ -0,0 +1,193 @@
+// (c) Meta Platforms, Inc. and affiliates. Confidential and proprietary.
+
+// Automatically generated by ./maint/extractcvars.py --- START
+// DO NOT EDIT!!!
+
+#include "CvarUT.h"
+
+static const CvarCase<int64_t> intCases[] = {
+  {"NCCL_ALLOC_P2P_NET_LL_BUFFERS_value_0", "NCCL_ALLOC_P2P_NET_LL_BUFFERS", "0", 0, CVAR_GET(int64_t, NCCL_ALLOC_P2P_NET_LL_BUFFERS)},
+  {"NCCL_ALLOC_P2P_NET_LL_BUFFERS_value_1", "NCCL_ALLOC_P2P_NET_LL_BUFFERS", "9999", 9999, CVAR_GET(int64_t, NCCL_ALLOC_P2P_NET_LL_BUFFERS)},
+  {"NCCL_ALLOC_P2P_NET_LL_BUFFERS_value_2", "NCCL_ALLOC_P2P_NET_LL_BUFFERS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_ALLOC_P2P_NET_LL_BUFFERS)},
+  {"NCCL_ALLOC_P2P_NET_LL_BUFFERS_value_3", "NCCL_ALLOC_P2P_NET_LL_BUFFERS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_ALLOC_P2P_NET_LL_BUFFERS)},
+  {"NCCL_ALLREDUCE_ALGO_single_choice_0", "NCCL_ALLREDUCE_ALGO", "orig", int64_t(NCCL_ALLREDUCE_ALGO::orig), CVAR_GET(int64_t, NCCL_ALLREDUCE_ALGO)},
+  {"NCCL_ALLREDUCE_ALGO_single_choice_1", "NCCL_ALLREDUCE_ALGO", "dda", int64_t(NCCL_ALLREDUCE_ALGO::dda), CVAR_GET(int64_t, NCCL_ALLREDUCE_ALGO)},
+  {"NCCL_ALLREDUCE_ALGO_default_choice", "NCCL_ALLREDUCE_ALGO", nullptr, int64_t(NCCL_ALLREDUCE_ALGO::orig), CVAR_GET(int64_t, NCCL_ALLREDUCE_ALGO)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_value_0", "NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_value_1", "NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_value_2", "NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_value_3", "NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE)},
+  {"NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE_default_value", "NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE", nullptr, -1, CVAR_GET(int64_t, NCCL_ALLREDUCE_SPARSE_BLOCK_THREAD_BLOCK_SIZE)},
+  {"NCCL_ALLTOALLV_ALGO_single_choice_0", "NCCL_ALLTOALLV_ALGO", "orig", int64_t(NCCL_ALLTOALLV_ALGO::orig), CVAR_GET(int64_t, NCCL_ALLTOALLV_ALGO)},
+  {"NCCL_ALLTOALLV_ALGO_single_choice_1", "NCCL_ALLTOALLV_ALGO", "ctran", int64_t(NCCL_ALLTOALLV_ALGO::ctran), CVAR_GET(int64_t, NCCL_ALLTOALLV_ALGO)},
+  {"NCCL_ALLTOALLV_ALGO_default_choice", "NCCL_ALLTOALLV_ALGO", nullptr, int64_t(NCCL_ALLTOALLV_ALGO::orig), CVAR_GET(int64_t, NCCL_ALLTOALLV_ALGO)},
+  {"NCCL_ALLTOALL_ALGO_single_choice_0", "NCCL_ALLTOALL_ALGO", "orig", int64_t(NCCL_ALLTOALL_ALGO::orig), CVAR_GET(int64_t, NCCL_ALLTOALL_ALGO)},
+  {"NCCL_ALLTOALL_ALGO_single_choice_1", "NCCL_ALLTOALL_ALGO", "ctran", int64_t(NCCL_ALLTOALL_ALGO::ctran), CVAR_GET(int64_t, NCCL_ALLTOALL_ALGO)},
+  {"NCCL_ALLTOALL_ALGO_default_choice", "NCCL_ALLTOALL_ALGO", nullptr, int64_t(NCCL_ALLTOALL_ALGO::orig), CVAR_GET(int64_t, NCCL_ALLTOALL_ALGO)},
+  {"NCCL_COMM_SPLIT_SHARE_RESOURCES_value_0", "NCCL_COMM_SPLIT_SHARE_RESOURCES", "0", 0, CVAR_GET(int64_t, NCCL_COMM_SPLIT_SHARE_RESOURCES)},
+  {"NCCL_COMM_SPLIT_SHARE_RESOURCES_value_1", "NCCL_COMM_SPLIT_SHARE_RESOURCES", "9999", 9999, CVAR_GET(int64_t, NCCL_COMM_SPLIT_SHARE_RESOURCES)},
+  {"NCCL_COMM_SPLIT_SHARE_RESOURCES_value_2", "NCCL_COMM_SPLIT_SHARE_RESOURCES", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_COMM_SPLIT_SHARE_RESOURCES)},
+  {"NCCL_COMM_SPLIT_SHARE_RESOURCES_value_3", "NCCL_COMM_SPLIT_SHARE_RESOURCES", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_COMM_SPLIT_SHARE_RESOURCES)},
+  {"NCCL_COMM_SPLIT_SHARE_RESOURCES_default_value", "NCCL_COMM_SPLIT_SHARE_RESOURCES", nullptr, -1, CVAR_GET(int64_t, NCCL_COMM_SPLIT_SHARE_RESOURCES)},
+  {"NCCL_CREATE_THREAD_CONTEXT_value_0", "NCCL_CREATE_THREAD_CONTEXT", "0", 0, CVAR_GET(int64_t, NCCL_CREATE_THREAD_CONTEXT)},
+  {"NCCL_CREATE_THREAD_CONTEXT_value_1", "NCCL_CREATE_THREAD_CONTEXT", "9999", 9999, CVAR_GET(int64_t, NCCL_CREATE_THREAD_CONTEXT)},
+  {"NCCL_CREATE_THREAD_CONTEXT_value_2", "NCCL_CREATE_THREAD_CONTEXT", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_CREATE_THREAD_CONTEXT)},
+  {"NCCL_CREATE_THREAD_CONTEXT_value_3", "NCCL_CREATE_THREAD_CONTEXT", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_CREATE_THREAD_CONTEXT)},
+  {"NCCL_CROSS_NIC_value_0", "NCCL_CROSS_NIC", "0", 0, CVAR_GET(int64_t, NCCL_CROSS_NIC)},
+  {"NCCL_CROSS_NIC_value_1", "NCCL_CROSS_NIC", "9999", 9999, CVAR_GET(int64_t, NCCL_CROSS_NIC)},
+  {"NCCL_CROSS_NIC_value_2", "NCCL_CROSS_NIC", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_CROSS_NIC)},
+  {"NCCL_CROSS_NIC_value_3", "NCCL_CROSS_NIC", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_CROSS_NIC)},
+  {"NCCL_CROSS_NIC_default_value", "NCCL_CROSS_NIC", nullptr, 2, CVAR_GET(int64_t, NCCL_CROSS_NIC)},
+  {"NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_value_0", "NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_value_1", "NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_value_2", "NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_value_3", "NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS_default_value", "NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS", nullptr, 64, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALLV_NUM_THREAD_BLOCKS)},
+  {"NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_value_0", "NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_value_1", "NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_value_2", "NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_value_3", "NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE_default_value", "NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE", nullptr, -1, CVAR_GET(int64_t, NCCL_CTRAN_ALLTOALL_THREAD_BLOCK_SIZE)},
+  {"NCCL_CTRAN_PROFILING_single_choice_0", "NCCL_CTRAN_PROFILING", "none", int64_t(NCCL_CTRAN_PROFILING::none), CVAR_GET(int64_t, NCCL_CTRAN_PROFILING)},
+  {"NCCL_CTRAN_PROFILING_single_choice_1", "NCCL_CTRAN_PROFILING", "stdout", int64_t(NCCL_CTRAN_PROFILING::stdout), CVAR_GET(int64_t, NCCL_CTRAN_PROFILING)},
+  {"NCCL_CTRAN_PROFILING_single_choice_2", "NCCL_CTRAN_PROFILING", "info", int64_t(NCCL_CTRAN_PROFILING::info), CVAR_GET(int64_t, NCCL_CTRAN_PROFILING)},
+  {"NCCL_CTRAN_PROFILING_single_choice_3", "NCCL_CTRAN_PROFILING", "kineto", int64_t(NCCL_CTRAN_PROFILING::kineto), CVAR_GET(int64_t, NCCL_CTRAN_PROFILING)},
+  {"NCCL_CTRAN_PROFILING_default_choice", "NCCL_CTRAN_PROFILING", nullptr, int64_t(NCCL_CTRAN_PROFILING::none), CVAR_GET(int64_t, NCCL_CTRAN_PROFILING)},
+  {"NCCL_CTRAN_RING_MAX_OUTSTANDING_value_0", "NCCL_CTRAN_RING_MAX_OUTSTANDING", "0", 0, CVAR_GET(int64_t, NCCL_CTRAN_RING_MAX_OUTSTANDING)},
+  {"NCCL_CTRAN_RING_MAX_OUTSTANDING_value_1", "NCCL_CTRAN_RING_MAX_OUTSTANDING", "9999", 9999, CVAR_GET(int64_t, NCCL_CTRAN_RING_MAX_OUTSTANDING)},
+  {"NCCL_CTRAN_RING_MAX_OUTSTANDING_value_2", "NCCL_CTRAN_RING_MAX_OUTSTANDING", "2147483647", std::numeric_limits<int>::max(), CVAR_GET(int64_t, NCCL_CTRAN_RING_MAX_OUTSTANDING)},
+  {"NCCL_CTRAN_RING_MAX_OUTSTANDING_value_3", "NCCL_CTRAN_RING_MAX_OUTSTANDING", "-2147483648", std::numeric_limits<int>::min(), CVAR_GET(int64_t, NCCL_CTRAN_RING_MAX_OUTSTANDING)},
+  {"NCCL_CTRAN_RING_MAX_OUTSTANDING_default_value", "NCCL_CTRAN_RING_MAX_OUTSTANDING", nullptr, 8, CVAR_GET(int64_t, NCCL_CTRAN_RING_MAX_OUTSTANDING)},
+  {"NCCL_CUMEM_ENABLE_value_0", "NCCL_CUMEM_ENABLE", "0", 0, CVAR_GET(int64_t, NCCL_CUMEM_ENABLE)},
+  {"NCCL_CUMEM_ENABLE_value_1", "NCCL_CUMEM_ENABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_CUMEM_ENABLE)},
+  {"NCCL_CUMEM_ENABLE_value_2", "NCCL_CUMEM_ENABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_CUMEM_ENABLE)},
+  {"NCCL_CUMEM_ENABLE_value_3", "NCCL_CUMEM_ENABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_CUMEM_ENABLE)},
+  {"NCCL_GDRCOPY_FIFO_ENABLE_value_0", "NCCL_GDRCOPY_FIFO_ENABLE", "0", 0, CVAR_GET(int64_t, NCCL_GDRCOPY_FIFO_ENABLE)},
+  {"NCCL_GDRCOPY_FIFO_ENABLE_value_1", "NCCL_GDRCOPY_FIFO_ENABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_GDRCOPY_FIFO_ENABLE)},
+  {"NCCL_GDRCOPY_FIFO_ENABLE_value_2", "NCCL_GDRCOPY_FIFO_ENABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_GDRCOPY_FIFO_ENABLE)},
+  {"NCCL_GDRCOPY_FIFO_ENABLE_value_3", "NCCL_GDRCOPY_FIFO_ENABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_GDRCOPY_FIFO_ENABLE)},
+  {"NCCL_GDRCOPY_FIFO_ENABLE_default_value", "NCCL_GDRCOPY_FIFO_ENABLE", nullptr, -2, CVAR_GET(int64_t, NCCL_GDRCOPY_FIFO_ENABLE)},
+  {"NCCL_GDR_FLUSH_DISABLE_value_0", "NCCL_GDR_FLUSH_DISABLE", "0", 0, CVAR_GET(int64_t, NCCL_GDR_FLUSH_DISABLE)},
+  {"NCCL_GDR_FLUSH_DISABLE_value_1", "NCCL_GDR_FLUSH_DISABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_GDR_FLUSH_DISABLE)},
+  {"NCCL_GDR_FLUSH_DISABLE_value_2", "NCCL_GDR_FLUSH_DISABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_GDR_FLUSH_DISABLE)},
+  {"NCCL_GDR_FLUSH_DISABLE_value_3", "NCCL_GDR_FLUSH_DISABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_GDR_FLUSH_DISABLE)},
+  {"NCCL_GRAPH_DUMP_FILE_RANK_value_0", "NCCL_GRAPH_DUMP_FILE_RANK", "0", 0, CVAR_GET(int64_t, NCCL_GRAPH_DUMP_FILE_RANK)},
+  {"NCCL_GRAPH_DUMP_FILE_RANK_value_1", "NCCL_GRAPH_DUMP_FILE_RANK", "9999", 9999, CVAR_GET(int64_t, NCCL_GRAPH_DUMP_FILE_RANK)},
+  {"NCCL_GRAPH_DUMP_FILE_RANK_value_2", "NCCL_GRAPH_DUMP_FILE_RANK", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_GRAPH_DUMP_FILE_RANK)},
+  {"NCCL_GRAPH_DUMP_FILE_RANK_value_3", "NCCL_GRAPH_DUMP_FILE_RANK", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_GRAPH_DUMP_FILE_RANK)},
+  {"NCCL_IB_PCI_RELAXED_ORDERING_value_0", "NCCL_IB_PCI_RELAXED_ORDERING", "0", 0, CVAR_GET(int64_t, NCCL_IB_PCI_RELAXED_ORDERING)},
+  {"NCCL_IB_PCI_RELAXED_ORDERING_value_1", "NCCL_IB_PCI_RELAXED_ORDERING", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_PCI_RELAXED_ORDERING)},
+  {"NCCL_IB_PCI_RELAXED_ORDERING_value_2", "NCCL_IB_PCI_RELAXED_ORDERING", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_PCI_RELAXED_ORDERING)},
+  {"NCCL_IB_PCI_RELAXED_ORDERING_value_3", "NCCL_IB_PCI_RELAXED_ORDERING", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_PCI_RELAXED_ORDERING)},
+  {"NCCL_IB_PCI_RELAXED_ORDERING_default_value", "NCCL_IB_PCI_RELAXED_ORDERING", nullptr, 2, CVAR_GET(int64_t, NCCL_IB_PCI_RELAXED_ORDERING)},
+  {"NCCL_IB_TC_value_0", "NCCL_IB_TC", "0", 0, CVAR_GET(int64_t, NCCL_IB_TC)},
+  {"NCCL_IB_TC_value_1", "NCCL_IB_TC", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_TC)},
+  {"NCCL_IB_TC_value_2", "NCCL_IB_TC", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_TC)},
+  {"NCCL_IB_TC_value_3", "NCCL_IB_TC", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_TC)},
+  {"NCCL_IB_USE_INLINE_value_0", "NCCL_IB_USE_INLINE", "0", 0, CVAR_GET(int64_t, NCCL_IB_USE_INLINE)},
+  {"NCCL_IB_USE_INLINE_value_1", "NCCL_IB_USE_INLINE", "9999", 9999, CVAR_GET(int64_t, NCCL_IB_USE_INLINE)},
+  {"NCCL_IB_USE_INLINE_value_2", "NCCL_IB_USE_INLINE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_IB_USE_INLINE)},
+  {"NCCL_IB_USE_INLINE_value_3", "NCCL_IB_USE_INLINE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_IB_USE_INLINE)},
+  {"NCCL_LL128_NTHREADS_value_0", "NCCL_LL128_NTHREADS", "0", 0, CVAR_GET(int64_t, NCCL_LL128_NTHREADS)},
+  {"NCCL_LL128_NTHREADS_value_1", "NCCL_LL128_NTHREADS", "9999", 9999, CVAR_GET(int64_t, NCCL_LL128_NTHREADS)},
+  {"NCCL_LL128_NTHREADS_value_2", "NCCL_LL128_NTHREADS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_LL128_NTHREADS)},
+  {"NCCL_LL128_NTHREADS_value_3", "NCCL_LL128_NTHREADS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_LL128_NTHREADS)},
+  {"NCCL_LL128_NTHREADS_default_value", "NCCL_LL128_NTHREADS", nullptr, -2, CVAR_GET(int64_t, NCCL_LL128_NTHREADS)},
+  {"NCCL_LL_BUFFSIZE_value_0", "NCCL_LL_BUFFSIZE", "0", 0, CVAR_GET(int64_t, NCCL_LL_BUFFSIZE)},
+  {"NCCL_LL_BUFFSIZE_value_1", "NCCL_LL_BUFFSIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_LL_BUFFSIZE)},
+  {"NCCL_LL_BUFFSIZE_value_2", "NCCL_LL_BUFFSIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_LL_BUFFSIZE)},
+  {"NCCL_LL_BUFFSIZE_value_3", "NCCL_LL_BUFFSIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_LL_BUFFSIZE)},
+  {"NCCL_LL_BUFFSIZE_default_value", "NCCL_LL_BUFFSIZE", nullptr, -2, CVAR_GET(int64_t, NCCL_LL_BUFFSIZE)},
+  {"NCCL_LOCAL_REGISTER_value_0", "NCCL_LOCAL_REGISTER", "0", 0, CVAR_GET(int64_t, NCCL_LOCAL_REGISTER)},
+  {"NCCL_LOCAL_REGISTER_value_1", "NCCL_LOCAL_REGISTER", "9999", 9999, CVAR_GET(int64_t, NCCL_LOCAL_REGISTER)},
+  {"NCCL_LOCAL_REGISTER_value_2", "NCCL_LOCAL_REGISTER", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_LOCAL_REGISTER)},
+  {"NCCL_LOCAL_REGISTER_value_3", "NCCL_LOCAL_REGISTER", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_LOCAL_REGISTER)},
+  {"NCCL_LOCAL_REGISTER_default_value", "NCCL_LOCAL_REGISTER", nullptr, 1, CVAR_GET(int64_t, NCCL_LOCAL_REGISTER)},
+  {"NCCL_MIN_NCHANNELS_value_0", "NCCL_MIN_NCHANNELS", "0", 0, CVAR_GET(int64_t, NCCL_MIN_NCHANNELS)},
+  {"NCCL_MIN_NCHANNELS_value_1", "NCCL_MIN_NCHANNELS", "9999", 9999, CVAR_GET(int64_t, NCCL_MIN_NCHANNELS)},
+  {"NCCL_MIN_NCHANNELS_value_2", "NCCL_MIN_NCHANNELS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_MIN_NCHANNELS)},
+  {"NCCL_MIN_NCHANNELS_value_3", "NCCL_MIN_NCHANNELS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_MIN_NCHANNELS)},
+  {"NCCL_MIN_NCHANNELS_default_value", "NCCL_MIN_NCHANNELS", nullptr, -2, CVAR_GET(int64_t, NCCL_MIN_NCHANNELS)},
+  {"NCCL_NET_SHARED_BUFFERS_value_0", "NCCL_NET_SHARED_BUFFERS", "0", 0, CVAR_GET(int64_t, NCCL_NET_SHARED_BUFFERS)},
+  {"NCCL_NET_SHARED_BUFFERS_value_1", "NCCL_NET_SHARED_BUFFERS", "9999", 9999, CVAR_GET(int64_t, NCCL_NET_SHARED_BUFFERS)},
+  {"NCCL_NET_SHARED_BUFFERS_value_2", "NCCL_NET_SHARED_BUFFERS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NET_SHARED_BUFFERS)},
+  {"NCCL_NET_SHARED_BUFFERS_value_3", "NCCL_NET_SHARED_BUFFERS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NET_SHARED_BUFFERS)},
+  {"NCCL_NET_SHARED_BUFFERS_default_value", "NCCL_NET_SHARED_BUFFERS", nullptr, -2, CVAR_GET(int64_t, NCCL_NET_SHARED_BUFFERS)},
+  {"NCCL_NVB_DISABLE_value_0", "NCCL_NVB_DISABLE", "0", 0, CVAR_GET(int64_t, NCCL_NVB_DISABLE)},
+  {"NCCL_NVB_DISABLE_value_1", "NCCL_NVB_DISABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_NVB_DISABLE)},
+  {"NCCL_NVB_DISABLE_value_2", "NCCL_NVB_DISABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NVB_DISABLE)},
+  {"NCCL_NVB_DISABLE_value_3", "NCCL_NVB_DISABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NVB_DISABLE)},
+  {"NCCL_NVLS_ENABLE_value_0", "NCCL_NVLS_ENABLE", "0", 0, CVAR_GET(int64_t, NCCL_NVLS_ENABLE)},
+  {"NCCL_NVLS_ENABLE_value_1", "NCCL_NVLS_ENABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_NVLS_ENABLE)},
+  {"NCCL_NVLS_ENABLE_value_2", "NCCL_NVLS_ENABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_NVLS_ENABLE)},
+  {"NCCL_NVLS_ENABLE_value_3", "NCCL_NVLS_ENABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_NVLS_ENABLE)},
+  {"NCCL_NVLS_ENABLE_default_value", "NCCL_NVLS_ENABLE", nullptr, 2, CVAR_GET(int64_t, NCCL_NVLS_ENABLE)},
+  {"NCCL_P2P_DIRECT_DISABLE_value_0", "NCCL_P2P_DIRECT_DISABLE", "0", 0, CVAR_GET(int64_t, NCCL_P2P_DIRECT_DISABLE)},
+  {"NCCL_P2P_DIRECT_DISABLE_value_1", "NCCL_P2P_DIRECT_DISABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_P2P_DIRECT_DISABLE)},
+  {"NCCL_P2P_DIRECT_DISABLE_value_2", "NCCL_P2P_DIRECT_DISABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_P2P_DIRECT_DISABLE)},
+  {"NCCL_P2P_DIRECT_DISABLE_value_3", "NCCL_P2P_DIRECT_DISABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_P2P_DIRECT_DISABLE)},
+  {"NCCL_P2P_NET_CHUNKSIZE_value_0", "NCCL_P2P_NET_CHUNKSIZE", "0", 0, CVAR_GET(int64_t, NCCL_P2P_NET_CHUNKSIZE)},
+  {"NCCL_P2P_NET_CHUNKSIZE_value_1", "NCCL_P2P_NET_CHUNKSIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_P2P_NET_CHUNKSIZE)},
+  {"NCCL_P2P_NET_CHUNKSIZE_value_2", "NCCL_P2P_NET_CHUNKSIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_P2P_NET_CHUNKSIZE)},
+  {"NCCL_P2P_NET_CHUNKSIZE_value_3", "NCCL_P2P_NET_CHUNKSIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_P2P_NET_CHUNKSIZE)},
+  {"NCCL_P2P_NET_CHUNKSIZE_default_value", "NCCL_P2P_NET_CHUNKSIZE", nullptr, 131072, CVAR_GET(int64_t, NCCL_P2P_NET_CHUNKSIZE)},
+  {"NCCL_PXN_DISABLE_value_0", "NCCL_PXN_DISABLE", "0", 0, CVAR_GET(int64_t, NCCL_PXN_DISABLE)},
+  {"NCCL_PXN_DISABLE_value_1", "NCCL_PXN_DISABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_PXN_DISABLE)},
+  {"NCCL_PXN_DISABLE_value_2", "NCCL_PXN_DISABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_PXN_DISABLE)},
+  {"NCCL_PXN_DISABLE_value_3", "NCCL_PXN_DISABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_PXN_DISABLE)},
+  {"NCCL_SET_STACK_SIZE_value_0", "NCCL_SET_STACK_SIZE", "0", 0, CVAR_GET(int64_t, NCCL_SET_STACK_SIZE)},
+  {"NCCL_SET_STACK_SIZE_value_1", "NCCL_SET_STACK_SIZE", "9999", 9999, CVAR_GET(int64_t, NCCL_SET_STACK_SIZE)},
+  {"NCCL_SET_STACK_SIZE_value_2", "NCCL_SET_STACK_SIZE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_SET_STACK_SIZE)},
+  {"NCCL_SET_STACK_SIZE_value_3", "NCCL_SET_STACK_SIZE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_SET_STACK_SIZE)},
+  {"NCCL_SET_THREAD_NAME_value_0", "NCCL_SET_THREAD_NAME", "0", 0, CVAR_GET(int64_t, NCCL_SET_THREAD_NAME)},
+  {"NCCL_SET_THREAD_NAME_value_1", "NCCL_SET_THREAD_NAME", "9999", 9999, CVAR_GET(int64_t, NCCL_SET_THREAD_NAME)},
+  {"NCCL_SET_THREAD_NAME_value_2", "NCCL_SET_THREAD_NAME", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_SET_THREAD_NAME)},
+  {"NCCL_SET_THREAD_NAME_value_3", "NCCL_SET_THREAD_NAME", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_SET_THREAD_NAME)},
+  {"NCCL_SHM_DISABLE_value_0", "NCCL_SHM_DISABLE", "0", 0, CVAR_GET(int64_t, NCCL_SHM_DISABLE)},
+  {"NCCL_SHM_DISABLE_value_1", "NCCL_SHM_DISABLE", "9999", 9999, CVAR_GET(int64_t, NCCL_SHM_DISABLE)},
+  {"NCCL_SHM_DISABLE_value_2", "NCCL_SHM_DISABLE", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_SHM_DISABLE)},
+  {"NCCL_SHM_DISABLE_value_3", "NCCL_SHM_DISABLE", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_SHM_DISABLE)},
+  {"NCCL_SOCKET_NTHREADS_value_0", "NCCL_SOCKET_NTHREADS", "0", 0, CVAR_GET(int64_t, NCCL_SOCKET_NTHREADS)},
+  {"NCCL_SOCKET_NTHREADS_value_1", "NCCL_SOCKET_NTHREADS", "9999", 9999, CVAR_GET(int64_t, NCCL_SOCKET_NTHREADS)},
+  {"NCCL_SOCKET_NTHREADS_value_2", "NCCL_SOCKET_NTHREADS", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_SOCKET_NTHREADS)},
+  {"NCCL_SOCKET_NTHREADS_value_3", "NCCL_SOCKET_NTHREADS", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_SOCKET_NTHREADS)},
+  {"NCCL_SOCKET_NTHREADS_default_value", "NCCL_SOCKET_NTHREADS", nullptr, -2, CVAR_GET(int64_t, NCCL_SOCKET_NTHREADS)},
+  {"NCCL_TOPO_DUMP_FILE_RANK_value_0", "NCCL_TOPO_DUMP_FILE_RANK", "0", 0, CVAR_GET(int64_t, NCCL_TOPO_DUMP_FILE_RANK)},
+  {"NCCL_TOPO_DUMP_FILE_RANK_value_1", "NCCL_TOPO_DUMP_FILE_RANK", "9999", 9999, CVAR_GET(int64_t, NCCL_TOPO_DUMP_FILE_RANK)},
+  {"NCCL_TOPO_DUMP_FILE_RANK_value_2", "NCCL_TOPO_DUMP_FILE_RANK", "9223372036854775807", std::numeric_limits<int64_t>::max(), CVAR_GET(int64_t, NCCL_TOPO_DUMP_FILE_RANK)},
+  {"NCCL_TOPO_DUMP_FILE_RANK_value_3", "NCCL_TOPO_DUMP_FILE_RANK", "-9223372036854775808", std::numeric_limits<int64_t>::min(), CVAR_GET(int64_t, NCCL_TOPO_DUMP_FILE_RANK)},
+};
+INSTANTIATE_CVAR_CASES(Shard3, CvarIntTest, intCases);
+
+static const CvarCase<std::string> stringCases[] = {
+  {"NCCL_COLLNET_ENABLE_value_0", "NCCL_COLLNET_ENABLE", "val1", "val1", CVAR_GET(std::string, NCCL_COLLNET_ENABLE)},
+  {"NCCL_COLLNET_ENABLE_value_1", "NCCL_COLLNET_ENABLE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_COLLNET_ENABLE)},
+  {"NCCL_IB_ADDR_RANGE_value_0", "NCCL_IB_ADDR_RANGE", "val1", "val1", CVAR_GET(std::string, NCCL_IB_ADDR_RANGE)},
+  {"NCCL_IB_ADDR_RANGE_value_1", "NCCL_IB_ADDR_RANGE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_IB_ADDR_RANGE)},
+  {"NCCL_IB_ADDR_RANGE_default_value", "NCCL_IB_ADDR_RANGE", nullptr, "::/0", CVAR_GET(std::string, NCCL_IB_ADDR_RANGE)},
+  {"NCCL_P2P_DISABLE_value_0", "NCCL_P2P_DISABLE", "val1", "val1", CVAR_GET(std::string, NCCL_P2P_DISABLE)},
+  {"NCCL_P2P_DISABLE_value_1", "NCCL_P2P_DISABLE", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_P2P_DISABLE)},
+  {"NCCL_THREAD_THRESHOLDS_value_0", "NCCL_THREAD_THRESHOLDS", "val1", "val1", CVAR_GET(std::string, NCCL_THREAD_THRESHOLDS)},
+  {"NCCL_THREAD_THRESHOLDS_value_1", "NCCL_THREAD_THRESHOLDS", "  val2_with_space   ", "val2_with_space", CVAR_GET(std::string, NCCL_THREAD_THRESHOLDS)},
+};
+INSTANTIATE_CVAR_CASES(Shard3, CvarStringTest, stringCases);
+
+static const CvarCase<std::vector<std::string>> stringlistCases[] = {
+  {"NCCL_CTRAN_TOPO_FILE_KEYS_valuelist_0", "NCCL_CTRAN_TOPO_FILE_KEYS", "val1,val2,val3", {"val1", "val2", "val3"}, CVAR_GET(std::vector<std::string>, NCCL_CTRAN_TOPO_FILE_KEYS)},
+  {"NCCL_CTRAN_TOPO_FILE_KEYS_valuelist_1", "NCCL_CTRAN_TOPO_FILE_KEYS", "val1:1,val2:2,val3:3", {"val1:1", "val2:2", "val3:3"}, CVAR_GET(std::vector<std::string>, NCCL_CTRAN_TOPO_FILE_KEYS)},
+  {"NCCL_CTRAN_TOPO_FILE_KEYS_valuelist_2", "NCCL_CTRAN_TOPO_FILE_KEYS", "val", {"val"}, CVAR_GET(std::vector<std::string>, NCCL_CTRAN_TOPO_FILE_KEYS)},
+  {"NCCL_CTRAN_TOPO_FILE_KEYS_valuelist_3", "NCCL_CTRAN_TOPO_FILE_KEYS", "val1, val_w_space  ", {"val1", "val_w_space"}, CVAR_GET(std::vector<std::string>, NCCL_CTRAN_TOPO_FILE_KEYS)},
+  {"NCCL_CTRAN_TOPO_FILE_KEYS_default_value", "NCCL_CTRAN_TOPO_FILE_KEYS", nullptr, {}, CVAR_GET(std::vector<std::string>, NCCL_CTRAN_TOPO_FILE_KEYS)},
+};
+INSTANTIATE_CVAR_CASES(Shard3, CvarStringListTest, stringlistCases);
+
+static const CvarWarnCase warnCases[] = {
+  {"NCCL_ALLREDUCE_ALGO_warn_unknown_val", "NCCL_ALLREDUCE_ALGO", "dummy", "Unknown value", CVAR_TOUCH(NCCL_ALLREDUCE_ALGO)},
+  {"NCCL_ALLTOALLV_ALGO_warn_unknown_val", "NCCL_ALLTOALLV_ALGO", "dummy", "Unknown value", CVAR_TOUCH(NCCL_ALLTOALLV_ALGO)},
+  {"NCCL_ALLTOALL_ALGO_warn_unknown_val", "NCCL_ALLTOALL_ALGO", "dummy", "Unknown value", CVAR_TOUCH(NCCL_ALLTOALL_ALGO)},
+  {"NCCL_CTRAN_PROFILING_warn_unknown_val", "NCCL_CTRAN_PROFILING", "dummy", "Unknown value", CVAR_TOUCH(NCCL_CTRAN_PROFILING)},
+  {"NCCL_CTRAN_TOPO_FILE_KEYS_warn_dup_val", "NCCL_CTRAN_TOPO_FILE_KEYS", "dummy,dummy", "Duplicate token", CVAR_TOUCH(NCCL_CTRAN_TOPO_FILE_KEYS)},
+};
+INSTANTIATE_CVAR_CASES(Shard3, CvarWarnTest, warnCases);
+
+// Automatically generated by ./maint/extractcvars.py --- END
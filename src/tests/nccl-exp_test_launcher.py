@@ -1,14 +1,140 @@
 import argparse
+import asyncio
+import collections
+import concurrent.futures
 import contextlib
+import fcntl
+import gzip
+import hashlib
+import itertools
+import json
 import logging
 import os
+import random
+import re
+import signal
 import socket
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
 
+from dataclasses import dataclass, field
 from pathlib import Path
 from subprocess import CompletedProcess
-from typing import Dict, Iterable, Tuple
+from typing import Awaitable, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Python tooling of the repo (CollTrace statistics, performance history)
+MAINT_DIR = Path(__file__).resolve().parents[2] / "maint"
+
+
+@dataclass
+class Span:
+    name: str
+    cat: str
+    tid: int
+    start: float
+    end: float
+    args: Dict[str, str] = field(default_factory=dict)
+
+
+class Timeline:
+    """start and end times of launcher phases ("PHASE") and the commands they
+    run ("CMD"), written as a Chrome/Perfetto trace in the format of the
+    proxy profiler (NCCL_PROXY_PROFILE): "b"/"e" event pairs with an id,
+    timestamps in us, and a closing {} entry. Recording is a no-op until
+    enabled."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.origin = time.monotonic()
+        self.spans: List[Span] = []
+        # rows of the trace, with the main thread first
+        self.tids: Dict[int, int] = {threading.main_thread().ident: 1}
+        self.lock = threading.Lock()
+
+    def add(self, name: str, cat: str, start: float, end: float, **span_args: str) -> None:
+        """record a span between two time.monotonic() times"""
+        if not self.enabled:
+            return
+        with self.lock:
+            tid = self.tids.setdefault(threading.get_ident(), len(self.tids) + 1)
+            self.spans.append(Span(name, cat, tid, start, end, span_args))
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = "CMD", **span_args: str) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, cat, start, time.monotonic(), **span_args)
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as f:
+            f.write("[\n")
+            for i, s in enumerate(sorted(self.spans, key=lambda s: s.start)):
+                for ph, t in (("b", s.start), ("e", s.end)):
+                    event = {
+                        "name": s.name,
+                        "cat": s.cat,
+                        "ph": ph,
+                        "id": i,
+                        "pid": 0,
+                        "tid": s.tid,
+                        "ts": (t - self.origin) * 1e6,
+                    }
+                    if ph == "b" and s.args:
+                        event["args"] = s.args
+                    f.write(json.dumps(event) + ",\n")
+            f.write("{} ]\n")
+
+    def critical_path(self) -> str:
+        """one line summary of the phases that determined the launcher's run
+        time, each with the command that ended last in it"""
+        phases = [s for s in self.spans if s.cat == "PHASE"]
+        if not phases:
+            return "Critical path: no phases recorded"
+        # walk back from the last phase to end, through the phase that ended
+        # last before each one started
+        path = []
+        cur: Optional[Span] = max(phases, key=lambda s: s.end)
+        while cur is not None:
+            path.append(cur)
+            preds = [s for s in phases if s.end <= cur.start]
+            cur = max(preds, key=lambda s: s.end) if preds else None
+
+        parts = []
+        for phase in reversed(path):
+            inner = [
+                s
+                for s in self.spans
+                if s.cat != "PHASE" and phase.start <= s.start and s.end <= phase.end
+            ]
+            text = f"{phase.name} {phase.end - phase.start:.1f}s"
+            details = [f"{s.name} {s.end - s.start:.1f}s" for s in inner if s.cat == "NCCL"]
+            if not details and inner:
+                last = max(inner, key=lambda s: (s.end, s.end - s.start))
+                details = [f"{last.name} {last.end - last.start:.1f}s"]
+            if details:
+                text += f" ({', '.join(details)})"
+            parts.append(text)
+        total = time.monotonic() - self.origin
+        return f"Critical path of {total:.1f}s run: " + " > ".join(parts)
+
+
+TIMELINE = Timeline()
+
+# "root@host" of sush2/suscp command lines
+CMD_HOST_RE = re.compile(r"root@([^\s:']+)")
+
+
+def cmd_label(cmd: str) -> str:
+    """short name of a command line for the timeline"""
+    m = CMD_HOST_RE.search(cmd)
+    prog = os.path.basename(cmd.split()[0]) if cmd.split() else cmd
+    return f"{prog} {m.group(1)}" if m else prog
 
 
 def exec_cmds(run_cmds: Iterable[str]) -> "list[CompletedProcess[bytes]]":
@@ -16,17 +142,262 @@ def exec_cmds(run_cmds: Iterable[str]) -> "list[CompletedProcess[bytes]]":
     shell_outputs = []
     for cmd in run_cmds:
         logging.info(f"Running {cmd}")
-        shell_outputs.append(
-            subprocess.run(
-                [cmd],
-                shell=True,
-                check=True,
-                stderr=subprocess.STDOUT,
+        with TIMELINE.span(cmd_label(cmd), cmd=cmd):
+            shell_outputs.append(
+                subprocess.run(
+                    [cmd],
+                    shell=True,
+                    check=True,
+                    stderr=subprocess.STDOUT,
+                )
             )
-        )
     return shell_outputs
 
 
+# "[jobid,rank]<stdout>:" prefix of mpirun --tag-output
+MPI_TAG_RE = re.compile(r"^\[\d+,(\d+)\]<(?:stdout|stderr)>:\s?")
+# "host:pid:tid [cudaDev]" of the NCCL logger, identifying a process
+NCCL_PREFIX_RE = re.compile(r"(\S+):(\d+):\d+ (?:\[-?\d+\]|NCCL)")
+DEFAULT_ALERT_PATTERNS = ["NCCL WARN", "CVAR:"]
+
+
+class OutputDemux:
+    """split output lines of a launched job by rank
+
+    Lines are attributed to the rank of their mpirun --tag-output prefix or,
+    failing that, to the host:pid of their NCCL logger prefix; other lines go
+    to "launcher". Each rank's lines are appended, gzip-compressed, to
+    <log_dir>/rank<rank>.log.gz (flushed in batches, so that thousands of
+    ranks do not hold thousands of open files), the last tail_lines lines of
+    the job are kept in memory, and lines matching an alert pattern are
+    logged right away.
+    """
+
+    FLUSH_BYTES = 1 << 16
+    MAX_ALERTS_PER_RANK = 5
+
+    def __init__(
+        self,
+        log_dir: Optional[Path],
+        tail_lines: int,
+        alert_patterns: List[str],
+    ) -> None:
+        self.log_dir = log_dir
+        if log_dir is not None:
+            log_dir.mkdir(parents=True, exist_ok=True)
+        self.tail: Deque[Tuple[str, str]] = collections.deque(maxlen=tail_lines)
+        self.alert_re = re.compile("|".join(re.escape(p) for p in alert_patterns))
+        self.alerts: Dict[str, int] = collections.Counter()
+        self.buffers: Dict[str, List[bytes]] = collections.defaultdict(list)
+        self.buffered: Dict[str, int] = collections.Counter()
+        # time.monotonic() of the last "Init COMPLETE" of NCCL_DEBUG=INFO
+        self.last_init: Optional[float] = None
+
+    def rank_of(self, line: str) -> Tuple[str, str]:
+        """(rank, line without the mpirun tag)"""
+        m = MPI_TAG_RE.match(line)
+        if m:
+            return m.group(1), line[m.end() :]
+        m = NCCL_PREFIX_RE.search(line)
+        if m:
+            return f"{m.group(1)}:{m.group(2)}", line
+        return "launcher", line
+
+    def feed(self, raw: str, rank: Optional[str] = None) -> bool:
+        """process a line, of rank if known; returns True if it raised an alert"""
+        if rank is None:
+            rank, line = self.rank_of(raw.rstrip("\n"))
+        else:
+            line = raw.rstrip("\n")
+        self.tail.append((rank, line))
+        if "Init COMPLETE" in line:
+            self.last_init = time.monotonic()
+        if self.log_dir is not None:
+            data = (line + "\n").encode()
+            self.buffers[rank].append(data)
+            self.buffered[rank] += len(data)
+            if self.buffered[rank] >= self.FLUSH_BYTES:
+                self.flush(rank)
+
+        if not self.alert_re.search(line):
+            return False
+        self.alerts[rank] += 1
+        if self.alerts[rank] <= self.MAX_ALERTS_PER_RANK:
+            logging.warning(f"[rank {rank}] {line.strip()}")
+        elif self.alerts[rank] == self.MAX_ALERTS_PER_RANK + 1:
+            logging.warning(f"[rank {rank}] more alerts suppressed")
+        return True
+
+    def flush(self, rank: str) -> None:
+        if not self.buffers[rank]:
+            return
+        name = rank.replace(":", "_").replace("/", "_")
+        # concatenated gzip members read as one stream with zcat/gzip.open
+        with open(self.log_dir / f"rank{name}.log.gz", "ab") as f:
+            f.write(gzip.compress(b"".join(self.buffers[rank])))
+        self.buffers[rank] = []
+        self.buffered[rank] = 0
+
+    def close(self) -> None:
+        if self.log_dir is not None:
+            for rank in list(self.buffers):
+                self.flush(rank)
+
+    def add_init_spans(self, start: float, end: float) -> None:
+        """split a job from start to end into NCCL init and test spans of
+        the timeline, if the job logged when NCCL init completed"""
+        if self.last_init is not None:
+            TIMELINE.add("NCCL init", "NCCL", start, self.last_init)
+            TIMELINE.add("test", "NCCL", self.last_init, end)
+
+    def summary(self) -> None:
+        """log ranks with alerts and the in-memory tail"""
+        if self.alerts:
+            total = sum(self.alerts.values())
+            ranks = ", ".join(f"{r} ({n})" for r, n in sorted(self.alerts.items()))
+            logging.warning(f"{total} alerts from ranks {ranks}")
+        for rank, line in self.tail:
+            print(f"[{rank}] {line}")
+
+
+async def stream_cmd(cmd: str, demux: OutputDemux, kill_on_alert: bool) -> int:
+    """run cmd, feeding its stdout and stderr to demux line by line"""
+    proc = await asyncio.create_subprocess_shell(
+        cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=1 << 20,
+        # own process group, so that mpirun or sush2 under the shell is
+        # terminated with it
+        start_new_session=True,
+    )
+
+    async def pump(stream: asyncio.StreamReader) -> None:
+        while True:
+            line = await stream.readline()
+            if not line:
+                return
+            if demux.feed(line.decode(errors="replace")) and kill_on_alert:
+                if proc.returncode is None:
+                    logging.error(f"Terminating {cmd} on alert")
+                    with contextlib.suppress(ProcessLookupError):
+                        os.killpg(proc.pid, signal.SIGTERM)
+
+    await asyncio.gather(pump(proc.stdout), pump(proc.stderr))
+    return await proc.wait()
+
+
+def exec_streamed(
+    cmd: str, args: argparse.Namespace, log_dir: Optional[Path]
+) -> int:
+    """run an mpirun command through the per-rank output pipeline"""
+    logging.info(f"Running {cmd}")
+    demux = OutputDemux(log_dir, args.tail_lines, args.alert_pattern or DEFAULT_ALERT_PATTERNS)
+    start = time.monotonic()
+    try:
+        with TIMELINE.span(cmd_label(cmd), cmd=cmd):
+            returncode = asyncio.run(stream_cmd(cmd, demux, args.kill_on_alert))
+    finally:
+        demux.close()
+    demux.add_init_spans(start, time.monotonic())
+    if returncode != 0 or demux.alerts:
+        demux.summary()
+    if log_dir is not None:
+        logging.info(f"Per-rank logs of {cmd} in {log_dir}")
+    return returncode
+
+
+def file_sha256(path: Path) -> str:
+    """sha256 of a local file, as printed by sha256sum"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def remote_sha256(host: str, path: str) -> Optional[str]:
+    """sha256 of a file on a remote host, or None if it cannot be read"""
+    cmd = f"sush2 --reason 'Check NCCL-EXP test binary' root@{host} 'sha256sum {path}'"
+    with TIMELINE.span(cmd_label(cmd), cmd=cmd):
+        res = subprocess.run(
+            [cmd],
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    if res.returncode != 0 or not res.stdout:
+        return None
+    return res.stdout.split()[0]
+
+
+def copy_cmd(src_host: Optional[str], binary: Path, dst_host: str, dest_dir: str) -> str:
+    """command copying binary to dst_host, from the launcher host if src_host
+    is None or else from the copy already in dest_dir on src_host"""
+    if src_host is None:
+        return f"suscp --reason 'copy NCCL-EXP test launcher binary' {binary} root@{dst_host}:{dest_dir}"
+    return (
+        f"sush2 --reason 'forward NCCL-EXP test launcher binary' root@{src_host} "
+        f"'suscp --reason \"forward NCCL-EXP test launcher binary\" {dest_dir}{binary.name} root@{dst_host}:{dest_dir}'"
+    )
+
+
+def distribute_binaries(
+    binaries: Iterable[Path],
+    hosts: List[str],
+    max_workers: int = 16,
+    tree_min_hosts: int = 16,
+    dest_dir: str = "/tmp/",
+) -> None:
+    """copy each binary once to dest_dir on every host that lacks it
+
+    Hosts already holding a copy with the same sha256 are skipped. Copies run
+    on a pool of max_workers threads. When at least tree_min_hosts hosts need
+    a binary, it is sent as a binomial tree: every round, each host holding
+    the binary (the launcher included) forwards it to one more host, so all
+    hosts have it after about log2(#hosts) rounds. Binaries are copied
+    under their basename, which must therefore be unique.
+    """
+    hosts = list(dict.fromkeys(h for h in hosts if h != "localhost"))
+    by_name: Dict[str, Path] = {}
+    for binary in binaries:
+        other = by_name.setdefault(binary.name, binary)
+        if other.resolve() != binary.resolve():
+            raise ValueError(f"{other} and {binary} would both be copied to {dest_dir}{binary.name}")
+    binaries = list(by_name.values())
+    if not binaries or not hosts:
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for binary in binaries:
+            phase_start = time.monotonic()
+            digest = file_sha256(binary)
+            remote = dest_dir + binary.name
+            remote_digests = pool.map(lambda h: remote_sha256(h, remote), hosts)
+            targets = [h for h, d in zip(hosts, remote_digests) if d != digest]
+            logging.info(
+                f"Distributing {binary} to {len(targets)} hosts ({len(hosts) - len(targets)} up to date)"
+            )
+            if len(targets) < tree_min_hosts:
+                rounds = [[(None, h) for h in targets]]
+            else:
+                rounds = []
+                holders: List[Optional[str]] = [None]
+                pending = list(targets)
+                while pending:
+                    sends = list(zip(holders, pending))
+                    pending = pending[len(sends):]
+                    holders += [dst for _, dst in sends]
+                    rounds.append(sends)
+            for sends in rounds:
+                cmds = [copy_cmd(src, binary, dst, dest_dir) for src, dst in sends]
+                # raises on the first failed copy, as exec_cmds() does
+                for _ in pool.map(lambda cmd: exec_cmds([cmd]), cmds):
+                    pass
+            TIMELINE.add(f"distribute {binary.name}", "PHASE", phase_start, time.monotonic())
+
+
 def get_nccl_test_binary(name: str) -> Tuple[Path, str]:
     """get full path and executable name from par package"""
     # If it looks like a path, treat it like one
@@ -63,28 +434,34 @@ def find_free_port() -> int:
         return s.getsockname()[1]
 
 
-def remote_mpi_launcher(args: argparse.Namespace) -> None:
-    """launch multi-process/node runs on remote hosts using MPI launcher"""
-    if len(args.hosts.split(",")) != args.nnode:
-        logging.warning(
-            f"nnode ({args.nnode}) does not match provided hosts: {args.hosts}...use provided hosts"
-        )
-        args.nnode = len(args.hosts.split(","))
-
-    master_addr = os.environ.get("MASTER_ADDR", args.hosts.split(",")[0])
-    if args.mpi_args is None:
-        np = args.nnode * args.ppn
-        ifname = args.ifname
-        host_list = [f"{host}:{args.ppn}" for host in args.hosts.split(",")]
-        final_hosts = ",".join(host_list)
-        mpi_args = f"-np {np} -host {final_hosts} --allow-run-as-root -x MASTER_ADDR={master_addr}"
-        if master_addr not in ("localhost", "127.0.0.1") and args.nnode > 1:
-            mpi_args = f"{mpi_args} -x THRIFT_TLS_CL_KEY_PATH=/var/facebook/x509_identities/server.pem -x THRIFT_TLS_CL_CERT_PATH=/var/facebook/x509_identities/server.pem --gmca btl_tcp_if_include {ifname} --gmca oob_tcp_if_include {ifname} --gmca btl tcp,self"
-    else:
-        mpi_args = args.mpi_args
+def build_mpi_args(
+    hosts: List[str],
+    ppn: int,
+    master_addr: str,
+    ifname: str,
+    tag_output: bool = False,
+    rankfile: Optional[str] = None,
+) -> str:
+    """mpirun arguments launching ppn processes on each of hosts, prefixing
+    their output lines with the rank if tag_output, and placing ranks as in
+    rankfile if given"""
+    np = len(hosts) * ppn
+    host_list = [f"{host}:{ppn}" for host in hosts]
+    final_hosts = ",".join(host_list)
+    mpi_args = f"-np {np} -host {final_hosts} --allow-run-as-root -x MASTER_ADDR={master_addr}"
+    if tag_output:
+        mpi_args = f"{mpi_args} --tag-output"
+    if rankfile is not None:
+        mpi_args = f"{mpi_args} --rankfile {rankfile}"
+    if master_addr not in ("localhost", "127.0.0.1") and len(hosts) > 1:
+        mpi_args = f"{mpi_args} -x THRIFT_TLS_CL_KEY_PATH=/var/facebook/x509_identities/server.pem -x THRIFT_TLS_CL_CERT_PATH=/var/facebook/x509_identities/server.pem --gmca btl_tcp_if_include {ifname} --gmca oob_tcp_if_include {ifname} --gmca btl tcp,self"
+    return mpi_args
 
-    # env. variables to be set on remote hosts
-    envs = parse_envs(args.envs)
+
+def with_envs(mpi_args: str, envs: Dict[str, str]) -> str:
+    """add env. variables to be set on remote hosts to mpirun arguments,
+    picking a free MASTER_PORT unless one is given"""
+    envs = dict(envs)
     # If user doesn't specify MASTER_PORT, try to dynamically find a free one on local machine where launcher is called
     # Note that this allows two nccl-tests-launcher to concurrently run on the same machine without port conflict (e.g., on sandcastle)
     if "MASTER_PORT" not in envs.keys():
@@ -93,28 +470,1066 @@ def remote_mpi_launcher(args: argparse.Namespace) -> None:
 
     for key, val in envs.items():
         mpi_args += f" -x {key}={val}"
+    return mpi_args
 
-    run_cmds = []
-    for coll in args.testname.split(","):
-        par_path, executable = get_nccl_test_binary(coll)
-        logging.info(f"Launching nccl-exp-test at {par_path}/{executable}")
-        # copy binary to remote hosts
-        for host in args.hosts.split(","):
-            if host != "localhost":
-                run_cmds.append(
-                    f"suscp --reason 'copy NCCL-EXP test launcher binary' {par_path}/{executable} root@{host}:/tmp/"
-                )
-        # mpirun launching nccl-tests on remote node
-        if master_addr != "localhost":
-            run_cmds.append(
-                f"sush2 --reason 'Testing NCCL-EXP test' root@{master_addr} '/usr/local/fbcode/bin/mpirun {mpi_args} /tmp/{executable}'"
+
+def mpirun_cmd(mpi_args: str, master_addr: str, par_path: Path, executable: str) -> str:
+    """command running mpirun on master_addr"""
+    # mpirun launching nccl-tests on remote node
+    if master_addr != "localhost":
+        return f"sush2 --reason 'Testing NCCL-EXP test' root@{master_addr} '/usr/local/fbcode/bin/mpirun {mpi_args} /tmp/{executable}'"
+    return f"/usr/local/fbcode/bin/mpirun {mpi_args} {par_path}/{executable}"
+
+
+@dataclass
+class HostTopo:
+    """GPUs and NICs of a host, from its NCCL_TOPO_DUMP_FILE XML"""
+
+    # (cuda dev, NUMA node of its CPU) by dev
+    gpus: List[Tuple[int, int]]
+    # (name, speed in Mbps)
+    nets: List[Tuple[str, int]]
+
+
+def parse_topo_xml(path: Path) -> HostTopo:
+    """read a topology dumped by ncclTopoDumpXmlToFile()"""
+    root = ET.parse(path).getroot()
+    gpus = []
+    for cpu in root.iter("cpu"):
+        numa = int(cpu.get("numaid", "0"))
+        gpus += [(int(gpu.get("dev", "0")), numa) for gpu in cpu.iter("gpu")]
+    nets = [(net.get("name", ""), int(net.get("speed", "0"))) for net in root.iter("net")]
+    return HostTopo(sorted(gpus), nets)
+
+
+def load_host_labels(path: str) -> Dict[str, Tuple[str, ...]]:
+    """{host: labels} of lines "HOST SWITCH [RACK ...]", labels going from
+    the closest network level to the farthest"""
+    labels = {}
+    with open(path) as f:
+        for line in f:
+            fields = line.split("#", 1)[0].split()
+            if len(fields) >= 2:
+                labels[fields[0]] = tuple(fields[1:])
+    return labels
+
+
+def host_distance(a: Tuple[str, ...], b: Tuple[str, ...]) -> int:
+    """switch hops between hosts with labels a and b: 0 under the same
+    switch, then 2 more per level up to their closest common label"""
+    levels = max(len(a), len(b))
+    for level in range(levels):
+        if level < len(a) and level < len(b) and a[level] == b[level]:
+            return 2 * level
+    return 2 * levels
+
+
+def btree_parent(nranks: int, rank: int) -> int:
+    """parent of rank in NCCL's binary tree (ncclGetBtree() in trees.cc)"""
+    if rank == 0:
+        return -1
+    bit = 1
+    while bit < nranks and not bit & rank:
+        bit <<= 1
+    up = (rank ^ bit) | (bit << 1)
+    return up if up < nranks else rank ^ bit
+
+
+def dtree_edges(nranks: int) -> List[Tuple[int, int]]:
+    """(child, parent) node pairs of NCCL's double binary tree
+    (ncclGetDtree() in trees.cc): a btree, and its mirror when nranks is
+    even or the btree shifted by one when nranks is odd"""
+    edges = []
+    for rank in range(nranks):
+        up = btree_parent(nranks, rank)
+        if up >= 0:
+            edges.append((rank, up))
+        if nranks % 2:
+            up = btree_parent(nranks, (rank - 1) % nranks)
+            if up >= 0:
+                edges.append((rank, (up + 1) % nranks))
+        else:
+            up = btree_parent(nranks, nranks - 1 - rank)
+            if up >= 0:
+                edges.append((rank, nranks - 1 - up))
+    return edges
+
+
+def placement_cost(order: List[str], labels: Dict[str, Tuple[str, ...]]) -> Tuple[int, int]:
+    """switch hops between (ring, double tree) neighbors of hosts in order"""
+    host_labels = [labels.get(host, ()) for host in order]
+    n = len(order)
+    ring = sum(host_distance(host_labels[i], host_labels[(i + 1) % n]) for i in range(n)) if n > 1 else 0
+    tree = sum(host_distance(host_labels[a], host_labels[b]) for a, b in dtree_edges(n))
+    return ring, tree
+
+
+def order_hosts(hosts: List[str], labels: Dict[str, Tuple[str, ...]]) -> List[str]:
+    """order of hosts with few switch hops between ring and tree neighbors
+
+    Candidates are the given order and hosts grouped by label hierarchy
+    (farthest level first), with groups in name order or largest first (so
+    that large groups align with the power-of-two subtrees of the btree).
+    The cheapest one is then improved by swapping whole switch groups while
+    that lowers the cost, for up to MAX_SWAP_GROUPS groups.
+    """
+
+    def natural(s: str) -> List[object]:
+        return [int(t) if t.isdigit() else t for t in re.split(r"(\d+)", s)]
+
+    def grouped(largest_first: bool) -> List[str]:
+        def order(members: List[str], level: int) -> List[str]:
+            if level < 0:
+                return sorted(members, key=natural)
+            groups: Dict[str, List[str]] = collections.defaultdict(list)
+            for host in members:
+                host_labels = labels.get(host, ())
+                groups[host_labels[level] if level < len(host_labels) else ""].append(host)
+            keys = sorted(groups, key=natural)
+            if largest_first:
+                keys.sort(key=lambda k: -len(groups[k]))
+            return [h for k in keys for h in order(groups[k], level - 1)]
+
+        depth = max((len(labels.get(host, ())) for host in hosts), default=0)
+        return order(hosts, depth - 1)
+
+    cost = lambda order: sum(placement_cost(order, labels))
+    best = min([list(hosts), grouped(False), grouped(True)], key=cost)
+
+    # contiguous runs of hosts under the same switch
+    blocks: List[List[str]] = []
+    for host in best:
+        if blocks and labels.get(host, ())[:1] == labels.get(blocks[-1][0], ())[:1]:
+            blocks[-1].append(host)
+        else:
+            blocks.append([host])
+    if len(blocks) > MAX_SWAP_GROUPS:
+        return best
+    best_cost = cost(best)
+    improved = True
+    while improved:
+        improved = False
+        for i, j in itertools.combinations(range(len(blocks)), 2):
+            blocks[i], blocks[j] = blocks[j], blocks[i]
+            order = [h for block in blocks for h in block]
+            if cost(order) < best_cost:
+                best, best_cost, improved = order, cost(order), True
+            else:
+                blocks[i], blocks[j] = blocks[j], blocks[i]
+    return best
+
+
+MAX_SWAP_GROUPS = 64
+
+
+def write_rankfile(
+    path: str, hosts: List[str], ppn: int, topos: Dict[str, HostTopo]
+) -> None:
+    """mpirun rankfile placing ranks host by host in the order of hosts,
+    local rank i using GPU i and bound to a core of the socket of that
+    GPU's NUMA node when the topology of the host is known"""
+    with open(path, "w") as f:
+        rank = 0
+        for host in hosts:
+            topo = topos.get(host)
+            per_socket: Dict[int, int] = collections.Counter()
+            for local_rank in range(ppn):
+                if topo is not None and local_rank < len(topo.gpus):
+                    socket_id = topo.gpus[local_rank][1]
+                    core = per_socket[socket_id]
+                    per_socket[socket_id] += 1
+                    f.write(f"rank {rank}={host} slot={socket_id}:{core}\n")
+                else:
+                    f.write(f"rank {rank}={host} slot={local_rank}\n")
+                rank += 1
+
+
+def place_hosts(hosts: List[str], args: argparse.Namespace) -> List[str]:
+    """hosts in topology-aware order, writing the --rankfile of this order
+    if requested"""
+    labels = load_host_labels(args.topo_labels) if args.topo_labels else {}
+    topos: Dict[str, HostTopo] = {}
+    if args.topo_dir is not None:
+        for host in hosts:
+            path = Path(args.topo_dir) / f"{host}.xml"
+            if path.exists():
+                topos[host] = parse_topo_xml(path)
+            else:
+                logging.warning(f"No topology of {host} in {args.topo_dir}")
+        for host, topo in topos.items():
+            if len(topo.gpus) < args.ppn:
+                logging.warning(f"{host} has {len(topo.gpus)} GPUs for {args.ppn} processes")
+        speeds = {host: sum(speed for _, speed in topo.nets) for host, topo in topos.items()}
+        if speeds and min(speeds.values()) < max(speeds.values()):
+            slow = [host for host, speed in speeds.items() if speed < max(speeds.values())]
+            logging.warning(f"Hosts with less network bandwidth than others: {','.join(slow)}")
+
+    missing = [host for host in hosts if host not in labels]
+    if labels and missing:
+        logging.warning(f"No switch labels of {len(missing)} hosts: {','.join(missing[:8])}")
+    ordered = order_hosts(hosts, labels)
+    before, after = placement_cost(hosts, labels), placement_cost(ordered, labels)
+    logging.info(
+        f"Topology-aware host order: ring/tree switch hops {before[0]}/{before[1]} -> {after[0]}/{after[1]}"
+    )
+
+    if args.rankfile is not None:
+        # absolute, as mpirun reads it from the same path on the host running it
+        args.rankfile = os.path.abspath(args.rankfile)
+        write_rankfile(args.rankfile, ordered, args.ppn, topos)
+        logging.info(f"Wrote rankfile {args.rankfile}")
+    return ordered
+
+
+def copy_rankfile(rankfile: str, master_addr: str) -> None:
+    """copy rankfile to the same path on master_addr, the host running mpirun"""
+    if master_addr not in LOCAL_HOSTS:
+        exec_cmds(
+            [f"suscp --reason 'copy NCCL-EXP rankfile' {rankfile} root@{master_addr}:{os.path.dirname(rankfile)}/"]
+        )
+
+
+LOCAL_HOSTS = ("localhost", "127.0.0.1")
+PORT_LOCK_DIR = Path(tempfile.gettempdir()) / "nccl-exp-launcher-ports"
+
+
+def ephemeral_port_range() -> Tuple[int, int]:
+    """ports the kernel hands out to sockets bound to port 0"""
+    try:
+        with open("/proc/sys/net/ipv4/ip_local_port_range") as f:
+            low, high = f.read().split()
+            return int(low), int(high)
+    except (OSError, ValueError):
+        return 32768, 60999
+
+
+@contextlib.contextmanager
+def reserve_port() -> Iterator[int]:
+    """reserve a free local port while the context is active
+
+    Unlike find_free_port(), the port is outside of the ephemeral range, so
+    that no socket bound to port 0 gets it, and is held by an exclusive lock
+    file, so that concurrent launchers on this host never pick the same one.
+    """
+    PORT_LOCK_DIR.mkdir(parents=True, exist_ok=True)
+    low, high = ephemeral_port_range()
+    candidates = [p for p in range(10000, 65536) if not low <= p <= high]
+    start = random.randrange(len(candidates))
+    for port in candidates[start:] + candidates[:start]:
+        lock = open(PORT_LOCK_DIR / f"{port}.lock", "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            continue
+        try:
+            with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+                s.bind(("", port))
+        except OSError:
+            # used by a process that is not a launcher
+            lock.close()
+            continue
+        try:
+            yield port
+        finally:
+            lock.close()
+        return
+    raise RuntimeError("no free port to reserve")
+
+
+class Backend:
+    """how the processes of a test are started on its hosts"""
+
+    name = ""
+
+    def distribute(self, binaries: List[Path], hosts: List[str], args: argparse.Namespace) -> None:
+        """make binaries available on hosts"""
+
+    def run(
+        self,
+        par_path: Path,
+        executable: str,
+        hosts: List[str],
+        ppn: int,
+        master_addr: str,
+        envs: Dict[str, str],
+        args: argparse.Namespace,
+        log_dir: Optional[Path],
+    ) -> int:
+        """run ppn processes of executable on each of hosts, with envs set and
+        their output split by rank into log_dir if given; returns the exit
+        status"""
+        raise NotImplementedError
+
+
+class MpirunBackend(Backend):
+    """mpirun on master_addr (through sush2 unless local), with binaries
+    copied to the hosts by suscp"""
+
+    name = "mpirun"
+
+    def distribute(self, binaries: List[Path], hosts: List[str], args: argparse.Namespace) -> None:
+        distribute_binaries(
+            binaries,
+            hosts,
+            max_workers=args.dist_workers,
+            tree_min_hosts=args.dist_tree_min_hosts,
+        )
+
+    def run(
+        self,
+        par_path: Path,
+        executable: str,
+        hosts: List[str],
+        ppn: int,
+        master_addr: str,
+        envs: Dict[str, str],
+        args: argparse.Namespace,
+        log_dir: Optional[Path],
+    ) -> int:
+        if args.mpi_args is None:
+            mpi_args = build_mpi_args(
+                hosts, ppn, master_addr, args.ifname, log_dir is not None, args.rankfile
             )
         else:
-            run_cmds.append(
-                f"/usr/local/fbcode/bin/mpirun {mpi_args} {par_path}/{executable}"
+            mpi_args = args.mpi_args
+        cmd = mpirun_cmd(with_envs(mpi_args, envs), master_addr, par_path, executable)
+        if log_dir is not None:
+            return exec_streamed(cmd, args, log_dir)
+        logging.info(f"Running {cmd}")
+        with TIMELINE.span(cmd_label(cmd), cmd=cmd):
+            return subprocess.run([cmd], shell=True, stderr=subprocess.STDOUT).returncode
+
+
+class LocalBackend(Backend):
+    """processes spawned directly on this host, without MPI
+
+    Each process gets RANK, WORLD_SIZE, LOCAL_RANK, LOCAL_WORLD_SIZE,
+    MASTER_ADDR and MASTER_PORT (reserved with reserve_port() unless given in
+    envs) and its own process group. When a process fails, or a line raises
+    an alert with --kill-on-alert, all process groups are sent SIGTERM, and
+    SIGKILL after TERM_GRACE_SEC.
+    """
+
+    name = "local"
+    TERM_GRACE_SEC = 10.0
+
+    def run(
+        self,
+        par_path: Path,
+        executable: str,
+        hosts: List[str],
+        ppn: int,
+        master_addr: str,
+        envs: Dict[str, str],
+        args: argparse.Namespace,
+        log_dir: Optional[Path],
+    ) -> int:
+        if any(host not in LOCAL_HOSTS for host in hosts):
+            raise ValueError(f"the local backend only runs on localhost, not {','.join(hosts)}")
+        world_size = len(hosts) * ppn
+        cmd = [str(par_path / executable)]
+        demux = None
+        if log_dir is not None:
+            demux = OutputDemux(log_dir, args.tail_lines, args.alert_pattern or DEFAULT_ALERT_PATTERNS)
+
+        with contextlib.ExitStack() as stack:
+            if "MASTER_PORT" not in envs:
+                envs = {**envs, "MASTER_PORT": str(stack.enter_context(reserve_port()))}
+            envs = {"MASTER_ADDR": "127.0.0.1", **envs}
+            logging.info(f"Running {world_size} processes of {cmd[0]} with MASTER_PORT={envs['MASTER_PORT']}")
+            start = time.monotonic()
+            try:
+                with TIMELINE.span(f"local {executable}", cmd=cmd[0]):
+                    returncode = asyncio.run(
+                        self.supervise(cmd, world_size, envs, demux, args.kill_on_alert)
+                    )
+            finally:
+                if demux is not None:
+                    demux.close()
+        if demux is not None:
+            demux.add_init_spans(start, time.monotonic())
+            if returncode != 0 or demux.alerts:
+                demux.summary()
+            logging.info(f"Per-rank logs of {cmd[0]} in {log_dir}")
+        return returncode
+
+    async def supervise(
+        self,
+        cmd: List[str],
+        world_size: int,
+        envs: Dict[str, str],
+        demux: Optional[OutputDemux],
+        kill_on_alert: bool,
+    ) -> int:
+        """run the processes; returns the first non-zero exit status, or 0"""
+        procs: List[asyncio.subprocess.Process] = []
+        teardown: Optional[asyncio.Future] = None
+
+        def fail(reason: str) -> None:
+            nonlocal teardown
+            if teardown is None:
+                logging.error(f"{reason}, terminating all ranks")
+                teardown = asyncio.ensure_future(self.terminate(procs))
+
+        async def pump(rank: int, stream: asyncio.StreamReader) -> None:
+            while True:
+                line = await stream.readline()
+                if not line:
+                    return
+                if demux.feed(line.decode(errors="replace"), str(rank)) and kill_on_alert:
+                    fail(f"Alert from rank {rank}")
+
+        try:
+            pipe = asyncio.subprocess.PIPE if demux is not None else None
+            for rank in range(world_size):
+                env = {
+                    **os.environ,
+                    **envs,
+                    "RANK": str(rank),
+                    "WORLD_SIZE": str(world_size),
+                    "LOCAL_RANK": str(rank),
+                    "LOCAL_WORLD_SIZE": str(world_size),
+                }
+                procs.append(
+                    await asyncio.create_subprocess_exec(
+                        *cmd,
+                        env=env,
+                        stdout=pipe,
+                        stderr=pipe,
+                        limit=1 << 20,
+                        start_new_session=True,
+                    )
+                )
+            pumps = []
+            if demux is not None:
+                pumps = [pump(rank, s) for rank, p in enumerate(procs) for s in (p.stdout, p.stderr)]
+            pumps_done = asyncio.ensure_future(asyncio.gather(*pumps))
+
+            returncode = 0
+            waits = {asyncio.ensure_future(p.wait()): rank for rank, p in enumerate(procs)}
+            pending = set(waits)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for wait in done:
+                    if wait.result() != 0 and returncode == 0:
+                        returncode = wait.result()
+                        fail(f"Rank {waits[wait]} exited with {returncode}")
+            await pumps_done
+            return returncode
+        finally:
+            if teardown is not None:
+                teardown.cancel()
+            # interrupted, or failed to spawn every rank
+            for proc in procs:
+                if proc.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        os.killpg(proc.pid, signal.SIGKILL)
+
+    async def terminate(self, procs: List[asyncio.subprocess.Process]) -> None:
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            for proc in procs:
+                if proc.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        os.killpg(proc.pid, sig)
+            await asyncio.sleep(self.TERM_GRACE_SEC)
+
+
+BACKENDS = {backend.name: backend for backend in (MpirunBackend, LocalBackend)}
+
+
+@dataclass
+class TestRun:
+    """a test of the scheduler, and its outcome once run"""
+
+    spec: str
+    par_path: Path
+    executable: str
+    nnode: int
+    ppn: int
+    hosts: List[str] = field(default_factory=list)
+    returncode: Optional[int] = None
+    start: float = 0.0
+    duration: float = 0.0
+
+
+def parse_test_spec(spec: str, nnode: int, ppn: int) -> TestRun:
+    """parse NAME[:NNODE[xPPN]], e.g. "AllToAllTest:2x8", of --testname"""
+    name, _, shape = spec.partition(":")
+    if shape:
+        nnode_str, _, ppn_str = shape.partition("x")
+        nnode = int(nnode_str)
+        ppn = int(ppn_str) if ppn_str else ppn
+    par_path, executable = get_nccl_test_binary(name)
+    return TestRun(spec, par_path, executable, nnode, ppn)
+
+
+def run_test(test: TestRun, args: argparse.Namespace, envs: Dict[str, str], index: int) -> TestRun:
+    """run test on its hosts, recording exit status and timing"""
+    log_dir = None
+    if args.log_dir is not None:
+        log_dir = Path(args.log_dir) / f"{index}_{test.executable}"
+    test.start = time.monotonic()
+    test.returncode = BACKENDS[args.backend]().run(
+        test.par_path, test.executable, test.hosts, test.ppn, test.hosts[0], envs, args, log_dir
+    )
+    test.duration = time.monotonic() - test.start
+    TIMELINE.add(f"run {test.spec}", "PHASE", test.start, test.start + test.duration)
+    return test
+
+
+def schedule_tests(
+    tests: List[TestRun], hosts: List[str], args: argparse.Namespace, envs: Dict[str, str]
+) -> List[TestRun]:
+    """run tests concurrently on disjoint partitions of hosts
+
+    Tests start in the given order as soon as enough hosts are free (a test
+    that does not fit yet does not hold back later ones that do), and every
+    test runs to completion regardless of the outcome of others.
+    """
+    for test in tests:
+        if test.nnode > len(hosts):
+            raise ValueError(f"test {test.spec} needs {test.nnode} hosts, only {len(hosts)} given")
+
+    free = list(hosts)
+    # by index, as identical specs give equal TestRuns
+    pending = dict(enumerate(tests))
+    running: Dict[concurrent.futures.Future, TestRun] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(hosts)) as pool:
+        while pending or running:
+            for index, test in list(pending.items()):
+                if test.nnode <= len(free):
+                    test.hosts, free = free[: test.nnode], free[test.nnode :]
+                    del pending[index]
+                    running[pool.submit(run_test, test, args, envs, index)] = test
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
             )
+            for future in done:
+                test = running.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"Failed to run {test.spec}: {e}")
+                    test.returncode = -1
+                free += test.hosts
+    return tests
+
+
+def print_summary(tests: List[TestRun]) -> None:
+    """print a table of the outcome of each test"""
+    rows = [("TEST", "HOSTS", "RANKS", "STATUS", "TIME(s)")]
+    for test in tests:
+        status = "OK" if test.returncode == 0 else f"FAILED({test.returncode})"
+        rows.append(
+            (
+                test.spec,
+                ",".join(test.hosts),
+                str(len(test.hosts) * test.ppn),
+                status,
+                f"{test.duration:.1f}",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(col.ljust(w) for col, w in zip(row, widths)).rstrip())
+
+
+def remote_mpi_launcher(
+    args: argparse.Namespace, envs: Optional[Dict[str, str]] = None
+) -> bool:
+    """launch multi-process/node runs on remote hosts using MPI launcher,
+    with envs (default: --envs) set; returns whether all tests passed"""
+    hosts = args.hosts.split(",")
+    if envs is None:
+        envs = parse_envs(args.envs)
+    backend = BACKENDS[args.backend]()
+
+    if args.schedule:
+        if args.mpi_args is not None:
+            raise ValueError("--mpi-args cannot be used with --schedule, which picks the hosts of each test")
+        if args.rankfile is not None:
+            raise ValueError("--rankfile cannot be used with --schedule, which picks the hosts of each test")
+        tests = [parse_test_spec(t, args.nnode, args.ppn) for t in args.testname.split(",")]
+        backend.distribute([test.par_path / test.executable for test in tests], hosts, args)
+        schedule_tests(tests, hosts, args, envs)
+        print_summary(tests)
+        return all(test.returncode == 0 for test in tests)
+
+    if len(hosts) != args.nnode:
+        logging.warning(
+            f"nnode ({args.nnode}) does not match provided hosts: {args.hosts}...use provided hosts"
+        )
+        args.nnode = len(hosts)
+
+    placed = args.topo_dir is not None or args.topo_labels is not None
+    if placed:
+        if args.mpi_args is not None:
+            raise ValueError("--mpi-args cannot be used with --topo-dir or --topo-labels, which order the hosts")
+        hosts = place_hosts(hosts, args)
+    # mpirun runs on the first host of the placement
+    master_addr = os.environ.get("MASTER_ADDR", hosts[0])
+    if placed and args.rankfile is not None:
+        copy_rankfile(args.rankfile, master_addr)
+    tests = [get_nccl_test_binary(coll) for coll in args.testname.split(",")]
+
+    # copy binaries to remote hosts
+    backend.distribute([par_path / executable for par_path, executable in tests], hosts, args)
+
+    for i, (par_path, executable) in enumerate(tests):
+        logging.info(f"Launching nccl-exp-test at {par_path}/{executable}")
+        log_dir = None
+        if args.log_dir is not None:
+            log_dir = Path(args.log_dir) / f"{i}_{executable}"
+        with TIMELINE.span(f"run {executable}", "PHASE"):
+            returncode = backend.run(
+                par_path, executable, hosts, args.ppn, master_addr, envs, args, log_dir
+            )
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, f"{par_path}/{executable}")
+    return True
+
+
+def parse_sweep(sweep_str: str) -> Dict[str, List[str]]:
+    """parse sweep axes "KEY=V1|V2|...;KEY2=..." into {KEY: [V1, V2, ...]}"""
+    axes = {}
+    for axis in sweep_str.split(";"):
+        if axis and "=" in axis:
+            key, values = axis.split("=", 1)
+            axes[key] = values.split("|")
+    return axes
+
+
+def sweep_configs(
+    axes: Dict[str, List[str]], design: str, samples: int, seed: int
+) -> List[Dict[str, str]]:
+    """env. variable settings covering the sweep axes
 
-    exec_cmds(run_cmds)
+    "cartesian" is every combination of values. "lhs" is a Latin hypercube
+    of samples configurations: the values of each axis are split into
+    samples equally likely strata, visited once each in random order.
+    """
+    keys = list(axes)
+    if design == "cartesian":
+        return [dict(zip(keys, values)) for values in itertools.product(*axes.values())]
+
+    rng = random.Random(seed)
+    columns = []
+    for key in keys:
+        strata = list(range(samples))
+        rng.shuffle(strata)
+        n = len(axes[key])
+        columns.append([axes[key][int((s + rng.random()) * n / samples)] for s in strata])
+    configs = [dict(zip(keys, values)) for values in zip(*columns)]
+    # fewer distinct configurations than samples when axes have few values
+    return [dict(c) for c in dict.fromkeys(tuple(c.items()) for c in configs)]
+
+
+def make_trace_dir(hosts: List[str], trace_dir: str) -> None:
+    """create trace_dir on hosts and locally"""
+    for host in dict.fromkeys(hosts):
+        if host != "localhost":
+            exec_cmds([f"sush2 --reason 'Testing NCCL-EXP test' root@{host} 'mkdir -p {trace_dir}'"])
+    Path(trace_dir).mkdir(parents=True, exist_ok=True)
+
+
+def gather_colltrace(hosts: List[str], trace_dir: str, local_dir: Path) -> None:
+    """copy the <rank>_online.json files of trace_dir on hosts to local_dir"""
+    local_dir.mkdir(parents=True, exist_ok=True)
+    with TIMELINE.span("gather CollTrace", "PHASE"):
+        for host in dict.fromkeys(hosts):
+            if host == "localhost":
+                continue
+            cmd = f"suscp --reason 'gather NCCL-EXP CollTrace results' 'root@{host}:{trace_dir}/*_online.json' {local_dir}/"
+            with TIMELINE.span(cmd_label(cmd), cmd=cmd):
+                subprocess.run([cmd], shell=True, stderr=subprocess.STDOUT)
+
+
+def load_colltrace(local_dir: Path) -> Dict[Tuple[str, int], List[float]]:
+    """latencies of every (collective, message size) in CollTrace results"""
+    sys.path.insert(0, str(MAINT_DIR))
+    import colltracestats
+
+    results: Dict[Tuple[str, int], List[float]] = collections.defaultdict(list)
+    # loadRank skips the empty entry of a rank without results and the -1
+    # latencies of collectives CollTrace failed to time
+    for work in colltracestats.findFiles([str(local_dir)]):
+        try:
+            _, columns = colltracestats.loadRank(work)
+        except ValueError as e:
+            logging.warning(f"Skipping {work[1]}: {e}")
+            continue
+        for key, column in columns.items():
+            results[key] += column
+    return results
+
+
+def print_best_configs(
+    configs: List[Dict[str, str]],
+    latencies: List[Dict[Tuple[str, int], List[float]]],
+    passed: List[bool],
+) -> None:
+    """print the configuration with the lowest median latency of each
+    (collective, message size), among those whose run passed"""
+    medians = [
+        {key: sorted(vals)[len(vals) // 2] for key, vals in lat.items()} if ok else {}
+        for lat, ok in zip(latencies, passed)
+    ]
+    rows = [("COLL", "MSG_SIZE", "BEST(ms)", "WORST(ms)", "CONFIG", "SETTINGS")]
+    for coll, size in sorted(set().union(*medians)):
+        ranked = sorted(
+            (m[(coll, size)], i) for i, m in enumerate(medians) if (coll, size) in m
+        )
+        best, i = ranked[0]
+        settings = " ".join(f"{k}={v}" for k, v in configs[i].items())
+        rows.append(
+            (coll, str(size), f"{best:.4f}", f"{ranked[-1][0]:.4f}", f"cfg{i}", settings)
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(col.ljust(w) for col, w in zip(row, widths)).rstrip())
+
+
+def sweep_launcher(args: argparse.Namespace) -> bool:
+    """run the tests once per configuration of --sweep, each test of each
+    configuration with its own NCCL_COLLTRACE_DIR, and report the best configuration per collective and
+    message size; returns whether all runs passed"""
+    configs = sweep_configs(
+        parse_sweep(args.sweep), args.sweep_design, args.sweep_samples, args.sweep_seed
+    )
+    hosts = args.hosts.split(",")
+    sweep_dir = Path(args.sweep_dir or f"/tmp/nccl_sweep_{int(time.time())}")
+    base_envs = parse_envs(args.envs)
+    logging.info(f"Sweeping {len(configs)} configurations into {sweep_dir}")
+
+    passed = []
+    latencies = []
+    for i, config in enumerate(configs):
+        logging.info(f"Configuration cfg{i}: {config}")
+        ok = True
+        config_latencies: Dict[Tuple[str, int], List[float]] = collections.defaultdict(list)
+        # one NCCL_COLLTRACE_DIR per test, as CollTrace names its files by rank
+        for j, testname in enumerate(args.testname.split(",")):
+            executable = get_nccl_test_binary(testname.partition(":")[0])[1]
+            trace_dir = f"{sweep_dir}/cfg{i}/{j}_{executable}"
+            make_trace_dir(hosts, trace_dir)
+
+            envs = {**base_envs, **config, "NCCL_COLLTRACE_DIR": trace_dir}
+            test_args = argparse.Namespace(**vars(args))
+            test_args.testname = testname
+            if args.log_dir is not None:
+                test_args.log_dir = f"{args.log_dir}/cfg{i}/{j}_{executable}"
+            try:
+                ok = remote_mpi_launcher(test_args, envs) and ok
+            except subprocess.CalledProcessError as e:
+                logging.error(f"Configuration cfg{i} failed: {e}")
+                ok = False
+
+            gather_colltrace(hosts, trace_dir, Path(trace_dir))
+            for key, vals in load_colltrace(Path(trace_dir)).items():
+                config_latencies[key] += vals
+        passed.append(ok)
+        latencies.append(config_latencies)
+
+    with open(sweep_dir / "sweep.json", "w") as f:
+        json.dump(
+            [
+                {
+                    "config": f"cfg{i}",
+                    "envs": config,
+                    "passed": ok,
+                    "latencies": [
+                        {"coll": coll, "msg_size": size, "latencies": vals}
+                        for (coll, size), vals in sorted(lat.items())
+                    ],
+                }
+                for i, (config, ok, lat) in enumerate(zip(configs, passed, latencies))
+            ],
+            f,
+        )
+    print_best_configs(configs, latencies, passed)
+    return all(passed)
+
+
+def perf_launcher(args: argparse.Namespace) -> bool:
+    """run the tests one at a time, each with its own NCCL_COLLTRACE_DIR,
+    and record them in the --perf-db history; returns whether all passed"""
+    sys.path.insert(0, str(MAINT_DIR))
+    import colltracestats
+    import perfhistory
+
+    hosts = args.hosts.split(",")
+    trace_root = args.perf_trace_dir or f"/tmp/nccl_perf_{int(time.time())}"
+    envs = parse_envs(args.envs)
+    history = perfhistory.PerfHistory(args.perf_db)
+
+    passed = True
+    for i, testname in enumerate(args.testname.split(",")):
+        par_path, executable = get_nccl_test_binary(testname)
+        trace_dir = f"{trace_root}/{i}_{executable}"
+        make_trace_dir(hosts, trace_dir)
+
+        test_args = argparse.Namespace(**vars(args))
+        test_args.testname = testname
+        if args.log_dir is not None:
+            test_args.log_dir = f"{args.log_dir}/{i}_{executable}"
+        try:
+            ok = remote_mpi_launcher(test_args, {**envs, "NCCL_COLLTRACE_DIR": trace_dir})
+        except subprocess.CalledProcessError as e:
+            logging.error(f"{executable} failed: {e}")
+            ok = False
+        passed = passed and ok
+
+        gather_colltrace(hosts, trace_dir, Path(trace_dir))
+        results, nranks = colltracestats.loadResults([trace_dir])
+        if not results:
+            logging.warning(f"No CollTrace results of {executable} in {trace_dir}; it is kept out of baselines")
+        run_id = history.recordRun(
+            executable,
+            file_sha256(par_path / executable),
+            envs,
+            test_args.nnode,
+            args.ppn,
+            results,
+            ok,
+            nranks,
+        )
+        logging.info(f"Recorded {executable} as run {run_id} of {args.perf_db}")
+
+    history.close()
+    return passed
+
+
+class Probe:
+    """how pre-flight checks run a shell command on a host"""
+
+    name = ""
+
+    async def run(self, host: str, cmd: str, timeout: float) -> Tuple[int, str]:
+        """(exit status, output) of cmd on host; raises asyncio.TimeoutError"""
+        raise NotImplementedError
+
+    async def shell(self, cmd: str, timeout: float) -> Tuple[int, str]:
+        proc = await asyncio.create_subprocess_shell(
+            cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,
+        )
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(proc.pid, signal.SIGKILL)
+            await proc.wait()
+            raise
+        return proc.returncode, out.decode(errors="replace")
+
+
+class SshProbe(Probe):
+    """sush2 to remote hosts, a local shell for localhost"""
+
+    name = "ssh"
+
+    async def run(self, host: str, cmd: str, timeout: float) -> Tuple[int, str]:
+        if host not in LOCAL_HOSTS:
+            cmd = f"sush2 --reason 'Check NCCL-EXP test host' root@{host} '{cmd}'"
+        return await self.shell(cmd, timeout)
+
+
+class LocalProbe(Probe):
+    """every host checked on this machine, as a stand-in for remote hosts"""
+
+    name = "local"
+
+    async def run(self, host: str, cmd: str, timeout: float) -> Tuple[int, str]:
+        return await self.shell(cmd, timeout)
+
+
+PROBES = {probe.name: probe for probe in (SshProbe, LocalProbe)}
+
+
+@dataclass
+class PreflightContext:
+    probe: Probe
+    master_addr: str
+    ifname: Optional[str]
+    master_port: Optional[int]
+    ppn: int
+    timeout: float
+
+
+# name -> check(ctx, host) returning (cache key or None to never cache,
+# error message or None); register more with @preflight_check
+PREFLIGHT_CHECKS: Dict[str, Callable[[PreflightContext, str], Awaitable[Tuple[Optional[str], Optional[str]]]]] = {}
+
+
+def preflight_check(name: str):
+    def register(check):
+        PREFLIGHT_CHECKS[name] = check
+        return check
+
+    return register
+
+
+@preflight_check("reach")
+async def check_reach(ctx: PreflightContext, host: str) -> Tuple[Optional[str], Optional[str]]:
+    rc, out = await ctx.probe.run(host, "true", ctx.timeout)
+    return "reach", None if rc == 0 else f"unreachable: {out.strip()[-200:]}"
+
+
+@preflight_check("ifname")
+async def check_ifname(ctx: PreflightContext, host: str) -> Tuple[Optional[str], Optional[str]]:
+    if ctx.ifname is None:
+        return None, None
+    rc, _ = await ctx.probe.run(host, f"test -e /sys/class/net/{ctx.ifname}", ctx.timeout)
+    return f"ifname={ctx.ifname}", None if rc == 0 else f"no interface {ctx.ifname}"
+
+
+@preflight_check("port")
+async def check_port(ctx: PreflightContext, host: str) -> Tuple[Optional[str], Optional[str]]:
+    # only the master listens on MASTER_PORT; ports in use change quickly,
+    # so the result is never cached
+    if host != ctx.master_addr or ctx.master_port is None:
+        return None, None
+    rc, out = await ctx.probe.run(host, f"ss -Htln 'sport = :{ctx.master_port}'", ctx.timeout)
+    if rc != 0:
+        return None, f"cannot list listening ports: {out.strip()[-200:]}"
+    return None, f"MASTER_PORT {ctx.master_port} in use" if out.strip() else None
+
+
+@preflight_check("gpus")
+async def check_gpus(ctx: PreflightContext, host: str) -> Tuple[Optional[str], Optional[str]]:
+    rc, out = await ctx.probe.run(
+        host,
+        "nvidia-smi --query-gpu=pci.bus_id --format=csv,noheader && echo -- && "
+        "nvidia-smi --query-compute-apps=gpu_bus_id --format=csv,noheader",
+        ctx.timeout,
+    )
+    if rc != 0:
+        return None, f"nvidia-smi failed: {out.strip()[-200:]}"
+    gpus, _, apps = out.partition("--")
+    busy = {line.strip() for line in apps.splitlines() if line.strip()}
+    free = [g for g in (line.strip() for line in gpus.splitlines()) if g and g not in busy]
+    if len(free) < ctx.ppn:
+        return None, f"{len(free)} free GPUs for {ctx.ppn} processes"
+    return None, None
+
+
+PREFLIGHT_CACHE_DIR = Path(tempfile.gettempdir())
+
+# {host: {check: (cache key, time)}} of passed pre-flight checks
+PreflightCache = Dict[str, Dict[str, Tuple[str, float]]]
+
+
+def preflight_cache_path(probe: str) -> Path:
+    """cache file of the pre-flight checks run by this user with probe; a
+    check passing with one probe says nothing about another"""
+    return PREFLIGHT_CACHE_DIR / f"nccl-exp-launcher-preflight.{os.getuid()}.{probe}.json"
+
+
+def load_preflight_cache(path: Path, ttl: float) -> PreflightCache:
+    """cache of the checks passed within ttl seconds"""
+    try:
+        with open(path) as f:
+            content = json.load(f)
+        now = time.time()
+        cache: PreflightCache = {}
+        for host, entries in content.items():
+            fresh = {name: (key, t) for name, (key, t) in entries.items() if now - t < ttl}
+            if fresh:
+                cache[host] = fresh
+        return cache
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def save_preflight_cache(path: Path, cache: PreflightCache) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}")
+    with open(tmp, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp, path)
+
+
+async def run_preflight(
+    hosts: List[str],
+    checks: List[str],
+    ctx: PreflightContext,
+    concurrency: int,
+    cache: PreflightCache,
+) -> Dict[str, List[Tuple[str, str]]]:
+    """{host: [(check, error)]} of the failed checks; every host runs its
+    checks in order, stopping at the first failure, with at most
+    concurrency hosts probed at a time"""
+    semaphore = asyncio.Semaphore(concurrency)
+    failures: Dict[str, List[Tuple[str, str]]] = {}
+
+    async def probe_host(host: str) -> None:
+        cached = cache.get(host, {})
+        async with semaphore:
+            for name in checks:
+                if name in cached:
+                    continue
+                with TIMELINE.span(f"preflight {name} {host}"):
+                    key, error = None, None
+                    try:
+                        key, error = await PREFLIGHT_CHECKS[name](ctx, host)
+                    except asyncio.TimeoutError:
+                        error = f"timed out after {ctx.timeout}s"
+                    except OSError as e:
+                        error = str(e)
+                if error is not None:
+                    failures[host] = [(name, error)]
+                    return
+                if key is not None:
+                    cache.setdefault(host, {})[name] = (key, time.time())
+
+    await asyncio.gather(*(probe_host(host) for host in dict.fromkeys(hosts)))
+    return failures
+
+
+def preflight(args: argparse.Namespace) -> bool:
+    """check every host of --hosts before launching; returns whether all passed"""
+    hosts = args.hosts.split(",")
+    envs = parse_envs(args.envs)
+    master_addr = os.environ.get("MASTER_ADDR", hosts[0])
+    multi_host = len(hosts) > 1 and master_addr not in LOCAL_HOSTS
+    ctx = PreflightContext(
+        probe=PROBES[args.preflight_probe](),
+        master_addr=master_addr,
+        # mpirun only uses --ifname across hosts
+        ifname=args.ifname if multi_host and args.backend == "mpirun" else None,
+        master_port=int(envs["MASTER_PORT"]) if "MASTER_PORT" in envs else None,
+        ppn=args.ppn,
+        timeout=args.preflight_timeout,
+    )
+    checks = args.preflight_checks.split(",")
+    unknown = [c for c in checks if c not in PREFLIGHT_CHECKS]
+    if unknown:
+        raise ValueError(f"unknown pre-flight checks {','.join(unknown)}, known: {','.join(PREFLIGHT_CHECKS)}")
+
+    cache_path = preflight_cache_path(ctx.probe.name)
+    cache = load_preflight_cache(cache_path, args.preflight_ttl)
+    # cache keys hold the check parameters that may change between runs
+    valid_keys = ("reach", f"ifname={ctx.ifname}")
+    for host in list(cache):
+        cache[host] = {name: entry for name, entry in cache[host].items() if entry[0] in valid_keys}
+    start = time.monotonic()
+    with TIMELINE.span("preflight", "PHASE"):
+        failures = asyncio.run(run_preflight(hosts, checks, ctx, args.preflight_concurrency, cache))
+    save_preflight_cache(cache_path, cache)
+    logging.info(
+        f"Pre-flight checks of {len(set(hosts))} hosts in {time.monotonic() - start:.1f}s: {len(failures)} failed"
+    )
+    if not failures:
+        return True
+    rows = [("HOST", "CHECK", "ERROR")] + [
+        (host, name, error) for host in hosts if host in failures for name, error in failures[host]
+    ]
+    widths = [max(len(row[i]) for row in rows) for i in range(2)]
+    for host, name, error in rows:
+        print(f"{host.ljust(widths[0])}  {name.ljust(widths[1])}  {error}")
+    return False
 
 
 def init_argparse() -> argparse.ArgumentParser:
@@ -172,6 +1587,170 @@ def init_argparse() -> argparse.ArgumentParser:
         default="eth2",
         help="Front-end interface for MPI launcher",
     )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        default="mpirun",
+        choices=sorted(BACKENDS),
+        help="how test processes are started: mpirun, or spawned directly on localhost (local), "
+        "with RANK, WORLD_SIZE, LOCAL_RANK, MASTER_ADDR and MASTER_PORT set",
+    )
+    parser.add_argument(
+        "--topo-dir",
+        type=str,
+        default=None,
+        help="directory of <host>.xml topologies dumped with NCCL_TOPO_DUMP_FILE; "
+        "used to check GPU and NIC counts and to bind ranks to the socket of their GPU in --rankfile",
+    )
+    parser.add_argument(
+        "--topo-labels",
+        type=str,
+        default=None,
+        help="file of 'HOST SWITCH [RACK ...]' lines; hosts are reordered to minimize switch hops "
+        "between ring and tree neighbors",
+    )
+    parser.add_argument(
+        "--rankfile",
+        type=str,
+        default=None,
+        help="mpirun rankfile to use; with --topo-dir or --topo-labels, it is written with the computed placement",
+    )
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="run the tests of --testname concurrently on disjoint subsets of --hosts and print a summary; "
+        "each test may be given as NAME:NNODE or NAME:NNODExPPN, defaulting to --nnode and --ppn",
+    )
+    parser.add_argument(
+        "--sweep",
+        type=str,
+        default=None,
+        help="run the tests once per configuration of these env. variable axes, "
+        "e.g. 'NCCL_ALGO=Ring|Tree;NCCL_BUFFSIZE=4194304|8388608' (wrapped by single/double quotes), "
+        "on top of --envs, and print the best configuration per collective and message size",
+    )
+    parser.add_argument(
+        "--sweep-design",
+        type=str,
+        default="cartesian",
+        choices=["cartesian", "lhs"],
+        help="configurations of --sweep: every combination, or a Latin hypercube of --sweep-samples",
+    )
+    parser.add_argument(
+        "--sweep-samples",
+        type=int,
+        default=16,
+        help="number of configurations of a Latin hypercube sweep",
+    )
+    parser.add_argument(
+        "--sweep-seed",
+        type=int,
+        default=0,
+        help="random seed of a Latin hypercube sweep",
+    )
+    parser.add_argument(
+        "--sweep-dir",
+        type=str,
+        default=None,
+        help="directory of the CollTrace results of each sweep configuration, on every host (default: /tmp/nccl_sweep_<time>)",
+    )
+    parser.add_argument(
+        "--perf-db",
+        type=str,
+        default=None,
+        help="run the tests one at a time with CollTrace and record their latencies in this "
+        "SQLite performance history; check for regressions with maint/perfhistory.py compare",
+    )
+    parser.add_argument(
+        "--perf-trace-dir",
+        type=str,
+        default=None,
+        help="directory of the CollTrace results of --perf-db runs, on every host (default: /tmp/nccl_perf_<time>)",
+    )
+    parser.add_argument(
+        "--timeline",
+        type=str,
+        default=None,
+        help="write the start and end of every launcher phase and command to this Chrome/Perfetto trace file; "
+        "with --log-dir and NCCL_DEBUG=INFO, test runs are split into NCCL init and test",
+    )
+    parser.add_argument(
+        "--timeline-summary",
+        action="store_true",
+        help="print a one line summary of the critical path of the launcher phases",
+    )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help="check every host before launching and abort with a per-host report if any fails",
+    )
+    parser.add_argument(
+        "--preflight-checks",
+        type=str,
+        default="reach,ifname,port,gpus",
+        help="pre-flight checks to run on each host, in order, separated by comma",
+    )
+    parser.add_argument(
+        "--preflight-probe",
+        type=str,
+        default="ssh",
+        choices=sorted(PROBES),
+        help="how pre-flight checks reach the hosts: sush2, or this machine standing in for every host",
+    )
+    parser.add_argument(
+        "--preflight-concurrency",
+        type=int,
+        default=64,
+        help="number of hosts checked at a time",
+    )
+    parser.add_argument(
+        "--preflight-timeout",
+        type=float,
+        default=30.0,
+        help="timeout in seconds of each pre-flight command",
+    )
+    parser.add_argument(
+        "--preflight-ttl",
+        type=float,
+        default=300.0,
+        help="seconds during which passed reachability and interface checks of a host are not repeated",
+    )
+    parser.add_argument(
+        "--log-dir",
+        type=str,
+        default=None,
+        help="split the output of each test by rank into gzip-compressed logs under this directory "
+        "instead of printing it, logging only alerts and, for failed tests, the last --tail-lines lines",
+    )
+    parser.add_argument(
+        "--tail-lines",
+        type=int,
+        default=50,
+        help="number of last output lines of a test kept in memory with --log-dir",
+    )
+    parser.add_argument(
+        "--alert-pattern",
+        action="append",
+        default=None,
+        help=f"output pattern to alert on with --log-dir; may be repeated (default: {DEFAULT_ALERT_PATTERNS})",
+    )
+    parser.add_argument(
+        "--kill-on-alert",
+        action="store_true",
+        help="terminate a test as soon as its output matches an alert pattern (with --log-dir)",
+    )
+    parser.add_argument(
+        "--dist-workers",
+        type=int,
+        default=16,
+        help="number of concurrent copies when distributing test binaries to hosts",
+    )
+    parser.add_argument(
+        "--dist-tree-min-hosts",
+        type=int,
+        default=16,
+        help="number of hosts from which test binaries are distributed as a tree, with hosts forwarding to other hosts",
+    )
     return parser
 
 
@@ -185,8 +1764,30 @@ def main() -> None:
     parser: argparse.ArgumentParser = init_argparse()
     args = parser.parse_args(sys.argv[1:])
 
+    if args.perf_db is not None and (args.sweep is not None or args.schedule):
+        parser.error("--perf-db cannot be used with --sweep or --schedule")
+
+    TIMELINE.enabled = args.timeline is not None or args.timeline_summary
+    try:
+        ok = (not args.preflight or preflight(args)) and launch(args)
+    finally:
+        if args.timeline is not None:
+            TIMELINE.write(args.timeline)
+            logging.info(f"Launcher timeline in {args.timeline}")
+        if args.timeline_summary:
+            print(TIMELINE.critical_path())
+    if not ok:
+        sys.exit(1)
+
+
+def launch(args: argparse.Namespace) -> bool:
+    """run the tests in the mode selected by args; returns whether all passed"""
     # get binary inside the par file and use MPI launcher
-    remote_mpi_launcher(args)
+    if args.sweep is not None:
+        return sweep_launcher(args)
+    if args.perf_db is not None:
+        return perf_launcher(args)
+    return remote_mpi_launcher(args)
 
 
 args: argparse.Namespace
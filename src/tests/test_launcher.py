@@ -0,0 +1,414 @@
+import argparse
+import asyncio
+import contextlib
+import gzip
+import importlib.util
+import io
+import json
+import os
+import signal
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Dict, List
+from unittest import mock
+
+_spec = importlib.util.spec_from_file_location(
+    "nccl_exp_test_launcher", Path(__file__).resolve().parent / "nccl-exp_test_launcher.py"
+)
+launcher = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(launcher)
+
+
+def make_args(*argv: str) -> argparse.Namespace:
+    return launcher.init_argparse().parse_args(list(argv))
+
+
+class SweepLauncherTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sweep_dir = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_trace_dir_per_test(self) -> None:
+        runs: List[Dict[str, str]] = []
+
+        def fake_launcher(args: argparse.Namespace, envs: Dict[str, str]) -> bool:
+            runs.append({"testname": args.testname, **envs})
+            latency = 1.0 if envs["NCCL_ALGO"] == "ring" else 2.0
+            coll = "AllReduce" if args.testname == "AllReduceTest" else "AllGather"
+            trace = Path(envs["NCCL_COLLTRACE_DIR"]) / "0_online.json"
+            trace.write_text(json.dumps([{"coll": coll, "msg_size": 1024, "latency": latency}]))
+            return True
+
+        args = make_args(
+            "--testname", "AllReduceTest,AllGatherTest",
+            "--sweep", "NCCL_ALGO=ring|tree",
+            "--sweep-dir", str(self.sweep_dir),
+        )
+        out = io.StringIO()
+        with mock.patch.object(launcher, "remote_mpi_launcher", fake_launcher), \
+                contextlib.redirect_stdout(out):
+            self.assertTrue(launcher.sweep_launcher(args))
+
+        trace_dirs = [run["NCCL_COLLTRACE_DIR"] for run in runs]
+        self.assertEqual(trace_dirs, [
+            f"{self.sweep_dir}/cfg0/0_AllReduceTest",
+            f"{self.sweep_dir}/cfg0/1_AllGatherTest",
+            f"{self.sweep_dir}/cfg1/0_AllReduceTest",
+            f"{self.sweep_dir}/cfg1/1_AllGatherTest",
+        ])
+        self.assertEqual([run["testname"] for run in runs],
+                         ["AllReduceTest", "AllGatherTest"] * 2)
+
+        with open(self.sweep_dir / "sweep.json") as f:
+            sweep = json.load(f)
+        self.assertEqual(
+            [[lat["coll"] for lat in cfg["latencies"]] for cfg in sweep],
+            [["AllGather", "AllReduce"]] * 2,
+        )
+        best = [line.split()[:3] for line in out.getvalue().splitlines()[1:]]
+        self.assertEqual(best, [["AllGather", "1024", "1.0000"], ["AllReduce", "1024", "1.0000"]])
+
+    def test_load_colltrace_idle_rank(self) -> None:
+        (self.sweep_dir / "0_online.json").write_text(json.dumps([
+            {"coll": "AllReduce", "msg_size": "1024", "latency": 1.5},
+            # a collective CollTrace failed to time
+            {"coll": "AllReduce", "msg_size": "1024", "latency": -1},
+        ]))
+        # a rank without results
+        (self.sweep_dir / "1_online.json").write_text(json.dumps([{}]))
+        (self.sweep_dir / "2_online.json").write_text('[{"coll": ')
+        with self.assertLogs(level="WARNING"):
+            latencies = launcher.load_colltrace(self.sweep_dir)
+        self.assertEqual(dict(latencies), {("AllReduce", 1024): [1.5]})
+
+
+class OutputDemuxTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.log_dir = Path(self.tmp.name) / "logs"
+
+    def read_log(self, name: str) -> List[str]:
+        with gzip.open(self.log_dir / f"rank{name}.log.gz", "rt") as f:
+            return f.read().splitlines()
+
+    def test_rank_of(self) -> None:
+        demux = launcher.OutputDemux(None, 10, launcher.DEFAULT_ALERT_PATTERNS)
+        self.assertEqual(demux.rank_of("[1,7]<stdout>: hello"), ("7", "hello"))
+        line = "2024-05-01T10:00:00 host0:1234:1240 [3] NCCL INFO Init COMPLETE"
+        self.assertEqual(demux.rank_of(line), ("host0:1234", line))
+        self.assertEqual(demux.rank_of("mpirun: starting"), ("launcher", "mpirun: starting"))
+
+    def test_split_and_alerts(self) -> None:
+        demux = launcher.OutputDemux(self.log_dir, 3, launcher.DEFAULT_ALERT_PATTERNS)
+        warn = "2024-05-01T10:00:00 host0:1234:1240 [3] NCCL WARN Call to ibv_create_qp failed"
+        with mock.patch.object(launcher.OutputDemux, "FLUSH_BYTES", 64), \
+                self.assertLogs(level="WARNING") as logs:
+            self.assertFalse(demux.feed("[1,0]<stdout>: rank 0 output\n"))
+            for _ in range(launcher.OutputDemux.MAX_ALERTS_PER_RANK + 2):
+                self.assertTrue(demux.feed(warn + "\n"))
+            self.assertTrue(demux.feed("[1,1]<stderr>: CVAR: unknown NCCL_FOO\n"))
+            demux.close()
+        self.assertEqual(demux.alerts, {"host0:1234": 7, "1": 1})
+        # alerts beyond MAX_ALERTS_PER_RANK of a rank are suppressed
+        self.assertEqual(logs.output.count(f"WARNING:root:[rank host0:1234] {warn}"), 5)
+        self.assertIn("WARNING:root:[rank host0:1234] more alerts suppressed", logs.output)
+        self.assertEqual(len(logs.output), 7)
+
+        self.assertEqual(self.read_log("0"), ["rank 0 output"])
+        self.assertEqual(self.read_log("host0_1234"), [warn] * 7)
+        self.assertEqual(self.read_log("1"), ["CVAR: unknown NCCL_FOO"])
+        self.assertEqual(list(demux.tail), [("host0:1234", warn)] * 2 + [("1", "CVAR: unknown NCCL_FOO")])
+
+    def test_kill_on_alert(self) -> None:
+        demux = launcher.OutputDemux(None, 10, launcher.DEFAULT_ALERT_PATTERNS)
+        cmd = "echo 'host0:1:1 [0] NCCL WARN NET/IB : Got completion with error'; sleep 60"
+        start = time.monotonic()
+        with self.assertLogs(level="WARNING"):
+            returncode = asyncio.run(launcher.stream_cmd(cmd, demux, True))
+        self.assertEqual(returncode, -signal.SIGTERM)
+        self.assertLess(time.monotonic() - start, 30)
+        self.assertEqual(demux.alerts, {"host0:1": 1})
+
+
+class PlacementTest(unittest.TestCase):
+    # h1 and h3 under switch sw1, the others under sw2
+    LABELS = "h1 sw1\nh2 sw2\nh3 sw1\nh4 sw2\nh5 sw2\n"
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        (self.dir / "labels.txt").write_text(self.LABELS)
+        # --rankfile is given relative to the working directory
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.dir)
+
+    def test_order_hosts(self) -> None:
+        labels = launcher.load_host_labels(str(self.dir / "labels.txt"))
+        hosts = ["h2", "h1", "h3", "h4", "h5"]
+        ordered = launcher.order_hosts(hosts, labels)
+        self.assertEqual(ordered, ["h1", "h3", "h2", "h4", "h5"])
+        self.assertLess(launcher.placement_cost(ordered, labels), launcher.placement_cost(hosts, labels))
+
+    def test_rankfile(self) -> None:
+        topo_dir = self.dir / "topo"
+        topo_dir.mkdir()
+        # GPUs 0-1 on NUMA node 0 and 2-3 on NUMA node 1
+        (topo_dir / "h1.xml").write_text(
+            '<system version="1">'
+            '<cpu numaid="0"><pci><gpu dev="0"/></pci><pci><gpu dev="1"/></pci></cpu>'
+            '<cpu numaid="1"><pci><gpu dev="2"/></pci><pci><gpu dev="3"/></pci></cpu>'
+            "</system>"
+        )
+        args = make_args(
+            "--hosts", "h1,h2", "--ppn", "3", "--topo-dir", str(topo_dir),
+            "--topo-labels", str(self.dir / "labels.txt"), "--rankfile", "rankfile.txt",
+        )
+        # no topology of h2
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(launcher.place_hosts(["h1", "h2"], args), ["h1", "h2"])
+        self.assertEqual(args.rankfile, os.path.join(os.getcwd(), "rankfile.txt"))
+        self.assertEqual(Path(args.rankfile).read_text().splitlines(), [
+            "rank 0=h1 slot=0:0",
+            "rank 1=h1 slot=0:1",
+            "rank 2=h1 slot=1:0",
+            "rank 3=h2 slot=0",
+            "rank 4=h2 slot=1",
+            "rank 5=h2 slot=2",
+        ])
+
+    def test_rankfile_on_mpirun_host(self) -> None:
+        runs: List[Dict[str, object]] = []
+
+        class FakeBackend(launcher.Backend):
+            def run(self, par_path, executable, hosts, ppn, master_addr, envs, args, log_dir) -> int:
+                runs.append({"hosts": hosts, "master_addr": master_addr, "rankfile": args.rankfile})
+                return 0
+
+        args = make_args(
+            "--hosts", "h2,h1,h3,h4,h5", "--nnode", "5", "--testname", "bin/AllReduceTest",
+            "--topo-labels", str(self.dir / "labels.txt"), "--rankfile", "rankfile.txt",
+        )
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(mock.patch.dict(launcher.BACKENDS, {args.backend: FakeBackend}))
+            stack.enter_context(mock.patch.dict(launcher.os.environ))
+            launcher.os.environ.pop("MASTER_ADDR", None)
+            exec_cmds = stack.enter_context(mock.patch.object(launcher, "exec_cmds"))
+            self.assertTrue(launcher.remote_mpi_launcher(args, {}))
+
+        rankfile = os.path.join(os.getcwd(), "rankfile.txt")
+        # mpirun runs on the first host of the placement, where the rankfile is copied
+        self.assertEqual(runs, [{"hosts": ["h1", "h3", "h2", "h4", "h5"], "master_addr": "h1", "rankfile": rankfile}])
+        exec_cmds.assert_called_once_with(
+            [f"suscp --reason 'copy NCCL-EXP rankfile' {rankfile} root@h1:{Path(rankfile).parent}/"]
+        )
+
+
+class ScheduleTest(unittest.TestCase):
+    def test_packing(self) -> None:
+        runs: List[Dict[str, object]] = []
+        lock = threading.Lock()
+        # AllReduceTest:2 and AllGatherTest:1 must run at the same time
+        concurrent = threading.Barrier(2, timeout=10)
+
+        class FakeBackend(launcher.Backend):
+            def run(self, par_path, executable, hosts, ppn, master_addr, envs, args, log_dir) -> int:
+                with lock:
+                    runs.append({"hosts": list(hosts), "log_dir": log_dir.name})
+                    first = len(runs) <= 2
+                if first:
+                    concurrent.wait()
+                return 1 if log_dir.name == "1_AllToAllTest" else 0
+
+        specs = ["bin/AllReduceTest:2", "bin/AllToAllTest:2", "bin/AllGatherTest:1"]
+        tests = [launcher.parse_test_spec(spec, 1, 8) for spec in specs]
+        args = make_args("--schedule", "--log-dir", "logs")
+        with mock.patch.dict(launcher.BACKENDS, {args.backend: FakeBackend}):
+            launcher.schedule_tests(tests, ["h1", "h2", "h3"], args, {})
+
+        # AllGatherTest:1 does not wait for AllToAllTest:2, which does not fit yet
+        self.assertEqual(runs[:2], [
+            {"hosts": ["h1", "h2"], "log_dir": "0_AllReduceTest"},
+            {"hosts": ["h3"], "log_dir": "2_AllGatherTest"},
+        ])
+        self.assertEqual(runs[2]["log_dir"], "1_AllToAllTest")
+        self.assertEqual([test.returncode for test in tests], [1 if i == 1 else 0 for i in range(3)])
+        self.assertTrue(all(len(test.hosts) == test.nnode for test in tests))
+
+        with self.assertRaisesRegex(ValueError, "needs 2 hosts, only 1 given"):
+            launcher.schedule_tests(tests, ["h1"], args, {})
+
+    def test_identical_specs(self) -> None:
+        log_dirs: List[str] = []
+
+        class FakeBackend(launcher.Backend):
+            def run(self, par_path, executable, hosts, ppn, master_addr, envs, args, log_dir) -> int:
+                log_dirs.append(log_dir.name)
+                return 0
+
+        # equal TestRuns, run one after the other on the same hosts
+        tests = [launcher.parse_test_spec("bin/AllReduceTest:2", 1, 8) for _ in range(2)]
+        self.assertEqual(tests[0], tests[1])
+        args = make_args("--schedule", "--log-dir", "logs")
+        with mock.patch.dict(launcher.BACKENDS, {args.backend: FakeBackend}):
+            launcher.schedule_tests(tests, ["h1", "h2"], args, {})
+        self.assertEqual(log_dirs, ["0_AllReduceTest", "1_AllReduceTest"])
+
+
+class DistributeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        for name in ("a", "b"):
+            (self.dir / name).mkdir()
+            (self.dir / name / "AllReduceTest").write_text(f"binary of {name}")
+        patcher = mock.patch.object(launcher, "remote_sha256", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(launcher, "exec_cmds")
+        self.exec_cmds = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_basename(self) -> None:
+        binaries = [self.dir / "a" / "AllReduceTest", self.dir / "b" / "AllReduceTest"]
+        with self.assertRaisesRegex(ValueError, "would both be copied to /tmp/AllReduceTest"):
+            launcher.distribute_binaries(binaries, ["h1", "h2"])
+        self.exec_cmds.assert_not_called()
+
+    def test_same_binary(self) -> None:
+        binaries = [self.dir / "a" / "AllReduceTest", self.dir / "b" / ".." / "a" / "AllReduceTest"]
+        launcher.distribute_binaries(binaries, ["h1", "h2", "localhost"])
+        self.assertEqual(
+            [call.args[0][0].split()[-2:] for call in self.exec_cmds.call_args_list],
+            [[str(binaries[0]), "root@h1:/tmp/"], [str(binaries[0]), "root@h2:/tmp/"]],
+        )
+
+
+class LocalBackendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+
+    def stub(self, script: str) -> None:
+        path = self.dir / "stub_test"
+        path.write_text("#!/bin/sh\n" + script)
+        path.chmod(0o755)
+
+    def run_local(self, ppn: int, *argv: str) -> int:
+        args = make_args("--backend", "local", *argv)
+        log_dir = self.dir / "logs" if args.log_dir is not None else None
+        with contextlib.redirect_stdout(io.StringIO()):
+            return launcher.LocalBackend().run(
+                self.dir, "stub_test", ["localhost"], ppn, "localhost", {"OUT_DIR": str(self.dir)}, args, log_dir
+            )
+
+    def test_rank_envs(self) -> None:
+        self.stub('echo "$RANK $LOCAL_RANK $WORLD_SIZE $LOCAL_WORLD_SIZE $MASTER_ADDR $MASTER_PORT" '
+                  '> "$OUT_DIR/$RANK.env"\n')
+        self.assertEqual(self.run_local(3), 0)
+        envs = [(self.dir / f"{rank}.env").read_text().split() for rank in range(3)]
+        self.assertEqual([env[:5] for env in envs], [[str(r), str(r), "3", "3", "127.0.0.1"] for r in range(3)])
+        # one port, reserved for the whole job
+        self.assertEqual(len({env[5] for env in envs}), 1)
+        self.assertTrue(envs[0][5].isdigit())
+
+    def test_teardown_on_failure(self) -> None:
+        # rank 0 fails once the others run; rank 2 ignores SIGTERM
+        self.stub(
+            'if [ "$RANK" = 0 ]; then\n'
+            '  while [ ! -e "$OUT_DIR/1.started" ] || [ ! -e "$OUT_DIR/2.started" ]; do sleep 0.1; done\n'
+            '  echo "rank 0 failed"\n'
+            "  exit 3\n"
+            "fi\n"
+            '[ "$RANK" = 2 ] && trap "" TERM\n'
+            'touch "$OUT_DIR/$RANK.started"\n'
+            "sleep 60\n"
+            'touch "$OUT_DIR/$RANK.done"\n'
+        )
+        start = time.monotonic()
+        with mock.patch.object(launcher.LocalBackend, "TERM_GRACE_SEC", 0.5), self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(self.run_local(3, "--log-dir", "logs"), 3)
+        self.assertLess(time.monotonic() - start, 30)
+        self.assertIn("Rank 0 exited with 3, terminating all ranks", logs.output[0])
+        self.assertEqual(list(self.dir.glob("*.done")), [])
+        with gzip.open(self.dir / "logs" / "rank0.log.gz", "rt") as f:
+            self.assertEqual(f.read(), "rank 0 failed\n")
+
+
+class PreflightTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(launcher, "PREFLIGHT_CACHE_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls: List[str] = []
+
+        async def check_count(ctx, host):
+            self.calls.append(host)
+            return "reach", None
+
+        async def check_fail_h2(ctx, host):
+            rc, _ = await ctx.probe.run(host, "test " + host + " != h2", ctx.timeout)
+            return None, None if rc == 0 else "h2 is down"
+
+        patcher = mock.patch.dict(
+            launcher.PREFLIGHT_CHECKS, {"count": check_count, "fail_h2": check_fail_h2}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def preflight(self, *argv: str) -> bool:
+        args = make_args("--hosts", "h1,h2,h3", "--preflight-timeout", "10", *argv)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            ok = launcher.preflight(args)
+        self.output = out.getvalue()
+        return ok
+
+    def test_local_probe(self) -> None:
+        self.assertTrue(self.preflight("--preflight-probe", "local", "--preflight-checks", "reach,count"))
+        self.assertEqual(sorted(self.calls), ["h1", "h2", "h3"])
+
+    def test_failure_report(self) -> None:
+        self.assertFalse(
+            self.preflight("--preflight-probe", "local", "--preflight-checks", "reach,fail_h2,count")
+        )
+        self.assertEqual(self.output.split("\n")[1].split(), ["h2", "fail_h2", "h2", "is", "down"])
+        # checks stop at the first failure of a host
+        self.assertEqual(sorted(self.calls), ["h1", "h3"])
+
+    def test_cache(self) -> None:
+        checks = ("--preflight-probe", "local", "--preflight-checks", "count")
+        self.assertTrue(self.preflight(*checks))
+        self.assertTrue(self.preflight(*checks))
+        self.assertEqual(len(self.calls), 3)
+        cache_path = launcher.preflight_cache_path("local")
+        self.assertEqual(sorted(json.loads(cache_path.read_text())), ["h1", "h2", "h3"])
+
+        self.assertTrue(self.preflight(*checks, "--preflight-ttl", "0"))
+        self.assertEqual(len(self.calls), 6)
+
+    def test_cache_per_probe(self) -> None:
+        # hosts that only passed with the local probe are not reachable over ssh
+        self.assertTrue(self.preflight("--preflight-probe", "local", "--preflight-checks", "reach"))
+        with mock.patch.object(launcher.SshProbe, "run", autospec=True, return_value=(255, "no route to host")):
+            self.assertFalse(self.preflight("--preflight-probe", "ssh", "--preflight-checks", "reach"))
+        self.assertEqual(
+            sorted(line.split()[0] for line in self.output.splitlines()[1:]), ["h1", "h2", "h3"]
+        )
+        self.assertNotEqual(launcher.preflight_cache_path("local"), launcher.preflight_cache_path("ssh"))
+
+
+if __name__ == "__main__":
+    unittest.main()
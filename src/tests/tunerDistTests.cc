@@ -20,7 +20,7 @@ TEST_F(tunerDistTest, init) {
   EXPECT_NE(comm, nullptr);
 
   // check if CVAR is set correctly
-  EXPECT_EQ(NCCL_NET_PLUGIN, "mock");
+  EXPECT_EQ(NCCL_NET_PLUGIN_get(), "mock");
   // check if the environment variable is updated correctly
   EXPECT_STREQ(getenv("NCCL_NET_PLUGIN"), "mock");
 
@@ -3,6 +3,7 @@
 #include <gmock/gmock.h>
 #include <gtest/gtest.h>
 #include <nccl.h>
+#include <stdlib.h>
 #include <memory>
 #include "nccl_cvars.h"
 #include "tuner.h"
@@ -18,7 +19,8 @@ class tunerTest : public ::testing::Test {
 TEST_F(tunerTest, loadAndCloseTuner) {
   ncclResult_t res = ncclSuccess;
   ncclTuner_t* tuner = nullptr;
-  NCCL_TUNER_PLUGIN = ""; // load mock tuner built with UT
+  setenv("NCCL_TUNER_PLUGIN", "", 1); // load mock tuner built with UT
+  ncclCvarReload({"NCCL_TUNER_PLUGIN"});
 
   res = ncclLoadTunerPlugin(&tuner);
   EXPECT_EQ(res, ncclSuccess);
@@ -30,7 +32,8 @@ TEST_F(tunerTest, loadAndCloseTuner) {
 TEST_F(tunerTest, getCollInfo) {
   ncclResult_t res = ncclSuccess;
   ncclTuner_t* tuner = nullptr;
-  NCCL_TUNER_PLUGIN = ""; // load mock tuner built with UT
+  setenv("NCCL_TUNER_PLUGIN", "", 1); // load mock tuner built with UT
+  ncclCvarReload({"NCCL_TUNER_PLUGIN"});
 
   res = ncclLoadTunerPlugin(&tuner);
   EXPECT_EQ(res, ncclSuccess);
@@ -87,7 +90,8 @@ TEST_F(tunerTest, getCollInfo) {
 TEST_F(tunerTest, invalidTunerName) {
   ncclResult_t res = ncclSuccess;
   ncclTuner_t* tuner = nullptr;
-  NCCL_TUNER_PLUGIN = "invalid";
+  setenv("NCCL_TUNER_PLUGIN", "invalid", 1);
+  ncclCvarReload({"NCCL_TUNER_PLUGIN"});
 
   res = ncclLoadTunerPlugin(&tuner);
   EXPECT_EQ(res, ncclSuccess);
@@ -138,7 +138,7 @@ ncclResult_t ncclTransportP2pSetup(struct ncclComm* comm, struct ncclTopoGraph*
     }
     TIME_STOP(2);
 
-    if (i-done >= NCCL_CONNECT_ROUND_SIZE || i == comm->nRanks-1) {
+    if (i-done >= NCCL_CONNECT_ROUND_SIZE_get() || i == comm->nRanks-1) {
       // Loop until all channels with all ranks have been connected
       bool allChannelsConnected;
       allChannelsConnected = false;
@@ -201,7 +201,7 @@ static ncclResult_t sendSetup(struct ncclComm* comm, struct ncclTopoGraph* graph
   struct setupReq req = { 0 };
   int localRank, tpProxyRank;
 
-  send->conn.shared = req.shared = graph ? 0 : NCCL_NET_SHARED_BUFFERS != -2 ? NCCL_NET_SHARED_BUFFERS : 1;
+  send->conn.shared = req.shared = graph ? 0 : NCCL_NET_SHARED_BUFFERS_get() != -2 ? NCCL_NET_SHARED_BUFFERS_get() : 1;
   req.channelId = channelId;
   req.connIndex = connIndex;
 
@@ -234,7 +234,7 @@ static ncclResult_t recvSetup(struct ncclComm* comm, struct ncclTopoGraph* graph
   struct setupReq req = { 0 };
   int localRank;
 
-  recv->conn.shared = req.shared = graph ? 0 : NCCL_NET_SHARED_BUFFERS != -2 ? NCCL_NET_SHARED_BUFFERS : 1;
+  recv->conn.shared = req.shared = graph ? 0 : NCCL_NET_SHARED_BUFFERS_get() != -2 ? NCCL_NET_SHARED_BUFFERS_get() : 1;
   req.channelId = channelId;
   req.connIndex = connIndex;
 
@@ -602,7 +602,7 @@ static ncclResult_t sendProxyConnect(struct ncclProxyConnection* connection, str
     }
     connection->proxyAppendPtr = localPeers[resources->tpLocalRank]->send.proxyAppend + resources->channelId;
 
-    if (resources->maxRecvs > 1 && NCCL_NET_SHARED_COMMS) {
+    if (resources->maxRecvs > 1 && NCCL_NET_SHARED_COMMS_get()) {
       // Connect or reuse connection for a netdev/remote rank.
       if (progressState->netComms[resources->netDev] == NULL) {
         NCCLCHECK(ncclCalloc(progressState->netComms + resources->netDev, proxyState->tpnRanks));
@@ -676,7 +676,7 @@ static ncclResult_t sendProxyConnect(struct ncclProxyConnection* connection, str
   } else {
     NCCLCHECK(netCreateShm(map->mems+NCCL_NET_MAP_HOSTMEM));
   }
-  if (ncclGdrCopy && map->sameProcess && NCCL_GDRCOPY_SYNC_ENABLE) {
+  if (ncclGdrCopy && map->sameProcess && NCCL_GDRCOPY_SYNC_ENABLE_get()) {
     uint64_t *cpuPtr, *gpuPtr;
     NCCLCHECK(ncclGdrCudaCalloc(&cpuPtr, &gpuPtr, 1, &resources->gdrDesc));
 
@@ -738,7 +738,7 @@ static ncclResult_t recvProxyConnect(struct ncclProxyConnection* connection, str
     }
     connection->proxyAppendPtr = localPeers[resources->tpLocalRank]->recv.proxyAppend + resources->channelId;
 
-    if (resources->maxRecvs > 1 && NCCL_NET_SHARED_COMMS) {
+    if (resources->maxRecvs > 1 && NCCL_NET_SHARED_COMMS_get()) {
       // Connect or reuse connection for a netdev/remote rank.
       if (progressState->netComms[resources->netDev] == NULL) {
         NCCLCHECK(ncclCalloc(progressState->netComms + resources->netDev, proxyState->tpnRanks));
@@ -812,14 +812,14 @@ static ncclResult_t recvProxyConnect(struct ncclProxyConnection* connection, str
     uint64_t *cpuPtr, *gpuPtr;
     NCCLCHECK(ncclGdrCudaCalloc(&cpuPtr, &gpuPtr, 2, &resources->gdrDesc));
 
-    if (NCCL_GDRCOPY_SYNC_ENABLE) {
+    if (NCCL_GDRCOPY_SYNC_ENABLE_get()) {
       resources->gdcSync = cpuPtr;
       struct connectMapMem* gdcMem = map->mems+NCCL_NET_MAP_GDCMEM;
       gdcMem->cpuPtr = (char*)cpuPtr;
       gdcMem->gpuPtr = (char*)gpuPtr;
       gdcMem->size = sizeof(uint64_t);
     }
-    if (NCCL_GDRCOPY_FLUSH_ENABLE) resources->gdcFlush = cpuPtr + 1;
+    if (NCCL_GDRCOPY_FLUSH_ENABLE_get()) resources->gdcFlush = cpuPtr + 1;
   }
 
   resources->sendMem = (struct ncclSendMem*) NCCL_NET_MAP_GET_POINTER(map, cpu, sendMem);
@@ -878,7 +878,7 @@ static ncclResult_t sendProxyFree(struct ncclProxyConnection* connection, struct
     if (mems[NCCL_NET_MAP_GDCMEM].cpuPtr) NCCLCHECK(ncclGdrCudaFree(resources->gdrDesc));
     if (resources->shared) {
       NCCLCHECK(sharedBuffersDestroy(proxyState, resources->tpLocalRank, 0, connection));
-      if (resources->maxRecvs > 1 && NCCL_NET_SHARED_COMMS) {
+      if (resources->maxRecvs > 1 && NCCL_NET_SHARED_COMMS_get()) {
         struct ncclSharedNetComms* comms = proxyState->progressState.netComms[resources->netDev]+resources->tpRemoteRank;
         comms->sendRefCount[resources->channelId]--;
         if (comms->sendRefCount[resources->channelId] == 0) NCCLCHECK(proxyState->ncclNet->closeSend(comms->sendComm[resources->channelId]));
@@ -919,7 +919,7 @@ static ncclResult_t recvProxyFree(struct ncclProxyConnection* connection, struct
     if (mems[NCCL_NET_MAP_GDCMEM].cpuPtr) NCCLCHECK(ncclGdrCudaFree(resources->gdrDesc));
     if (resources->shared) {
       NCCLCHECK(sharedBuffersDestroy(proxyState, resources->tpLocalRank, 1, connection));
-      if (resources->maxRecvs > 1 && NCCL_NET_SHARED_COMMS) {
+      if (resources->maxRecvs > 1 && NCCL_NET_SHARED_COMMS_get()) {
         struct ncclSharedNetComms* comms = proxyState->progressState.netComms[resources->netDev] + resources->tpRemoteProxyRank;
         comms->recvRefCount[resources->channelId]--;
         if (comms->recvRefCount[resources->channelId] == 0) NCCLCHECK(proxyState->ncclNet->closeRecv(comms->recvComm[resources->channelId]));
@@ -242,13 +242,13 @@ static void* envIbAddrRange(sa_family_t, int*);
 static ncclResult_t ncclUpdateGidIndex(struct ibv_context*, uint8_t, sa_family_t, void*, int, int, int, int*);
 
 static ncclResult_t ncclIbGetGidIndex(struct ibv_context *context, uint8_t portNum, int gidTblLen, int *gidIndex) {
-  *gidIndex = NCCL_IB_GID_INDEX;
+  *gidIndex = NCCL_IB_GID_INDEX_get();
   if (*gidIndex >= 0) {
     return ncclSuccess;
   }
 
   sa_family_t userAddrFamily = envIbAddrFamily();
-  int userRoceVersion = NCCL_IB_ROCE_VERSION_NUM;
+  int userRoceVersion = NCCL_IB_ROCE_VERSION_NUM_get();
   int ipMaskBits;
   void *ipAddr = envIbAddrRange(userAddrFamily, &ipMaskBits);
 
@@ -262,11 +262,11 @@ static ncclResult_t ncclIbGetGidIndex(struct ibv_context *context, uint8_t portN
 
 sa_family_t envIbAddrFamily(void) {
   sa_family_t family = AF_INET;
-  if (NCCL_IB_ADDR_FAMILY.empty()) {
+  if (NCCL_IB_ADDR_FAMILY_get().empty()) {
     return family;
   }
 
-  const char* env = NCCL_IB_ADDR_FAMILY.c_str();
+  const char* env = NCCL_IB_ADDR_FAMILY_get().c_str();
   INFO(NCCL_ENV, "NCCL_IB_ADDR_FAMILY set by environment to %s", env);
 
   if (strcmp(env, "AF_INET") == 0) {
@@ -284,11 +284,11 @@ void* envIbAddrRange(sa_family_t af, int* mask) {
   static struct in6_addr addr6;
   void *ret = (af == AF_INET) ? (void *)&addr : (void *)&addr6;
 
-  if (NCCL_IB_ADDR_RANGE.empty()) {
+  if (NCCL_IB_ADDR_RANGE_get().empty()) {
     return NULL;
   }
 
-  const char* env = NCCL_IB_ADDR_RANGE.c_str();
+  const char* env = NCCL_IB_ADDR_RANGE_get().c_str();
   INFO(NCCL_ENV, "NCCL_IB_ADDR_RANGE set by environment to %s", env);
 
   char addrString[128] = { 0 };
@@ -463,7 +463,7 @@ static ncclResult_t ncclIbGetPciPath(char* devName, char** path, int* realPort)
     // Merge multi-port NICs into the same PCI device
     p[strlen(p)-1] = '0';
     // Also merge virtual functions (VF) into the same device
-    if (NCCL_IB_MERGE_VFS) p[strlen(p)-3] = p[strlen(p)-4] = '0';
+    if (NCCL_IB_MERGE_VFS_get()) p[strlen(p)-3] = p[strlen(p)-4] = '0';
     // And keep the real port aside (the ibv port is always 1 on recent cards)
     *realPort = 0;
     for (int d=0; d<ncclNIbDevs; d++) {
@@ -499,7 +499,7 @@ static int ncclIbSpeed(int speed) {
 
 // Determine whether RELAXED_ORDERING is enabled and possible
 static int ncclIbRelaxedOrderingCapable(void) {
-  int roMode = NCCL_IB_PCI_RELAXED_ORDERING;
+  int roMode = NCCL_IB_PCI_RELAXED_ORDERING_get();
   ncclResult_t r = ncclInternalError;
   if (roMode == 1 || roMode == 2) {
     // Query IBVERBS_1.8 API - needed for IBV_ACCESS_RELAXED_ORDERING support
@@ -509,7 +509,7 @@ static int ncclIbRelaxedOrderingCapable(void) {
 }
 
 ncclResult_t ncclIbInit(ncclDebugLogger_t logFunction) {
-  if (NCCL_IB_DISABLE) return ncclInternalError;
+  if (NCCL_IB_DISABLE_get()) return ncclInternalError;
   static int shownIbHcaEnv = 0;
   if(wrap_ibv_symbols() != ncclSuccess) { return ncclInternalError; }
 
@@ -588,7 +588,7 @@ ncclResult_t ncclIbInit(ncclDebugLogger_t logFunction) {
           // Enable ADAPTIVE_ROUTING by default on IB networks
           // But allow it to be overloaded by an env parameter
           ncclIbDevs[ncclNIbDevs].ar = (portAttr.link_layer == IBV_LINK_LAYER_INFINIBAND) ? 1 : 0;
-          if (NCCL_IB_ADAPTIVE_ROUTING != -2) ncclIbDevs[ncclNIbDevs].ar = NCCL_IB_ADAPTIVE_ROUTING;
+          if (NCCL_IB_ADAPTIVE_ROUTING_get() != -2) ncclIbDevs[ncclNIbDevs].ar = NCCL_IB_ADAPTIVE_ROUTING_get();
 
           pthread_create(&ncclIbAsyncThread, NULL, ncclIbAsyncThreadMain, context);
           ncclSetThreadName(ncclIbAsyncThread, "NCCL IbAsync %2d", ncclNIbDevs);
@@ -862,7 +862,7 @@ ncclResult_t ncclIbInitVerbs(int dev, struct ibv_context* ctx, struct ncclIbVerb
   pthread_mutex_unlock(&ncclIbDevs[dev].lock);
 
   // Recv requests can generate 2 completions (one for the post FIFO, one for the Recv).
-  NCCLCHECK(wrap_ibv_create_cq(&verbs->cq, ctx, 2*MAX_REQUESTS*NCCL_IB_QPS_PER_CONNECTION, NULL, NULL, 0));
+  NCCLCHECK(wrap_ibv_create_cq(&verbs->cq, ctx, 2*MAX_REQUESTS*NCCL_IB_QPS_PER_CONNECTION_get(), NULL, NULL, 0));
   return ncclSuccess;
 }
 
@@ -891,12 +891,12 @@ ncclResult_t ncclIbCreateQp(uint8_t ib_port, struct ncclIbVerbs* verbs, int acce
   qpInitAttr.cap.max_recv_wr = MAX_REQUESTS;
   qpInitAttr.cap.max_send_sge = 1;
   qpInitAttr.cap.max_recv_sge = 1;
-  qpInitAttr.cap.max_inline_data = NCCL_IB_USE_INLINE ? sizeof(struct ncclIbSendFifo) : 0;
+  qpInitAttr.cap.max_inline_data = NCCL_IB_USE_INLINE_get() ? sizeof(struct ncclIbSendFifo) : 0;
   NCCLCHECK(wrap_ibv_create_qp(qp, verbs->pd, &qpInitAttr));
   struct ibv_qp_attr qpAttr;
   memset(&qpAttr, 0, sizeof(struct ibv_qp_attr));
   qpAttr.qp_state = IBV_QPS_INIT;
-  qpAttr.pkey_index = NCCL_IB_PKEY;
+  qpAttr.pkey_index = NCCL_IB_PKEY_get();
   qpAttr.port_num = ib_port;
   qpAttr.qp_access_flags = access_flags;
   NCCLCHECK(wrap_ibv_modify_qp(*qp, &qpAttr, IBV_QP_STATE | IBV_QP_PKEY_INDEX | IBV_QP_PORT | IBV_QP_ACCESS_FLAGS));
@@ -919,12 +919,12 @@ ncclResult_t ncclIbRtrQp(struct ibv_qp* qp, uint8_t sGidIndex, uint32_t qpn, str
     qpAttr.ah_attr.grh.flow_label = 0;
     qpAttr.ah_attr.grh.sgid_index = sGidIndex;
     qpAttr.ah_attr.grh.hop_limit = 255;
-    qpAttr.ah_attr.grh.traffic_class = NCCL_IB_TC;
+    qpAttr.ah_attr.grh.traffic_class = NCCL_IB_TC_get();
   } else {
     qpAttr.ah_attr.is_global = 0;
     qpAttr.ah_attr.dlid = info->lid;
   }
-  qpAttr.ah_attr.sl = NCCL_IB_SL;
+  qpAttr.ah_attr.sl = NCCL_IB_SL_get();
   qpAttr.ah_attr.src_path_bits = 0;
   qpAttr.ah_attr.port_num = info->ib_port;
   NCCLCHECK(wrap_ibv_modify_qp(qp, &qpAttr, IBV_QP_STATE | IBV_QP_AV | IBV_QP_PATH_MTU | IBV_QP_DEST_QPN | IBV_QP_RQ_PSN | IBV_QP_MAX_DEST_RD_ATOMIC | IBV_QP_MIN_RNR_TIMER));
@@ -935,8 +935,8 @@ ncclResult_t ncclIbRtsQp(struct ibv_qp* qp) {
   struct ibv_qp_attr qpAttr;
   memset(&qpAttr, 0, sizeof(struct ibv_qp_attr));
   qpAttr.qp_state = IBV_QPS_RTS;
-  qpAttr.timeout = NCCL_IB_TIMEOUT;
-  qpAttr.retry_cnt = NCCL_IB_RETRY_CNT;
+  qpAttr.timeout = NCCL_IB_TIMEOUT_get();
+  qpAttr.retry_cnt = NCCL_IB_RETRY_CNT_get();
   qpAttr.rnr_retry = 7;
   qpAttr.sq_psn = 0;
   qpAttr.max_rd_atomic = 1;
@@ -992,7 +992,7 @@ ib_connect_check:
   NCCLCHECK(ncclIbInitVerbs(dev, ctx, &comm->verbs));
   uint8_t ib_port;
   ib_port = ncclIbDevs[dev].port;
-  comm->nqps = NCCL_IB_QPS_PER_CONNECTION;
+  comm->nqps = NCCL_IB_QPS_PER_CONNECTION_get();
   for (int q=0; q<comm->nqps; q++) {
     NCCLCHECK(ncclIbCreateQp(ib_port, &comm->verbs, IBV_ACCESS_REMOTE_WRITE, comm->qps+q));
   }
@@ -1123,7 +1123,7 @@ ib_recv:
 
   // QP Creation
   NCCLCHECK(ncclIbInitVerbs(lComm->dev, ctx, &rComm->verbs));
-  rComm->nqps = NCCL_IB_QPS_PER_CONNECTION;
+  rComm->nqps = NCCL_IB_QPS_PER_CONNECTION_get();
   for (int q=0; q<rComm->nqps; q++) {
     NCCLCHECK(ncclIbCreateQp(ib_port, &rComm->verbs, IBV_ACCESS_REMOTE_WRITE, rComm->qps+q));
   }
@@ -1143,11 +1143,11 @@ ib_recv:
   rComm->remFifo.addr = remQpInfo.fifoAddr;
   NCCLCHECK(wrap_ibv_reg_mr(&rComm->remFifo.mr, rComm->verbs.pd, &rComm->remFifo.elems, sizeof(struct ncclIbSendFifo)*MAX_REQUESTS*NCCL_NET_IB_MAX_RECVS, IBV_ACCESS_REMOTE_WRITE|IBV_ACCESS_LOCAL_WRITE|IBV_ACCESS_REMOTE_READ));
   rComm->remFifo.sge.lkey = rComm->remFifo.mr->lkey;
-  if (NCCL_IB_USE_INLINE) rComm->remFifo.flags = IBV_SEND_INLINE;
+  if (NCCL_IB_USE_INLINE_get()) rComm->remFifo.flags = IBV_SEND_INLINE;
 
   // Allocate Flush dummy buffer for GPU Direct RDMA
   rComm->gpuFlush.enabled = ((ncclIbGdrSupport(lComm->dev) == ncclSuccess || ncclIbDmaBufSupport(lComm->dev) == ncclSuccess)
-                             && (NCCL_GDR_FLUSH_DISABLE == 0)) ? 1 : 0;
+                             && (NCCL_GDR_FLUSH_DISABLE_get() == 0)) ? 1 : 0;
   if (rComm->gpuFlush.enabled) {
     NCCLCHECK(wrap_ibv_reg_mr(&rComm->gpuFlush.hostMr, rComm->verbs.pd, &rComm->gpuFlush.hostMem, sizeof(int), IBV_ACCESS_LOCAL_WRITE));
     rComm->gpuFlush.sge.addr = (uint64_t)&rComm->gpuFlush.hostMem;
@@ -1355,7 +1355,7 @@ ncclResult_t ncclIbMultiSend(struct ncclIbSendComm* comm, int slot) {
   }
 
   struct ibv_send_wr* lastWr = comm->wrs+nreqs-1;
-  if (nreqs > 1 || (comm->ar && reqs[0]->send.size > NCCL_IB_AR_THRESHOLD)) {
+  if (nreqs > 1 || (comm->ar && reqs[0]->send.size > NCCL_IB_AR_THRESHOLD_get())) {
     // When using ADAPTIVE_ROUTING, send the bulk of the data first as an
     // RDMA_WRITE, then a 0-byte RDMA_WRITE_WITH_IMM to trigger a remote
     // completion.
@@ -1370,7 +1370,7 @@ ncclResult_t ncclIbMultiSend(struct ncclIbSendComm* comm, int slot) {
 
   // Multi-QP: make sure IB writes are multiples of 128B so that LL and LL128 protocols still work
   const int align = 128;
-  const int nqps = NCCL_IB_SPLIT_DATA_ON_QPS ? comm->nqps : 1;
+  const int nqps = NCCL_IB_SPLIT_DATA_ON_QPS_get() ? comm->nqps : 1;
   for (int q=0; q<nqps; q++) {
     for (int r=0; r<nreqs; r++) {
       int chunkSize = DIVUP(DIVUP(reqs[r]->send.size, nqps), align) * align;
@@ -1449,7 +1449,7 @@ ncclResult_t ncclIbIsend(void* sendComm, void* data, int size, int tag, void* mh
     req->send.data = data;
     req->send.lkey = mr->lkey;
     req->send.offset = 0;
-    req->events = NCCL_IB_SPLIT_DATA_ON_QPS ? comm->nqps : 1;
+    req->events = NCCL_IB_SPLIT_DATA_ON_QPS_get() ? comm->nqps : 1;
     if (comm->gidInfo.link_layer == IBV_LINK_LAYER_ETHERNET) req->gidInfo = &comm->gidInfo;
     *request = reqs[r] = req;
 
@@ -1555,7 +1555,7 @@ ncclResult_t ncclIbIrecv(void* recvComm, int n, void** data, int* sizes, int* ta
   wr.num_sge = 0;
 
   TIME_START(1);
-  const int nqps = NCCL_IB_SPLIT_DATA_ON_QPS ? comm->nqps : 1;
+  const int nqps = NCCL_IB_SPLIT_DATA_ON_QPS_get() ? comm->nqps : 1;
   for (int q=0; q<nqps; q++) {
     struct ibv_qp* qp = comm->qps[comm->qpIndex];
     struct ibv_recv_wr* bad_wr;
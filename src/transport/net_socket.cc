@@ -257,8 +257,8 @@ void* persistentSocketThread(void *args_) {
 }
 
 ncclResult_t ncclNetSocketGetNsockNthread(int dev, int* ns, int* nt) {
-  int nSocksPerThread = NCCL_NSOCKS_PERTHREAD;
-  int nThreads = NCCL_SOCKET_NTHREADS;
+  int nSocksPerThread = NCCL_NSOCKS_PERTHREAD_get();
+  int nThreads = NCCL_SOCKET_NTHREADS_get();
   if (nThreads > MAX_THREADS) {
     WARN("NET/Socket : NCCL_SOCKET_NTHREADS is greater than the maximum allowed, setting to %d", MAX_THREADS);
     nThreads = MAX_THREADS;
@@ -256,7 +256,7 @@ ncclResult_t ncclNvlsInit(struct ncclComm* comm) {
 
   int gpuCount;
   NCCLCHECK(ncclTopoGetGpuCount(comm->topo, &gpuCount));
-  if (!NCCL_NVLS_ENABLE || gpuCount <= 2) return ncclSuccess;
+  if (!NCCL_NVLS_ENABLE_get() || gpuCount <= 2) return ncclSuccess;
 
   CUdevice dev;
   int driverVersion;
@@ -264,7 +264,7 @@ ncclResult_t ncclNvlsInit(struct ncclComm* comm) {
   if (CUPFN(cuDeviceGet) == NULL) return ncclSuccess;
   CUCHECK(cuCtxGetDevice(&dev));
   CUDACHECK(cudaDriverGetVersion(&driverVersion));
-  if (NCCL_NVLS_ENABLE == 2) {
+  if (NCCL_NVLS_ENABLE_get() == 2) {
     // NVLS Multicast support requires CUDA12.1 UMD + KMD
     if (CUPFN(cuMulticastCreate) != NULL /*&& driverVersion >= 12010 */) {
       CUCHECK(cuDeviceGetAttribute(&comm->nvlsSupport, CU_DEVICE_ATTRIBUTE_MULTICAST_SUPPORTED, dev));
@@ -274,7 +274,7 @@ ncclResult_t ncclNvlsInit(struct ncclComm* comm) {
   }
 
   INFO(NCCL_INIT, "NVLS multicast support is %savailable on dev %d", comm->nvlsSupport ? "" : "not ", dev);
-  if (comm->nvlsSupport == 1) comm->nvlsChannels = std::max(comm->config.minCTAs, std::min(comm->config.maxCTAs, (int)NCCL_NVLS_NCHANNELS));
+  if (comm->nvlsSupport == 1) comm->nvlsChannels = std::max(comm->config.minCTAs, std::min(comm->config.maxCTAs, (int)NCCL_NVLS_NCHANNELS_get()));
   return ncclSuccess;
 }
 
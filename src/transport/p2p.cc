@@ -313,7 +313,7 @@ static ncclResult_t p2pGetInfo(struct ncclTopoSystem* topo, struct ncclPeerInfo*
   // connected via NVLink, if so we enable P2P Read by default
   NCCLCHECK(ncclTopoCheckP2p(topo, info1->busId, info2->busId, &p2p, read, intermediateRank));
 
-  int readEnable = NCCL_P2P_READ_ENABLE;
+  int readEnable = NCCL_P2P_READ_ENABLE_get();
   if (readEnable != -2) *read = readEnable;
   return ncclSuccess;
 }
@@ -373,7 +373,7 @@ ncclResult_t p2pSendSetup(struct ncclComm* comm, struct ncclTopoGraph* graph, st
 
   if (intermediateRank == -1) {
     info->rank = myInfo->rank;
-    if (myInfo->pidHash == peerInfo->pidHash && NCCL_P2P_DIRECT_DISABLE == 0 && useMemcpy == 0 && !ncclCuMemEnable()) {
+    if (myInfo->pidHash == peerInfo->pidHash && NCCL_P2P_DIRECT_DISABLE_get() == 0 && useMemcpy == 0 && !ncclCuMemEnable()) {
       resources->type = P2P_DIRECT;
       send->conn.flags |= info->read ? NCCL_DIRECT_READ : NCCL_DIRECT_WRITE;
       INFO(NCCL_INIT|NCCL_P2P, "Channel %02d/%01d : %d[%d] -> %d[%d] via P2P/direct pointer%s",
@@ -437,7 +437,7 @@ ncclResult_t p2pRecvSetup(struct ncclComm* comm, struct ncclTopoGraph* graph, st
 
   if (intermediateRank == -1) {
     info->rank = myInfo->rank;
-    if (myInfo->pidHash == peerInfo->pidHash && NCCL_P2P_DIRECT_DISABLE == 0 && useMemcpy == 0 && !ncclCuMemEnable()) {
+    if (myInfo->pidHash == peerInfo->pidHash && NCCL_P2P_DIRECT_DISABLE_get() == 0 && useMemcpy == 0 && !ncclCuMemEnable()) {
       resources->type = P2P_DIRECT;
       recv->conn.flags |= info->read ? NCCL_DIRECT_READ : NCCL_DIRECT_WRITE;
     } else {
@@ -771,7 +771,7 @@ struct ncclTransport p2pTransport = {
 static void initCeOperation() {
   static int init = 0;
   if (!init) {
-    useMemcpy = NCCL_P2P_USE_CUDA_MEMCPY;
+    useMemcpy = NCCL_P2P_USE_CUDA_MEMCPY_get();
     if (useMemcpy) {
       p2pTransport.send.proxyConnect = p2pSendProxyConnect;
       p2pTransport.send.proxyProgress = p2pSendProxyProgress;
@@ -88,7 +88,7 @@ static ncclResult_t shmCanConnect(int* ret, struct ncclTopoSystem* topo, struct
   *ret = 0;
   initCeOperation();
 
-  if (NCCL_SHM_DISABLE == 1) return ncclSuccess;
+  if (NCCL_SHM_DISABLE_get() == 1) return ncclSuccess;
 
   int useNet = 0;
   NCCLCHECK(ncclTopoCheckNet(topo, info1->busId, info2->busId, &useNet));
@@ -445,8 +445,8 @@ struct ncclTransport shmTransport = {
 static void initCeOperation() {
   static int init = 0;
   if (!init) {
-    useMemcpySend = NCCL_SHM_USE_CUDA_MEMCPY && (NCCL_SHM_MEMCPY_MODE & 1);
-    useMemcpyRecv = NCCL_SHM_USE_CUDA_MEMCPY && (NCCL_SHM_MEMCPY_MODE & 2);
+    useMemcpySend = NCCL_SHM_USE_CUDA_MEMCPY_get() && (NCCL_SHM_MEMCPY_MODE_get() & 1);
+    useMemcpyRecv = NCCL_SHM_USE_CUDA_MEMCPY_get() && (NCCL_SHM_MEMCPY_MODE_get() & 2);
     if (useMemcpySend) {
       shmTransport.send.proxyConnect = shmSendProxyConnect;
       shmTransport.send.proxyFree = shmSendProxyFree;
@@ -457,7 +457,7 @@ static void initCeOperation() {
       shmTransport.recv.proxyFree = shmRecvProxyFree;
       shmTransport.recv.proxyProgress = shmRecvProxyProgress;
     }
-    shmLocality = NCCL_SHM_LOCALITY;
+    shmLocality = NCCL_SHM_LOCALITY_get();
     if (shmLocality != SHM_SEND_SIDE && shmLocality != SHM_RECV_SIDE) {
       WARN("Ignoring SHM locality, must be 1 (sender side) or 2 (receiver side, default)");
       shmLocality = SHM_RECV_SIDE;